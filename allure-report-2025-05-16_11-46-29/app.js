@@ -1,2 +0,0 @@
-/*! For license information please see app.js.LICENSE.txt */
-!function(){var t={306:function(t){!function(e,n){"use strict";t.exports=function(){function t(e){if(!(this instanceof t))return n(e);e=e||{},this.tailSpace=e.tailSpace||"",this.elementSeparator=e.elementSeparator||"__",this.modSeparator=e.modSeparator||"_",this.modValueSeparator=e.modValueSeparator||"_",this.classSeparator=e.classSeparator||" ",this.isFullModifier=void 0===e.isFullModifier||e.isFullModifier,this.isFullBoolValue=void 0!==e.isFullBoolValue&&e.isFullBoolValue}function e(t,e,n){return this.bind.apply(this,[null].concat(Array.prototype.slice.call(arguments)))}function n(n){var r=new t(n),o=r.stringify.bind(r);return o.with=o.lock=e,o}t.prototype={_stringifyModifier:function(t,e,n){var r="";return void 0===n?r:this.isFullBoolValue||!1!==n?(r+=this.classSeparator+t+this.modSeparator+e,(this.isFullBoolValue||!0!==n)&&(r+=this.modValueSeparator+String(n)),r):r},_stringifyModifiers:function(t,e){var n="";for(var r in this.isFullModifier||(t=""),e)e.hasOwnProperty(r)&&(n+=this._stringifyModifier(t,r,e[r]));return n},stringify:function(t,e,n){var r=String(t);return e&&"object"==typeof e&&void 0===n&&(n=e,e=null),e&&(r+=this.elementSeparator+String(e)),n&&(r+=this._stringifyModifiers(r,n)),r+this.tailSpace}};var r=n();return r.B=t,r}()}()},4755:function(t,e,n){"use strict";n.d(e,{qw:function(){return ut},mX:function(){return lt},nZ:function(){return st}});var r={};n.r(r),n.d(r,{ClipboardBehavior:function(){return O},DownloadBehavior:function(){return T},GaBehavior:function(){return B},LoadBehavior:function(){return F},TooltipBehavior:function(){return W}});var o,i,a,s,l=n(1391),u=n(8603),c=n(3029),h=n(2901),f=n(388),p=n(3954),d=n(5361),m=n(793),g=n(3678),v=n(2854),y=n(9237),b=n(2415),w=n.n(b);function _(t,e,n){return e=(0,p.A)(e),(0,f.A)(t,x()?Reflect.construct(e,n||[],(0,p.A)(t).constructor):e.apply(t,n))}function x(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(x=function(){return!!t})()}var k,A,O=(o=(0,v.on)("mouseenter [data-copy]"),i=(0,v.on)("mouseleave [data-copy]"),a=(0,v.on)("click [data-copy]"),s=function(t){function e(){return(0,c.A)(this,e),_(this,e,arguments)}return(0,d.A)(e,t),(0,h.A)(e,[{key:"initialize",value:function(){this.tooltip=new g.A({position:"left"})}},{key:"onTipHover",value:function(t){var e=this.$(t.currentTarget);this.tooltip.show((0,y.default)("controls.clipboard"),e)}},{key:"onTipLeave",value:function(){this.tooltip.hide()}},{key:"onCopyableClick",value:function(t){var e=this.$(t.currentTarget);w()(e.data("copy"))?this.tooltip.show((0,y.default)("controls.clipboardSuccess"),e):this.tooltip.show((0,y.default)("controls.clipboardError"),e)}}])}(u.Behavior),(0,m.A)(s.prototype,"onTipHover",[o],Object.getOwnPropertyDescriptor(s.prototype,"onTipHover"),s.prototype),(0,m.A)(s.prototype,"onTipLeave",[i],Object.getOwnPropertyDescriptor(s.prototype,"onTipLeave"),s.prototype),(0,m.A)(s.prototype,"onCopyableClick",[a],Object.getOwnPropertyDescriptor(s.prototype,"onCopyableClick"),s.prototype),s),E=n(5193);function C(t,e,n){return e=(0,p.A)(e),(0,f.A)(t,S()?Reflect.construct(e,n||[],(0,p.A)(t).constructor):e.apply(t,n))}function S(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(S=function(){return!!t})()}var P,j,T=(k=(0,v.on)("click [data-download]"),A=function(t){function e(){return(0,c.A)(this,e),C(this,e,arguments)}return(0,d.A)(e,t),(0,h.A)(e,[{key:"initialize",value:function(){this.tooltip=new g.A({position:"left"})}},{key:"onDownloadableClick",value:function(t){var e=this;t.preventDefault(),t.stopPropagation();var n=this.$(t.currentTarget),r=n.data("download");if(r){var o=n.data("download-type")||"application/octet-stream",i="_blank"===n.data("download-target");(0,E._)("".concat(r),o).then((function(t){var e=document.createElement("a");e.setAttribute("href",t),e.setAttribute("download",r),i&&e.setAttribute("target","_blank"),document.body.appendChild(e),e.click(),document.body.removeChild(e)})).catch((function(t){e.tooltip.show("Download error: ".concat(t),n)}))}}}])}(u.Behavior),(0,m.A)(A.prototype,"onDownloadableClick",[k],Object.getOwnPropertyDescriptor(A.prototype,"onDownloadableClick"),A.prototype),A),R=n(4467),M=n(9922);function N(t,e,n){return e=(0,p.A)(e),(0,f.A)(t,D()?Reflect.construct(e,n||[],(0,p.A)(t).constructor):e.apply(t,n))}function D(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(D=function(){return!!t})()}var B=(P=(0,v.on)("click [data-ga4-event]"),j=function(t){function e(){return(0,c.A)(this,e),N(this,e,arguments)}return(0,d.A)(e,t),(0,h.A)(e,[{key:"initialize",value:function(){}},{key:"onDataEventClick",value:function(t){var e=this.$(t.currentTarget),n=e.data("ga4-event"),r=e.data(),o=Object.keys(r).filter((function(t){return t.startsWith("ga4Param")})).map((function(t){var e=r[t],n=t.substring(8).split(/\.?(?=[A-Z])/).join("_").toLowerCase();return(0,R.A)({},n,e)})).reduce((function(t,e){return Object.assign(t,e)}),{});(0,M.A)(n,o)}}])}(u.Behavior),(0,m.A)(j.prototype,"onDataEventClick",[P],Object.getOwnPropertyDescriptor(j.prototype,"onDataEventClick"),j.prototype),j);function V(t,e,n){return e=(0,p.A)(e),(0,f.A)(t,I()?Reflect.construct(e,n||[],(0,p.A)(t).constructor):e.apply(t,n))}function I(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(I=function(){return!!t})()}var L,z,$,F=function(t){function e(){return(0,c.A)(this,e),V(this,e,arguments)}return(0,d.A)(e,t),(0,h.A)(e,[{key:"initialize",value:function(){var t=this,e=this.view.render.bind(this.view);this.loaded=!1,this.view.render=function(){t.loaded?e():t.view.loadData().then((function(){t.loaded=!0,e()}))}}}])}(u.Behavior),U=n(3633);function H(t,e,n){return e=(0,p.A)(e),(0,f.A)(t,q()?Reflect.construct(e,n||[],(0,p.A)(t).constructor):e.apply(t,n))}function q(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(q=function(){return!!t})()}var W=(L=(0,v.on)("mouseenter [data-tooltip]"),z=(0,v.on)("mouseleave [data-tooltip]"),$=function(t){function e(){return(0,c.A)(this,e),H(this,e,arguments)}return(0,d.A)(e,t),(0,h.A)(e,[{key:"initialize",value:function(){this.tooltip=new g.A(this.options)}},{key:"onDestroy",value:function(){this.tooltip.hide()}},{key:"onTipHover",value:function(t){var e=this.$(t.currentTarget);this.tooltip.show((0,U.escapeExpression)(e.data("tooltip")),e)}},{key:"onTipLeave",value:function(){this.tooltip.hide()}}])}(u.Behavior),(0,m.A)($.prototype,"onTipHover",[L],Object.getOwnPropertyDescriptor($.prototype,"onTipHover"),$.prototype),(0,m.A)($.prototype,"onTipLeave",[z],Object.getOwnPropertyDescriptor($.prototype,"onTipLeave"),$.prototype),$),G=n(2319),K=n(8563);function X(t,e,n){return e=(0,p.A)(e),(0,f.A)(t,Y()?Reflect.construct(e,n||[],(0,p.A)(t).constructor):e.apply(t,n))}function Y(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Y=function(){return!!t})()}var J=function(t){function e(){return(0,c.A)(this,e),X(this,e,arguments)}return(0,d.A)(e,t),(0,h.A)(e,[{key:"getContentView",value:function(){var t=this.options,e=t.code,n=t.message;return new G.A({code:e,message:n})}}])}(K.A),Z=n(991),Q=n(1450),tt=n(8262),et=n(734);function nt(t,e,n){return e=(0,p.A)(e),(0,f.A)(t,rt()?Reflect.construct(e,n||[],(0,p.A)(t).constructor):e.apply(t,n))}function rt(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(rt=function(){return!!t})()}var ot=function(t){function e(){return(0,c.A)(this,e),nt(this,e,arguments)}return(0,d.A)(e,t),(0,h.A)(e,[{key:"initialize",value:function(t){var n=t.uid;(0,Z.A)((0,p.A)(e.prototype),"initialize",this).call(this),this.uid=n,this.model=new tt.A({uid:n}),this.routeState=new l.Model}},{key:"loadData",value:function(){return this.model.fetch()}},{key:"getContentView",value:function(){var t="#testresult/".concat(this.uid);return new Q.A({baseUrl:t,model:this.model,routeState:this.routeState})}},{key:"onViewReady",value:function(){var t=this.options,e=t.uid,n=t.tabName;this.onRouteUpdate(e,n)}},{key:"onRouteUpdate",value:function(t,e){this.routeState.set("testResultTab",e);var n=et.A.getUrlParams().attachment;n?this.routeState.set("attachment",n):this.routeState.unset("attachment")}},{key:"shouldKeepState",value:function(t){return this.uid===t}}])}(K.A),it=n(566);"function"==typeof window.requestAnimationFrame&&(window.requestAnimationFrame=window.requestAnimationFrame.bind(window)),u.Behaviors.behaviorsLookup=r;var at=function(t){return t.split("/")[0]},st=function(t){return function(){var e=ut.getView();e&&e.onRouteUpdate&&e.shouldKeepState&&at(et.A.getCurrentUrl())===at(et.A.currentUrl)&&e.shouldKeepState.apply(e,arguments)?e.onRouteUpdate.apply(e,arguments):ut.showView(t.apply(void 0,arguments))}},lt=function(){return new J({code:401,message:(0,y.default)("errors.notFound")})},ut=new u.Application({region:"#content"});ut.on("start",(function(){(0,it.vM)().then((function(){l.history.start(),document.dir=it.Ay.dir(),it.Ay.on("languageChanged",(function(){ut.getRegion().reset(),et.A.reload(),document.dir=it.Ay.dir()}))})),et.A.on("route:notFound",st(lt)),et.A.on("route:testresultPage",st((function(t,e){return new ot({uid:t,tabName:e})})))}))},2319:function(t,e,n){"use strict";var r,o=n(3029),i=n(2901),a=n(388),s=n(3954),l=n(5361),u=n(4467),c=n(8603),h=n(2854),f=n(365),p=n.n(f);function d(t,e,n){return e=(0,s.A)(e),(0,a.A)(t,m()?Reflect.construct(e,n||[],(0,s.A)(t).constructor):e.apply(t,n))}function m(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(m=function(){return!!t})()}var g=(0,h.s7)("error-splash")(r=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=d(this,e,[].concat(r)),(0,u.A)(t,"template",p()),t}return(0,l.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){return{cls:this.className,code:this.options.code,message:this.options.message}}}])}(c.View))||r;e.A=g},4838:function(t,e,n){"use strict";var r,o=n(2901),i=n(3029),a=n(388),s=n(3954),l=n(5361),u=n(2854),c=n(3678);function h(t,e,n){return e=(0,s.A)(e),(0,a.A)(t,f()?Reflect.construct(e,n||[],(0,s.A)(t).constructor):e.apply(t,n))}function f(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(f=function(){return!!t})()}var p=(0,u.s7)("popover")(r=function(t){function e(){return(0,i.A)(this,e),h(this,e,arguments)}return(0,l.A)(e,t),(0,o.A)(e)}(c.A))||r;e.A=p},1450:function(t,e,n){"use strict";n.d(e,{A:function(){return zt}});var r=n(3029),o=n(2901),i=n(388),a=n(3954),s=n(5361),l=n(4467),u=n(793),c=n(8603),h=n(4523),f=n(2854),p=n(9237),d=n(8681),m=n(1391),g=n(5193),v=n(734),y=n(5381),b=n(5981),w=n.n(b),_=n(5344),x=n.n(_),k=n(6033),A=n.n(k),O=n(5772),E=n.n(O),C=n(6503),S=n.n(C),P=n(7285),j=n.n(P);w().registerLanguage("xml",j()),w().registerLanguage("bash",x()),w().registerLanguage("markdown",S()),w().registerLanguage("diff",A()),w().registerLanguage("json",E());var T,R,M,N,D,B,V=w(),I=n(3938),L=n.n(I);function z(t,e,n){return e=(0,a.A)(e),(0,i.A)(t,$()?Reflect.construct(e,n||[],(0,a.A)(t).constructor):e.apply(t,n))}function $(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return($=function(){return!!t})()}var F,U,H,q,W,G,K,X=(T=(0,f.s7)("attachment"),R=(0,f.h1)("TooltipBehavior",{position:"bottom"}),M=(0,f.Ei)({customView:".attachment__custom-view"}),N=(0,f.on)("click .attachment__media-container"),T(D=R(D=M((B=function(t){function e(){var t;(0,r.A)(this,e);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return t=z(this,e,[].concat(o)),(0,l.A)(t,"template",L()),t}return(0,s.A)(e,t),(0,o.A)(e,[{key:"initialize",value:function(){this.fullScreen=!!this.options.fullScreen,this.attachment=this.options.attachment,this.attachmentInfo=(0,y.A)(this.attachment.type)}},{key:"onRender",value:function(){var t=this;if(this.sourceUrl||(0,g._)("data/attachments/".concat(this.attachment.source),this.attachment.type).then((function(e){t.sourceUrl=e})).then((function(){if(t.needsFetch())return t.loadContent()})).then(this.render),"custom"===this.attachmentInfo.type)this.showChildView("customView",new this.attachmentInfo.View({sourceUrl:this.sourceUrl,attachment:this.attachment}));else if("code"===this.attachmentInfo.type){var e=this.$(".attachment__code");e.addClass("language-".concat(this.attachment.type.split("/").pop())),V.highlightElement(e[0])}}},{key:"onDestroy",value:function(){v.A.setSearch({attachment:null})}},{key:"onImageClick",value:function(t){this.$(t.currentTarget).hasClass("attachment__media-container_fullscreen")?this.onDestroy():v.A.setSearch({attachment:this.attachment.uid})}},{key:"needsFetch",value:function(){return"parser"in this.attachmentInfo}},{key:"loadContent",value:function(){var t=this;return m.$.ajax(this.sourceUrl,{dataType:"text"}).then((function(e){var n=t.attachmentInfo.parser;t.content=n(e)}))}},{key:"serializeData",value:function(){return{type:this.attachmentInfo.type,content:this.content,sourceUrl:this.sourceUrl,attachment:this.attachment,fullScreen:this.fullScreen}}}])}(c.View),(0,u.A)(B.prototype,"onImageClick",[N],Object.getOwnPropertyDescriptor(B.prototype,"onImageClick"),B.prototype),D=B))||D)||D)||D),Y=X,J=n(2319),Z=n(4692),Q=n.n(Z),tt=n(2958),et=n.n(tt);function nt(t,e,n){return e=(0,a.A)(e),(0,i.A)(t,rt()?Reflect.construct(e,n||[],(0,a.A)(t).constructor):e.apply(t,n))}function rt(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(rt=function(){return!!t})()}var ot,it,at,st,lt,ut,ct,ht=(F=(0,f.s7)("modal"),U=(0,f.Ei)({content:".modal__content"}),H=(0,f.on)("click .modal__content"),q=(0,f.on)("click .modal__background, .modal__close"),F(W=U((K=function(t){function e(){var t;(0,r.A)(this,e);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return t=nt(this,e,[].concat(o)),(0,l.A)(t,"template",et()),t}return(0,s.A)(e,t),(0,o.A)(e,[{key:"show",value:function(){this.constructor.container.append(this.$el),this.showChildView("content",this.options.childView),Q()("#content").toggleClass("blur",!0)}},{key:"onDestroy",value:function(){Q()("#content").toggleClass("blur",!1)}},{key:"onKeepOpen",value:function(t){t.stopPropagation()}},{key:"onClose",value:function(){this.destroy()}},{key:"serializeData",value:function(){return{cls:this.className,title:this.options.title}}}])}(c.View),(0,l.A)(K,"container",Q()(document.body)),G=K,(0,u.A)(G.prototype,"onKeepOpen",[H],Object.getOwnPropertyDescriptor(G.prototype,"onKeepOpen"),G.prototype),(0,u.A)(G.prototype,"onClose",[q],Object.getOwnPropertyDescriptor(G.prototype,"onClose"),G.prototype),W=G))||W)||W),ft=ht,pt=n(3963),dt=n(8469),mt=n.n(dt);function gt(t,e,n){return e=(0,a.A)(e),(0,i.A)(t,vt()?Reflect.construct(e,n||[],(0,a.A)(t).constructor):e.apply(t,n))}function vt(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(vt=function(){return!!t})()}var yt,bt=(ot=(0,f.s7)("test-result-execution"),it=(0,f.on)("click .step__title_hasContent"),at=(0,f.on)("click .attachment-row"),st=(0,f.on)("click .attachment-row__fullscreen"),lt=(0,f.on)("click .parameters-table__cell"),ot((ct=function(t){function e(){var t;(0,r.A)(this,e);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return t=gt(this,e,[].concat(o)),(0,l.A)(t,"template",mt()),t}return(0,s.A)(e,t),(0,o.A)(e,[{key:"initialize",value:function(){this.state=new m.Model,this.routeState=this.options.routeState,this.listenTo(this.state,"change:attachment",this.highlightSelectedAttachment,this)}},{key:"onRender",value:function(){var t=this.routeState.get("attachment");t&&this.highlightSelectedAttachment(t)}},{key:"highlightSelectedAttachment",value:function(t){this.$(".attachment-row").removeClass("attachment-row_selected");var e=this.$('.attachment-row[data-uid="'.concat(t,'"]'));e.addClass("attachment-row_selected"),e.parents(".step").addClass("step_expanded")}},{key:"serializeData",value:function(){var t=(0,pt.g)(this.model.get("beforeStages")),e=(0,pt.g)(this.model.get("testStage")),n=(0,pt.g)(this.model.get("afterStages"));return{hasContent:t.length+e.length+n.length>0,before:t,test:e,after:n,baseUrl:this.options.baseUrl}}},{key:"onStepClick",value:function(t){this.$(t.currentTarget).parent().toggleClass("step_expanded")}},{key:"onAttachmentClick",value:function(t){var e=Q()(t.currentTarget).data("uid"),n="attachment__".concat(e);Q()(t.currentTarget).hasClass("attachment-row_selected")&&this.getRegion(n)?this.getRegion(n).destroy():(this.addRegion(n,{el:this.$(".".concat(n))}),this.getRegion(n).show(new Y({attachment:this.model.getAttachment(e)}))),this.$(t.currentTarget).toggleClass("attachment-row_selected")}},{key:"onAttachmnetFullScrennClick",value:function(t){var e=Q()(t.currentTarget).closest(".attachment-row").data("uid");v.A.setSearch({attachment:e}),t.stopPropagation()}},{key:"onParameterClick",value:function(t){this.$(t.target).siblings().addBack().toggleClass("line-ellipsis")}}])}(c.View),(0,u.A)(ct.prototype,"onStepClick",[it],Object.getOwnPropertyDescriptor(ct.prototype,"onStepClick"),ct.prototype),(0,u.A)(ct.prototype,"onAttachmentClick",[at],Object.getOwnPropertyDescriptor(ct.prototype,"onAttachmentClick"),ct.prototype),(0,u.A)(ct.prototype,"onAttachmnetFullScrennClick",[st],Object.getOwnPropertyDescriptor(ct.prototype,"onAttachmnetFullScrennClick"),ct.prototype),(0,u.A)(ct.prototype,"onParameterClick",[lt],Object.getOwnPropertyDescriptor(ct.prototype,"onParameterClick"),ct.prototype),ut=ct))||ut),wt=bt,_t=n(4175),xt=n.n(_t);function kt(t,e,n){return e=(0,a.A)(e),(0,i.A)(t,At()?Reflect.construct(e,n||[],(0,a.A)(t).constructor):e.apply(t,n))}function At(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(At=function(){return!!t})()}var Ot,Et,Ct,St,Pt,jt,Tt,Rt=(0,f.s7)("test-result-overview")(yt=(0,f.Ei)({execution:".test-result-overview__execution"})(yt=function(t){function e(){var t;(0,r.A)(this,e);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return t=kt(this,e,[].concat(o)),(0,l.A)(t,"template",xt()),t}return(0,s.A)(e,t),(0,o.A)(e,[{key:"initialize",value:function(){this.blocks=[]}},{key:"onRender",value:function(){this.showBlock(this.$(".test-result-overview__tags"),d.A.testResultBlocks.tag),this.showBlock(this.$(".test-result-overview__before"),d.A.testResultBlocks.before),this.showChildView("execution",new wt(this.options)),this.showBlock(this.$(".test-result-overview__after"),d.A.testResultBlocks.after)}},{key:"onDestroy",value:function(){this.blocks.forEach((function(t){return t.destroy()}))}},{key:"showBlock",value:function(t,e){var n=this;e.forEach((function(e){var r=new e({model:n.model});r.$el.appendTo(t),n.blocks.push(r),r.render()}))}},{key:"templateContext",value:function(){return{cls:this.className}}}])}(c.View))||yt)||yt,Mt=Rt,Nt=n(3826),Dt=n.n(Nt);function Bt(t,e,n){return e=(0,a.A)(e),(0,i.A)(t,Vt()?Reflect.construct(e,n||[],(0,a.A)(t).constructor):e.apply(t,n))}function Vt(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Vt=function(){return!!t})()}var It=[{id:"",name:"testResult.overview.name",View:Mt}],Lt=(Ot=(0,f.s7)("test-result"),Et=(0,f.h1)("TooltipBehavior",{position:"left"}),Ct=(0,f.h1)("ClipboardBehavior"),St=(0,f.Ei)({content:".test-result__content"}),Pt=(0,f.on)("click .status-details__trace-toggle"),Ot(jt=Et(jt=Ct(jt=St((Tt=function(t){function e(){var t;(0,r.A)(this,e);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return t=Bt(this,e,[].concat(o)),(0,l.A)(t,"template",Dt()),t}return(0,s.A)(e,t),(0,o.A)(e,[{key:"initialize",value:function(t){var e=this,n=t.routeState;this.routeState=n,this.tabs=It.concat(d.A.testResultTabs),this.tabName=this.routeState.get("testResultTab")||"",this.listenTo(this.routeState,"change:testResultTab",(function(t,n){return e.onTabChange(n)})),this.listenTo(this.routeState,"change:attachment",(function(t,n){return e.onShowAttachment(n)}))}},{key:"onRender",value:function(){var t=(0,h.findWhere)(this.tabs,{id:this.tabName});this.showChildView("content",t?new t.View(this.options):new J.A({code:404,message:'Tab "'.concat(this.tabName,'" not found')}));var e=this.routeState.get("attachment");e&&this.onShowAttachment(e)}},{key:"onTabChange",value:function(t){this.tabName=t||"",this.render()}},{key:"onShowAttachment",value:function(t){if(!t&&this.modalView&&this.modalView.destroy(),t){var e=this.model.getAttachment(t);this.modalView=new ft({childView:e?new Y({attachment:e,fullScreen:!0}):new J.A({code:404,message:(0,p.default)("errors.missedAttachment")}),title:e?e.name||e.source:(0,p.default)("errors.notFound")}),this.modalView.show()}}},{key:"templateContext",value:function(){var t=this,e=this.options.baseUrl;return{cls:this.className,statusName:"status.".concat(this.model.get("status")),links:this.tabs.map((function(n){return{href:"".concat(e,"/").concat(n.id),name:n.name,active:n.id===t.tabName}}))}}},{key:"onStacktraceClick",value:function(t){this.$(t.currentTarget).closest(".status-details").toggleClass("status-details__expanded")}}])}(c.View),(0,u.A)(Tt.prototype,"onStacktraceClick",[Pt],Object.getOwnPropertyDescriptor(Tt.prototype,"onStacktraceClick"),Tt.prototype),jt=Tt))||jt)||jt)||jt)||jt),zt=Lt},3678:function(t,e,n){"use strict";var r,o,i=n(3029),a=n(2901),s=n(388),l=n(3954),u=n(5361),c=n(4467),h=n(2854),f=n(306),p=n.n(f),d=n(1391),m=n(4692),g=n.n(m),v=n(4523);function y(t,e,n){return e=(0,l.A)(e),(0,s.A)(t,b()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function b(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(b=function(){return!!t})()}var w={top:function(t,e,n){var r=t.top,o=t.left,i=t.width,a=e.offset;return{top:r-n.height-a,left:o+i/2-n.width/2}},"top-right":function(t,e,n){var r=t.top,o=t.left,i=t.width,a=e.offset;return{top:r-n.height-a,left:o+i+a}},center:function(t,e,n){var r=t.top,o=t.left;return{top:r+t.height/2,left:o+t.width/2-n.width/2}},right:function(t,e,n){var r=t.top,o=t.left,i=t.height,a=t.width,s=e.offset;return{top:r+i/2-n.height/2,left:o+a+s}},left:function(t,e,n){var r=t.top,o=t.left,i=t.height,a=e.offset;return{top:r+i/2-n.height/2,left:o-a-n.width}},bottom:function(t,e,n){var r=t.top,o=t.left,i=t.height,a=t.width;return{top:r+i+e.offset,left:o+a/2-n.width/2}},"bottom-left":function(t,e,n){var r=t.top,o=t.left,i=t.height,a=t.width;return{top:r+i+e.offset,left:o+a-n.width}}},_=(0,h.s7)("tooltip")((o=function(t){function e(){return(0,i.A)(this,e),y(this,e,arguments)}return(0,u.A)(e,t),(0,a.A)(e,[{key:"initialize",value:function(t){this.options=t,(0,v.defaults)(this.options,{offset:10})}},{key:"render",value:function(){this.constructor.container.append(this.$el)}},{key:"isVisible",value:function(){return this.$el.is(":visible")}},{key:"setContent",value:function(t){this.$el.html(t)}},{key:"show",value:function(t,e){var n=this.options.position;this.setContent(t),this.$el.addClass(p()(this.className,{position:n})),this.render(),"rtl"===document.dir&&"right"===n?this.$el.css(w.left(e[0].getBoundingClientRect(),{offset:this.options.offset},this.$el[0].getBoundingClientRect())):"rtl"===document.dir&&"left"===n?this.$el.css(w.right(e[0].getBoundingClientRect(),{offset:this.options.offset},this.$el[0].getBoundingClientRect())):this.$el.css(w[n](e[0].getBoundingClientRect(),{offset:this.options.offset},this.$el[0].getBoundingClientRect()))}},{key:"hide",value:function(){this.$el.remove()}}])}(d.View),(0,c.A)(o,"container",g()(document.body)),r=o))||r;e.A=_},5193:function(t,e,n){"use strict";function r(t,e,n,r,o,i,a){try{var s=t[i](a),l=s.value}catch(t){return void n(t)}s.done?e(l):Promise.resolve(l).then(r,o)}n.d(e,{_:function(){return s}});var o=n(4756),i=n.n(o),a=function(t){return new Promise((function(t){!function e(){if(!1!==window.reportDataReady)return t(!0);setTimeout(e,30)}()})).then((function(){return new Promise((function(e,n){window.reportData[t]?e(window.reportData[t]):n("not found")}))}))},s=function(){var t,e=(t=i().mark((function t(e){var n,r,o=arguments;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(n=o.length>1&&void 0!==o[1]?o[1]:"application/octet-stream",!window.reportData){t.next=6;break}return t.next=4,a(e);case 4:return r=t.sent,t.abrupt("return","data:".concat(n,";base64,").concat(r));case 6:return t.abrupt("return",e);case 7:case"end":return t.stop()}}),t)})),function(){var e=this,n=arguments;return new Promise((function(o,i){var a=t.apply(e,n);function s(t){r(a,o,i,s,l,"next",t)}function l(t){r(a,o,i,s,l,"throw",t)}s(void 0)}))});return function(t){return e.apply(this,arguments)}}()},8262:function(t,e,n){"use strict";n.d(e,{A:function(){return b}});var r=n(4467),o=n(3029),i=n(2901),a=n(388),s=n(991),l=n(3954),u=n(5361),c=n(1391),h=n(4523),f=n(3963),p=n(5193);function d(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function m(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?d(Object(n),!0).forEach((function(e){(0,r.A)(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):d(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}function g(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,v()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function v(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(v=function(){return!!t})()}function y(t){var e=t.steps,n=t.attachments;return(0,f.g)(e).reduce((function(t,e){return t.concat(y(e))}),[]).concat((0,f.g)(n))}var b=function(t){function e(){return(0,o.A)(this,e),g(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"idAttribute",get:function(){return"uid"}},{key:"fetch",value:function(t){var n=this;return(0,p._)(this.url(),"application/json").then((function(r){return(0,s.A)((0,l.A)(e.prototype),"fetch",n).call(n,m(m({},t),{},{url:r}))}))}},{key:"parse",value:function(t){return this.allAttachments=(0,f.g)(t.beforeStages).concat((0,f.g)(t.testStage)).concat((0,f.g)(t.afterStages)).reduce((function(t,e){return t.concat(y(e))}),[]),t}},{key:"getAttachment",value:function(t){return(0,h.findWhere)(this.allAttachments,{uid:t.toString()})}},{key:"url",value:function(){return"data/test-cases/".concat(this.id,".json")}}])}(c.Model)},2854:function(t,e,n){"use strict";n.d(e,{Ei:function(){return c},fF:function(){return h},h1:function(){return l},on:function(){return s},s7:function(){return u}});var r=n(4467),o=n(4523);var i,a,s=(i="on",a="events",function(t){return function(e,n,r){if(!t)throw new Error("The ".concat(i," decorator requires an eventName argument"));if((0,o.isFunction)(e[a]))throw new Error("The ".concat(i," decorator is not compatible with ").concat(a," as method form"));return e[a]&&!(0,o.has)(e,a)&&(e[a]=(0,o.clone)(e[a])),e[a]||(e[a]={}),e[a][t]=n,r}});function l(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};return function(n){n.prototype.behaviors=Object.assign((0,r.A)({},t,e),n.prototype.behaviors)}}function u(t){return function(e){e.prototype.className=t}}function c(t){return function(e){e.prototype.regions=Object.assign(t,e.regions)}}function h(t){return function(e){e.prototype.options=Object.assign(t,e.options)}}},3570:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return a}});var r=n(3633),o=n(9237),i={flaky:{className:"fa fa-bomb",tooltip:"marks.flaky"},newFailed:{className:"fa fa-times-circle",tooltip:"marks.newFailed"},newBroken:{className:"fa fa-exclamation-circle",tooltip:"marks.newBroken"},newPassed:{className:"fa fa-check-circle",tooltip:"marks.newPassed"},retriesStatusChange:{className:"fa fa-refresh",tooltip:"marks.retriesStatusChange"},failed:{className:"fa fa-times-circle fa-fw text_status_failed",tooltip:"status.failed"},broken:{className:"fa fa-exclamation-circle fa-fw text_status_broken",tooltip:"status.broken"},passed:{className:"fa fa-check-circle fa-fw text_status_passed",tooltip:"status.passed"},skipped:{className:"fa fa-minus-circle fa-fw text_status_skipped",tooltip:"status.skipped"},unknown:{className:"fa fa-question-circle fa-fw text_status_unknown",tooltip:"status.unknown"}};function a(t,e){var n=e.hash,a=n.extraClasses,s=void 0===a?"":a,l=n.noTooltip,u=void 0!==l&&l,c=i[t];return c?new r.SafeString('<span class="'.concat(c.className," ").concat(s,'" ').concat(u?"":'data-tooltip="'.concat((0,o.default)(c.tooltip),'"'),"></span>")):""}},4354:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return o}});var r=n(3633);function o(){return new r.SafeString('<span class="angle fa fa-angle-right fa-fw fa-lg"></span>')}},6308:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return o}});var r=n(3633);function o(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"unknown";return new r.SafeString('<span class="fa fa-chevron-right fa-fw text_status_'.concat(t,'"></span>'))}},3735:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return i}});var r=n(306),o=n.n(r);function i(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];var r=e.pop();return o().apply(void 0,e.concat([r.hash]))}},109:function(t,e,n){"use strict";function r(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return e.slice(0,-1).join("")}n.r(e),n.d(e,{default:function(){return r}})},9241:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return o}});var r=n(566);function o(t){return t?(t instanceof Date||(t=new Date(t)),new Intl.DateTimeFormat(r.Ay.language).format(t)):"unknown"}},2164:function(t,e,n){"use strict";function r(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];e.pop();for(var r=0,o=e;r<o.length;r++){var i=o[r];if(i)return i}}n.r(e),n.d(e,{default:function(){return r}})},5969:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return s}});var r=n(4523),o=n(7777),i=n.n(o),a=[{suffix:"d",method:function(t){return Math.floor(t.valueOf()/864e5)}},{suffix:"h",method:"getUTCHours"},{suffix:"m",method:"getUTCMinutes"},{suffix:"s",method:"getUTCSeconds"},{pad:3,suffix:"ms",method:"getUTCMilliseconds"}];function s(t,e){if(0===t)return"0s";if(!t)return"Unknown";var n=new Date(t);return"number"!=typeof e&&(e=2),a.map((function(t){var e=t.method,o=t.suffix,i=t.pad;return{value:(0,r.isFunction)(e)?e(n):n[e](),suffix:o,pad:i}})).reduce((function(t,e){var n=t.hasValue,r=t.out;return n=n||e.value>0,(e.value>0||n&&"ms"!==e.suffix)&&r.push(e),{hasValue:n,out:r}}),{hasValue:!1,out:[]}).out.map((function(t,e){return(0===e?t.value:i()(t.value,t.pad||2,"0"))+t.suffix})).slice(0,e).join(" ")}},7243:function(t,e,n){"use strict";function r(t,e){return t===e}n.r(e),n.d(e,{default:function(){return r}})},3198:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return o}});var r=n(5381);function o(t){return(0,r.A)(t).icon}},9735:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return C}});const r="array",o="bit",i="bits",a="byte",s="bytes",l="",u="exponent",c="function",h="iec",f="Invalid number",p="Invalid rounding method",d="jedec",m="object",g=".",v="round",y="s",b="si",w="kbit",_="kB",x=" ",k="string",A="0",O={symbol:{iec:{bits:["bit","Kibit","Mibit","Gibit","Tibit","Pibit","Eibit","Zibit","Yibit"],bytes:["B","KiB","MiB","GiB","TiB","PiB","EiB","ZiB","YiB"]},jedec:{bits:["bit","Kbit","Mbit","Gbit","Tbit","Pbit","Ebit","Zbit","Ybit"],bytes:["B","KB","MB","GB","TB","PB","EB","ZB","YB"]}},fullform:{iec:["","kibi","mebi","gibi","tebi","pebi","exbi","zebi","yobi"],jedec:["","kilo","mega","giga","tera","peta","exa","zetta","yotta"]}};function E(t,{bits:e=!1,pad:n=!1,base:E=-1,round:C=2,locale:S=l,localeOptions:P={},separator:j=l,spacer:T=x,symbols:R={},standard:M=l,output:N=k,fullform:D=!1,fullforms:B=[],exponent:V=-1,roundingMethod:I=v,precision:L=0}={}){let z=V,$=Number(t),F=[],U=0,H=l;M===b?(E=10,M=d):M===h||M===d?E=2:2===E?M=h:(E=10,M=d);const q=10===E?1e3:1024,W=!0===D,G=$<0,K=Math[I];if("bigint"!=typeof t&&isNaN(t))throw new TypeError(f);if(typeof K!==c)throw new TypeError(p);if(G&&($=-$),(-1===z||isNaN(z))&&(z=Math.floor(Math.log($)/Math.log(q)),z<0&&(z=0)),z>8&&(L>0&&(L+=8-z),z=8),N===u)return z;if(0===$)F[0]=0,H=F[1]=O.symbol[M][e?i:s][z];else{U=$/(2===E?Math.pow(2,10*z):Math.pow(1e3,z)),e&&(U*=8,U>=q&&z<8&&(U/=q,z++));const t=Math.pow(10,z>0?C:0);F[0]=K(U*t)/t,F[0]===q&&z<8&&-1===V&&(F[0]=1,z++),H=F[1]=10===E&&1===z?e?w:_:O.symbol[M][e?i:s][z]}if(G&&(F[0]=-F[0]),L>0&&(F[0]=F[0].toPrecision(L)),F[1]=R[F[1]]||F[1],!0===S?F[0]=F[0].toLocaleString():S.length>0?F[0]=F[0].toLocaleString(S,P):j.length>0&&(F[0]=F[0].toString().replace(g,j)),n&&!1===Number.isInteger(F[0])&&C>0){const t=j||g,e=F[0].toString().split(t),n=e[1]||l,r=n.length,o=C-r;F[0]=`${e[0]}${t}${n.padEnd(r+o,A)}`}return W&&(F[1]=B[z]?B[z]:O.fullform[M][z]+(e?o:a)+(1===F[0]?l:y)),N===r?F:N===m?{value:F[0],symbol:F[1],exponent:z,unit:H}:F.join(T)}function C(t){return E(t,{base:2,round:1})}},279:function(t,e,n){"use strict";function r(t){return t||"number"==typeof t}n.r(e),n.d(e,{default:function(){return r}})},2458:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return i}});var r=n(3633),o=/^(\w)+:\/\/.*/;function i(t){return o.test(t)?new r.SafeString('<a href="'.concat(t,'"  class="link" target="_blank">').concat(t,"</a>")):t}},180:function(t,e,n){"use strict";function r(t,e){return!(!t&&!e)}n.r(e),n.d(e,{default:function(){return r}})},1747:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return i}});var r=n(3633),o=n(5731);function i(t){var e=o.z.map((function(e){var n=t&&void 0!==t[e]?t[e]:0;return 0===n?"":'<span class="label label_status_'.concat(e,'">').concat(n,"</span> ")})).join("");return new r.SafeString("".concat(e))}},4883:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return i}});var r=n(3633),o=n(5731);function i(t){var e=o.z.map((function(e){var n=void 0===t[e]?0:t[e];return 0===n?"":'<div class="bar__fill bar__fill_status_'.concat(e,'" style="flex-grow: ').concat(n,'">').concat(n,"</div>")})).join("");return new r.SafeString('<div class="bar">'.concat(e,"</div>"))}},9237:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return o}});var r=n(566);function o(t,e){return r.Ay.t(t,e?e.hash:{})}},6827:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return a}});var r=n(3633),o=/((?:(https?:\/\/|ftp:\/\/|mailto:)|www\.)\S+?)(\s|"|'|\)|]|}|&#62|$)/gm,i=function(t){return t.replace(/[\u00A0-\u9999<>&]/gim,(function(t){return"&#".concat(t.charCodeAt(0),";")}))};function a(t){return void 0!==t&&t.match(o)?new r.SafeString(i(t).replace(o,(function(t,e,n,r){return'<a class="link" target="_blank" href="'.concat(n?e:"https://".concat(e),'">').concat(e,"</a>").concat(r," ")}))):t}},4336:function(t,e,n){"use strict";n.r(e),n.d(e,{default:function(){return i}});var r=n(7777),o=n.n(r);function i(t,e){return t?(t instanceof Date||(t=new Date(t)),"boolean"!=typeof e&&(e=!1),[t.getHours(),o()(t.getMinutes(),2,"0"),o()(t.getSeconds(),2,"0")+(e?".".concat(t.getMilliseconds()):"")].join(":")):"unknown"}},8563:function(t,e,n){"use strict";n.d(e,{A:function(){return et}});var r,o,i,a,s=n(3029),l=n(2901),u=n(388),c=n(3954),h=n(5361),f=n(4467),p=n(8603),d=n(2319),m=n(793),g=n(3633),v=n(4523),y=n(2854),b=n(734),w=n(8681),_=n(1248),x=n(566),k=n(991),A=n(4838),O=n(9922),E=n(4692),C=n.n(E),S=n(4965),P=n.n(S);function j(t,e,n){return e=(0,c.A)(e),(0,u.A)(t,T()?Reflect.construct(e,n||[],(0,c.A)(t).constructor):e.apply(t,n))}function T(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(T=function(){return!!t})()}var R,M,N,D,B,V,I,L,z=(r=(0,y.s7)("language-select popover"),o=(0,y.on)("click .language-select__item"),r((a=function(t){function e(){return(0,s.A)(this,e),j(this,e,arguments)}return(0,h.A)(e,t),(0,l.A)(e,[{key:"initialize",value:function(){(0,k.A)((0,c.A)(e.prototype),"initialize",this).call(this,{position:"top-right"})}},{key:"setContent",value:function(){this.$el.html(P()({languages:x.Yj,currentLang:_.A.getLanguage()}))}},{key:"show",value:function(t){var n=this;(0,k.A)((0,c.A)(e.prototype),"show",this).call(this,null,t),this.delegateEvents(),setTimeout((function(){C()(document).one("click",(function(){return n.hide()}))}))}},{key:"onLanguageClick",value:function(t){var e=this.$(t.currentTarget).data("id");_.A.setLanguage(e),x.Ay.changeLanguage(e),(0,O.A)("language_change",{language:e})}}])}(A.A),(0,m.A)(a.prototype,"onLanguageClick",[o],Object.getOwnPropertyDescriptor(a.prototype,"onLanguageClick"),a.prototype),i=a))||i),$=z,F=n(3678),U=n(9409),H=n.n(U);function q(t,e,n){return e=(0,c.A)(e),(0,u.A)(t,W()?Reflect.construct(e,n||[],(0,c.A)(t).constructor):e.apply(t,n))}function W(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(W=function(){return!!t})()}var G,K=(R=(0,y.s7)("side-nav"),M=(0,y.on)("mouseenter [data-tooltip]"),N=(0,y.on)("mouseleave [data-tooltip]"),D=(0,y.on)("click .side-nav__collapse"),B=(0,y.on)("click .side-nav__language"),V=(0,y.on)("click .side-nav__language-small"),R((L=function(t){function e(){var t;(0,s.A)(this,e);for(var n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];return t=q(this,e,[].concat(r)),(0,f.A)(t,"template",H()),t}return(0,h.A)(e,t),(0,l.A)(e,[{key:"initialize",value:function(){var t=this;this.tabs=w.A.tabs.map((function(e){var n=e.tabName;return{tabName:n,icon:e.icon,title:e.title,active:t.isTabActive(n)}})),this.tooltip=new F.A({position:"right"}),this.langSelect=new $}},{key:"onRender",value:function(){this.$el.toggleClass("side-nav_collapsed",_.A.isSidebarCollapsed())}},{key:"onDestroy",value:function(){this.tooltip.hide()}},{key:"serializeData",value:function(){return{language:(0,v.findWhere)(x.Yj,{id:_.A.getLanguage()}),tabs:this.tabs}}},{key:"isTabActive",value:function(t){var e=b.A.getCurrentUrl();return t?0===e.indexOf(t):e===t}},{key:"onSidelinkHover",value:function(t){if(this.$el.hasClass("side-nav_collapsed")){var e=this.$(t.currentTarget);this.tooltip.show((0,g.escapeExpression)(e.data("tooltip")),e)}}},{key:"onSidelinkLeave",value:function(){this.tooltip.hide()}},{key:"onCollapseClick",value:function(){this.$el.toggleClass("side-nav_collapsed"),_.A.setSidebarCollapsed(this.$el.hasClass("side-nav_collapsed")),this.tooltip.hide()}},{key:"onLanguageClick",value:function(t){this.langSelect.isVisible()?this.langSelect.hide():this.langSelect.show(this.$(t.currentTarget)),this.tooltip.hide()}}])}(p.View),(0,m.A)(L.prototype,"onSidelinkHover",[M],Object.getOwnPropertyDescriptor(L.prototype,"onSidelinkHover"),L.prototype),(0,m.A)(L.prototype,"onSidelinkLeave",[N],Object.getOwnPropertyDescriptor(L.prototype,"onSidelinkLeave"),L.prototype),(0,m.A)(L.prototype,"onCollapseClick",[D],Object.getOwnPropertyDescriptor(L.prototype,"onCollapseClick"),L.prototype),(0,m.A)(L.prototype,"onLanguageClick",[B,V],Object.getOwnPropertyDescriptor(L.prototype,"onLanguageClick"),L.prototype),I=L))||I),X=K,Y=n(4821),J=n.n(Y);function Z(t,e,n){return e=(0,c.A)(e),(0,u.A)(t,Q()?Reflect.construct(e,n||[],(0,c.A)(t).constructor):e.apply(t,n))}function Q(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Q=function(){return!!t})()}var tt=(0,y.s7)("app")(G=(0,y.Ei)({content:".app__content",nav:".app__nav"})(G=(0,y.h1)("GaBehavior")(G=(0,y.h1)("DownloadBehavior")(G=function(t){function e(){var t;(0,s.A)(this,e);for(var n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];return t=Z(this,e,[].concat(r)),(0,f.A)(t,"template",J()),t}return(0,h.A)(e,t),(0,l.A)(e,[{key:"initialize",value:function(){}},{key:"onRender",value:function(){var t=this;this.showChildView("nav",new X);var e=this.loadData();e?e.then((function(){t.showChildView("content",t.getContentView()),t.onViewReady()})).catch((function(e){t.showChildView("content",new d.A({code:404,message:e}))})):this.showChildView("content",this.getContentView())}},{key:"onViewReady",value:function(){}},{key:"loadData",value:function(){}},{key:"getContentView",value:function(){throw new Error("attempt to call abstract method")}},{key:"shouldKeepState",value:function(){return!0}}])}(p.View))||G)||G)||G)||G,et=tt},427:function(){allure.api.addTab("categories",{title:"tab.categories.name",icon:"fa fa-flag",route:"categories(/)(:testGroup)(/)(:testResult)(/)(:testResultTab)(/)",onEnter:function(t,e,n){return new allure.components.TreeLayout({testGroup:t,testResult:e,testResultTab:n,tabName:"tab.categories.name",baseUrl:"categories",url:"data/categories.json",csvUrl:"data/categories.csv"})}})},1334:function(){allure.api.addTab("suites",{title:"tab.suites.name",icon:"fa fa-briefcase",route:"suites(/)(:testGroup)(/)(:testResult)(/)(:testResultTab)(/)",onEnter:function(t,e,n){return new allure.components.TreeLayout({testGroup:t,testResult:e,testResultTab:n,tabName:"tab.suites.name",baseUrl:"suites",url:"data/suites.json",csvUrl:"data/suites.csv"})}})},734:function(t,e,n){"use strict";var r=n(3029),o=n(2901),i=n(388),a=n(3954),s=n(5361),l=n(4467),u=n(8835),c=n(1391),h=n(4523);function f(t,e,n){return e=(0,a.A)(e),(0,i.A)(t,p()?Reflect.construct(e,n||[],(0,a.A)(t).constructor):e.apply(t,n))}function p(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(p=function(){return!!t})()}var d=function(t){function e(){var t;return(0,r.A)(this,e),t=f(this,e,[{routes:{"testresult/:uid(/)(:tabName)":"testresultPage","*default":"notFound"}}]),(0,l.A)(t,"currentUrl",null),t.on("route",t.onRouteChange,t),t}return(0,s.A)(e,t),(0,o.A)(e,[{key:"onRouteChange",value:function(){this.previousUrl=this.currentUrl,this.currentUrl=this.getCurrentUrl()}},{key:"getCurrentUrl",value:function(){return c.history.getFragment()}},{key:"reload",value:function(){c.history.loadUrl(this.getCurrentUrl())}},{key:"to",value:function(t,e,n){e=(0,h.omit)(e,(function(t){return null===t}));var r=u.format({pathname:t,query:e});return this.toUrl(r,n)}},{key:"toUrl",value:function(t,e){return this.navigate(t,Object.assign({trigger:!0},e))}},{key:"setSearch",value:function(t){var e=u.parse(this.getCurrentUrl()).pathname;return this.to(e,t)}},{key:"getUrlParams",value:function(){var t=u.parse(this.getCurrentUrl(),!0);return t?t.query:{}}}])}(c.Router);e.A=new d},3963:function(t,e,n){"use strict";function r(t){return Array.isArray(t)?t:t?[t]:[]}n.d(e,{g:function(){return r}})},5381:function(t,e,n){"use strict";n.d(e,{A:function(){return v}});var r=n(4467),o={},i={};function a(t){return new Function("d","return {"+t.map((function(t,e){return JSON.stringify(t)+": d["+e+'] || ""'})).join(",")+"}")}function s(t){var e=Object.create(null),n=[];return t.forEach((function(t){for(var r in t)r in e||n.push(e[r]=r)})),n}function l(t,e){var n=t+"",r=n.length;return r<e?new Array(e-r+1).join(0)+n:n}function u(t){var e,n=t.getUTCHours(),r=t.getUTCMinutes(),o=t.getUTCSeconds(),i=t.getUTCMilliseconds();return isNaN(t)?"Invalid Date":((e=t.getUTCFullYear())<0?"-"+l(-e,6):e>9999?"+"+l(e,6):l(e,4))+"-"+l(t.getUTCMonth()+1,2)+"-"+l(t.getUTCDate(),2)+(i?"T"+l(n,2)+":"+l(r,2)+":"+l(o,2)+"."+l(i,3)+"Z":o?"T"+l(n,2)+":"+l(r,2)+":"+l(o,2)+"Z":r||n?"T"+l(n,2)+":"+l(r,2)+"Z":"")}function c(t){var e=new RegExp('["'+t+"\n\r]"),n=t.charCodeAt(0);function r(t,e){var r,a=[],s=t.length,l=0,u=0,c=s<=0,h=!1;function f(){if(c)return i;if(h)return h=!1,o;var e,r,a=l;if(34===t.charCodeAt(a)){for(;l++<s&&34!==t.charCodeAt(l)||34===t.charCodeAt(++l););return(e=l)>=s?c=!0:10===(r=t.charCodeAt(l++))?h=!0:13===r&&(h=!0,10===t.charCodeAt(l)&&++l),t.slice(a+1,e-1).replace(/""/g,'"')}for(;l<s;){if(10===(r=t.charCodeAt(e=l++)))h=!0;else if(13===r)h=!0,10===t.charCodeAt(l)&&++l;else if(r!==n)continue;return t.slice(a,e)}return c=!0,t.slice(a,s)}for(10===t.charCodeAt(s-1)&&--s,13===t.charCodeAt(s-1)&&--s;(r=f())!==i;){for(var p=[];r!==o&&r!==i;)p.push(r),r=f();e&&null==(p=e(p,u++))||a.push(p)}return a}function l(e,n){return e.map((function(e){return n.map((function(t){return h(e[t])})).join(t)}))}function c(e){return e.map(h).join(t)}function h(t){return null==t?"":t instanceof Date?u(t):e.test(t+="")?'"'+t.replace(/"/g,'""')+'"':t}return{parse:function(t,e){var n,o,i=r(t,(function(t,r){if(n)return n(t,r-1);o=t,n=e?function(t,e){var n=a(t);return function(r,o){return e(n(r),o,t)}}(t,e):a(t)}));return i.columns=o||[],i},parseRows:r,format:function(e,n){return null==n&&(n=s(e)),[n.map(h).join(t)].concat(l(e,n)).join("\n")},formatBody:function(t,e){return null==e&&(e=s(t)),l(t,e).join("\n")},formatRows:function(t){return t.map(c).join("\n")},formatRow:c,formatValue:h}}var h=c(","),f=(h.parse,h.parseRows),p=(h.format,h.formatBody,h.formatRows,h.formatRow,h.formatValue,c("\t")),d=(p.parse,p.parseRows),m=(p.format,p.formatBody,p.formatRows,p.formatRow,p.formatValue,n(8681));function g(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function v(t){if(m.A.attachmentViews[t])return function(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?g(Object(n),!0).forEach((function(e){(0,r.A)(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):g(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}({type:"custom"},m.A.attachmentViews[t]);switch(t){case"image/bmp":case"image/gif":case"image/tiff":case"image/jpeg":case"image/jpg":case"image/png":case"image/*":return{type:"image",icon:"fa fa-file-image-o"};case"text/xml":case"application/xml":case"application/json":case"text/json":case"text/yaml":case"application/yaml":case"application/x-yaml":case"text/x-yaml":return{type:"code",icon:"fa fa-file-code-o",parser:function(t){return t}};case"text/plain":case"text/*":return{type:"text",icon:"fa fa-file-text-o",parser:function(t){return t}};case"text/html":return{type:"html",icon:"fa fa-file-code-o"};case"text/csv":return{type:"table",icon:"fa fa-table",parser:function(t){return f(t)}};case"text/tab-separated-values":return{type:"table",icon:"fa fa-table",parser:function(t){return d(t)}};case"image/svg+xml":return{type:"svg",icon:"fa fa-file-image-o"};case"video/mp4":case"video/ogg":case"video/webm":return{type:"video",icon:"fa fa-file-video-o"};case"text/uri-list":return{type:"uri",icon:"fa fa-list-alt",parser:function(t){return t.split("\n").map((function(t){return t.trim()})).filter((function(t){return t.length>0})).map((function(t){return{comment:0===t.indexOf("#"),text:t}}))}};case"application/x-tar":case"application/x-gtar":case"application/x-bzip2":case"application/gzip":case"application/zip":return{type:"archive",icon:"fa fa-file-archive-o"};default:return{type:null,icon:"fa fa-file-o"}}}},2415:function(t){"use strict";t.exports=function(t){var e=document.createElement("textarea");e.value=t,e.setAttribute("readonly",""),e.style.contain="strict",e.style.position="absolute",e.style.left="-9999px",e.style.fontSize="12pt";var n=getSelection(),r=!1;n.rangeCount>0&&(r=n.getRangeAt(0)),document.body.appendChild(e),e.select();var o=!1;try{o=document.execCommand("copy")}catch(t){}return document.body.removeChild(e),r&&(n.removeAllRanges(),n.addRange(r)),o}},9922:function(t,e,n){"use strict";function r(t,e){!function(){window.dataLayer=Array.isArray(window.dataLayer)?window.dataLayer:[],window.dataLayer.push(arguments)}("event",t,e)}n.d(e,{A:function(){return r}})},8681:function(t,e,n){"use strict";n.d(e,{A:function(){return x}});var r=n(3029),o=n(2901),i=n(4467),a=n(4755),s=n(388),l=n(991),u=n(3954),c=n(5361),h=n(1391),f=n(5193);function p(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function d(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?p(Object(n),!0).forEach((function(e){(0,i.A)(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):p(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}function m(t,e,n){return e=(0,u.A)(e),(0,s.A)(t,g()?Reflect.construct(e,n||[],(0,u.A)(t).constructor):e.apply(t,n))}function g(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(g=function(){return!!t})()}var v=function(t){function e(){return(0,r.A)(this,e),m(this,e,arguments)}return(0,c.A)(e,t),(0,o.A)(e,[{key:"initialize",value:function(t,e){this.options=e}},{key:"url",value:function(){return"widgets/".concat(this.options.name,".json")}},{key:"parse",value:function(t){return Array.isArray(t)?{items:t}:t}},{key:"fetch",value:function(t){var n=this;return(0,f._)(this.url(),"application/json").then((function(r){return(0,l.A)((0,u.A)(e.prototype),"fetch",n).call(n,d(d({},t),{},{url:r}))}))}},{key:"getWidgetData",value:function(t){var e=this.get(t);return new h.Model(Array.isArray(e)?{items:e}:e)}}])}(h.Model),y=n(9237),b=n(734),w=n(566),_=function(){return(0,o.A)((function t(){(0,r.A)(this,t),(0,i.A)(this,"tabs",[]),(0,i.A)(this,"testResultTabs",[]),(0,i.A)(this,"attachmentViews",{}),(0,i.A)(this,"testResultBlocks",{tag:[],before:[],after:[]}),(0,i.A)(this,"widgets",{})}),[{key:"addTab",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=e.title,r=e.icon,o=e.route,i=e.onEnter,s=void 0===i?a.mX:i;n=n||t,this.tabs.push({tabName:t,title:n,icon:r}),b.A.route(o,t),b.A.on("route:".concat(t),(0,a.nZ)(s))}},{key:"addWidget",value:function(t,e,n){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:v;this.widgets[t]||(this.widgets[t]={}),this.widgets[t][e]={widget:n,model:r}}},{key:"addTranslation",value:function(t,e){(0,w.XY)(t,e)}},{key:"translate",value:function(t,e){return(0,y.default)(t,e)}},{key:"addTestResultBlock",value:function(t,e){var n=e.position;this.testResultBlocks[n].push(t)}},{key:"addAttachmentViewer",value:function(t,e){var n=e.View,r=e.icon,o=void 0===r?"fa fa-file-o":r;this.attachmentViews[t]={View:n,icon:o}}},{key:"addTestResultTab",value:function(t,e,n){this.testResultTabs.push({id:t,name:e,View:n})}}])}(),x=new _},1248:function(t,e,n){"use strict";var r=(0,n(1109).fv)();e.A=r},1109:function(t,e,n){"use strict";n.d(e,{fv:function(){return v},gU:function(){return y},O$:function(){return w},gW:function(){return b}});var r=n(4467),o=n(3029),i=n(2901),a=n(388),s=n(3954),l=n(5361);function u(t,e,n){return e=(0,s.A)(e),(0,a.A)(t,c()?Reflect.construct(e,n||[],(0,s.A)(t).constructor):e.apply(t,n))}function c(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(c=function(){return!!t})()}var h=function(t){function e(){return(0,o.A)(this,e),u(this,e,arguments)}return(0,l.A)(e,t),(0,i.A)(e,[{key:"storageKey",value:function(){return"ALLURE_REPORT_SETTINGS"}},{key:"fetch",value:function(){var t=this;return new Promise((function(e){var n=window.localStorage.getItem(t.storageKey());n&&t.set(JSON.parse(n)),e()}))}},{key:"save",value:function(t,e){this.set(t,e);var n=this.toJSON();window.localStorage.setItem(this.storageKey(),JSON.stringify(n))}}])}(n(1391).Model);function f(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function p(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?f(Object(n),!0).forEach((function(e){(0,r.A)(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):f(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}var d={sidebarCollapsed:!1,sideBySidePosition:[50,50]},m={visibleStatuses:{failed:!0,broken:!0,skipped:!0,unknown:!0,passed:!0},visibleMarks:{flaky:!1,newFailed:!1,newPassed:!1,newBroken:!1,retriesStatusChange:!1},showGroupInfo:!1,treeSorting:{ascending:!0,sorter:"sorter.name"}},g={widgets:[[],[]]};function v(){var t=new(h.extend({defaults:function(){return p(p({},d),{},{language:document.documentElement.lang||"en"})},getLanguage:function(){return this.get("language")},setLanguage:function(t){return this.save("language",t)},isSidebarCollapsed:function(){return this.get("sidebarCollapsed")},setSidebarCollapsed:function(t){return this.save("sidebarCollapsed",t)},getSideBySidePosition:function(){return this.get("sideBySidePosition")},setSideBySidePosition:function(t){return this.save("sideBySidePosition",t)}}));return t.fetch(),t}function y(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=new(h.extend({storageKey:function(){return"ALLURE_REPORT_SETTINGS_".concat(t.toUpperCase())},defaults:function(){return e}}));return n.fetch(),n}function b(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:g,n=new(h.extend({storageKey:function(){return"ALLURE_REPORT_SETTINGS_".concat(t.toUpperCase())},defaults:function(){return e},getWidgetsArrangement:function(){return this.get("widgets")},setWidgetsArrangement:function(t){this.save("widgets",t)}}));return n.fetch(),n}function w(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:m,n=new(h.extend({storageKey:function(){return"ALLURE_REPORT_SETTINGS_".concat(t.toUpperCase())},defaults:function(){return e},getVisibleStatuses:function(){return this.get("visibleStatuses")},setVisibleStatuses:function(t){return this.save("visibleStatuses",t)},getVisibleMarks:function(){return this.get("visibleMarks")},setVisibleMarks:function(t){return this.save("visibleMarks",t)},getTreeSorting:function(){return this.get("treeSorting")},setTreeSorting:function(t){this.save("treeSorting",t)},isShowGroupInfo:function(){return this.get("showGroupInfo")},setShowGroupInfo:function(t){this.save("showGroupInfo",t)}}));return n.fetch(),n}},5731:function(t,e,n){"use strict";n.d(e,{z:function(){return r}});var r=["failed","broken","passed","skipped","unknown"]},566:function(t,e,n){"use strict";n.d(e,{Yj:function(){return rt},XY:function(){return it},Ay:function(){return at},vM:function(){return ot}});var r=Object.assign||function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t};var o={type:"logger",log:function(t){this.output("log",t)},warn:function(t){this.output("warn",t)},error:function(t){this.output("error",t)},output:function(t,e){var n;console&&console[t]&&(n=console)[t].apply(n,function(t){if(Array.isArray(t)){for(var e=0,n=Array(t.length);e<t.length;e++)n[e]=t[e];return n}return Array.from(t)}(e))}},i=function(){function t(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.init(e,n)}return t.prototype.init=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};this.prefix=e.prefix||"i18next:",this.logger=t||o,this.options=e,this.debug=e.debug},t.prototype.setDebug=function(t){this.debug=t},t.prototype.log=function(){for(var t=arguments.length,e=Array(t),n=0;n<t;n++)e[n]=arguments[n];return this.forward(e,"log","",!0)},t.prototype.warn=function(){for(var t=arguments.length,e=Array(t),n=0;n<t;n++)e[n]=arguments[n];return this.forward(e,"warn","",!0)},t.prototype.error=function(){for(var t=arguments.length,e=Array(t),n=0;n<t;n++)e[n]=arguments[n];return this.forward(e,"error","")},t.prototype.deprecate=function(){for(var t=arguments.length,e=Array(t),n=0;n<t;n++)e[n]=arguments[n];return this.forward(e,"warn","WARNING DEPRECATED: ",!0)},t.prototype.forward=function(t,e,n,r){return r&&!this.debug?null:("string"==typeof t[0]&&(t[0]=""+n+this.prefix+" "+t[0]),this.logger[e](t))},t.prototype.create=function(e){return new t(this.logger,r({prefix:this.prefix+":"+e+":"},this.options))},t}(),a=new i;var s=function(){function t(){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.observers={}}return t.prototype.on=function(t,e){var n=this;t.split(" ").forEach((function(t){n.observers[t]=n.observers[t]||[],n.observers[t].push(e)}))},t.prototype.off=function(t,e){var n=this;this.observers[t]&&this.observers[t].forEach((function(){if(e){var r=n.observers[t].indexOf(e);r>-1&&n.observers[t].splice(r,1)}else delete n.observers[t]}))},t.prototype.emit=function(t){for(var e=arguments.length,n=Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];this.observers[t]&&[].concat(this.observers[t]).forEach((function(t){t.apply(void 0,n)}));this.observers["*"]&&[].concat(this.observers["*"]).forEach((function(e){var r;e.apply(e,(r=[t]).concat.apply(r,n))}))},t}(),l=s;function u(t){return null==t?"":""+t}function c(t,e,n){function r(t){return t&&t.indexOf("###")>-1?t.replace(/###/g,"."):t}function o(){return!t||"string"==typeof t}for(var i="string"!=typeof e?[].concat(e):e.split(".");i.length>1;){if(o())return{};var a=r(i.shift());!t[a]&&n&&(t[a]=new n),t=t[a]}return o()?{}:{obj:t,k:r(i.shift())}}function h(t,e,n){var r=c(t,e,Object);r.obj[r.k]=n}function f(t,e){var n=c(t,e),r=n.obj,o=n.k;if(r)return r[o]}function p(t,e,n){for(var r in e)r in t?"string"==typeof t[r]||t[r]instanceof String||"string"==typeof e[r]||e[r]instanceof String?n&&(t[r]=e[r]):p(t[r],e[r],n):t[r]=e[r];return t}function d(t){return t.replace(/[\-\[\]\/\{\}\(\)\*\+\?\.\\\^\$\|]/g,"\\$&")}var m={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;","/":"&#x2F;"};function g(t){return"string"==typeof t?t.replace(/[&<>"'\/]/g,(function(t){return m[t]})):t}var v=Object.assign||function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t};function y(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):function(t,e){for(var n=Object.getOwnPropertyNames(e),r=0;r<n.length;r++){var o=n[r],i=Object.getOwnPropertyDescriptor(e,o);i&&i.configurable&&void 0===t[o]&&Object.defineProperty(t,o,i)}}(t,e))}var b=function(t){function e(){var n=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{ns:["translation"],defaultNS:"translation"};!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);var o=function(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}(this,t.call(this));return o.data=n,o.options=r,o}return y(e,t),e.prototype.addNamespaces=function(t){this.options.ns.indexOf(t)<0&&this.options.ns.push(t)},e.prototype.removeNamespaces=function(t){var e=this.options.ns.indexOf(t);e>-1&&this.options.ns.splice(e,1)},e.prototype.getResource=function(t,e,n){var r=(arguments.length>3&&void 0!==arguments[3]?arguments[3]:{}).keySeparator||this.options.keySeparator;void 0===r&&(r=".");var o=[t,e];return n&&"string"!=typeof n&&(o=o.concat(n)),n&&"string"==typeof n&&(o=o.concat(r?n.split(r):n)),t.indexOf(".")>-1&&(o=t.split(".")),f(this.data,o)},e.prototype.addResource=function(t,e,n,r){var o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:{silent:!1},i=this.options.keySeparator;void 0===i&&(i=".");var a=[t,e];n&&(a=a.concat(i?n.split(i):n)),t.indexOf(".")>-1&&(r=e,e=(a=t.split("."))[1]),this.addNamespaces(e),h(this.data,a,r),o.silent||this.emit("added",t,e,n,r)},e.prototype.addResources=function(t,e,n){for(var r in n)"string"==typeof n[r]&&this.addResource(t,e,r,n[r],{silent:!0});this.emit("added",t,e,n)},e.prototype.addResourceBundle=function(t,e,n,r,o){var i=[t,e];t.indexOf(".")>-1&&(r=n,n=e,e=(i=t.split("."))[1]),this.addNamespaces(e);var a=f(this.data,i)||{};r?p(a,n,o):a=v({},a,n),h(this.data,i,a),this.emit("added",t,e,n)},e.prototype.removeResourceBundle=function(t,e){this.hasResourceBundle(t,e)&&delete this.data[t][e],this.removeNamespaces(e),this.emit("removed",t,e)},e.prototype.hasResourceBundle=function(t,e){return void 0!==this.getResource(t,e)},e.prototype.getResourceBundle=function(t,e){return e||(e=this.options.defaultNS),"v1"===this.options.compatibilityAPI?v({},this.getResource(t,e)):this.getResource(t,e)},e.prototype.toJSON=function(){return this.data},e}(l),w=b,_={processors:{},addPostProcessor:function(t){this.processors[t.name]=t},handle:function(t,e,n,r,o){var i=this;return t.forEach((function(t){i.processors[t]&&(e=i.processors[t].process(e,n,r,o))})),e}};function x(t){return t.interpolation={unescapeSuffix:"HTML"},t.interpolation.prefix=t.interpolationPrefix||"__",t.interpolation.suffix=t.interpolationSuffix||"__",t.interpolation.escapeValue=t.escapeInterpolation||!1,t.interpolation.nestingPrefix=t.reusePrefix||"$t(",t.interpolation.nestingSuffix=t.reuseSuffix||")",t}function k(t){return(t.interpolationPrefix||t.interpolationSuffix||void 0!==t.escapeInterpolation)&&(t=x(t)),t.nsSeparator=t.nsseparator,t.keySeparator=t.keyseparator,t.returnObjects=t.returnObjectTrees,t}var A=Object.assign||function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t},O="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t};function E(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):function(t,e){for(var n=Object.getOwnPropertyNames(e),r=0;r<n.length;r++){var o=n[r],i=Object.getOwnPropertyDescriptor(e,o);i&&i.configurable&&void 0===t[o]&&Object.defineProperty(t,o,i)}}(t,e))}var C=function(t){function e(n){var r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);var o=function(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}(this,t.call(this));return function(t,e,n){t.forEach((function(t){e[t]&&(n[t]=e[t])}))}(["resourceStore","languageUtils","pluralResolver","interpolator","backendConnector"],n,o),o.options=r,o.logger=a.create("translator"),o}return E(e,t),e.prototype.changeLanguage=function(t){t&&(this.language=t)},e.prototype.exists=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{interpolation:{}};return"v1"===this.options.compatibilityAPI&&(e=k(e)),void 0!==this.resolve(t,e)},e.prototype.extractFromKey=function(t,e){var n=e.nsSeparator||this.options.nsSeparator;void 0===n&&(n=":");var r=e.keySeparator||this.options.keySeparator||".",o=e.ns||this.options.defaultNS;if(n&&t.indexOf(n)>-1){var i=t.split(n);(n!==r||n===r&&this.options.ns.indexOf(i[0])>-1)&&(o=i.shift()),t=i.join(r)}return"string"==typeof o&&(o=[o]),{key:t,namespaces:o}},e.prototype.translate=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if("object"!==(void 0===e?"undefined":O(e))?e=this.options.overloadTranslationOptionHandler(arguments):"v1"===this.options.compatibilityAPI&&(e=k(e)),null==t||""===t)return"";"number"==typeof t&&(t=String(t)),"string"==typeof t&&(t=[t]);var n=e.keySeparator||this.options.keySeparator||".",r=this.extractFromKey(t[t.length-1],e),o=r.key,i=r.namespaces,a=i[i.length-1],s=e.lng||this.language,l=e.appendNamespaceToCIMode||this.options.appendNamespaceToCIMode;if(s&&"cimode"===s.toLowerCase())return l?a+(e.nsSeparator||this.options.nsSeparator)+o:o;var u=this.resolve(t,e),c=Object.prototype.toString.apply(u),h=void 0!==e.joinArrays?e.joinArrays:this.options.joinArrays;if(u&&"string"!=typeof u&&["[object Number]","[object Function]","[object RegExp]"].indexOf(c)<0&&(!h||"[object Array]"!==c)){if(!e.returnObjects&&!this.options.returnObjects)return this.logger.warn("accessing an object - but returnObjects options is not enabled!"),this.options.returnedObjectHandler?this.options.returnedObjectHandler(o,u,e):"key '"+o+" ("+this.language+")' returned an object instead of string.";if(e.keySeparator||this.options.keySeparator){var f="[object Array]"===c?[]:{};for(var p in u)Object.prototype.hasOwnProperty.call(u,p)&&(f[p]=this.translate(""+o+n+p,A({},e,{joinArrays:!1,ns:i})));u=f}}else if(h&&"[object Array]"===c)(u=u.join(h))&&(u=this.extendTranslation(u,o,e));else{var d=!1,m=!1;if(this.isValidLookup(u)||void 0===e.defaultValue||(d=!0,u=e.defaultValue),this.isValidLookup(u)||(m=!0,u=o),m||d){this.logger.log("missingKey",s,a,o,u);var g=[],v=this.languageUtils.getFallbackCodes(this.options.fallbackLng,e.lng||this.language);if("fallback"===this.options.saveMissingTo&&v&&v[0])for(var y=0;y<v.length;y++)g.push(v[y]);else"all"===this.options.saveMissingTo?g=this.languageUtils.toResolveHierarchy(e.lng||this.language):g.push(e.lng||this.language);this.options.saveMissing&&(this.options.missingKeyHandler?this.options.missingKeyHandler(g,a,o,u):this.backendConnector&&this.backendConnector.saveMissing&&this.backendConnector.saveMissing(g,a,o,u)),this.emit("missingKey",g,a,o,u)}u=this.extendTranslation(u,o,e),m&&u===o&&this.options.appendNamespaceToMissingKey&&(u=a+":"+o),m&&this.options.parseMissingKeyHandler&&(u=this.options.parseMissingKeyHandler(u))}return u},e.prototype.extendTranslation=function(t,e,n){var r=this;n.interpolation&&this.interpolator.init(A({},n,{interpolation:A({},this.options.interpolation,n.interpolation)}));var o=n.replace&&"string"!=typeof n.replace?n.replace:n;this.options.interpolation.defaultVariables&&(o=A({},this.options.interpolation.defaultVariables,o)),t=this.interpolator.interpolate(t,o,n.lng||this.language),!1!==n.nest&&(t=this.interpolator.nest(t,(function(){return r.translate.apply(r,arguments)}),n)),n.interpolation&&this.interpolator.reset();var i=n.postProcess||this.options.postProcess,a="string"==typeof i?[i]:i;return void 0!==t&&a&&a.length&&!1!==n.applyPostProcessor&&(t=_.handle(a,t,e,n,this)),t},e.prototype.resolve=function(t){var e=this,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=void 0;return"string"==typeof t&&(t=[t]),t.forEach((function(t){if(!e.isValidLookup(r)){var o=e.extractFromKey(t,n),i=o.key,a=o.namespaces;e.options.fallbackNS&&(a=a.concat(e.options.fallbackNS));var s=void 0!==n.count&&"string"!=typeof n.count,l=void 0!==n.context&&"string"==typeof n.context&&""!==n.context,u=n.lngs?n.lngs:e.languageUtils.toResolveHierarchy(n.lng||e.language);a.forEach((function(t){e.isValidLookup(r)||u.forEach((function(o){if(!e.isValidLookup(r)){var a=i,u=[a],c=void 0;s&&(c=e.pluralResolver.getSuffix(o,n.count)),s&&l&&u.push(a+c),l&&u.push(a+=""+e.options.contextSeparator+n.context),s&&u.push(a+=c);for(var h=void 0;h=u.pop();)e.isValidLookup(r)||(r=e.getResource(o,t,h,n))}}))}))}})),r},e.prototype.isValidLookup=function(t){return!(void 0===t||!this.options.returnNull&&null===t||!this.options.returnEmptyString&&""===t)},e.prototype.getResource=function(t,e,n){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};return this.resourceStore.getResource(t,e,n,r)},e}(l),S=C;function P(t){return t.charAt(0).toUpperCase()+t.slice(1)}var j=function(){function t(e){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.options=e,this.whitelist=this.options.whitelist||!1,this.logger=a.create("languageUtils")}return t.prototype.getScriptPartFromCode=function(t){if(!t||t.indexOf("-")<0)return null;var e=t.split("-");return 2===e.length?null:(e.pop(),this.formatLanguageCode(e.join("-")))},t.prototype.getLanguagePartFromCode=function(t){if(!t||t.indexOf("-")<0)return t;var e=t.split("-");return this.formatLanguageCode(e[0])},t.prototype.formatLanguageCode=function(t){if("string"==typeof t&&t.indexOf("-")>-1){var e=["hans","hant","latn","cyrl","cans","mong","arab"],n=t.split("-");return this.options.lowerCaseLng?n=n.map((function(t){return t.toLowerCase()})):2===n.length?(n[0]=n[0].toLowerCase(),n[1]=n[1].toUpperCase(),e.indexOf(n[1].toLowerCase())>-1&&(n[1]=P(n[1].toLowerCase()))):3===n.length&&(n[0]=n[0].toLowerCase(),2===n[1].length&&(n[1]=n[1].toUpperCase()),"sgn"!==n[0]&&2===n[2].length&&(n[2]=n[2].toUpperCase()),e.indexOf(n[1].toLowerCase())>-1&&(n[1]=P(n[1].toLowerCase())),e.indexOf(n[2].toLowerCase())>-1&&(n[2]=P(n[2].toLowerCase()))),n.join("-")}return this.options.cleanCode||this.options.lowerCaseLng?t.toLowerCase():t},t.prototype.isWhitelisted=function(t){return("languageOnly"===this.options.load||this.options.nonExplicitWhitelist)&&(t=this.getLanguagePartFromCode(t)),!this.whitelist||!this.whitelist.length||this.whitelist.indexOf(t)>-1},t.prototype.getFallbackCodes=function(t,e){if(!t)return[];if("string"==typeof t&&(t=[t]),"[object Array]"===Object.prototype.toString.apply(t))return t;if(!e)return t.default||[];var n=t[e];return n||(n=t[this.getScriptPartFromCode(e)]),n||(n=t[this.formatLanguageCode(e)]),n||(n=t.default),n||[]},t.prototype.toResolveHierarchy=function(t,e){var n=this,r=this.getFallbackCodes(e||this.options.fallbackLng||[],t),o=[],i=function(t){t&&(n.isWhitelisted(t)?o.push(t):n.logger.warn("rejecting non-whitelisted language code: "+t))};return"string"==typeof t&&t.indexOf("-")>-1?("languageOnly"!==this.options.load&&i(this.formatLanguageCode(t)),"languageOnly"!==this.options.load&&"currentOnly"!==this.options.load&&i(this.getScriptPartFromCode(t)),"currentOnly"!==this.options.load&&i(this.getLanguagePartFromCode(t))):"string"==typeof t&&i(this.formatLanguageCode(t)),r.forEach((function(t){o.indexOf(t)<0&&i(n.formatLanguageCode(t))})),o},t}();var T=[{lngs:["ach","ak","am","arn","br","fil","gun","ln","mfe","mg","mi","oc","tg","ti","tr","uz","wa"],nr:[1,2],fc:1},{lngs:["af","an","ast","az","bg","bn","ca","da","de","dev","el","en","eo","es","es_ar","et","eu","fi","fo","fur","fy","gl","gu","ha","he","hi","hu","hy","ia","it","kn","ku","lb","mai","ml","mn","mr","nah","nap","nb","ne","nl","nn","no","nso","pa","pap","pms","ps","pt","pt_br","rm","sco","se","si","so","son","sq","sv","sw","ta","te","tk","ur","yo"],nr:[1,2],fc:2},{lngs:["ay","bo","cgg","fa","id","ja","jbo","ka","kk","km","ko","ky","lo","ms","sah","su","th","tt","ug","vi","wo","zh"],nr:[1],fc:3},{lngs:["be","bs","dz","hr","ru","sr","uk"],nr:[1,2,5],fc:4},{lngs:["ar"],nr:[0,1,2,3,11,100],fc:5},{lngs:["cs","sk"],nr:[1,2,5],fc:6},{lngs:["csb","pl"],nr:[1,2,5],fc:7},{lngs:["cy"],nr:[1,2,3,8],fc:8},{lngs:["fr"],nr:[1,2],fc:9},{lngs:["ga"],nr:[1,2,3,7,11],fc:10},{lngs:["gd"],nr:[1,2,3,20],fc:11},{lngs:["is"],nr:[1,2],fc:12},{lngs:["jv"],nr:[0,1],fc:13},{lngs:["kw"],nr:[1,2,3,4],fc:14},{lngs:["lt"],nr:[1,2,10],fc:15},{lngs:["lv"],nr:[1,2,0],fc:16},{lngs:["mk"],nr:[1,2],fc:17},{lngs:["mnk"],nr:[0,1,2],fc:18},{lngs:["mt"],nr:[1,2,11,20],fc:19},{lngs:["or"],nr:[2,1],fc:2},{lngs:["ro"],nr:[1,2,20],fc:20},{lngs:["sl"],nr:[5,1,2,3],fc:21}],R={1:function(t){return Number(t>1)},2:function(t){return Number(1!=t)},3:function(t){return 0},4:function(t){return Number(t%10==1&&t%100!=11?0:t%10>=2&&t%10<=4&&(t%100<10||t%100>=20)?1:2)},5:function(t){return Number(0===t?0:1==t?1:2==t?2:t%100>=3&&t%100<=10?3:t%100>=11?4:5)},6:function(t){return Number(1==t?0:t>=2&&t<=4?1:2)},7:function(t){return Number(1==t?0:t%10>=2&&t%10<=4&&(t%100<10||t%100>=20)?1:2)},8:function(t){return Number(1==t?0:2==t?1:8!=t&&11!=t?2:3)},9:function(t){return Number(t>=2)},10:function(t){return Number(1==t?0:2==t?1:t<7?2:t<11?3:4)},11:function(t){return Number(1==t||11==t?0:2==t||12==t?1:t>2&&t<20?2:3)},12:function(t){return Number(t%10!=1||t%100==11)},13:function(t){return Number(0!==t)},14:function(t){return Number(1==t?0:2==t?1:3==t?2:3)},15:function(t){return Number(t%10==1&&t%100!=11?0:t%10>=2&&(t%100<10||t%100>=20)?1:2)},16:function(t){return Number(t%10==1&&t%100!=11?0:0!==t?1:2)},17:function(t){return Number(1==t||t%10==1?0:1)},18:function(t){return Number(0==t?0:1==t?1:2)},19:function(t){return Number(1==t?0:0===t||t%100>1&&t%100<11?1:t%100>10&&t%100<20?2:3)},20:function(t){return Number(1==t?0:0===t||t%100>0&&t%100<20?1:2)},21:function(t){return Number(t%100==1?1:t%100==2?2:t%100==3||t%100==4?3:0)}};var M=function(){function t(e){var n,r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.languageUtils=e,this.options=r,this.logger=a.create("pluralResolver"),this.rules=(n={},T.forEach((function(t){t.lngs.forEach((function(e){n[e]={numbers:t.nr,plurals:R[t.fc]}}))})),n)}return t.prototype.addRule=function(t,e){this.rules[t]=e},t.prototype.getRule=function(t){return this.rules[this.languageUtils.getLanguagePartFromCode(t)]},t.prototype.needsPlural=function(t){var e=this.getRule(t);return e&&e.numbers.length>1},t.prototype.getSuffix=function(t,e){var n=this,r=this.getRule(t);if(r){if(1===r.numbers.length)return"";var o=r.noAbs?r.plurals(e):r.plurals(Math.abs(e)),i=r.numbers[o];this.options.simplifyPluralSuffix&&2===r.numbers.length&&1===r.numbers[0]&&(2===i?i="plural":1===i&&(i=""));var a=function(){return n.options.prepend&&i.toString()?n.options.prepend+i.toString():i.toString()};return"v1"===this.options.compatibilityJSON?1===i?"":"number"==typeof i?"_plural_"+i.toString():a():"v2"===this.options.compatibilityJSON||2===r.numbers.length&&1===r.numbers[0]||2===r.numbers.length&&1===r.numbers[0]?a():this.options.prepend&&o.toString()?this.options.prepend+o.toString():o.toString()}return this.logger.warn("no plural rule found for: "+t),""},t}(),N=M,D=Object.assign||function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t};var B=function(){function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.logger=a.create("interpolator"),this.init(e,!0)}return t.prototype.init=function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};arguments[1]&&(this.options=t,this.format=t.interpolation&&t.interpolation.format||function(t){return t},this.escape=t.interpolation&&t.interpolation.escape||g),t.interpolation||(t.interpolation={escapeValue:!0});var e=t.interpolation;this.escapeValue=void 0===e.escapeValue||e.escapeValue,this.prefix=e.prefix?d(e.prefix):e.prefixEscaped||"{{",this.suffix=e.suffix?d(e.suffix):e.suffixEscaped||"}}",this.formatSeparator=e.formatSeparator?e.formatSeparator:e.formatSeparator||",",this.unescapePrefix=e.unescapeSuffix?"":e.unescapePrefix||"-",this.unescapeSuffix=this.unescapePrefix?"":e.unescapeSuffix||"",this.nestingPrefix=e.nestingPrefix?d(e.nestingPrefix):e.nestingPrefixEscaped||d("$t("),this.nestingSuffix=e.nestingSuffix?d(e.nestingSuffix):e.nestingSuffixEscaped||d(")"),this.resetRegExp()},t.prototype.reset=function(){this.options&&this.init(this.options)},t.prototype.resetRegExp=function(){var t=this.prefix+"(.+?)"+this.suffix;this.regexp=new RegExp(t,"g");var e=""+this.prefix+this.unescapePrefix+"(.+?)"+this.unescapeSuffix+this.suffix;this.regexpUnescape=new RegExp(e,"g");var n=this.nestingPrefix+"(.+?)"+this.nestingSuffix;this.nestingRegexp=new RegExp(n,"g")},t.prototype.interpolate=function(t,e,n){var r=this,o=void 0,i=void 0;function a(t){return t.replace(/\$/g,"$$$$")}var s=function(t){if(t.indexOf(r.formatSeparator)<0)return f(e,t);var o=t.split(r.formatSeparator),i=o.shift().trim(),a=o.join(r.formatSeparator).trim();return r.format(f(e,i),a,n)};for(this.resetRegExp();o=this.regexpUnescape.exec(t);)i=s(o[1].trim()),t=t.replace(o[0],i),this.regexpUnescape.lastIndex=0;for(;o=this.regexp.exec(t);)"string"!=typeof(i=s(o[1].trim()))&&(i=u(i)),i||(this.logger.warn("missed to pass in variable "+o[1]+" for interpolating "+t),i=""),i=this.escapeValue?a(this.escape(i)):a(i),t=t.replace(o[0],i),this.regexp.lastIndex=0;return t},t.prototype.nest=function(t,e){var n=void 0,r=void 0,o=D({},arguments.length>2&&void 0!==arguments[2]?arguments[2]:{});function i(t){if(t.indexOf(",")<0)return t;var e=t.split(",");t=e.shift();var n=e.join(",");n=(n=this.interpolate(n,o)).replace(/'/g,'"');try{o=JSON.parse(n)}catch(e){this.logger.error("failed parsing options string in nesting for key "+t,e)}return t}for(o.applyPostProcessor=!1;n=this.nestingRegexp.exec(t);){if((r=e(i.call(this,n[1].trim()),o))&&n[0]===t&&"string"!=typeof r)return r;"string"!=typeof r&&(r=u(r)),r||(this.logger.warn("missed to resolve "+n[1]+" for nesting "+t),r=""),t=t.replace(n[0],r),this.regexp.lastIndex=0}return t},t}(),V=B,I=Object.assign||function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t},L=function(t,e){if(Array.isArray(t))return t;if(Symbol.iterator in Object(t))return function(t,e){var n=[],r=!0,o=!1,i=void 0;try{for(var a,s=t[Symbol.iterator]();!(r=(a=s.next()).done)&&(n.push(a.value),!e||n.length!==e);r=!0);}catch(t){o=!0,i=t}finally{try{!r&&s.return&&s.return()}finally{if(o)throw i}}return n}(t,e);throw new TypeError("Invalid attempt to destructure non-iterable instance")};function z(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):function(t,e){for(var n=Object.getOwnPropertyNames(e),r=0;r<n.length;r++){var o=n[r],i=Object.getOwnPropertyDescriptor(e,o);i&&i.configurable&&void 0===t[o]&&Object.defineProperty(t,o,i)}}(t,e))}var $=function(t){function e(n,r,o){var i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);var s=function(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}(this,t.call(this));return s.backend=n,s.store=r,s.services=o,s.options=i,s.logger=a.create("backendConnector"),s.state={},s.queue=[],s.backend&&s.backend.init&&s.backend.init(o,i.backend,i),s}return z(e,t),e.prototype.queueLoad=function(t,e,n){var r=this,o=[],i=[],a=[],s=[];return t.forEach((function(t){var n=!0;e.forEach((function(e){var a=t+"|"+e;r.store.hasResourceBundle(t,e)?r.state[a]=2:r.state[a]<0||(1===r.state[a]?i.indexOf(a)<0&&i.push(a):(r.state[a]=1,n=!1,i.indexOf(a)<0&&i.push(a),o.indexOf(a)<0&&o.push(a),s.indexOf(e)<0&&s.push(e)))})),n||a.push(t)})),(o.length||i.length)&&this.queue.push({pending:i,loaded:{},errors:[],callback:n}),{toLoad:o,pending:i,toLoadLanguages:a,toLoadNamespaces:s}},e.prototype.loaded=function(t,e,n){var r=this,o=t.split("|"),i=L(o,2),a=i[0],s=i[1];e&&this.emit("failedLoading",a,s,e),n&&this.store.addResourceBundle(a,s,n),this.state[t]=e?-1:2,this.queue.forEach((function(n){var o,i,l,u,h,f;o=n.loaded,i=s,u=c(o,[a],Object),h=u.obj,f=u.k,h[f]=h[f]||[],l&&(h[f]=h[f].concat(i)),l||h[f].push(i),function(t,e){for(var n=t.indexOf(e);-1!==n;)t.splice(n,1),n=t.indexOf(e)}(n.pending,t),e&&n.errors.push(e),0!==n.pending.length||n.done||(r.emit("loaded",n.loaded),n.done=!0,n.errors.length?n.callback(n.errors):n.callback())})),this.queue=this.queue.filter((function(t){return!t.done}))},e.prototype.read=function(t,e,n){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:0,o=this,i=arguments.length>4&&void 0!==arguments[4]?arguments[4]:250,a=arguments[5];return t.length?this.backend[n](t,e,(function(s,l){s&&l&&r<5?setTimeout((function(){o.read.call(o,t,e,n,r+1,2*i,a)}),i):a(s,l)})):a(null,{})},e.prototype.load=function(t,e,n){var r=this;if(!this.backend)return this.logger.warn("No backend was added via i18next.use. Will not load resources."),n&&n();var o=I({},this.backend.options,this.options.backend);"string"==typeof t&&(t=this.services.languageUtils.toResolveHierarchy(t)),"string"==typeof e&&(e=[e]);var i=this.queueLoad(t,e,n);if(!i.toLoad.length)return i.pending.length||n(),null;o.allowMultiLoading&&this.backend.readMulti?this.read(i.toLoadLanguages,i.toLoadNamespaces,"readMulti",null,null,(function(t,e){t&&r.logger.warn("loading namespaces "+i.toLoadNamespaces.join(", ")+" for languages "+i.toLoadLanguages.join(", ")+" via multiloading failed",t),!t&&e&&r.logger.log("successfully loaded namespaces "+i.toLoadNamespaces.join(", ")+" for languages "+i.toLoadLanguages.join(", ")+" via multiloading",e),i.toLoad.forEach((function(n){var o=n.split("|"),i=L(o,2),a=i[0],s=i[1],l=f(e,[a,s]);if(l)r.loaded(n,t,l);else{var u="loading namespace "+s+" for language "+a+" via multiloading failed";r.loaded(n,u),r.logger.error(u)}}))})):i.toLoad.forEach((function(t){r.loadOne(t)}))},e.prototype.reload=function(t,e){var n=this;this.backend||this.logger.warn("No backend was added via i18next.use. Will not load resources.");var r=I({},this.backend.options,this.options.backend);"string"==typeof t&&(t=this.services.languageUtils.toResolveHierarchy(t)),"string"==typeof e&&(e=[e]),r.allowMultiLoading&&this.backend.readMulti?this.read(t,e,"readMulti",null,null,(function(r,o){r&&n.logger.warn("reloading namespaces "+e.join(", ")+" for languages "+t.join(", ")+" via multiloading failed",r),!r&&o&&n.logger.log("successfully reloaded namespaces "+e.join(", ")+" for languages "+t.join(", ")+" via multiloading",o),t.forEach((function(t){e.forEach((function(e){var i=f(o,[t,e]);if(i)n.loaded(t+"|"+e,r,i);else{var a="reloading namespace "+e+" for language "+t+" via multiloading failed";n.loaded(t+"|"+e,a),n.logger.error(a)}}))}))})):t.forEach((function(t){e.forEach((function(e){n.loadOne(t+"|"+e,"re")}))}))},e.prototype.loadOne=function(t){var e=this,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"",r=t.split("|"),o=L(r,2),i=o[0],a=o[1];this.read(i,a,"read",null,null,(function(r,o){r&&e.logger.warn(n+"loading namespace "+a+" for language "+i+" failed",r),!r&&o&&e.logger.log(n+"loaded namespace "+a+" for language "+i,o),e.loaded(t,r,o)}))},e.prototype.saveMissing=function(t,e,n,r){this.backend&&this.backend.create&&this.backend.create(t,e,n,r),t&&t[0]&&this.store.addResource(t[0],e,n,r)},e}(l),F=$,U=Object.assign||function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t};function H(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):function(t,e){for(var n=Object.getOwnPropertyNames(e),r=0;r<n.length;r++){var o=n[r],i=Object.getOwnPropertyDescriptor(e,o);i&&i.configurable&&void 0===t[o]&&Object.defineProperty(t,o,i)}}(t,e))}var q=function(t){function e(n,r,o){var i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);var s=function(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}(this,t.call(this));return s.cache=n,s.store=r,s.services=o,s.options=i,s.logger=a.create("cacheConnector"),s.cache&&s.cache.init&&s.cache.init(o,i.cache,i),s}return H(e,t),e.prototype.load=function(t,e,n){var r=this;if(!this.cache)return n&&n();var o=U({},this.cache.options,this.options.cache),i="string"==typeof t?this.services.languageUtils.toResolveHierarchy(t):t;o.enabled?this.cache.load(i,(function(t,e){if(t&&r.logger.error("loading languages "+i.join(", ")+" from cache failed",t),e)for(var o in e)if(Object.prototype.hasOwnProperty.call(e,o))for(var a in e[o])if(Object.prototype.hasOwnProperty.call(e[o],a)&&"i18nStamp"!==a){var s=e[o][a];s&&r.store.addResourceBundle(o,a,s)}n&&n()})):n&&n()},e.prototype.save=function(){this.cache&&this.options.cache&&this.options.cache.enabled&&this.cache.save(this.store.data)},e}(l),W=q;function G(t){return"string"==typeof t.ns&&(t.ns=[t.ns]),"string"==typeof t.fallbackLng&&(t.fallbackLng=[t.fallbackLng]),"string"==typeof t.fallbackNS&&(t.fallbackNS=[t.fallbackNS]),t.whitelist&&t.whitelist.indexOf("cimode")<0&&t.whitelist.push("cimode"),t}var K=Object.assign||function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t};function X(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}function Y(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):function(t,e){for(var n=Object.getOwnPropertyNames(e),r=0;r<n.length;r++){var o=n[r],i=Object.getOwnPropertyDescriptor(e,o);i&&i.configurable&&void 0===t[o]&&Object.defineProperty(t,o,i)}}(t,e))}function J(){}var Z=function(t){function e(){var n=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},r=arguments[1];!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);var o=X(this,t.call(this));if(o.options=G(n),o.services={},o.logger=a,o.modules={external:[]},r&&!o.isInitialized&&!n.isClone){var i;if(!o.options.initImmediate)return i=o.init(n,r),X(o,i);setTimeout((function(){o.init(n,r)}),0)}return o}return Y(e,t),e.prototype.init=function(t,e){var n=this;function r(t){return t?"function"==typeof t?new t:t:null}if("function"==typeof t&&(e=t,t={}),t||(t={}),"v1"===t.compatibilityAPI?this.options=K({},{debug:!1,initImmediate:!0,ns:["translation"],defaultNS:["translation"],fallbackLng:["dev"],fallbackNS:!1,whitelist:!1,nonExplicitWhitelist:!1,load:"all",preload:!1,simplifyPluralSuffix:!0,keySeparator:".",nsSeparator:":",pluralSeparator:"_",contextSeparator:"_",saveMissing:!1,saveMissingTo:"fallback",missingKeyHandler:!1,postProcess:!1,returnNull:!0,returnEmptyString:!0,returnObjects:!1,joinArrays:!1,returnedObjectHandler:function(){},parseMissingKeyHandler:!1,appendNamespaceToMissingKey:!1,appendNamespaceToCIMode:!1,overloadTranslationOptionHandler:function(t){return{defaultValue:t[1]}},interpolation:{escapeValue:!0,format:function(t,e,n){return t},prefix:"{{",suffix:"}}",formatSeparator:",",unescapePrefix:"-",nestingPrefix:"$t(",nestingSuffix:")",defaultVariables:void 0}},G(function(t){return t.resStore&&(t.resources=t.resStore),t.ns&&t.ns.defaultNs?(t.defaultNS=t.ns.defaultNs,t.ns=t.ns.namespaces):t.defaultNS=t.ns||"translation",t.fallbackToDefaultNS&&t.defaultNS&&(t.fallbackNS=t.defaultNS),t.saveMissing=t.sendMissing,t.saveMissingTo=t.sendMissingTo||"current",t.returnNull=!t.fallbackOnNull,t.returnEmptyString=!t.fallbackOnEmpty,t.returnObjects=t.returnObjectTrees,t.joinArrays="\n",t.returnedObjectHandler=t.objectTreeKeyHandler,t.parseMissingKeyHandler=t.parseMissingKey,t.appendNamespaceToMissingKey=!0,t.nsSeparator=t.nsseparator||":",t.keySeparator=t.keyseparator||".","sprintf"===t.shortcutFunction&&(t.overloadTranslationOptionHandler=function(t){for(var e=[],n=1;n<t.length;n++)e.push(t[n]);return{postProcess:"sprintf",sprintf:e}}),t.whitelist=t.lngWhitelist,t.preload=t.preload,"current"===t.load&&(t.load="currentOnly"),"unspecific"===t.load&&(t.load="languageOnly"),t.backend=t.backend||{},t.backend.loadPath=t.resGetPath||"locales/__lng__/__ns__.json",t.backend.addPath=t.resPostPath||"locales/add/__lng__/__ns__",t.backend.allowMultiLoading=t.dynamicLoad,t.cache=t.cache||{},t.cache.prefix="res_",t.cache.expirationTime=6048e5,t.cache.enabled=t.useLocalStorage,(t=x(t)).defaultVariables&&(t.interpolation.defaultVariables=t.defaultVariables),t}(t)),{}):"v1"===t.compatibilityJSON?this.options=K({},{debug:!1,initImmediate:!0,ns:["translation"],defaultNS:["translation"],fallbackLng:["dev"],fallbackNS:!1,whitelist:!1,nonExplicitWhitelist:!1,load:"all",preload:!1,simplifyPluralSuffix:!0,keySeparator:".",nsSeparator:":",pluralSeparator:"_",contextSeparator:"_",saveMissing:!1,saveMissingTo:"fallback",missingKeyHandler:!1,postProcess:!1,returnNull:!0,returnEmptyString:!0,returnObjects:!1,joinArrays:!1,returnedObjectHandler:function(){},parseMissingKeyHandler:!1,appendNamespaceToMissingKey:!1,appendNamespaceToCIMode:!1,overloadTranslationOptionHandler:function(t){return{defaultValue:t[1]}},interpolation:{escapeValue:!0,format:function(t,e,n){return t},prefix:"{{",suffix:"}}",formatSeparator:",",unescapePrefix:"-",nestingPrefix:"$t(",nestingSuffix:")",defaultVariables:void 0}},G(function(t){return(t=x(t)).joinArrays="\n",t}(t)),{}):this.options=K({},{debug:!1,initImmediate:!0,ns:["translation"],defaultNS:["translation"],fallbackLng:["dev"],fallbackNS:!1,whitelist:!1,nonExplicitWhitelist:!1,load:"all",preload:!1,simplifyPluralSuffix:!0,keySeparator:".",nsSeparator:":",pluralSeparator:"_",contextSeparator:"_",saveMissing:!1,saveMissingTo:"fallback",missingKeyHandler:!1,postProcess:!1,returnNull:!0,returnEmptyString:!0,returnObjects:!1,joinArrays:!1,returnedObjectHandler:function(){},parseMissingKeyHandler:!1,appendNamespaceToMissingKey:!1,appendNamespaceToCIMode:!1,overloadTranslationOptionHandler:function(t){return{defaultValue:t[1]}},interpolation:{escapeValue:!0,format:function(t,e,n){return t},prefix:"{{",suffix:"}}",formatSeparator:",",unescapePrefix:"-",nestingPrefix:"$t(",nestingSuffix:")",defaultVariables:void 0}},this.options,G(t)),this.format=this.options.interpolation.format,e||(e=J),!this.options.isClone){this.modules.logger?a.init(r(this.modules.logger),this.options):a.init(null,this.options);var o=new j(this.options);this.store=new w(this.options.resources,this.options);var i=this.services;i.logger=a,i.resourceStore=this.store,i.resourceStore.on("added removed",(function(t,e){i.cacheConnector.save()})),i.languageUtils=o,i.pluralResolver=new N(o,{prepend:this.options.pluralSeparator,compatibilityJSON:this.options.compatibilityJSON,simplifyPluralSuffix:this.options.simplifyPluralSuffix}),i.interpolator=new V(this.options),i.backendConnector=new F(r(this.modules.backend),i.resourceStore,i,this.options),i.backendConnector.on("*",(function(t){for(var e=arguments.length,r=Array(e>1?e-1:0),o=1;o<e;o++)r[o-1]=arguments[o];n.emit.apply(n,[t].concat(r))})),i.backendConnector.on("loaded",(function(t){i.cacheConnector.save()})),i.cacheConnector=new W(r(this.modules.cache),i.resourceStore,i,this.options),i.cacheConnector.on("*",(function(t){for(var e=arguments.length,r=Array(e>1?e-1:0),o=1;o<e;o++)r[o-1]=arguments[o];n.emit.apply(n,[t].concat(r))})),this.modules.languageDetector&&(i.languageDetector=r(this.modules.languageDetector),i.languageDetector.init(i,this.options.detection,this.options)),this.translator=new S(this.services,this.options),this.translator.on("*",(function(t){for(var e=arguments.length,r=Array(e>1?e-1:0),o=1;o<e;o++)r[o-1]=arguments[o];n.emit.apply(n,[t].concat(r))})),this.modules.external.forEach((function(t){t.init&&t.init(n)}))}var s;["getResource","addResource","addResources","addResourceBundle","removeResourceBundle","hasResourceBundle","getResourceBundle"].forEach((function(t){n[t]=function(){var e;return(e=n.store)[t].apply(e,arguments)}})),"v1"===this.options.compatibilityAPI&&((s=this).lng=function(){return a.deprecate("i18next.lng() can be replaced by i18next.language for detected language or i18next.languages for languages ordered by translation lookup."),s.services.languageUtils.toResolveHierarchy(s.language)[0]},s.preload=function(t,e){a.deprecate("i18next.preload() can be replaced with i18next.loadLanguages()"),s.loadLanguages(t,e)},s.setLng=function(t,e,n){return a.deprecate("i18next.setLng() can be replaced with i18next.changeLanguage() or i18next.getFixedT() to get a translation function with fixed language or namespace."),"function"==typeof e&&(n=e,e={}),e||(e={}),!0===e.fixLng&&n?n(null,s.getFixedT(t)):s.changeLanguage(t,n)},s.addPostProcessor=function(t,e){a.deprecate("i18next.addPostProcessor() can be replaced by i18next.use({ type: 'postProcessor', name: 'name', process: fc })"),s.use({type:"postProcessor",name:t,process:e})});var l=function(){n.changeLanguage(n.options.lng,(function(t,r){n.isInitialized=!0,n.logger.log("initialized",n.options),n.emit("initialized",n.options),e(t,r)}))};return this.options.resources||!this.options.initImmediate?l():setTimeout(l,0),this},e.prototype.loadResources=function(){var t=this,e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:J;if(this.options.resources)e(null);else{if(this.language&&"cimode"===this.language.toLowerCase())return e();var n=[],r=function(e){e&&t.services.languageUtils.toResolveHierarchy(e).forEach((function(t){n.indexOf(t)<0&&n.push(t)}))};if(this.language)r(this.language);else this.services.languageUtils.getFallbackCodes(this.options.fallbackLng).forEach((function(t){return r(t)}));this.options.preload&&this.options.preload.forEach((function(t){return r(t)})),this.services.cacheConnector.load(n,this.options.ns,(function(){t.services.backendConnector.load(n,t.options.ns,e)}))}},e.prototype.reloadResources=function(t,e){t||(t=this.languages),e||(e=this.options.ns),this.services.backendConnector.reload(t,e)},e.prototype.use=function(t){return"backend"===t.type&&(this.modules.backend=t),"cache"===t.type&&(this.modules.cache=t),("logger"===t.type||t.log&&t.warn&&t.error)&&(this.modules.logger=t),"languageDetector"===t.type&&(this.modules.languageDetector=t),"postProcessor"===t.type&&_.addPostProcessor(t),"3rdParty"===t.type&&this.modules.external.push(t),this},e.prototype.changeLanguage=function(t,e){var n=this,r=function(t){t&&(n.language=t,n.languages=n.services.languageUtils.toResolveHierarchy(t),n.translator.changeLanguage(t),n.services.languageDetector&&n.services.languageDetector.cacheUserLanguage(t)),n.loadResources((function(r){!function(t,r){r&&(n.emit("languageChanged",r),n.logger.log("languageChanged",r)),e&&e(t,(function(){return n.t.apply(n,arguments)}))}(r,t)}))};t||!this.services.languageDetector||this.services.languageDetector.async?!t&&this.services.languageDetector&&this.services.languageDetector.async?this.services.languageDetector.detect(r):r(t):r(this.services.languageDetector.detect())},e.prototype.getFixedT=function(t,e){var n=this,r=function t(e){var r=K({},arguments.length>1&&void 0!==arguments[1]?arguments[1]:{});return r.lng=r.lng||t.lng,r.lngs=r.lngs||t.lngs,r.ns=r.ns||t.ns,n.t(e,r)};return"string"==typeof t?r.lng=t:r.lngs=t,r.ns=e,r},e.prototype.t=function(){var t;return this.translator&&(t=this.translator).translate.apply(t,arguments)},e.prototype.exists=function(){var t;return this.translator&&(t=this.translator).exists.apply(t,arguments)},e.prototype.setDefaultNamespace=function(t){this.options.defaultNS=t},e.prototype.loadNamespaces=function(t,e){var n=this;if(!this.options.ns)return e&&e();"string"==typeof t&&(t=[t]),t.forEach((function(t){n.options.ns.indexOf(t)<0&&n.options.ns.push(t)})),this.loadResources(e)},e.prototype.loadLanguages=function(t,e){"string"==typeof t&&(t=[t]);var n=this.options.preload||[],r=t.filter((function(t){return n.indexOf(t)<0}));if(!r.length)return e();this.options.preload=n.concat(r),this.loadResources(e)},e.prototype.dir=function(t){if(t||(t=this.languages&&this.languages.length>0?this.languages[0]:this.language),!t)return"rtl";return["ar","shu","sqr","ssh","xaa","yhd","yud","aao","abh","abv","acm","acq","acw","acx","acy","adf","ads","aeb","aec","afb","ajp","apc","apd","arb","arq","ars","ary","arz","auz","avl","ayh","ayl","ayn","ayp","bbz","pga","he","iw","ps","pbt","pbu","pst","prp","prd","ur","ydd","yds","yih","ji","yi","hbo","men","xmn","fa","jpr","peo","pes","prs","dv","sam"].indexOf(this.services.languageUtils.getLanguagePartFromCode(t))>=0?"rtl":"ltr"},e.prototype.createInstance=function(){return new e(arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},arguments[1])},e.prototype.cloneInstance=function(){var t=this,n=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:J,o=K({},this.options,n,{isClone:!0}),i=new e(o,r);return["store","services","language"].forEach((function(e){i[e]=t[e]})),i.translator=new S(i.services,i.options),i.translator.on("*",(function(t){for(var e=arguments.length,n=Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];i.emit.apply(i,[t].concat(n))})),i.init(o,r),i},e}(l),Q=new Z,tt=Q,et=(Q.changeLanguage.bind(Q),Q.cloneInstance.bind(Q),Q.createInstance.bind(Q),Q.dir.bind(Q),Q.exists.bind(Q),Q.getFixedT.bind(Q),Q.init.bind(Q),Q.loadLanguages.bind(Q),Q.loadNamespaces.bind(Q),Q.loadResources.bind(Q),Q.off.bind(Q),Q.on.bind(Q),Q.setDefaultNamespace.bind(Q),Q.t.bind(Q),Q.use.bind(Q),n(9922)),nt=n(1248),rt=[{id:"am",title:"Հայերեն"},{id:"az",title:"Azərbaycanca"},{id:"br",title:"Brazil"},{id:"de",title:"Deutsch"},{id:"en",title:"English"},{id:"es",title:"Español"},{id:"fr",title:"Français"},{id:"he",title:"Hebrew"},{id:"isv",abbr:"Ⱄ",title:"Medžuslovjansky"},{id:"it",title:"Italiano"},{id:"ja",title:"日本語"},{id:"ka",title:"ქართული"},{id:"kr",title:"한국어"},{id:"nl",title:"Nederlands"},{id:"pl",title:"Polski"},{id:"ru",title:"Русский"},{id:"sv",title:"Svenska"},{id:"tr",title:"Türkçe"},{id:"zh",title:"中文"}];function ot(){return new Promise((function(t,e){var n=nt.A.getLanguage();tt.init({lng:n,interpolation:{escapeValue:!1},fallbackLng:"en"},(function(n){return n?e(n):t()})),tt.on("initialized",(function(){var t=tt.services.pluralResolver;t.addRule("isv",t.getRule("be"))})),(0,et.A)("init_language",{language:n||"en"})}))}function it(t,e){tt.on("initialized",(function(){tt.services.resourceStore.addResourceBundle(t,tt.options.ns[0],e,!0,!0)}))}rt.map((function(t){return t.id})).forEach((function(t){return it(t,n(7951)("./".concat(t)))}));var at=tt},8603:function(t,e,n){t.exports=function(t,e,n){"use strict";t=t&&t.hasOwnProperty("default")?t.default:t,e=e&&e.hasOwnProperty("default")?e.default:e,n=n&&n.hasOwnProperty("default")?n.default:n;var r="3.5.1",o=function(t){return function(e){for(var n=arguments.length,r=Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return t.apply(e,r)}},i=t.Model.extend,a=function t(n,r){e.isObject(n)&&(n=n.prev+" is going to be removed in the future. Please use "+n.next+" instead."+(n.url?" See: "+n.url:"")),$t.DEV_MODE&&(void 0!==r&&r||t._cache[n]||(t._warn("Deprecation warning: "+n),t._cache[n]=!0))};a._console="undefined"!=typeof console?console:{},a._warn=function(){return(a._console.warn||a._console.log||e.noop).apply(a._console,arguments)},a._cache={};var s=function(t){return document.documentElement.contains(t&&t.parentNode)},l=function(t,n){var r=this;t&&e.each(n,(function(e){var n=t[e];void 0!==n&&(r[e]=n)}))},u=function(t){if(t)return this.options&&void 0!==this.options[t]?this.options[t]:this[t]},c=function(t){var n=this;return e.reduce(t,(function(t,r,o){return e.isFunction(r)||(r=n[r]),r&&(t[o]=r),t}),{})},h=/(^|:)(\w)/gi;function f(t,e,n){return n.toUpperCase()}var p=e.memoize((function(t){return"on"+t.replace(h,f)}));function d(t){for(var n=arguments.length,r=Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];var i=p(t),a=u.call(this,i),s=void 0;return e.isFunction(a)&&(s=a.apply(this,r)),this.trigger.apply(this,arguments),s}function m(t){for(var n=arguments.length,r=Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return e.isFunction(t.triggerMethod)?t.triggerMethod.apply(t,r):d.apply(t,r)}function g(t,n,r){t._getImmediateChildren&&e.each(t._getImmediateChildren(),(function(t){r(t)&&m(t,n,t)}))}function v(t){return!t._isAttached}function y(t){return!!v(t)&&(t._isAttached=!0,!0)}function b(t){return t._isAttached}function w(t){return!!b(t)&&(t._isAttached=!1,!0)}function _(t){t._isAttached&&t._isRendered&&m(t,"dom:refresh",t)}function x(t){t._isAttached&&t._isRendered&&m(t,"dom:remove",t)}function k(){g(this,"before:attach",v)}function A(){g(this,"attach",y),_(this)}function O(){g(this,"before:detach",b),x(this)}function E(){g(this,"detach",w)}function C(){x(this)}function S(){_(this)}function P(t){t._areViewEventsMonitored||!1===t.monitorViewEvents||(t._areViewEventsMonitored=!0,t.on({"before:attach":k,attach:A,"before:detach":O,detach:E,"before:render":C,render:S}))}var j=["description","fileName","lineNumber","name","message","number"],T=i.call(Error,{urlRoot:"http://marionettejs.com/docs/v"+r+"/",constructor:function(t,n){e.isObject(t)?t=(n=t).message:n||(n={});var r=Error.call(this,t);e.extend(this,e.pick(r,j),e.pick(n,j)),this.captureStackTrace(),n.url&&(this.url=this.urlRoot+n.url)},captureStackTrace:function(){Error.captureStackTrace&&Error.captureStackTrace(this,T)},toString:function(){return this.name+": "+this.message+(this.url?" See: "+this.url:"")}});function R(t,n,r,o,i){var s=o.split(/\s+/);s.length>1&&a("Multiple handlers for a single event are deprecated. If needed, use a single handler to call multiple methods."),e.each(s,(function(e){var o=t[e];if(!o)throw new T('Method "'+e+'" was configured as an event handler, but does not exist.');t[i](n,r,o)}))}function M(t,n,r,o){if(!e.isObject(r))throw new T({message:"Bindings must be an object.",url:"marionette.functions.html#marionettebindevents"});e.each(r,(function(r,i){e.isString(r)?R(t,n,i,r,o):t[o](n,i,r)}))}function N(t,e){return t&&e?(M(this,t,e,"listenTo"),this):this}function D(t,e){return t?e?(M(this,t,e,"stopListening"),this):(this.stopListening(t),this):this}function B(t,n,r,o){if(!e.isObject(r))throw new T({message:"Bindings must be an object.",url:"marionette.functions.html#marionettebindrequests"});var i=c.call(t,r);n[o](i,t)}function V(t,e){return t&&e?(B(this,t,e,"reply"),this):this}function I(t,e){return t?e?(B(this,t,e,"stopReplying"),this):(t.stopReplying(null,null,this),this):this}T.extend=i;var L={normalizeMethods:c,_setOptions:function(t){this.options=e.extend({},e.result(this,"options"),t)},mergeOptions:l,getOption:u,bindEvents:N,unbindEvents:D},z={_initRadio:function(){var t=e.result(this,"channelName");if(t){if(!n)throw new T({name:"BackboneRadioMissing",message:'The dependency "backbone.radio" is missing.'});var r=this._channel=n.channel(t),o=e.result(this,"radioEvents");this.bindEvents(r,o);var i=e.result(this,"radioRequests");this.bindRequests(r,i),this.on("destroy",this._destroyRadio)}},_destroyRadio:function(){this._channel.stopReplying(null,null,this)},getChannel:function(){return this._channel},bindEvents:N,unbindEvents:D,bindRequests:V,unbindRequests:I},$=["channelName","radioEvents","radioRequests"],F=function(t){this.hasOwnProperty("options")||this._setOptions(t),this.mergeOptions(t,$),this._setCid(),this._initRadio(),this.initialize.apply(this,arguments)};F.extend=i,e.extend(F.prototype,t.Events,L,z,{cidPrefix:"mno",_isDestroyed:!1,isDestroyed:function(){return this._isDestroyed},initialize:function(){},_setCid:function(){this.cid||(this.cid=e.uniqueId(this.cidPrefix))},destroy:function(){if(this._isDestroyed)return this;for(var t=arguments.length,e=Array(t),n=0;n<t;n++)e[n]=arguments[n];return this.triggerMethod.apply(this,["before:destroy",this].concat(e)),this._isDestroyed=!0,this.triggerMethod.apply(this,["destroy",this].concat(e)),this.stopListening(),this},triggerMethod:d});var U=function(t){this.templateId=t};e.extend(U,{templateCaches:{},get:function(t,e){var n=this.templateCaches[t];return n||(n=new U(t),this.templateCaches[t]=n),n.load(e)},clear:function(){for(var t=void 0,e=arguments.length,n=Array(e),r=0;r<e;r++)n[r]=arguments[r];var o=n.length;if(o>0)for(t=0;t<o;t++)delete this.templateCaches[n[t]];else this.templateCaches={}}}),e.extend(U.prototype,{load:function(t){if(this.compiledTemplate)return this.compiledTemplate;var e=this.loadTemplate(this.templateId,t);return this.compiledTemplate=this.compileTemplate(e,t),this.compiledTemplate},loadTemplate:function(e,n){var r=t.$(e);if(!r.length)throw new T({name:"NoTemplateError",message:'Could not find template: "'+e+'"'});return r.html()},compileTemplate:function(t,n){return e.template(t,n)}});var H=e.invokeMap||e.invoke;function q(t,n){return t.behaviorClass?t.behaviorClass:e.isFunction(t)?t:e.isFunction($t.Behaviors.behaviorsLookup)?$t.Behaviors.behaviorsLookup(t,n)[n]:$t.Behaviors.behaviorsLookup[n]}function W(t,n){return e.chain(n).map((function(n,r){var o=q(n,r),i=new o(n===o?{}:n,t),a=W(t,e.result(i,"behaviors"));return[i].concat(a)})).flatten().value()}var G={_initBehaviors:function(){this._behaviors=this._getBehaviors()},_getBehaviors:function(){var t=e.result(this,"behaviors");return e.isObject(t)?W(this,t):{}},_getBehaviorTriggers:function(){var t=H(this._behaviors,"getTriggers");return e.reduce(t,(function(t,n){return e.extend(t,n)}),{})},_getBehaviorEvents:function(){var t=H(this._behaviors,"getEvents");return e.reduce(t,(function(t,n){return e.extend(t,n)}),{})},_proxyBehaviorViewProperties:function(){H(this._behaviors,"proxyViewProperties")},_delegateBehaviorEntityEvents:function(){H(this._behaviors,"delegateEntityEvents")},_undelegateBehaviorEntityEvents:function(){H(this._behaviors,"undelegateEntityEvents")},_destroyBehaviors:function(){for(var t=arguments.length,e=Array(t),n=0;n<t;n++)e[n]=arguments[n];H.apply(void 0,[this._behaviors,"destroy"].concat(e))},_removeBehavior:function(t){this._isDestroyed||(this.undelegate(".trig"+t.cid+" ."+t.cid),this._behaviors=e.without(this._behaviors,t))},_bindBehaviorUIElements:function(){H(this._behaviors,"bindUIElements")},_unbindBehaviorUIElements:function(){H(this._behaviors,"unbindUIElements")},_triggerEventOnBehaviors:function(){for(var t=this._behaviors,e=0,n=t&&t.length;e<n;e++)d.apply(t[e],arguments)}},K={_delegateEntityEvents:function(t,n){var r=e.result(this,"modelEvents");r&&(D.call(this,t,r),N.call(this,t,r));var o=e.result(this,"collectionEvents");o&&(D.call(this,n,o),N.call(this,n,o))},_undelegateEntityEvents:function(t,n){var r=e.result(this,"modelEvents");D.call(this,t,r);var o=e.result(this,"collectionEvents");D.call(this,n,o)}},X=/^(\S+)\s*(.*)$/,Y=function(t,e){var n=t.match(X);return n[1]+"."+e+" "+n[2]},J={childViewEventPrefix:!0,triggersStopPropagation:!0,triggersPreventDefault:!0};function Z(t){return!!J[t]}function Q(t,e){return J[t]=e}function tt(t,n){e.isString(n)&&(n={event:n});var r=n.event,o=!!n.preventDefault;Z("triggersPreventDefault")&&(o=!1!==n.preventDefault);var i=!!n.stopPropagation;return Z("triggersStopPropagation")&&(i=!1!==n.stopPropagation),function(e){o&&e.preventDefault(),i&&e.stopPropagation(),t.triggerMethod(r,t,e)}}var et={_getViewTriggers:function(t,n){var r=this;return e.reduce(n,(function(e,n,o){return e[o=Y(o,"trig"+r.cid)]=tt(t,n),e}),{})}},nt=function(t,n){return e.reduce(t,(function(t,e,r){return t[rt(r,n)]=e,t}),{})},rt=function(t,e){return t.replace(/@ui\.[a-zA-Z-_$0-9]*/g,(function(t){return e[t.slice(4)]}))},ot=function t(n,r,o){return e.each(n,(function(i,a){e.isString(i)?n[a]=rt(i,r):e.isObject(i)&&e.isArray(o)&&(e.extend(i,t(e.pick(i,o),r)),e.each(o,(function(t){var n=i[t];e.isString(n)&&(i[t]=rt(n,r))})))})),n},it={normalizeUIKeys:function(t){var e=this._getUIBindings();return nt(t,e)},normalizeUIString:function(t){var e=this._getUIBindings();return rt(t,e)},normalizeUIValues:function(t,e){var n=this._getUIBindings();return ot(t,n,e)},_getUIBindings:function(){var t=e.result(this,"_uiBindings"),n=e.result(this,"ui");return t||n},_bindUIElements:function(){var t=this;if(this.ui){this._uiBindings||(this._uiBindings=this.ui);var n=e.result(this,"_uiBindings");this._ui={},e.each(n,(function(e,n){t._ui[n]=t.$(e)})),this.ui=this._ui}},_unbindUIElements:function(){var t=this;this.ui&&this._uiBindings&&(e.each(this.ui,(function(e,n){delete t.ui[n]})),this.ui=this._uiBindings,delete this._uiBindings,delete this._ui)},_getUI:function(t){return this._ui[t]}};function at(e){return e instanceof t.$?e:t.$(e)}function st(t){return this.prototype.Dom=e.extend({},this.prototype.Dom,t),this}var lt={createBuffer:function(){return document.createDocumentFragment()},getEl:function(t){return at(t)},findEl:function(t,e){return(arguments.length>2&&void 0!==arguments[2]?arguments[2]:at(t)).find(e)},hasEl:function(t,e){return t.contains(e&&e.parentNode)},detachEl:function(t){(arguments.length>1&&void 0!==arguments[1]?arguments[1]:at(t)).detach()},replaceEl:function(t,e){if(t!==e){var n=e.parentNode;n&&n.replaceChild(t,e)}},swapEl:function(t,e){if(t!==e){var n=t.parentNode,r=e.parentNode;if(n&&r){var o=t.nextSibling,i=e.nextSibling;n.insertBefore(e,o),r.insertBefore(t,i)}}},setContents:function(t,e){(arguments.length>2&&void 0!==arguments[2]?arguments[2]:at(t)).html(e)},appendContents:function(t,e){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},r=n._$el,o=void 0===r?at(t):r,i=n._$contents,a=void 0===i?at(e):i;o.append(a)},hasContents:function(t){return!!t&&t.hasChildNodes()},detachContents:function(t){(arguments.length>1&&void 0!==arguments[1]?arguments[1]:at(t)).contents().detach()}},ut={Dom:lt,supportsRenderLifecycle:!0,supportsDestroyLifecycle:!0,_isDestroyed:!1,isDestroyed:function(){return!!this._isDestroyed},_isRendered:!1,isRendered:function(){return!!this._isRendered},_isAttached:!1,isAttached:function(){return!!this._isAttached},delegateEvents:function(n){this._proxyBehaviorViewProperties(),this._buildEventProxies();var r=this._getEvents(n);void 0===n&&(this.events=r);var o=e.extend({},this._getBehaviorEvents(),r,this._getBehaviorTriggers(),this.getTriggers());return t.View.prototype.delegateEvents.call(this,o),this},_getEvents:function(t){var n=t||this.events;return e.isFunction(n)?this.normalizeUIKeys(n.call(this)):this.normalizeUIKeys(n)},getTriggers:function(){if(this.triggers){var t=this.normalizeUIKeys(e.result(this,"triggers"));return this._getViewTriggers(this,t)}},delegateEntityEvents:function(){return this._delegateEntityEvents(this.model,this.collection),this._delegateBehaviorEntityEvents(),this},undelegateEntityEvents:function(){return this._undelegateEntityEvents(this.model,this.collection),this._undelegateBehaviorEntityEvents(),this},destroy:function(){if(this._isDestroyed)return this;for(var t=this._isAttached&&!this._shouldDisableEvents,e=arguments.length,n=Array(e),r=0;r<e;r++)n[r]=arguments[r];return this.triggerMethod.apply(this,["before:destroy",this].concat(n)),t&&this.triggerMethod("before:detach",this),this.unbindUIElements(),this._removeElement(),t&&(this._isAttached=!1,this.triggerMethod("detach",this)),this._removeChildren(),this._isDestroyed=!0,this._isRendered=!1,this._destroyBehaviors.apply(this,n),this.triggerMethod.apply(this,["destroy",this].concat(n)),this.stopListening(),this},_removeElement:function(){this.$el.off().removeData(),this.Dom.detachEl(this.el,this.$el)},bindUIElements:function(){return this._bindUIElements(),this._bindBehaviorUIElements(),this},unbindUIElements:function(){return this._unbindUIElements(),this._unbindBehaviorUIElements(),this},getUI:function(t){return this._getUI(t)},childViewEventPrefix:function(){return!!Z("childViewEventPrefix")&&"childview"},triggerMethod:function(){var t=d.apply(this,arguments);return this._triggerEventOnBehaviors.apply(this,arguments),t},_buildEventProxies:function(){this._childViewEvents=e.result(this,"childViewEvents"),this._childViewTriggers=e.result(this,"childViewTriggers")},_proxyChildViewEvents:function(t){this.listenTo(t,"all",this._childViewEventHandler)},_childViewEventHandler:function(t){for(var n=this.normalizeMethods(this._childViewEvents),r=arguments.length,o=Array(r>1?r-1:0),i=1;i<r;i++)o[i-1]=arguments[i];void 0!==n&&e.isFunction(n[t])&&n[t].apply(this,o);var a=this._childViewTriggers;a&&e.isString(a[t])&&this.triggerMethod.apply(this,[a[t]].concat(o));var s=e.result(this,"childViewEventPrefix");if(!1!==s){var l=s+":"+t;this.triggerMethod.apply(this,[l].concat(o))}}};function ct(t){t._isRendered||(t.supportsRenderLifecycle||m(t,"before:render",t),t.render(),t.supportsRenderLifecycle||(t._isRendered=!0,m(t,"render",t)))}function ht(t){if(t.destroy)t.destroy();else{t.supportsDestroyLifecycle||m(t,"before:destroy",t);var e=t._isAttached&&!t._shouldDisableEvents;e&&m(t,"before:detach",t),t.remove(),e&&(t._isAttached=!1,m(t,"detach",t)),t._isDestroyed=!0,t.supportsDestroyLifecycle||m(t,"destroy",t)}}e.extend(ut,G,L,K,et,it);var ft=["allowMissingEl","parentEl","replaceElement"],pt=F.extend({Dom:lt,cidPrefix:"mnr",replaceElement:!1,_isReplaced:!1,_isSwappingView:!1,constructor:function(e){if(this._setOptions(e),this.mergeOptions(e,ft),this._initEl=this.el=this.getOption("el"),this.el=this.el instanceof t.$?this.el[0]:this.el,!this.el)throw new T({name:"NoElError",message:'An "el" must be specified for a region.'});this.$el=this.getEl(this.el),F.call(this,e)},show:function(t,e){if(this._ensureElement(e))return(t=this._getView(t,e))===this.currentView||(this._isSwappingView=!!this.currentView,this.triggerMethod("before:show",this,t,e),t._isAttached||this.empty(e),this._setupChildView(t),this.currentView=t,ct(t),this._attachView(t,e),this.triggerMethod("show",this,t,e),this._isSwappingView=!1),this},_setupChildView:function(t){P(t),this._proxyChildViewEvents(t),t.on("destroy",this._empty,this)},_proxyChildViewEvents:function(t){var e=this._parentView;e&&e._proxyChildViewEvents(t)},_shouldDisableMonitoring:function(){return this._parentView&&!1===this._parentView.monitorViewEvents},_attachView:function(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=!t._isAttached&&s(this.el)&&!this._shouldDisableMonitoring(),o=void 0===n.replaceElement?!!e.result(this,"replaceElement"):!!n.replaceElement;r&&m(t,"before:attach",t),o?this._replaceEl(t):this.attachHtml(t),r&&(t._isAttached=!0,m(t,"attach",t))},_ensureElement:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};if(e.isObject(this.el)||(this.$el=this.getEl(this.el),this.el=this.$el[0],this.$el=this.Dom.getEl(this.el)),!this.$el||0===this.$el.length){if(void 0===t.allowMissingEl?e.result(this,"allowMissingEl"):t.allowMissingEl)return!1;throw new T('An "el" must exist in DOM for this region '+this.cid)}return!0},_getView:function(e){if(!e)throw new T({name:"ViewNotValid",message:"The view passed is undefined and therefore invalid. You must pass a view instance to show."});if(e._isDestroyed)throw new T({name:"ViewDestroyedError",message:'View (cid: "'+e.cid+'") has already been destroyed and cannot be used.'});if(e instanceof t.View)return e;var n=this._getViewOptions(e);return new wt(n)},_getViewOptions:function(t){return e.isFunction(t)?{template:t}:e.isObject(t)?t:{template:function(){return t}}},getEl:function(t){var n=e.result(this,"parentEl");return n&&e.isString(t)?this.Dom.findEl(n,t):this.Dom.getEl(t)},_replaceEl:function(t){this._restoreEl(),t.on("before:destroy",this._restoreEl,this),this.Dom.replaceEl(t.el,this.el),this._isReplaced=!0},_restoreEl:function(){if(this._isReplaced){var t=this.currentView;t&&(this._detachView(t),this._isReplaced=!1)}},isReplaced:function(){return!!this._isReplaced},isSwappingView:function(){return!!this._isSwappingView},attachHtml:function(t){this.Dom.appendContents(this.el,t.el,{_$el:this.$el,_$contents:t.$el})},empty:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{allowMissingEl:!0},e=this.currentView;if(!e)return this._ensureElement(t)&&this.detachHtml(),this;var n=!t.preventDestroy;return n||a("The preventDestroy option is deprecated. Use Region#detachView"),this._empty(e,n),this},_empty:function(t,e){t.off("destroy",this._empty,this),this.triggerMethod("before:empty",this,t),this._restoreEl(),delete this.currentView,t._isDestroyed||(e?this.removeView(t):this._detachView(t),this._stopChildViewEvents(t)),this.triggerMethod("empty",this,t)},_stopChildViewEvents:function(t){this._parentView&&this._parentView.stopListening(t)},destroyView:function(t){return t._isDestroyed||(t._shouldDisableEvents=this._shouldDisableMonitoring(),ht(t)),t},removeView:function(t){this.destroyView(t)},detachView:function(){var t=this.currentView;if(t)return this._empty(t),t},_detachView:function(t){var e=t._isAttached&&!this._shouldDisableMonitoring(),n=this._isReplaced;e&&m(t,"before:detach",t),n?this.Dom.replaceEl(this.el,t.el):this.detachHtml(),e&&(t._isAttached=!1,m(t,"detach",t))},detachHtml:function(){this.Dom.detachContents(this.el,this.$el)},hasView:function(){return!!this.currentView},reset:function(t){return this.empty(t),this.$el&&(this.el=this._initEl),delete this.$el,this},destroy:function(t){return this._isDestroyed?this:(this.reset(t),this._name&&this._parentView._removeReferences(this._name),delete this._parentView,delete this._name,F.prototype.destroy.apply(this,arguments))}},{setDomApi:st}),dt=function(t,e){return t instanceof pt?t:mt(t,e)};function mt(t,n){var r=e.extend({},n);if(e.isString(t))return e.extend(r,{el:t}),gt(r);if(e.isFunction(t))return e.extend(r,{regionClass:t}),gt(r);if(e.isObject(t))return t.selector&&a("The selector option on a Region definition object is deprecated. Use el to pass a selector string"),e.extend(r,{el:t.selector},t),gt(r);throw new T({message:"Improper region configuration type.",url:"marionette.region.html#region-configuration-types"})}function gt(t){return new(0,t.regionClass)(e.omit(t,"regionClass"))}var vt={regionClass:pt,_initRegions:function(){this.regions=this.regions||{},this._regions={},this.addRegions(e.result(this,"regions"))},_reInitRegions:function(){H(this._regions,"reset")},addRegion:function(t,e){var n={};return n[t]=e,this.addRegions(n)[t]},addRegions:function(t){if(!e.isEmpty(t))return t=this.normalizeUIValues(t,["selector","el"]),this.regions=e.extend({},this.regions,t),this._addRegions(t)},_addRegions:function(t){var n=this,r={regionClass:this.regionClass,parentEl:e.partial(e.result,this,"el")};return e.reduce(t,(function(t,e,o){return t[o]=dt(e,r),n._addRegion(t[o],o),t}),{})},_addRegion:function(t,e){this.triggerMethod("before:add:region",this,e,t),t._parentView=this,t._name=e,this._regions[e]=t,this.triggerMethod("add:region",this,e,t)},removeRegion:function(t){var e=this._regions[t];return this._removeRegion(e,t),e},removeRegions:function(){var t=this._getRegions();return e.each(this._regions,e.bind(this._removeRegion,this)),t},_removeRegion:function(t,e){this.triggerMethod("before:remove:region",this,e,t),t.destroy(),this.triggerMethod("remove:region",this,e,t)},_removeReferences:function(t){delete this.regions[t],delete this._regions[t]},emptyRegions:function(){var t=this.getRegions();return H(t,"empty"),t},hasRegion:function(t){return!!this.getRegion(t)},getRegion:function(t){return this._isRendered||this.render(),this._regions[t]},_getRegions:function(){return e.clone(this._regions)},getRegions:function(){return this._isRendered||this.render(),this._getRegions()},showChildView:function(t,e){for(var n=this.getRegion(t),r=arguments.length,o=Array(r>2?r-2:0),i=2;i<r;i++)o[i-2]=arguments[i];return n.show.apply(n,[e].concat(o))},detachChildView:function(t){return this.getRegion(t).detachView()},getChildView:function(t){return this.getRegion(t).currentView}},yt={render:function(t,n){if(!t)throw new T({name:"TemplateNotFoundError",message:"Cannot render the template since its false, null or undefined."});return(e.isFunction(t)?t:U.get(t))(n)}},bt=["behaviors","childViewEventPrefix","childViewEvents","childViewTriggers","collectionEvents","events","modelEvents","regionClass","regions","template","templateContext","triggers","ui"],wt=t.View.extend({constructor:function(n){this.render=e.bind(this.render,this),this._setOptions(n),this.mergeOptions(n,bt),P(this),this._initBehaviors(),this._initRegions();var r=Array.prototype.slice.call(arguments);r[0]=this.options,t.View.prototype.constructor.apply(this,r),this.delegateEntityEvents(),this._triggerEventOnBehaviors("initialize",this)},serializeData:function(){return this.model||this.collection?this.model?this.serializeModel():{items:this.serializeCollection()}:{}},serializeModel:function(){return this.model?e.clone(this.model.attributes):{}},serializeCollection:function(){return this.collection?this.collection.map((function(t){return e.clone(t.attributes)})):{}},setElement:function(){return t.View.prototype.setElement.apply(this,arguments),this._isRendered=this.Dom.hasContents(this.el),this._isAttached=s(this.el),this._isRendered&&this.bindUIElements(),this},render:function(){return this._isDestroyed||(this.triggerMethod("before:render",this),this._isRendered&&this._reInitRegions(),this._renderTemplate(),this.bindUIElements(),this._isRendered=!0,this.triggerMethod("render",this)),this},_renderTemplate:function(){var t=this.getTemplate();if(!1!==t){var e=this.mixinTemplateContext(this.serializeData()),n=this._renderHtml(t,e);this.attachElContent(n)}else a("template:false is deprecated.  Use _.noop.")},_renderHtml:function(t,e){return yt.render(t,e,this)},getTemplate:function(){return this.template},mixinTemplateContext:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},n=e.result(this,"templateContext");return e.extend(t,n)},attachElContent:function(t){return this.Dom.setContents(this.el,t,this.$el),this},_removeChildren:function(){this.removeRegions()},_getImmediateChildren:function(){return e.chain(this._getRegions()).map("currentView").compact().value()}},{setRenderer:function(t){return this.prototype._renderHtml=t,this},setDomApi:st});e.extend(wt.prototype,ut,vt);var _t=["forEach","each","map","find","detect","filter","select","reject","every","all","some","any","include","contains","invoke","toArray","first","initial","rest","last","without","isEmpty","pluck","reduce","partition"],xt=function(t,n){e.each(_t,(function(r){t[r]=function(){var t=e.result(this,n),o=Array.prototype.slice.call(arguments);return e[r].apply(e,[t].concat(o))}}))},kt=function(t){this._views={},this._indexByModel={},this._indexByCustom={},this._updateLength(),e.each(t,e.bind(this.add,this))};xt(kt.prototype,"_getViews"),e.extend(kt.prototype,{_getViews:function(){return e.values(this._views)},add:function(t,e){return this._add(t,e)._updateLength()},_add:function(t,e){var n=t.cid;return this._views[n]=t,t.model&&(this._indexByModel[t.model.cid]=n),e&&(this._indexByCustom[e]=n),this},findByModel:function(t){return this.findByModelCid(t.cid)},findByModelCid:function(t){var e=this._indexByModel[t];return this.findByCid(e)},findByCustom:function(t){var e=this._indexByCustom[t];return this.findByCid(e)},findByIndex:function(t){return e.values(this._views)[t]},findByCid:function(t){return this._views[t]},remove:function(t){return this._remove(t)._updateLength()},_remove:function(t){var n=t.cid;return t.model&&delete this._indexByModel[t.model.cid],e.some(this._indexByCustom,e.bind((function(t,e){if(t===n)return delete this._indexByCustom[e],!0}),this)),delete this._views[n],this},_updateLength:function(){return this.length=e.size(this._views),this}});var At=["behaviors","childView","childViewEventPrefix","childViewEvents","childViewOptions","childViewTriggers","collectionEvents","events","filter","emptyView","emptyViewOptions","modelEvents","reorderOnSort","sort","triggers","ui","viewComparator"],Ot=t.View.extend({sort:!0,constructor:function(n){this.render=e.bind(this.render,this),this._setOptions(n),this.mergeOptions(n,At),P(this),this._initBehaviors(),this.once("render",this._initialEvents),this._initChildViewStorage(),this._bufferedChildren=[];var r=Array.prototype.slice.call(arguments);r[0]=this.options,t.View.prototype.constructor.apply(this,r),this.delegateEntityEvents(),this._triggerEventOnBehaviors("initialize",this)},_startBuffering:function(){this._isBuffering=!0},_endBuffering:function(){var t=this._isAttached&&!1!==this.monitorViewEvents?this._getImmediateChildren():[];this._isBuffering=!1,e.each(t,(function(t){m(t,"before:attach",t)})),this.attachBuffer(this,this._createBuffer()),e.each(t,(function(t){t._isAttached=!0,m(t,"attach",t)})),this._bufferedChildren=[]},_getImmediateChildren:function(){return e.values(this.children._views)},_initialEvents:function(){this.collection&&(this.listenTo(this.collection,"add",this._onCollectionAdd),this.listenTo(this.collection,"update",this._onCollectionUpdate),this.listenTo(this.collection,"reset",this.render),this.sort&&this.listenTo(this.collection,"sort",this._sortViews))},_onCollectionAdd:function(t,n,r){var o=void 0!==r.at&&(r.index||n.indexOf(t));(this.filter||!1===o)&&(o=e.indexOf(this._filteredSortedModels(o),t)),this._shouldAddChild(t,o)&&(this._destroyEmptyView(),this._addChild(t,o))},_onCollectionUpdate:function(t,e){var n=e.changes;this._removeChildModels(n.removed)},_removeChildModels:function(t){var e=this._getRemovedViews(t);e.length&&(this.children._updateLength(),this._updateIndices(e,!1),this.isEmpty()&&this._showEmptyView())},_getRemovedViews:function(t){var n=this;return e.reduce(t,(function(t,e){var r=e&&n.children.findByModel(e);return!r||r._isDestroyed||(n._removeChildView(r),t.push(r)),t}),[])},_removeChildView:function(t){this.triggerMethod("before:remove:child",this,t),this.children._remove(t),t._shouldDisableEvents=!1===this.monitorViewEvents,ht(t),this.stopListening(t),this.triggerMethod("remove:child",this,t)},setElement:function(){return t.View.prototype.setElement.apply(this,arguments),this._isAttached=s(this.el),this},render:function(){return this._isDestroyed||(this.triggerMethod("before:render",this),this._renderChildren(),this._isRendered=!0,this.triggerMethod("render",this)),this},setFilter:function(t){var e=(arguments.length>1&&void 0!==arguments[1]?arguments[1]:{}).preventRender,n=this._isRendered&&!this._isDestroyed,r=this.filter!==t;if(n&&r&&!e){var o=this._filteredSortedModels();this.filter=t;var i=this._filteredSortedModels();this._applyModelDeltas(i,o)}else this.filter=t;return this},removeFilter:function(t){return this.setFilter(null,t)},_applyModelDeltas:function(t,n){var r=this,o={};e.each(t,(function(t,e){!r.children.findByModel(t)&&r._onCollectionAdd(t,r.collection,{at:e}),o[t.cid]=!0}));var i=e.filter(n,(function(t){return!o[t.cid]&&r.children.findByModel(t)}));this._removeChildModels(i)},reorder:function(){var t=this,n=this.children,r=this._filteredSortedModels();if(!r.length&&this._showingEmptyView)return this;if(e.some(r,(function(t){return!n.findByModel(t)})))this.render();else{var o=[],i=e.reduce(this.children._views,(function(t,n){var i=e.indexOf(r,n.model);return-1===i?(o.push(n.model),t):(n._index=i,t[i]=n.el,t)}),new Array(r.length));this.triggerMethod("before:reorder",this);var a=this.Dom.createBuffer();e.each(i,(function(e){t.Dom.appendContents(a,e)})),this._appendReorderedChildren(a),this._removeChildModels(o),this.triggerMethod("reorder",this)}return this},resortView:function(){return this.reorderOnSort?this.reorder():this._renderChildren(),this},_sortViews:function(){var t=this,n=this._filteredSortedModels();e.find(n,(function(e,n){var r=t.children.findByModel(e);return!r||r._index!==n}))&&this.resortView()},_emptyViewIndex:-1,_appendReorderedChildren:function(t){this.Dom.appendContents(this.el,t,{_$el:this.$el})},_renderChildren:function(){this._isRendered&&(this._destroyEmptyView(),this._destroyChildren());var t=this._filteredSortedModels();this.isEmpty({processedModels:t})?this._showEmptyView():(this.triggerMethod("before:render:children",this),this._startBuffering(),this._showCollection(t),this._endBuffering(),this.triggerMethod("render:children",this))},_createView:function(t,e){var n=this._getChildView(t),r=this._getChildViewOptions(t,e);return this.buildChildView(t,n,r)},_setupChildView:function(t,e){P(t),this._proxyChildViewEvents(t),this.sort&&(t._index=e)},_showCollection:function(t){e.each(t,e.bind(this._addChild,this)),this.children._updateLength()},_filteredSortedModels:function(t){if(!this.collection||!this.collection.length)return[];var e=this.getViewComparator(),n=this.collection.models;if(t=Math.min(Math.max(t,0),n.length-1),e){var r=void 0;t&&(r=n[t],n=n.slice(0,t).concat(n.slice(t+1))),n=this._sortModelsBy(n,e),r&&n.splice(t,0,r)}return n=this._filterModels(n)},getViewComparator:function(){return this.viewComparator},_filterModels:function(t){var n=this;return this.filter&&(t=e.filter(t,(function(t,e){return n._shouldAddChild(t,e)}))),t},_sortModelsBy:function(t,n){return"string"==typeof n?e.sortBy(t,(function(t){return t.get(n)})):1===n.length?e.sortBy(t,e.bind(n,this)):e.clone(t).sort(e.bind(n,this))},_showEmptyView:function(){var n=this._getEmptyView();if(n&&!this._showingEmptyView){this._showingEmptyView=!0;var r=new t.Model,o=this.emptyViewOptions||this.childViewOptions;e.isFunction(o)&&(o=o.call(this,r,this._emptyViewIndex));var i=this.buildChildView(r,n,o);this.triggerMethod("before:render:empty",this,i),this.addChildView(i,0),this.triggerMethod("render:empty",this,i)}},_destroyEmptyView:function(){this._showingEmptyView&&(this.triggerMethod("before:remove:empty",this),this._destroyChildren(),delete this._showingEmptyView,this.triggerMethod("remove:empty",this))},_getEmptyView:function(){var t=this.emptyView;if(t)return this._getView(t)},_getChildView:function(t){var e=this.childView;if(!e)throw new T({name:"NoChildViewError",message:'A "childView" must be specified'});if(!(e=this._getView(e,t)))throw new T({name:"InvalidChildViewError",message:'"childView" must be a view class or a function that returns a view class'});return e},_getView:function(n,r){return n.prototype instanceof t.View||n===t.View?n:e.isFunction(n)?n.call(this,r):void 0},_addChild:function(t,e){var n=this._createView(t,e);return this.addChildView(n,e),n},_getChildViewOptions:function(t,n){return e.isFunction(this.childViewOptions)?this.childViewOptions(t,n):this.childViewOptions},addChildView:function(t,e){return this.triggerMethod("before:add:child",this,t),this._setupChildView(t,e),this._isBuffering?this.children._add(t):(this._updateIndices(t,!0),this.children.add(t)),ct(t),this._attachView(t,e),this.triggerMethod("add:child",this,t),t},_updateIndices:function(t,n){if(this.sort)if(n){var r=e.isArray(t)?e.max(t,"_index"):t;e.isObject(r)&&e.each(this.children._views,(function(t){t._index>=r._index&&(t._index+=1)}))}else e.each(e.sortBy(this.children._views,"_index"),(function(t,e){t._index=e}))},_attachView:function(t,e){var n=!t._isAttached&&!this._isBuffering&&this._isAttached&&!1!==this.monitorViewEvents;n&&m(t,"before:attach",t),this.attachHtml(this,t,e),n&&(t._isAttached=!0,m(t,"attach",t))},buildChildView:function(t,n,r){return new n(e.extend({model:t},r))},removeChildView:function(t){return!t||t._isDestroyed||(this._removeChildView(t),this.children._updateLength(),this._updateIndices(t,!1)),t},isEmpty:function(t){var n=void 0;return e.result(t,"processedModels")?n=t.processedModels:(n=this.collection?this.collection.models:[],n=this._filterModels(n)),0===n.length},attachBuffer:function(t,e){this.Dom.appendContents(t.el,e,{_$el:t.$el})},_createBuffer:function(){var t=this,n=this.Dom.createBuffer();return e.each(this._bufferedChildren,(function(e){t.Dom.appendContents(n,e.el,{_$contents:e.$el})})),n},attachHtml:function(t,e,n){t._isBuffering?t._bufferedChildren.splice(n,0,e):t._insertBefore(e,n)||t._insertAfter(e)},_insertBefore:function(t,n){var r=void 0;return this.sort&&n<this.children.length-1&&(r=e.find(this.children._views,(function(t){return t._index===n+1}))),!!r&&(this.beforeEl(r.el,t.el),!0)},beforeEl:function(t,e){this.$(t).before(e)},_insertAfter:function(t){this.Dom.appendContents(this.el,t.el,{_$el:this.$el,_$contents:t.$el})},_initChildViewStorage:function(){this.children=new kt},_removeChildren:function(){this._destroyChildren()},_destroyChildren:function(t){this.children.length&&(this.triggerMethod("before:destroy:children",this),e.each(this.children._views,e.bind(this._removeChildView,this)),this.children._updateLength(),this.triggerMethod("destroy:children",this))},_shouldAddChild:function(t,n){var r=this.filter;return!e.isFunction(r)||r.call(this,t,n,this.collection)}},{setDomApi:st});e.extend(Ot.prototype,ut);var Et=function(){this._init()};function Ct(t,e){return e.model&&e.model.get(t)}xt(Et.prototype,"_views"),e.extend(Et.prototype,{_init:function(){this._views=[],this._viewsByCid={},this._indexByModel={},this._updateLength()},_add:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this._views.length,n=t.cid;this._viewsByCid[n]=t,t.model&&(this._indexByModel[t.model.cid]=n),this._views.splice(e,0,t),this._updateLength()},_sort:function(t,n){return"string"==typeof t?(t=e.partial(Ct,t),this._sortBy(t)):1===t.length?this._sortBy(e.bind(t,n)):this._views.sort(e.bind(t,n))},_sortBy:function(t){var n=e.sortBy(this._views,t);return this._set(n),n},_set:function(t){this._views.length=0,this._views.push.apply(this._views,t.slice(0)),this._updateLength()},_swap:function(t,e){var n=this.findIndexByView(t),r=this.findIndexByView(e);if(-1!==n&&-1!==r){var o=this._views[n];this._views[n]=this._views[r],this._views[r]=o}},findByModel:function(t){return this.findByModelCid(t.cid)},findByModelCid:function(t){var e=this._indexByModel[t];return this.findByCid(e)},findByIndex:function(t){return this._views[t]},findIndexByView:function(t){return this._views.indexOf(t)},findByCid:function(t){return this._viewsByCid[t]},hasView:function(t){return!!this.findByCid(t.cid)},_remove:function(t){if(this._viewsByCid[t.cid]){t.model&&delete this._indexByModel[t.model.cid],delete this._viewsByCid[t.cid];var e=this.findIndexByView(t);this._views.splice(e,1),this._updateLength()}},_updateLength:function(){this.length=this._views.length}});var St=["behaviors","childView","childViewEventPrefix","childViewEvents","childViewOptions","childViewTriggers","collectionEvents","emptyView","emptyViewOptions","events","modelEvents","sortWithCollection","triggers","ui","viewComparator","viewFilter"],Pt=t.View.extend({sortWithCollection:!0,constructor:function(e){this._setOptions(e),this.mergeOptions(e,St),P(this),this.once("render",this._initialEvents),this._initChildViewStorage(),this._initBehaviors();var n=Array.prototype.slice.call(arguments);n[0]=this.options,t.View.prototype.constructor.apply(this,n),this.getEmptyRegion(),this.delegateEntityEvents(),this._triggerEventOnBehaviors("initialize",this)},_initChildViewStorage:function(){this.children=new Et},getEmptyRegion:function(){return this._emptyRegion&&!this._emptyRegion.isDestroyed()||(this._emptyRegion=new pt({el:this.el,replaceElement:!1}),this._emptyRegion._parentView=this),this._emptyRegion},_initialEvents:function(){this.listenTo(this.collection,{sort:this._onCollectionSort,reset:this._onCollectionReset,update:this._onCollectionUpdate})},_onCollectionSort:function(t,e){var n=e.add,r=e.merge,o=e.remove;this.sortWithCollection&&!1!==this.viewComparator&&(n||o||r||this.sort())},_onCollectionReset:function(){this.render()},_onCollectionUpdate:function(t,e){var n=e.changes,r=n.removed.length&&this._removeChildModels(n.removed);this._addedViews=n.added.length&&this._addChildModels(n.added),this._detachChildren(r),this._showChildren(),this._removeChildViews(r)},_removeChildModels:function(t){var n=this;return e.reduce(t,(function(t,e){var r=n._removeChildModel(e);return r&&t.push(r),t}),[])},_removeChildModel:function(t){var e=this.children.findByModel(t);return e&&this._removeChild(e),e},_removeChild:function(t){this.triggerMethod("before:remove:child",this,t),this.children._remove(t),this.triggerMethod("remove:child",this,t)},_addChildModels:function(t){return e.map(t,e.bind(this._addChildModel,this))},_addChildModel:function(t){var e=this._createChildView(t);return this._addChild(e),e},_createChildView:function(t){var e=this._getChildView(t),n=this._getChildViewOptions(t);return this.buildChildView(t,e,n)},_addChild:function(t,e){this.triggerMethod("before:add:child",this,t),this._setupChildView(t),this.children._add(t,e),this.triggerMethod("add:child",this,t)},_getChildView:function(t){var e=this.childView;if(!e)throw new T({name:"NoChildViewError",message:'A "childView" must be specified'});if(!(e=this._getView(e,t)))throw new T({name:"InvalidChildViewError",message:'"childView" must be a view class or a function that returns a view class'});return e},_getView:function(n,r){return n.prototype instanceof t.View||n===t.View?n:e.isFunction(n)?n.call(this,r):void 0},_getChildViewOptions:function(t){return e.isFunction(this.childViewOptions)?this.childViewOptions(t):this.childViewOptions},buildChildView:function(t,n,r){return new n(e.extend({model:t},r))},_setupChildView:function(t){P(t),t.on("destroy",this.removeChildView,this),this._proxyChildViewEvents(t)},_getImmediateChildren:function(){return this.children._views},setElement:function(){return t.View.prototype.setElement.apply(this,arguments),this._isAttached=s(this.el),this},render:function(){return this._isDestroyed||(this.triggerMethod("before:render",this),this._destroyChildren(),this.children._init(),this.collection&&this._addChildModels(this.collection.models),this._showChildren(),this._isRendered=!0,this.triggerMethod("render",this)),this},sort:function(){return this._isDestroyed?this:this.children.length?(this._showChildren(),this):this},_showChildren:function(){this.isEmpty()?this._showEmptyView():(this._sortChildren(),this.filter())},isEmpty:function(t){return t||!this.children.length},_showEmptyView:function(){var t=this._getEmptyView();if(t){var e=this._getEmptyViewOptions();this.getEmptyRegion().show(new t(e))}},_getEmptyView:function(){var t=this.emptyView;if(t)return this._getView(t)},_destroyEmptyView:function(){var t=this.getEmptyRegion();t.hasView()&&t.empty()},_getEmptyViewOptions:function(){var t=this.emptyViewOptions||this.childViewOptions;return e.isFunction(t)?t.call(this):t},_sortChildren:function(){var t=this.getComparator();t&&(delete this._addedViews,this.triggerMethod("before:sort",this),this.children._sort(t,this),this.triggerMethod("sort",this))},setComparator:function(t){var e=(arguments.length>1&&void 0!==arguments[1]?arguments[1]:{}).preventRender,n=this.viewComparator!==t&&!e;return this.viewComparator=t,n&&this.sort(),this},removeComparator:function(t){return this.setComparator(null,t)},getComparator:function(){return this.viewComparator?this.viewComparator:!(!this.sortWithCollection||!1===this.viewComparator||!this.collection)&&this._viewComparator},_viewComparator:function(t){return this.collection.indexOf(t.model)},filter:function(){if(this._isDestroyed)return this;if(!this.children.length)return this;var t=this._filterChildren();return this._renderChildren(t),this},_filterChildren:function(){var t=this,n=this._getFilter(),r=this._addedViews;if(delete this._addedViews,!n)return r||this.children._views;this.triggerMethod("before:filter",this);var o=[],i=[];return e.each(this.children._views,(function(e,r,a){(n.call(t,e,r,a)?o:i).push(e)})),this._detachChildren(i),this.triggerMethod("filter",this,o,i),o},_getFilter:function(){var t=this.getFilter();if(!t)return!1;if(e.isFunction(t))return t;if(e.isObject(t)){var n=e.matches(t);return function(t){return n(t.model&&t.model.attributes)}}if(e.isString(t))return function(e){return e.model&&e.model.get(t)};throw new T({name:"InvalidViewFilterError",message:'"viewFilter" must be a function, predicate object literal, a string indicating a model attribute, or falsy'})},getFilter:function(){return this.viewFilter},setFilter:function(t){var e=(arguments.length>1&&void 0!==arguments[1]?arguments[1]:{}).preventRender,n=this.viewFilter!==t&&!e;return this.viewFilter=t,n&&this.filter(),this},removeFilter:function(t){return this.setFilter(null,t)},_detachChildren:function(t){e.each(t,e.bind(this._detachChildView,this))},_detachChildView:function(t){var e=t._isAttached&&!1!==this.monitorViewEvents;e&&m(t,"before:detach",t),this.detachHtml(t),e&&(t._isAttached=!1,m(t,"detach",t))},detachHtml:function(t){this.Dom.detachEl(t.el,t.$el)},_renderChildren:function(t){if(this.isEmpty(!t.length))this._showEmptyView();else{this._destroyEmptyView(),this.triggerMethod("before:render:children",this,t);var e=this._getBuffer(t);this._attachChildren(e,t),this.triggerMethod("render:children",this,t)}},_attachChildren:function(t,n){n=this._isAttached&&!1!==this.monitorViewEvents?n:[],e.each(n,(function(t){t._isAttached||m(t,"before:attach",t)})),this.attachHtml(t),e.each(n,(function(t){t._isAttached||(t._isAttached=!0,m(t,"attach",t))}))},_getBuffer:function(t){var n=this,r=this.Dom.createBuffer();return e.each(t,(function(t){ct(t),n.Dom.appendContents(r,t.el,{_$contents:t.$el})})),r},attachHtml:function(t){this.Dom.appendContents(this.el,t,{_$el:this.$el})},swapChildViews:function(t,e){if(!this.children.hasView(t)||!this.children.hasView(e))throw new T({name:"ChildSwapError",message:"Both views must be children of the collection view"});return this.children._swap(t,e),this.Dom.swapEl(t.el,e.el),this.Dom.hasEl(this.el,t.el)!==this.Dom.hasEl(this.el,e.el)&&this.filter(),this},addChildView:function(t,e){return!t||t._isDestroyed||((!e||e>=this.children.length)&&(this._addedViews=[t]),this._addChild(t,e),this._showChildren()),t},detachChildView:function(t){return this.removeChildView(t,{shouldDetach:!0}),t},removeChildView:function(t,e){return t?(this._removeChildView(t,e),this._removeChild(t),this.isEmpty()&&this._showEmptyView(),t):t},_removeChildViews:function(t){e.each(t,e.bind(this._removeChildView,this))},_removeChildView:function(t){var e=(arguments.length>1&&void 0!==arguments[1]?arguments[1]:{}).shouldDetach;t.off("destroy",this.removeChildView,this),e?this._detachChildView(t):this._destroyChildView(t),this.stopListening(t)},_destroyChildView:function(t){t._isDestroyed||(t._shouldDisableEvents=!1===this.monitorViewEvents,ht(t))},_removeChildren:function(){this._destroyChildren(),this.getEmptyRegion().destroy(),delete this._addedViews},_destroyChildren:function(){this.children&&this.children.length&&(this.triggerMethod("before:destroy:children",this),!1===this.monitorViewEvents&&this.Dom.detachContents(this.el,this.$el),e.each(this.children._views,e.bind(this._removeChildView,this)),this.triggerMethod("destroy:children",this))}},{setDomApi:st});e.extend(Pt.prototype,ut);var jt=["childViewContainer","template","templateContext"],Tt=Ot.extend({constructor:function(t){a("CompositeView is deprecated. Convert to View at your earliest convenience"),this.mergeOptions(t,jt),Ot.prototype.constructor.apply(this,arguments)},_initialEvents:function(){this.collection&&(this.listenTo(this.collection,"add",this._onCollectionAdd),this.listenTo(this.collection,"update",this._onCollectionUpdate),this.listenTo(this.collection,"reset",this.renderChildren),this.sort&&this.listenTo(this.collection,"sort",this._sortViews))},_getChildView:function(t){var e=this.childView;if(!e)return this.constructor;if(!(e=this._getView(e,t)))throw new T({name:"InvalidChildViewError",message:'"childView" must be a view class or a function that returns a view class'});return e},serializeData:function(){return this.serializeModel()},render:function(){return this._isDestroyed||(this._isRendering=!0,this.resetChildViewContainer(),this.triggerMethod("before:render",this),this._renderTemplate(),this.bindUIElements(),this.renderChildren(),this._isRendering=!1,this._isRendered=!0,this.triggerMethod("render",this)),this},renderChildren:function(){(this._isRendered||this._isRendering)&&Ot.prototype._renderChildren.call(this)},attachBuffer:function(t,e){var n=this.getChildViewContainer(t);this.Dom.appendContents(n[0],e,{_$el:n})},_insertAfter:function(t){var e=this.getChildViewContainer(this,t);this.Dom.appendContents(e[0],t.el,{_$el:e,_$contents:t.$el})},_appendReorderedChildren:function(t){var e=this.getChildViewContainer(this);this.Dom.appendContents(e[0],t,{_$el:e})},getChildViewContainer:function(t,n){if(t.$childViewContainer)return t.$childViewContainer;var r=void 0;if(t.childViewContainer){var o=e.result(t,"childViewContainer");if((r="@"===o.charAt(0)&&t.ui?t.ui[o.substr(4)]:this.$(o)).length<=0)throw new T({name:"ChildViewContainerMissingError",message:'The specified "childViewContainer" was not found: '+t.childViewContainer})}else r=t.$el;return t.$childViewContainer=r,r},resetChildViewContainer:function(){this.$childViewContainer&&(this.$childViewContainer=void 0)}}),Rt=e.pick(wt.prototype,"serializeModel","getTemplate","_renderTemplate","_renderHtml","mixinTemplateContext","attachElContent");e.extend(Tt.prototype,Rt);var Mt=["collectionEvents","events","modelEvents","triggers","ui"],Nt=F.extend({cidPrefix:"mnb",constructor:function(t,n){this.view=n,this.defaults&&a("Behavior defaults are deprecated. For similar functionality set options on the Behavior class."),this.defaults=e.clone(e.result(this,"defaults",{})),this._setOptions(e.extend({},this.defaults,t)),this.mergeOptions(this.options,Mt),this.ui=e.extend({},e.result(this,"ui"),e.result(n,"ui")),F.apply(this,arguments)},$:function(){return this.view.$.apply(this.view,arguments)},destroy:function(){return this.stopListening(),this.view._removeBehavior(this),this},proxyViewProperties:function(){return this.$el=this.view.$el,this.el=this.view.el,this},bindUIElements:function(){return this._bindUIElements(),this},unbindUIElements:function(){return this._unbindUIElements(),this},getUI:function(t){return this._getUI(t)},delegateEntityEvents:function(){return this._delegateEntityEvents(this.view.model,this.view.collection),this},undelegateEntityEvents:function(){return this._undelegateEntityEvents(this.view.model,this.view.collection),this},getEvents:function(){var t=this,n=this.normalizeUIKeys(e.result(this,"events"));return e.reduce(n,(function(n,r,o){return e.isFunction(r)||(r=t[r]),r?(n[o=Y(o,t.cid)]=e.bind(r,t),n):n}),{})},getTriggers:function(){if(this.triggers){var t=this.normalizeUIKeys(e.result(this,"triggers"));return this._getViewTriggers(this.view,t)}}});e.extend(Nt.prototype,K,et,it);var Dt=["region","regionClass"],Bt=F.extend({cidPrefix:"mna",constructor:function(t){this._setOptions(t),this.mergeOptions(t,Dt),this._initRegion(),F.prototype.constructor.apply(this,arguments)},regionClass:pt,_initRegion:function(){var t=this.region;if(t){var e={regionClass:this.regionClass};this._region=dt(t,e)}},getRegion:function(){return this._region},showView:function(t){for(var e=this.getRegion(),n=arguments.length,r=Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return e.show.apply(e,[t].concat(r))},getView:function(){return this.getRegion().currentView},start:function(t){return this.triggerMethod("before:start",this,t),this.triggerMethod("start",this,t),this}}),Vt=["appRoutes","controller"],It=t.Router.extend({constructor:function(e){this._setOptions(e),this.mergeOptions(e,Vt),t.Router.apply(this,arguments);var n=this.appRoutes,r=this._getController();this.processAppRoutes(r,n),this.on("route",this._processOnRoute,this)},appRoute:function(t,e){var n=this._getController();return this._addAppRoute(n,t,e),this},_processOnRoute:function(t,n){if(e.isFunction(this.onRoute)){var r=e.invert(this.appRoutes)[t];this.onRoute(t,r,n)}},processAppRoutes:function(t,n){var r=this;if(!n)return this;var o=e.keys(n).reverse();return e.each(o,(function(e){r._addAppRoute(t,e,n[e])})),this},_getController:function(){return this.controller},_addAppRoute:function(t,n,r){var o=t[r];if(!o)throw new T('Method "'+r+'" was not found on the controller');this.route(n,r,e.bind(o,t))},triggerMethod:d});function Lt(){throw new T({message:"You must define where your behaviors are stored.",url:"marionette.behaviors.md#behaviorslookup"})}e.extend(It.prototype,L);var zt=t.Marionette,$t=t.Marionette={};return $t.noConflict=function(){return t.Marionette=zt,this},$t.bindEvents=o(N),$t.unbindEvents=o(D),$t.bindRequests=o(V),$t.unbindRequests=o(I),$t.mergeOptions=o(l),$t.getOption=o(u),$t.normalizeMethods=o(c),$t.extend=i,$t.isNodeAttached=s,$t.deprecate=a,$t.triggerMethod=o(d),$t.triggerMethodOn=m,$t.isEnabled=Z,$t.setEnabled=Q,$t.monitorViewEvents=P,$t.Behaviors={},$t.Behaviors.behaviorsLookup=Lt,$t.Application=Bt,$t.AppRouter=It,$t.Renderer=yt,$t.TemplateCache=U,$t.View=wt,$t.CollectionView=Ot,$t.NextCollectionView=Pt,$t.CompositeView=Tt,$t.Behavior=Nt,$t.Region=pt,$t.Error=T,$t.Object=F,$t.DEV_MODE=!1,$t.FEATURES=J,$t.VERSION=r,$t.DomApi=lt,$t.setDomApi=function(t){Ot.setDomApi(t),Tt.setDomApi(t),Pt.setDomApi(t),pt.setDomApi(t),wt.setDomApi(t)},$t}(n(1391),n(4523),n(5804)),this&&this.Marionette&&(this.Mn=this.Marionette)},5804:function(t,e,n){t.exports=function(t,e){"use strict";t="default"in t?t.default:t,e="default"in e?e.default:e;var n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol?"symbol":typeof t},r=e.Radio,o=e.Radio={};o.VERSION="2.0.0",o.noConflict=function(){return e.Radio=r,this},o.DEBUG=!1,o._debugText=function(t,e,n){return t+(n?" on the "+n+" channel":"")+': "'+e+'"'},o.debugLog=function(t,e,n){o.DEBUG&&console&&console.warn&&console.warn(o._debugText(t,e,n))};var i=/\s+/;function a(t,e,n,r){var o=t[e];if(!(n&&n!==o.callback&&n!==o.callback._callback||r&&r!==o.context))return delete t[e],!0}function s(e,n,r,o){e||(e={});for(var i=n?[n]:t.keys(e),s=!1,l=0,u=i.length;l<u;l++)e[n=i[l]]&&a(e,n,r,o)&&(s=!0);return s}o._eventsApi=function(e,r,o,a){if(!o)return!1;var s={};if("object"===(void 0===o?"undefined":n(o))){for(var l in o){var u=e[r].apply(e,[l,o[l]].concat(a));i.test(l)?t.extend(s,u):s[l]=u}return s}if(i.test(o)){for(var c=o.split(i),h=0,f=c.length;h<f;h++)s[c[h]]=e[r].apply(e,[c[h]].concat(a));return s}return!1},o._callHandler=function(t,e,n){var r=n[0],o=n[1],i=n[2];switch(n.length){case 0:return t.call(e);case 1:return t.call(e,r);case 2:return t.call(e,r,o);case 3:return t.call(e,r,o,i);default:return t.apply(e,n)}};var l,u,c={};function h(e){return c[e]||(c[e]=t.bind(o.log,o,e))}function f(e){return t.isFunction(e)?e:function(){return e}}t.extend(o,{log:function(e,n){if("undefined"!=typeof console){var r=t.toArray(arguments).slice(2);console.log("["+e+'] "'+n+'"',r)}},tuneIn:function(t){var e=o.channel(t);return e._tunedIn=!0,e.on("all",h(t)),this},tuneOut:function(t){var e=o.channel(t);return e._tunedIn=!1,e.off("all",h(t)),delete c[t],this}}),o.Requests={request:function(e){var n=t.toArray(arguments).slice(1),r=o._eventsApi(this,"request",e,n);if(r)return r;var i=this.channelName,a=this._requests;if(i&&this._tunedIn&&o.log.apply(this,[i,e].concat(n)),a&&(a[e]||a.default)){var s=a[e]||a.default;return n=a[e]?n:arguments,o._callHandler(s.callback,s.context,n)}o.debugLog("An unhandled request was fired",e,i)},reply:function(t,e,n){return o._eventsApi(this,"reply",t,[e,n])||(this._requests||(this._requests={}),this._requests[t]&&o.debugLog("A request was overwritten",t,this.channelName),this._requests[t]={callback:f(e),context:n||this}),this},replyOnce:function(e,n,r){if(o._eventsApi(this,"replyOnce",e,[n,r]))return this;var i=this,a=t.once((function(){return i.stopReplying(e),f(n).apply(this,arguments)}));return this.reply(e,a,r)},stopReplying:function(t,e,n){return o._eventsApi(this,"stopReplying",t)||(t||e||n?s(this._requests,t,e,n)||o.debugLog("Attempted to remove the unregistered request",t,this.channelName):delete this._requests),this}},o._channels={},o.channel=function(t){if(!t)throw new Error("You must provide a name for the channel.");return o._channels[t]?o._channels[t]:o._channels[t]=new o.Channel(t)},o.Channel=function(t){this.channelName=t},t.extend(o.Channel.prototype,e.Events,o.Requests,{reset:function(){return this.off(),this.stopListening(),this.stopReplying(),this}});var p=[e.Events,o.Requests];return t.each(p,(function(e){t.each(e,(function(e,n){o[n]=function(e){return u=t.toArray(arguments).slice(1),(l=this.channel(e))[n].apply(l,u)}}))})),o.reset=function(e){var n=e?[this._channels[e]]:this._channels;t.each(n,(function(t){t.reset()}))},o}(n(4523),n(1391))},1391:function(t,e,n){var r,o,i;i="object"==typeof self&&self.self===self&&self||"object"==typeof n.g&&n.g.global===n.g&&n.g,r=[n(4523),n(4692),e],o=function(t,e,n){i.Backbone=function(t,e,n,r){var o=t.Backbone,i=Array.prototype.slice;e.VERSION="1.6.0",e.$=r,e.noConflict=function(){return t.Backbone=o,this},e.emulateHTTP=!1,e.emulateJSON=!1;var a,s=e.Events={},l=/\s+/,u=function(t,e,r,o,i){var a,s=0;if(r&&"object"==typeof r){void 0!==o&&"context"in i&&void 0===i.context&&(i.context=o);for(a=n.keys(r);s<a.length;s++)e=u(t,e,a[s],r[a[s]],i)}else if(r&&l.test(r))for(a=r.split(l);s<a.length;s++)e=t(e,a[s],o,i);else e=t(e,r,o,i);return e};s.on=function(t,e,n){return this._events=u(c,this._events||{},t,e,{context:n,ctx:this,listening:a}),a&&((this._listeners||(this._listeners={}))[a.id]=a,a.interop=!1),this},s.listenTo=function(t,e,r){if(!t)return this;var o=t._listenId||(t._listenId=n.uniqueId("l")),i=this._listeningTo||(this._listeningTo={}),s=a=i[o];s||(this._listenId||(this._listenId=n.uniqueId("l")),s=a=i[o]=new g(this,t));var l=h(t,e,r,this);if(a=void 0,l)throw l;return s.interop&&s.on(e,r),this};var c=function(t,e,n,r){if(n){var o=t[e]||(t[e]=[]),i=r.context,a=r.ctx,s=r.listening;s&&s.count++,o.push({callback:n,context:i,ctx:i||a,listening:s})}return t},h=function(t,e,n,r){try{t.on(e,n,r)}catch(t){return t}};s.off=function(t,e,n){return this._events?(this._events=u(f,this._events,t,e,{context:n,listeners:this._listeners}),this):this},s.stopListening=function(t,e,r){var o=this._listeningTo;if(!o)return this;for(var i=t?[t._listenId]:n.keys(o),a=0;a<i.length;a++){var s=o[i[a]];if(!s)break;s.obj.off(e,r,this),s.interop&&s.off(e,r)}return n.isEmpty(o)&&(this._listeningTo=void 0),this};var f=function(t,e,r,o){if(t){var i,a=o.context,s=o.listeners,l=0;if(e||a||r){for(i=e?[e]:n.keys(t);l<i.length;l++){var u=t[e=i[l]];if(!u)break;for(var c=[],h=0;h<u.length;h++){var f=u[h];if(r&&r!==f.callback&&r!==f.callback._callback||a&&a!==f.context)c.push(f);else{var p=f.listening;p&&p.off(e,r)}}c.length?t[e]=c:delete t[e]}return t}for(i=n.keys(s);l<i.length;l++)s[i[l]].cleanup()}};s.once=function(t,e,n){var r=u(p,{},t,e,this.off.bind(this));return"string"==typeof t&&null==n&&(e=void 0),this.on(r,e,n)},s.listenToOnce=function(t,e,n){var r=u(p,{},e,n,this.stopListening.bind(this,t));return this.listenTo(t,r)};var p=function(t,e,r,o){if(r){var i=t[e]=n.once((function(){o(e,i),r.apply(this,arguments)}));i._callback=r}return t};s.trigger=function(t){if(!this._events)return this;for(var e=Math.max(0,arguments.length-1),n=Array(e),r=0;r<e;r++)n[r]=arguments[r+1];return u(d,this._events,t,void 0,n),this};var d=function(t,e,n,r){if(t){var o=t[e],i=t.all;o&&i&&(i=i.slice()),o&&m(o,r),i&&m(i,[e].concat(r))}return t},m=function(t,e){var n,r=-1,o=t.length,i=e[0],a=e[1],s=e[2];switch(e.length){case 0:for(;++r<o;)(n=t[r]).callback.call(n.ctx);return;case 1:for(;++r<o;)(n=t[r]).callback.call(n.ctx,i);return;case 2:for(;++r<o;)(n=t[r]).callback.call(n.ctx,i,a);return;case 3:for(;++r<o;)(n=t[r]).callback.call(n.ctx,i,a,s);return;default:for(;++r<o;)(n=t[r]).callback.apply(n.ctx,e);return}},g=function(t,e){this.id=t._listenId,this.listener=t,this.obj=e,this.interop=!0,this.count=0,this._events=void 0};g.prototype.on=s.on,g.prototype.off=function(t,e){var n;this.interop?(this._events=u(f,this._events,t,e,{context:void 0,listeners:void 0}),n=!this._events):(this.count--,n=0===this.count),n&&this.cleanup()},g.prototype.cleanup=function(){delete this.listener._listeningTo[this.obj._listenId],this.interop||delete this.obj._listeners[this.id]},s.bind=s.on,s.unbind=s.off,n.extend(e,s);var v=e.Model=function(t,e){var r=t||{};e||(e={}),this.preinitialize.apply(this,arguments),this.cid=n.uniqueId(this.cidPrefix),this.attributes={},e.collection&&(this.collection=e.collection),e.parse&&(r=this.parse(r,e)||{});var o=n.result(this,"defaults");r=n.defaults(n.extend({},o,r),o),this.set(r,e),this.changed={},this.initialize.apply(this,arguments)};n.extend(v.prototype,s,{changed:null,validationError:null,idAttribute:"id",cidPrefix:"c",preinitialize:function(){},initialize:function(){},toJSON:function(t){return n.clone(this.attributes)},sync:function(){return e.sync.apply(this,arguments)},get:function(t){return this.attributes[t]},escape:function(t){return n.escape(this.get(t))},has:function(t){return null!=this.get(t)},matches:function(t){return!!n.iteratee(t,this)(this.attributes)},set:function(t,e,r){if(null==t)return this;var o;if("object"==typeof t?(o=t,r=e):(o={})[t]=e,r||(r={}),!this._validate(o,r))return!1;var i=r.unset,a=r.silent,s=[],l=this._changing;this._changing=!0,l||(this._previousAttributes=n.clone(this.attributes),this.changed={});var u=this.attributes,c=this.changed,h=this._previousAttributes;for(var f in o)e=o[f],n.isEqual(u[f],e)||s.push(f),n.isEqual(h[f],e)?delete c[f]:c[f]=e,i?delete u[f]:u[f]=e;if(this.idAttribute in o){var p=this.id;this.id=this.get(this.idAttribute),this.trigger("changeId",this,p,r)}if(!a){s.length&&(this._pending=r);for(var d=0;d<s.length;d++)this.trigger("change:"+s[d],this,u[s[d]],r)}if(l)return this;if(!a)for(;this._pending;)r=this._pending,this._pending=!1,this.trigger("change",this,r);return this._pending=!1,this._changing=!1,this},unset:function(t,e){return this.set(t,void 0,n.extend({},e,{unset:!0}))},clear:function(t){var e={};for(var r in this.attributes)e[r]=void 0;return this.set(e,n.extend({},t,{unset:!0}))},hasChanged:function(t){return null==t?!n.isEmpty(this.changed):n.has(this.changed,t)},changedAttributes:function(t){if(!t)return!!this.hasChanged()&&n.clone(this.changed);var e,r=this._changing?this._previousAttributes:this.attributes,o={};for(var i in t){var a=t[i];n.isEqual(r[i],a)||(o[i]=a,e=!0)}return!!e&&o},previous:function(t){return null!=t&&this._previousAttributes?this._previousAttributes[t]:null},previousAttributes:function(){return n.clone(this._previousAttributes)},fetch:function(t){t=n.extend({parse:!0},t);var e=this,r=t.success;return t.success=function(n){var o=t.parse?e.parse(n,t):n;if(!e.set(o,t))return!1;r&&r.call(t.context,e,n,t),e.trigger("sync",e,n,t)},K(this,t),this.sync("read",this,t)},save:function(t,e,r){var o;null==t||"object"==typeof t?(o=t,r=e):(o={})[t]=e;var i=(r=n.extend({validate:!0,parse:!0},r)).wait;if(o&&!i){if(!this.set(o,r))return!1}else if(!this._validate(o,r))return!1;var a=this,s=r.success,l=this.attributes;r.success=function(t){a.attributes=l;var e=r.parse?a.parse(t,r):t;if(i&&(e=n.extend({},o,e)),e&&!a.set(e,r))return!1;s&&s.call(r.context,a,t,r),a.trigger("sync",a,t,r)},K(this,r),o&&i&&(this.attributes=n.extend({},l,o));var u=this.isNew()?"create":r.patch?"patch":"update";"patch"!==u||r.attrs||(r.attrs=o);var c=this.sync(u,this,r);return this.attributes=l,c},destroy:function(t){t=t?n.clone(t):{};var e=this,r=t.success,o=t.wait,i=function(){e.stopListening(),e.trigger("destroy",e,e.collection,t)};t.success=function(n){o&&i(),r&&r.call(t.context,e,n,t),e.isNew()||e.trigger("sync",e,n,t)};var a=!1;return this.isNew()?n.defer(t.success):(K(this,t),a=this.sync("delete",this,t)),o||i(),a},url:function(){var t=n.result(this,"urlRoot")||n.result(this.collection,"url")||G();if(this.isNew())return t;var e=this.get(this.idAttribute);return t.replace(/[^\/]$/,"$&/")+encodeURIComponent(e)},parse:function(t,e){return t},clone:function(){return new this.constructor(this.attributes)},isNew:function(){return!this.has(this.idAttribute)},isValid:function(t){return this._validate({},n.extend({},t,{validate:!0}))},_validate:function(t,e){if(!e.validate||!this.validate)return!0;t=n.extend({},this.attributes,t);var r=this.validationError=this.validate(t,e)||null;return!r||(this.trigger("invalid",this,r,n.extend(e,{validationError:r})),!1)}});var y=e.Collection=function(t,e){e||(e={}),this.preinitialize.apply(this,arguments),e.model&&(this.model=e.model),void 0!==e.comparator&&(this.comparator=e.comparator),this._reset(),this.initialize.apply(this,arguments),t&&this.reset(t,n.extend({silent:!0},e))},b={add:!0,remove:!0,merge:!0},w={add:!0,remove:!1},_=function(t,e,n){n=Math.min(Math.max(n,0),t.length);var r,o=Array(t.length-n),i=e.length;for(r=0;r<o.length;r++)o[r]=t[r+n];for(r=0;r<i;r++)t[r+n]=e[r];for(r=0;r<o.length;r++)t[r+i+n]=o[r]};n.extend(y.prototype,s,{model:v,preinitialize:function(){},initialize:function(){},toJSON:function(t){return this.map((function(e){return e.toJSON(t)}))},sync:function(){return e.sync.apply(this,arguments)},add:function(t,e){return this.set(t,n.extend({merge:!1},e,w))},remove:function(t,e){e=n.extend({},e);var r=!n.isArray(t);t=r?[t]:t.slice();var o=this._removeModels(t,e);return!e.silent&&o.length&&(e.changes={added:[],merged:[],removed:o},this.trigger("update",this,e)),r?o[0]:o},set:function(t,e){if(null!=t){(e=n.extend({},b,e)).parse&&!this._isModel(t)&&(t=this.parse(t,e)||[]);var r=!n.isArray(t);t=r?[t]:t.slice();var o=e.at;null!=o&&(o=+o),o>this.length&&(o=this.length),o<0&&(o+=this.length+1);var i,a,s=[],l=[],u=[],c=[],h={},f=e.add,p=e.merge,d=e.remove,m=!1,g=this.comparator&&null==o&&!1!==e.sort,v=n.isString(this.comparator)?this.comparator:null;for(a=0;a<t.length;a++){i=t[a];var y=this.get(i);if(y){if(p&&i!==y){var w=this._isModel(i)?i.attributes:i;e.parse&&(w=y.parse(w,e)),y.set(w,e),u.push(y),g&&!m&&(m=y.hasChanged(v))}h[y.cid]||(h[y.cid]=!0,s.push(y)),t[a]=y}else f&&(i=t[a]=this._prepareModel(i,e))&&(l.push(i),this._addReference(i,e),h[i.cid]=!0,s.push(i))}if(d){for(a=0;a<this.length;a++)h[(i=this.models[a]).cid]||c.push(i);c.length&&this._removeModels(c,e)}var x=!1,k=!g&&f&&d;if(s.length&&k?(x=this.length!==s.length||n.some(this.models,(function(t,e){return t!==s[e]})),this.models.length=0,_(this.models,s,0),this.length=this.models.length):l.length&&(g&&(m=!0),_(this.models,l,null==o?this.length:o),this.length=this.models.length),m&&this.sort({silent:!0}),!e.silent){for(a=0;a<l.length;a++)null!=o&&(e.index=o+a),(i=l[a]).trigger("add",i,this,e);(m||x)&&this.trigger("sort",this,e),(l.length||c.length||u.length)&&(e.changes={added:l,removed:c,merged:u},this.trigger("update",this,e))}return r?t[0]:t}},reset:function(t,e){e=e?n.clone(e):{};for(var r=0;r<this.models.length;r++)this._removeReference(this.models[r],e);return e.previousModels=this.models,this._reset(),t=this.add(t,n.extend({silent:!0},e)),e.silent||this.trigger("reset",this,e),t},push:function(t,e){return this.add(t,n.extend({at:this.length},e))},pop:function(t){var e=this.at(this.length-1);return this.remove(e,t)},unshift:function(t,e){return this.add(t,n.extend({at:0},e))},shift:function(t){var e=this.at(0);return this.remove(e,t)},slice:function(){return i.apply(this.models,arguments)},get:function(t){if(null!=t)return this._byId[t]||this._byId[this.modelId(this._isModel(t)?t.attributes:t,t.idAttribute)]||t.cid&&this._byId[t.cid]},has:function(t){return null!=this.get(t)},at:function(t){return t<0&&(t+=this.length),this.models[t]},where:function(t,e){return this[e?"find":"filter"](t)},findWhere:function(t){return this.where(t,!0)},sort:function(t){var e=this.comparator;if(!e)throw new Error("Cannot sort a set without a comparator");t||(t={});var r=e.length;return n.isFunction(e)&&(e=e.bind(this)),1===r||n.isString(e)?this.models=this.sortBy(e):this.models.sort(e),t.silent||this.trigger("sort",this,t),this},pluck:function(t){return this.map(t+"")},fetch:function(t){var e=(t=n.extend({parse:!0},t)).success,r=this;return t.success=function(n){var o=t.reset?"reset":"set";r[o](n,t),e&&e.call(t.context,r,n,t),r.trigger("sync",r,n,t)},K(this,t),this.sync("read",this,t)},create:function(t,e){var r=(e=e?n.clone(e):{}).wait;if(!(t=this._prepareModel(t,e)))return!1;r||this.add(t,e);var o=this,i=e.success;return e.success=function(t,e,n){r&&(t.off("error",o._forwardPristineError,o),o.add(t,n)),i&&i.call(n.context,t,e,n)},r&&t.once("error",this._forwardPristineError,this),t.save(null,e),t},parse:function(t,e){return t},clone:function(){return new this.constructor(this.models,{model:this.model,comparator:this.comparator})},modelId:function(t,e){return t[e||this.model.prototype.idAttribute||"id"]},values:function(){return new k(this,A)},keys:function(){return new k(this,O)},entries:function(){return new k(this,E)},_reset:function(){this.length=0,this.models=[],this._byId={}},_prepareModel:function(t,e){return this._isModel(t)?(t.collection||(t.collection=this),t):((e=e?n.clone(e):{}).collection=this,(r=this.model.prototype?new this.model(t,e):this.model(t,e)).validationError?(this.trigger("invalid",this,r.validationError,e),!1):r);var r},_removeModels:function(t,e){for(var n=[],r=0;r<t.length;r++){var o=this.get(t[r]);if(o){var i=this.indexOf(o);this.models.splice(i,1),this.length--,delete this._byId[o.cid];var a=this.modelId(o.attributes,o.idAttribute);null!=a&&delete this._byId[a],e.silent||(e.index=i,o.trigger("remove",o,this,e)),n.push(o),this._removeReference(o,e)}}return t.length>0&&!e.silent&&delete e.index,n},_isModel:function(t){return t instanceof v},_addReference:function(t,e){this._byId[t.cid]=t;var n=this.modelId(t.attributes,t.idAttribute);null!=n&&(this._byId[n]=t),t.on("all",this._onModelEvent,this)},_removeReference:function(t,e){delete this._byId[t.cid];var n=this.modelId(t.attributes,t.idAttribute);null!=n&&delete this._byId[n],this===t.collection&&delete t.collection,t.off("all",this._onModelEvent,this)},_onModelEvent:function(t,e,n,r){if(e){if(("add"===t||"remove"===t)&&n!==this)return;if("destroy"===t&&this.remove(e,r),"changeId"===t){var o=this.modelId(e.previousAttributes(),e.idAttribute),i=this.modelId(e.attributes,e.idAttribute);null!=o&&delete this._byId[o],null!=i&&(this._byId[i]=e)}}this.trigger.apply(this,arguments)},_forwardPristineError:function(t,e,n){this.has(t)||this._onModelEvent("error",t,e,n)}});var x="function"==typeof Symbol&&Symbol.iterator;x&&(y.prototype[x]=y.prototype.values);var k=function(t,e){this._collection=t,this._kind=e,this._index=0},A=1,O=2,E=3;x&&(k.prototype[x]=function(){return this}),k.prototype.next=function(){if(this._collection){if(this._index<this._collection.length){var t,e=this._collection.at(this._index);if(this._index++,this._kind===A)t=e;else{var n=this._collection.modelId(e.attributes,e.idAttribute);t=this._kind===O?n:[n,e]}return{value:t,done:!1}}this._collection=void 0}return{value:void 0,done:!0}};var C=e.View=function(t){this.cid=n.uniqueId("view"),this.preinitialize.apply(this,arguments),n.extend(this,n.pick(t,P)),this._ensureElement(),this.initialize.apply(this,arguments)},S=/^(\S+)\s*(.*)$/,P=["model","collection","el","id","attributes","className","tagName","events"];n.extend(C.prototype,s,{tagName:"div",$:function(t){return this.$el.find(t)},preinitialize:function(){},initialize:function(){},render:function(){return this},remove:function(){return this._removeElement(),this.stopListening(),this},_removeElement:function(){this.$el.remove()},setElement:function(t){return this.undelegateEvents(),this._setElement(t),this.delegateEvents(),this},_setElement:function(t){this.$el=t instanceof e.$?t:e.$(t),this.el=this.$el[0]},delegateEvents:function(t){if(t||(t=n.result(this,"events")),!t)return this;for(var e in this.undelegateEvents(),t){var r=t[e];if(n.isFunction(r)||(r=this[r]),r){var o=e.match(S);this.delegate(o[1],o[2],r.bind(this))}}return this},delegate:function(t,e,n){return this.$el.on(t+".delegateEvents"+this.cid,e,n),this},undelegateEvents:function(){return this.$el&&this.$el.off(".delegateEvents"+this.cid),this},undelegate:function(t,e,n){return this.$el.off(t+".delegateEvents"+this.cid,e,n),this},_createElement:function(t){return document.createElement(t)},_ensureElement:function(){if(this.el)this.setElement(n.result(this,"el"));else{var t=n.extend({},n.result(this,"attributes"));this.id&&(t.id=n.result(this,"id")),this.className&&(t.class=n.result(this,"className")),this.setElement(this._createElement(n.result(this,"tagName"))),this._setAttributes(t)}},_setAttributes:function(t){this.$el.attr(t)}});var j=function(t,e,n,r){switch(e){case 1:return function(){return t[n](this[r])};case 2:return function(e){return t[n](this[r],e)};case 3:return function(e,o){return t[n](this[r],R(e,this),o)};case 4:return function(e,o,i){return t[n](this[r],R(e,this),o,i)};default:return function(){var e=i.call(arguments);return e.unshift(this[r]),t[n].apply(t,e)}}},T=function(t,e,r,o){n.each(r,(function(n,r){e[r]&&(t.prototype[r]=j(e,n,r,o))}))},R=function(t,e){return n.isFunction(t)?t:n.isObject(t)&&!e._isModel(t)?M(t):n.isString(t)?function(e){return e.get(t)}:t},M=function(t){var e=n.matches(t);return function(t){return e(t.attributes)}},N={forEach:3,each:3,map:3,collect:3,reduce:0,foldl:0,inject:0,reduceRight:0,foldr:0,find:3,detect:3,filter:3,select:3,reject:3,every:3,all:3,some:3,any:3,include:3,includes:3,contains:3,invoke:0,max:3,min:3,toArray:1,size:1,first:3,head:3,take:3,initial:3,rest:3,tail:3,drop:3,last:3,without:0,difference:0,indexOf:3,shuffle:1,lastIndexOf:3,isEmpty:1,chain:1,sample:3,partition:3,groupBy:3,countBy:3,sortBy:3,indexBy:3,findIndex:3,findLastIndex:3},D={keys:1,values:1,pairs:1,invert:1,pick:0,omit:0,chain:1,isEmpty:1};n.each([[y,N,"models"],[v,D,"attributes"]],(function(t){var e=t[0],r=t[1],o=t[2];e.mixin=function(t){var r=n.reduce(n.functions(t),(function(t,e){return t[e]=0,t}),{});T(e,t,r,o)},T(e,n,r,o)})),e.sync=function(t,r,o){var i=B[t];n.defaults(o||(o={}),{emulateHTTP:e.emulateHTTP,emulateJSON:e.emulateJSON});var a={type:i,dataType:"json"};if(o.url||(a.url=n.result(r,"url")||G()),null!=o.data||!r||"create"!==t&&"update"!==t&&"patch"!==t||(a.contentType="application/json",a.data=JSON.stringify(o.attrs||r.toJSON(o))),o.emulateJSON&&(a.contentType="application/x-www-form-urlencoded",a.data=a.data?{model:a.data}:{}),o.emulateHTTP&&("PUT"===i||"DELETE"===i||"PATCH"===i)){a.type="POST",o.emulateJSON&&(a.data._method=i);var s=o.beforeSend;o.beforeSend=function(t){if(t.setRequestHeader("X-HTTP-Method-Override",i),s)return s.apply(this,arguments)}}"GET"===a.type||o.emulateJSON||(a.processData=!1);var l=o.error;o.error=function(t,e,n){o.textStatus=e,o.errorThrown=n,l&&l.call(o.context,t,e,n)};var u=o.xhr=e.ajax(n.extend(a,o));return r.trigger("request",r,u,o),u};var B={create:"POST",update:"PUT",patch:"PATCH",delete:"DELETE",read:"GET"};e.ajax=function(){return e.$.ajax.apply(e.$,arguments)};var V=e.Router=function(t){t||(t={}),this.preinitialize.apply(this,arguments),t.routes&&(this.routes=t.routes),this._bindRoutes(),this.initialize.apply(this,arguments)},I=/\((.*?)\)/g,L=/(\(\?)?:\w+/g,z=/\*\w+/g,$=/[\-{}\[\]+?.,\\\^$|#\s]/g;n.extend(V.prototype,s,{preinitialize:function(){},initialize:function(){},route:function(t,r,o){n.isRegExp(t)||(t=this._routeToRegExp(t)),n.isFunction(r)&&(o=r,r=""),o||(o=this[r]);var i=this;return e.history.route(t,(function(n){var a=i._extractParameters(t,n);!1!==i.execute(o,a,r)&&(i.trigger.apply(i,["route:"+r].concat(a)),i.trigger("route",r,a),e.history.trigger("route",i,r,a))})),this},execute:function(t,e,n){t&&t.apply(this,e)},navigate:function(t,n){return e.history.navigate(t,n),this},_bindRoutes:function(){if(this.routes){this.routes=n.result(this,"routes");for(var t,e=n.keys(this.routes);null!=(t=e.pop());)this.route(t,this.routes[t])}},_routeToRegExp:function(t){return t=t.replace($,"\\$&").replace(I,"(?:$1)?").replace(L,(function(t,e){return e?t:"([^/?]+)"})).replace(z,"([^?]*?)"),new RegExp("^"+t+"(?:\\?([\\s\\S]*))?$")},_extractParameters:function(t,e){var r=t.exec(e).slice(1);return n.map(r,(function(t,e){return e===r.length-1?t||null:t?decodeURIComponent(t):null}))}});var F=e.History=function(){this.handlers=[],this.checkUrl=this.checkUrl.bind(this),"undefined"!=typeof window&&(this.location=window.location,this.history=window.history)},U=/^[#\/]|\s+$/g,H=/^\/+|\/+$/g,q=/#.*$/;F.started=!1,n.extend(F.prototype,s,{interval:50,atRoot:function(){return this.location.pathname.replace(/[^\/]$/,"$&/")===this.root&&!this.getSearch()},matchRoot:function(){return this.decodeFragment(this.location.pathname).slice(0,this.root.length-1)+"/"===this.root},decodeFragment:function(t){return decodeURI(t.replace(/%25/g,"%2525"))},getSearch:function(){var t=this.location.href.replace(/#.*/,"").match(/\?.+/);return t?t[0]:""},getHash:function(t){var e=(t||this).location.href.match(/#(.*)$/);return e?e[1]:""},getPath:function(){var t=this.decodeFragment(this.location.pathname+this.getSearch()).slice(this.root.length-1);return"/"===t.charAt(0)?t.slice(1):t},getFragment:function(t){return null==t&&(t=this._usePushState||!this._wantsHashChange?this.getPath():this.getHash()),t.replace(U,"")},start:function(t){if(F.started)throw new Error("Backbone.history has already been started");if(F.started=!0,this.options=n.extend({root:"/"},this.options,t),this.root=this.options.root,this._trailingSlash=this.options.trailingSlash,this._wantsHashChange=!1!==this.options.hashChange,this._hasHashChange="onhashchange"in window&&(void 0===document.documentMode||document.documentMode>7),this._useHashChange=this._wantsHashChange&&this._hasHashChange,this._wantsPushState=!!this.options.pushState,this._hasPushState=!(!this.history||!this.history.pushState),this._usePushState=this._wantsPushState&&this._hasPushState,this.fragment=this.getFragment(),this.root=("/"+this.root+"/").replace(H,"/"),this._wantsHashChange&&this._wantsPushState){if(!this._hasPushState&&!this.atRoot()){var e=this.root.slice(0,-1)||"/";return this.location.replace(e+"#"+this.getPath()),!0}this._hasPushState&&this.atRoot()&&this.navigate(this.getHash(),{replace:!0})}if(!this._hasHashChange&&this._wantsHashChange&&!this._usePushState){this.iframe=document.createElement("iframe"),this.iframe.src="javascript:0",this.iframe.style.display="none",this.iframe.tabIndex=-1;var r=document.body,o=r.insertBefore(this.iframe,r.firstChild).contentWindow;o.document.open(),o.document.close(),o.location.hash="#"+this.fragment}var i=window.addEventListener||function(t,e){return attachEvent("on"+t,e)};if(this._usePushState?i("popstate",this.checkUrl,!1):this._useHashChange&&!this.iframe?i("hashchange",this.checkUrl,!1):this._wantsHashChange&&(this._checkUrlInterval=setInterval(this.checkUrl,this.interval)),!this.options.silent)return this.loadUrl()},stop:function(){var t=window.removeEventListener||function(t,e){return detachEvent("on"+t,e)};this._usePushState?t("popstate",this.checkUrl,!1):this._useHashChange&&!this.iframe&&t("hashchange",this.checkUrl,!1),this.iframe&&(document.body.removeChild(this.iframe),this.iframe=null),this._checkUrlInterval&&clearInterval(this._checkUrlInterval),F.started=!1},route:function(t,e){this.handlers.unshift({route:t,callback:e})},checkUrl:function(t){var e=this.getFragment();if(e===this.fragment&&this.iframe&&(e=this.getHash(this.iframe.contentWindow)),e===this.fragment)return!this.matchRoot()&&this.notfound();this.iframe&&this.navigate(e),this.loadUrl()},loadUrl:function(t){return this.matchRoot()?(t=this.fragment=this.getFragment(t),n.some(this.handlers,(function(e){if(e.route.test(t))return e.callback(t),!0}))||this.notfound()):this.notfound()},notfound:function(){return this.trigger("notfound"),!1},navigate:function(t,e){if(!F.started)return!1;e&&!0!==e||(e={trigger:!!e}),t=this.getFragment(t||"");var n=this.root;this._trailingSlash||""!==t&&"?"!==t.charAt(0)||(n=n.slice(0,-1)||"/");var r=n+t;t=t.replace(q,"");var o=this.decodeFragment(t);if(this.fragment!==o){if(this.fragment=o,this._usePushState)this.history[e.replace?"replaceState":"pushState"]({},document.title,r);else{if(!this._wantsHashChange)return this.location.assign(r);if(this._updateHash(this.location,t,e.replace),this.iframe&&t!==this.getHash(this.iframe.contentWindow)){var i=this.iframe.contentWindow;e.replace||(i.document.open(),i.document.close()),this._updateHash(i.location,t,e.replace)}}return e.trigger?this.loadUrl(t):void 0}},_updateHash:function(t,e,n){if(n){var r=t.href.replace(/(javascript:|#).*$/,"");t.replace(r+"#"+e)}else t.hash="#"+e}}),e.history=new F;var W=function(t,e){var r,o=this;return r=t&&n.has(t,"constructor")?t.constructor:function(){return o.apply(this,arguments)},n.extend(r,o,e),r.prototype=n.create(o.prototype,t),r.prototype.constructor=r,r.__super__=o.prototype,r};v.extend=y.extend=V.extend=C.extend=F.extend=W;var G=function(){throw new Error('A "url" property or function must be specified')},K=function(t,e){var n=e.error;e.error=function(r){n&&n.call(e.context,t,r,e),t.trigger("error",t,r,e)}};return e._debug=function(){return{root:t,_:n}},e}(i,n,t,e)}.apply(e,r),void 0===o||(t.exports=o)},8075:function(t,e,n){"use strict";var r=n(453),o=n(487),i=o(r("String.prototype.indexOf"));t.exports=function(t,e){var n=r(t,!!e);return"function"==typeof n&&i(t,".prototype.")>-1?o(n):n}},487:function(t,e,n){"use strict";var r=n(6743),o=n(453),i=n(6897),a=n(9675),s=o("%Function.prototype.apply%"),l=o("%Function.prototype.call%"),u=o("%Reflect.apply%",!0)||r.call(l,s),c=n(655),h=o("%Math.max%");t.exports=function(t){if("function"!=typeof t)throw new a("a function is required");var e=u(r,l,arguments);return i(e,1+h(0,t.length-(arguments.length-1)),!0)};var f=function(){return u(r,s,arguments)};c?c(t.exports,"apply",{value:f}):t.exports.apply=f},41:function(t,e,n){"use strict";var r=n(655),o=n(8068),i=n(9675),a=n(5795);t.exports=function(t,e,n){if(!t||"object"!=typeof t&&"function"!=typeof t)throw new i("`obj` must be an object or a function`");if("string"!=typeof e&&"symbol"!=typeof e)throw new i("`property` must be a string or a symbol`");if(arguments.length>3&&"boolean"!=typeof arguments[3]&&null!==arguments[3])throw new i("`nonEnumerable`, if provided, must be a boolean or null");if(arguments.length>4&&"boolean"!=typeof arguments[4]&&null!==arguments[4])throw new i("`nonWritable`, if provided, must be a boolean or null");if(arguments.length>5&&"boolean"!=typeof arguments[5]&&null!==arguments[5])throw new i("`nonConfigurable`, if provided, must be a boolean or null");if(arguments.length>6&&"boolean"!=typeof arguments[6])throw new i("`loose`, if provided, must be a boolean");var s=arguments.length>3?arguments[3]:null,l=arguments.length>4?arguments[4]:null,u=arguments.length>5?arguments[5]:null,c=arguments.length>6&&arguments[6],h=!!a&&a(t,e);if(r)r(t,e,{configurable:null===u&&h?h.configurable:!u,enumerable:null===s&&h?h.enumerable:!s,value:n,writable:null===l&&h?h.writable:!l});else{if(!c&&(s||l||u))throw new o("This environment does not support defining a property as non-configurable, non-writable, or non-enumerable.");t[e]=n}}},655:function(t,e,n){"use strict";var r=n(453)("%Object.defineProperty%",!0)||!1;if(r)try{r({},"a",{value:1})}catch(t){r=!1}t.exports=r},1237:function(t){"use strict";t.exports=EvalError},9383:function(t){"use strict";t.exports=Error},9290:function(t){"use strict";t.exports=RangeError},9538:function(t){"use strict";t.exports=ReferenceError},8068:function(t){"use strict";t.exports=SyntaxError},9675:function(t){"use strict";t.exports=TypeError},5345:function(t){"use strict";t.exports=URIError},9353:function(t){"use strict";var e=Object.prototype.toString,n=Math.max,r=function(t,e){for(var n=[],r=0;r<t.length;r+=1)n[r]=t[r];for(var o=0;o<e.length;o+=1)n[o+t.length]=e[o];return n};t.exports=function(t){var o=this;if("function"!=typeof o||"[object Function]"!==e.apply(o))throw new TypeError("Function.prototype.bind called on incompatible "+o);for(var i,a=function(t,e){for(var n=[],r=e||0,o=0;r<t.length;r+=1,o+=1)n[o]=t[r];return n}(arguments,1),s=n(0,o.length-a.length),l=[],u=0;u<s;u++)l[u]="$"+u;if(i=Function("binder","return function ("+function(t,e){for(var n="",r=0;r<t.length;r+=1)n+=t[r],r+1<t.length&&(n+=e);return n}(l,",")+"){ return binder.apply(this,arguments); }")((function(){if(this instanceof i){var e=o.apply(this,r(a,arguments));return Object(e)===e?e:this}return o.apply(t,r(a,arguments))})),o.prototype){var c=function(){};c.prototype=o.prototype,i.prototype=new c,c.prototype=null}return i}},6743:function(t,e,n){"use strict";var r=n(9353);t.exports=Function.prototype.bind||r},453:function(t,e,n){"use strict";var r,o=n(9383),i=n(1237),a=n(9290),s=n(9538),l=n(8068),u=n(9675),c=n(5345),h=Function,f=function(t){try{return h('"use strict"; return ('+t+").constructor;")()}catch(t){}},p=Object.getOwnPropertyDescriptor;if(p)try{p({},"")}catch(t){p=null}var d=function(){throw new u},m=p?function(){try{return d}catch(t){try{return p(arguments,"callee").get}catch(t){return d}}}():d,g=n(4039)(),v=n(24)(),y=Object.getPrototypeOf||(v?function(t){return t.__proto__}:null),b={},w="undefined"!=typeof Uint8Array&&y?y(Uint8Array):r,_={__proto__:null,"%AggregateError%":"undefined"==typeof AggregateError?r:AggregateError,"%Array%":Array,"%ArrayBuffer%":"undefined"==typeof ArrayBuffer?r:ArrayBuffer,"%ArrayIteratorPrototype%":g&&y?y([][Symbol.iterator]()):r,"%AsyncFromSyncIteratorPrototype%":r,"%AsyncFunction%":b,"%AsyncGenerator%":b,"%AsyncGeneratorFunction%":b,"%AsyncIteratorPrototype%":b,"%Atomics%":"undefined"==typeof Atomics?r:Atomics,"%BigInt%":"undefined"==typeof BigInt?r:BigInt,"%BigInt64Array%":"undefined"==typeof BigInt64Array?r:BigInt64Array,"%BigUint64Array%":"undefined"==typeof BigUint64Array?r:BigUint64Array,"%Boolean%":Boolean,"%DataView%":"undefined"==typeof DataView?r:DataView,"%Date%":Date,"%decodeURI%":decodeURI,"%decodeURIComponent%":decodeURIComponent,"%encodeURI%":encodeURI,"%encodeURIComponent%":encodeURIComponent,"%Error%":o,"%eval%":eval,"%EvalError%":i,"%Float32Array%":"undefined"==typeof Float32Array?r:Float32Array,"%Float64Array%":"undefined"==typeof Float64Array?r:Float64Array,"%FinalizationRegistry%":"undefined"==typeof FinalizationRegistry?r:FinalizationRegistry,"%Function%":h,"%GeneratorFunction%":b,"%Int8Array%":"undefined"==typeof Int8Array?r:Int8Array,"%Int16Array%":"undefined"==typeof Int16Array?r:Int16Array,"%Int32Array%":"undefined"==typeof Int32Array?r:Int32Array,"%isFinite%":isFinite,"%isNaN%":isNaN,"%IteratorPrototype%":g&&y?y(y([][Symbol.iterator]())):r,"%JSON%":"object"==typeof JSON?JSON:r,"%Map%":"undefined"==typeof Map?r:Map,"%MapIteratorPrototype%":"undefined"!=typeof Map&&g&&y?y((new Map)[Symbol.iterator]()):r,"%Math%":Math,"%Number%":Number,"%Object%":Object,"%parseFloat%":parseFloat,"%parseInt%":parseInt,"%Promise%":"undefined"==typeof Promise?r:Promise,"%Proxy%":"undefined"==typeof Proxy?r:Proxy,"%RangeError%":a,"%ReferenceError%":s,"%Reflect%":"undefined"==typeof Reflect?r:Reflect,"%RegExp%":RegExp,"%Set%":"undefined"==typeof Set?r:Set,"%SetIteratorPrototype%":"undefined"!=typeof Set&&g&&y?y((new Set)[Symbol.iterator]()):r,"%SharedArrayBuffer%":"undefined"==typeof SharedArrayBuffer?r:SharedArrayBuffer,"%String%":String,"%StringIteratorPrototype%":g&&y?y(""[Symbol.iterator]()):r,"%Symbol%":g?Symbol:r,"%SyntaxError%":l,"%ThrowTypeError%":m,"%TypedArray%":w,"%TypeError%":u,"%Uint8Array%":"undefined"==typeof Uint8Array?r:Uint8Array,"%Uint8ClampedArray%":"undefined"==typeof Uint8ClampedArray?r:Uint8ClampedArray,"%Uint16Array%":"undefined"==typeof Uint16Array?r:Uint16Array,"%Uint32Array%":"undefined"==typeof Uint32Array?r:Uint32Array,"%URIError%":c,"%WeakMap%":"undefined"==typeof WeakMap?r:WeakMap,"%WeakRef%":"undefined"==typeof WeakRef?r:WeakRef,"%WeakSet%":"undefined"==typeof WeakSet?r:WeakSet};if(y)try{null.error}catch(t){var x=y(y(t));_["%Error.prototype%"]=x}var k=function t(e){var n;if("%AsyncFunction%"===e)n=f("async function () {}");else if("%GeneratorFunction%"===e)n=f("function* () {}");else if("%AsyncGeneratorFunction%"===e)n=f("async function* () {}");else if("%AsyncGenerator%"===e){var r=t("%AsyncGeneratorFunction%");r&&(n=r.prototype)}else if("%AsyncIteratorPrototype%"===e){var o=t("%AsyncGenerator%");o&&y&&(n=y(o.prototype))}return _[e]=n,n},A={__proto__:null,"%ArrayBufferPrototype%":["ArrayBuffer","prototype"],"%ArrayPrototype%":["Array","prototype"],"%ArrayProto_entries%":["Array","prototype","entries"],"%ArrayProto_forEach%":["Array","prototype","forEach"],"%ArrayProto_keys%":["Array","prototype","keys"],"%ArrayProto_values%":["Array","prototype","values"],"%AsyncFunctionPrototype%":["AsyncFunction","prototype"],"%AsyncGenerator%":["AsyncGeneratorFunction","prototype"],"%AsyncGeneratorPrototype%":["AsyncGeneratorFunction","prototype","prototype"],"%BooleanPrototype%":["Boolean","prototype"],"%DataViewPrototype%":["DataView","prototype"],"%DatePrototype%":["Date","prototype"],"%ErrorPrototype%":["Error","prototype"],"%EvalErrorPrototype%":["EvalError","prototype"],"%Float32ArrayPrototype%":["Float32Array","prototype"],"%Float64ArrayPrototype%":["Float64Array","prototype"],"%FunctionPrototype%":["Function","prototype"],"%Generator%":["GeneratorFunction","prototype"],"%GeneratorPrototype%":["GeneratorFunction","prototype","prototype"],"%Int8ArrayPrototype%":["Int8Array","prototype"],"%Int16ArrayPrototype%":["Int16Array","prototype"],"%Int32ArrayPrototype%":["Int32Array","prototype"],"%JSONParse%":["JSON","parse"],"%JSONStringify%":["JSON","stringify"],"%MapPrototype%":["Map","prototype"],"%NumberPrototype%":["Number","prototype"],"%ObjectPrototype%":["Object","prototype"],"%ObjProto_toString%":["Object","prototype","toString"],"%ObjProto_valueOf%":["Object","prototype","valueOf"],"%PromisePrototype%":["Promise","prototype"],"%PromiseProto_then%":["Promise","prototype","then"],"%Promise_all%":["Promise","all"],"%Promise_reject%":["Promise","reject"],"%Promise_resolve%":["Promise","resolve"],"%RangeErrorPrototype%":["RangeError","prototype"],"%ReferenceErrorPrototype%":["ReferenceError","prototype"],"%RegExpPrototype%":["RegExp","prototype"],"%SetPrototype%":["Set","prototype"],"%SharedArrayBufferPrototype%":["SharedArrayBuffer","prototype"],"%StringPrototype%":["String","prototype"],"%SymbolPrototype%":["Symbol","prototype"],"%SyntaxErrorPrototype%":["SyntaxError","prototype"],"%TypedArrayPrototype%":["TypedArray","prototype"],"%TypeErrorPrototype%":["TypeError","prototype"],"%Uint8ArrayPrototype%":["Uint8Array","prototype"],"%Uint8ClampedArrayPrototype%":["Uint8ClampedArray","prototype"],"%Uint16ArrayPrototype%":["Uint16Array","prototype"],"%Uint32ArrayPrototype%":["Uint32Array","prototype"],"%URIErrorPrototype%":["URIError","prototype"],"%WeakMapPrototype%":["WeakMap","prototype"],"%WeakSetPrototype%":["WeakSet","prototype"]},O=n(6743),E=n(9957),C=O.call(Function.call,Array.prototype.concat),S=O.call(Function.apply,Array.prototype.splice),P=O.call(Function.call,String.prototype.replace),j=O.call(Function.call,String.prototype.slice),T=O.call(Function.call,RegExp.prototype.exec),R=/[^%.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|%$))/g,M=/\\(\\)?/g,N=function(t,e){var n,r=t;if(E(A,r)&&(r="%"+(n=A[r])[0]+"%"),E(_,r)){var o=_[r];if(o===b&&(o=k(r)),void 0===o&&!e)throw new u("intrinsic "+t+" exists, but is not available. Please file an issue!");return{alias:n,name:r,value:o}}throw new l("intrinsic "+t+" does not exist!")};t.exports=function(t,e){if("string"!=typeof t||0===t.length)throw new u("intrinsic name must be a non-empty string");if(arguments.length>1&&"boolean"!=typeof e)throw new u('"allowMissing" argument must be a boolean');if(null===T(/^%?[^%]*%?$/,t))throw new l("`%` may not be present anywhere but at the beginning and end of the intrinsic name");var n=function(t){var e=j(t,0,1),n=j(t,-1);if("%"===e&&"%"!==n)throw new l("invalid intrinsic syntax, expected closing `%`");if("%"===n&&"%"!==e)throw new l("invalid intrinsic syntax, expected opening `%`");var r=[];return P(t,R,(function(t,e,n,o){r[r.length]=n?P(o,M,"$1"):e||t})),r}(t),r=n.length>0?n[0]:"",o=N("%"+r+"%",e),i=o.name,a=o.value,s=!1,c=o.alias;c&&(r=c[0],S(n,C([0,1],c)));for(var h=1,f=!0;h<n.length;h+=1){var d=n[h],m=j(d,0,1),g=j(d,-1);if(('"'===m||"'"===m||"`"===m||'"'===g||"'"===g||"`"===g)&&m!==g)throw new l("property names with quotes must have matching quotes");if("constructor"!==d&&f||(s=!0),E(_,i="%"+(r+="."+d)+"%"))a=_[i];else if(null!=a){if(!(d in a)){if(!e)throw new u("base intrinsic for "+t+" exists, but the property is not available.");return}if(p&&h+1>=n.length){var v=p(a,d);a=(f=!!v)&&"get"in v&&!("originalValue"in v.get)?v.get:a[d]}else f=E(a,d),a=a[d];f&&!s&&(_[i]=a)}}return a}},5795:function(t,e,n){"use strict";var r=n(453)("%Object.getOwnPropertyDescriptor%",!0);if(r)try{r([],"length")}catch(t){r=null}t.exports=r},2417:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"                "+t.escapeExpression(t.lambda(null!=e?i(e,"name"):e,e))+"\n"},3:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"                "+t.escapeExpression(t.lambda(null!=e?i(e,"source"):e,e))+"\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=t.lambda,u=t.escapeExpression,c=null!=e?e:t.nullContext||{},h=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div>\n    <div class="attachment-row" data-uid="'+u(l(null!=e?h(e,"uid"):e,e))+'">\n        <span class="attachment-row__arrow block__arrow">'+u(o(n(4354)).call(c,{name:"angle",hash:{},data:a,loc:{start:{line:3,column:57},end:{line:3,column:66}}}))+'</span>\n        <div class="attachment-row__icon">\n            <span class="'+u(o(n(3198)).call(c,null!=e?h(e,"type"):e,{name:"fileicon",hash:{},data:a,loc:{start:{line:5,column:25},end:{line:5,column:42}}}))+'" data-tooltip="'+u(l(null!=e?h(e,"type"):e,e))+'"></span>\n        </div>\n        <div class="attachment-row__name long-line">\n'+(null!=(s=h(r,"if").call(c,null!=e?h(e,"name"):e,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.program(3,a,0),data:a,loc:{start:{line:8,column:12},end:{line:12,column:19}}}))?s:"")+'        </div>\n        <div class="attachment-row__control attachment-row__link">\n            <div class="link"\n                  data-download="data/attachments/'+u(l(null!=e?h(e,"source"):e,e))+'"\n                  data-download-target="_blank"\n                  data-download-type="'+u(l(null!=e?h(e,"type"):e,e))+'"\n                  data-tooltip="Open attachment in new tab">\n                <span class="fa fa-save"></span> '+u(o(n(9735)).call(c,null!=e?h(e,"size"):e,{name:"filesize",hash:{},data:a,loc:{start:{line:20,column:49},end:{line:20,column:66}}}))+'\n            </div>\n        </div>\n        <div class="attachment-row__control attachment-row__fullscreen">\n            <a class="link">\n                <span class="fa fa-arrows-alt"></span>\n            </a>\n        </div>\n    </div>\n    <div class="attachment-row__preview">\n        <div class="attachment-row__content '+u(o(n(3735)).call(c,"attachment",null!=e?h(e,"uid"):e,{name:"b",hash:{},data:a,loc:{start:{line:30,column:44},end:{line:30,column:67}}}))+'"></div>\n    </div>\n</div>\n'},useData:!0})},1253:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<span class="fa fa-files-o fullname__copy"\n      data-copy="'+t.escapeExpression("function"==typeof(i=null!=(i=a(n,"value")||(null!=e?a(e,"value"):e))?i:t.hooks.helperMissing)?i.call(null!=e?e:t.nullContext||{},{name:"value",hash:{},data:o,loc:{start:{line:2,column:17},end:{line:2,column:26}}}):i)+'"\n      data-ga4-event="clipboard_copy_click"></span>\n'},useData:!0})},1155:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="parameters-table">\n'+(null!=(i=a(n,"each").call(null!=e?e:t.nullContext||{},null!=e?a(e,"parameters"):e,{name:"each",hash:{},fn:t.program(2,o,0),inverse:t.noop,data:o,loc:{start:{line:3,column:8},end:{line:8,column:17}}}))?i:"")+"    </div>\n"},2:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lambda,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <div class="'+l(o(n(3735)).call(s,"parameters-table","row",{name:"b",hash:{},data:a,loc:{start:{line:4,column:24},end:{line:4,column:54}}}))+'">\n                <div class="'+l(o(n(3735)).call(s,"parameters-table","cell",{name:"b",hash:{name:!0},data:a,loc:{start:{line:5,column:28},end:{line:5,column:69}}}))+' line-ellipsis">'+l(u(null!=e?c(e,"name"):e,e))+'</div>\n                <div class="'+l(o(n(3735)).call(s,"parameters-table","cell",{name:"b",hash:{value:!0},data:a,loc:{start:{line:6,column:28},end:{line:6,column:70}}}))+' line-ellipsis">'+l(u(null!=e?c(e,"value"):e,e))+"</div>\n            </div>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"if").call(null!=e?e:t.nullContext||{},null!=e?a(e,"parameters"):e,{name:"if",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:10,column:7}}}))?i:""},useData:!0})},811:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <div class="'+u(o(n(3735)).call(l,"status-details","trace-toggle",{name:"b",hash:{status:null!=e?c(e,"status"):e},data:a,loc:{start:{line:4,column:24},end:{line:4,column:75}}}))+' clickable"\n                 data-tooltip="'+u(o(n(9237)).call(l,"testResult.status.trace",{name:"t",hash:{},data:a,loc:{start:{line:5,column:31},end:{line:5,column:62}}}))+'"\n                 data-ga4-event="stacktrace_expand_click">\n                <pre class="status-details__message"><code>'+(null!=(s=c(r,"if").call(l,null!=e?c(e,"statusMessage"):e,{name:"if",hash:{},fn:t.program(2,a,0),inverse:t.program(4,a,0),data:a,loc:{start:{line:7,column:59},end:{line:7,column:143}}}))?s:"")+'</code></pre>\n            </div>\n\n            <pre class="'+u(o(n(3735)).call(l,"status-details","trace",{name:"b",hash:{},data:a,loc:{start:{line:10,column:24},end:{line:10,column:54}}}))+'"><code>'+(null!=(s=c(r,"if").call(l,null!=e?c(e,"statusTrace"):e,{name:"if",hash:{},fn:t.program(6,a,0),inverse:t.program(4,a,0),data:a,loc:{start:{line:10,column:62},end:{line:10,column:142}}}))?s:"")+"</code></pre>\n"},2:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return t.escapeExpression(t.lambda(null!=e?i(e,"statusMessage"):e,e))},4:function(t,e,r,i,a){return t.escapeExpression(o(n(9237)).call(null!=e?e:t.nullContext||{},"testResult.status.empty",{name:"t",hash:{},data:a,loc:{start:{line:7,column:105},end:{line:7,column:136}}}))},6:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return t.escapeExpression(t.lambda(null!=e?i(e,"statusTrace"):e,e))},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+t.escapeExpression(o(n(3735)).call(l,"status-details",{name:"b",hash:{status:null!=e?u(e,"status"):e},data:a,loc:{start:{line:1,column:12},end:{line:1,column:48}}}))+'">\n    <div class="status-details__content">\n'+(null!=(s=u(r,"if").call(l,o(n(180)).call(l,null!=e?u(e,"statusMessage"):e,null!=e?u(e,"statusTrace"):e,{name:"or",hash:{},data:a,loc:{start:{line:3,column:14},end:{line:3,column:44}}}),{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.noop,data:a,loc:{start:{line:3,column:8},end:{line:11,column:15}}}))?s:"")+"    </div>\n</div>\n"},useData:!0})},9313:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return t.escapeExpression(o(n(9237)).call(null!=e?e:t.nullContext||{},"testResult.stats.count.parameters",{name:"t",hash:{count:null!=(s=null!=e?l(e,"parameters"):e)?l(s,"length"):s},data:a,loc:{start:{line:4,column:12},end:{line:4,column:79}}}))+'<span class="step-stats__info_separator">,&nbsp;</span>'},3:function(t,e,r,i,a){var s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return t.escapeExpression(o(n(9237)).call(null!=e?e:t.nullContext||{},"testResult.stats.count.steps",{name:"t",hash:{count:null!=e?s(e,"stepsCount"):e},data:a,loc:{start:{line:8,column:12},end:{line:8,column:67}}}))+'<span class="step-stats__info_separator">,&nbsp;</span>'},5:function(t,e,r,i,a){var s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return t.escapeExpression(o(n(9237)).call(null!=e?e:t.nullContext||{},"testResult.stats.count.attachments",{name:"t",hash:{count:null!=e?s(e,"attachmentsCount"):e},data:a,loc:{start:{line:12,column:12},end:{line:12,column:79}}}))+'<span class="step-stats__info_separator">,&nbsp;</span>'},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<span class="step-stats__info">\n    <span>'+(null!=(s=c(r,"if").call(l,null!=(s=null!=e?c(e,"parameters"):e)?c(s,"length"):s,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.noop,data:a,loc:{start:{line:3,column:9},end:{line:6,column:18}}}))?s:"")+(null!=(s=c(r,"if").call(l,null!=e?c(e,"stepsCount"):e,{name:"if",hash:{},fn:t.program(3,a,0),inverse:t.noop,data:a,loc:{start:{line:7,column:9},end:{line:10,column:17}}}))?s:"")+(null!=(s=c(r,"if").call(l,null!=e?c(e,"attachmentsCount"):e,{name:"if",hash:{},fn:t.program(5,a,0),inverse:t.noop,data:a,loc:{start:{line:11,column:8},end:{line:14,column:17}}}))?s:"")+'</span>\n    <span class="step-stats__info_time" data-tooltip="'+u(o(n(9241)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"start"):s,{name:"date",hash:{},data:a,loc:{start:{line:16,column:54},end:{line:16,column:73}}}))+" "+u(o(n(4336)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"start"):s,!0,{name:"time",hash:{},data:a,loc:{start:{line:16,column:74},end:{line:16,column:98}}}))+"&nbsp;&ndash;&nbsp;"+u(o(n(4336)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"stop"):s,!0,{name:"time",hash:{},data:a,loc:{start:{line:16,column:117},end:{line:16,column:140}}}))+'">'+u(o(n(5969)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"duration"):s,{name:"duration",hash:{},data:a,loc:{start:{line:16,column:142},end:{line:16,column:168}}}))+"</span>\n</span>\n"},useData:!0})},973:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lambda,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <li class="'+l(o(n(3735)).call(s,"tab",{name:"b",hash:{active:null!=e?c(e,"active"):e},data:a,loc:{start:{line:3,column:19},end:{line:3,column:44}}}))+'"><a class="link link__no-decoration" href="'+l(u(null!=e?c(e,"href"):e,e))+'" data-ga4-event="tab_change_click" data-ga4-param-tab="'+l(u(null!=e?c(e,"name"):e,e))+'">'+l(o(n(9237)).call(s,null!=e?c(e,"name"):e,{name:"t",hash:{},data:a,loc:{start:{line:3,column:162},end:{line:3,column:172}}}))+"</a></li>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<ul class="tabs">\n'+(null!=(i=a(n,"each").call(null!=e?e:t.nullContext||{},null!=e?a(e,"links"):e,{name:"each",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:2,column:4},end:{line:4,column:13}}}))?i:"")+"</ul>\n"},useData:!0})},3938:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,n,r,o){return'    <div class="attachment__custom-view"></div>\n'},3:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(7243)).call(l,null!=e?u(e,"type"):e,"code",{name:"eq",hash:{},data:a,loc:{start:{line:3,column:10},end:{line:3,column:26}}}),{name:"if",hash:{},fn:t.program(4,a,0),inverse:t.program(6,a,0),data:a,loc:{start:{line:3,column:0},end:{line:58,column:0}}}))?s:""},4:function(t,e,r,i,a){var s=t.escapeExpression,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="'+s(o(n(3735)).call(null!=e?e:t.nullContext||{},"attachment__text-container",{name:"b",hash:{fullscreen:null!=e?l(e,"fullScreen"):e},data:a,loc:{start:{line:4,column:16},end:{line:4,column:72}}}))+'">\n        <pre class="attachment__code">'+s(t.lambda(null!=e?l(e,"content"):e,e))+"</pre>\n    </div>\n"},6:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(7243)).call(l,null!=e?u(e,"type"):e,"text",{name:"eq",hash:{},data:a,loc:{start:{line:7,column:10},end:{line:7,column:26}}}),{name:"if",hash:{},fn:t.program(7,a,0),inverse:t.program(9,a,0),data:a,loc:{start:{line:7,column:0},end:{line:58,column:0}}}))?s:""},7:function(t,e,r,i,a){var s=t.escapeExpression,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="'+s(o(n(3735)).call(null!=e?e:t.nullContext||{},"attachment__text-container",{name:"b",hash:{fullscreen:null!=e?l(e,"fullScreen"):e},data:a,loc:{start:{line:8,column:16},end:{line:8,column:72}}}))+'">\n        <pre class="attachment__text">'+s(t.lambda(null!=e?l(e,"content"):e,e))+"</pre>\n    </div>\n"},9:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(7243)).call(l,null!=e?u(e,"type"):e,"table",{name:"eq",hash:{},data:a,loc:{start:{line:11,column:10},end:{line:11,column:27}}}),{name:"if",hash:{},fn:t.program(10,a,0),inverse:t.program(14,a,0),data:a,loc:{start:{line:11,column:0},end:{line:58,column:0}}}))?s:""},10:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="'+t.escapeExpression(o(n(3735)).call(l,"attachment__table-container",{name:"b",hash:{fullscreen:null!=e?u(e,"fullScreen"):e},data:a,loc:{start:{line:12,column:16},end:{line:12,column:73}}}))+'">\n        <table class="table attachment__table">\n            <tbody>\n'+(null!=(s=u(r,"each").call(l,null!=e?u(e,"content"):e,{name:"each",hash:{},fn:t.program(11,a,0),inverse:t.noop,data:a,loc:{start:{line:15,column:12},end:{line:21,column:21}}}))?s:"")+"            </tbody>\n        </table>\n    </div>\n"},11:function(t,e,n,r,o){var i;return"                <tr>\n"+(null!=(i=(t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]})(n,"each").call(null!=e?e:t.nullContext||{},e,{name:"each",hash:{},fn:t.program(12,o,0),inverse:t.noop,data:o,loc:{start:{line:17,column:20},end:{line:19,column:29}}}))?i:"")+"                </tr>\n"},12:function(t,e,n,r,o){return"                        <td>"+t.escapeExpression(t.lambda(e,e))+"</td>\n"},14:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(7243)).call(l,null!=e?u(e,"type"):e,"image",{name:"eq",hash:{},data:a,loc:{start:{line:25,column:10},end:{line:25,column:27}}}),{name:"if",hash:{},fn:t.program(15,a,0),inverse:t.program(17,a,0),data:a,loc:{start:{line:25,column:0},end:{line:58,column:0}}}))?s:""},15:function(t,e,r,i,a){var s=t.escapeExpression,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="'+s(o(n(3735)).call(null!=e?e:t.nullContext||{},"attachment__media-container",{name:"b",hash:{fullscreen:null!=e?l(e,"fullScreen"):e},data:a,loc:{start:{line:26,column:16},end:{line:26,column:73}}}))+'"><img class="attachment__media" src="'+s(t.lambda(null!=e?l(e,"sourceUrl"):e,e))+'"/>\n    </div>\n'},17:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(7243)).call(l,null!=e?u(e,"type"):e,"svg",{name:"eq",hash:{},data:a,loc:{start:{line:28,column:10},end:{line:28,column:25}}}),{name:"if",hash:{},fn:t.program(18,a,0),inverse:t.program(20,a,0),data:a,loc:{start:{line:28,column:0},end:{line:58,column:0}}}))?s:""},18:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <object class="attachment__embed" type="image/svg+xml" data="'+t.escapeExpression(t.lambda(null!=e?i(e,"sourceUrl"):e,e))+'">\n        Your browser does not support SVG\n    </object>\n'},20:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(7243)).call(l,null!=e?u(e,"type"):e,"video",{name:"eq",hash:{},data:a,loc:{start:{line:32,column:10},end:{line:32,column:27}}}),{name:"if",hash:{},fn:t.program(21,a,0),inverse:t.program(23,a,0),data:a,loc:{start:{line:32,column:0},end:{line:58,column:0}}}))?s:""},21:function(t,e,n,r,o){var i,a=t.lambda,s=t.escapeExpression,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="attachment__media-container">\n        <video class="attachment__media" controls>\n            <source src="'+s(a(null!=e?l(e,"sourceUrl"):e,e))+'" type="'+s(a(null!=(i=null!=e?l(e,"attachment"):e)?l(i,"type"):i,e))+'">\n            Your browser does not support video tag\n        </video>\n    </div>\n'},23:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(7243)).call(l,null!=e?u(e,"type"):e,"uri",{name:"eq",hash:{},data:a,loc:{start:{line:39,column:10},end:{line:39,column:25}}}),{name:"if",hash:{},fn:t.program(24,a,0),inverse:t.program(30,a,0),data:a,loc:{start:{line:39,column:0},end:{line:58,column:0}}}))?s:""},24:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="'+t.escapeExpression(o(n(3735)).call(l,"attachment__text-container",{name:"b",hash:{fullscreen:null!=e?u(e,"fullScreen"):e},data:a,loc:{start:{line:40,column:16},end:{line:40,column:72}}}))+'">\n'+(null!=(s=u(r,"each").call(l,null!=e?u(e,"content"):e,{name:"each",hash:{},fn:t.program(25,a,0),inverse:t.noop,data:a,loc:{start:{line:41,column:8},end:{line:49,column:17}}}))?s:"")+"    </div>\n"},25:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <p class="'+t.escapeExpression(o(n(3735)).call(l,"attachment","url",{name:"b",hash:{comment:null!=e?u(e,"comment"):e},data:a,loc:{start:{line:42,column:22},end:{line:42,column:62}}}))+'">\n'+(null!=(s=u(r,"if").call(l,null!=e?u(e,"comment"):e,{name:"if",hash:{},fn:t.program(26,a,0),inverse:t.program(28,a,0),data:a,loc:{start:{line:43,column:16},end:{line:47,column:23}}}))?s:"")+"            </p>\n"},26:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"                    "+t.escapeExpression(t.lambda(null!=e?i(e,"text"):e,e))+"\n"},28:function(t,e,n,r,o){var i=t.lambda,a=t.escapeExpression,s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'                    <a href="'+a(i(null!=e?s(e,"text"):e,e))+'" target="_blank" class="link">'+a(i(null!=e?s(e,"text"):e,e))+"</a>\n"},30:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(7243)).call(l,null!=e?u(e,"type"):e,"html",{name:"eq",hash:{},data:a,loc:{start:{line:51,column:10},end:{line:51,column:26}}}),{name:"if",hash:{},fn:t.program(31,a,0),inverse:t.program(33,a,0),data:a,loc:{start:{line:51,column:0},end:{line:58,column:0}}}))?s:""},31:function(t,e,r,i,a){var s=t.escapeExpression,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <iframe class="'+s(o(n(3735)).call(null!=e?e:t.nullContext||{},"attachment__iframe",{name:"b",hash:{fullscreen:null!=e?l(e,"fullScreen"):e},data:a,loc:{start:{line:52,column:23},end:{line:52,column:71}}}))+'" frameborder="0" src="'+s(t.lambda(null!=e?l(e,"sourceUrl"):e,e))+'"></iframe>\n'},33:function(t,e,r,i,a){var s,l=t.escapeExpression,u=t.lambda,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="'+l(o(n(3735)).call(null!=e?e:t.nullContext||{},"attachment__text-container",{name:"b",hash:{fullscreen:null!=e?c(e,"fullScreen"):e},data:a,loc:{start:{line:54,column:16},end:{line:54,column:72}}}))+'">\n        <span class="fa fa-download"></span>\n        <a class="link" href="'+l(u(null!=e?c(e,"sourceUrl"):e,e))+'" download="'+l(u(null!=(s=null!=e?c(e,"attachment"):e)?c(s,"name"):s,e))+'">Click to download attachment</a>\n    </div>\n'},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(7243)).call(l,null!=e?u(e,"type"):e,"custom",{name:"eq",hash:{},data:a,loc:{start:{line:1,column:6},end:{line:1,column:24}}}),{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.program(3,a,0),data:a,loc:{start:{line:1,column:0},end:{line:58,column:7}}}))?s:""},useData:!0})},5258:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,o,i){var a,s=t.lambda,l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+l(s(null!=e?u(e,"cls"):e,e))+'">\n    <p class="'+l((a=n(3735),a&&(a.__esModule?a.default:a)).call(null!=e?e:t.nullContext||{},null!=e?u(e,"cls"):e,"message",{name:"b",hash:{},data:i,loc:{start:{line:2,column:14},end:{line:2,column:33}}}))+'">'+l(s(null!=e?u(e,"message"):e,e))+"</p>\n</div>"},useData:!0})},365:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s=t.lambda,l=t.escapeExpression,u=null!=e?e:t.nullContext||{},c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+l(s(null!=e?c(e,"cls"):e,e))+'">\n    <h1 class="'+l(o(n(3735)).call(u,null!=e?c(e,"cls"):e,"title",{name:"b",hash:{},data:a,loc:{start:{line:2,column:15},end:{line:2,column:32}}}))+'">'+l(s(null!=e?c(e,"code"):e,e))+'</h1>\n    <p class="'+l(o(n(3735)).call(u,null!=e?c(e,"cls"):e,"message",{name:"b",hash:{},data:a,loc:{start:{line:3,column:14},end:{line:3,column:33}}}))+'">'+l(s(null!=e?c(e,"message"):e,e))+"</p>\n</div>"},useData:!0})},2651:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=null!=e?e:t.nullContext||{},s=t.hooks.helperMissing,l="function",u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<svg class="chart__svg">\n    <g class="chart__plot" transform="translate('+u(typeof(i=null!=(i=c(n,"PAD_LEFT")||(null!=e?c(e,"PAD_LEFT"):e))?i:s)===l?i.call(a,{name:"PAD_LEFT",hash:{},data:o,loc:{start:{line:2,column:48},end:{line:2,column:60}}}):i)+", "+u(typeof(i=null!=(i=c(n,"PAD_TOP")||(null!=e?c(e,"PAD_TOP"):e))?i:s)===l?i.call(a,{name:"PAD_TOP",hash:{},data:o,loc:{start:{line:2,column:62},end:{line:2,column:73}}}):i)+')"></g>\n    <g class="chart__axis chart__axis_x"></g>\n    <g class="chart__axis chart__axis_y"></g>\n</svg>'},useData:!0})},2703:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({1:function(t,e,n,r,o){var i,a=null!=e?e:t.nullContext||{},s=t.hooks.helperMissing,l="function",u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <div class="trend__tooltip_label">\n            <span class="label" style="background-color: '+u(typeof(i=null!=(i=c(n,"color")||(null!=e?c(e,"color"):e))?i:s)===l?i.call(a,{name:"color",hash:{},data:o,loc:{start:{line:5,column:57},end:{line:5,column:66}}}):i)+'">'+u(typeof(i=null!=(i=c(n,"num")||(null!=e?c(e,"num"):e))?i:s)===l?i.call(a,{name:"num",hash:{},data:o,loc:{start:{line:5,column:68},end:{line:5,column:75}}}):i)+'</span>\n            <span class="trend__tooltip_name">'+u(typeof(i=null!=(i=c(n,"key")||(null!=e?c(e,"key"):e))?i:s)===l?i.call(a,{name:"key",hash:{},data:o,loc:{start:{line:6,column:46},end:{line:6,column:53}}}):i)+"</span>\n        </div>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a,s=null!=e?e:t.nullContext||{},l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return t.escapeExpression("function"==typeof(a=null!=(a=l(n,"name")||(null!=e?l(e,"name"):e))?a:t.hooks.helperMissing)?a.call(s,{name:"name",hash:{},data:o,loc:{start:{line:1,column:0},end:{line:1,column:8}}}):a)+'\n<div class="trend__tooltip">\n'+(null!=(i=l(n,"each").call(s,null!=e?l(e,"data"):e,{name:"each",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:3,column:4},end:{line:8,column:13}}}))?i:"")+"</div>\n"},useData:!0})},4965:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a,s,l){var u=null!=e?e:t.nullContext||{},c=t.escapeExpression,h=t.lambda,f=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <li class="'+c(o(n(3735)).call(u,"language-select","item",{name:"b",hash:{active:o(n(7243)).call(u,null!=e?f(e,"id"):e,null!=l[1]?f(l[1],"currentLang"):l[1],{name:"eq",hash:{},data:a,loc:{start:{line:3,column:55},end:{line:3,column:77}}})},data:a,loc:{start:{line:3,column:19},end:{line:3,column:79}}}))+'" data-id="'+c(h(null!=e?f(e,"id"):e,e))+'">'+c(h(null!=e?f(e,"title"):e,e))+"</li>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a,s,l){var u,c=null!=e?e:t.nullContext||{},h=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<ul class="'+t.escapeExpression(o(n(3735)).call(c,"language-select","menu",{name:"b",hash:{},data:a,loc:{start:{line:1,column:11},end:{line:1,column:41}}}))+'">\n'+(null!=(u=h(r,"each").call(c,null!=e?h(e,"languages"):e,{name:"each",hash:{},fn:t.program(1,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:2,column:4},end:{line:4,column:13}}}))?u:"")+"</ul>\n"},useData:!0,useDepths:!0})},8966:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=null!=e?e:t.nullContext||{},s=t.hooks.helperMissing,l="function",u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="loader__mask">\n    <div class="loader">\n        '+u(typeof(i=null!=(i=c(n,"spinner")||(null!=e?c(e,"spinner"):e))?i:s)===l?i.call(a,{name:"spinner",hash:{},data:o,loc:{start:{line:3,column:8},end:{line:3,column:19}}}):i)+'\n        <p class="loader__text">'+u(typeof(i=null!=(i=c(n,"text")||(null!=e?c(e,"text"):e))?i:s)===l?i.call(a,{name:"text",hash:{},data:o,loc:{start:{line:4,column:32},end:{line:4,column:40}}}):i)+"</p>\n    </div>\n</div>\n"},useData:!0})},245:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <div class="'+t.escapeExpression(o(n(3735)).call(l,"marks-toggle","item",{name:"b",hash:{},data:a,loc:{start:{line:4,column:20},end:{line:4,column:47}}}))+'">\n'+(null!=(s=u(r,"if").call(l,null!=e?u(e,"active"):e,{name:"if",hash:{},fn:t.program(2,a,0),inverse:t.program(4,a,0),data:a,loc:{start:{line:5,column:8},end:{line:11,column:15}}}))?s:"")+"        </div>\n"},2:function(t,e,r,i,a){var s=t.lambda,l=t.escapeExpression,u=null!=e?e:t.nullContext||{},c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <span class="y-label-mark y-label_mark_'+l(s(null!=e?c(e,"mark"):e,e))+'" data-mark="'+l(s(null!=e?c(e,"mark"):e,e))+'"\n                    data-tooltip="'+l(o(n(9237)).call(u,"component.markToggle.hideCases",{name:"t",hash:{mark:null!=e?c(e,"markName"):e},data:a,loc:{start:{line:7,column:34},end:{line:7,column:86}}}))+'">'+l(o(n(3570)).call(u,null!=e?c(e,"mark"):e,{name:"allure-icon",hash:{noTooltip:!0},data:a,loc:{start:{line:7,column:88},end:{line:7,column:123}}}))+"</span>\n"},4:function(t,e,r,i,a){var s=t.lambda,l=t.escapeExpression,u=null!=e?e:t.nullContext||{},c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <span class="n-label-mark n-label_mark_'+l(s(null!=e?c(e,"mark"):e,e))+'" data-mark="'+l(s(null!=e?c(e,"mark"):e,e))+'"\n                    data-tooltip="'+l(o(n(9237)).call(u,"component.markToggle.showCases",{name:"t",hash:{mark:null!=e?c(e,"markName"):e},data:a,loc:{start:{line:10,column:34},end:{line:10,column:86}}}))+'">'+l(o(n(3570)).call(u,null!=e?c(e,"mark"):e,{name:"allure-icon",hash:{noTooltip:!0},data:a,loc:{start:{line:10,column:88},end:{line:10,column:123}}}))+"</span>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+u(o(n(3735)).call(l,"marks-toggle","items",{name:"b",hash:{},data:a,loc:{start:{line:1,column:12},end:{line:1,column:40}}}))+'">\n    '+u(o(n(9237)).call(l,"component.tree.filter-marks",{name:"t",hash:{},data:a,loc:{start:{line:2,column:4},end:{line:2,column:39}}}))+":\n"+(null!=(s=c(r,"each").call(l,null!=e?c(e,"marks"):e,{name:"each",hash:{},fn:t.program(1,a,0),inverse:t.noop,data:a,loc:{start:{line:3,column:4},end:{line:13,column:13}}}))?s:"")+"</div>\n"},useData:!0})},2958:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="modal__background">\n    <div class="modal__window">\n        <h2 class="'+l(o(n(3735)).call(s,null!=e?u(e,"cls"):e,"title",{name:"b",hash:{},data:a,loc:{start:{line:3,column:19},end:{line:3,column:36}}}))+'">\n            <span>'+l(t.lambda(null!=e?u(e,"title"):e,e))+'</span>\n            <span class="'+l(o(n(3735)).call(s,null!=e?u(e,"cls"):e,"close",{name:"b",hash:{},data:a,loc:{start:{line:5,column:25},end:{line:5,column:42}}}))+' fa fa-close" data-tooltip="Close"></span>\n        </h2>\n        <div class="modal__content"></div>\n        <br>\n    </div>\n\n</div>\n'},useData:!0})},9393:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){return'<div class="search__container">\n    <input class="search__input"\n           type="text"/>\n</div>\n'},useData:!0})},3143:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lambda,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="'+l(o(n(3735)).call(s,"sorter","item",{name:"b",hash:{},data:a,loc:{start:{line:3,column:16},end:{line:3,column:37}}}))+'"\n         data-name="'+l(u(null!=e?c(e,"name"):e,e))+'"\n         data-asc="'+l(u(null!=e?c(e,"asc"):e,e))+'"\n         data-ga4-event="sort_click"\n         data-ga4-param-name="'+l(u(null!=e?c(e,"name"):e,e))+'">\n        <span class="'+l(o(n(3735)).call(s,"sorter",{name:"b",hash:{enabled:o(n(180)).call(s,null!=e?c(e,"asc"):e,null!=e?c(e,"desc"):e,{name:"or",hash:{},data:a,loc:{start:{line:8,column:42},end:{line:8,column:55}}})},data:a,loc:{start:{line:8,column:21},end:{line:8,column:57}}}))+" "+l(o(n(3735)).call(s,"sorter","name",{name:"b",hash:{},data:a,loc:{start:{line:8,column:58},end:{line:8,column:79}}}))+'">'+l(o(n(9237)).call(s,null!=e?c(e,"name"):e,{name:"t",hash:{},data:a,loc:{start:{line:8,column:81},end:{line:8,column:91}}}))+'</span>\n        <span class="fa-stack '+l(o(n(3735)).call(s,"sorter","icon",{name:"b",hash:{},data:a,loc:{start:{line:9,column:30},end:{line:9,column:51}}}))+'">\n            <i class="fa fa-sort-asc fa-stack-1x '+l(o(n(3735)).call(s,"sorter",{name:"b",hash:{enabled:null!=e?c(e,"asc"):e},data:a,loc:{start:{line:10,column:49},end:{line:10,column:75}}}))+'"></i>\n            <i class="fa fa-sort-desc fa-stack-1x '+l(o(n(3735)).call(s,"sorter",{name:"b",hash:{enabled:null!=e?c(e,"desc"):e},data:a,loc:{start:{line:11,column:50},end:{line:11,column:77}}}))+'"></i>\n        </span>\n    </div>\n'},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="sorter">\n'+(null!=(i=a(n,"each").call(null!=e?e:t.nullContext||{},null!=e?a(e,"sorters"):e,{name:"each",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:2,column:0},end:{line:14,column:9}}}))?i:"")+"</div>\n"},useData:!0})},4402:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){return'<div class="side-by-side__left"></div>\n<div class="side-by-side__right"></div>'},useData:!0})},9409:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lambda,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <li class="'+l(o(n(3735)).call(s,"side-nav","item",{name:"b",hash:{},data:a,loc:{start:{line:8,column:19},end:{line:8,column:42}}}))+'"\n            data-tooltip="'+l(o(n(9237)).call(s,null!=e?c(e,"title"):e,{name:"t",hash:{},data:a,loc:{start:{line:9,column:26},end:{line:9,column:37}}}))+'"\n            data-ga4-event="tab_click"\n            data-ga4-param-tab="'+l(u(null!=e?c(e,"tabName"):e,e))+'">\n            <a href="#'+l(u(null!=e?c(e,"tabName"):e,e))+'" class="'+l(o(n(3735)).call(s,"side-nav","link",{name:"b",hash:{active:null!=e?c(e,"active"):e},data:a,loc:{start:{line:12,column:42},end:{line:12,column:79}}}))+'">\n                <span class="'+l(o(n(3735)).call(s,"side-nav","icon",{name:"b",hash:{},data:a,loc:{start:{line:13,column:29},end:{line:13,column:52}}}))+" "+l(u(null!=e?c(e,"icon"):e,e))+'"></span>\n                <div class="'+l(o(n(3735)).call(s,"side-nav","text",{name:"b",hash:{},data:a,loc:{start:{line:14,column:28},end:{line:14,column:51}}}))+'">'+l(o(n(9237)).call(s,null!=e?c(e,"title"):e,{name:"t",hash:{},data:a,loc:{start:{line:14,column:53},end:{line:14,column:64}}}))+"</div>\n            </a>\n        </li>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+u(o(n(3735)).call(l,"side-nav","head",{name:"b",hash:{},data:a,loc:{start:{line:1,column:12},end:{line:1,column:35}}}))+'">\n    <a href="#" class="'+u(o(n(3735)).call(l,"side-nav","brand",{name:"b",hash:{},data:a,loc:{start:{line:2,column:23},end:{line:2,column:47}}}))+'" data-ga4-event="home_click">\n        <span class="'+u(o(n(3735)).call(l,"side-nav","brand-text",{name:"b",hash:{},data:a,loc:{start:{line:3,column:21},end:{line:3,column:50}}}))+'">Allure</span>\n    </a>\n</div>\n<ul class="'+u(o(n(3735)).call(l,"side-nav","menu",{name:"b",hash:{},data:a,loc:{start:{line:6,column:11},end:{line:6,column:34}}}))+'">\n'+(null!=(s=c(r,"each").call(l,null!=e?c(e,"tabs"):e,{name:"each",hash:{},fn:t.program(1,a,0),inverse:t.noop,data:a,loc:{start:{line:7,column:4},end:{line:17,column:13}}}))?s:"")+'</ul>\n<div class="'+u(o(n(3735)).call(l,"side-nav","strut",{name:"b",hash:{},data:a,loc:{start:{line:19,column:12},end:{line:19,column:36}}}))+'"></div>\n<div class="'+u(o(n(3735)).call(l,"side-nav","footer",{name:"b",hash:{},data:a,loc:{start:{line:20,column:12},end:{line:20,column:37}}}))+'">\n    <div class="'+u(o(n(3735)).call(l,"side-nav","item",{name:"b",hash:{},data:a,loc:{start:{line:21,column:16},end:{line:21,column:39}}}))+'" data-tooltip="'+u(o(n(9237)).call(l,"controls.language",{name:"t",hash:{},data:a,loc:{start:{line:21,column:55},end:{line:21,column:80}}}))+'">\n        <button class="'+u(o(n(3735)).call(l,"button",{name:"b",hash:{},data:a,loc:{start:{line:22,column:23},end:{line:22,column:37}}}))+" "+u(o(n(3735)).call(l,"button",{name:"b",hash:{inverse:!0},data:a,loc:{start:{line:22,column:38},end:{line:22,column:65}}}))+" "+u(o(n(3735)).call(l,"side-nav","language-small",{name:"b",hash:{lang:null!=(s=null!=e?c(e,"language"):e)?c(s,"id"):s},data:a,loc:{start:{line:22,column:66},end:{line:22,column:116}}}))+'"\n                data-ga4-event="language_menu_click">\n            '+u(t.lambda(null!=(s=null!=e?c(e,"language"):e)?c(s,"id"):s,e))+'\n        </button>\n    </div>\n\n    <div class="'+u(o(n(3735)).call(l,"side-nav","item",{name:"b",hash:{},data:a,loc:{start:{line:28,column:16},end:{line:28,column:39}}}))+' " data-tooltip="'+u(o(n(9237)).call(l,"controls.expand",{name:"t",hash:{},data:a,loc:{start:{line:28,column:56},end:{line:28,column:79}}}))+'" data-ga4-event="expand_menu_click">\n        <div class="'+u(o(n(3735)).call(l,"side-nav","collapse",{name:"b",hash:{},data:a,loc:{start:{line:29,column:20},end:{line:29,column:47}}}))+'">\n            <span class="'+u(o(n(3735)).call(l,"side-nav","icon",{name:"b",hash:{},data:a,loc:{start:{line:30,column:25},end:{line:30,column:48}}}))+' fa fa-angle-left"></span>\n            <span class="'+u(o(n(3735)).call(l,"side-nav","text",{name:"b",hash:{},data:a,loc:{start:{line:31,column:25},end:{line:31,column:48}}}))+'">'+u(o(n(9237)).call(l,"controls.collapse",{name:"t",hash:{},data:a,loc:{start:{line:31,column:50},end:{line:31,column:75}}}))+"</span>\n        </div>\n    </div>\n</div>\n"},useData:!0})},6065:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <div class="'+t.escapeExpression(o(n(3735)).call(l,"status-toggle","item",{name:"b",hash:{},data:a,loc:{start:{line:4,column:20},end:{line:4,column:48}}}))+'">\n'+(null!=(s=u(r,"if").call(l,null!=e?u(e,"active"):e,{name:"if",hash:{},fn:t.program(2,a,0),inverse:t.program(4,a,0),data:a,loc:{start:{line:5,column:8},end:{line:13,column:15}}}))?s:"")+"        </div>\n"},2:function(t,e,r,i,a){var s=t.lambda,l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <span class="y-label y-label_status_'+l(s(null!=e?u(e,"status"):e,e))+'"\n                  data-status="'+l(s(null!=e?u(e,"status"):e,e))+'"\n                  data-tooltip="'+l(o(n(9237)).call(null!=e?e:t.nullContext||{},"component.statusToggle.hideCases",{name:"t",hash:{status:null!=e?u(e,"statusName"):e},data:a,loc:{start:{line:8,column:32},end:{line:8,column:90}}}))+'">'+l(s(null!=e?u(e,"count"):e,e))+"</span>\n"},4:function(t,e,r,i,a){var s=t.lambda,l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <span class="n-label n-label_status_'+l(s(null!=e?u(e,"status"):e,e))+'"\n                  data-status="'+l(s(null!=e?u(e,"status"):e,e))+'"\n                  data-tooltip="'+l(o(n(9237)).call(null!=e?e:t.nullContext||{},"component.statusToggle.showCases",{name:"t",hash:{status:null!=e?u(e,"statusName"):e},data:a,loc:{start:{line:12,column:32},end:{line:12,column:90}}}))+'">'+l(s(null!=e?u(e,"count"):e,e))+"</span>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+u(o(n(3735)).call(l,"status-toggle","items",{name:"b",hash:{},data:a,loc:{start:{line:1,column:12},end:{line:1,column:41}}}))+'">\n    '+u(o(n(9237)).call(l,"component.tree.filter",{name:"t",hash:{},data:a,loc:{start:{line:2,column:4},end:{line:2,column:33}}}))+":\n"+(null!=(s=c(r,"each").call(l,null!=e?c(e,"statuses"):e,{name:"each",hash:{},fn:t.program(1,a,0),inverse:t.noop,data:a,loc:{start:{line:3,column:4},end:{line:15,column:13}}}))?s:"")+"</div>\n"},useData:!0})},8469:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="execution__content">'+(null!=(s=t.invokePartial(n(1812),e,{name:"stages-block",hash:{expanded:!1,baseUrl:null!=e?u(e,"baseUrl"):e,name:o(n(9237)).call(l,"testResult.execution.setup",{name:"t",hash:{},data:a,loc:{start:{line:5,column:45},end:{line:5,column:77}}}),stages:null!=e?u(e,"before"):e},data:a,helpers:r,partials:i,decorators:t.decorators}))?s:"")+(null!=(s=t.invokePartial(n(1812),e,{name:"stages-block",hash:{expanded:!0,baseUrl:null!=e?u(e,"baseUrl"):e,name:o(n(9237)).call(l,"testResult.execution.body",{name:"t",hash:{},data:a,loc:{start:{line:6,column:43},end:{line:6,column:74}}}),stages:null!=e?u(e,"test"):e},data:a,helpers:r,partials:i,decorators:t.decorators}))?s:"")+(null!=(s=t.invokePartial(n(1812),e,{name:"stages-block",hash:{expanded:!1,baseUrl:null!=e?u(e,"baseUrl"):e,name:o(n(9237)).call(l,"testResult.execution.teardown",{name:"t",hash:{},data:a,loc:{start:{line:7,column:44},end:{line:7,column:79}}}),stages:null!=e?u(e,"after"):e},data:a,helpers:r,partials:i,decorators:t.decorators}))?s:"")+"    </div>\n"},3:function(t,e,r,i,a){return'    <div class="'+t.escapeExpression(o(n(3735)).call(null!=e?e:t.nullContext||{},"pane","section",{name:"b",hash:{},data:a,loc:{start:{line:10,column:16},end:{line:10,column:38}}}))+'">\n        No information about test execution is available.\n    </div>\n'},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<h3 class="test-result-execution__title">'+t.escapeExpression(o(n(9237)).call(l,"testResult.execution.name",{name:"t",hash:{},data:a,loc:{start:{line:1,column:41},end:{line:1,column:74}}}))+"</h3>\n\n"+(null!=(s=u(r,"if").call(l,null!=e?u(e,"hasContent"):e,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.program(3,a,0),data:a,loc:{start:{line:3,column:0},end:{line:13,column:7}}}))?s:"")},usePartial:!0,useData:!0})},1812:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a,s,l){var u,c=null!=e?e:t.nullContext||{},h=t.escapeExpression,f=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="'+h(o(n(3735)).call(c,"step",{name:"b",hash:{expanded:null!=e?f(e,"expanded"):e},data:a,loc:{start:{line:2,column:16},end:{line:2,column:46}}}))+'">\n        <div class="'+h(o(n(3735)).call(c,"step","title",{name:"b",hash:{stage:!0,hasContent:!0},data:a,loc:{start:{line:3,column:20},end:{line:3,column:67}}}))+'">\n            <span class="step__arrow block__arrow">'+h(o(n(4354)).call(c,{name:"angle",hash:{},data:a,loc:{start:{line:4,column:51},end:{line:4,column:60}}}))+"</span>\n            "+h(t.lambda(null!=e?f(e,"name"):e,e))+'\n        </div>\n        <div class="'+h(o(n(3735)).call(c,"step","content",{name:"b",hash:{},data:a,loc:{start:{line:7,column:20},end:{line:7,column:42}}}))+'">\n'+(null!=(u=f(r,"each").call(c,null!=e?f(e,"stages"):e,{name:"each",hash:{},fn:t.program(2,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:8,column:12},end:{line:40,column:21}}}))?u:"")+"        </div>\n    </div>\n"},2:function(t,e,n,r,o,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=l(n,"if").call(null!=e?e:t.nullContext||{},null!=e?l(e,"name"):e,{name:"if",hash:{},fn:t.program(3,o,0,i,a),inverse:t.program(12,o,0,i,a),data:o,loc:{start:{line:9,column:16},end:{line:39,column:23}}}))?s:""},3:function(t,e,r,i,a,s,l){var u,c=null!=e?e:t.nullContext||{},h=t.escapeExpression,f=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'                    <div class="'+h(o(n(3735)).call(c,"step",{name:"b",hash:{},data:a,loc:{start:{line:10,column:32},end:{line:10,column:44}}}))+'">\n                        <div class="'+h(o(n(3735)).call(c,"step","title",{name:"b",hash:{stage:!0,hasContent:null!=e?f(e,"hasContent"):e},data:a,loc:{start:{line:11,column:36},end:{line:11,column:89}}}))+'">\n'+(null!=(u=f(r,"if").call(c,null!=e?f(e,"hasContent"):e,{name:"if",hash:{},fn:t.program(4,a,0,s,l),inverse:t.program(6,a,0,s,l),data:a,loc:{start:{line:12,column:28},end:{line:16,column:35}}}))?u:"")+"                            "+h(t.lambda(null!=e?f(e,"name"):e,e))+"\n"+(null!=(u=t.invokePartial(n(9313),e,{name:"../../blocks/step-stats/step-stats",hash:{baseUrl:null!=l[2]?f(l[2],"baseUrl"):l[2]},data:a,indent:"                            ",helpers:r,partials:i,decorators:t.decorators}))?u:"")+'                        </div>\n                        <div class="'+h(o(n(3735)).call(c,"step","content",{name:"b",hash:{},data:a,loc:{start:{line:20,column:36},end:{line:20,column:58}}}))+'">\n'+(null!=(u=t.invokePartial(n(1155),e,{name:"../../blocks/parameters-table/parameters-table",hash:{parameters:null!=e?f(e,"parameters"):e},data:a,indent:"                            ",helpers:r,partials:i,decorators:t.decorators}))?u:"")+(null!=(u=t.invokePartial(n(6731),e,{name:"steps-list",hash:{baseUrl:null!=l[1]?f(l[1],"baseUrl"):l[1],steps:null!=e?f(e,"steps"):e},data:a,helpers:r,partials:i,decorators:t.decorators}))?u:"")+(null!=(u=f(r,"each").call(c,null!=e?f(e,"attachments"):e,{name:"each",hash:{},fn:t.program(8,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:23,column:28},end:{line:25,column:37}}}))?u:"")+(null!=(u=f(r,"if").call(c,null!=e?f(e,"shouldDisplayMessage"):e,{name:"if",hash:{},fn:t.program(10,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:26,column:28},end:{line:28,column:35}}}))?u:"")+"                        </div>\n                    </div>\n"},4:function(t,e,r,i,a){var s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'                                <span class="step__arrow block__arrow">'+t.escapeExpression(o(n(6308)).call(null!=e?e:t.nullContext||{},null!=e?s(e,"status"):e,{name:"arrow",hash:{},data:a,loc:{start:{line:13,column:71},end:{line:13,column:87}}}))+"</span>\n"},6:function(t,e,r,i,a){var s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'                                <span class="step__status">'+t.escapeExpression(o(n(3570)).call(null!=e?e:t.nullContext||{},null!=e?s(e,"status"):e,{name:"allure-icon",hash:{},data:a,loc:{start:{line:15,column:59},end:{line:15,column:81}}}))+"</span>\n"},8:function(t,e,r,o,i,a,s){var l,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(l=t.invokePartial(n(2417),e,{name:"../../blocks/attachment-row/attachment-row",hash:{baseUrl:null!=s[2]?u(s[2],"baseUrl"):s[2]},data:i,indent:"                                ",helpers:r,partials:o,decorators:t.decorators}))?l:""},10:function(t,e,r,o,i){var a;return null!=(a=t.invokePartial(n(811),e,{name:"../../blocks/status-details/status-details",data:i,helpers:r,partials:o,decorators:t.decorators}))?a:""},12:function(t,e,r,o,i,a,s){var l,u=null!=e?e:t.nullContext||{},c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return(null!=(l=t.invokePartial(n(6731),e,{name:"steps-list",hash:{baseUrl:null!=s[1]?c(s[1],"baseUrl"):s[1],steps:null!=e?c(e,"steps"):e},data:i,helpers:r,partials:o,decorators:t.decorators}))?l:"")+(null!=(l=c(r,"each").call(u,null!=e?c(e,"attachments"):e,{name:"each",hash:{},fn:t.program(13,i,0,a,s),inverse:t.noop,data:i,loc:{start:{line:33,column:20},end:{line:35,column:29}}}))?l:"")+(null!=(l=c(r,"if").call(u,null!=e?c(e,"shouldDisplayMessage"):e,{name:"if",hash:{},fn:t.program(10,i,0,a,s),inverse:t.noop,data:i,loc:{start:{line:36,column:20},end:{line:38,column:27}}}))?l:"")},13:function(t,e,r,o,i,a,s){var l,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(l=t.invokePartial(n(2417),e,{name:"../../blocks/attachment-row/attachment-row",hash:{baseUrl:null!=s[2]?u(s[2],"baseUrl"):s[2]},data:i,indent:"                        ",helpers:r,partials:o,decorators:t.decorators}))?l:""},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=l(n,"if").call(null!=e?e:t.nullContext||{},null!=e?l(e,"stages"):e,{name:"if",hash:{},fn:t.program(1,o,0,i,a),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:43,column:7}}}))?s:""},usePartial:!0,useData:!0,useDepths:!0})},6731:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,n,r,o,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="step">\n'+(null!=(s=l(n,"if").call(null!=e?e:t.nullContext||{},null!=e?l(e,"attachmentStep"):e,{name:"if",hash:{},fn:t.program(2,o,0,i,a),inverse:t.program(5,o,0,i,a),data:o,loc:{start:{line:3,column:8},end:{line:27,column:15}}}))?s:"")+"    </div>\n"},2:function(t,e,n,r,o,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=l(n,"each").call(null!=e?e:t.nullContext||{},null!=e?l(e,"attachments"):e,{name:"each",hash:{},fn:t.program(3,o,0,i,a),inverse:t.noop,data:o,loc:{start:{line:4,column:8},end:{line:6,column:17}}}))?s:""},3:function(t,e,r,o,i,a,s){var l,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(l=t.invokePartial(n(2417),e,{name:"../../blocks/attachment-row/attachment-row",hash:{baseUrl:null!=s[2]?u(s[2],"baseUrl"):s[2]},data:i,indent:"          ",helpers:r,partials:o,decorators:t.decorators}))?l:""},5:function(t,e,r,i,a,s,l){var u,c=null!=e?e:t.nullContext||{},h=t.escapeExpression,f=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <div class="'+h(o(n(3735)).call(c,"step","title",{name:"b",hash:{hasContent:null!=e?f(e,"hasContent"):e},data:a,loc:{start:{line:8,column:20},end:{line:8,column:62}}}))+' long-line">\n'+(null!=(u=f(r,"if").call(c,null!=e?f(e,"hasContent"):e,{name:"if",hash:{},fn:t.program(6,a,0,s,l),inverse:t.program(8,a,0,s,l),data:a,loc:{start:{line:9,column:10},end:{line:13,column:17}}}))?u:"")+'          <div class="step__name">'+h(o(n(6827)).call(c,null!=e?f(e,"name"):e,{name:"text-with-links",hash:{},data:a,loc:{start:{line:14,column:34},end:{line:14,column:58}}}))+"</div>\n"+(null!=(u=t.invokePartial(n(9313),e,{name:"../../blocks/step-stats/step-stats",hash:{baseUrl:null!=l[2]?f(l[2],"baseUrl"):l[2]},data:a,indent:"          ",helpers:r,partials:i,decorators:t.decorators}))?u:"")+'        </div>\n        <div class="step__content">\n'+(null!=(u=t.invokePartial(n(1155),e,{name:"../../blocks/parameters-table/parameters-table",hash:{parameters:null!=e?f(e,"parameters"):e},data:a,indent:"          ",helpers:r,partials:i,decorators:t.decorators}))?u:"")+(null!=(u=t.invokePartial(n(6731),e,{name:"steps-list",hash:{baseUrl:null!=l[1]?f(l[1],"baseUrl"):l[1],steps:null!=e?f(e,"steps"):e},data:a,helpers:r,partials:i,decorators:t.decorators}))?u:"")+(null!=(u=f(r,"each").call(c,null!=e?f(e,"attachments"):e,{name:"each",hash:{},fn:t.program(10,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:20,column:10},end:{line:22,column:19}}}))?u:"")+(null!=(u=f(r,"if").call(c,null!=e?f(e,"shouldDisplayMessage"):e,{name:"if",hash:{},fn:t.program(12,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:23,column:10},end:{line:25,column:17}}}))?u:"")+"        </div>\n"},6:function(t,e,r,i,a){var s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <span class="step__arrow block__arrow">'+t.escapeExpression(o(n(6308)).call(null!=e?e:t.nullContext||{},null!=e?s(e,"status"):e,{name:"arrow",hash:{},data:a,loc:{start:{line:10,column:51},end:{line:10,column:67}}}))+"</span>\n"},8:function(t,e,r,i,a){var s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <span class="step__status">'+t.escapeExpression(o(n(3570)).call(null!=e?e:t.nullContext||{},null!=e?s(e,"status"):e,{name:"allure-icon",hash:{},data:a,loc:{start:{line:12,column:39},end:{line:12,column:61}}}))+"</span>\n"},10:function(t,e,r,o,i,a,s){var l,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(l=t.invokePartial(n(2417),e,{name:"../../blocks/attachment-row/attachment-row",hash:{baseUrl:null!=s[2]?u(s[2],"baseUrl"):s[2]},data:i,indent:"            ",helpers:r,partials:o,decorators:t.decorators}))?l:""},12:function(t,e,r,o,i){var a;return null!=(a=t.invokePartial(n(811),e,{name:"../../blocks/status-details/status-details",data:i,helpers:r,partials:o,decorators:t.decorators}))?a:""},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=l(n,"each").call(null!=e?e:t.nullContext||{},null!=e?l(e,"steps"):e,{name:"each",hash:{},fn:t.program(1,o,0,i,a),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:29,column:9}}}))?s:""},usePartial:!0,useData:!0,useDepths:!0})},4175:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+u(o(n(3735)).call(l,"alert","wide",{name:"b",hash:{status:null!=e?c(e,"status"):e},data:a,loc:{start:{line:1,column:12},end:{line:1,column:46}}}))+'">'+(null!=(s=t.invokePartial(n(811),e,{name:"../../blocks/status-details/status-details",data:a,helpers:r,partials:i,decorators:t.decorators}))?s:"")+'</div>\n\n<div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"tags",{name:"b",hash:{},data:a,loc:{start:{line:5,column:12},end:{line:5,column:28}}}))+'"></div>\n<div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"before",{name:"b",hash:{},data:a,loc:{start:{line:6,column:12},end:{line:6,column:30}}}))+'"></div>\n<div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"execution",{name:"b",hash:{},data:a,loc:{start:{line:7,column:12},end:{line:7,column:33}}}))+'"></div>\n<div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"after",{name:"b",hash:{},data:a,loc:{start:{line:8,column:12},end:{line:8,column:29}}}))+'"></div>'},usePartial:!0,useData:!0})},3826:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,o,i){var a,s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="pane__subtitle long-line line-ellipsis">\n'+(null!=(a=t.invokePartial(n(1253),e,{name:"../../blocks/clipboard-copy/clipboard-copy",hash:{value:null!=e?s(e,"fullName"):e},data:i,indent:"        ",helpers:r,partials:o,decorators:t.decorators}))?a:"")+'        <span class="fullname__body">'+t.escapeExpression(t.lambda(null!=e?s(e,"fullName"):e,e))+"</span>\n    </div>\n"},3:function(t,e,r,i,a){return"            "+t.escapeExpression(o(n(3570)).call(null!=e?e:t.nullContext||{},"flaky",{name:"allure-icon",hash:{},data:a,loc:{start:{line:13,column:12},end:{line:13,column:35}}}))+"\n"},5:function(t,e,r,i,a){return"            "+t.escapeExpression(o(n(3570)).call(null!=e?e:t.nullContext||{},"newFailed",{name:"allure-icon",hash:{},data:a,loc:{start:{line:16,column:12},end:{line:16,column:39}}}))+"\n"},7:function(t,e,r,i,a){return"            "+t.escapeExpression(o(n(3570)).call(null!=e?e:t.nullContext||{},"newPassed",{name:"allure-icon",hash:{},data:a,loc:{start:{line:19,column:12},end:{line:19,column:39}}}))+"\n"},9:function(t,e,r,i,a){return"            "+t.escapeExpression(o(n(3570)).call(null!=e?e:t.nullContext||{},"newBroken",{name:"allure-icon",hash:{},data:a,loc:{start:{line:22,column:12},end:{line:22,column:39}}}))+"\n"},11:function(t,e,r,i,a){return"            "+t.escapeExpression(o(n(3570)).call(null!=e?e:t.nullContext||{},"retriesStatusChange",{name:"allure-icon",hash:{},data:a,loc:{start:{line:25,column:12},end:{line:25,column:49}}}))+"\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lambda,h=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return(null!=(s=h(r,"if").call(l,null!=e?h(e,"fullName"):e,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.noop,data:a,loc:{start:{line:1,column:0},end:{line:6,column:7}}}))?s:"")+'<h2 class="'+u(o(n(3735)).call(l,"pane","title",{name:"b",hash:{borderless:!0},data:a,loc:{start:{line:7,column:11},end:{line:7,column:47}}}))+'">\n    <div class="'+u(o(n(3735)).call(l,null!=e?h(e,"cls"):e,"status",{name:"b",hash:{},data:a,loc:{start:{line:8,column:16},end:{line:8,column:34}}}))+'">\n        <span class="label label_status_'+u(c(null!=e?h(e,"status"):e,e))+'">'+u(o(n(9237)).call(l,null!=e?h(e,"statusName"):e,{name:"t",hash:{},data:a,loc:{start:{line:9,column:52},end:{line:9,column:68}}}))+'</span>\n    </div>\n    <div class="'+u(o(n(3735)).call(l,null!=e?h(e,"cls"):e,"name",{name:"b",hash:{},data:a,loc:{start:{line:11,column:16},end:{line:11,column:32}}}))+'">\n'+(null!=(s=h(r,"if").call(l,null!=e?h(e,"flaky"):e,{name:"if",hash:{},fn:t.program(3,a,0),inverse:t.noop,data:a,loc:{start:{line:12,column:8},end:{line:14,column:15}}}))?s:"")+(null!=(s=h(r,"if").call(l,null!=e?h(e,"newFailed"):e,{name:"if",hash:{},fn:t.program(5,a,0),inverse:t.noop,data:a,loc:{start:{line:15,column:8},end:{line:17,column:15}}}))?s:"")+(null!=(s=h(r,"if").call(l,null!=e?h(e,"newPassed"):e,{name:"if",hash:{},fn:t.program(7,a,0),inverse:t.noop,data:a,loc:{start:{line:18,column:8},end:{line:20,column:15}}}))?s:"")+(null!=(s=h(r,"if").call(l,null!=e?h(e,"newBroken"):e,{name:"if",hash:{},fn:t.program(9,a,0),inverse:t.noop,data:a,loc:{start:{line:21,column:8},end:{line:23,column:15}}}))?s:"")+(null!=(s=h(r,"if").call(l,null!=e?h(e,"retriesStatusChange"):e,{name:"if",hash:{},fn:t.program(11,a,0),inverse:t.noop,data:a,loc:{start:{line:24,column:8},end:{line:26,column:15}}}))?s:"")+'        <span class="long-line">'+u(c(null!=e?h(e,"name"):e,e))+"</span>\n    </div>\n</h2>\n\n"+(null!=(s=t.invokePartial(n(973),e,{name:"../../blocks/tabs/tabs",data:a,helpers:r,partials:i,decorators:t.decorators}))?s:"")+'<div class="'+u(o(n(3735)).call(l,null!=e?h(e,"cls"):e,"content",{name:"b",hash:{},data:a,loc:{start:{line:32,column:12},end:{line:32,column:31}}}))+'"></div>\n'},usePartial:!0,useData:!0})},5501:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <span class="'+l(o(n(3735)).call(s,"pane","subtitle",{name:"b",hash:{},data:a,loc:{start:{line:4,column:21},end:{line:4,column:44}}}))+'">\n        '+l(o(n(9237)).call(s,"component.tree.filtered.total",{name:"t",hash:{count:null!=e?u(e,"totalCases"):e},data:a,loc:{start:{line:5,column:8},end:{line:5,column:62}}}))+",\n            "+l(o(n(9237)).call(s,"component.tree.filtered.shown",{name:"t",hash:{count:null!=e?u(e,"shownCases"):e},data:a,loc:{start:{line:6,column:12},end:{line:6,column:66}}}))+"\n    </span>\n"},3:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <span class="fa fa-download '+l(o(n(3735)).call(s,null!=e?u(e,"cls"):e,"control",{name:"b",hash:{},data:a,loc:{start:{line:14,column:40},end:{line:14,column:59}}}))+" "+l(o(n(3735)).call(s,null!=e?u(e,"cls"):e,"download",{name:"b",hash:{},data:a,loc:{start:{line:14,column:60},end:{line:14,column:80}}}))+'"\n               data-tooltip="'+l(o(n(9237)).call(s,"component.tree.download",{name:"t",hash:{},data:a,loc:{start:{line:15,column:29},end:{line:15,column:60}}}))+'"\n               data-ga4-event="csv_download_click"\n               data-download="'+l(t.lambda(null!=e?u(e,"csvUrl"):e,e))+'"\n               data-download-type="text/csv"></span>\n'},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+u(o(n(3735)).call(l,"pane","title",{name:"b",hash:{borderless:!0},data:a,loc:{start:{line:1,column:12},end:{line:1,column:48}}}))+'">\n    <span class="'+u(o(n(3735)).call(l,"pane","title-text",{name:"b",hash:{},data:a,loc:{start:{line:2,column:17},end:{line:2,column:42}}}))+'">'+u(o(n(9237)).call(l,null!=e?c(e,"tabName"):e,{name:"t",hash:{},data:a,loc:{start:{line:2,column:44},end:{line:2,column:57}}}))+"</span>\n"+(null!=(s=c(r,"if").call(l,null!=e?c(e,"filtered"):e,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.noop,data:a,loc:{start:{line:3,column:4},end:{line:8,column:11}}}))?s:"")+'    <div class="'+u(o(n(3735)).call(l,"pane","search",{name:"b",hash:{},data:a,loc:{start:{line:9,column:16},end:{line:9,column:37}}}))+'"></div>\n    <span class="pane__controls">\n        <span class="fa fa-info-circle '+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"control",{name:"b",hash:{},data:a,loc:{start:{line:11,column:39},end:{line:11,column:58}}}))+" "+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"info",{name:"b",hash:{},data:a,loc:{start:{line:11,column:59},end:{line:11,column:75}}}))+'"\n              data-tooltip="'+u(o(n(9237)).call(l,"component.tree.groups",{name:"t",hash:{},data:a,loc:{start:{line:12,column:28},end:{line:12,column:57}}}))+'"></span>\n'+(null!=(s=c(r,"if").call(l,null!=e?c(e,"csvUrl"):e,{name:"if",hash:{},fn:t.program(3,a,0),inverse:t.noop,data:a,loc:{start:{line:13,column:8},end:{line:19,column:15}}}))?s:"")+'    </span>\n</div>\n\n<div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"ctrl",{name:"b",hash:{},data:a,loc:{start:{line:23,column:12},end:{line:23,column:28}}}))+'">\n    <div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"sorter",{name:"b",hash:{},data:a,loc:{start:{line:24,column:16},end:{line:24,column:34}}}))+'"></div>\n    <div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"strut",{name:"b",hash:{},data:a,loc:{start:{line:25,column:16},end:{line:25,column:33}}}))+'"></div>\n    <div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"filter",{name:"b",hash:{},data:a,loc:{start:{line:26,column:16},end:{line:26,column:34}}}))+'"></div>\n    <div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"filter-marks",{name:"b",hash:{},data:a,loc:{start:{line:27,column:16},end:{line:27,column:40}}}))+'"></div>\n</div>\n\n<div class="'+u(o(n(3735)).call(l,null!=e?c(e,"cls"):e,"content",{name:"b",hash:{},data:a,loc:{start:{line:30,column:12},end:{line:30,column:31}}}))+'" ></div>\n'},useData:!0})},7204:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,n,r,o,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=l(n,"each").call(null!=e?e:t.nullContext||{},null!=e?l(e,"items"):e,{name:"each",hash:{},fn:t.program(2,o,0,i,a),inverse:t.noop,data:o,loc:{start:{line:3,column:8},end:{line:5,column:17}}}))?s:""},2:function(t,e,r,o,i,a,s){var l,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(l=t.invokePartial(n(7685),e,{name:"tree-group",hash:{testResultTab:null!=s[1]?u(s[1],"testResultTab"):s[1],tabName:null!=s[1]?u(s[1],"tabName"):s[1],showGroupInfo:null!=s[1]?u(s[1],"showGroupInfo"):s[1],baseUrl:null!=s[1]?u(s[1],"baseUrl"):s[1]},data:i,helpers:r,partials:o,decorators:t.decorators}))?l:""},4:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'           <div class="'+l(o(n(3735)).call(s,null!=e?u(e,"cls"):e,"empty",{name:"b",hash:{},data:a,loc:{start:{line:7,column:23},end:{line:7,column:40}}}))+'">'+l(o(n(9237)).call(s,"component.tree.empty",{name:"t",hash:{},data:a,loc:{start:{line:7,column:42},end:{line:7,column:70}}}))+"</div>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a,s,l){var u,c=null!=e?e:t.nullContext||{},h=t.escapeExpression,f=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+h(o(n(3735)).call(c,null!=e?f(e,"cls"):e,"content",{name:"b",hash:{},data:a,loc:{start:{line:1,column:12},end:{line:1,column:31}}}))+'" data-uid="'+h(t.lambda(null!=e?f(e,"uid"):e,e))+'">\n'+(null!=(u=f(r,"if").call(c,null!=e?f(e,"items"):e,{name:"if",hash:{},fn:t.program(1,a,0,s,l),inverse:t.program(4,a,0,s,l),data:a,loc:{start:{line:2,column:4},end:{line:8,column:11}}}))?u:"")+"</div>\n"},usePartial:!0,useData:!0,useDepths:!0})},7685:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a,s,l){var u,c=t.escapeExpression,h=null!=e?e:t.nullContext||{},f=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="node">\n        <div class="node__title long-line" data-uid="'+c(t.lambda(null!=e?f(e,"uid"):e,e))+'">\n            <span class="node__arrow block__arrow">'+c(o(n(4354)).call(h,{name:"angle",hash:{},data:a,loc:{start:{line:4,column:51},end:{line:4,column:60}}}))+"</span>\n"+(null!=(u=f(r,"if").call(h,null!=e?f(e,"name"):e,{name:"if",hash:{},fn:t.program(2,a,0,s,l),inverse:t.program(4,a,0,s,l),data:a,loc:{start:{line:5,column:12},end:{line:11,column:19}}}))?u:"")+'            <div class="tree__strut">&nbsp</div>\n            <span class="node__stats">\n                '+c(o(n(1747)).call(h,null!=e?f(e,"statistic"):e,{name:"statistic-bar",hash:{},data:a,loc:{start:{line:14,column:16},end:{line:14,column:43}}}))+'\n            </span>\n        </div>\n\n        <div class="node__children">\n'+(null!=(u=f(r,"if").call(h,null!=e?f(e,"showGroupInfo"):e,{name:"if",hash:{},fn:t.program(6,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:19,column:12},end:{line:28,column:19}}}))?u:"")+(null!=(u=f(r,"each").call(h,null!=e?f(e,"children"):e,{name:"each",hash:{},fn:t.program(8,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:29,column:12},end:{line:31,column:21}}}))?u:"")+"        </div>\n    </div>\n"},2:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'                <div class="node__name">\n                    '+t.escapeExpression(t.lambda(null!=e?i(e,"name"):e,e))+"\n                </div>\n"},4:function(t,e,r,i,a){return'                <span class="node__unknown">'+t.escapeExpression(o(n(9237)).call(null!=e?e:t.nullContext||{},"component.tree.unknown",{name:"t",hash:{},data:a,loc:{start:{line:10,column:44},end:{line:10,column:74}}}))+"</span>\n"},6:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'                <div class="node">\n                    <div class="node__info long-line" data-uid="'+t.escapeExpression(t.lambda(null!=e?u(e,"uid"):e,e))+'">\n                        <span class="fa fa-clock-o"></span>\n'+(null!=(s=t.invokePartial(n(7085),e,{name:"tree-time",hash:{tooltip:o(n(9237)).call(l,"component.tree.time.total.tooltip",{name:"t",hash:{},data:a,loc:{start:{line:23,column:108},end:{line:23,column:147}}}),name:o(n(9237)).call(l,"component.tree.time.total.name",{name:"t",hash:{},data:a,loc:{start:{line:23,column:63},end:{line:23,column:99}}}),value:null!=(s=null!=e?u(e,"time"):e)?u(s,"duration"):s},data:a,indent:"                        ",helpers:r,partials:i,decorators:t.decorators}))?s:"")+(null!=(s=t.invokePartial(n(7085),e,{name:"tree-time",hash:{tooltip:o(n(9237)).call(l,"component.tree.time.max.tooltip",{name:"t",hash:{},data:a,loc:{start:{line:24,column:109},end:{line:24,column:146}}}),name:o(n(9237)).call(l,"component.tree.time.max.name",{name:"t",hash:{},data:a,loc:{start:{line:24,column:66},end:{line:24,column:100}}}),value:null!=(s=null!=e?u(e,"time"):e)?u(s,"maxDuration"):s},data:a,indent:"                        ",helpers:r,partials:i,decorators:t.decorators}))?s:"")+(null!=(s=t.invokePartial(n(7085),e,{name:"tree-time",hash:{tooltip:o(n(9237)).call(l,"component.tree.time.sum.tooltip",{name:"t",hash:{},data:a,loc:{start:{line:25,column:109},end:{line:25,column:146}}}),name:o(n(9237)).call(l,"component.tree.time.sum.name",{name:"t",hash:{},data:a,loc:{start:{line:25,column:66},end:{line:25,column:100}}}),value:null!=(s=null!=e?u(e,"time"):e)?u(s,"sumDuration"):s},data:a,indent:"                        ",helpers:r,partials:i,decorators:t.decorators}))?s:"")+"                    </div>\n                </div>\n"},8:function(t,e,r,o,i,a,s){var l,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(l=t.invokePartial(n(7685),e,{name:"tree-group",hash:{testResultTab:null!=s[1]?u(s[1],"testResultTab"):s[1],tabName:null!=s[1]?u(s[1],"tabName"):s[1],showGroupInfo:null!=s[1]?u(s[1],"showGroupInfo"):s[1],baseUrl:null!=s[1]?u(s[1],"baseUrl"):s[1]},data:i,helpers:r,partials:o,decorators:t.decorators}))?l:""},10:function(t,e,r,o,i){var a,s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(a=t.invokePartial(n(4286),e,{name:"tree-leaf",hash:{testResultTab:null!=e?s(e,"testResultTab"):e,baseUrl:null!=e?s(e,"baseUrl"):e},data:i,helpers:r,partials:o,decorators:t.decorators}))?a:""},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=l(n,"if").call(null!=e?e:t.nullContext||{},null!=e?l(e,"children"):e,{name:"if",hash:{},fn:t.program(1,o,0,i,a),inverse:t.program(10,o,0,i,a),data:o,loc:{start:{line:1,column:0},end:{line:36,column:7}}}))?s:""},usePartial:!0,useData:!0,useDepths:!0})},4286:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <div class="node__parameters long-line line-ellipsis">\n                <span>&nbsp</span>\n'+(null!=(i=a(n,"each").call(null!=e?e:t.nullContext||{},null!=e?a(e,"parameters"):e,{name:"each",hash:{},fn:t.program(2,o,0),inverse:t.noop,data:o,loc:{start:{line:13,column:16},end:{line:20,column:25}}}))?i:"")+"            </div>\n"},2:function(t,e,n,r,o){var i;return(null!=(i=(t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]})(n,"if").call(null!=e?e:t.nullContext||{},e,{name:"if",hash:{},fn:t.program(3,o,0),inverse:t.program(5,o,0),data:o,loc:{start:{line:14,column:20},end:{line:18,column:29}}}))?i:"")+'<span class="node__parameters_separator">,</span>\n'},3:function(t,e,n,r,o){return"                        "+t.escapeExpression(t.lambda(e,e))},5:function(t,e,n,r,o){return"                        null"},7:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <div class="'+l(o(n(3735)).call(s,"node","mark",{name:"b",hash:{shown:null!=e?u(e,"flaky"):e},data:a,loc:{start:{line:25,column:24},end:{line:25,column:55}}}))+'">\n                '+l(o(n(3570)).call(s,"flaky",{name:"allure-icon",hash:{},data:a,loc:{start:{line:26,column:16},end:{line:26,column:39}}}))+"\n            </div>\n"},9:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <div class="'+l(o(n(3735)).call(s,"node","mark",{name:"b",hash:{shown:null!=e?u(e,"newFailed"):e},data:a,loc:{start:{line:30,column:24},end:{line:30,column:59}}}))+'">\n                '+l(o(n(3570)).call(s,"newFailed",{name:"allure-icon",hash:{},data:a,loc:{start:{line:31,column:16},end:{line:31,column:43}}}))+"\n            </div>\n"},11:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <div class="'+l(o(n(3735)).call(s,"node","mark",{name:"b",hash:{shown:null!=e?u(e,"newBroken"):e},data:a,loc:{start:{line:35,column:24},end:{line:35,column:59}}}))+'">\n                '+l(o(n(3570)).call(s,"newBroken",{name:"allure-icon",hash:{},data:a,loc:{start:{line:36,column:16},end:{line:36,column:43}}}))+"\n            </div>\n"},13:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <div class="'+l(o(n(3735)).call(s,"node","mark",{name:"b",hash:{shown:null!=e?u(e,"newPassed"):e},data:a,loc:{start:{line:40,column:24},end:{line:40,column:59}}}))+'">\n                '+l(o(n(3570)).call(s,"newPassed",{name:"allure-icon",hash:{},data:a,loc:{start:{line:41,column:16},end:{line:41,column:43}}}))+"\n            </div>\n"},15:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <div class="'+l(o(n(3735)).call(s,"node","mark",{name:"b",hash:{shown:null!=e?u(e,"retriesStatusChange"):e},data:a,loc:{start:{line:45,column:24},end:{line:45,column:69}}}))+'">\n                '+l(o(n(3570)).call(s,"retriesStatusChange",{name:"allure-icon",hash:{},data:a,loc:{start:{line:46,column:16},end:{line:46,column:53}}}))+"\n            </div>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=t.lambda,u=t.escapeExpression,c=null!=e?e:t.nullContext||{},h=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<a class="node node__leaf" href="#'+u(l(null!=e?h(e,"baseUrl"):e,e))+"/"+u(l(null!=e?h(e,"parentUid"):e,e))+"/"+u(l(null!=e?h(e,"uid"):e,e))+"/"+u(l(null!=e?h(e,"testResultTab"):e,e))+'">\n    <div class="node__title" data-uid="'+u(l(null!=e?h(e,"uid"):e,e))+'" data-parentUid="'+u(l(null!=e?h(e,"parentUid"):e,e))+'">\n        <div class="node__anchor">\n            '+u(o(n(3570)).call(c,null!=e?h(e,"status"):e,{name:"allure-icon",hash:{extraClasses:"fa-lg"},data:a,loc:{start:{line:4,column:12},end:{line:4,column:55}}}))+'\n        </div>\n        <div class="node__order">#'+u(l(null!=e?h(e,"order"):e,e))+'</div>\n        <div class="node__name">\n            '+u(l(null!=e?h(e,"name"):e,e))+"\n        </div>\n"+(null!=(s=h(r,"if").call(c,null!=e?h(e,"parameters"):e,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.noop,data:a,loc:{start:{line:10,column:8},end:{line:22,column:15}}}))?s:"")+'        <div class="tree__strut">&nbsp</div>\n'+(null!=(s=h(r,"if").call(c,null!=e?h(e,"flaky"):e,{name:"if",hash:{},fn:t.program(7,a,0),inverse:t.noop,data:a,loc:{start:{line:24,column:8},end:{line:28,column:15}}}))?s:"")+(null!=(s=h(r,"if").call(c,null!=e?h(e,"newFailed"):e,{name:"if",hash:{},fn:t.program(9,a,0),inverse:t.noop,data:a,loc:{start:{line:29,column:8},end:{line:33,column:15}}}))?s:"")+(null!=(s=h(r,"if").call(c,null!=e?h(e,"newBroken"):e,{name:"if",hash:{},fn:t.program(11,a,0),inverse:t.noop,data:a,loc:{start:{line:34,column:8},end:{line:38,column:15}}}))?s:"")+(null!=(s=h(r,"if").call(c,null!=e?h(e,"newPassed"):e,{name:"if",hash:{},fn:t.program(13,a,0),inverse:t.noop,data:a,loc:{start:{line:39,column:8},end:{line:43,column:15}}}))?s:"")+(null!=(s=h(r,"if").call(c,null!=e?h(e,"retriesStatusChange"):e,{name:"if",hash:{},fn:t.program(15,a,0),inverse:t.noop,data:a,loc:{start:{line:44,column:8},end:{line:48,column:15}}}))?s:"")+'        <div class="node__stats">'+u(o(n(5969)).call(c,null!=(s=null!=e?h(e,"time"):e)?h(s,"duration"):s,{name:"duration",hash:{},data:a,loc:{start:{line:50,column:12},end:{line:50,column:40}}}))+"</div>\n    </div>\n</a>\n"},useData:!0})},7085:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s=t.lambda,l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <span class="node__time" data-tooltip="'+l(s(null!=e?u(e,"tooltip"):e,e))+'">\n        '+l(s(null!=e?u(e,"name"):e,e))+":\n        <b>"+l(o(n(5969)).call(null!=e?e:t.nullContext||{},null!=e?u(e,"value"):e,{name:"duration",hash:{},data:a,loc:{start:{line:4,column:11},end:{line:4,column:29}}}))+"</b>\n    </span>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=u(r,"if").call(l,o(n(279)).call(l,null!=e?u(e,"value"):e,{name:"is-def",hash:{},data:a,loc:{start:{line:1,column:6},end:{line:1,column:20}}}),{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.noop,data:a,loc:{start:{line:1,column:0},end:{line:6,column:7}}}))?s:""},useData:!0})},5917:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a,s,l){var u=t.lambda,c=t.escapeExpression,h=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"        <"+c(u(null!=l[1]?h(l[1],"rowTag"):l[1],e))+' class="table__row" href="#'+c(u(null!=l[1]?h(l[1],"baseUrl"):l[1],e))+"/"+c(u(null!=e?h(e,"uid"):e,e))+'">\n            <div class="table__col">'+c(u(null!=e?h(e,"name"):e,e))+'</div>\n            <div class="table__col">\n                '+c(o(n(4883)).call(null!=e?e:t.nullContext||{},null!=e?h(e,"statistic"):e,{name:"status-bar",hash:{},data:a,loc:{start:{line:10,column:16},end:{line:10,column:40}}}))+"\n            </div>\n        </"+c(u(null!=l[1]?h(l[1],"rowTag"):l[1],e))+">\n"},3:function(t,e,r,i,a){var s=t.escapeExpression,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <a class="table__row" href="#'+s(t.lambda(null!=e?l(e,"baseUrl"):e,e))+'">\n            <div class="table__col table__col_center">\n                '+s(o(n(9237)).call(null!=e?e:t.nullContext||{},"component.widgetStatus.showAll",{name:"t",hash:{},data:a,loc:{start:{line:17,column:16},end:{line:17,column:54}}}))+"\n            </div>\n        </a>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a,s,l){var u,c=null!=e?e:t.nullContext||{},h=t.escapeExpression,f=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<h2 class="widget__title">\n    '+h(o(n(9237)).call(c,null!=e?f(e,"title"):e,{name:"t",hash:{},data:a,loc:{start:{line:2,column:4},end:{line:2,column:15}}}))+'\n    <span class="widget__subtitle">'+h(o(n(9237)).call(c,"component.widgetStatus.total",{name:"t",hash:{count:null!=e?f(e,"total"):e},data:a,loc:{start:{line:3,column:35},end:{line:3,column:83}}}))+'</span>\n</h2>\n<div class="table table_hover widget__table">\n'+(null!=(u=f(r,"each").call(c,null!=e?f(e,"items"):e,{name:"each",hash:{},fn:t.program(1,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:6,column:4},end:{line:13,column:13}}}))?u:"")+(null!=(u=f(r,"if").call(c,null!=e?f(e,"showAll"):e,{name:"if",hash:{},fn:t.program(3,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:14,column:4},end:{line:20,column:11}}}))?u:"")+"</div>\n"},useData:!0,useDepths:!0})},4821:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression;return'<div class="'+l(o(n(3735)).call(s,"app","nav",{name:"b",hash:{},data:a,loc:{start:{line:1,column:12},end:{line:1,column:29}}}))+'"></div>\n<div class="'+l(o(n(3735)).call(s,"app","content",{name:"b",hash:{},data:a,loc:{start:{line:2,column:12},end:{line:2,column:33}}}))+'"></div>\n'},useData:!0})},424:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=null!=e?e:t.nullContext||{},s=t.hooks.helperMissing,l="function",u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="timeline__body">\n    <div class=\'timeline__chart\'>\n        <svg class="timeline__chart_svg">\n            <g transform="translate('+u(typeof(i=null!=(i=c(n,"PADDING")||(null!=e?c(e,"PADDING"):e))?i:s)===l?i.call(a,{name:"PADDING",hash:{},data:o,loc:{start:{line:4,column:36},end:{line:4,column:47}}}):i)+', 15)">\n                <g class="timeline__slider"/>\n                <g class="timeline__plot" transform="translate(0, '+u(typeof(i=null!=(i=c(n,"PADDING")||(null!=e?c(e,"PADDING"):e))?i:s)===l?i.call(a,{name:"PADDING",hash:{},data:o,loc:{start:{line:6,column:66},end:{line:6,column:77}}}):i)+')">\n                    <g class="timeline__chart__axis timeline__chart__axis_x"/>\n                </g>\n            </g>\n        </svg>\n    </div>\n    <div class=\'timeline__brush\'>\n        <svg class="timeline__brush_svg">\n            <g class="timeline__brush__axis timeline__brush__axis_x"/>\n        </svg>\n    </div>\n</div>'},useData:!0})},1166:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({1:function(t,e,r,o,i){var a,s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"    "+t.escapeExpression((s=n(9237),s&&(s.__esModule?s.default:s)).call(l,"testResult.categories.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:4},end:{line:2,column:38}}}))+":\n"+(null!=(a=u(r,"each").call(l,null!=e?u(e,"categories"):e,{name:"each",hash:{},fn:t.program(2,i,0),inverse:t.noop,data:i,loc:{start:{line:3,column:4},end:{line:5,column:13}}}))?a:"")},2:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"        <span>"+t.escapeExpression(t.lambda(null!=e?i(e,"name"):e,e))+" </span>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"if").call(null!=e?e:t.nullContext||{},null!=e?a(e,"categories"):e,{name:"if",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:6,column:7}}}))?i:""},useData:!0})},9592:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({1:function(t,e,r,o,i){var a,s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <h3 class="pane__section-title">'+t.escapeExpression((s=n(9237),s&&(s.__esModule?s.default:s)).call(null!=e?e:t.nullContext||{},"testResult.description.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:36},end:{line:2,column:71}}}))+'</h3>\n    <div class="description__text">'+(null!=(a=t.lambda(null!=e?l(e,"descriptionHtml"):e,e))?a:"")+"</div>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"if").call(null!=e?e:t.nullContext||{},null!=e?a(e,"descriptionHtml"):e,{name:"if",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:4,column:7}}}))?i:""},useData:!0})},2694:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <span data-tooltip="'+u(o(n(9241)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"start"):s,{name:"date",hash:{},data:a,loc:{start:{line:2,column:24},end:{line:2,column:43}}}))+" "+u(o(n(4336)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"start"):s,{name:"time",hash:{},data:a,loc:{start:{line:2,column:44},end:{line:2,column:63}}}))+"&nbsp;&ndash;&nbsp;"+u(o(n(4336)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"stop"):s,{name:"time",hash:{},data:a,loc:{start:{line:2,column:82},end:{line:2,column:100}}}))+'">\n        '+u(o(n(9237)).call(l,"testResult.duration.name",{name:"t",hash:{},data:a,loc:{start:{line:3,column:8},end:{line:3,column:40}}}))+':\n        <span class="fa fa-clock-o"></span>\n        '+u(o(n(5969)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"duration"):s,2,{name:"duration",hash:{},data:a,loc:{start:{line:5,column:8},end:{line:5,column:36}}}))+"\n    </span>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"if").call(null!=e?e:t.nullContext||{},null!=e?a(e,"time"):e,{name:"if",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:7,column:7}}}))?i:""},useData:!0})},9140:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a,s,l){var u,c=null!=e?e:t.nullContext||{},h=t.escapeExpression,f=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <div class="'+h(o(n(3735)).call(c,null!=e?f(e,"cls"):e,"success-rate",{name:"b",hash:{},data:a,loc:{start:{line:3,column:20},end:{line:3,column:44}}}))+'">\n            '+h(o(n(9237)).call(c,"testResult.history.successRate",{name:"t",hash:{},data:a,loc:{start:{line:4,column:12},end:{line:4,column:50}}}))+" "+h(t.lambda(null!=e?f(e,"successRate"):e,e))+"\n"+(null!=(u=f(r,"if").call(c,null!=(u=null!=(u=null!=e?f(e,"history"):e)?f(u,"statistic"):u)?f(u,"total"):u,{name:"if",hash:{},fn:t.program(2,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:5,column:12},end:{line:7,column:19}}}))?u:"")+"        </div>\n"+(null!=(u=f(r,"each").call(c,null!=(u=null!=e?f(e,"history"):e)?f(u,"items"):u,{name:"each",hash:{},fn:t.program(4,a,0,s,l),inverse:t.noop,data:a,loc:{start:{line:9,column:8},end:{line:23,column:17}}}))?u:"")},2:function(t,e,r,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"                ("+t.escapeExpression(o(n(9237)).call(null!=e?e:t.nullContext||{},"testResult.history.statistic",{name:"t",hash:{total:null!=(s=null!=(s=null!=e?l(e,"history"):e)?l(s,"statistic"):s)?l(s,"total"):s,passed:null!=(s=null!=(s=null!=e?l(e,"history"):e)?l(s,"statistic"):s)?l(s,"passed"):s},data:a,loc:{start:{line:6,column:17},end:{line:6,column:115}}}))+")\n"},4:function(t,e,n,r,o,i,a){var s,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(s=l(n,"if").call(null!=e?e:t.nullContext||{},null!=e?l(e,"reportUrl"):e,{name:"if",hash:{},fn:t.program(5,o,0,i,a),inverse:t.program(7,o,0,i,a),data:o,loc:{start:{line:10,column:12},end:{line:22,column:19}}}))?s:""},5:function(t,e,r,i,a,s,l){var u,c=null!=e?e:t.nullContext||{},h=t.escapeExpression,f=t.lambda,p=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'                <div class="'+h(o(n(3735)).call(c,null!=l[1]?p(l[1],"cls"):l[1],"row",{name:"b",hash:{},data:a,loc:{start:{line:11,column:28},end:{line:11,column:46}}}))+'">\n                    <a class="link" href="'+h(f(null!=e?p(e,"reportUrl"):e,e))+'" target="_blank">\n                        <span class="label label_status_'+h(f(null!=e?p(e,"status"):e,e))+'">'+h(f(null!=e?p(e,"status"):e,e))+"</span>\n                        <span>"+h(o(n(9237)).call(c,"testResult.history.time",{name:"t",hash:{time:o(n(4336)).call(c,null!=(u=null!=e?p(e,"time"):e)?p(u,"start"):u,{name:"time",hash:{},data:a,loc:{start:{line:14,column:88},end:{line:14,column:105}}}),date:o(n(9241)).call(c,null!=(u=null!=e?p(e,"time"):e)?p(u,"start"):u,{name:"date",hash:{},data:a,loc:{start:{line:14,column:65},end:{line:14,column:82}}})},data:a,loc:{start:{line:14,column:30},end:{line:14,column:107}}}))+"</span>\n                    </a>\n                </div>\n"},7:function(t,e,r,i,a){var s,l=t.lambda,u=t.escapeExpression,c=null!=e?e:t.nullContext||{},h=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'                <div>\n                    <span class="label label_status_'+u(l(null!=e?h(e,"status"):e,e))+'">'+u(l(null!=e?h(e,"status"):e,e))+"</span>\n                    <span>"+u(o(n(9237)).call(c,"testResult.history.time",{name:"t",hash:{time:o(n(4336)).call(c,null!=(s=null!=e?h(e,"time"):e)?h(s,"start"):s,{name:"time",hash:{},data:a,loc:{start:{line:20,column:84},end:{line:20,column:101}}}),date:o(n(9241)).call(c,null!=(s=null!=e?h(e,"time"):e)?h(s,"start"):s,{name:"date",hash:{},data:a,loc:{start:{line:20,column:61},end:{line:20,column:78}}})},data:a,loc:{start:{line:20,column:26},end:{line:20,column:103}}}))+"</span>\n                </div>\n"},9:function(t,e,r,i,a){return"        "+t.escapeExpression(o(n(9237)).call(null!=e?e:t.nullContext||{},"testResult.history.empty",{name:"t",hash:{},data:a,loc:{start:{line:25,column:8},end:{line:25,column:40}}}))+"\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a,s,l){var u,c=null!=e?e:t.nullContext||{},h=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+t.escapeExpression(o(n(3735)).call(c,"pane","section",{name:"b",hash:{},data:a,loc:{start:{line:1,column:12},end:{line:1,column:34}}}))+'">\n'+(null!=(u=h(r,"if").call(c,null!=e?h(e,"history"):e,{name:"if",hash:{},fn:t.program(1,a,0,s,l),inverse:t.program(9,a,0,s,l),data:a,loc:{start:{line:2,column:4},end:{line:26,column:11}}}))?u:"")+"</div>"},useData:!0,useDepths:!0})},7552:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <h3 class="pane__section-title">'+t.escapeExpression(o(n(9237)).call(l,"testResult.links.name",{name:"t",hash:{},data:a,loc:{start:{line:2,column:36},end:{line:2,column:65}}}))+"</h3>\n"+(null!=(s=u(r,"each").call(l,null!=e?u(e,"links"):e,{name:"each",hash:{},fn:t.program(2,a,0),inverse:t.noop,data:a,loc:{start:{line:3,column:4},end:{line:13,column:13}}}))?s:"")},2:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <span class="testresult-link">\n'+(null!=(s=c(r,"if").call(l,o(n(7243)).call(l,null!=e?c(e,"type"):e,"issue",{name:"eq",hash:{},data:a,loc:{start:{line:5,column:14},end:{line:5,column:31}}}),{name:"if",hash:{},fn:t.program(3,a,0),inverse:t.noop,data:a,loc:{start:{line:5,column:8},end:{line:7,column:15}}}))?s:"")+(null!=(s=c(r,"if").call(l,o(n(7243)).call(l,null!=e?c(e,"type"):e,"tms",{name:"eq",hash:{},data:a,loc:{start:{line:8,column:14},end:{line:8,column:29}}}),{name:"if",hash:{},fn:t.program(5,a,0),inverse:t.noop,data:a,loc:{start:{line:8,column:8},end:{line:10,column:15}}}))?s:"")+'        <a class="link" href="'+u(o(n(2164)).call(l,null!=e?c(e,"url"):e,null!=e?c(e,"name"):e,{name:"default",hash:{},data:a,loc:{start:{line:11,column:30},end:{line:11,column:50}}}))+'" target="_blank">'+u(o(n(2164)).call(l,null!=e?c(e,"name"):e,null!=e?c(e,"url"):e,"link",{name:"default",hash:{},data:a,loc:{start:{line:11,column:68},end:{line:11,column:95}}}))+"</a>\n    </span>\n"},3:function(t,e,n,r,o){return'            <span class="fa fa-bug"></span>\n'},5:function(t,e,n,r,o){return'            <span class="fa fa-database"></span>\n'},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"if").call(null!=e?e:t.nullContext||{},null!=e?a(e,"links"):e,{name:"if",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:14,column:7}}}))?i:""},useData:!0})},6452:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({1:function(t,e,r,o,i){var a,s=t.escapeExpression,l=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <h3 class="pane__section-title">'+s((a=n(9237),a&&(a.__esModule?a.default:a)).call(null!=e?e:t.nullContext||{},"testResult.owner.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:36},end:{line:2,column:65}}}))+"</h3>\n    <div>"+s(t.lambda(null!=e?l(e,"owner"):e,e))+"</div>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"if").call(null!=e?e:t.nullContext||{},null!=e?a(e,"owner"):e,{name:"if",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:4,column:7}}}))?i:""},useData:!0})},5774:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"<h3>"+t.escapeExpression(o(n(9237)).call(l,"testResult.parameters.name",{name:"t",hash:{},data:a,loc:{start:{line:2,column:4},end:{line:2,column:38}}}))+"</h3>\n"+(null!=(s=u(r,"each").call(l,null!=e?u(e,"parameters"):e,{name:"each",hash:{},fn:t.program(2,a,0),inverse:t.noop,data:a,loc:{start:{line:3,column:4},end:{line:12,column:13}}}))?s:"")},2:function(t,e,n,r,o){var i,a=null!=e?e:t.nullContext||{},s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <div class="environment long-line line-ellipsis">\n            <span class="environment__key">'+(null!=(i=s(n,"if").call(a,null!=e?s(e,"name"):e,{name:"if",hash:{},fn:t.program(3,o,0),inverse:t.program(5,o,0),data:o,loc:{start:{line:5,column:43},end:{line:5,column:90}}}))?i:"")+"</span>:\n"+(null!=(i=s(n,"if").call(a,null!=e?s(e,"value"):e,{name:"if",hash:{},fn:t.program(7,o,0),inverse:t.program(9,o,0),data:o,loc:{start:{line:6,column:12},end:{line:10,column:19}}}))?i:"")+"        </div>\n"},3:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return t.escapeExpression(t.lambda(null!=e?i(e,"name"):e,e))},5:function(t,e,n,r,o){return"&lt;null&gt;"},7:function(t,e,r,i,a){var s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"                <span>"+t.escapeExpression(o(n(2458)).call(null!=e?e:t.nullContext||{},null!=e?s(e,"value"):e,{name:"linky",hash:{},data:a,loc:{start:{line:7,column:22},end:{line:7,column:37}}}))+"</span>\n"},9:function(t,e,n,r,o){return"                null\n"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"if").call(null!=e?e:t.nullContext||{},null!=(i=null!=e?a(e,"parameters"):e)?a(i,"length"):i,{name:"if",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:13,column:7}}}))?i:""},useData:!0})},9500:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"each").call(null!=e?e:t.nullContext||{},null!=e?a(e,"retries"):e,{name:"each",hash:{},fn:t.program(2,o,0),inverse:t.noop,data:o,loc:{start:{line:3,column:8},end:{line:9,column:17}}}))?i:""},2:function(t,e,r,i,a){var s,l=t.lambda,u=t.escapeExpression,c=null!=e?e:t.nullContext||{},h=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <a class="link" href="#/testresult/'+u(l(null!=e?h(e,"uid"):e,e))+'">\n                <span class="label label_status_'+u(l(null!=e?h(e,"status"):e,e))+'">'+u(l(null!=e?h(e,"status"):e,e))+"</span>\n                <span>"+u(o(n(9237)).call(c,"testResult.retries.time",{name:"t",hash:{date:o(n(4336)).call(c,null!=(s=null!=e?h(e,"time"):e)?h(s,"start"):s,{name:"time",hash:{},data:a,loc:{start:{line:6,column:80},end:{line:6,column:97}}}),time:o(n(9241)).call(c,null!=(s=null!=e?h(e,"time"):e)?h(s,"start"):s,{name:"date",hash:{},data:a,loc:{start:{line:6,column:57},end:{line:6,column:74}}})},data:a,loc:{start:{line:6,column:22},end:{line:6,column:99}}}))+'</span>\n                <pre class="preformated-text"><code>'+u(l(null!=e?h(e,"statusDetails"):e,e))+"</code></pre>\n            </a>\n"},4:function(t,e,r,i,a){return"        "+t.escapeExpression(o(n(9237)).call(null!=e?e:t.nullContext||{},"testResult.retries.empty",{name:"t",hash:{},data:a,loc:{start:{line:11,column:8},end:{line:11,column:40}}}))+"\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+t.escapeExpression(o(n(3735)).call(l,"pane","section",{name:"b",hash:{},data:a,loc:{start:{line:1,column:12},end:{line:1,column:34}}}))+'">\n'+(null!=(s=u(r,"if").call(l,null!=e?u(e,"retries"):e,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.program(4,a,0),data:a,loc:{start:{line:2,column:4},end:{line:12,column:11}}}))?s:"")+"</div>"},useData:!0})},1428:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"    "+l(o(n(9237)).call(s,"testResult.severity.name",{name:"t",hash:{},data:a,loc:{start:{line:2,column:4},end:{line:2,column:36}}}))+":\n    "+l(o(n(9237)).call(s,o(n(109)).call(s,"testResult.severity.",null!=e?u(e,"severity"):e,{name:"concat",hash:{},data:a,loc:{start:{line:3,column:8},end:{line:3,column:48}}}),{name:"t",hash:{},data:a,loc:{start:{line:3,column:4},end:{line:3,column:50}}}))+"\n"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"if").call(null!=e?e:t.nullContext||{},null!=e?a(e,"severity"):e,{name:"if",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:4,column:7}}}))?i:""},useData:!0})},628:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({1:function(t,e,r,o,i){var a,s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"    "+t.escapeExpression((s=n(9237),s&&(s.__esModule?s.default:s)).call(l,"testResult.tags.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:4},end:{line:2,column:32}}}))+": "+(null!=(a=u(r,"each").call(l,null!=e?u(e,"tags"):e,{name:"each",hash:{},fn:t.program(2,i,0),inverse:t.noop,data:i,loc:{start:{line:2,column:34},end:{line:4,column:13}}}))?a:"")},2:function(t,e,n,r,o){var i;return'\n        <span class="label label__info">'+(null!=(i=(t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]})(n,"if").call(null!=e?e:t.nullContext||{},e,{name:"if",hash:{},fn:t.program(3,o,0),inverse:t.program(5,o,0),data:o,loc:{start:{line:3,column:40},end:{line:3,column:79}}}))?i:"")+"</span>\n"},3:function(t,e,n,r,o){return t.escapeExpression(t.lambda(e,e))},5:function(t,e,n,r,o){return"null"},compiler:[8,">= 4.3.0"],main:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"if").call(null!=e?e:t.nullContext||{},null!=e?a(e,"tags"):e,{name:"if",hash:{},fn:t.program(1,o,0),inverse:t.noop,data:o,loc:{start:{line:1,column:0},end:{line:5,column:7}}}))?i:""},useData:!0})},3972:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,o,i){return'<h2 class="widget__title">\n    '+t.escapeExpression((a=n(9237),a&&(a.__esModule?a.default:a)).call(null!=e?e:t.nullContext||{},"widget.categoriesTrend.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:4},end:{line:2,column:39}}}))+'\n</h2>\n<div class="categories-trend__chart"></div>\n';var a},useData:!0})},1360:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,o,i){return'<h2 class="widget__title">\n    '+t.escapeExpression((a=n(9237),a&&(a.__esModule?a.default:a)).call(null!=e?e:t.nullContext||{},"widget.durationTrend.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:4},end:{line:2,column:37}}}))+'\n</h2>\n<div class="duration-trend__chart"></div>\n';var a},useData:!0})},5549:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,o,i){return'<h2 class="widget__title">\n    '+t.escapeExpression((a=n(9237),a&&(a.__esModule?a.default:a)).call(null!=e?e:t.nullContext||{},"chart.duration.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:4},end:{line:2,column:31}}}))+'\n</h2>\n<div class="duration-widget__content chart__body"></div>';var a},useData:!0})},4e3:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,n,r,o){var i,a=null!=e?e:t.nullContext||{},s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <div class="table  table_hover widget__table">\n'+(null!=(i=s(n,"each").call(a,null!=e?s(e,"items"):e,{name:"each",hash:{},fn:t.program(2,o,0),inverse:t.noop,data:o,loc:{start:{line:6,column:4},end:{line:17,column:13}}}))?i:"")+(null!=(i=s(n,"if").call(a,null!=e?s(e,"overLimit"):e,{name:"if",hash:{},fn:t.program(6,o,0),inverse:t.noop,data:o,loc:{start:{line:18,column:4},end:{line:22,column:11}}}))?i:"")+"    </div>\n\n"},2:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'        <div class="'+u(o(n(3735)).call(l,"table","row",{name:"b",hash:{},data:a,loc:{start:{line:7,column:20},end:{line:7,column:39}}}))+'" disabled>\n            <div class="'+u(o(n(3735)).call(l,"table","col",{name:"b",hash:{},data:a,loc:{start:{line:8,column:24},end:{line:8,column:43}}}))+' long-line">\n                '+u(t.lambda(null!=e?c(e,"name"):e,e))+'\n            </div>\n            <div class="'+u(o(n(3735)).call(l,"table","col",{name:"b",hash:{},data:a,loc:{start:{line:11,column:24},end:{line:11,column:43}}}))+' long-line">\n'+(null!=(s=c(r,"each").call(l,null!=e?c(e,"values"):e,{name:"each",hash:{},fn:t.program(3,a,0),inverse:t.noop,data:a,loc:{start:{line:12,column:16},end:{line:14,column:25}}}))?s:"")+"            </div>\n        </div>\n"},3:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"                    "+t.escapeExpression(o(n(2458)).call(l,e,{name:"linky",hash:{},data:a,loc:{start:{line:13,column:20},end:{line:13,column:34}}}))+(null!=(s=u(r,"unless").call(l,a&&u(a,"last"),{name:"unless",hash:{},fn:t.program(4,a,0),inverse:t.noop,data:a,loc:{start:{line:13,column:34},end:{line:13,column:67}}}))?s:"")+"\n"},4:function(t,e,n,r,o){return",<br>"},6:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression;return'        <a class="'+l(o(n(3735)).call(s,"table","row",{name:"b",hash:{},data:a,loc:{start:{line:19,column:18},end:{line:19,column:37}}}))+' clickable environment-widget__expand">\n            <div class="'+l(o(n(3735)).call(s,"table","col",{name:"b",hash:{center:!0},data:a,loc:{start:{line:20,column:24},end:{line:20,column:55}}}))+'">'+l(o(n(9237)).call(s,"widget.environment.showAll",{name:"t",hash:{},data:a,loc:{start:{line:20,column:57},end:{line:20,column:91}}}))+"</div>\n        </a>\n"},8:function(t,e,r,i,a){return'    <div class="widget__noitems">'+t.escapeExpression(o(n(9237)).call(null!=e?e:t.nullContext||{},"widget.environment.empty",{name:"t",hash:{},data:a,loc:{start:{line:26,column:33},end:{line:26,column:65}}}))+"</div>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<h2 class="widget__title">\n    '+t.escapeExpression(o(n(9237)).call(l,"widget.environment.name",{name:"t",hash:{},data:a,loc:{start:{line:2,column:4},end:{line:2,column:35}}}))+"\n</h2>\n"+(null!=(s=u(r,"if").call(l,null!=e?u(e,"items"):e,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.program(8,a,0),data:a,loc:{start:{line:4,column:0},end:{line:27,column:7}}}))?s:"")},useData:!0})},4538:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,n,r,o){var i,a=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return null!=(i=a(n,"each").call(null!=e?e:t.nullContext||{},null!=e?a(e,"items"):e,{name:"each",hash:{},fn:t.program(2,o,0),inverse:t.noop,data:o,loc:{start:{line:6,column:4},end:{line:30,column:13}}}))?i:""},2:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lambda,h=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'    <span class="table__row">\n        <div class="'+u(o(n(3735)).call(l,"table","col",{name:"b",hash:{},data:a,loc:{start:{line:8,column:20},end:{line:8,column:39}}}))+' executor">\n            <span class="executor-icon executor-icon__'+u(c(null!=e?h(e,"type"):e,e))+'">&nbsp;</span>\n            '+u(c(null!=e?h(e,"name"):e,e))+"\n        </div>\n"+(null!=(s=h(r,"if").call(l,null!=e?h(e,"buildName"):e,{name:"if",hash:{},fn:t.program(3,a,0),inverse:t.program(8,a,0),data:a,loc:{start:{line:12,column:8},end:{line:28,column:15}}}))?s:"")+"    </span>\n"},3:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'            <div class="'+t.escapeExpression(o(n(3735)).call(l,"table","col",{name:"b",hash:{right:!0},data:a,loc:{start:{line:13,column:24},end:{line:13,column:54}}}))+' executor">\n'+(null!=(s=u(r,"if").call(l,null!=e?u(e,"buildUrl"):e,{name:"if",hash:{},fn:t.program(4,a,0),inverse:t.program(6,a,0),data:a,loc:{start:{line:14,column:16},end:{line:21,column:23}}}))?s:"")+"\n            </div>\n"},4:function(t,e,n,r,o){var i=t.lambda,a=t.escapeExpression,s=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'                    <a class="link" href="'+a(i(null!=e?s(e,"buildUrl"):e,e))+'">\n                        '+a(i(null!=e?s(e,"buildName"):e,e))+'\n                        <span class="fa fa-external-link"></span>\n                    </a>\n'},6:function(t,e,n,r,o){var i=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"                    "+t.escapeExpression(t.lambda(null!=e?i(e,"buildName"):e,e))+"\n"},8:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression;return'            <div class="'+l(o(n(3735)).call(s,"table","col",{name:"b",hash:{right:!0},data:a,loc:{start:{line:25,column:24},end:{line:25,column:54}}}))+'">\n                '+l(o(n(9237)).call(s,"widget.executors.unknown",{name:"t",hash:{},data:a,loc:{start:{line:26,column:16},end:{line:26,column:48}}}))+"\n            </div>\n"},10:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression;return'    <div class="table__row">\n        <div class="'+l(o(n(3735)).call(s,"table","col",{name:"b",hash:{center:!0},data:a,loc:{start:{line:33,column:20},end:{line:33,column:51}}}))+'">\n            '+l(o(n(9237)).call(s,"widget.executors.empty",{name:"t",hash:{},data:a,loc:{start:{line:34,column:12},end:{line:34,column:42}}}))+"\n        </div>\n    </div>\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<h2 class="widget__title">\n    '+t.escapeExpression(o(n(9237)).call(l,"widget.executors.name",{name:"t",hash:{},data:a,loc:{start:{line:2,column:4},end:{line:2,column:33}}}))+'\n</h2>\n<div class="table table_hover widget__table">\n'+(null!=(s=u(r,"if").call(l,null!=e?u(e,"items"):e,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.program(10,a,0),data:a,loc:{start:{line:5,column:0},end:{line:37,column:7}}}))?s:"")+"</div>\n"},useData:!0})},1650:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,o,i){return'<h2 class="widget__title">\n    '+t.escapeExpression((a=n(9237),a&&(a.__esModule?a.default:a)).call(null!=e?e:t.nullContext||{},"widget.trend.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:4},end:{line:2,column:29}}}))+'\n</h2>\n<div class="history-trend__chart"></div>\n';var a},useData:!0})},4990:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,o,i){return'<h2 class="widget__title">\n    '+t.escapeExpression((a=n(9237),a&&(a.__esModule?a.default:a)).call(null!=e?e:t.nullContext||{},"widget.retryTrend.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:4},end:{line:2,column:34}}}))+'\n</h2>\n<div class="retry-trend__chart"></div>\n';var a},useData:!0})},1463:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,o,i){return'<h2 class="widget__title">\n    '+t.escapeExpression((a=n(9237),a&&(a.__esModule?a.default:a)).call(null!=e?e:t.nullContext||{},"chart.severity.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:4},end:{line:2,column:31}}}))+'\n</h2>\n<div class="severity-widget__content chart__body"></div>';var a},useData:!0})},1585:function(t,e,n){var r=n(3633);t.exports=(r.default||r).template({compiler:[8,">= 4.3.0"],main:function(t,e,r,o,i){return'<h2 class="widget__title">\n    '+t.escapeExpression((a=n(9237),a&&(a.__esModule?a.default:a)).call(null!=e?e:t.nullContext||{},"chart.status.name",{name:"t",hash:{},data:i,loc:{start:{line:2,column:4},end:{line:2,column:29}}}))+'\n</h2>\n<div class="status-widget__content chart__body"></div>\n';var a},useData:!0})},5459:function(t,e,n){var r=n(3633);function o(t){return t&&(t.__esModule?t.default:t)}t.exports=(r.default||r).template({1:function(t,e,r,i,a){var s=null!=e?e:t.nullContext||{},l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"                "+l(o(n(9237)).call(s,"widget.summary.aggregatedName",{name:"t",hash:{},data:a,loc:{start:{line:5,column:16},end:{line:5,column:53}}}))+'\n                <span class="'+l(o(n(3735)).call(s,"widget","subtitle",{name:"b",hash:{},data:a,loc:{start:{line:6,column:29},end:{line:6,column:54}}}))+'">'+l(t.lambda(null!=e?u(e,"launchesCount"):e,e))+" "+l(o(n(9237)).call(s,"widget.summary.launches",{name:"t",hash:{count:null!=e?u(e,"launchesCount"):e},data:a,loc:{start:{line:6,column:74},end:{line:6,column:125}}}))+"</span>\n"},3:function(t,e,r,i,a){var s,l=t.escapeExpression,u=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return"                "+l(t.lambda(null!=e?u(e,"reportName"):e,e))+" "+l(o(n(9241)).call(null!=e?e:t.nullContext||{},null!=(s=null!=e?u(e,"time"):e)?u(s,"stop"):s,{name:"date",hash:{},data:a,loc:{start:{line:8,column:31},end:{line:8,column:49}}}))+"\n"},compiler:[8,">= 4.3.0"],main:function(t,e,r,i,a){var s,l=null!=e?e:t.nullContext||{},u=t.escapeExpression,c=t.lookupProperty||function(t,e){if(Object.prototype.hasOwnProperty.call(t,e))return t[e]};return'<div class="'+u(o(n(3735)).call(l,"widget","flex-line",{name:"b",hash:{},data:a,loc:{start:{line:1,column:12},end:{line:1,column:38}}}))+'">\n    <div class="'+u(o(n(3735)).call(l,"widget","column",{name:"b",hash:{},data:a,loc:{start:{line:2,column:16},end:{line:2,column:39}}}))+'">\n        <h2 class="'+u(o(n(3735)).call(l,"widget","title",{name:"b",hash:{},data:a,loc:{start:{line:3,column:19},end:{line:3,column:41}}}))+'">\n'+(null!=(s=c(r,"if").call(l,null!=e?c(e,"isAggregated"):e,{name:"if",hash:{},fn:t.program(1,a,0),inverse:t.program(3,a,0),data:a,loc:{start:{line:4,column:12},end:{line:9,column:19}}}))?s:"")+'            <div class="'+u(o(n(3735)).call(l,"widget","subtitle",{name:"b",hash:{},data:a,loc:{start:{line:10,column:24},end:{line:10,column:49}}}))+'">\n                '+u(o(n(4336)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"start"):s,{name:"time",hash:{},data:a,loc:{start:{line:11,column:16},end:{line:11,column:35}}}))+" - "+u(o(n(4336)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"stop"):s,{name:"time",hash:{},data:a,loc:{start:{line:11,column:38},end:{line:11,column:56}}}))+" ("+u(o(n(5969)).call(l,null!=(s=null!=e?c(e,"time"):e)?c(s,"duration"):s,2,{name:"duration",hash:{},data:a,loc:{start:{line:11,column:58},end:{line:11,column:86}}}))+')\n            </div>\n        </h2>\n        <div class="'+u(o(n(3735)).call(l,"summary-widget","stats",{name:"b",hash:{},data:a,loc:{start:{line:14,column:20},end:{line:14,column:50}}}))+' splash">\n            <div class="'+u(o(n(3735)).call(l,"splash","title",{name:"b",hash:{},data:a,loc:{start:{line:15,column:24},end:{line:15,column:46}}}))+'">'+u(t.lambda(null!=(s=null!=e?c(e,"statistic"):e)?c(s,"total"):s,e))+'</div>\n            <div class="'+u(o(n(3735)).call(l,"splash","subtitle",{name:"b",hash:{},data:a,loc:{start:{line:16,column:24},end:{line:16,column:49}}}))+'">'+u(o(n(9237)).call(l,"widget.summary.testResults",{name:"t",hash:{count:null!=(s=null!=e?c(e,"statistic"):e)?c(s,"total"):s},data:a,loc:{start:{line:16,column:51},end:{line:16,column:107}}}))+'</div>\n        </div>\n    </div>\n    <div class="'+u(o(n(3735)).call(l,"widget","column",{name:"b",hash:{},data:a,loc:{start:{line:19,column:16},end:{line:19,column:39}}}))+" "+u(o(n(3735)).call(l,"summary-widget","chart",{name:"b",hash:{},data:a,loc:{start:{line:19,column:40},end:{line:19,column:70}}}))+'"></div>\n</div>\n'},useData:!0})},261:function(t,e,n){"use strict";function r(t){return t&&t.__esModule?t:{default:t}}function o(t){if(t&&t.__esModule)return t;var e={};if(null!=t)for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&(e[n]=t[n]);return e.default=t,e}e.__esModule=!0;var i=o(n(2871)),a=r(n(9613)),s=r(n(3769)),l=o(n(2849)),u=o(n(7624)),c=r(n(1148));function h(){var t=new i.HandlebarsEnvironment;return l.extend(t,i),t.SafeString=a.default,t.Exception=s.default,t.Utils=l,t.escapeExpression=l.escapeExpression,t.VM=u,t.template=function(e){return u.template(e,t)},t}var f=h();f.create=h,c.default(f),f.default=f,e.default=f,t.exports=e.default},2871:function(t,e,n){"use strict";function r(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.HandlebarsEnvironment=h;var o=n(2849),i=r(n(3769)),a=n(2277),s=n(5940),l=r(n(8185)),u=n(3865);e.VERSION="4.7.8";e.COMPILER_REVISION=8;e.LAST_COMPATIBLE_COMPILER_REVISION=7;e.REVISION_CHANGES={1:"<= 1.0.rc.2",2:"== 1.0.0-rc.3",3:"== 1.0.0-rc.4",4:"== 1.x.x",5:"== 2.0.0-alpha.x",6:">= 2.0.0-beta.1",7:">= 4.0.0 <4.3.0",8:">= 4.3.0"};var c="[object Object]";function h(t,e,n){this.helpers=t||{},this.partials=e||{},this.decorators=n||{},a.registerDefaultHelpers(this),s.registerDefaultDecorators(this)}h.prototype={constructor:h,logger:l.default,log:l.default.log,registerHelper:function(t,e){if(o.toString.call(t)===c){if(e)throw new i.default("Arg not supported with multiple helpers");o.extend(this.helpers,t)}else this.helpers[t]=e},unregisterHelper:function(t){delete this.helpers[t]},registerPartial:function(t,e){if(o.toString.call(t)===c)o.extend(this.partials,t);else{if(void 0===e)throw new i.default('Attempting to register a partial called "'+t+'" as undefined');this.partials[t]=e}},unregisterPartial:function(t){delete this.partials[t]},registerDecorator:function(t,e){if(o.toString.call(t)===c){if(e)throw new i.default("Arg not supported with multiple decorators");o.extend(this.decorators,t)}else this.decorators[t]=e},unregisterDecorator:function(t){delete this.decorators[t]},resetLoggedPropertyAccesses:function(){u.resetLoggedProperties()}};var f=l.default.log;e.log=f,e.createFrame=o.createFrame,e.logger=l.default},5940:function(t,e,n){"use strict";e.__esModule=!0,e.registerDefaultDecorators=function(t){i.default(t)};var r,o=n(7430),i=(r=o)&&r.__esModule?r:{default:r}},7430:function(t,e,n){"use strict";e.__esModule=!0;var r=n(2849);e.default=function(t){t.registerDecorator("inline",(function(t,e,n,o){var i=t;return e.partials||(e.partials={},i=function(o,i){var a=n.partials;n.partials=r.extend({},a,e.partials);var s=t(o,i);return n.partials=a,s}),e.partials[o.args[0]]=o.fn,i}))},t.exports=e.default},3769:function(t,e){"use strict";e.__esModule=!0;var n=["description","fileName","lineNumber","endLineNumber","message","name","number","stack"];function r(t,e){var o=e&&e.loc,i=void 0,a=void 0,s=void 0,l=void 0;o&&(i=o.start.line,a=o.end.line,s=o.start.column,l=o.end.column,t+=" - "+i+":"+s);for(var u=Error.prototype.constructor.call(this,t),c=0;c<n.length;c++)this[n[c]]=u[n[c]];Error.captureStackTrace&&Error.captureStackTrace(this,r);try{o&&(this.lineNumber=i,this.endLineNumber=a,Object.defineProperty?(Object.defineProperty(this,"column",{value:s,enumerable:!0}),Object.defineProperty(this,"endColumn",{value:l,enumerable:!0})):(this.column=s,this.endColumn=l))}catch(t){}}r.prototype=new Error,e.default=r,t.exports=e.default},2277:function(t,e,n){"use strict";function r(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.registerDefaultHelpers=function(t){o.default(t),i.default(t),a.default(t),s.default(t),l.default(t),u.default(t),c.default(t)},e.moveHelperToHooks=function(t,e,n){t.helpers[e]&&(t.hooks[e]=t.helpers[e],n||delete t.helpers[e])};var o=r(n(6097)),i=r(n(6785)),a=r(n(4353)),s=r(n(2355)),l=r(n(5300)),u=r(n(7466)),c=r(n(908))},6097:function(t,e,n){"use strict";e.__esModule=!0;var r=n(2849);e.default=function(t){t.registerHelper("blockHelperMissing",(function(e,n){var o=n.inverse,i=n.fn;if(!0===e)return i(this);if(!1===e||null==e)return o(this);if(r.isArray(e))return e.length>0?(n.ids&&(n.ids=[n.name]),t.helpers.each(e,n)):o(this);if(n.data&&n.ids){var a=r.createFrame(n.data);a.contextPath=r.appendContextPath(n.data.contextPath,n.name),n={data:a}}return i(e,n)}))},t.exports=e.default},6785:function(t,e,n){"use strict";e.__esModule=!0;var r,o=n(2849),i=n(3769),a=(r=i)&&r.__esModule?r:{default:r};e.default=function(t){t.registerHelper("each",(function(t,e){if(!e)throw new a.default("Must pass iterator to #each");var n,r=e.fn,i=e.inverse,s=0,l="",u=void 0,c=void 0;function h(e,n,i){u&&(u.key=e,u.index=n,u.first=0===n,u.last=!!i,c&&(u.contextPath=c+e)),l+=r(t[e],{data:u,blockParams:o.blockParams([t[e],e],[c+e,null])})}if(e.data&&e.ids&&(c=o.appendContextPath(e.data.contextPath,e.ids[0])+"."),o.isFunction(t)&&(t=t.call(this)),e.data&&(u=o.createFrame(e.data)),t&&"object"==typeof t)if(o.isArray(t))for(var f=t.length;s<f;s++)s in t&&h(s,s,s===t.length-1);else if("function"==typeof Symbol&&t[Symbol.iterator]){for(var p=[],d=t[Symbol.iterator](),m=d.next();!m.done;m=d.next())p.push(m.value);for(f=(t=p).length;s<f;s++)h(s,s,s===t.length-1)}else n=void 0,Object.keys(t).forEach((function(t){void 0!==n&&h(n,s-1),n=t,s++})),void 0!==n&&h(n,s-1,!0);return 0===s&&(l=i(this)),l}))},t.exports=e.default},4353:function(t,e,n){"use strict";e.__esModule=!0;var r,o=n(3769),i=(r=o)&&r.__esModule?r:{default:r};e.default=function(t){t.registerHelper("helperMissing",(function(){if(1!==arguments.length)throw new i.default('Missing helper: "'+arguments[arguments.length-1].name+'"')}))},t.exports=e.default},2355:function(t,e,n){"use strict";e.__esModule=!0;var r,o=n(2849),i=n(3769),a=(r=i)&&r.__esModule?r:{default:r};e.default=function(t){t.registerHelper("if",(function(t,e){if(2!=arguments.length)throw new a.default("#if requires exactly one argument");return o.isFunction(t)&&(t=t.call(this)),!e.hash.includeZero&&!t||o.isEmpty(t)?e.inverse(this):e.fn(this)})),t.registerHelper("unless",(function(e,n){if(2!=arguments.length)throw new a.default("#unless requires exactly one argument");return t.helpers.if.call(this,e,{fn:n.inverse,inverse:n.fn,hash:n.hash})}))},t.exports=e.default},5300:function(t,e){"use strict";e.__esModule=!0,e.default=function(t){t.registerHelper("log",(function(){for(var e=[void 0],n=arguments[arguments.length-1],r=0;r<arguments.length-1;r++)e.push(arguments[r]);var o=1;null!=n.hash.level?o=n.hash.level:n.data&&null!=n.data.level&&(o=n.data.level),e[0]=o,t.log.apply(t,e)}))},t.exports=e.default},7466:function(t,e){"use strict";e.__esModule=!0,e.default=function(t){t.registerHelper("lookup",(function(t,e,n){return t?n.lookupProperty(t,e):t}))},t.exports=e.default},908:function(t,e,n){"use strict";e.__esModule=!0;var r,o=n(2849),i=n(3769),a=(r=i)&&r.__esModule?r:{default:r};e.default=function(t){t.registerHelper("with",(function(t,e){if(2!=arguments.length)throw new a.default("#with requires exactly one argument");o.isFunction(t)&&(t=t.call(this));var n=e.fn;if(o.isEmpty(t))return e.inverse(this);var r=e.data;return e.data&&e.ids&&((r=o.createFrame(e.data)).contextPath=o.appendContextPath(e.data.contextPath,e.ids[0])),n(t,{data:r,blockParams:o.blockParams([t],[r&&r.contextPath])})}))},t.exports=e.default},9726:function(t,e,n){"use strict";e.__esModule=!0,e.createNewLookupObject=function(){for(var t=arguments.length,e=Array(t),n=0;n<t;n++)e[n]=arguments[n];return r.extend.apply(void 0,[Object.create(null)].concat(e))};var r=n(2849)},3865:function(t,e,n){"use strict";e.__esModule=!0,e.createProtoAccessControl=function(t){var e=Object.create(null);e.constructor=!1,e.__defineGetter__=!1,e.__defineSetter__=!1,e.__lookupGetter__=!1;var n=Object.create(null);return n.__proto__=!1,{properties:{whitelist:o.createNewLookupObject(n,t.allowedProtoProperties),defaultValue:t.allowProtoPropertiesByDefault},methods:{whitelist:o.createNewLookupObject(e,t.allowedProtoMethods),defaultValue:t.allowProtoMethodsByDefault}}},e.resultIsAllowed=function(t,e,n){return l("function"==typeof t?e.methods:e.properties,n)},e.resetLoggedProperties=function(){Object.keys(s).forEach((function(t){delete s[t]}))};var r,o=n(9726),i=n(8185),a=(r=i)&&r.__esModule?r:{default:r},s=Object.create(null);function l(t,e){return void 0!==t.whitelist[e]?!0===t.whitelist[e]:void 0!==t.defaultValue?t.defaultValue:(function(t){!0!==s[t]&&(s[t]=!0,a.default.log("error",'Handlebars: Access has been denied to resolve the property "'+t+'" because it is not an "own property" of its parent.\nYou can add a runtime option to disable the check or this warning:\nSee https://handlebarsjs.com/api-reference/runtime-options.html#options-to-control-prototype-access for details'))}(e),!1)}},2614:function(t,e){"use strict";e.__esModule=!0,e.wrapHelper=function(t,e){if("function"!=typeof t)return t;return function(){return arguments[arguments.length-1]=e(arguments[arguments.length-1]),t.apply(this,arguments)}}},8185:function(t,e,n){"use strict";e.__esModule=!0;var r=n(2849),o={methodMap:["debug","info","warn","error"],level:"info",lookupLevel:function(t){if("string"==typeof t){var e=r.indexOf(o.methodMap,t.toLowerCase());t=e>=0?e:parseInt(t,10)}return t},log:function(t){if(t=o.lookupLevel(t),"undefined"!=typeof console&&o.lookupLevel(o.level)<=t){var e=o.methodMap[t];console[e]||(e="log");for(var n=arguments.length,r=Array(n>1?n-1:0),i=1;i<n;i++)r[i-1]=arguments[i];console[e].apply(console,r)}}};e.default=o,t.exports=e.default},1148:function(t,e){"use strict";e.__esModule=!0,e.default=function(t){"object"!=typeof globalThis&&(Object.prototype.__defineGetter__("__magic__",(function(){return this})),__magic__.globalThis=__magic__,delete Object.prototype.__magic__);var e=globalThis.Handlebars;t.noConflict=function(){return globalThis.Handlebars===t&&(globalThis.Handlebars=e),t}},t.exports=e.default},7624:function(t,e,n){"use strict";e.__esModule=!0,e.checkRevision=function(t){var e=t&&t[0]||1,n=s.COMPILER_REVISION;if(e>=s.LAST_COMPATIBLE_COMPILER_REVISION&&e<=s.COMPILER_REVISION)return;if(e<s.LAST_COMPATIBLE_COMPILER_REVISION){var r=s.REVISION_CHANGES[n],o=s.REVISION_CHANGES[e];throw new a.default("Template was precompiled with an older version of Handlebars than the current runtime. Please update your precompiler to a newer version ("+r+") or downgrade your runtime to an older version ("+o+").")}throw new a.default("Template was precompiled with a newer version of Handlebars than the current runtime. Please update your runtime to a newer version ("+t[1]+").")},e.template=function(t,e){if(!e)throw new a.default("No environment passed to template");if(!t||!t.main)throw new a.default("Unknown template object: "+typeof t);t.main.decorator=t.main_d,e.VM.checkRevision(t.compiler);var n=t.compiler&&7===t.compiler[0];var r={strict:function(t,e,n){if(!t||!(e in t))throw new a.default('"'+e+'" not defined in '+t,{loc:n});return r.lookupProperty(t,e)},lookupProperty:function(t,e){var n=t[e];return null==n||Object.prototype.hasOwnProperty.call(t,e)||c.resultIsAllowed(n,r.protoAccessControl,e)?n:void 0},lookup:function(t,e){for(var n=t.length,o=0;o<n;o++){if(null!=(t[o]&&r.lookupProperty(t[o],e)))return t[o][e]}},lambda:function(t,e){return"function"==typeof t?t.call(e):t},escapeExpression:o.escapeExpression,invokePartial:function(n,r,i){i.hash&&(r=o.extend({},r,i.hash),i.ids&&(i.ids[0]=!0)),n=e.VM.resolvePartial.call(this,n,r,i);var s=o.extend({},i,{hooks:this.hooks,protoAccessControl:this.protoAccessControl}),l=e.VM.invokePartial.call(this,n,r,s);if(null==l&&e.compile&&(i.partials[i.name]=e.compile(n,t.compilerOptions,e),l=i.partials[i.name](r,s)),null!=l){if(i.indent){for(var u=l.split("\n"),c=0,h=u.length;c<h&&(u[c]||c+1!==h);c++)u[c]=i.indent+u[c];l=u.join("\n")}return l}throw new a.default("The partial "+i.name+" could not be compiled when running in runtime-only mode")},fn:function(e){var n=t[e];return n.decorator=t[e+"_d"],n},programs:[],program:function(t,e,n,r,o){var i=this.programs[t],a=this.fn(t);return e||o||r||n?i=h(this,t,a,e,n,r,o):i||(i=this.programs[t]=h(this,t,a)),i},data:function(t,e){for(;t&&e--;)t=t._parent;return t},mergeIfNeeded:function(t,e){var n=t||e;return t&&e&&t!==e&&(n=o.extend({},e,t)),n},nullContext:Object.seal({}),noop:e.VM.noop,compilerInfo:t.compiler};function i(e){var n=arguments.length<=1||void 0===arguments[1]?{}:arguments[1],o=n.data;i._setup(n),!n.partial&&t.useData&&(o=function(t,e){e&&"root"in e||((e=e?s.createFrame(e):{}).root=t);return e}(e,o));var a=void 0,l=t.useBlockParams?[]:void 0;function u(e){return""+t.main(r,e,r.helpers,r.partials,o,l,a)}return t.useDepths&&(a=n.depths?e!=n.depths[0]?[e].concat(n.depths):n.depths:[e]),(u=p(t.main,u,r,n.depths||[],o,l))(e,n)}return i.isTop=!0,i._setup=function(i){if(i.partial)r.protoAccessControl=i.protoAccessControl,r.helpers=i.helpers,r.partials=i.partials,r.decorators=i.decorators,r.hooks=i.hooks;else{var a=o.extend({},e.helpers,i.helpers);!function(t,e){Object.keys(t).forEach((function(n){var r=t[n];t[n]=function(t,e){var n=e.lookupProperty;return u.wrapHelper(t,(function(t){return o.extend({lookupProperty:n},t)}))}(r,e)}))}(a,r),r.helpers=a,t.usePartial&&(r.partials=r.mergeIfNeeded(i.partials,e.partials)),(t.usePartial||t.useDecorators)&&(r.decorators=o.extend({},e.decorators,i.decorators)),r.hooks={},r.protoAccessControl=c.createProtoAccessControl(i);var s=i.allowCallsToHelperMissing||n;l.moveHelperToHooks(r,"helperMissing",s),l.moveHelperToHooks(r,"blockHelperMissing",s)}},i._child=function(e,n,o,i){if(t.useBlockParams&&!o)throw new a.default("must pass block params");if(t.useDepths&&!i)throw new a.default("must pass parent depths");return h(r,e,t[e],n,0,o,i)},i},e.wrapProgram=h,e.resolvePartial=function(t,e,n){t?t.call||n.name||(n.name=t,t=n.partials[t]):t="@partial-block"===n.name?n.data["partial-block"]:n.partials[n.name];return t},e.invokePartial=function(t,e,n){var r=n.data&&n.data["partial-block"];n.partial=!0,n.ids&&(n.data.contextPath=n.ids[0]||n.data.contextPath);var i=void 0;n.fn&&n.fn!==f&&function(){n.data=s.createFrame(n.data);var t=n.fn;i=n.data["partial-block"]=function(e){var n=arguments.length<=1||void 0===arguments[1]?{}:arguments[1];return n.data=s.createFrame(n.data),n.data["partial-block"]=r,t(e,n)},t.partials&&(n.partials=o.extend({},n.partials,t.partials))}();void 0===t&&i&&(t=i);if(void 0===t)throw new a.default("The partial "+n.name+" could not be found");if(t instanceof Function)return t(e,n)},e.noop=f;var r,o=function(t){if(t&&t.__esModule)return t;var e={};if(null!=t)for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&(e[n]=t[n]);return e.default=t,e}(n(2849)),i=n(3769),a=(r=i)&&r.__esModule?r:{default:r},s=n(2871),l=n(2277),u=n(2614),c=n(3865);function h(t,e,n,r,o,i,a){function s(e){var o=arguments.length<=1||void 0===arguments[1]?{}:arguments[1],s=a;return!a||e==a[0]||e===t.nullContext&&null===a[0]||(s=[e].concat(a)),n(t,e,t.helpers,t.partials,o.data||r,i&&[o.blockParams].concat(i),s)}return(s=p(n,s,t,a,r,i)).program=e,s.depth=a?a.length:0,s.blockParams=o||0,s}function f(){return""}function p(t,e,n,r,i,a){if(t.decorator){var s={};e=t.decorator(e,s,n,r&&r[0],i,a,r),o.extend(e,s)}return e}},9613:function(t,e){"use strict";function n(t){this.string=t}e.__esModule=!0,n.prototype.toString=n.prototype.toHTML=function(){return""+this.string},e.default=n,t.exports=e.default},2849:function(t,e){"use strict";e.__esModule=!0,e.extend=a,e.indexOf=function(t,e){for(var n=0,r=t.length;n<r;n++)if(t[n]===e)return n;return-1},e.escapeExpression=function(t){if("string"!=typeof t){if(t&&t.toHTML)return t.toHTML();if(null==t)return"";if(!t)return t+"";t=""+t}if(!o.test(t))return t;return t.replace(r,i)},e.isEmpty=function(t){return!t&&0!==t||!(!u(t)||0!==t.length)},e.createFrame=function(t){var e=a({},t);return e._parent=t,e},e.blockParams=function(t,e){return t.path=e,t},e.appendContextPath=function(t,e){return(t?t+".":"")+e};var n={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#x27;","`":"&#x60;","=":"&#x3D;"},r=/[&<>"'`=]/g,o=/[&<>"'`=]/;function i(t){return n[t]}function a(t){for(var e=1;e<arguments.length;e++)for(var n in arguments[e])Object.prototype.hasOwnProperty.call(arguments[e],n)&&(t[n]=arguments[e][n]);return t}var s=Object.prototype.toString;e.toString=s;var l=function(t){return"function"==typeof t};l(/x/)&&(e.isFunction=l=function(t){return"function"==typeof t&&"[object Function]"===s.call(t)}),e.isFunction=l;var u=Array.isArray||function(t){return!(!t||"object"!=typeof t)&&"[object Array]"===s.call(t)};e.isArray=u},3633:function(t,e,n){t.exports=n(261).default},592:function(t,e,n){"use strict";var r=n(655),o=function(){return!!r};o.hasArrayLengthDefineBug=function(){if(!r)return null;try{return 1!==r([],"length",{value:1}).length}catch(t){return!0}},t.exports=o},24:function(t){"use strict";var e={__proto__:null,foo:{}},n=Object;t.exports=function(){return{__proto__:e}.foo===e.foo&&!(e instanceof n)}},4039:function(t,e,n){"use strict";var r="undefined"!=typeof Symbol&&Symbol,o=n(1333);t.exports=function(){return"function"==typeof r&&("function"==typeof Symbol&&("symbol"==typeof r("foo")&&("symbol"==typeof Symbol("bar")&&o())))}},1333:function(t){"use strict";t.exports=function(){if("function"!=typeof Symbol||"function"!=typeof Object.getOwnPropertySymbols)return!1;if("symbol"==typeof Symbol.iterator)return!0;var t={},e=Symbol("test"),n=Object(e);if("string"==typeof e)return!1;if("[object Symbol]"!==Object.prototype.toString.call(e))return!1;if("[object Symbol]"!==Object.prototype.toString.call(n))return!1;for(e in t[e]=42,t)return!1;if("function"==typeof Object.keys&&0!==Object.keys(t).length)return!1;if("function"==typeof Object.getOwnPropertyNames&&0!==Object.getOwnPropertyNames(t).length)return!1;var r=Object.getOwnPropertySymbols(t);if(1!==r.length||r[0]!==e)return!1;if(!Object.prototype.propertyIsEnumerable.call(t,e))return!1;if("function"==typeof Object.getOwnPropertyDescriptor){var o=Object.getOwnPropertyDescriptor(t,e);if(42!==o.value||!0!==o.enumerable)return!1}return!0}},9957:function(t,e,n){"use strict";var r=Function.prototype.call,o=Object.prototype.hasOwnProperty,i=n(6743);t.exports=i.call(r,o)},5981:function(t){function e(t){return t instanceof Map?t.clear=t.delete=t.set=function(){throw new Error("map is read-only")}:t instanceof Set&&(t.add=t.clear=t.delete=function(){throw new Error("set is read-only")}),Object.freeze(t),Object.getOwnPropertyNames(t).forEach((function(n){var r=t[n];"object"!=typeof r||Object.isFrozen(r)||e(r)})),t}var n=e,r=e;n.default=r;class o{constructor(t){void 0===t.data&&(t.data={}),this.data=t.data,this.isMatchIgnored=!1}ignoreMatch(){this.isMatchIgnored=!0}}function i(t){return t.replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&#x27;")}function a(t,...e){const n=Object.create(null);for(const e in t)n[e]=t[e];return e.forEach((function(t){for(const e in t)n[e]=t[e]})),n}const s=t=>!!t.kind;class l{constructor(t,e){this.buffer="",this.classPrefix=e.classPrefix,t.walk(this)}addText(t){this.buffer+=i(t)}openNode(t){if(!s(t))return;let e=t.kind;t.sublanguage||(e=`${this.classPrefix}${e}`),this.span(e)}closeNode(t){s(t)&&(this.buffer+="</span>")}value(){return this.buffer}span(t){this.buffer+=`<span class="${t}">`}}class u{constructor(){this.rootNode={children:[]},this.stack=[this.rootNode]}get top(){return this.stack[this.stack.length-1]}get root(){return this.rootNode}add(t){this.top.children.push(t)}openNode(t){const e={kind:t,children:[]};this.add(e),this.stack.push(e)}closeNode(){if(this.stack.length>1)return this.stack.pop()}closeAllNodes(){for(;this.closeNode(););}toJSON(){return JSON.stringify(this.rootNode,null,4)}walk(t){return this.constructor._walk(t,this.rootNode)}static _walk(t,e){return"string"==typeof e?t.addText(e):e.children&&(t.openNode(e),e.children.forEach((e=>this._walk(t,e))),t.closeNode(e)),t}static _collapse(t){"string"!=typeof t&&t.children&&(t.children.every((t=>"string"==typeof t))?t.children=[t.children.join("")]:t.children.forEach((t=>{u._collapse(t)})))}}class c extends u{constructor(t){super(),this.options=t}addKeyword(t,e){""!==t&&(this.openNode(e),this.addText(t),this.closeNode())}addText(t){""!==t&&this.add(t)}addSublanguage(t,e){const n=t.root;n.kind=e,n.sublanguage=!0,this.add(n)}toHTML(){return new l(this,this.options).value()}finalize(){return!0}}function h(t){return t?"string"==typeof t?t:t.source:null}const f=/\[(?:[^\\\]]|\\.)*\]|\(\??|\\([1-9][0-9]*)|\\./;const p="[a-zA-Z]\\w*",d="[a-zA-Z_]\\w*",m="\\b\\d+(\\.\\d+)?",g="(-?)(\\b0[xX][a-fA-F0-9]+|(\\b\\d+(\\.\\d*)?|\\.\\d+)([eE][-+]?\\d+)?)",v="\\b(0b[01]+)",y={begin:"\\\\[\\s\\S]",relevance:0},b={className:"string",begin:"'",end:"'",illegal:"\\n",contains:[y]},w={className:"string",begin:'"',end:'"',illegal:"\\n",contains:[y]},_={begin:/\b(a|an|the|are|I'm|isn't|don't|doesn't|won't|but|just|should|pretty|simply|enough|gonna|going|wtf|so|such|will|you|your|they|like|more)\b/},x=function(t,e,n={}){const r=a({className:"comment",begin:t,end:e,contains:[]},n);return r.contains.push(_),r.contains.push({className:"doctag",begin:"(?:TODO|FIXME|NOTE|BUG|OPTIMIZE|HACK|XXX):",relevance:0}),r},k=x("//","$"),A=x("/\\*","\\*/"),O=x("#","$"),E={className:"number",begin:m,relevance:0},C={className:"number",begin:g,relevance:0},S={className:"number",begin:v,relevance:0},P={className:"number",begin:m+"(%|em|ex|ch|rem|vw|vh|vmin|vmax|cm|mm|in|pt|pc|px|deg|grad|rad|turn|s|ms|Hz|kHz|dpi|dpcm|dppx)?",relevance:0},j={begin:/(?=\/[^/\n]*\/)/,contains:[{className:"regexp",begin:/\//,end:/\/[gimuy]*/,illegal:/\n/,contains:[y,{begin:/\[/,end:/\]/,relevance:0,contains:[y]}]}]},T={className:"title",begin:p,relevance:0},R={className:"title",begin:d,relevance:0},M={begin:"\\.\\s*"+d,relevance:0};var N=Object.freeze({__proto__:null,MATCH_NOTHING_RE:/\b\B/,IDENT_RE:p,UNDERSCORE_IDENT_RE:d,NUMBER_RE:m,C_NUMBER_RE:g,BINARY_NUMBER_RE:v,RE_STARTERS_RE:"!|!=|!==|%|%=|&|&&|&=|\\*|\\*=|\\+|\\+=|,|-|-=|/=|/|:|;|<<|<<=|<=|<|===|==|=|>>>=|>>=|>=|>>>|>>|>|\\?|\\[|\\{|\\(|\\^|\\^=|\\||\\|=|\\|\\||~",SHEBANG:(t={})=>{const e=/^#![ ]*\//;return t.binary&&(t.begin=function(...t){return t.map((t=>h(t))).join("")}(e,/.*\b/,t.binary,/\b.*/)),a({className:"meta",begin:e,end:/$/,relevance:0,"on:begin":(t,e)=>{0!==t.index&&e.ignoreMatch()}},t)},BACKSLASH_ESCAPE:y,APOS_STRING_MODE:b,QUOTE_STRING_MODE:w,PHRASAL_WORDS_MODE:_,COMMENT:x,C_LINE_COMMENT_MODE:k,C_BLOCK_COMMENT_MODE:A,HASH_COMMENT_MODE:O,NUMBER_MODE:E,C_NUMBER_MODE:C,BINARY_NUMBER_MODE:S,CSS_NUMBER_MODE:P,REGEXP_MODE:j,TITLE_MODE:T,UNDERSCORE_TITLE_MODE:R,METHOD_GUARD:M,END_SAME_AS_BEGIN:function(t){return Object.assign(t,{"on:begin":(t,e)=>{e.data._beginMatch=t[1]},"on:end":(t,e)=>{e.data._beginMatch!==t[1]&&e.ignoreMatch()}})}});function D(t,e){"."===t.input[t.index-1]&&e.ignoreMatch()}function B(t,e){e&&t.beginKeywords&&(t.begin="\\b("+t.beginKeywords.split(" ").join("|")+")(?!\\.)(?=\\b|\\s)",t.__beforeBegin=D,t.keywords=t.keywords||t.beginKeywords,delete t.beginKeywords,void 0===t.relevance&&(t.relevance=0))}function V(t,e){Array.isArray(t.illegal)&&(t.illegal=function(...t){return"("+t.map((t=>h(t))).join("|")+")"}(...t.illegal))}function I(t,e){if(t.match){if(t.begin||t.end)throw new Error("begin & end are not supported with match");t.begin=t.match,delete t.match}}function L(t,e){void 0===t.relevance&&(t.relevance=1)}const z=["of","and","for","in","not","or","if","then","parent","list","value"],$="keyword";function F(t,e,n=$){const r={};return"string"==typeof t?o(n,t.split(" ")):Array.isArray(t)?o(n,t):Object.keys(t).forEach((function(n){Object.assign(r,F(t[n],e,n))})),r;function o(t,n){e&&(n=n.map((t=>t.toLowerCase()))),n.forEach((function(e){const n=e.split("|");r[n[0]]=[t,U(n[0],n[1])]}))}}function U(t,e){return e?Number(e):function(t){return z.includes(t.toLowerCase())}(t)?0:1}function H(t,{plugins:e}){function n(e,n){return new RegExp(h(e),"m"+(t.case_insensitive?"i":"")+(n?"g":""))}class r{constructor(){this.matchIndexes={},this.regexes=[],this.matchAt=1,this.position=0}addRule(t,e){e.position=this.position++,this.matchIndexes[this.matchAt]=e,this.regexes.push([e,t]),this.matchAt+=function(t){return new RegExp(t.toString()+"|").exec("").length-1}(t)+1}compile(){0===this.regexes.length&&(this.exec=()=>null);const t=this.regexes.map((t=>t[1]));this.matcherRe=n(function(t,e="|"){let n=0;return t.map((t=>{n+=1;const e=n;let r=h(t),o="";for(;r.length>0;){const t=f.exec(r);if(!t){o+=r;break}o+=r.substring(0,t.index),r=r.substring(t.index+t[0].length),"\\"===t[0][0]&&t[1]?o+="\\"+String(Number(t[1])+e):(o+=t[0],"("===t[0]&&n++)}return o})).map((t=>`(${t})`)).join(e)}(t),!0),this.lastIndex=0}exec(t){this.matcherRe.lastIndex=this.lastIndex;const e=this.matcherRe.exec(t);if(!e)return null;const n=e.findIndex(((t,e)=>e>0&&void 0!==t)),r=this.matchIndexes[n];return e.splice(0,n),Object.assign(e,r)}}class o{constructor(){this.rules=[],this.multiRegexes=[],this.count=0,this.lastIndex=0,this.regexIndex=0}getMatcher(t){if(this.multiRegexes[t])return this.multiRegexes[t];const e=new r;return this.rules.slice(t).forEach((([t,n])=>e.addRule(t,n))),e.compile(),this.multiRegexes[t]=e,e}resumingScanAtSamePosition(){return 0!==this.regexIndex}considerAll(){this.regexIndex=0}addRule(t,e){this.rules.push([t,e]),"begin"===e.type&&this.count++}exec(t){const e=this.getMatcher(this.regexIndex);e.lastIndex=this.lastIndex;let n=e.exec(t);if(this.resumingScanAtSamePosition())if(n&&n.index===this.lastIndex);else{const e=this.getMatcher(0);e.lastIndex=this.lastIndex+1,n=e.exec(t)}return n&&(this.regexIndex+=n.position+1,this.regexIndex===this.count&&this.considerAll()),n}}if(t.compilerExtensions||(t.compilerExtensions=[]),t.contains&&t.contains.includes("self"))throw new Error("ERR: contains `self` is not supported at the top-level of a language.  See documentation.");return t.classNameAliases=a(t.classNameAliases||{}),function e(r,i){const s=r;if(r.isCompiled)return s;[I].forEach((t=>t(r,i))),t.compilerExtensions.forEach((t=>t(r,i))),r.__beforeBegin=null,[B,V,L].forEach((t=>t(r,i))),r.isCompiled=!0;let l=null;if("object"==typeof r.keywords&&(l=r.keywords.$pattern,delete r.keywords.$pattern),r.keywords&&(r.keywords=F(r.keywords,t.case_insensitive)),r.lexemes&&l)throw new Error("ERR: Prefer `keywords.$pattern` to `mode.lexemes`, BOTH are not allowed. (see mode reference) ");return l=l||r.lexemes||/\w+/,s.keywordPatternRe=n(l,!0),i&&(r.begin||(r.begin=/\B|\b/),s.beginRe=n(r.begin),r.endSameAsBegin&&(r.end=r.begin),r.end||r.endsWithParent||(r.end=/\B|\b/),r.end&&(s.endRe=n(r.end)),s.terminatorEnd=h(r.end)||"",r.endsWithParent&&i.terminatorEnd&&(s.terminatorEnd+=(r.end?"|":"")+i.terminatorEnd)),r.illegal&&(s.illegalRe=n(r.illegal)),r.contains||(r.contains=[]),r.contains=[].concat(...r.contains.map((function(t){return function(t){t.variants&&!t.cachedVariants&&(t.cachedVariants=t.variants.map((function(e){return a(t,{variants:null},e)})));if(t.cachedVariants)return t.cachedVariants;if(q(t))return a(t,{starts:t.starts?a(t.starts):null});if(Object.isFrozen(t))return a(t);return t}("self"===t?r:t)}))),r.contains.forEach((function(t){e(t,s)})),r.starts&&e(r.starts,i),s.matcher=function(t){const e=new o;return t.contains.forEach((t=>e.addRule(t.begin,{rule:t,type:"begin"}))),t.terminatorEnd&&e.addRule(t.terminatorEnd,{type:"end"}),t.illegal&&e.addRule(t.illegal,{type:"illegal"}),e}(s),s}(t)}function q(t){return!!t&&(t.endsWithParent||q(t.starts))}function W(t){const e={props:["language","code","autodetect"],data:function(){return{detectedLanguage:"",unknownLanguage:!1}},computed:{className(){return this.unknownLanguage?"":"hljs "+this.detectedLanguage},highlighted(){if(!this.autoDetect&&!t.getLanguage(this.language))return console.warn(`The language "${this.language}" you specified could not be found.`),this.unknownLanguage=!0,i(this.code);let e={};return this.autoDetect?(e=t.highlightAuto(this.code),this.detectedLanguage=e.language):(e=t.highlight(this.language,this.code,this.ignoreIllegals),this.detectedLanguage=this.language),e.value},autoDetect(){return!this.language||(t=this.autodetect,Boolean(t||""===t));var t},ignoreIllegals(){return!0}},render(t){return t("pre",{},[t("code",{class:this.className,domProps:{innerHTML:this.highlighted}})])}};return{Component:e,VuePlugin:{install(t){t.component("highlightjs",e)}}}}const G={"after:highlightElement":({el:t,result:e,text:n})=>{const r=X(t);if(!r.length)return;const o=document.createElement("div");o.innerHTML=e.value,e.value=function(t,e,n){let r=0,o="";const a=[];function s(){return t.length&&e.length?t[0].offset!==e[0].offset?t[0].offset<e[0].offset?t:e:"start"===e[0].event?t:e:t.length?t:e}function l(t){function e(t){return" "+t.nodeName+'="'+i(t.value)+'"'}o+="<"+K(t)+[].map.call(t.attributes,e).join("")+">"}function u(t){o+="</"+K(t)+">"}function c(t){("start"===t.event?l:u)(t.node)}for(;t.length||e.length;){let e=s();if(o+=i(n.substring(r,e[0].offset)),r=e[0].offset,e===t){a.reverse().forEach(u);do{c(e.splice(0,1)[0]),e=s()}while(e===t&&e.length&&e[0].offset===r);a.reverse().forEach(l)}else"start"===e[0].event?a.push(e[0].node):a.pop(),c(e.splice(0,1)[0])}return o+i(n.substr(r))}(r,X(o),n)}};function K(t){return t.nodeName.toLowerCase()}function X(t){const e=[];return function t(n,r){for(let o=n.firstChild;o;o=o.nextSibling)3===o.nodeType?r+=o.nodeValue.length:1===o.nodeType&&(e.push({event:"start",offset:r,node:o}),r=t(o,r),K(o).match(/br|hr|img|input/)||e.push({event:"stop",offset:r,node:o}));return r}(t,0),e}const Y={},J=t=>{console.error(t)},Z=(t,...e)=>{console.log(`WARN: ${t}`,...e)},Q=(t,e)=>{Y[`${t}/${e}`]||(console.log(`Deprecated as of ${t}. ${e}`),Y[`${t}/${e}`]=!0)},tt=i,et=a,nt=Symbol("nomatch");var rt=function(t){const e=Object.create(null),r=Object.create(null),i=[];let a=!0;const s=/(^(<[^>]+>|\t|)+|\n)/gm,l="Could not find the language '{}', did you forget to load/include a language module?",u={disableAutodetect:!0,name:"Plain text",contains:[]};let h={noHighlightRe:/^(no-?highlight)$/i,languageDetectRe:/\blang(?:uage)?-([\w-]+)\b/i,classPrefix:"hljs-",tabReplace:null,useBR:!1,languages:null,__emitter:c};function f(t){return h.noHighlightRe.test(t)}function p(t,e,n,r){let o="",i="";"object"==typeof e?(o=t,n=e.ignoreIllegals,i=e.language,r=void 0):(Q("10.7.0","highlight(lang, code, ...args) has been deprecated."),Q("10.7.0","Please use highlight(code, options) instead.\nhttps://github.com/highlightjs/highlight.js/issues/2277"),i=t,o=e);const a={code:o,language:i};E("before:highlight",a);const s=a.result?a.result:d(a.language,a.code,n,r);return s.code=a.code,E("after:highlight",s),s}function d(t,n,r,s){function u(t,e){const n=_.case_insensitive?e[0].toLowerCase():e[0];return Object.prototype.hasOwnProperty.call(t.keywords,n)&&t.keywords[n]}function c(){null!=O.subLanguage?function(){if(""===S)return;let t=null;if("string"==typeof O.subLanguage){if(!e[O.subLanguage])return void C.addText(S);t=d(O.subLanguage,S,!0,E[O.subLanguage]),E[O.subLanguage]=t.top}else t=m(S,O.subLanguage.length?O.subLanguage:null);O.relevance>0&&(P+=t.relevance),C.addSublanguage(t.emitter,t.language)}():function(){if(!O.keywords)return void C.addText(S);let t=0;O.keywordPatternRe.lastIndex=0;let e=O.keywordPatternRe.exec(S),n="";for(;e;){n+=S.substring(t,e.index);const r=u(O,e);if(r){const[t,o]=r;if(C.addText(n),n="",P+=o,t.startsWith("_"))n+=e[0];else{const n=_.classNameAliases[t]||t;C.addKeyword(e[0],n)}}else n+=e[0];t=O.keywordPatternRe.lastIndex,e=O.keywordPatternRe.exec(S)}n+=S.substr(t),C.addText(n)}(),S=""}function f(t){return t.className&&C.openNode(_.classNameAliases[t.className]||t.className),O=Object.create(t,{parent:{value:O}}),O}function p(t,e,n){let r=function(t,e){const n=t&&t.exec(e);return n&&0===n.index}(t.endRe,n);if(r){if(t["on:end"]){const n=new o(t);t["on:end"](e,n),n.isMatchIgnored&&(r=!1)}if(r){for(;t.endsParent&&t.parent;)t=t.parent;return t}}if(t.endsWithParent)return p(t.parent,e,n)}function g(t){return 0===O.matcher.regexIndex?(S+=t[0],1):(R=!0,0)}function v(t){const e=t[0],n=t.rule,r=new o(n),i=[n.__beforeBegin,n["on:begin"]];for(const n of i)if(n&&(n(t,r),r.isMatchIgnored))return g(e);return n&&n.endSameAsBegin&&(n.endRe=new RegExp(e.replace(/[-/\\^$*+?.()|[\]{}]/g,"\\$&"),"m")),n.skip?S+=e:(n.excludeBegin&&(S+=e),c(),n.returnBegin||n.excludeBegin||(S=e)),f(n),n.returnBegin?0:e.length}function y(t){const e=t[0],r=n.substr(t.index),o=p(O,t,r);if(!o)return nt;const i=O;i.skip?S+=e:(i.returnEnd||i.excludeEnd||(S+=e),c(),i.excludeEnd&&(S=e));do{O.className&&C.closeNode(),O.skip||O.subLanguage||(P+=O.relevance),O=O.parent}while(O!==o.parent);return o.starts&&(o.endSameAsBegin&&(o.starts.endRe=o.endRe),f(o.starts)),i.returnEnd?0:e.length}let b={};function w(e,o){const i=o&&o[0];if(S+=e,null==i)return c(),0;if("begin"===b.type&&"end"===o.type&&b.index===o.index&&""===i){if(S+=n.slice(o.index,o.index+1),!a){const e=new Error("0 width match regex");throw e.languageName=t,e.badRule=b.rule,e}return 1}if(b=o,"begin"===o.type)return v(o);if("illegal"===o.type&&!r){const t=new Error('Illegal lexeme "'+i+'" for mode "'+(O.className||"<unnamed>")+'"');throw t.mode=O,t}if("end"===o.type){const t=y(o);if(t!==nt)return t}if("illegal"===o.type&&""===i)return 1;if(T>1e5&&T>3*o.index){throw new Error("potential infinite loop, way more iterations than matches")}return S+=i,i.length}const _=k(t);if(!_)throw J(l.replace("{}",t)),new Error('Unknown language: "'+t+'"');const x=H(_,{plugins:i});let A="",O=s||x;const E={},C=new h.__emitter(h);!function(){const t=[];for(let e=O;e!==_;e=e.parent)e.className&&t.unshift(e.className);t.forEach((t=>C.openNode(t)))}();let S="",P=0,j=0,T=0,R=!1;try{for(O.matcher.considerAll();;){T++,R?R=!1:O.matcher.considerAll(),O.matcher.lastIndex=j;const t=O.matcher.exec(n);if(!t)break;const e=w(n.substring(j,t.index),t);j=t.index+e}return w(n.substr(j)),C.closeAllNodes(),C.finalize(),A=C.toHTML(),{relevance:Math.floor(P),value:A,language:t,illegal:!1,emitter:C,top:O}}catch(e){if(e.message&&e.message.includes("Illegal"))return{illegal:!0,illegalBy:{msg:e.message,context:n.slice(j-100,j+100),mode:e.mode},sofar:A,relevance:0,value:tt(n),emitter:C};if(a)return{illegal:!1,relevance:0,value:tt(n),emitter:C,language:t,top:O,errorRaised:e};throw e}}function m(t,n){n=n||h.languages||Object.keys(e);const r=function(t){const e={relevance:0,emitter:new h.__emitter(h),value:tt(t),illegal:!1,top:u};return e.emitter.addText(t),e}(t),o=n.filter(k).filter(O).map((e=>d(e,t,!1)));o.unshift(r);const i=o.sort(((t,e)=>{if(t.relevance!==e.relevance)return e.relevance-t.relevance;if(t.language&&e.language){if(k(t.language).supersetOf===e.language)return 1;if(k(e.language).supersetOf===t.language)return-1}return 0})),[a,s]=i,l=a;return l.second_best=s,l}const g={"before:highlightElement":({el:t})=>{h.useBR&&(t.innerHTML=t.innerHTML.replace(/\n/g,"").replace(/<br[ /]*>/g,"\n"))},"after:highlightElement":({result:t})=>{h.useBR&&(t.value=t.value.replace(/\n/g,"<br>"))}},v=/^(<[^>]+>|\t)+/gm,y={"after:highlightElement":({result:t})=>{h.tabReplace&&(t.value=t.value.replace(v,(t=>t.replace(/\t/g,h.tabReplace))))}};function b(t){let e=null;const n=function(t){let e=t.className+" ";e+=t.parentNode?t.parentNode.className:"";const n=h.languageDetectRe.exec(e);if(n){const e=k(n[1]);return e||(Z(l.replace("{}",n[1])),Z("Falling back to no-highlight mode for this block.",t)),e?n[1]:"no-highlight"}return e.split(/\s+/).find((t=>f(t)||k(t)))}(t);if(f(n))return;E("before:highlightElement",{el:t,language:n}),e=t;const o=e.textContent,i=n?p(o,{language:n,ignoreIllegals:!0}):m(o);E("after:highlightElement",{el:t,result:i,text:o}),t.innerHTML=i.value,function(t,e,n){const o=e?r[e]:n;t.classList.add("hljs"),o&&t.classList.add(o)}(t,n,i.language),t.result={language:i.language,re:i.relevance,relavance:i.relevance},i.second_best&&(t.second_best={language:i.second_best.language,re:i.second_best.relevance,relavance:i.second_best.relevance})}const w=()=>{if(w.called)return;w.called=!0,Q("10.6.0","initHighlighting() is deprecated.  Use highlightAll() instead.");document.querySelectorAll("pre code").forEach(b)};let _=!1;function x(){if("loading"===document.readyState)return void(_=!0);document.querySelectorAll("pre code").forEach(b)}function k(t){return t=(t||"").toLowerCase(),e[t]||e[r[t]]}function A(t,{languageName:e}){"string"==typeof t&&(t=[t]),t.forEach((t=>{r[t.toLowerCase()]=e}))}function O(t){const e=k(t);return e&&!e.disableAutodetect}function E(t,e){const n=t;i.forEach((function(t){t[n]&&t[n](e)}))}"undefined"!=typeof window&&window.addEventListener&&window.addEventListener("DOMContentLoaded",(function(){_&&x()}),!1),Object.assign(t,{highlight:p,highlightAuto:m,highlightAll:x,fixMarkup:function(t){return Q("10.2.0","fixMarkup will be removed entirely in v11.0"),Q("10.2.0","Please see https://github.com/highlightjs/highlight.js/issues/2534"),e=t,h.tabReplace||h.useBR?e.replace(s,(t=>"\n"===t?h.useBR?"<br>":t:h.tabReplace?t.replace(/\t/g,h.tabReplace):t)):e;var e},highlightElement:b,highlightBlock:function(t){return Q("10.7.0","highlightBlock will be removed entirely in v12.0"),Q("10.7.0","Please use highlightElement now."),b(t)},configure:function(t){t.useBR&&(Q("10.3.0","'useBR' will be removed entirely in v11.0"),Q("10.3.0","Please see https://github.com/highlightjs/highlight.js/issues/2559")),h=et(h,t)},initHighlighting:w,initHighlightingOnLoad:function(){Q("10.6.0","initHighlightingOnLoad() is deprecated.  Use highlightAll() instead."),_=!0},registerLanguage:function(n,r){let o=null;try{o=r(t)}catch(t){if(J("Language definition for '{}' could not be registered.".replace("{}",n)),!a)throw t;J(t),o=u}o.name||(o.name=n),e[n]=o,o.rawDefinition=r.bind(null,t),o.aliases&&A(o.aliases,{languageName:n})},unregisterLanguage:function(t){delete e[t];for(const e of Object.keys(r))r[e]===t&&delete r[e]},listLanguages:function(){return Object.keys(e)},getLanguage:k,registerAliases:A,requireLanguage:function(t){Q("10.4.0","requireLanguage will be removed entirely in v11."),Q("10.4.0","Please see https://github.com/highlightjs/highlight.js/pull/2844");const e=k(t);if(e)return e;throw new Error("The '{}' language is required, but not loaded.".replace("{}",t))},autoDetection:O,inherit:et,addPlugin:function(t){!function(t){t["before:highlightBlock"]&&!t["before:highlightElement"]&&(t["before:highlightElement"]=e=>{t["before:highlightBlock"](Object.assign({block:e.el},e))}),t["after:highlightBlock"]&&!t["after:highlightElement"]&&(t["after:highlightElement"]=e=>{t["after:highlightBlock"](Object.assign({block:e.el},e))})}(t),i.push(t)},vuePlugin:W(t).VuePlugin}),t.debugMode=function(){a=!1},t.safeMode=function(){a=!0},t.versionString="10.7.3";for(const t in N)"object"==typeof N[t]&&n(N[t]);return Object.assign(t,N),t.addPlugin(g),t.addPlugin(G),t.addPlugin(y),t}({});t.exports=rt},5344:function(t){function e(...t){return t.map((t=>{return(e=t)?"string"==typeof e?e:e.source:null;var e})).join("")}t.exports=function(t){const n={},r={begin:/\$\{/,end:/\}/,contains:["self",{begin:/:-/,contains:[n]}]};Object.assign(n,{className:"variable",variants:[{begin:e(/\$[\w\d#@][\w\d_]*/,"(?![\\w\\d])(?![$])")},r]});const o={className:"subst",begin:/\$\(/,end:/\)/,contains:[t.BACKSLASH_ESCAPE]},i={begin:/<<-?\s*(?=\w+)/,starts:{contains:[t.END_SAME_AS_BEGIN({begin:/(\w+)/,end:/(\w+)/,className:"string"})]}},a={className:"string",begin:/"/,end:/"/,contains:[t.BACKSLASH_ESCAPE,n,o]};o.contains.push(a);const s={begin:/\$\(\(/,end:/\)\)/,contains:[{begin:/\d+#[0-9a-f]+/,className:"number"},t.NUMBER_MODE,n]},l=t.SHEBANG({binary:`(${["fish","bash","zsh","sh","csh","ksh","tcsh","dash","scsh"].join("|")})`,relevance:10}),u={className:"function",begin:/\w[\w\d_]*\s*\(\s*\)\s*\{/,returnBegin:!0,contains:[t.inherit(t.TITLE_MODE,{begin:/\w[\w\d_]*/})],relevance:0};return{name:"Bash",aliases:["sh","zsh"],keywords:{$pattern:/\b[a-z._-]+\b/,keyword:"if then else elif fi for while in do done case esac function",literal:"true false",built_in:"break cd continue eval exec exit export getopts hash pwd readonly return shift test times trap umask unset alias bind builtin caller command declare echo enable help let local logout mapfile printf read readarray source type typeset ulimit unalias set shopt autoload bg bindkey bye cap chdir clone comparguments compcall compctl compdescribe compfiles compgroups compquote comptags comptry compvalues dirs disable disown echotc echoti emulate fc fg float functions getcap getln history integer jobs kill limit log noglob popd print pushd pushln rehash sched setcap setopt stat suspend ttyctl unfunction unhash unlimit unsetopt vared wait whence where which zcompile zformat zftp zle zmodload zparseopts zprof zpty zregexparse zsocket zstyle ztcp"},contains:[l,t.SHEBANG(),u,s,t.HASH_COMMENT_MODE,i,a,{className:"",begin:/\\"/},{className:"string",begin:/'/,end:/'/},n]}}},6033:function(t){t.exports=function(t){return{name:"Diff",aliases:["patch"],contains:[{className:"meta",relevance:10,variants:[{begin:/^@@ +-\d+,\d+ +\+\d+,\d+ +@@/},{begin:/^\*\*\* +\d+,\d+ +\*\*\*\*$/},{begin:/^--- +\d+,\d+ +----$/}]},{className:"comment",variants:[{begin:/Index: /,end:/$/},{begin:/^index/,end:/$/},{begin:/={3,}/,end:/$/},{begin:/^-{3}/,end:/$/},{begin:/^\*{3} /,end:/$/},{begin:/^\+{3}/,end:/$/},{begin:/^\*{15}$/},{begin:/^diff --git/,end:/$/}]},{className:"addition",begin:/^\+/,end:/$/},{className:"deletion",begin:/^-/,end:/$/},{className:"addition",begin:/^!/,end:/$/}]}}},5772:function(t){t.exports=function(t){const e={literal:"true false null"},n=[t.C_LINE_COMMENT_MODE,t.C_BLOCK_COMMENT_MODE],r=[t.QUOTE_STRING_MODE,t.C_NUMBER_MODE],o={end:",",endsWithParent:!0,excludeEnd:!0,contains:r,keywords:e},i={begin:/\{/,end:/\}/,contains:[{className:"attr",begin:/"/,end:/"/,contains:[t.BACKSLASH_ESCAPE],illegal:"\\n"},t.inherit(o,{begin:/:/})].concat(n),illegal:"\\S"},a={begin:"\\[",end:"\\]",contains:[t.inherit(o)],illegal:"\\S"};return r.push(i,a),n.forEach((function(t){r.push(t)})),{name:"JSON",contains:r,keywords:e,illegal:"\\S"}}},6503:function(t){function e(...t){return t.map((t=>{return(e=t)?"string"==typeof e?e:e.source:null;var e})).join("")}t.exports=function(t){const n={begin:/<\/?[A-Za-z_]/,end:">",subLanguage:"xml",relevance:0},r={variants:[{begin:/\[.+?\]\[.*?\]/,relevance:0},{begin:/\[.+?\]\(((data|javascript|mailto):|(?:http|ftp)s?:\/\/).*?\)/,relevance:2},{begin:e(/\[.+?\]\(/,/[A-Za-z][A-Za-z0-9+.-]*/,/:\/\/.*?\)/),relevance:2},{begin:/\[.+?\]\([./?&#].*?\)/,relevance:1},{begin:/\[.+?\]\(.*?\)/,relevance:0}],returnBegin:!0,contains:[{className:"string",relevance:0,begin:"\\[",end:"\\]",excludeBegin:!0,returnEnd:!0},{className:"link",relevance:0,begin:"\\]\\(",end:"\\)",excludeBegin:!0,excludeEnd:!0},{className:"symbol",relevance:0,begin:"\\]\\[",end:"\\]",excludeBegin:!0,excludeEnd:!0}]},o={className:"strong",contains:[],variants:[{begin:/_{2}/,end:/_{2}/},{begin:/\*{2}/,end:/\*{2}/}]},i={className:"emphasis",contains:[],variants:[{begin:/\*(?!\*)/,end:/\*/},{begin:/_(?!_)/,end:/_/,relevance:0}]};o.contains.push(i),i.contains.push(o);let a=[n,r];return o.contains=o.contains.concat(a),i.contains=i.contains.concat(a),a=a.concat(o,i),{name:"Markdown",aliases:["md","mkdown","mkd"],contains:[{className:"section",variants:[{begin:"^#{1,6}",end:"$",contains:a},{begin:"(?=^.+?\\n[=-]{2,}$)",contains:[{begin:"^[=-]*$"},{begin:"^",end:"\\n",contains:a}]}]},n,{className:"bullet",begin:"^[ \t]*([*+-]|(\\d+\\.))(?=\\s+)",end:"\\s+",excludeEnd:!0},o,i,{className:"quote",begin:"^>\\s+",contains:a,end:"$"},{className:"code",variants:[{begin:"(`{3,})[^`](.|\\n)*?\\1`*[ ]*"},{begin:"(~{3,})[^~](.|\\n)*?\\1~*[ ]*"},{begin:"```",end:"```+[ ]*$"},{begin:"~~~",end:"~~~+[ ]*$"},{begin:"`.+?`"},{begin:"(?=^( {4}|\\t))",contains:[{begin:"^( {4}|\\t)",end:"(\\n)$"}],relevance:0}]},{begin:"^[-\\*]{3,}",end:"$"},r,{begin:/^\[[^\n]+\]:/,returnBegin:!0,contains:[{className:"symbol",begin:/\[/,end:/\]/,excludeBegin:!0,excludeEnd:!0},{className:"link",begin:/:\s*/,end:/$/,excludeBegin:!0}]}]}}},7285:function(t){function e(t){return t?"string"==typeof t?t:t.source:null}function n(t){return r("(?=",t,")")}function r(...t){return t.map((t=>e(t))).join("")}function o(...t){return"("+t.map((t=>e(t))).join("|")+")"}t.exports=function(t){const e=r(/[A-Z_]/,r("(",/[A-Z0-9_.-]*:/,")?"),/[A-Z0-9_.-]*/),i={className:"symbol",begin:/&[a-z]+;|&#[0-9]+;|&#x[a-f0-9]+;/},a={begin:/\s/,contains:[{className:"meta-keyword",begin:/#?[a-z_][a-z1-9_-]+/,illegal:/\n/}]},s=t.inherit(a,{begin:/\(/,end:/\)/}),l=t.inherit(t.APOS_STRING_MODE,{className:"meta-string"}),u=t.inherit(t.QUOTE_STRING_MODE,{className:"meta-string"}),c={endsWithParent:!0,illegal:/</,relevance:0,contains:[{className:"attr",begin:/[A-Za-z0-9._:-]+/,relevance:0},{begin:/=\s*/,relevance:0,contains:[{className:"string",endsParent:!0,variants:[{begin:/"/,end:/"/,contains:[i]},{begin:/'/,end:/'/,contains:[i]},{begin:/[^\s"'=<>`]+/}]}]}]};return{name:"HTML, XML",aliases:["html","xhtml","rss","atom","xjb","xsd","xsl","plist","wsf","svg"],case_insensitive:!0,contains:[{className:"meta",begin:/<![a-z]/,end:/>/,relevance:10,contains:[a,u,l,s,{begin:/\[/,end:/\]/,contains:[{className:"meta",begin:/<![a-z]/,end:/>/,contains:[a,s,u,l]}]}]},t.COMMENT(/<!--/,/-->/,{relevance:10}),{begin:/<!\[CDATA\[/,end:/\]\]>/,relevance:10},i,{className:"meta",begin:/<\?xml/,end:/\?>/,relevance:10},{className:"tag",begin:/<style(?=\s|>)/,end:/>/,keywords:{name:"style"},contains:[c],starts:{end:/<\/style>/,returnEnd:!0,subLanguage:["css","xml"]}},{className:"tag",begin:/<script(?=\s|>)/,end:/>/,keywords:{name:"script"},contains:[c],starts:{end:/<\/script>/,returnEnd:!0,subLanguage:["javascript","handlebars","xml"]}},{className:"tag",begin:/<>|<\/>/},{className:"tag",begin:r(/</,n(r(e,o(/\/>/,/>/,/\s/)))),end:/\/?>/,contains:[{className:"name",begin:e,relevance:0,starts:c}]},{className:"tag",begin:r(/<\//,n(r(e,/>/))),contains:[{className:"name",begin:e,relevance:0},{begin:/>/,relevance:0,endsParent:!0}]}]}}},4692:function(t,e){var n;!function(e,n){"use strict";"object"==typeof t.exports?t.exports=e.document?n(e,!0):function(t){if(!t.document)throw new Error("jQuery requires a window with a document");return n(t)}:n(e)}("undefined"!=typeof window?window:this,(function(r,o){"use strict";var i=[],a=Object.getPrototypeOf,s=i.slice,l=i.flat?function(t){return i.flat.call(t)}:function(t){return i.concat.apply([],t)},u=i.push,c=i.indexOf,h={},f=h.toString,p=h.hasOwnProperty,d=p.toString,m=d.call(Object),g={},v=function(t){return"function"==typeof t&&"number"!=typeof t.nodeType&&"function"!=typeof t.item},y=function(t){return null!=t&&t===t.window},b=r.document,w={type:!0,src:!0,nonce:!0,noModule:!0};function _(t,e,n){var r,o,i=(n=n||b).createElement("script");if(i.text=t,e)for(r in w)(o=e[r]||e.getAttribute&&e.getAttribute(r))&&i.setAttribute(r,o);n.head.appendChild(i).parentNode.removeChild(i)}function x(t){return null==t?t+"":"object"==typeof t||"function"==typeof t?h[f.call(t)]||"object":typeof t}var k="3.7.1",A=/HTML$/i,O=function(t,e){return new O.fn.init(t,e)};function E(t){var e=!!t&&"length"in t&&t.length,n=x(t);return!v(t)&&!y(t)&&("array"===n||0===e||"number"==typeof e&&e>0&&e-1 in t)}function C(t,e){return t.nodeName&&t.nodeName.toLowerCase()===e.toLowerCase()}O.fn=O.prototype={jquery:k,constructor:O,length:0,toArray:function(){return s.call(this)},get:function(t){return null==t?s.call(this):t<0?this[t+this.length]:this[t]},pushStack:function(t){var e=O.merge(this.constructor(),t);return e.prevObject=this,e},each:function(t){return O.each(this,t)},map:function(t){return this.pushStack(O.map(this,(function(e,n){return t.call(e,n,e)})))},slice:function(){return this.pushStack(s.apply(this,arguments))},first:function(){return this.eq(0)},last:function(){return this.eq(-1)},even:function(){return this.pushStack(O.grep(this,(function(t,e){return(e+1)%2})))},odd:function(){return this.pushStack(O.grep(this,(function(t,e){return e%2})))},eq:function(t){var e=this.length,n=+t+(t<0?e:0);return this.pushStack(n>=0&&n<e?[this[n]]:[])},end:function(){return this.prevObject||this.constructor()},push:u,sort:i.sort,splice:i.splice},O.extend=O.fn.extend=function(){var t,e,n,r,o,i,a=arguments[0]||{},s=1,l=arguments.length,u=!1;for("boolean"==typeof a&&(u=a,a=arguments[s]||{},s++),"object"==typeof a||v(a)||(a={}),s===l&&(a=this,s--);s<l;s++)if(null!=(t=arguments[s]))for(e in t)r=t[e],"__proto__"!==e&&a!==r&&(u&&r&&(O.isPlainObject(r)||(o=Array.isArray(r)))?(n=a[e],i=o&&!Array.isArray(n)?[]:o||O.isPlainObject(n)?n:{},o=!1,a[e]=O.extend(u,i,r)):void 0!==r&&(a[e]=r));return a},O.extend({expando:"jQuery"+(k+Math.random()).replace(/\D/g,""),isReady:!0,error:function(t){throw new Error(t)},noop:function(){},isPlainObject:function(t){var e,n;return!(!t||"[object Object]"!==f.call(t))&&(!(e=a(t))||"function"==typeof(n=p.call(e,"constructor")&&e.constructor)&&d.call(n)===m)},isEmptyObject:function(t){var e;for(e in t)return!1;return!0},globalEval:function(t,e,n){_(t,{nonce:e&&e.nonce},n)},each:function(t,e){var n,r=0;if(E(t))for(n=t.length;r<n&&!1!==e.call(t[r],r,t[r]);r++);else for(r in t)if(!1===e.call(t[r],r,t[r]))break;return t},text:function(t){var e,n="",r=0,o=t.nodeType;if(!o)for(;e=t[r++];)n+=O.text(e);return 1===o||11===o?t.textContent:9===o?t.documentElement.textContent:3===o||4===o?t.nodeValue:n},makeArray:function(t,e){var n=e||[];return null!=t&&(E(Object(t))?O.merge(n,"string"==typeof t?[t]:t):u.call(n,t)),n},inArray:function(t,e,n){return null==e?-1:c.call(e,t,n)},isXMLDoc:function(t){var e=t&&t.namespaceURI,n=t&&(t.ownerDocument||t).documentElement;return!A.test(e||n&&n.nodeName||"HTML")},merge:function(t,e){for(var n=+e.length,r=0,o=t.length;r<n;r++)t[o++]=e[r];return t.length=o,t},grep:function(t,e,n){for(var r=[],o=0,i=t.length,a=!n;o<i;o++)!e(t[o],o)!==a&&r.push(t[o]);return r},map:function(t,e,n){var r,o,i=0,a=[];if(E(t))for(r=t.length;i<r;i++)null!=(o=e(t[i],i,n))&&a.push(o);else for(i in t)null!=(o=e(t[i],i,n))&&a.push(o);return l(a)},guid:1,support:g}),"function"==typeof Symbol&&(O.fn[Symbol.iterator]=i[Symbol.iterator]),O.each("Boolean Number String Function Array Date RegExp Object Error Symbol".split(" "),(function(t,e){h["[object "+e+"]"]=e.toLowerCase()}));var S=i.pop,P=i.sort,j=i.splice,T="[\\x20\\t\\r\\n\\f]",R=new RegExp("^"+T+"+|((?:^|[^\\\\])(?:\\\\.)*)"+T+"+$","g");O.contains=function(t,e){var n=e&&e.parentNode;return t===n||!(!n||1!==n.nodeType||!(t.contains?t.contains(n):t.compareDocumentPosition&&16&t.compareDocumentPosition(n)))};var M=/([\0-\x1f\x7f]|^-?\d)|^-$|[^\x80-\uFFFF\w-]/g;function N(t,e){return e?"\0"===t?"�":t.slice(0,-1)+"\\"+t.charCodeAt(t.length-1).toString(16)+" ":"\\"+t}O.escapeSelector=function(t){return(t+"").replace(M,N)};var D=b,B=u;!function(){var t,e,n,o,a,l,u,h,f,d,m=B,v=O.expando,y=0,b=0,w=tt(),_=tt(),x=tt(),k=tt(),A=function(t,e){return t===e&&(a=!0),0},E="checked|selected|async|autofocus|autoplay|controls|defer|disabled|hidden|ismap|loop|multiple|open|readonly|required|scoped",M="(?:\\\\[\\da-fA-F]{1,6}"+T+"?|\\\\[^\\r\\n\\f]|[\\w-]|[^\0-\\x7f])+",N="\\["+T+"*("+M+")(?:"+T+"*([*^$|!~]?=)"+T+"*(?:'((?:\\\\.|[^\\\\'])*)'|\"((?:\\\\.|[^\\\\\"])*)\"|("+M+"))|)"+T+"*\\]",V=":("+M+")(?:\\((('((?:\\\\.|[^\\\\'])*)'|\"((?:\\\\.|[^\\\\\"])*)\")|((?:\\\\.|[^\\\\()[\\]]|"+N+")*)|.*)\\)|)",I=new RegExp(T+"+","g"),L=new RegExp("^"+T+"*,"+T+"*"),z=new RegExp("^"+T+"*([>+~]|"+T+")"+T+"*"),$=new RegExp(T+"|>"),F=new RegExp(V),U=new RegExp("^"+M+"$"),H={ID:new RegExp("^#("+M+")"),CLASS:new RegExp("^\\.("+M+")"),TAG:new RegExp("^("+M+"|[*])"),ATTR:new RegExp("^"+N),PSEUDO:new RegExp("^"+V),CHILD:new RegExp("^:(only|first|last|nth|nth-last)-(child|of-type)(?:\\("+T+"*(even|odd|(([+-]|)(\\d*)n|)"+T+"*(?:([+-]|)"+T+"*(\\d+)|))"+T+"*\\)|)","i"),bool:new RegExp("^(?:"+E+")$","i"),needsContext:new RegExp("^"+T+"*[>+~]|:(even|odd|eq|gt|lt|nth|first|last)(?:\\("+T+"*((?:-\\d)?\\d*)"+T+"*\\)|)(?=[^-]|$)","i")},q=/^(?:input|select|textarea|button)$/i,W=/^h\d$/i,G=/^(?:#([\w-]+)|(\w+)|\.([\w-]+))$/,K=/[+~]/,X=new RegExp("\\\\[\\da-fA-F]{1,6}"+T+"?|\\\\([^\\r\\n\\f])","g"),Y=function(t,e){var n="0x"+t.slice(1)-65536;return e||(n<0?String.fromCharCode(n+65536):String.fromCharCode(n>>10|55296,1023&n|56320))},J=function(){lt()},Z=ft((function(t){return!0===t.disabled&&C(t,"fieldset")}),{dir:"parentNode",next:"legend"});try{m.apply(i=s.call(D.childNodes),D.childNodes),i[D.childNodes.length].nodeType}catch(t){m={apply:function(t,e){B.apply(t,s.call(e))},call:function(t){B.apply(t,s.call(arguments,1))}}}function Q(t,e,n,r){var o,i,a,s,u,c,p,d=e&&e.ownerDocument,y=e?e.nodeType:9;if(n=n||[],"string"!=typeof t||!t||1!==y&&9!==y&&11!==y)return n;if(!r&&(lt(e),e=e||l,h)){if(11!==y&&(u=G.exec(t)))if(o=u[1]){if(9===y){if(!(a=e.getElementById(o)))return n;if(a.id===o)return m.call(n,a),n}else if(d&&(a=d.getElementById(o))&&Q.contains(e,a)&&a.id===o)return m.call(n,a),n}else{if(u[2])return m.apply(n,e.getElementsByTagName(t)),n;if((o=u[3])&&e.getElementsByClassName)return m.apply(n,e.getElementsByClassName(o)),n}if(!(k[t+" "]||f&&f.test(t))){if(p=t,d=e,1===y&&($.test(t)||z.test(t))){for((d=K.test(t)&&st(e.parentNode)||e)==e&&g.scope||((s=e.getAttribute("id"))?s=O.escapeSelector(s):e.setAttribute("id",s=v)),i=(c=ct(t)).length;i--;)c[i]=(s?"#"+s:":scope")+" "+ht(c[i]);p=c.join(",")}try{return m.apply(n,d.querySelectorAll(p)),n}catch(e){k(t,!0)}finally{s===v&&e.removeAttribute("id")}}}return yt(t.replace(R,"$1"),e,n,r)}function tt(){var t=[];return function n(r,o){return t.push(r+" ")>e.cacheLength&&delete n[t.shift()],n[r+" "]=o}}function et(t){return t[v]=!0,t}function nt(t){var e=l.createElement("fieldset");try{return!!t(e)}catch(t){return!1}finally{e.parentNode&&e.parentNode.removeChild(e),e=null}}function rt(t){return function(e){return C(e,"input")&&e.type===t}}function ot(t){return function(e){return(C(e,"input")||C(e,"button"))&&e.type===t}}function it(t){return function(e){return"form"in e?e.parentNode&&!1===e.disabled?"label"in e?"label"in e.parentNode?e.parentNode.disabled===t:e.disabled===t:e.isDisabled===t||e.isDisabled!==!t&&Z(e)===t:e.disabled===t:"label"in e&&e.disabled===t}}function at(t){return et((function(e){return e=+e,et((function(n,r){for(var o,i=t([],n.length,e),a=i.length;a--;)n[o=i[a]]&&(n[o]=!(r[o]=n[o]))}))}))}function st(t){return t&&void 0!==t.getElementsByTagName&&t}function lt(t){var n,r=t?t.ownerDocument||t:D;return r!=l&&9===r.nodeType&&r.documentElement?(u=(l=r).documentElement,h=!O.isXMLDoc(l),d=u.matches||u.webkitMatchesSelector||u.msMatchesSelector,u.msMatchesSelector&&D!=l&&(n=l.defaultView)&&n.top!==n&&n.addEventListener("unload",J),g.getById=nt((function(t){return u.appendChild(t).id=O.expando,!l.getElementsByName||!l.getElementsByName(O.expando).length})),g.disconnectedMatch=nt((function(t){return d.call(t,"*")})),g.scope=nt((function(){return l.querySelectorAll(":scope")})),g.cssHas=nt((function(){try{return l.querySelector(":has(*,:jqfake)"),!1}catch(t){return!0}})),g.getById?(e.filter.ID=function(t){var e=t.replace(X,Y);return function(t){return t.getAttribute("id")===e}},e.find.ID=function(t,e){if(void 0!==e.getElementById&&h){var n=e.getElementById(t);return n?[n]:[]}}):(e.filter.ID=function(t){var e=t.replace(X,Y);return function(t){var n=void 0!==t.getAttributeNode&&t.getAttributeNode("id");return n&&n.value===e}},e.find.ID=function(t,e){if(void 0!==e.getElementById&&h){var n,r,o,i=e.getElementById(t);if(i){if((n=i.getAttributeNode("id"))&&n.value===t)return[i];for(o=e.getElementsByName(t),r=0;i=o[r++];)if((n=i.getAttributeNode("id"))&&n.value===t)return[i]}return[]}}),e.find.TAG=function(t,e){return void 0!==e.getElementsByTagName?e.getElementsByTagName(t):e.querySelectorAll(t)},e.find.CLASS=function(t,e){if(void 0!==e.getElementsByClassName&&h)return e.getElementsByClassName(t)},f=[],nt((function(t){var e;u.appendChild(t).innerHTML="<a id='"+v+"' href='' disabled='disabled'></a><select id='"+v+"-\r\\' disabled='disabled'><option selected=''></option></select>",t.querySelectorAll("[selected]").length||f.push("\\["+T+"*(?:value|"+E+")"),t.querySelectorAll("[id~="+v+"-]").length||f.push("~="),t.querySelectorAll("a#"+v+"+*").length||f.push(".#.+[+~]"),t.querySelectorAll(":checked").length||f.push(":checked"),(e=l.createElement("input")).setAttribute("type","hidden"),t.appendChild(e).setAttribute("name","D"),u.appendChild(t).disabled=!0,2!==t.querySelectorAll(":disabled").length&&f.push(":enabled",":disabled"),(e=l.createElement("input")).setAttribute("name",""),t.appendChild(e),t.querySelectorAll("[name='']").length||f.push("\\["+T+"*name"+T+"*="+T+"*(?:''|\"\")")})),g.cssHas||f.push(":has"),f=f.length&&new RegExp(f.join("|")),A=function(t,e){if(t===e)return a=!0,0;var n=!t.compareDocumentPosition-!e.compareDocumentPosition;return n||(1&(n=(t.ownerDocument||t)==(e.ownerDocument||e)?t.compareDocumentPosition(e):1)||!g.sortDetached&&e.compareDocumentPosition(t)===n?t===l||t.ownerDocument==D&&Q.contains(D,t)?-1:e===l||e.ownerDocument==D&&Q.contains(D,e)?1:o?c.call(o,t)-c.call(o,e):0:4&n?-1:1)},l):l}for(t in Q.matches=function(t,e){return Q(t,null,null,e)},Q.matchesSelector=function(t,e){if(lt(t),h&&!k[e+" "]&&(!f||!f.test(e)))try{var n=d.call(t,e);if(n||g.disconnectedMatch||t.document&&11!==t.document.nodeType)return n}catch(t){k(e,!0)}return Q(e,l,null,[t]).length>0},Q.contains=function(t,e){return(t.ownerDocument||t)!=l&&lt(t),O.contains(t,e)},Q.attr=function(t,n){(t.ownerDocument||t)!=l&&lt(t);var r=e.attrHandle[n.toLowerCase()],o=r&&p.call(e.attrHandle,n.toLowerCase())?r(t,n,!h):void 0;return void 0!==o?o:t.getAttribute(n)},Q.error=function(t){throw new Error("Syntax error, unrecognized expression: "+t)},O.uniqueSort=function(t){var e,n=[],r=0,i=0;if(a=!g.sortStable,o=!g.sortStable&&s.call(t,0),P.call(t,A),a){for(;e=t[i++];)e===t[i]&&(r=n.push(i));for(;r--;)j.call(t,n[r],1)}return o=null,t},O.fn.uniqueSort=function(){return this.pushStack(O.uniqueSort(s.apply(this)))},e=O.expr={cacheLength:50,createPseudo:et,match:H,attrHandle:{},find:{},relative:{">":{dir:"parentNode",first:!0}," ":{dir:"parentNode"},"+":{dir:"previousSibling",first:!0},"~":{dir:"previousSibling"}},preFilter:{ATTR:function(t){return t[1]=t[1].replace(X,Y),t[3]=(t[3]||t[4]||t[5]||"").replace(X,Y),"~="===t[2]&&(t[3]=" "+t[3]+" "),t.slice(0,4)},CHILD:function(t){return t[1]=t[1].toLowerCase(),"nth"===t[1].slice(0,3)?(t[3]||Q.error(t[0]),t[4]=+(t[4]?t[5]+(t[6]||1):2*("even"===t[3]||"odd"===t[3])),t[5]=+(t[7]+t[8]||"odd"===t[3])):t[3]&&Q.error(t[0]),t},PSEUDO:function(t){var e,n=!t[6]&&t[2];return H.CHILD.test(t[0])?null:(t[3]?t[2]=t[4]||t[5]||"":n&&F.test(n)&&(e=ct(n,!0))&&(e=n.indexOf(")",n.length-e)-n.length)&&(t[0]=t[0].slice(0,e),t[2]=n.slice(0,e)),t.slice(0,3))}},filter:{TAG:function(t){var e=t.replace(X,Y).toLowerCase();return"*"===t?function(){return!0}:function(t){return C(t,e)}},CLASS:function(t){var e=w[t+" "];return e||(e=new RegExp("(^|"+T+")"+t+"("+T+"|$)"))&&w(t,(function(t){return e.test("string"==typeof t.className&&t.className||void 0!==t.getAttribute&&t.getAttribute("class")||"")}))},ATTR:function(t,e,n){return function(r){var o=Q.attr(r,t);return null==o?"!="===e:!e||(o+="","="===e?o===n:"!="===e?o!==n:"^="===e?n&&0===o.indexOf(n):"*="===e?n&&o.indexOf(n)>-1:"$="===e?n&&o.slice(-n.length)===n:"~="===e?(" "+o.replace(I," ")+" ").indexOf(n)>-1:"|="===e&&(o===n||o.slice(0,n.length+1)===n+"-"))}},CHILD:function(t,e,n,r,o){var i="nth"!==t.slice(0,3),a="last"!==t.slice(-4),s="of-type"===e;return 1===r&&0===o?function(t){return!!t.parentNode}:function(e,n,l){var u,c,h,f,p,d=i!==a?"nextSibling":"previousSibling",m=e.parentNode,g=s&&e.nodeName.toLowerCase(),b=!l&&!s,w=!1;if(m){if(i){for(;d;){for(h=e;h=h[d];)if(s?C(h,g):1===h.nodeType)return!1;p=d="only"===t&&!p&&"nextSibling"}return!0}if(p=[a?m.firstChild:m.lastChild],a&&b){for(w=(f=(u=(c=m[v]||(m[v]={}))[t]||[])[0]===y&&u[1])&&u[2],h=f&&m.childNodes[f];h=++f&&h&&h[d]||(w=f=0)||p.pop();)if(1===h.nodeType&&++w&&h===e){c[t]=[y,f,w];break}}else if(b&&(w=f=(u=(c=e[v]||(e[v]={}))[t]||[])[0]===y&&u[1]),!1===w)for(;(h=++f&&h&&h[d]||(w=f=0)||p.pop())&&(!(s?C(h,g):1===h.nodeType)||!++w||(b&&((c=h[v]||(h[v]={}))[t]=[y,w]),h!==e)););return(w-=o)===r||w%r==0&&w/r>=0}}},PSEUDO:function(t,n){var r,o=e.pseudos[t]||e.setFilters[t.toLowerCase()]||Q.error("unsupported pseudo: "+t);return o[v]?o(n):o.length>1?(r=[t,t,"",n],e.setFilters.hasOwnProperty(t.toLowerCase())?et((function(t,e){for(var r,i=o(t,n),a=i.length;a--;)t[r=c.call(t,i[a])]=!(e[r]=i[a])})):function(t){return o(t,0,r)}):o}},pseudos:{not:et((function(t){var e=[],n=[],r=vt(t.replace(R,"$1"));return r[v]?et((function(t,e,n,o){for(var i,a=r(t,null,o,[]),s=t.length;s--;)(i=a[s])&&(t[s]=!(e[s]=i))})):function(t,o,i){return e[0]=t,r(e,null,i,n),e[0]=null,!n.pop()}})),has:et((function(t){return function(e){return Q(t,e).length>0}})),contains:et((function(t){return t=t.replace(X,Y),function(e){return(e.textContent||O.text(e)).indexOf(t)>-1}})),lang:et((function(t){return U.test(t||"")||Q.error("unsupported lang: "+t),t=t.replace(X,Y).toLowerCase(),function(e){var n;do{if(n=h?e.lang:e.getAttribute("xml:lang")||e.getAttribute("lang"))return(n=n.toLowerCase())===t||0===n.indexOf(t+"-")}while((e=e.parentNode)&&1===e.nodeType);return!1}})),target:function(t){var e=r.location&&r.location.hash;return e&&e.slice(1)===t.id},root:function(t){return t===u},focus:function(t){return t===function(){try{return l.activeElement}catch(t){}}()&&l.hasFocus()&&!!(t.type||t.href||~t.tabIndex)},enabled:it(!1),disabled:it(!0),checked:function(t){return C(t,"input")&&!!t.checked||C(t,"option")&&!!t.selected},selected:function(t){return t.parentNode&&t.parentNode.selectedIndex,!0===t.selected},empty:function(t){for(t=t.firstChild;t;t=t.nextSibling)if(t.nodeType<6)return!1;return!0},parent:function(t){return!e.pseudos.empty(t)},header:function(t){return W.test(t.nodeName)},input:function(t){return q.test(t.nodeName)},button:function(t){return C(t,"input")&&"button"===t.type||C(t,"button")},text:function(t){var e;return C(t,"input")&&"text"===t.type&&(null==(e=t.getAttribute("type"))||"text"===e.toLowerCase())},first:at((function(){return[0]})),last:at((function(t,e){return[e-1]})),eq:at((function(t,e,n){return[n<0?n+e:n]})),even:at((function(t,e){for(var n=0;n<e;n+=2)t.push(n);return t})),odd:at((function(t,e){for(var n=1;n<e;n+=2)t.push(n);return t})),lt:at((function(t,e,n){var r;for(r=n<0?n+e:n>e?e:n;--r>=0;)t.push(r);return t})),gt:at((function(t,e,n){for(var r=n<0?n+e:n;++r<e;)t.push(r);return t}))}},e.pseudos.nth=e.pseudos.eq,{radio:!0,checkbox:!0,file:!0,password:!0,image:!0})e.pseudos[t]=rt(t);for(t in{submit:!0,reset:!0})e.pseudos[t]=ot(t);function ut(){}function ct(t,n){var r,o,i,a,s,l,u,c=_[t+" "];if(c)return n?0:c.slice(0);for(s=t,l=[],u=e.preFilter;s;){for(a in r&&!(o=L.exec(s))||(o&&(s=s.slice(o[0].length)||s),l.push(i=[])),r=!1,(o=z.exec(s))&&(r=o.shift(),i.push({value:r,type:o[0].replace(R," ")}),s=s.slice(r.length)),e.filter)!(o=H[a].exec(s))||u[a]&&!(o=u[a](o))||(r=o.shift(),i.push({value:r,type:a,matches:o}),s=s.slice(r.length));if(!r)break}return n?s.length:s?Q.error(t):_(t,l).slice(0)}function ht(t){for(var e=0,n=t.length,r="";e<n;e++)r+=t[e].value;return r}function ft(t,e,n){var r=e.dir,o=e.next,i=o||r,a=n&&"parentNode"===i,s=b++;return e.first?function(e,n,o){for(;e=e[r];)if(1===e.nodeType||a)return t(e,n,o);return!1}:function(e,n,l){var u,c,h=[y,s];if(l){for(;e=e[r];)if((1===e.nodeType||a)&&t(e,n,l))return!0}else for(;e=e[r];)if(1===e.nodeType||a)if(c=e[v]||(e[v]={}),o&&C(e,o))e=e[r]||e;else{if((u=c[i])&&u[0]===y&&u[1]===s)return h[2]=u[2];if(c[i]=h,h[2]=t(e,n,l))return!0}return!1}}function pt(t){return t.length>1?function(e,n,r){for(var o=t.length;o--;)if(!t[o](e,n,r))return!1;return!0}:t[0]}function dt(t,e,n,r,o){for(var i,a=[],s=0,l=t.length,u=null!=e;s<l;s++)(i=t[s])&&(n&&!n(i,r,o)||(a.push(i),u&&e.push(s)));return a}function mt(t,e,n,r,o,i){return r&&!r[v]&&(r=mt(r)),o&&!o[v]&&(o=mt(o,i)),et((function(i,a,s,l){var u,h,f,p,d=[],g=[],v=a.length,y=i||function(t,e,n){for(var r=0,o=e.length;r<o;r++)Q(t,e[r],n);return n}(e||"*",s.nodeType?[s]:s,[]),b=!t||!i&&e?y:dt(y,d,t,s,l);if(n?n(b,p=o||(i?t:v||r)?[]:a,s,l):p=b,r)for(u=dt(p,g),r(u,[],s,l),h=u.length;h--;)(f=u[h])&&(p[g[h]]=!(b[g[h]]=f));if(i){if(o||t){if(o){for(u=[],h=p.length;h--;)(f=p[h])&&u.push(b[h]=f);o(null,p=[],u,l)}for(h=p.length;h--;)(f=p[h])&&(u=o?c.call(i,f):d[h])>-1&&(i[u]=!(a[u]=f))}}else p=dt(p===a?p.splice(v,p.length):p),o?o(null,a,p,l):m.apply(a,p)}))}function gt(t){for(var r,o,i,a=t.length,s=e.relative[t[0].type],l=s||e.relative[" "],u=s?1:0,h=ft((function(t){return t===r}),l,!0),f=ft((function(t){return c.call(r,t)>-1}),l,!0),p=[function(t,e,o){var i=!s&&(o||e!=n)||((r=e).nodeType?h(t,e,o):f(t,e,o));return r=null,i}];u<a;u++)if(o=e.relative[t[u].type])p=[ft(pt(p),o)];else{if((o=e.filter[t[u].type].apply(null,t[u].matches))[v]){for(i=++u;i<a&&!e.relative[t[i].type];i++);return mt(u>1&&pt(p),u>1&&ht(t.slice(0,u-1).concat({value:" "===t[u-2].type?"*":""})).replace(R,"$1"),o,u<i&&gt(t.slice(u,i)),i<a&&gt(t=t.slice(i)),i<a&&ht(t))}p.push(o)}return pt(p)}function vt(t,r){var o,i=[],a=[],s=x[t+" "];if(!s){for(r||(r=ct(t)),o=r.length;o--;)(s=gt(r[o]))[v]?i.push(s):a.push(s);s=x(t,function(t,r){var o=r.length>0,i=t.length>0,a=function(a,s,u,c,f){var p,d,g,v=0,b="0",w=a&&[],_=[],x=n,k=a||i&&e.find.TAG("*",f),A=y+=null==x?1:Math.random()||.1,E=k.length;for(f&&(n=s==l||s||f);b!==E&&null!=(p=k[b]);b++){if(i&&p){for(d=0,s||p.ownerDocument==l||(lt(p),u=!h);g=t[d++];)if(g(p,s||l,u)){m.call(c,p);break}f&&(y=A)}o&&((p=!g&&p)&&v--,a&&w.push(p))}if(v+=b,o&&b!==v){for(d=0;g=r[d++];)g(w,_,s,u);if(a){if(v>0)for(;b--;)w[b]||_[b]||(_[b]=S.call(c));_=dt(_)}m.apply(c,_),f&&!a&&_.length>0&&v+r.length>1&&O.uniqueSort(c)}return f&&(y=A,n=x),w};return o?et(a):a}(a,i)),s.selector=t}return s}function yt(t,n,r,o){var i,a,s,l,u,c="function"==typeof t&&t,f=!o&&ct(t=c.selector||t);if(r=r||[],1===f.length){if((a=f[0]=f[0].slice(0)).length>2&&"ID"===(s=a[0]).type&&9===n.nodeType&&h&&e.relative[a[1].type]){if(!(n=(e.find.ID(s.matches[0].replace(X,Y),n)||[])[0]))return r;c&&(n=n.parentNode),t=t.slice(a.shift().value.length)}for(i=H.needsContext.test(t)?0:a.length;i--&&(s=a[i],!e.relative[l=s.type]);)if((u=e.find[l])&&(o=u(s.matches[0].replace(X,Y),K.test(a[0].type)&&st(n.parentNode)||n))){if(a.splice(i,1),!(t=o.length&&ht(a)))return m.apply(r,o),r;break}}return(c||vt(t,f))(o,n,!h,r,!n||K.test(t)&&st(n.parentNode)||n),r}ut.prototype=e.filters=e.pseudos,e.setFilters=new ut,g.sortStable=v.split("").sort(A).join("")===v,lt(),g.sortDetached=nt((function(t){return 1&t.compareDocumentPosition(l.createElement("fieldset"))})),O.find=Q,O.expr[":"]=O.expr.pseudos,O.unique=O.uniqueSort,Q.compile=vt,Q.select=yt,Q.setDocument=lt,Q.tokenize=ct,Q.escape=O.escapeSelector,Q.getText=O.text,Q.isXML=O.isXMLDoc,Q.selectors=O.expr,Q.support=O.support,Q.uniqueSort=O.uniqueSort}();var V=function(t,e,n){for(var r=[],o=void 0!==n;(t=t[e])&&9!==t.nodeType;)if(1===t.nodeType){if(o&&O(t).is(n))break;r.push(t)}return r},I=function(t,e){for(var n=[];t;t=t.nextSibling)1===t.nodeType&&t!==e&&n.push(t);return n},L=O.expr.match.needsContext,z=/^<([a-z][^\/\0>:\x20\t\r\n\f]*)[\x20\t\r\n\f]*\/?>(?:<\/\1>|)$/i;function $(t,e,n){return v(e)?O.grep(t,(function(t,r){return!!e.call(t,r,t)!==n})):e.nodeType?O.grep(t,(function(t){return t===e!==n})):"string"!=typeof e?O.grep(t,(function(t){return c.call(e,t)>-1!==n})):O.filter(e,t,n)}O.filter=function(t,e,n){var r=e[0];return n&&(t=":not("+t+")"),1===e.length&&1===r.nodeType?O.find.matchesSelector(r,t)?[r]:[]:O.find.matches(t,O.grep(e,(function(t){return 1===t.nodeType})))},O.fn.extend({find:function(t){var e,n,r=this.length,o=this;if("string"!=typeof t)return this.pushStack(O(t).filter((function(){for(e=0;e<r;e++)if(O.contains(o[e],this))return!0})));for(n=this.pushStack([]),e=0;e<r;e++)O.find(t,o[e],n);return r>1?O.uniqueSort(n):n},filter:function(t){return this.pushStack($(this,t||[],!1))},not:function(t){return this.pushStack($(this,t||[],!0))},is:function(t){return!!$(this,"string"==typeof t&&L.test(t)?O(t):t||[],!1).length}});var F,U=/^(?:\s*(<[\w\W]+>)[^>]*|#([\w-]+))$/;(O.fn.init=function(t,e,n){var r,o;if(!t)return this;if(n=n||F,"string"==typeof t){if(!(r="<"===t[0]&&">"===t[t.length-1]&&t.length>=3?[null,t,null]:U.exec(t))||!r[1]&&e)return!e||e.jquery?(e||n).find(t):this.constructor(e).find(t);if(r[1]){if(e=e instanceof O?e[0]:e,O.merge(this,O.parseHTML(r[1],e&&e.nodeType?e.ownerDocument||e:b,!0)),z.test(r[1])&&O.isPlainObject(e))for(r in e)v(this[r])?this[r](e[r]):this.attr(r,e[r]);return this}return(o=b.getElementById(r[2]))&&(this[0]=o,this.length=1),this}return t.nodeType?(this[0]=t,this.length=1,this):v(t)?void 0!==n.ready?n.ready(t):t(O):O.makeArray(t,this)}).prototype=O.fn,F=O(b);var H=/^(?:parents|prev(?:Until|All))/,q={children:!0,contents:!0,next:!0,prev:!0};function W(t,e){for(;(t=t[e])&&1!==t.nodeType;);return t}O.fn.extend({has:function(t){var e=O(t,this),n=e.length;return this.filter((function(){for(var t=0;t<n;t++)if(O.contains(this,e[t]))return!0}))},closest:function(t,e){var n,r=0,o=this.length,i=[],a="string"!=typeof t&&O(t);if(!L.test(t))for(;r<o;r++)for(n=this[r];n&&n!==e;n=n.parentNode)if(n.nodeType<11&&(a?a.index(n)>-1:1===n.nodeType&&O.find.matchesSelector(n,t))){i.push(n);break}return this.pushStack(i.length>1?O.uniqueSort(i):i)},index:function(t){return t?"string"==typeof t?c.call(O(t),this[0]):c.call(this,t.jquery?t[0]:t):this[0]&&this[0].parentNode?this.first().prevAll().length:-1},add:function(t,e){return this.pushStack(O.uniqueSort(O.merge(this.get(),O(t,e))))},addBack:function(t){return this.add(null==t?this.prevObject:this.prevObject.filter(t))}}),O.each({parent:function(t){var e=t.parentNode;return e&&11!==e.nodeType?e:null},parents:function(t){return V(t,"parentNode")},parentsUntil:function(t,e,n){return V(t,"parentNode",n)},next:function(t){return W(t,"nextSibling")},prev:function(t){return W(t,"previousSibling")},nextAll:function(t){return V(t,"nextSibling")},prevAll:function(t){return V(t,"previousSibling")},nextUntil:function(t,e,n){return V(t,"nextSibling",n)},prevUntil:function(t,e,n){return V(t,"previousSibling",n)},siblings:function(t){return I((t.parentNode||{}).firstChild,t)},children:function(t){return I(t.firstChild)},contents:function(t){return null!=t.contentDocument&&a(t.contentDocument)?t.contentDocument:(C(t,"template")&&(t=t.content||t),O.merge([],t.childNodes))}},(function(t,e){O.fn[t]=function(n,r){var o=O.map(this,e,n);return"Until"!==t.slice(-5)&&(r=n),r&&"string"==typeof r&&(o=O.filter(r,o)),this.length>1&&(q[t]||O.uniqueSort(o),H.test(t)&&o.reverse()),this.pushStack(o)}}));var G=/[^\x20\t\r\n\f]+/g;function K(t){return t}function X(t){throw t}function Y(t,e,n,r){var o;try{t&&v(o=t.promise)?o.call(t).done(e).fail(n):t&&v(o=t.then)?o.call(t,e,n):e.apply(void 0,[t].slice(r))}catch(t){n.apply(void 0,[t])}}O.Callbacks=function(t){t="string"==typeof t?function(t){var e={};return O.each(t.match(G)||[],(function(t,n){e[n]=!0})),e}(t):O.extend({},t);var e,n,r,o,i=[],a=[],s=-1,l=function(){for(o=o||t.once,r=e=!0;a.length;s=-1)for(n=a.shift();++s<i.length;)!1===i[s].apply(n[0],n[1])&&t.stopOnFalse&&(s=i.length,n=!1);t.memory||(n=!1),e=!1,o&&(i=n?[]:"")},u={add:function(){return i&&(n&&!e&&(s=i.length-1,a.push(n)),function e(n){O.each(n,(function(n,r){v(r)?t.unique&&u.has(r)||i.push(r):r&&r.length&&"string"!==x(r)&&e(r)}))}(arguments),n&&!e&&l()),this},remove:function(){return O.each(arguments,(function(t,e){for(var n;(n=O.inArray(e,i,n))>-1;)i.splice(n,1),n<=s&&s--})),this},has:function(t){return t?O.inArray(t,i)>-1:i.length>0},empty:function(){return i&&(i=[]),this},disable:function(){return o=a=[],i=n="",this},disabled:function(){return!i},lock:function(){return o=a=[],n||e||(i=n=""),this},locked:function(){return!!o},fireWith:function(t,n){return o||(n=[t,(n=n||[]).slice?n.slice():n],a.push(n),e||l()),this},fire:function(){return u.fireWith(this,arguments),this},fired:function(){return!!r}};return u},O.extend({Deferred:function(t){var e=[["notify","progress",O.Callbacks("memory"),O.Callbacks("memory"),2],["resolve","done",O.Callbacks("once memory"),O.Callbacks("once memory"),0,"resolved"],["reject","fail",O.Callbacks("once memory"),O.Callbacks("once memory"),1,"rejected"]],n="pending",o={state:function(){return n},always:function(){return i.done(arguments).fail(arguments),this},catch:function(t){return o.then(null,t)},pipe:function(){var t=arguments;return O.Deferred((function(n){O.each(e,(function(e,r){var o=v(t[r[4]])&&t[r[4]];i[r[1]]((function(){var t=o&&o.apply(this,arguments);t&&v(t.promise)?t.promise().progress(n.notify).done(n.resolve).fail(n.reject):n[r[0]+"With"](this,o?[t]:arguments)}))})),t=null})).promise()},then:function(t,n,o){var i=0;function a(t,e,n,o){return function(){var s=this,l=arguments,u=function(){var r,u;if(!(t<i)){if((r=n.apply(s,l))===e.promise())throw new TypeError("Thenable self-resolution");u=r&&("object"==typeof r||"function"==typeof r)&&r.then,v(u)?o?u.call(r,a(i,e,K,o),a(i,e,X,o)):(i++,u.call(r,a(i,e,K,o),a(i,e,X,o),a(i,e,K,e.notifyWith))):(n!==K&&(s=void 0,l=[r]),(o||e.resolveWith)(s,l))}},c=o?u:function(){try{u()}catch(r){O.Deferred.exceptionHook&&O.Deferred.exceptionHook(r,c.error),t+1>=i&&(n!==X&&(s=void 0,l=[r]),e.rejectWith(s,l))}};t?c():(O.Deferred.getErrorHook?c.error=O.Deferred.getErrorHook():O.Deferred.getStackHook&&(c.error=O.Deferred.getStackHook()),r.setTimeout(c))}}return O.Deferred((function(r){e[0][3].add(a(0,r,v(o)?o:K,r.notifyWith)),e[1][3].add(a(0,r,v(t)?t:K)),e[2][3].add(a(0,r,v(n)?n:X))})).promise()},promise:function(t){return null!=t?O.extend(t,o):o}},i={};return O.each(e,(function(t,r){var a=r[2],s=r[5];o[r[1]]=a.add,s&&a.add((function(){n=s}),e[3-t][2].disable,e[3-t][3].disable,e[0][2].lock,e[0][3].lock),a.add(r[3].fire),i[r[0]]=function(){return i[r[0]+"With"](this===i?void 0:this,arguments),this},i[r[0]+"With"]=a.fireWith})),o.promise(i),t&&t.call(i,i),i},when:function(t){var e=arguments.length,n=e,r=Array(n),o=s.call(arguments),i=O.Deferred(),a=function(t){return function(n){r[t]=this,o[t]=arguments.length>1?s.call(arguments):n,--e||i.resolveWith(r,o)}};if(e<=1&&(Y(t,i.done(a(n)).resolve,i.reject,!e),"pending"===i.state()||v(o[n]&&o[n].then)))return i.then();for(;n--;)Y(o[n],a(n),i.reject);return i.promise()}});var J=/^(Eval|Internal|Range|Reference|Syntax|Type|URI)Error$/;O.Deferred.exceptionHook=function(t,e){r.console&&r.console.warn&&t&&J.test(t.name)&&r.console.warn("jQuery.Deferred exception: "+t.message,t.stack,e)},O.readyException=function(t){r.setTimeout((function(){throw t}))};var Z=O.Deferred();function Q(){b.removeEventListener("DOMContentLoaded",Q),r.removeEventListener("load",Q),O.ready()}O.fn.ready=function(t){return Z.then(t).catch((function(t){O.readyException(t)})),this},O.extend({isReady:!1,readyWait:1,ready:function(t){(!0===t?--O.readyWait:O.isReady)||(O.isReady=!0,!0!==t&&--O.readyWait>0||Z.resolveWith(b,[O]))}}),O.ready.then=Z.then,"complete"===b.readyState||"loading"!==b.readyState&&!b.documentElement.doScroll?r.setTimeout(O.ready):(b.addEventListener("DOMContentLoaded",Q),r.addEventListener("load",Q));var tt=function(t,e,n,r,o,i,a){var s=0,l=t.length,u=null==n;if("object"===x(n))for(s in o=!0,n)tt(t,e,s,n[s],!0,i,a);else if(void 0!==r&&(o=!0,v(r)||(a=!0),u&&(a?(e.call(t,r),e=null):(u=e,e=function(t,e,n){return u.call(O(t),n)})),e))for(;s<l;s++)e(t[s],n,a?r:r.call(t[s],s,e(t[s],n)));return o?t:u?e.call(t):l?e(t[0],n):i},et=/^-ms-/,nt=/-([a-z])/g;function rt(t,e){return e.toUpperCase()}function ot(t){return t.replace(et,"ms-").replace(nt,rt)}var it=function(t){return 1===t.nodeType||9===t.nodeType||!+t.nodeType};function at(){this.expando=O.expando+at.uid++}at.uid=1,at.prototype={cache:function(t){var e=t[this.expando];return e||(e={},it(t)&&(t.nodeType?t[this.expando]=e:Object.defineProperty(t,this.expando,{value:e,configurable:!0}))),e},set:function(t,e,n){var r,o=this.cache(t);if("string"==typeof e)o[ot(e)]=n;else for(r in e)o[ot(r)]=e[r];return o},get:function(t,e){return void 0===e?this.cache(t):t[this.expando]&&t[this.expando][ot(e)]},access:function(t,e,n){return void 0===e||e&&"string"==typeof e&&void 0===n?this.get(t,e):(this.set(t,e,n),void 0!==n?n:e)},remove:function(t,e){var n,r=t[this.expando];if(void 0!==r){if(void 0!==e){n=(e=Array.isArray(e)?e.map(ot):(e=ot(e))in r?[e]:e.match(G)||[]).length;for(;n--;)delete r[e[n]]}(void 0===e||O.isEmptyObject(r))&&(t.nodeType?t[this.expando]=void 0:delete t[this.expando])}},hasData:function(t){var e=t[this.expando];return void 0!==e&&!O.isEmptyObject(e)}};var st=new at,lt=new at,ut=/^(?:\{[\w\W]*\}|\[[\w\W]*\])$/,ct=/[A-Z]/g;function ht(t,e,n){var r;if(void 0===n&&1===t.nodeType)if(r="data-"+e.replace(ct,"-$&").toLowerCase(),"string"==typeof(n=t.getAttribute(r))){try{n=function(t){return"true"===t||"false"!==t&&("null"===t?null:t===+t+""?+t:ut.test(t)?JSON.parse(t):t)}(n)}catch(t){}lt.set(t,e,n)}else n=void 0;return n}O.extend({hasData:function(t){return lt.hasData(t)||st.hasData(t)},data:function(t,e,n){return lt.access(t,e,n)},removeData:function(t,e){lt.remove(t,e)},_data:function(t,e,n){return st.access(t,e,n)},_removeData:function(t,e){st.remove(t,e)}}),O.fn.extend({data:function(t,e){var n,r,o,i=this[0],a=i&&i.attributes;if(void 0===t){if(this.length&&(o=lt.get(i),1===i.nodeType&&!st.get(i,"hasDataAttrs"))){for(n=a.length;n--;)a[n]&&0===(r=a[n].name).indexOf("data-")&&(r=ot(r.slice(5)),ht(i,r,o[r]));st.set(i,"hasDataAttrs",!0)}return o}return"object"==typeof t?this.each((function(){lt.set(this,t)})):tt(this,(function(e){var n;if(i&&void 0===e)return void 0!==(n=lt.get(i,t))||void 0!==(n=ht(i,t))?n:void 0;this.each((function(){lt.set(this,t,e)}))}),null,e,arguments.length>1,null,!0)},removeData:function(t){return this.each((function(){lt.remove(this,t)}))}}),O.extend({queue:function(t,e,n){var r;if(t)return e=(e||"fx")+"queue",r=st.get(t,e),n&&(!r||Array.isArray(n)?r=st.access(t,e,O.makeArray(n)):r.push(n)),r||[]},dequeue:function(t,e){e=e||"fx";var n=O.queue(t,e),r=n.length,o=n.shift(),i=O._queueHooks(t,e);"inprogress"===o&&(o=n.shift(),r--),o&&("fx"===e&&n.unshift("inprogress"),delete i.stop,o.call(t,(function(){O.dequeue(t,e)}),i)),!r&&i&&i.empty.fire()},_queueHooks:function(t,e){var n=e+"queueHooks";return st.get(t,n)||st.access(t,n,{empty:O.Callbacks("once memory").add((function(){st.remove(t,[e+"queue",n])}))})}}),O.fn.extend({queue:function(t,e){var n=2;return"string"!=typeof t&&(e=t,t="fx",n--),arguments.length<n?O.queue(this[0],t):void 0===e?this:this.each((function(){var n=O.queue(this,t,e);O._queueHooks(this,t),"fx"===t&&"inprogress"!==n[0]&&O.dequeue(this,t)}))},dequeue:function(t){return this.each((function(){O.dequeue(this,t)}))},clearQueue:function(t){return this.queue(t||"fx",[])},promise:function(t,e){var n,r=1,o=O.Deferred(),i=this,a=this.length,s=function(){--r||o.resolveWith(i,[i])};for("string"!=typeof t&&(e=t,t=void 0),t=t||"fx";a--;)(n=st.get(i[a],t+"queueHooks"))&&n.empty&&(r++,n.empty.add(s));return s(),o.promise(e)}});var ft=/[+-]?(?:\d*\.|)\d+(?:[eE][+-]?\d+|)/.source,pt=new RegExp("^(?:([+-])=|)("+ft+")([a-z%]*)$","i"),dt=["Top","Right","Bottom","Left"],mt=b.documentElement,gt=function(t){return O.contains(t.ownerDocument,t)},vt={composed:!0};mt.getRootNode&&(gt=function(t){return O.contains(t.ownerDocument,t)||t.getRootNode(vt)===t.ownerDocument});var yt=function(t,e){return"none"===(t=e||t).style.display||""===t.style.display&&gt(t)&&"none"===O.css(t,"display")};function bt(t,e,n,r){var o,i,a=20,s=r?function(){return r.cur()}:function(){return O.css(t,e,"")},l=s(),u=n&&n[3]||(O.cssNumber[e]?"":"px"),c=t.nodeType&&(O.cssNumber[e]||"px"!==u&&+l)&&pt.exec(O.css(t,e));if(c&&c[3]!==u){for(l/=2,u=u||c[3],c=+l||1;a--;)O.style(t,e,c+u),(1-i)*(1-(i=s()/l||.5))<=0&&(a=0),c/=i;c*=2,O.style(t,e,c+u),n=n||[]}return n&&(c=+c||+l||0,o=n[1]?c+(n[1]+1)*n[2]:+n[2],r&&(r.unit=u,r.start=c,r.end=o)),o}var wt={};function _t(t){var e,n=t.ownerDocument,r=t.nodeName,o=wt[r];return o||(e=n.body.appendChild(n.createElement(r)),o=O.css(e,"display"),e.parentNode.removeChild(e),"none"===o&&(o="block"),wt[r]=o,o)}function xt(t,e){for(var n,r,o=[],i=0,a=t.length;i<a;i++)(r=t[i]).style&&(n=r.style.display,e?("none"===n&&(o[i]=st.get(r,"display")||null,o[i]||(r.style.display="")),""===r.style.display&&yt(r)&&(o[i]=_t(r))):"none"!==n&&(o[i]="none",st.set(r,"display",n)));for(i=0;i<a;i++)null!=o[i]&&(t[i].style.display=o[i]);return t}O.fn.extend({show:function(){return xt(this,!0)},hide:function(){return xt(this)},toggle:function(t){return"boolean"==typeof t?t?this.show():this.hide():this.each((function(){yt(this)?O(this).show():O(this).hide()}))}});var kt,At,Ot=/^(?:checkbox|radio)$/i,Et=/<([a-z][^\/\0>\x20\t\r\n\f]*)/i,Ct=/^$|^module$|\/(?:java|ecma)script/i;kt=b.createDocumentFragment().appendChild(b.createElement("div")),(At=b.createElement("input")).setAttribute("type","radio"),At.setAttribute("checked","checked"),At.setAttribute("name","t"),kt.appendChild(At),g.checkClone=kt.cloneNode(!0).cloneNode(!0).lastChild.checked,kt.innerHTML="<textarea>x</textarea>",g.noCloneChecked=!!kt.cloneNode(!0).lastChild.defaultValue,kt.innerHTML="<option></option>",g.option=!!kt.lastChild;var St={thead:[1,"<table>","</table>"],col:[2,"<table><colgroup>","</colgroup></table>"],tr:[2,"<table><tbody>","</tbody></table>"],td:[3,"<table><tbody><tr>","</tr></tbody></table>"],_default:[0,"",""]};function Pt(t,e){var n;return n=void 0!==t.getElementsByTagName?t.getElementsByTagName(e||"*"):void 0!==t.querySelectorAll?t.querySelectorAll(e||"*"):[],void 0===e||e&&C(t,e)?O.merge([t],n):n}function jt(t,e){for(var n=0,r=t.length;n<r;n++)st.set(t[n],"globalEval",!e||st.get(e[n],"globalEval"))}St.tbody=St.tfoot=St.colgroup=St.caption=St.thead,St.th=St.td,g.option||(St.optgroup=St.option=[1,"<select multiple='multiple'>","</select>"]);var Tt=/<|&#?\w+;/;function Rt(t,e,n,r,o){for(var i,a,s,l,u,c,h=e.createDocumentFragment(),f=[],p=0,d=t.length;p<d;p++)if((i=t[p])||0===i)if("object"===x(i))O.merge(f,i.nodeType?[i]:i);else if(Tt.test(i)){for(a=a||h.appendChild(e.createElement("div")),s=(Et.exec(i)||["",""])[1].toLowerCase(),l=St[s]||St._default,a.innerHTML=l[1]+O.htmlPrefilter(i)+l[2],c=l[0];c--;)a=a.lastChild;O.merge(f,a.childNodes),(a=h.firstChild).textContent=""}else f.push(e.createTextNode(i));for(h.textContent="",p=0;i=f[p++];)if(r&&O.inArray(i,r)>-1)o&&o.push(i);else if(u=gt(i),a=Pt(h.appendChild(i),"script"),u&&jt(a),n)for(c=0;i=a[c++];)Ct.test(i.type||"")&&n.push(i);return h}var Mt=/^([^.]*)(?:\.(.+)|)/;function Nt(){return!0}function Dt(){return!1}function Bt(t,e,n,r,o,i){var a,s;if("object"==typeof e){for(s in"string"!=typeof n&&(r=r||n,n=void 0),e)Bt(t,s,n,r,e[s],i);return t}if(null==r&&null==o?(o=n,r=n=void 0):null==o&&("string"==typeof n?(o=r,r=void 0):(o=r,r=n,n=void 0)),!1===o)o=Dt;else if(!o)return t;return 1===i&&(a=o,o=function(t){return O().off(t),a.apply(this,arguments)},o.guid=a.guid||(a.guid=O.guid++)),t.each((function(){O.event.add(this,e,o,r,n)}))}function Vt(t,e,n){n?(st.set(t,e,!1),O.event.add(t,e,{namespace:!1,handler:function(t){var n,r=st.get(this,e);if(1&t.isTrigger&&this[e]){if(r)(O.event.special[e]||{}).delegateType&&t.stopPropagation();else if(r=s.call(arguments),st.set(this,e,r),this[e](),n=st.get(this,e),st.set(this,e,!1),r!==n)return t.stopImmediatePropagation(),t.preventDefault(),n}else r&&(st.set(this,e,O.event.trigger(r[0],r.slice(1),this)),t.stopPropagation(),t.isImmediatePropagationStopped=Nt)}})):void 0===st.get(t,e)&&O.event.add(t,e,Nt)}O.event={global:{},add:function(t,e,n,r,o){var i,a,s,l,u,c,h,f,p,d,m,g=st.get(t);if(it(t))for(n.handler&&(n=(i=n).handler,o=i.selector),o&&O.find.matchesSelector(mt,o),n.guid||(n.guid=O.guid++),(l=g.events)||(l=g.events=Object.create(null)),(a=g.handle)||(a=g.handle=function(e){return void 0!==O&&O.event.triggered!==e.type?O.event.dispatch.apply(t,arguments):void 0}),u=(e=(e||"").match(G)||[""]).length;u--;)p=m=(s=Mt.exec(e[u])||[])[1],d=(s[2]||"").split(".").sort(),p&&(h=O.event.special[p]||{},p=(o?h.delegateType:h.bindType)||p,h=O.event.special[p]||{},c=O.extend({type:p,origType:m,data:r,handler:n,guid:n.guid,selector:o,needsContext:o&&O.expr.match.needsContext.test(o),namespace:d.join(".")},i),(f=l[p])||((f=l[p]=[]).delegateCount=0,h.setup&&!1!==h.setup.call(t,r,d,a)||t.addEventListener&&t.addEventListener(p,a)),h.add&&(h.add.call(t,c),c.handler.guid||(c.handler.guid=n.guid)),o?f.splice(f.delegateCount++,0,c):f.push(c),O.event.global[p]=!0)},remove:function(t,e,n,r,o){var i,a,s,l,u,c,h,f,p,d,m,g=st.hasData(t)&&st.get(t);if(g&&(l=g.events)){for(u=(e=(e||"").match(G)||[""]).length;u--;)if(p=m=(s=Mt.exec(e[u])||[])[1],d=(s[2]||"").split(".").sort(),p){for(h=O.event.special[p]||{},f=l[p=(r?h.delegateType:h.bindType)||p]||[],s=s[2]&&new RegExp("(^|\\.)"+d.join("\\.(?:.*\\.|)")+"(\\.|$)"),a=i=f.length;i--;)c=f[i],!o&&m!==c.origType||n&&n.guid!==c.guid||s&&!s.test(c.namespace)||r&&r!==c.selector&&("**"!==r||!c.selector)||(f.splice(i,1),c.selector&&f.delegateCount--,h.remove&&h.remove.call(t,c));a&&!f.length&&(h.teardown&&!1!==h.teardown.call(t,d,g.handle)||O.removeEvent(t,p,g.handle),delete l[p])}else for(p in l)O.event.remove(t,p+e[u],n,r,!0);O.isEmptyObject(l)&&st.remove(t,"handle events")}},dispatch:function(t){var e,n,r,o,i,a,s=new Array(arguments.length),l=O.event.fix(t),u=(st.get(this,"events")||Object.create(null))[l.type]||[],c=O.event.special[l.type]||{};for(s[0]=l,e=1;e<arguments.length;e++)s[e]=arguments[e];if(l.delegateTarget=this,!c.preDispatch||!1!==c.preDispatch.call(this,l)){for(a=O.event.handlers.call(this,l,u),e=0;(o=a[e++])&&!l.isPropagationStopped();)for(l.currentTarget=o.elem,n=0;(i=o.handlers[n++])&&!l.isImmediatePropagationStopped();)l.rnamespace&&!1!==i.namespace&&!l.rnamespace.test(i.namespace)||(l.handleObj=i,l.data=i.data,void 0!==(r=((O.event.special[i.origType]||{}).handle||i.handler).apply(o.elem,s))&&!1===(l.result=r)&&(l.preventDefault(),l.stopPropagation()));return c.postDispatch&&c.postDispatch.call(this,l),l.result}},handlers:function(t,e){var n,r,o,i,a,s=[],l=e.delegateCount,u=t.target;if(l&&u.nodeType&&!("click"===t.type&&t.button>=1))for(;u!==this;u=u.parentNode||this)if(1===u.nodeType&&("click"!==t.type||!0!==u.disabled)){for(i=[],a={},n=0;n<l;n++)void 0===a[o=(r=e[n]).selector+" "]&&(a[o]=r.needsContext?O(o,this).index(u)>-1:O.find(o,this,null,[u]).length),a[o]&&i.push(r);i.length&&s.push({elem:u,handlers:i})}return u=this,l<e.length&&s.push({elem:u,handlers:e.slice(l)}),s},addProp:function(t,e){Object.defineProperty(O.Event.prototype,t,{enumerable:!0,configurable:!0,get:v(e)?function(){if(this.originalEvent)return e(this.originalEvent)}:function(){if(this.originalEvent)return this.originalEvent[t]},set:function(e){Object.defineProperty(this,t,{enumerable:!0,configurable:!0,writable:!0,value:e})}})},fix:function(t){return t[O.expando]?t:new O.Event(t)},special:{load:{noBubble:!0},click:{setup:function(t){var e=this||t;return Ot.test(e.type)&&e.click&&C(e,"input")&&Vt(e,"click",!0),!1},trigger:function(t){var e=this||t;return Ot.test(e.type)&&e.click&&C(e,"input")&&Vt(e,"click"),!0},_default:function(t){var e=t.target;return Ot.test(e.type)&&e.click&&C(e,"input")&&st.get(e,"click")||C(e,"a")}},beforeunload:{postDispatch:function(t){void 0!==t.result&&t.originalEvent&&(t.originalEvent.returnValue=t.result)}}}},O.removeEvent=function(t,e,n){t.removeEventListener&&t.removeEventListener(e,n)},O.Event=function(t,e){if(!(this instanceof O.Event))return new O.Event(t,e);t&&t.type?(this.originalEvent=t,this.type=t.type,this.isDefaultPrevented=t.defaultPrevented||void 0===t.defaultPrevented&&!1===t.returnValue?Nt:Dt,this.target=t.target&&3===t.target.nodeType?t.target.parentNode:t.target,this.currentTarget=t.currentTarget,this.relatedTarget=t.relatedTarget):this.type=t,e&&O.extend(this,e),this.timeStamp=t&&t.timeStamp||Date.now(),this[O.expando]=!0},O.Event.prototype={constructor:O.Event,isDefaultPrevented:Dt,isPropagationStopped:Dt,isImmediatePropagationStopped:Dt,isSimulated:!1,preventDefault:function(){var t=this.originalEvent;this.isDefaultPrevented=Nt,t&&!this.isSimulated&&t.preventDefault()},stopPropagation:function(){var t=this.originalEvent;this.isPropagationStopped=Nt,t&&!this.isSimulated&&t.stopPropagation()},stopImmediatePropagation:function(){var t=this.originalEvent;this.isImmediatePropagationStopped=Nt,t&&!this.isSimulated&&t.stopImmediatePropagation(),this.stopPropagation()}},O.each({altKey:!0,bubbles:!0,cancelable:!0,changedTouches:!0,ctrlKey:!0,detail:!0,eventPhase:!0,metaKey:!0,pageX:!0,pageY:!0,shiftKey:!0,view:!0,char:!0,code:!0,charCode:!0,key:!0,keyCode:!0,button:!0,buttons:!0,clientX:!0,clientY:!0,offsetX:!0,offsetY:!0,pointerId:!0,pointerType:!0,screenX:!0,screenY:!0,targetTouches:!0,toElement:!0,touches:!0,which:!0},O.event.addProp),O.each({focus:"focusin",blur:"focusout"},(function(t,e){function n(t){if(b.documentMode){var n=st.get(this,"handle"),r=O.event.fix(t);r.type="focusin"===t.type?"focus":"blur",r.isSimulated=!0,n(t),r.target===r.currentTarget&&n(r)}else O.event.simulate(e,t.target,O.event.fix(t))}O.event.special[t]={setup:function(){var r;if(Vt(this,t,!0),!b.documentMode)return!1;(r=st.get(this,e))||this.addEventListener(e,n),st.set(this,e,(r||0)+1)},trigger:function(){return Vt(this,t),!0},teardown:function(){var t;if(!b.documentMode)return!1;(t=st.get(this,e)-1)?st.set(this,e,t):(this.removeEventListener(e,n),st.remove(this,e))},_default:function(e){return st.get(e.target,t)},delegateType:e},O.event.special[e]={setup:function(){var r=this.ownerDocument||this.document||this,o=b.documentMode?this:r,i=st.get(o,e);i||(b.documentMode?this.addEventListener(e,n):r.addEventListener(t,n,!0)),st.set(o,e,(i||0)+1)},teardown:function(){var r=this.ownerDocument||this.document||this,o=b.documentMode?this:r,i=st.get(o,e)-1;i?st.set(o,e,i):(b.documentMode?this.removeEventListener(e,n):r.removeEventListener(t,n,!0),st.remove(o,e))}}})),O.each({mouseenter:"mouseover",mouseleave:"mouseout",pointerenter:"pointerover",pointerleave:"pointerout"},(function(t,e){O.event.special[t]={delegateType:e,bindType:e,handle:function(t){var n,r=t.relatedTarget,o=t.handleObj;return r&&(r===this||O.contains(this,r))||(t.type=o.origType,n=o.handler.apply(this,arguments),t.type=e),n}}})),O.fn.extend({on:function(t,e,n,r){return Bt(this,t,e,n,r)},one:function(t,e,n,r){return Bt(this,t,e,n,r,1)},off:function(t,e,n){var r,o;if(t&&t.preventDefault&&t.handleObj)return r=t.handleObj,O(t.delegateTarget).off(r.namespace?r.origType+"."+r.namespace:r.origType,r.selector,r.handler),this;if("object"==typeof t){for(o in t)this.off(o,e,t[o]);return this}return!1!==e&&"function"!=typeof e||(n=e,e=void 0),!1===n&&(n=Dt),this.each((function(){O.event.remove(this,t,n,e)}))}});var It=/<script|<style|<link/i,Lt=/checked\s*(?:[^=]|=\s*.checked.)/i,zt=/^\s*<!\[CDATA\[|\]\]>\s*$/g;function $t(t,e){return C(t,"table")&&C(11!==e.nodeType?e:e.firstChild,"tr")&&O(t).children("tbody")[0]||t}function Ft(t){return t.type=(null!==t.getAttribute("type"))+"/"+t.type,t}function Ut(t){return"true/"===(t.type||"").slice(0,5)?t.type=t.type.slice(5):t.removeAttribute("type"),t}function Ht(t,e){var n,r,o,i,a,s;if(1===e.nodeType){if(st.hasData(t)&&(s=st.get(t).events))for(o in st.remove(e,"handle events"),s)for(n=0,r=s[o].length;n<r;n++)O.event.add(e,o,s[o][n]);lt.hasData(t)&&(i=lt.access(t),a=O.extend({},i),lt.set(e,a))}}function qt(t,e){var n=e.nodeName.toLowerCase();"input"===n&&Ot.test(t.type)?e.checked=t.checked:"input"!==n&&"textarea"!==n||(e.defaultValue=t.defaultValue)}function Wt(t,e,n,r){e=l(e);var o,i,a,s,u,c,h=0,f=t.length,p=f-1,d=e[0],m=v(d);if(m||f>1&&"string"==typeof d&&!g.checkClone&&Lt.test(d))return t.each((function(o){var i=t.eq(o);m&&(e[0]=d.call(this,o,i.html())),Wt(i,e,n,r)}));if(f&&(i=(o=Rt(e,t[0].ownerDocument,!1,t,r)).firstChild,1===o.childNodes.length&&(o=i),i||r)){for(s=(a=O.map(Pt(o,"script"),Ft)).length;h<f;h++)u=o,h!==p&&(u=O.clone(u,!0,!0),s&&O.merge(a,Pt(u,"script"))),n.call(t[h],u,h);if(s)for(c=a[a.length-1].ownerDocument,O.map(a,Ut),h=0;h<s;h++)u=a[h],Ct.test(u.type||"")&&!st.access(u,"globalEval")&&O.contains(c,u)&&(u.src&&"module"!==(u.type||"").toLowerCase()?O._evalUrl&&!u.noModule&&O._evalUrl(u.src,{nonce:u.nonce||u.getAttribute("nonce")},c):_(u.textContent.replace(zt,""),u,c))}return t}function Gt(t,e,n){for(var r,o=e?O.filter(e,t):t,i=0;null!=(r=o[i]);i++)n||1!==r.nodeType||O.cleanData(Pt(r)),r.parentNode&&(n&&gt(r)&&jt(Pt(r,"script")),r.parentNode.removeChild(r));return t}O.extend({htmlPrefilter:function(t){return t},clone:function(t,e,n){var r,o,i,a,s=t.cloneNode(!0),l=gt(t);if(!(g.noCloneChecked||1!==t.nodeType&&11!==t.nodeType||O.isXMLDoc(t)))for(a=Pt(s),r=0,o=(i=Pt(t)).length;r<o;r++)qt(i[r],a[r]);if(e)if(n)for(i=i||Pt(t),a=a||Pt(s),r=0,o=i.length;r<o;r++)Ht(i[r],a[r]);else Ht(t,s);return(a=Pt(s,"script")).length>0&&jt(a,!l&&Pt(t,"script")),s},cleanData:function(t){for(var e,n,r,o=O.event.special,i=0;void 0!==(n=t[i]);i++)if(it(n)){if(e=n[st.expando]){if(e.events)for(r in e.events)o[r]?O.event.remove(n,r):O.removeEvent(n,r,e.handle);n[st.expando]=void 0}n[lt.expando]&&(n[lt.expando]=void 0)}}}),O.fn.extend({detach:function(t){return Gt(this,t,!0)},remove:function(t){return Gt(this,t)},text:function(t){return tt(this,(function(t){return void 0===t?O.text(this):this.empty().each((function(){1!==this.nodeType&&11!==this.nodeType&&9!==this.nodeType||(this.textContent=t)}))}),null,t,arguments.length)},append:function(){return Wt(this,arguments,(function(t){1!==this.nodeType&&11!==this.nodeType&&9!==this.nodeType||$t(this,t).appendChild(t)}))},prepend:function(){return Wt(this,arguments,(function(t){if(1===this.nodeType||11===this.nodeType||9===this.nodeType){var e=$t(this,t);e.insertBefore(t,e.firstChild)}}))},before:function(){return Wt(this,arguments,(function(t){this.parentNode&&this.parentNode.insertBefore(t,this)}))},after:function(){return Wt(this,arguments,(function(t){this.parentNode&&this.parentNode.insertBefore(t,this.nextSibling)}))},empty:function(){for(var t,e=0;null!=(t=this[e]);e++)1===t.nodeType&&(O.cleanData(Pt(t,!1)),t.textContent="");return this},clone:function(t,e){return t=null!=t&&t,e=null==e?t:e,this.map((function(){return O.clone(this,t,e)}))},html:function(t){return tt(this,(function(t){var e=this[0]||{},n=0,r=this.length;if(void 0===t&&1===e.nodeType)return e.innerHTML;if("string"==typeof t&&!It.test(t)&&!St[(Et.exec(t)||["",""])[1].toLowerCase()]){t=O.htmlPrefilter(t);try{for(;n<r;n++)1===(e=this[n]||{}).nodeType&&(O.cleanData(Pt(e,!1)),e.innerHTML=t);e=0}catch(t){}}e&&this.empty().append(t)}),null,t,arguments.length)},replaceWith:function(){var t=[];return Wt(this,arguments,(function(e){var n=this.parentNode;O.inArray(this,t)<0&&(O.cleanData(Pt(this)),n&&n.replaceChild(e,this))}),t)}}),O.each({appendTo:"append",prependTo:"prepend",insertBefore:"before",insertAfter:"after",replaceAll:"replaceWith"},(function(t,e){O.fn[t]=function(t){for(var n,r=[],o=O(t),i=o.length-1,a=0;a<=i;a++)n=a===i?this:this.clone(!0),O(o[a])[e](n),u.apply(r,n.get());return this.pushStack(r)}}));var Kt=new RegExp("^("+ft+")(?!px)[a-z%]+$","i"),Xt=/^--/,Yt=function(t){var e=t.ownerDocument.defaultView;return e&&e.opener||(e=r),e.getComputedStyle(t)},Jt=function(t,e,n){var r,o,i={};for(o in e)i[o]=t.style[o],t.style[o]=e[o];for(o in r=n.call(t),e)t.style[o]=i[o];return r},Zt=new RegExp(dt.join("|"),"i");function Qt(t,e,n){var r,o,i,a,s=Xt.test(e),l=t.style;return(n=n||Yt(t))&&(a=n.getPropertyValue(e)||n[e],s&&a&&(a=a.replace(R,"$1")||void 0),""!==a||gt(t)||(a=O.style(t,e)),!g.pixelBoxStyles()&&Kt.test(a)&&Zt.test(e)&&(r=l.width,o=l.minWidth,i=l.maxWidth,l.minWidth=l.maxWidth=l.width=a,a=n.width,l.width=r,l.minWidth=o,l.maxWidth=i)),void 0!==a?a+"":a}function te(t,e){return{get:function(){if(!t())return(this.get=e).apply(this,arguments);delete this.get}}}!function(){function t(){if(c){u.style.cssText="position:absolute;left:-11111px;width:60px;margin-top:1px;padding:0;border:0",c.style.cssText="position:relative;display:block;box-sizing:border-box;overflow:scroll;margin:auto;border:1px;padding:1px;width:60%;top:1%",mt.appendChild(u).appendChild(c);var t=r.getComputedStyle(c);n="1%"!==t.top,l=12===e(t.marginLeft),c.style.right="60%",a=36===e(t.right),o=36===e(t.width),c.style.position="absolute",i=12===e(c.offsetWidth/3),mt.removeChild(u),c=null}}function e(t){return Math.round(parseFloat(t))}var n,o,i,a,s,l,u=b.createElement("div"),c=b.createElement("div");c.style&&(c.style.backgroundClip="content-box",c.cloneNode(!0).style.backgroundClip="",g.clearCloneStyle="content-box"===c.style.backgroundClip,O.extend(g,{boxSizingReliable:function(){return t(),o},pixelBoxStyles:function(){return t(),a},pixelPosition:function(){return t(),n},reliableMarginLeft:function(){return t(),l},scrollboxSize:function(){return t(),i},reliableTrDimensions:function(){var t,e,n,o;return null==s&&(t=b.createElement("table"),e=b.createElement("tr"),n=b.createElement("div"),t.style.cssText="position:absolute;left:-11111px;border-collapse:separate",e.style.cssText="box-sizing:content-box;border:1px solid",e.style.height="1px",n.style.height="9px",n.style.display="block",mt.appendChild(t).appendChild(e).appendChild(n),o=r.getComputedStyle(e),s=parseInt(o.height,10)+parseInt(o.borderTopWidth,10)+parseInt(o.borderBottomWidth,10)===e.offsetHeight,mt.removeChild(t)),s}}))}();var ee=["Webkit","Moz","ms"],ne=b.createElement("div").style,re={};function oe(t){var e=O.cssProps[t]||re[t];return e||(t in ne?t:re[t]=function(t){for(var e=t[0].toUpperCase()+t.slice(1),n=ee.length;n--;)if((t=ee[n]+e)in ne)return t}(t)||t)}var ie=/^(none|table(?!-c[ea]).+)/,ae={position:"absolute",visibility:"hidden",display:"block"},se={letterSpacing:"0",fontWeight:"400"};function le(t,e,n){var r=pt.exec(e);return r?Math.max(0,r[2]-(n||0))+(r[3]||"px"):e}function ue(t,e,n,r,o,i){var a="width"===e?1:0,s=0,l=0,u=0;if(n===(r?"border":"content"))return 0;for(;a<4;a+=2)"margin"===n&&(u+=O.css(t,n+dt[a],!0,o)),r?("content"===n&&(l-=O.css(t,"padding"+dt[a],!0,o)),"margin"!==n&&(l-=O.css(t,"border"+dt[a]+"Width",!0,o))):(l+=O.css(t,"padding"+dt[a],!0,o),"padding"!==n?l+=O.css(t,"border"+dt[a]+"Width",!0,o):s+=O.css(t,"border"+dt[a]+"Width",!0,o));return!r&&i>=0&&(l+=Math.max(0,Math.ceil(t["offset"+e[0].toUpperCase()+e.slice(1)]-i-l-s-.5))||0),l+u}function ce(t,e,n){var r=Yt(t),o=(!g.boxSizingReliable()||n)&&"border-box"===O.css(t,"boxSizing",!1,r),i=o,a=Qt(t,e,r),s="offset"+e[0].toUpperCase()+e.slice(1);if(Kt.test(a)){if(!n)return a;a="auto"}return(!g.boxSizingReliable()&&o||!g.reliableTrDimensions()&&C(t,"tr")||"auto"===a||!parseFloat(a)&&"inline"===O.css(t,"display",!1,r))&&t.getClientRects().length&&(o="border-box"===O.css(t,"boxSizing",!1,r),(i=s in t)&&(a=t[s])),(a=parseFloat(a)||0)+ue(t,e,n||(o?"border":"content"),i,r,a)+"px"}function he(t,e,n,r,o){return new he.prototype.init(t,e,n,r,o)}O.extend({cssHooks:{opacity:{get:function(t,e){if(e){var n=Qt(t,"opacity");return""===n?"1":n}}}},cssNumber:{animationIterationCount:!0,aspectRatio:!0,borderImageSlice:!0,columnCount:!0,flexGrow:!0,flexShrink:!0,fontWeight:!0,gridArea:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnStart:!0,gridRow:!0,gridRowEnd:!0,gridRowStart:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,scale:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeMiterlimit:!0,strokeOpacity:!0},cssProps:{},style:function(t,e,n,r){if(t&&3!==t.nodeType&&8!==t.nodeType&&t.style){var o,i,a,s=ot(e),l=Xt.test(e),u=t.style;if(l||(e=oe(s)),a=O.cssHooks[e]||O.cssHooks[s],void 0===n)return a&&"get"in a&&void 0!==(o=a.get(t,!1,r))?o:u[e];"string"===(i=typeof n)&&(o=pt.exec(n))&&o[1]&&(n=bt(t,e,o),i="number"),null!=n&&n==n&&("number"!==i||l||(n+=o&&o[3]||(O.cssNumber[s]?"":"px")),g.clearCloneStyle||""!==n||0!==e.indexOf("background")||(u[e]="inherit"),a&&"set"in a&&void 0===(n=a.set(t,n,r))||(l?u.setProperty(e,n):u[e]=n))}},css:function(t,e,n,r){var o,i,a,s=ot(e);return Xt.test(e)||(e=oe(s)),(a=O.cssHooks[e]||O.cssHooks[s])&&"get"in a&&(o=a.get(t,!0,n)),void 0===o&&(o=Qt(t,e,r)),"normal"===o&&e in se&&(o=se[e]),""===n||n?(i=parseFloat(o),!0===n||isFinite(i)?i||0:o):o}}),O.each(["height","width"],(function(t,e){O.cssHooks[e]={get:function(t,n,r){if(n)return!ie.test(O.css(t,"display"))||t.getClientRects().length&&t.getBoundingClientRect().width?ce(t,e,r):Jt(t,ae,(function(){return ce(t,e,r)}))},set:function(t,n,r){var o,i=Yt(t),a=!g.scrollboxSize()&&"absolute"===i.position,s=(a||r)&&"border-box"===O.css(t,"boxSizing",!1,i),l=r?ue(t,e,r,s,i):0;return s&&a&&(l-=Math.ceil(t["offset"+e[0].toUpperCase()+e.slice(1)]-parseFloat(i[e])-ue(t,e,"border",!1,i)-.5)),l&&(o=pt.exec(n))&&"px"!==(o[3]||"px")&&(t.style[e]=n,n=O.css(t,e)),le(0,n,l)}}})),O.cssHooks.marginLeft=te(g.reliableMarginLeft,(function(t,e){if(e)return(parseFloat(Qt(t,"marginLeft"))||t.getBoundingClientRect().left-Jt(t,{marginLeft:0},(function(){return t.getBoundingClientRect().left})))+"px"})),O.each({margin:"",padding:"",border:"Width"},(function(t,e){O.cssHooks[t+e]={expand:function(n){for(var r=0,o={},i="string"==typeof n?n.split(" "):[n];r<4;r++)o[t+dt[r]+e]=i[r]||i[r-2]||i[0];return o}},"margin"!==t&&(O.cssHooks[t+e].set=le)})),O.fn.extend({css:function(t,e){return tt(this,(function(t,e,n){var r,o,i={},a=0;if(Array.isArray(e)){for(r=Yt(t),o=e.length;a<o;a++)i[e[a]]=O.css(t,e[a],!1,r);return i}return void 0!==n?O.style(t,e,n):O.css(t,e)}),t,e,arguments.length>1)}}),O.Tween=he,he.prototype={constructor:he,init:function(t,e,n,r,o,i){this.elem=t,this.prop=n,this.easing=o||O.easing._default,this.options=e,this.start=this.now=this.cur(),this.end=r,this.unit=i||(O.cssNumber[n]?"":"px")},cur:function(){var t=he.propHooks[this.prop];return t&&t.get?t.get(this):he.propHooks._default.get(this)},run:function(t){var e,n=he.propHooks[this.prop];return this.options.duration?this.pos=e=O.easing[this.easing](t,this.options.duration*t,0,1,this.options.duration):this.pos=e=t,this.now=(this.end-this.start)*e+this.start,this.options.step&&this.options.step.call(this.elem,this.now,this),n&&n.set?n.set(this):he.propHooks._default.set(this),this}},he.prototype.init.prototype=he.prototype,he.propHooks={_default:{get:function(t){var e;return 1!==t.elem.nodeType||null!=t.elem[t.prop]&&null==t.elem.style[t.prop]?t.elem[t.prop]:(e=O.css(t.elem,t.prop,""))&&"auto"!==e?e:0},set:function(t){O.fx.step[t.prop]?O.fx.step[t.prop](t):1!==t.elem.nodeType||!O.cssHooks[t.prop]&&null==t.elem.style[oe(t.prop)]?t.elem[t.prop]=t.now:O.style(t.elem,t.prop,t.now+t.unit)}}},he.propHooks.scrollTop=he.propHooks.scrollLeft={set:function(t){t.elem.nodeType&&t.elem.parentNode&&(t.elem[t.prop]=t.now)}},O.easing={linear:function(t){return t},swing:function(t){return.5-Math.cos(t*Math.PI)/2},_default:"swing"},O.fx=he.prototype.init,O.fx.step={};var fe,pe,de=/^(?:toggle|show|hide)$/,me=/queueHooks$/;function ge(){pe&&(!1===b.hidden&&r.requestAnimationFrame?r.requestAnimationFrame(ge):r.setTimeout(ge,O.fx.interval),O.fx.tick())}function ve(){return r.setTimeout((function(){fe=void 0})),fe=Date.now()}function ye(t,e){var n,r=0,o={height:t};for(e=e?1:0;r<4;r+=2-e)o["margin"+(n=dt[r])]=o["padding"+n]=t;return e&&(o.opacity=o.width=t),o}function be(t,e,n){for(var r,o=(we.tweeners[e]||[]).concat(we.tweeners["*"]),i=0,a=o.length;i<a;i++)if(r=o[i].call(n,e,t))return r}function we(t,e,n){var r,o,i=0,a=we.prefilters.length,s=O.Deferred().always((function(){delete l.elem})),l=function(){if(o)return!1;for(var e=fe||ve(),n=Math.max(0,u.startTime+u.duration-e),r=1-(n/u.duration||0),i=0,a=u.tweens.length;i<a;i++)u.tweens[i].run(r);return s.notifyWith(t,[u,r,n]),r<1&&a?n:(a||s.notifyWith(t,[u,1,0]),s.resolveWith(t,[u]),!1)},u=s.promise({elem:t,props:O.extend({},e),opts:O.extend(!0,{specialEasing:{},easing:O.easing._default},n),originalProperties:e,originalOptions:n,startTime:fe||ve(),duration:n.duration,tweens:[],createTween:function(e,n){var r=O.Tween(t,u.opts,e,n,u.opts.specialEasing[e]||u.opts.easing);return u.tweens.push(r),r},stop:function(e){var n=0,r=e?u.tweens.length:0;if(o)return this;for(o=!0;n<r;n++)u.tweens[n].run(1);return e?(s.notifyWith(t,[u,1,0]),s.resolveWith(t,[u,e])):s.rejectWith(t,[u,e]),this}}),c=u.props;for(!function(t,e){var n,r,o,i,a;for(n in t)if(o=e[r=ot(n)],i=t[n],Array.isArray(i)&&(o=i[1],i=t[n]=i[0]),n!==r&&(t[r]=i,delete t[n]),(a=O.cssHooks[r])&&"expand"in a)for(n in i=a.expand(i),delete t[r],i)n in t||(t[n]=i[n],e[n]=o);else e[r]=o}(c,u.opts.specialEasing);i<a;i++)if(r=we.prefilters[i].call(u,t,c,u.opts))return v(r.stop)&&(O._queueHooks(u.elem,u.opts.queue).stop=r.stop.bind(r)),r;return O.map(c,be,u),v(u.opts.start)&&u.opts.start.call(t,u),u.progress(u.opts.progress).done(u.opts.done,u.opts.complete).fail(u.opts.fail).always(u.opts.always),O.fx.timer(O.extend(l,{elem:t,anim:u,queue:u.opts.queue})),u}O.Animation=O.extend(we,{tweeners:{"*":[function(t,e){var n=this.createTween(t,e);return bt(n.elem,t,pt.exec(e),n),n}]},tweener:function(t,e){v(t)?(e=t,t=["*"]):t=t.match(G);for(var n,r=0,o=t.length;r<o;r++)n=t[r],we.tweeners[n]=we.tweeners[n]||[],we.tweeners[n].unshift(e)},prefilters:[function(t,e,n){var r,o,i,a,s,l,u,c,h="width"in e||"height"in e,f=this,p={},d=t.style,m=t.nodeType&&yt(t),g=st.get(t,"fxshow");for(r in n.queue||(null==(a=O._queueHooks(t,"fx")).unqueued&&(a.unqueued=0,s=a.empty.fire,a.empty.fire=function(){a.unqueued||s()}),a.unqueued++,f.always((function(){f.always((function(){a.unqueued--,O.queue(t,"fx").length||a.empty.fire()}))}))),e)if(o=e[r],de.test(o)){if(delete e[r],i=i||"toggle"===o,o===(m?"hide":"show")){if("show"!==o||!g||void 0===g[r])continue;m=!0}p[r]=g&&g[r]||O.style(t,r)}if((l=!O.isEmptyObject(e))||!O.isEmptyObject(p))for(r in h&&1===t.nodeType&&(n.overflow=[d.overflow,d.overflowX,d.overflowY],null==(u=g&&g.display)&&(u=st.get(t,"display")),"none"===(c=O.css(t,"display"))&&(u?c=u:(xt([t],!0),u=t.style.display||u,c=O.css(t,"display"),xt([t]))),("inline"===c||"inline-block"===c&&null!=u)&&"none"===O.css(t,"float")&&(l||(f.done((function(){d.display=u})),null==u&&(c=d.display,u="none"===c?"":c)),d.display="inline-block")),n.overflow&&(d.overflow="hidden",f.always((function(){d.overflow=n.overflow[0],d.overflowX=n.overflow[1],d.overflowY=n.overflow[2]}))),l=!1,p)l||(g?"hidden"in g&&(m=g.hidden):g=st.access(t,"fxshow",{display:u}),i&&(g.hidden=!m),m&&xt([t],!0),f.done((function(){for(r in m||xt([t]),st.remove(t,"fxshow"),p)O.style(t,r,p[r])}))),l=be(m?g[r]:0,r,f),r in g||(g[r]=l.start,m&&(l.end=l.start,l.start=0))}],prefilter:function(t,e){e?we.prefilters.unshift(t):we.prefilters.push(t)}}),O.speed=function(t,e,n){var r=t&&"object"==typeof t?O.extend({},t):{complete:n||!n&&e||v(t)&&t,duration:t,easing:n&&e||e&&!v(e)&&e};return O.fx.off?r.duration=0:"number"!=typeof r.duration&&(r.duration in O.fx.speeds?r.duration=O.fx.speeds[r.duration]:r.duration=O.fx.speeds._default),null!=r.queue&&!0!==r.queue||(r.queue="fx"),r.old=r.complete,r.complete=function(){v(r.old)&&r.old.call(this),r.queue&&O.dequeue(this,r.queue)},r},O.fn.extend({fadeTo:function(t,e,n,r){return this.filter(yt).css("opacity",0).show().end().animate({opacity:e},t,n,r)},animate:function(t,e,n,r){var o=O.isEmptyObject(t),i=O.speed(e,n,r),a=function(){var e=we(this,O.extend({},t),i);(o||st.get(this,"finish"))&&e.stop(!0)};return a.finish=a,o||!1===i.queue?this.each(a):this.queue(i.queue,a)},stop:function(t,e,n){var r=function(t){var e=t.stop;delete t.stop,e(n)};return"string"!=typeof t&&(n=e,e=t,t=void 0),e&&this.queue(t||"fx",[]),this.each((function(){var e=!0,o=null!=t&&t+"queueHooks",i=O.timers,a=st.get(this);if(o)a[o]&&a[o].stop&&r(a[o]);else for(o in a)a[o]&&a[o].stop&&me.test(o)&&r(a[o]);for(o=i.length;o--;)i[o].elem!==this||null!=t&&i[o].queue!==t||(i[o].anim.stop(n),e=!1,i.splice(o,1));!e&&n||O.dequeue(this,t)}))},finish:function(t){return!1!==t&&(t=t||"fx"),this.each((function(){var e,n=st.get(this),r=n[t+"queue"],o=n[t+"queueHooks"],i=O.timers,a=r?r.length:0;for(n.finish=!0,O.queue(this,t,[]),o&&o.stop&&o.stop.call(this,!0),e=i.length;e--;)i[e].elem===this&&i[e].queue===t&&(i[e].anim.stop(!0),i.splice(e,1));for(e=0;e<a;e++)r[e]&&r[e].finish&&r[e].finish.call(this);delete n.finish}))}}),O.each(["toggle","show","hide"],(function(t,e){var n=O.fn[e];O.fn[e]=function(t,r,o){return null==t||"boolean"==typeof t?n.apply(this,arguments):this.animate(ye(e,!0),t,r,o)}})),O.each({slideDown:ye("show"),slideUp:ye("hide"),slideToggle:ye("toggle"),fadeIn:{opacity:"show"},fadeOut:{opacity:"hide"},fadeToggle:{opacity:"toggle"}},(function(t,e){O.fn[t]=function(t,n,r){return this.animate(e,t,n,r)}})),O.timers=[],O.fx.tick=function(){var t,e=0,n=O.timers;for(fe=Date.now();e<n.length;e++)(t=n[e])()||n[e]!==t||n.splice(e--,1);n.length||O.fx.stop(),fe=void 0},O.fx.timer=function(t){O.timers.push(t),O.fx.start()},O.fx.interval=13,O.fx.start=function(){pe||(pe=!0,ge())},O.fx.stop=function(){pe=null},O.fx.speeds={slow:600,fast:200,_default:400},O.fn.delay=function(t,e){return t=O.fx&&O.fx.speeds[t]||t,e=e||"fx",this.queue(e,(function(e,n){var o=r.setTimeout(e,t);n.stop=function(){r.clearTimeout(o)}}))},function(){var t=b.createElement("input"),e=b.createElement("select").appendChild(b.createElement("option"));t.type="checkbox",g.checkOn=""!==t.value,g.optSelected=e.selected,(t=b.createElement("input")).value="t",t.type="radio",g.radioValue="t"===t.value}();var _e,xe=O.expr.attrHandle;O.fn.extend({attr:function(t,e){return tt(this,O.attr,t,e,arguments.length>1)},removeAttr:function(t){return this.each((function(){O.removeAttr(this,t)}))}}),O.extend({attr:function(t,e,n){var r,o,i=t.nodeType;if(3!==i&&8!==i&&2!==i)return void 0===t.getAttribute?O.prop(t,e,n):(1===i&&O.isXMLDoc(t)||(o=O.attrHooks[e.toLowerCase()]||(O.expr.match.bool.test(e)?_e:void 0)),void 0!==n?null===n?void O.removeAttr(t,e):o&&"set"in o&&void 0!==(r=o.set(t,n,e))?r:(t.setAttribute(e,n+""),n):o&&"get"in o&&null!==(r=o.get(t,e))?r:null==(r=O.find.attr(t,e))?void 0:r)},attrHooks:{type:{set:function(t,e){if(!g.radioValue&&"radio"===e&&C(t,"input")){var n=t.value;return t.setAttribute("type",e),n&&(t.value=n),e}}}},removeAttr:function(t,e){var n,r=0,o=e&&e.match(G);if(o&&1===t.nodeType)for(;n=o[r++];)t.removeAttribute(n)}}),_e={set:function(t,e,n){return!1===e?O.removeAttr(t,n):t.setAttribute(n,n),n}},O.each(O.expr.match.bool.source.match(/\w+/g),(function(t,e){var n=xe[e]||O.find.attr;xe[e]=function(t,e,r){var o,i,a=e.toLowerCase();return r||(i=xe[a],xe[a]=o,o=null!=n(t,e,r)?a:null,xe[a]=i),o}}));var ke=/^(?:input|select|textarea|button)$/i,Ae=/^(?:a|area)$/i;function Oe(t){return(t.match(G)||[]).join(" ")}function Ee(t){return t.getAttribute&&t.getAttribute("class")||""}function Ce(t){return Array.isArray(t)?t:"string"==typeof t&&t.match(G)||[]}O.fn.extend({prop:function(t,e){return tt(this,O.prop,t,e,arguments.length>1)},removeProp:function(t){return this.each((function(){delete this[O.propFix[t]||t]}))}}),O.extend({prop:function(t,e,n){var r,o,i=t.nodeType;if(3!==i&&8!==i&&2!==i)return 1===i&&O.isXMLDoc(t)||(e=O.propFix[e]||e,o=O.propHooks[e]),void 0!==n?o&&"set"in o&&void 0!==(r=o.set(t,n,e))?r:t[e]=n:o&&"get"in o&&null!==(r=o.get(t,e))?r:t[e]},propHooks:{tabIndex:{get:function(t){var e=O.find.attr(t,"tabindex");return e?parseInt(e,10):ke.test(t.nodeName)||Ae.test(t.nodeName)&&t.href?0:-1}}},propFix:{for:"htmlFor",class:"className"}}),g.optSelected||(O.propHooks.selected={get:function(t){var e=t.parentNode;return e&&e.parentNode&&e.parentNode.selectedIndex,null},set:function(t){var e=t.parentNode;e&&(e.selectedIndex,e.parentNode&&e.parentNode.selectedIndex)}}),O.each(["tabIndex","readOnly","maxLength","cellSpacing","cellPadding","rowSpan","colSpan","useMap","frameBorder","contentEditable"],(function(){O.propFix[this.toLowerCase()]=this})),O.fn.extend({addClass:function(t){var e,n,r,o,i,a;return v(t)?this.each((function(e){O(this).addClass(t.call(this,e,Ee(this)))})):(e=Ce(t)).length?this.each((function(){if(r=Ee(this),n=1===this.nodeType&&" "+Oe(r)+" "){for(i=0;i<e.length;i++)o=e[i],n.indexOf(" "+o+" ")<0&&(n+=o+" ");a=Oe(n),r!==a&&this.setAttribute("class",a)}})):this},removeClass:function(t){var e,n,r,o,i,a;return v(t)?this.each((function(e){O(this).removeClass(t.call(this,e,Ee(this)))})):arguments.length?(e=Ce(t)).length?this.each((function(){if(r=Ee(this),n=1===this.nodeType&&" "+Oe(r)+" "){for(i=0;i<e.length;i++)for(o=e[i];n.indexOf(" "+o+" ")>-1;)n=n.replace(" "+o+" "," ");a=Oe(n),r!==a&&this.setAttribute("class",a)}})):this:this.attr("class","")},toggleClass:function(t,e){var n,r,o,i,a=typeof t,s="string"===a||Array.isArray(t);return v(t)?this.each((function(n){O(this).toggleClass(t.call(this,n,Ee(this),e),e)})):"boolean"==typeof e&&s?e?this.addClass(t):this.removeClass(t):(n=Ce(t),this.each((function(){if(s)for(i=O(this),o=0;o<n.length;o++)r=n[o],i.hasClass(r)?i.removeClass(r):i.addClass(r);else void 0!==t&&"boolean"!==a||((r=Ee(this))&&st.set(this,"__className__",r),this.setAttribute&&this.setAttribute("class",r||!1===t?"":st.get(this,"__className__")||""))})))},hasClass:function(t){var e,n,r=0;for(e=" "+t+" ";n=this[r++];)if(1===n.nodeType&&(" "+Oe(Ee(n))+" ").indexOf(e)>-1)return!0;return!1}});var Se=/\r/g;O.fn.extend({val:function(t){var e,n,r,o=this[0];return arguments.length?(r=v(t),this.each((function(n){var o;1===this.nodeType&&(null==(o=r?t.call(this,n,O(this).val()):t)?o="":"number"==typeof o?o+="":Array.isArray(o)&&(o=O.map(o,(function(t){return null==t?"":t+""}))),(e=O.valHooks[this.type]||O.valHooks[this.nodeName.toLowerCase()])&&"set"in e&&void 0!==e.set(this,o,"value")||(this.value=o))}))):o?(e=O.valHooks[o.type]||O.valHooks[o.nodeName.toLowerCase()])&&"get"in e&&void 0!==(n=e.get(o,"value"))?n:"string"==typeof(n=o.value)?n.replace(Se,""):null==n?"":n:void 0}}),O.extend({valHooks:{option:{get:function(t){var e=O.find.attr(t,"value");return null!=e?e:Oe(O.text(t))}},select:{get:function(t){var e,n,r,o=t.options,i=t.selectedIndex,a="select-one"===t.type,s=a?null:[],l=a?i+1:o.length;for(r=i<0?l:a?i:0;r<l;r++)if(((n=o[r]).selected||r===i)&&!n.disabled&&(!n.parentNode.disabled||!C(n.parentNode,"optgroup"))){if(e=O(n).val(),a)return e;s.push(e)}return s},set:function(t,e){for(var n,r,o=t.options,i=O.makeArray(e),a=o.length;a--;)((r=o[a]).selected=O.inArray(O.valHooks.option.get(r),i)>-1)&&(n=!0);return n||(t.selectedIndex=-1),i}}}}),O.each(["radio","checkbox"],(function(){O.valHooks[this]={set:function(t,e){if(Array.isArray(e))return t.checked=O.inArray(O(t).val(),e)>-1}},g.checkOn||(O.valHooks[this].get=function(t){return null===t.getAttribute("value")?"on":t.value})}));var Pe=r.location,je={guid:Date.now()},Te=/\?/;O.parseXML=function(t){var e,n;if(!t||"string"!=typeof t)return null;try{e=(new r.DOMParser).parseFromString(t,"text/xml")}catch(t){}return n=e&&e.getElementsByTagName("parsererror")[0],e&&!n||O.error("Invalid XML: "+(n?O.map(n.childNodes,(function(t){return t.textContent})).join("\n"):t)),e};var Re=/^(?:focusinfocus|focusoutblur)$/,Me=function(t){t.stopPropagation()};O.extend(O.event,{trigger:function(t,e,n,o){var i,a,s,l,u,c,h,f,d=[n||b],m=p.call(t,"type")?t.type:t,g=p.call(t,"namespace")?t.namespace.split("."):[];if(a=f=s=n=n||b,3!==n.nodeType&&8!==n.nodeType&&!Re.test(m+O.event.triggered)&&(m.indexOf(".")>-1&&(g=m.split("."),m=g.shift(),g.sort()),u=m.indexOf(":")<0&&"on"+m,(t=t[O.expando]?t:new O.Event(m,"object"==typeof t&&t)).isTrigger=o?2:3,t.namespace=g.join("."),t.rnamespace=t.namespace?new RegExp("(^|\\.)"+g.join("\\.(?:.*\\.|)")+"(\\.|$)"):null,t.result=void 0,t.target||(t.target=n),e=null==e?[t]:O.makeArray(e,[t]),h=O.event.special[m]||{},o||!h.trigger||!1!==h.trigger.apply(n,e))){if(!o&&!h.noBubble&&!y(n)){for(l=h.delegateType||m,Re.test(l+m)||(a=a.parentNode);a;a=a.parentNode)d.push(a),s=a;s===(n.ownerDocument||b)&&d.push(s.defaultView||s.parentWindow||r)}for(i=0;(a=d[i++])&&!t.isPropagationStopped();)f=a,t.type=i>1?l:h.bindType||m,(c=(st.get(a,"events")||Object.create(null))[t.type]&&st.get(a,"handle"))&&c.apply(a,e),(c=u&&a[u])&&c.apply&&it(a)&&(t.result=c.apply(a,e),!1===t.result&&t.preventDefault());return t.type=m,o||t.isDefaultPrevented()||h._default&&!1!==h._default.apply(d.pop(),e)||!it(n)||u&&v(n[m])&&!y(n)&&((s=n[u])&&(n[u]=null),O.event.triggered=m,t.isPropagationStopped()&&f.addEventListener(m,Me),n[m](),t.isPropagationStopped()&&f.removeEventListener(m,Me),O.event.triggered=void 0,s&&(n[u]=s)),t.result}},simulate:function(t,e,n){var r=O.extend(new O.Event,n,{type:t,isSimulated:!0});O.event.trigger(r,null,e)}}),O.fn.extend({trigger:function(t,e){return this.each((function(){O.event.trigger(t,e,this)}))},triggerHandler:function(t,e){var n=this[0];if(n)return O.event.trigger(t,e,n,!0)}});var Ne=/\[\]$/,De=/\r?\n/g,Be=/^(?:submit|button|image|reset|file)$/i,Ve=/^(?:input|select|textarea|keygen)/i;function Ie(t,e,n,r){var o;if(Array.isArray(e))O.each(e,(function(e,o){n||Ne.test(t)?r(t,o):Ie(t+"["+("object"==typeof o&&null!=o?e:"")+"]",o,n,r)}));else if(n||"object"!==x(e))r(t,e);else for(o in e)Ie(t+"["+o+"]",e[o],n,r)}O.param=function(t,e){var n,r=[],o=function(t,e){var n=v(e)?e():e;r[r.length]=encodeURIComponent(t)+"="+encodeURIComponent(null==n?"":n)};if(null==t)return"";if(Array.isArray(t)||t.jquery&&!O.isPlainObject(t))O.each(t,(function(){o(this.name,this.value)}));else for(n in t)Ie(n,t[n],e,o);return r.join("&")},O.fn.extend({serialize:function(){return O.param(this.serializeArray())},serializeArray:function(){return this.map((function(){var t=O.prop(this,"elements");return t?O.makeArray(t):this})).filter((function(){var t=this.type;return this.name&&!O(this).is(":disabled")&&Ve.test(this.nodeName)&&!Be.test(t)&&(this.checked||!Ot.test(t))})).map((function(t,e){var n=O(this).val();return null==n?null:Array.isArray(n)?O.map(n,(function(t){return{name:e.name,value:t.replace(De,"\r\n")}})):{name:e.name,value:n.replace(De,"\r\n")}})).get()}});var Le=/%20/g,ze=/#.*$/,$e=/([?&])_=[^&]*/,Fe=/^(.*?):[ \t]*([^\r\n]*)$/gm,Ue=/^(?:GET|HEAD)$/,He=/^\/\//,qe={},We={},Ge="*/".concat("*"),Ke=b.createElement("a");function Xe(t){return function(e,n){"string"!=typeof e&&(n=e,e="*");var r,o=0,i=e.toLowerCase().match(G)||[];if(v(n))for(;r=i[o++];)"+"===r[0]?(r=r.slice(1)||"*",(t[r]=t[r]||[]).unshift(n)):(t[r]=t[r]||[]).push(n)}}function Ye(t,e,n,r){var o={},i=t===We;function a(s){var l;return o[s]=!0,O.each(t[s]||[],(function(t,s){var u=s(e,n,r);return"string"!=typeof u||i||o[u]?i?!(l=u):void 0:(e.dataTypes.unshift(u),a(u),!1)})),l}return a(e.dataTypes[0])||!o["*"]&&a("*")}function Je(t,e){var n,r,o=O.ajaxSettings.flatOptions||{};for(n in e)void 0!==e[n]&&((o[n]?t:r||(r={}))[n]=e[n]);return r&&O.extend(!0,t,r),t}Ke.href=Pe.href,O.extend({active:0,lastModified:{},etag:{},ajaxSettings:{url:Pe.href,type:"GET",isLocal:/^(?:about|app|app-storage|.+-extension|file|res|widget):$/.test(Pe.protocol),global:!0,processData:!0,async:!0,contentType:"application/x-www-form-urlencoded; charset=UTF-8",accepts:{"*":Ge,text:"text/plain",html:"text/html",xml:"application/xml, text/xml",json:"application/json, text/javascript"},contents:{xml:/\bxml\b/,html:/\bhtml/,json:/\bjson\b/},responseFields:{xml:"responseXML",text:"responseText",json:"responseJSON"},converters:{"* text":String,"text html":!0,"text json":JSON.parse,"text xml":O.parseXML},flatOptions:{url:!0,context:!0}},ajaxSetup:function(t,e){return e?Je(Je(t,O.ajaxSettings),e):Je(O.ajaxSettings,t)},ajaxPrefilter:Xe(qe),ajaxTransport:Xe(We),ajax:function(t,e){"object"==typeof t&&(e=t,t=void 0),e=e||{};var n,o,i,a,s,l,u,c,h,f,p=O.ajaxSetup({},e),d=p.context||p,m=p.context&&(d.nodeType||d.jquery)?O(d):O.event,g=O.Deferred(),v=O.Callbacks("once memory"),y=p.statusCode||{},w={},_={},x="canceled",k={readyState:0,getResponseHeader:function(t){var e;if(u){if(!a)for(a={};e=Fe.exec(i);)a[e[1].toLowerCase()+" "]=(a[e[1].toLowerCase()+" "]||[]).concat(e[2]);e=a[t.toLowerCase()+" "]}return null==e?null:e.join(", ")},getAllResponseHeaders:function(){return u?i:null},setRequestHeader:function(t,e){return null==u&&(t=_[t.toLowerCase()]=_[t.toLowerCase()]||t,w[t]=e),this},overrideMimeType:function(t){return null==u&&(p.mimeType=t),this},statusCode:function(t){var e;if(t)if(u)k.always(t[k.status]);else for(e in t)y[e]=[y[e],t[e]];return this},abort:function(t){var e=t||x;return n&&n.abort(e),A(0,e),this}};if(g.promise(k),p.url=((t||p.url||Pe.href)+"").replace(He,Pe.protocol+"//"),p.type=e.method||e.type||p.method||p.type,p.dataTypes=(p.dataType||"*").toLowerCase().match(G)||[""],null==p.crossDomain){l=b.createElement("a");try{l.href=p.url,l.href=l.href,p.crossDomain=Ke.protocol+"//"+Ke.host!=l.protocol+"//"+l.host}catch(t){p.crossDomain=!0}}if(p.data&&p.processData&&"string"!=typeof p.data&&(p.data=O.param(p.data,p.traditional)),Ye(qe,p,e,k),u)return k;for(h in(c=O.event&&p.global)&&0==O.active++&&O.event.trigger("ajaxStart"),p.type=p.type.toUpperCase(),p.hasContent=!Ue.test(p.type),o=p.url.replace(ze,""),p.hasContent?p.data&&p.processData&&0===(p.contentType||"").indexOf("application/x-www-form-urlencoded")&&(p.data=p.data.replace(Le,"+")):(f=p.url.slice(o.length),p.data&&(p.processData||"string"==typeof p.data)&&(o+=(Te.test(o)?"&":"?")+p.data,delete p.data),!1===p.cache&&(o=o.replace($e,"$1"),f=(Te.test(o)?"&":"?")+"_="+je.guid+++f),p.url=o+f),p.ifModified&&(O.lastModified[o]&&k.setRequestHeader("If-Modified-Since",O.lastModified[o]),O.etag[o]&&k.setRequestHeader("If-None-Match",O.etag[o])),(p.data&&p.hasContent&&!1!==p.contentType||e.contentType)&&k.setRequestHeader("Content-Type",p.contentType),k.setRequestHeader("Accept",p.dataTypes[0]&&p.accepts[p.dataTypes[0]]?p.accepts[p.dataTypes[0]]+("*"!==p.dataTypes[0]?", "+Ge+"; q=0.01":""):p.accepts["*"]),p.headers)k.setRequestHeader(h,p.headers[h]);if(p.beforeSend&&(!1===p.beforeSend.call(d,k,p)||u))return k.abort();if(x="abort",v.add(p.complete),k.done(p.success),k.fail(p.error),n=Ye(We,p,e,k)){if(k.readyState=1,c&&m.trigger("ajaxSend",[k,p]),u)return k;p.async&&p.timeout>0&&(s=r.setTimeout((function(){k.abort("timeout")}),p.timeout));try{u=!1,n.send(w,A)}catch(t){if(u)throw t;A(-1,t)}}else A(-1,"No Transport");function A(t,e,a,l){var h,f,b,w,_,x=e;u||(u=!0,s&&r.clearTimeout(s),n=void 0,i=l||"",k.readyState=t>0?4:0,h=t>=200&&t<300||304===t,a&&(w=function(t,e,n){for(var r,o,i,a,s=t.contents,l=t.dataTypes;"*"===l[0];)l.shift(),void 0===r&&(r=t.mimeType||e.getResponseHeader("Content-Type"));if(r)for(o in s)if(s[o]&&s[o].test(r)){l.unshift(o);break}if(l[0]in n)i=l[0];else{for(o in n){if(!l[0]||t.converters[o+" "+l[0]]){i=o;break}a||(a=o)}i=i||a}if(i)return i!==l[0]&&l.unshift(i),n[i]}(p,k,a)),!h&&O.inArray("script",p.dataTypes)>-1&&O.inArray("json",p.dataTypes)<0&&(p.converters["text script"]=function(){}),w=function(t,e,n,r){var o,i,a,s,l,u={},c=t.dataTypes.slice();if(c[1])for(a in t.converters)u[a.toLowerCase()]=t.converters[a];for(i=c.shift();i;)if(t.responseFields[i]&&(n[t.responseFields[i]]=e),!l&&r&&t.dataFilter&&(e=t.dataFilter(e,t.dataType)),l=i,i=c.shift())if("*"===i)i=l;else if("*"!==l&&l!==i){if(!(a=u[l+" "+i]||u["* "+i]))for(o in u)if((s=o.split(" "))[1]===i&&(a=u[l+" "+s[0]]||u["* "+s[0]])){!0===a?a=u[o]:!0!==u[o]&&(i=s[0],c.unshift(s[1]));break}if(!0!==a)if(a&&t.throws)e=a(e);else try{e=a(e)}catch(t){return{state:"parsererror",error:a?t:"No conversion from "+l+" to "+i}}}return{state:"success",data:e}}(p,w,k,h),h?(p.ifModified&&((_=k.getResponseHeader("Last-Modified"))&&(O.lastModified[o]=_),(_=k.getResponseHeader("etag"))&&(O.etag[o]=_)),204===t||"HEAD"===p.type?x="nocontent":304===t?x="notmodified":(x=w.state,f=w.data,h=!(b=w.error))):(b=x,!t&&x||(x="error",t<0&&(t=0))),k.status=t,k.statusText=(e||x)+"",h?g.resolveWith(d,[f,x,k]):g.rejectWith(d,[k,x,b]),k.statusCode(y),y=void 0,c&&m.trigger(h?"ajaxSuccess":"ajaxError",[k,p,h?f:b]),v.fireWith(d,[k,x]),c&&(m.trigger("ajaxComplete",[k,p]),--O.active||O.event.trigger("ajaxStop")))}return k},getJSON:function(t,e,n){return O.get(t,e,n,"json")},getScript:function(t,e){return O.get(t,void 0,e,"script")}}),O.each(["get","post"],(function(t,e){O[e]=function(t,n,r,o){return v(n)&&(o=o||r,r=n,n=void 0),O.ajax(O.extend({url:t,type:e,dataType:o,data:n,success:r},O.isPlainObject(t)&&t))}})),O.ajaxPrefilter((function(t){var e;for(e in t.headers)"content-type"===e.toLowerCase()&&(t.contentType=t.headers[e]||"")})),O._evalUrl=function(t,e,n){return O.ajax({url:t,type:"GET",dataType:"script",cache:!0,async:!1,global:!1,converters:{"text script":function(){}},dataFilter:function(t){O.globalEval(t,e,n)}})},O.fn.extend({wrapAll:function(t){var e;return this[0]&&(v(t)&&(t=t.call(this[0])),e=O(t,this[0].ownerDocument).eq(0).clone(!0),this[0].parentNode&&e.insertBefore(this[0]),e.map((function(){for(var t=this;t.firstElementChild;)t=t.firstElementChild;return t})).append(this)),this},wrapInner:function(t){return v(t)?this.each((function(e){O(this).wrapInner(t.call(this,e))})):this.each((function(){var e=O(this),n=e.contents();n.length?n.wrapAll(t):e.append(t)}))},wrap:function(t){var e=v(t);return this.each((function(n){O(this).wrapAll(e?t.call(this,n):t)}))},unwrap:function(t){return this.parent(t).not("body").each((function(){O(this).replaceWith(this.childNodes)})),this}}),O.expr.pseudos.hidden=function(t){return!O.expr.pseudos.visible(t)},O.expr.pseudos.visible=function(t){return!!(t.offsetWidth||t.offsetHeight||t.getClientRects().length)},O.ajaxSettings.xhr=function(){try{return new r.XMLHttpRequest}catch(t){}};var Ze={0:200,1223:204},Qe=O.ajaxSettings.xhr();g.cors=!!Qe&&"withCredentials"in Qe,g.ajax=Qe=!!Qe,O.ajaxTransport((function(t){var e,n;if(g.cors||Qe&&!t.crossDomain)return{send:function(o,i){var a,s=t.xhr();if(s.open(t.type,t.url,t.async,t.username,t.password),t.xhrFields)for(a in t.xhrFields)s[a]=t.xhrFields[a];for(a in t.mimeType&&s.overrideMimeType&&s.overrideMimeType(t.mimeType),t.crossDomain||o["X-Requested-With"]||(o["X-Requested-With"]="XMLHttpRequest"),o)s.setRequestHeader(a,o[a]);e=function(t){return function(){e&&(e=n=s.onload=s.onerror=s.onabort=s.ontimeout=s.onreadystatechange=null,"abort"===t?s.abort():"error"===t?"number"!=typeof s.status?i(0,"error"):i(s.status,s.statusText):i(Ze[s.status]||s.status,s.statusText,"text"!==(s.responseType||"text")||"string"!=typeof s.responseText?{binary:s.response}:{text:s.responseText},s.getAllResponseHeaders()))}},s.onload=e(),n=s.onerror=s.ontimeout=e("error"),void 0!==s.onabort?s.onabort=n:s.onreadystatechange=function(){4===s.readyState&&r.setTimeout((function(){e&&n()}))},e=e("abort");try{s.send(t.hasContent&&t.data||null)}catch(t){if(e)throw t}},abort:function(){e&&e()}}})),O.ajaxPrefilter((function(t){t.crossDomain&&(t.contents.script=!1)})),O.ajaxSetup({accepts:{script:"text/javascript, application/javascript, application/ecmascript, application/x-ecmascript"},contents:{script:/\b(?:java|ecma)script\b/},converters:{"text script":function(t){return O.globalEval(t),t}}}),O.ajaxPrefilter("script",(function(t){void 0===t.cache&&(t.cache=!1),t.crossDomain&&(t.type="GET")})),O.ajaxTransport("script",(function(t){var e,n;if(t.crossDomain||t.scriptAttrs)return{send:function(r,o){e=O("<script>").attr(t.scriptAttrs||{}).prop({charset:t.scriptCharset,src:t.url}).on("load error",n=function(t){e.remove(),n=null,t&&o("error"===t.type?404:200,t.type)}),b.head.appendChild(e[0])},abort:function(){n&&n()}}}));var tn,en=[],nn=/(=)\?(?=&|$)|\?\?/;O.ajaxSetup({jsonp:"callback",jsonpCallback:function(){var t=en.pop()||O.expando+"_"+je.guid++;return this[t]=!0,t}}),O.ajaxPrefilter("json jsonp",(function(t,e,n){var o,i,a,s=!1!==t.jsonp&&(nn.test(t.url)?"url":"string"==typeof t.data&&0===(t.contentType||"").indexOf("application/x-www-form-urlencoded")&&nn.test(t.data)&&"data");if(s||"jsonp"===t.dataTypes[0])return o=t.jsonpCallback=v(t.jsonpCallback)?t.jsonpCallback():t.jsonpCallback,s?t[s]=t[s].replace(nn,"$1"+o):!1!==t.jsonp&&(t.url+=(Te.test(t.url)?"&":"?")+t.jsonp+"="+o),t.converters["script json"]=function(){return a||O.error(o+" was not called"),a[0]},t.dataTypes[0]="json",i=r[o],r[o]=function(){a=arguments},n.always((function(){void 0===i?O(r).removeProp(o):r[o]=i,t[o]&&(t.jsonpCallback=e.jsonpCallback,en.push(o)),a&&v(i)&&i(a[0]),a=i=void 0})),"script"})),g.createHTMLDocument=((tn=b.implementation.createHTMLDocument("").body).innerHTML="<form></form><form></form>",2===tn.childNodes.length),O.parseHTML=function(t,e,n){return"string"!=typeof t?[]:("boolean"==typeof e&&(n=e,e=!1),e||(g.createHTMLDocument?((r=(e=b.implementation.createHTMLDocument("")).createElement("base")).href=b.location.href,e.head.appendChild(r)):e=b),i=!n&&[],(o=z.exec(t))?[e.createElement(o[1])]:(o=Rt([t],e,i),i&&i.length&&O(i).remove(),O.merge([],o.childNodes)));var r,o,i},O.fn.load=function(t,e,n){var r,o,i,a=this,s=t.indexOf(" ");return s>-1&&(r=Oe(t.slice(s)),t=t.slice(0,s)),v(e)?(n=e,e=void 0):e&&"object"==typeof e&&(o="POST"),a.length>0&&O.ajax({url:t,type:o||"GET",dataType:"html",data:e}).done((function(t){i=arguments,a.html(r?O("<div>").append(O.parseHTML(t)).find(r):t)})).always(n&&function(t,e){a.each((function(){n.apply(this,i||[t.responseText,e,t])}))}),this},O.expr.pseudos.animated=function(t){return O.grep(O.timers,(function(e){return t===e.elem})).length},O.offset={setOffset:function(t,e,n){var r,o,i,a,s,l,u=O.css(t,"position"),c=O(t),h={};"static"===u&&(t.style.position="relative"),s=c.offset(),i=O.css(t,"top"),l=O.css(t,"left"),("absolute"===u||"fixed"===u)&&(i+l).indexOf("auto")>-1?(a=(r=c.position()).top,o=r.left):(a=parseFloat(i)||0,o=parseFloat(l)||0),v(e)&&(e=e.call(t,n,O.extend({},s))),null!=e.top&&(h.top=e.top-s.top+a),null!=e.left&&(h.left=e.left-s.left+o),"using"in e?e.using.call(t,h):c.css(h)}},O.fn.extend({offset:function(t){if(arguments.length)return void 0===t?this:this.each((function(e){O.offset.setOffset(this,t,e)}));var e,n,r=this[0];return r?r.getClientRects().length?(e=r.getBoundingClientRect(),n=r.ownerDocument.defaultView,{top:e.top+n.pageYOffset,left:e.left+n.pageXOffset}):{top:0,left:0}:void 0},position:function(){if(this[0]){var t,e,n,r=this[0],o={top:0,left:0};if("fixed"===O.css(r,"position"))e=r.getBoundingClientRect();else{for(e=this.offset(),n=r.ownerDocument,t=r.offsetParent||n.documentElement;t&&(t===n.body||t===n.documentElement)&&"static"===O.css(t,"position");)t=t.parentNode;t&&t!==r&&1===t.nodeType&&((o=O(t).offset()).top+=O.css(t,"borderTopWidth",!0),o.left+=O.css(t,"borderLeftWidth",!0))}return{top:e.top-o.top-O.css(r,"marginTop",!0),left:e.left-o.left-O.css(r,"marginLeft",!0)}}},offsetParent:function(){return this.map((function(){for(var t=this.offsetParent;t&&"static"===O.css(t,"position");)t=t.offsetParent;return t||mt}))}}),O.each({scrollLeft:"pageXOffset",scrollTop:"pageYOffset"},(function(t,e){var n="pageYOffset"===e;O.fn[t]=function(r){return tt(this,(function(t,r,o){var i;if(y(t)?i=t:9===t.nodeType&&(i=t.defaultView),void 0===o)return i?i[e]:t[r];i?i.scrollTo(n?i.pageXOffset:o,n?o:i.pageYOffset):t[r]=o}),t,r,arguments.length)}})),O.each(["top","left"],(function(t,e){O.cssHooks[e]=te(g.pixelPosition,(function(t,n){if(n)return n=Qt(t,e),Kt.test(n)?O(t).position()[e]+"px":n}))})),O.each({Height:"height",Width:"width"},(function(t,e){O.each({padding:"inner"+t,content:e,"":"outer"+t},(function(n,r){O.fn[r]=function(o,i){var a=arguments.length&&(n||"boolean"!=typeof o),s=n||(!0===o||!0===i?"margin":"border");return tt(this,(function(e,n,o){var i;return y(e)?0===r.indexOf("outer")?e["inner"+t]:e.document.documentElement["client"+t]:9===e.nodeType?(i=e.documentElement,Math.max(e.body["scroll"+t],i["scroll"+t],e.body["offset"+t],i["offset"+t],i["client"+t])):void 0===o?O.css(e,n,s):O.style(e,n,o,s)}),e,a?o:void 0,a)}}))})),O.each(["ajaxStart","ajaxStop","ajaxComplete","ajaxError","ajaxSuccess","ajaxSend"],(function(t,e){O.fn[e]=function(t){return this.on(e,t)}})),O.fn.extend({bind:function(t,e,n){return this.on(t,null,e,n)},unbind:function(t,e){return this.off(t,null,e)},delegate:function(t,e,n,r){return this.on(e,t,n,r)},undelegate:function(t,e,n){return 1===arguments.length?this.off(t,"**"):this.off(e,t||"**",n)},hover:function(t,e){return this.on("mouseenter",t).on("mouseleave",e||t)}}),O.each("blur focus focusin focusout resize scroll click dblclick mousedown mouseup mousemove mouseover mouseout mouseenter mouseleave change select submit keydown keypress keyup contextmenu".split(" "),(function(t,e){O.fn[e]=function(t,n){return arguments.length>0?this.on(e,null,t,n):this.trigger(e)}}));var rn=/^[\s\uFEFF\xA0]+|([^\s\uFEFF\xA0])[\s\uFEFF\xA0]+$/g;O.proxy=function(t,e){var n,r,o;if("string"==typeof e&&(n=t[e],e=t,t=n),v(t))return r=s.call(arguments,2),o=function(){return t.apply(e||this,r.concat(s.call(arguments)))},o.guid=t.guid=t.guid||O.guid++,o},O.holdReady=function(t){t?O.readyWait++:O.ready(!0)},O.isArray=Array.isArray,O.parseJSON=JSON.parse,O.nodeName=C,O.isFunction=v,O.isWindow=y,O.camelCase=ot,O.type=x,O.now=Date.now,O.isNumeric=function(t){var e=O.type(t);return("number"===e||"string"===e)&&!isNaN(t-parseFloat(t))},O.trim=function(t){return null==t?"":(t+"").replace(rn,"$1")},void 0===(n=function(){return O}.apply(e,[]))||(t.exports=n);var on=r.jQuery,an=r.$;return O.noConflict=function(t){return r.$===O&&(r.$=an),t&&r.jQuery===O&&(r.jQuery=on),O},void 0===o&&(r.jQuery=r.$=O),O}))},8859:function(t,e,n){var r="function"==typeof Map&&Map.prototype,o=Object.getOwnPropertyDescriptor&&r?Object.getOwnPropertyDescriptor(Map.prototype,"size"):null,i=r&&o&&"function"==typeof o.get?o.get:null,a=r&&Map.prototype.forEach,s="function"==typeof Set&&Set.prototype,l=Object.getOwnPropertyDescriptor&&s?Object.getOwnPropertyDescriptor(Set.prototype,"size"):null,u=s&&l&&"function"==typeof l.get?l.get:null,c=s&&Set.prototype.forEach,h="function"==typeof WeakMap&&WeakMap.prototype?WeakMap.prototype.has:null,f="function"==typeof WeakSet&&WeakSet.prototype?WeakSet.prototype.has:null,p="function"==typeof WeakRef&&WeakRef.prototype?WeakRef.prototype.deref:null,d=Boolean.prototype.valueOf,m=Object.prototype.toString,g=Function.prototype.toString,v=String.prototype.match,y=String.prototype.slice,b=String.prototype.replace,w=String.prototype.toUpperCase,_=String.prototype.toLowerCase,x=RegExp.prototype.test,k=Array.prototype.concat,A=Array.prototype.join,O=Array.prototype.slice,E=Math.floor,C="function"==typeof BigInt?BigInt.prototype.valueOf:null,S=Object.getOwnPropertySymbols,P="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?Symbol.prototype.toString:null,j="function"==typeof Symbol&&"object"==typeof Symbol.iterator,T="function"==typeof Symbol&&Symbol.toStringTag&&(typeof Symbol.toStringTag===j||"symbol")?Symbol.toStringTag:null,R=Object.prototype.propertyIsEnumerable,M=("function"==typeof Reflect?Reflect.getPrototypeOf:Object.getPrototypeOf)||([].__proto__===Array.prototype?function(t){return t.__proto__}:null);function N(t,e){if(t===1/0||t===-1/0||t!=t||t&&t>-1e3&&t<1e3||x.call(/e/,e))return e;var n=/[0-9](?=(?:[0-9]{3})+(?![0-9]))/g;if("number"==typeof t){var r=t<0?-E(-t):E(t);if(r!==t){var o=String(r),i=y.call(e,o.length+1);return b.call(o,n,"$&_")+"."+b.call(b.call(i,/([0-9]{3})/g,"$&_"),/_$/,"")}}return b.call(e,n,"$&_")}var D=n(2634),B=D.custom,V=F(B)?B:null;function I(t,e,n){var r="double"===(n.quoteStyle||e)?'"':"'";return r+t+r}function L(t){return b.call(String(t),/"/g,"&quot;")}function z(t){return!("[object Array]"!==q(t)||T&&"object"==typeof t&&T in t)}function $(t){return!("[object RegExp]"!==q(t)||T&&"object"==typeof t&&T in t)}function F(t){if(j)return t&&"object"==typeof t&&t instanceof Symbol;if("symbol"==typeof t)return!0;if(!t||"object"!=typeof t||!P)return!1;try{return P.call(t),!0}catch(t){}return!1}t.exports=function t(e,r,o,s){var l=r||{};if(H(l,"quoteStyle")&&"single"!==l.quoteStyle&&"double"!==l.quoteStyle)throw new TypeError('option "quoteStyle" must be "single" or "double"');if(H(l,"maxStringLength")&&("number"==typeof l.maxStringLength?l.maxStringLength<0&&l.maxStringLength!==1/0:null!==l.maxStringLength))throw new TypeError('option "maxStringLength", if provided, must be a positive integer, Infinity, or `null`');var m=!H(l,"customInspect")||l.customInspect;if("boolean"!=typeof m&&"symbol"!==m)throw new TypeError("option \"customInspect\", if provided, must be `true`, `false`, or `'symbol'`");if(H(l,"indent")&&null!==l.indent&&"\t"!==l.indent&&!(parseInt(l.indent,10)===l.indent&&l.indent>0))throw new TypeError('option "indent" must be "\\t", an integer > 0, or `null`');if(H(l,"numericSeparator")&&"boolean"!=typeof l.numericSeparator)throw new TypeError('option "numericSeparator", if provided, must be `true` or `false`');var w=l.numericSeparator;if(void 0===e)return"undefined";if(null===e)return"null";if("boolean"==typeof e)return e?"true":"false";if("string"==typeof e)return G(e,l);if("number"==typeof e){if(0===e)return 1/0/e>0?"0":"-0";var x=String(e);return w?N(e,x):x}if("bigint"==typeof e){var E=String(e)+"n";return w?N(e,E):E}var S=void 0===l.depth?5:l.depth;if(void 0===o&&(o=0),o>=S&&S>0&&"object"==typeof e)return z(e)?"[Array]":"[Object]";var B=function(t,e){var n;if("\t"===t.indent)n="\t";else{if(!("number"==typeof t.indent&&t.indent>0))return null;n=A.call(Array(t.indent+1)," ")}return{base:n,prev:A.call(Array(e+1),n)}}(l,o);if(void 0===s)s=[];else if(W(s,e)>=0)return"[Circular]";function U(e,n,r){if(n&&(s=O.call(s)).push(n),r){var i={depth:l.depth};return H(l,"quoteStyle")&&(i.quoteStyle=l.quoteStyle),t(e,i,o+1,s)}return t(e,l,o+1,s)}if("function"==typeof e&&!$(e)){var K=function(t){if(t.name)return t.name;var e=v.call(g.call(t),/^function\s*([\w$]+)/);if(e)return e[1];return null}(e),tt=Q(e,U);return"[Function"+(K?": "+K:" (anonymous)")+"]"+(tt.length>0?" { "+A.call(tt,", ")+" }":"")}if(F(e)){var et=j?b.call(String(e),/^(Symbol\(.*\))_[^)]*$/,"$1"):P.call(e);return"object"!=typeof e||j?et:X(et)}if(function(t){if(!t||"object"!=typeof t)return!1;if("undefined"!=typeof HTMLElement&&t instanceof HTMLElement)return!0;return"string"==typeof t.nodeName&&"function"==typeof t.getAttribute}(e)){for(var nt="<"+_.call(String(e.nodeName)),rt=e.attributes||[],ot=0;ot<rt.length;ot++)nt+=" "+rt[ot].name+"="+I(L(rt[ot].value),"double",l);return nt+=">",e.childNodes&&e.childNodes.length&&(nt+="..."),nt+="</"+_.call(String(e.nodeName))+">"}if(z(e)){if(0===e.length)return"[]";var it=Q(e,U);return B&&!function(t){for(var e=0;e<t.length;e++)if(W(t[e],"\n")>=0)return!1;return!0}(it)?"["+Z(it,B)+"]":"[ "+A.call(it,", ")+" ]"}if(function(t){return!("[object Error]"!==q(t)||T&&"object"==typeof t&&T in t)}(e)){var at=Q(e,U);return"cause"in Error.prototype||!("cause"in e)||R.call(e,"cause")?0===at.length?"["+String(e)+"]":"{ ["+String(e)+"] "+A.call(at,", ")+" }":"{ ["+String(e)+"] "+A.call(k.call("[cause]: "+U(e.cause),at),", ")+" }"}if("object"==typeof e&&m){if(V&&"function"==typeof e[V]&&D)return D(e,{depth:S-o});if("symbol"!==m&&"function"==typeof e.inspect)return e.inspect()}if(function(t){if(!i||!t||"object"!=typeof t)return!1;try{i.call(t);try{u.call(t)}catch(t){return!0}return t instanceof Map}catch(t){}return!1}(e)){var st=[];return a&&a.call(e,(function(t,n){st.push(U(n,e,!0)+" => "+U(t,e))})),J("Map",i.call(e),st,B)}if(function(t){if(!u||!t||"object"!=typeof t)return!1;try{u.call(t);try{i.call(t)}catch(t){return!0}return t instanceof Set}catch(t){}return!1}(e)){var lt=[];return c&&c.call(e,(function(t){lt.push(U(t,e))})),J("Set",u.call(e),lt,B)}if(function(t){if(!h||!t||"object"!=typeof t)return!1;try{h.call(t,h);try{f.call(t,f)}catch(t){return!0}return t instanceof WeakMap}catch(t){}return!1}(e))return Y("WeakMap");if(function(t){if(!f||!t||"object"!=typeof t)return!1;try{f.call(t,f);try{h.call(t,h)}catch(t){return!0}return t instanceof WeakSet}catch(t){}return!1}(e))return Y("WeakSet");if(function(t){if(!p||!t||"object"!=typeof t)return!1;try{return p.call(t),!0}catch(t){}return!1}(e))return Y("WeakRef");if(function(t){return!("[object Number]"!==q(t)||T&&"object"==typeof t&&T in t)}(e))return X(U(Number(e)));if(function(t){if(!t||"object"!=typeof t||!C)return!1;try{return C.call(t),!0}catch(t){}return!1}(e))return X(U(C.call(e)));if(function(t){return!("[object Boolean]"!==q(t)||T&&"object"==typeof t&&T in t)}(e))return X(d.call(e));if(function(t){return!("[object String]"!==q(t)||T&&"object"==typeof t&&T in t)}(e))return X(U(String(e)));if("undefined"!=typeof window&&e===window)return"{ [object Window] }";if(e===n.g)return"{ [object globalThis] }";if(!function(t){return!("[object Date]"!==q(t)||T&&"object"==typeof t&&T in t)}(e)&&!$(e)){var ut=Q(e,U),ct=M?M(e)===Object.prototype:e instanceof Object||e.constructor===Object,ht=e instanceof Object?"":"null prototype",ft=!ct&&T&&Object(e)===e&&T in e?y.call(q(e),8,-1):ht?"Object":"",pt=(ct||"function"!=typeof e.constructor?"":e.constructor.name?e.constructor.name+" ":"")+(ft||ht?"["+A.call(k.call([],ft||[],ht||[]),": ")+"] ":"");return 0===ut.length?pt+"{}":B?pt+"{"+Z(ut,B)+"}":pt+"{ "+A.call(ut,", ")+" }"}return String(e)};var U=Object.prototype.hasOwnProperty||function(t){return t in this};function H(t,e){return U.call(t,e)}function q(t){return m.call(t)}function W(t,e){if(t.indexOf)return t.indexOf(e);for(var n=0,r=t.length;n<r;n++)if(t[n]===e)return n;return-1}function G(t,e){if(t.length>e.maxStringLength){var n=t.length-e.maxStringLength,r="... "+n+" more character"+(n>1?"s":"");return G(y.call(t,0,e.maxStringLength),e)+r}return I(b.call(b.call(t,/(['\\])/g,"\\$1"),/[\x00-\x1f]/g,K),"single",e)}function K(t){var e=t.charCodeAt(0),n={8:"b",9:"t",10:"n",12:"f",13:"r"}[e];return n?"\\"+n:"\\x"+(e<16?"0":"")+w.call(e.toString(16))}function X(t){return"Object("+t+")"}function Y(t){return t+" { ? }"}function J(t,e,n,r){return t+" ("+e+") {"+(r?Z(n,r):A.call(n,", "))+"}"}function Z(t,e){if(0===t.length)return"";var n="\n"+e.prev+e.base;return n+A.call(t,","+n)+"\n"+e.prev}function Q(t,e){var n=z(t),r=[];if(n){r.length=t.length;for(var o=0;o<t.length;o++)r[o]=H(t,o)?e(t[o],t):""}var i,a="function"==typeof S?S(t):[];if(j){i={};for(var s=0;s<a.length;s++)i["$"+a[s]]=a[s]}for(var l in t)H(t,l)&&(n&&String(Number(l))===l&&l<t.length||j&&i["$"+l]instanceof Symbol||(x.call(/[^\w$]/,l)?r.push(e(l,t)+": "+e(t[l],t)):r.push(l+": "+e(t[l],t))));if("function"==typeof S)for(var u=0;u<a.length;u++)R.call(t,a[u])&&r.push("["+e(a[u])+"]: "+e(t[a[u]],t));return r}},4765:function(t){"use strict";var e=String.prototype.replace,n=/%20/g,r="RFC1738",o="RFC3986";t.exports={default:o,formatters:{RFC1738:function(t){return e.call(t,n,"+")},RFC3986:function(t){return String(t)}},RFC1738:r,RFC3986:o}},5373:function(t,e,n){"use strict";var r=n(8636),o=n(2642),i=n(4765);t.exports={formats:i,parse:o,stringify:r}},2642:function(t,e,n){"use strict";var r=n(7720),o=Object.prototype.hasOwnProperty,i=Array.isArray,a={allowDots:!1,allowEmptyArrays:!1,allowPrototypes:!1,allowSparse:!1,arrayLimit:20,charset:"utf-8",charsetSentinel:!1,comma:!1,decodeDotInKeys:!1,decoder:r.decode,delimiter:"&",depth:5,duplicates:"combine",ignoreQueryPrefix:!1,interpretNumericEntities:!1,parameterLimit:1e3,parseArrays:!0,plainObjects:!1,strictDepth:!1,strictNullHandling:!1},s=function(t){return t.replace(/&#(\d+);/g,(function(t,e){return String.fromCharCode(parseInt(e,10))}))},l=function(t,e){return t&&"string"==typeof t&&e.comma&&t.indexOf(",")>-1?t.split(","):t},u=function(t,e,n,r){if(t){var i=n.allowDots?t.replace(/\.([^.[]+)/g,"[$1]"):t,a=/(\[[^[\]]*])/g,s=n.depth>0&&/(\[[^[\]]*])/.exec(i),u=s?i.slice(0,s.index):i,c=[];if(u){if(!n.plainObjects&&o.call(Object.prototype,u)&&!n.allowPrototypes)return;c.push(u)}for(var h=0;n.depth>0&&null!==(s=a.exec(i))&&h<n.depth;){if(h+=1,!n.plainObjects&&o.call(Object.prototype,s[1].slice(1,-1))&&!n.allowPrototypes)return;c.push(s[1])}if(s){if(!0===n.strictDepth)throw new RangeError("Input depth exceeded depth option of "+n.depth+" and strictDepth is true");c.push("["+i.slice(s.index)+"]")}return function(t,e,n,r){for(var o=r?e:l(e,n),i=t.length-1;i>=0;--i){var a,s=t[i];if("[]"===s&&n.parseArrays)a=n.allowEmptyArrays&&(""===o||n.strictNullHandling&&null===o)?[]:[].concat(o);else{a=n.plainObjects?Object.create(null):{};var u="["===s.charAt(0)&&"]"===s.charAt(s.length-1)?s.slice(1,-1):s,c=n.decodeDotInKeys?u.replace(/%2E/g,"."):u,h=parseInt(c,10);n.parseArrays||""!==c?!isNaN(h)&&s!==c&&String(h)===c&&h>=0&&n.parseArrays&&h<=n.arrayLimit?(a=[])[h]=o:"__proto__"!==c&&(a[c]=o):a={0:o}}o=a}return o}(c,e,n,r)}};t.exports=function(t,e){var n=function(t){if(!t)return a;if(void 0!==t.allowEmptyArrays&&"boolean"!=typeof t.allowEmptyArrays)throw new TypeError("`allowEmptyArrays` option can only be `true` or `false`, when provided");if(void 0!==t.decodeDotInKeys&&"boolean"!=typeof t.decodeDotInKeys)throw new TypeError("`decodeDotInKeys` option can only be `true` or `false`, when provided");if(null!==t.decoder&&void 0!==t.decoder&&"function"!=typeof t.decoder)throw new TypeError("Decoder has to be a function.");if(void 0!==t.charset&&"utf-8"!==t.charset&&"iso-8859-1"!==t.charset)throw new TypeError("The charset option must be either utf-8, iso-8859-1, or undefined");var e=void 0===t.charset?a.charset:t.charset,n=void 0===t.duplicates?a.duplicates:t.duplicates;if("combine"!==n&&"first"!==n&&"last"!==n)throw new TypeError("The duplicates option must be either combine, first, or last");return{allowDots:void 0===t.allowDots?!0===t.decodeDotInKeys||a.allowDots:!!t.allowDots,allowEmptyArrays:"boolean"==typeof t.allowEmptyArrays?!!t.allowEmptyArrays:a.allowEmptyArrays,allowPrototypes:"boolean"==typeof t.allowPrototypes?t.allowPrototypes:a.allowPrototypes,allowSparse:"boolean"==typeof t.allowSparse?t.allowSparse:a.allowSparse,arrayLimit:"number"==typeof t.arrayLimit?t.arrayLimit:a.arrayLimit,charset:e,charsetSentinel:"boolean"==typeof t.charsetSentinel?t.charsetSentinel:a.charsetSentinel,comma:"boolean"==typeof t.comma?t.comma:a.comma,decodeDotInKeys:"boolean"==typeof t.decodeDotInKeys?t.decodeDotInKeys:a.decodeDotInKeys,decoder:"function"==typeof t.decoder?t.decoder:a.decoder,delimiter:"string"==typeof t.delimiter||r.isRegExp(t.delimiter)?t.delimiter:a.delimiter,depth:"number"==typeof t.depth||!1===t.depth?+t.depth:a.depth,duplicates:n,ignoreQueryPrefix:!0===t.ignoreQueryPrefix,interpretNumericEntities:"boolean"==typeof t.interpretNumericEntities?t.interpretNumericEntities:a.interpretNumericEntities,parameterLimit:"number"==typeof t.parameterLimit?t.parameterLimit:a.parameterLimit,parseArrays:!1!==t.parseArrays,plainObjects:"boolean"==typeof t.plainObjects?t.plainObjects:a.plainObjects,strictDepth:"boolean"==typeof t.strictDepth?!!t.strictDepth:a.strictDepth,strictNullHandling:"boolean"==typeof t.strictNullHandling?t.strictNullHandling:a.strictNullHandling}}(e);if(""===t||null==t)return n.plainObjects?Object.create(null):{};for(var c="string"==typeof t?function(t,e){var n={__proto__:null},u=e.ignoreQueryPrefix?t.replace(/^\?/,""):t;u=u.replace(/%5B/gi,"[").replace(/%5D/gi,"]");var c,h=e.parameterLimit===1/0?void 0:e.parameterLimit,f=u.split(e.delimiter,h),p=-1,d=e.charset;if(e.charsetSentinel)for(c=0;c<f.length;++c)0===f[c].indexOf("utf8=")&&("utf8=%E2%9C%93"===f[c]?d="utf-8":"utf8=%26%2310003%3B"===f[c]&&(d="iso-8859-1"),p=c,c=f.length);for(c=0;c<f.length;++c)if(c!==p){var m,g,v=f[c],y=v.indexOf("]="),b=-1===y?v.indexOf("="):y+1;-1===b?(m=e.decoder(v,a.decoder,d,"key"),g=e.strictNullHandling?null:""):(m=e.decoder(v.slice(0,b),a.decoder,d,"key"),g=r.maybeMap(l(v.slice(b+1),e),(function(t){return e.decoder(t,a.decoder,d,"value")}))),g&&e.interpretNumericEntities&&"iso-8859-1"===d&&(g=s(g)),v.indexOf("[]=")>-1&&(g=i(g)?[g]:g);var w=o.call(n,m);w&&"combine"===e.duplicates?n[m]=r.combine(n[m],g):w&&"last"!==e.duplicates||(n[m]=g)}return n}(t,n):t,h=n.plainObjects?Object.create(null):{},f=Object.keys(c),p=0;p<f.length;++p){var d=f[p],m=u(d,c[d],n,"string"==typeof t);h=r.merge(h,m,n)}return!0===n.allowSparse?h:r.compact(h)}},8636:function(t,e,n){"use strict";var r=n(920),o=n(7720),i=n(4765),a=Object.prototype.hasOwnProperty,s={brackets:function(t){return t+"[]"},comma:"comma",indices:function(t,e){return t+"["+e+"]"},repeat:function(t){return t}},l=Array.isArray,u=Array.prototype.push,c=function(t,e){u.apply(t,l(e)?e:[e])},h=Date.prototype.toISOString,f=i.default,p={addQueryPrefix:!1,allowDots:!1,allowEmptyArrays:!1,arrayFormat:"indices",charset:"utf-8",charsetSentinel:!1,delimiter:"&",encode:!0,encodeDotInKeys:!1,encoder:o.encode,encodeValuesOnly:!1,format:f,formatter:i.formatters[f],indices:!1,serializeDate:function(t){return h.call(t)},skipNulls:!1,strictNullHandling:!1},d={},m=function t(e,n,i,a,s,u,h,f,m,g,v,y,b,w,_,x,k,A){for(var O,E=e,C=A,S=0,P=!1;void 0!==(C=C.get(d))&&!P;){var j=C.get(e);if(S+=1,void 0!==j){if(j===S)throw new RangeError("Cyclic object value");P=!0}void 0===C.get(d)&&(S=0)}if("function"==typeof g?E=g(n,E):E instanceof Date?E=b(E):"comma"===i&&l(E)&&(E=o.maybeMap(E,(function(t){return t instanceof Date?b(t):t}))),null===E){if(u)return m&&!x?m(n,p.encoder,k,"key",w):n;E=""}if("string"==typeof(O=E)||"number"==typeof O||"boolean"==typeof O||"symbol"==typeof O||"bigint"==typeof O||o.isBuffer(E))return m?[_(x?n:m(n,p.encoder,k,"key",w))+"="+_(m(E,p.encoder,k,"value",w))]:[_(n)+"="+_(String(E))];var T,R=[];if(void 0===E)return R;if("comma"===i&&l(E))x&&m&&(E=o.maybeMap(E,m)),T=[{value:E.length>0?E.join(",")||null:void 0}];else if(l(g))T=g;else{var M=Object.keys(E);T=v?M.sort(v):M}var N=f?n.replace(/\./g,"%2E"):n,D=a&&l(E)&&1===E.length?N+"[]":N;if(s&&l(E)&&0===E.length)return D+"[]";for(var B=0;B<T.length;++B){var V=T[B],I="object"==typeof V&&void 0!==V.value?V.value:E[V];if(!h||null!==I){var L=y&&f?V.replace(/\./g,"%2E"):V,z=l(E)?"function"==typeof i?i(D,L):D:D+(y?"."+L:"["+L+"]");A.set(e,S);var $=r();$.set(d,A),c(R,t(I,z,i,a,s,u,h,f,"comma"===i&&x&&l(E)?null:m,g,v,y,b,w,_,x,k,$))}}return R};t.exports=function(t,e){var n,o=t,u=function(t){if(!t)return p;if(void 0!==t.allowEmptyArrays&&"boolean"!=typeof t.allowEmptyArrays)throw new TypeError("`allowEmptyArrays` option can only be `true` or `false`, when provided");if(void 0!==t.encodeDotInKeys&&"boolean"!=typeof t.encodeDotInKeys)throw new TypeError("`encodeDotInKeys` option can only be `true` or `false`, when provided");if(null!==t.encoder&&void 0!==t.encoder&&"function"!=typeof t.encoder)throw new TypeError("Encoder has to be a function.");var e=t.charset||p.charset;if(void 0!==t.charset&&"utf-8"!==t.charset&&"iso-8859-1"!==t.charset)throw new TypeError("The charset option must be either utf-8, iso-8859-1, or undefined");var n=i.default;if(void 0!==t.format){if(!a.call(i.formatters,t.format))throw new TypeError("Unknown format option provided.");n=t.format}var r,o=i.formatters[n],u=p.filter;if(("function"==typeof t.filter||l(t.filter))&&(u=t.filter),r=t.arrayFormat in s?t.arrayFormat:"indices"in t?t.indices?"indices":"repeat":p.arrayFormat,"commaRoundTrip"in t&&"boolean"!=typeof t.commaRoundTrip)throw new TypeError("`commaRoundTrip` must be a boolean, or absent");var c=void 0===t.allowDots?!0===t.encodeDotInKeys||p.allowDots:!!t.allowDots;return{addQueryPrefix:"boolean"==typeof t.addQueryPrefix?t.addQueryPrefix:p.addQueryPrefix,allowDots:c,allowEmptyArrays:"boolean"==typeof t.allowEmptyArrays?!!t.allowEmptyArrays:p.allowEmptyArrays,arrayFormat:r,charset:e,charsetSentinel:"boolean"==typeof t.charsetSentinel?t.charsetSentinel:p.charsetSentinel,commaRoundTrip:t.commaRoundTrip,delimiter:void 0===t.delimiter?p.delimiter:t.delimiter,encode:"boolean"==typeof t.encode?t.encode:p.encode,encodeDotInKeys:"boolean"==typeof t.encodeDotInKeys?t.encodeDotInKeys:p.encodeDotInKeys,encoder:"function"==typeof t.encoder?t.encoder:p.encoder,encodeValuesOnly:"boolean"==typeof t.encodeValuesOnly?t.encodeValuesOnly:p.encodeValuesOnly,filter:u,format:n,formatter:o,serializeDate:"function"==typeof t.serializeDate?t.serializeDate:p.serializeDate,skipNulls:"boolean"==typeof t.skipNulls?t.skipNulls:p.skipNulls,sort:"function"==typeof t.sort?t.sort:null,strictNullHandling:"boolean"==typeof t.strictNullHandling?t.strictNullHandling:p.strictNullHandling}}(e);"function"==typeof u.filter?o=(0,u.filter)("",o):l(u.filter)&&(n=u.filter);var h=[];if("object"!=typeof o||null===o)return"";var f=s[u.arrayFormat],d="comma"===f&&u.commaRoundTrip;n||(n=Object.keys(o)),u.sort&&n.sort(u.sort);for(var g=r(),v=0;v<n.length;++v){var y=n[v];u.skipNulls&&null===o[y]||c(h,m(o[y],y,f,d,u.allowEmptyArrays,u.strictNullHandling,u.skipNulls,u.encodeDotInKeys,u.encode?u.encoder:null,u.filter,u.sort,u.allowDots,u.serializeDate,u.format,u.formatter,u.encodeValuesOnly,u.charset,g))}var b=h.join(u.delimiter),w=!0===u.addQueryPrefix?"?":"";return u.charsetSentinel&&("iso-8859-1"===u.charset?w+="utf8=%26%2310003%3B&":w+="utf8=%E2%9C%93&"),b.length>0?w+b:""}},7720:function(t,e,n){"use strict";var r=n(4765),o=Object.prototype.hasOwnProperty,i=Array.isArray,a=function(){for(var t=[],e=0;e<256;++e)t.push("%"+((e<16?"0":"")+e.toString(16)).toUpperCase());return t}(),s=function(t,e){for(var n=e&&e.plainObjects?Object.create(null):{},r=0;r<t.length;++r)void 0!==t[r]&&(n[r]=t[r]);return n},l=1024;t.exports={arrayToObject:s,assign:function(t,e){return Object.keys(e).reduce((function(t,n){return t[n]=e[n],t}),t)},combine:function(t,e){return[].concat(t,e)},compact:function(t){for(var e=[{obj:{o:t},prop:"o"}],n=[],r=0;r<e.length;++r)for(var o=e[r],a=o.obj[o.prop],s=Object.keys(a),l=0;l<s.length;++l){var u=s[l],c=a[u];"object"==typeof c&&null!==c&&-1===n.indexOf(c)&&(e.push({obj:a,prop:u}),n.push(c))}return function(t){for(;t.length>1;){var e=t.pop(),n=e.obj[e.prop];if(i(n)){for(var r=[],o=0;o<n.length;++o)void 0!==n[o]&&r.push(n[o]);e.obj[e.prop]=r}}}(e),t},decode:function(t,e,n){var r=t.replace(/\+/g," ");if("iso-8859-1"===n)return r.replace(/%[0-9a-f]{2}/gi,unescape);try{return decodeURIComponent(r)}catch(t){return r}},encode:function(t,e,n,o,i){if(0===t.length)return t;var s=t;if("symbol"==typeof t?s=Symbol.prototype.toString.call(t):"string"!=typeof t&&(s=String(t)),"iso-8859-1"===n)return escape(s).replace(/%u[0-9a-f]{4}/gi,(function(t){return"%26%23"+parseInt(t.slice(2),16)+"%3B"}));for(var u="",c=0;c<s.length;c+=l){for(var h=s.length>=l?s.slice(c,c+l):s,f=[],p=0;p<h.length;++p){var d=h.charCodeAt(p);45===d||46===d||95===d||126===d||d>=48&&d<=57||d>=65&&d<=90||d>=97&&d<=122||i===r.RFC1738&&(40===d||41===d)?f[f.length]=h.charAt(p):d<128?f[f.length]=a[d]:d<2048?f[f.length]=a[192|d>>6]+a[128|63&d]:d<55296||d>=57344?f[f.length]=a[224|d>>12]+a[128|d>>6&63]+a[128|63&d]:(p+=1,d=65536+((1023&d)<<10|1023&h.charCodeAt(p)),f[f.length]=a[240|d>>18]+a[128|d>>12&63]+a[128|d>>6&63]+a[128|63&d])}u+=f.join("")}return u},isBuffer:function(t){return!(!t||"object"!=typeof t)&&!!(t.constructor&&t.constructor.isBuffer&&t.constructor.isBuffer(t))},isRegExp:function(t){return"[object RegExp]"===Object.prototype.toString.call(t)},maybeMap:function(t,e){if(i(t)){for(var n=[],r=0;r<t.length;r+=1)n.push(e(t[r]));return n}return e(t)},merge:function t(e,n,r){if(!n)return e;if("object"!=typeof n){if(i(e))e.push(n);else{if(!e||"object"!=typeof e)return[e,n];(r&&(r.plainObjects||r.allowPrototypes)||!o.call(Object.prototype,n))&&(e[n]=!0)}return e}if(!e||"object"!=typeof e)return[e].concat(n);var a=e;return i(e)&&!i(n)&&(a=s(e,r)),i(e)&&i(n)?(n.forEach((function(n,i){if(o.call(e,i)){var a=e[i];a&&"object"==typeof a&&n&&"object"==typeof n?e[i]=t(a,n,r):e.push(n)}else e[i]=n})),e):Object.keys(n).reduce((function(e,i){var a=n[i];return o.call(e,i)?e[i]=t(e[i],a,r):e[i]=a,e}),a)}}},6897:function(t,e,n){"use strict";var r=n(453),o=n(41),i=n(592)(),a=n(5795),s=n(9675),l=r("%Math.floor%");t.exports=function(t,e){if("function"!=typeof t)throw new s("`fn` is not a function");if("number"!=typeof e||e<0||e>4294967295||l(e)!==e)throw new s("`length` must be a positive 32-bit integer");var n=arguments.length>2&&!!arguments[2],r=!0,u=!0;if("length"in t&&a){var c=a(t,"length");c&&!c.configurable&&(r=!1),c&&!c.writable&&(u=!1)}return(r||u||!n)&&(i?o(t,"length",e,!0,!0):o(t,"length",e)),t}},920:function(t,e,n){"use strict";var r=n(453),o=n(8075),i=n(8859),a=n(9675),s=r("%WeakMap%",!0),l=r("%Map%",!0),u=o("WeakMap.prototype.get",!0),c=o("WeakMap.prototype.set",!0),h=o("WeakMap.prototype.has",!0),f=o("Map.prototype.get",!0),p=o("Map.prototype.set",!0),d=o("Map.prototype.has",!0),m=function(t,e){for(var n,r=t;null!==(n=r.next);r=n)if(n.key===e)return r.next=n.next,n.next=t.next,t.next=n,n};t.exports=function(){var t,e,n,r={assert:function(t){if(!r.has(t))throw new a("Side channel does not contain "+i(t))},get:function(r){if(s&&r&&("object"==typeof r||"function"==typeof r)){if(t)return u(t,r)}else if(l){if(e)return f(e,r)}else if(n)return function(t,e){var n=m(t,e);return n&&n.value}(n,r)},has:function(r){if(s&&r&&("object"==typeof r||"function"==typeof r)){if(t)return h(t,r)}else if(l){if(e)return d(e,r)}else if(n)return function(t,e){return!!m(t,e)}(n,r);return!1},set:function(r,o){s&&r&&("object"==typeof r||"function"==typeof r)?(t||(t=new s),c(t,r,o)):l?(e||(e=new l),p(e,r,o)):(n||(n={key:{},next:null}),function(t,e,n){var r=m(t,e);r?r.value=n:t.next={key:e,next:t.next,value:n}}(n,r,o))}};return r}},7730:function(t){t.exports=function(t){return null==t?"":""+t}},6565:function(t){t.exports=function(t,e){if(e<1)return"";for(var n="";e>0;)1&e&&(n+=t),e>>=1,t+=t;return n}},7777:function(t,e,n){var r=n(7730),o=n(6565);t.exports=function(t,e,n,i){t=r(t),e=~~e;var a=0;switch(n?n.length>1&&(n=n.charAt(0)):n=" ",i){case"right":return a=e-t.length,t+o(n,a);case"both":return a=e-t.length,o(n,Math.ceil(a/2))+t+o(n,Math.floor(a/2));default:return a=e-t.length,o(n,a)+t}}},1270:function(t,e,n){var r;t=n.nmd(t),function(o){e&&e.nodeType,t&&t.nodeType;var i="object"==typeof n.g&&n.g;i.global!==i&&i.window!==i&&i.self;var a,s=2147483647,l=36,u=1,c=26,h=38,f=700,p=72,d=128,m="-",g=/^xn--/,v=/[^\x20-\x7E]/,y=/[\x2E\u3002\uFF0E\uFF61]/g,b={overflow:"Overflow: input needs wider integers to process","not-basic":"Illegal input >= 0x80 (not a basic code point)","invalid-input":"Invalid input"},w=l-u,_=Math.floor,x=String.fromCharCode;function k(t){throw new RangeError(b[t])}function A(t,e){for(var n=t.length,r=[];n--;)r[n]=e(t[n]);return r}function O(t,e){var n=t.split("@"),r="";return n.length>1&&(r=n[0]+"@",t=n[1]),r+A((t=t.replace(y,".")).split("."),e).join(".")}function E(t){for(var e,n,r=[],o=0,i=t.length;o<i;)(e=t.charCodeAt(o++))>=55296&&e<=56319&&o<i?56320==(64512&(n=t.charCodeAt(o++)))?r.push(((1023&e)<<10)+(1023&n)+65536):(r.push(e),o--):r.push(e);return r}function C(t){return A(t,(function(t){var e="";return t>65535&&(e+=x((t-=65536)>>>10&1023|55296),t=56320|1023&t),e+=x(t)})).join("")}function S(t,e){return t+22+75*(t<26)-((0!=e)<<5)}function P(t,e,n){var r=0;for(t=n?_(t/f):t>>1,t+=_(t/e);t>w*c>>1;r+=l)t=_(t/w);return _(r+(w+1)*t/(t+h))}function j(t){var e,n,r,o,i,a,h,f,g,v,y,b=[],w=t.length,x=0,A=d,O=p;for((n=t.lastIndexOf(m))<0&&(n=0),r=0;r<n;++r)t.charCodeAt(r)>=128&&k("not-basic"),b.push(t.charCodeAt(r));for(o=n>0?n+1:0;o<w;){for(i=x,a=1,h=l;o>=w&&k("invalid-input"),((f=(y=t.charCodeAt(o++))-48<10?y-22:y-65<26?y-65:y-97<26?y-97:l)>=l||f>_((s-x)/a))&&k("overflow"),x+=f*a,!(f<(g=h<=O?u:h>=O+c?c:h-O));h+=l)a>_(s/(v=l-g))&&k("overflow"),a*=v;O=P(x-i,e=b.length+1,0==i),_(x/e)>s-A&&k("overflow"),A+=_(x/e),x%=e,b.splice(x++,0,A)}return C(b)}function T(t){var e,n,r,o,i,a,h,f,g,v,y,b,w,A,O,C=[];for(b=(t=E(t)).length,e=d,n=0,i=p,a=0;a<b;++a)(y=t[a])<128&&C.push(x(y));for(r=o=C.length,o&&C.push(m);r<b;){for(h=s,a=0;a<b;++a)(y=t[a])>=e&&y<h&&(h=y);for(h-e>_((s-n)/(w=r+1))&&k("overflow"),n+=(h-e)*w,e=h,a=0;a<b;++a)if((y=t[a])<e&&++n>s&&k("overflow"),y==e){for(f=n,g=l;!(f<(v=g<=i?u:g>=i+c?c:g-i));g+=l)O=f-v,A=l-v,C.push(x(S(v+O%A,0))),f=_(O/A);C.push(x(S(f,0))),i=P(n,w,r==o),n=0,++r}++n,++e}return C.join("")}a={version:"1.4.1",ucs2:{decode:E,encode:C},decode:j,encode:T,toASCII:function(t){return O(t,(function(t){return v.test(t)?"xn--"+T(t):t}))},toUnicode:function(t){return O(t,(function(t){return g.test(t)?j(t.slice(4).toLowerCase()):t}))}},void 0===(r=function(){return a}.call(e,n,e,t))||(t.exports=r)}()},8835:function(t,e,n){"use strict";var r=n(1270);function o(){this.protocol=null,this.slashes=null,this.auth=null,this.host=null,this.port=null,this.hostname=null,this.hash=null,this.search=null,this.query=null,this.pathname=null,this.path=null,this.href=null}var i=/^([a-z0-9.+-]+:)/i,a=/:[0-9]*$/,s=/^(\/\/?(?!\/)[^?\s]*)(\?[^\s]*)?$/,l=["{","}","|","\\","^","`"].concat(["<",">",'"',"`"," ","\r","\n","\t"]),u=["'"].concat(l),c=["%","/","?",";","#"].concat(u),h=["/","?","#"],f=/^[+a-z0-9A-Z_-]{0,63}$/,p=/^([+a-z0-9A-Z_-]{0,63})(.*)$/,d={javascript:!0,"javascript:":!0},m={javascript:!0,"javascript:":!0},g={http:!0,https:!0,ftp:!0,gopher:!0,file:!0,"http:":!0,"https:":!0,"ftp:":!0,"gopher:":!0,"file:":!0},v=n(5373);function y(t,e,n){if(t&&"object"==typeof t&&t instanceof o)return t;var r=new o;return r.parse(t,e,n),r}o.prototype.parse=function(t,e,n){if("string"!=typeof t)throw new TypeError("Parameter 'url' must be a string, not "+typeof t);var o=t.indexOf("?"),a=-1!==o&&o<t.indexOf("#")?"?":"#",l=t.split(a);l[0]=l[0].replace(/\\/g,"/");var y=t=l.join(a);if(y=y.trim(),!n&&1===t.split("#").length){var b=s.exec(y);if(b)return this.path=y,this.href=y,this.pathname=b[1],b[2]?(this.search=b[2],this.query=e?v.parse(this.search.substr(1)):this.search.substr(1)):e&&(this.search="",this.query={}),this}var w=i.exec(y);if(w){var _=(w=w[0]).toLowerCase();this.protocol=_,y=y.substr(w.length)}if(n||w||y.match(/^\/\/[^@/]+@[^@/]+/)){var x="//"===y.substr(0,2);!x||w&&m[w]||(y=y.substr(2),this.slashes=!0)}if(!m[w]&&(x||w&&!g[w])){for(var k,A,O=-1,E=0;E<h.length;E++){-1!==(C=y.indexOf(h[E]))&&(-1===O||C<O)&&(O=C)}-1!==(A=-1===O?y.lastIndexOf("@"):y.lastIndexOf("@",O))&&(k=y.slice(0,A),y=y.slice(A+1),this.auth=decodeURIComponent(k)),O=-1;for(E=0;E<c.length;E++){var C;-1!==(C=y.indexOf(c[E]))&&(-1===O||C<O)&&(O=C)}-1===O&&(O=y.length),this.host=y.slice(0,O),y=y.slice(O),this.parseHost(),this.hostname=this.hostname||"";var S="["===this.hostname[0]&&"]"===this.hostname[this.hostname.length-1];if(!S)for(var P=this.hostname.split(/\./),j=(E=0,P.length);E<j;E++){var T=P[E];if(T&&!T.match(f)){for(var R="",M=0,N=T.length;M<N;M++)T.charCodeAt(M)>127?R+="x":R+=T[M];if(!R.match(f)){var D=P.slice(0,E),B=P.slice(E+1),V=T.match(p);V&&(D.push(V[1]),B.unshift(V[2])),B.length&&(y="/"+B.join(".")+y),this.hostname=D.join(".");break}}}this.hostname.length>255?this.hostname="":this.hostname=this.hostname.toLowerCase(),S||(this.hostname=r.toASCII(this.hostname));var I=this.port?":"+this.port:"",L=this.hostname||"";this.host=L+I,this.href+=this.host,S&&(this.hostname=this.hostname.substr(1,this.hostname.length-2),"/"!==y[0]&&(y="/"+y))}if(!d[_])for(E=0,j=u.length;E<j;E++){var z=u[E];if(-1!==y.indexOf(z)){var $=encodeURIComponent(z);$===z&&($=escape(z)),y=y.split(z).join($)}}var F=y.indexOf("#");-1!==F&&(this.hash=y.substr(F),y=y.slice(0,F));var U=y.indexOf("?");if(-1!==U?(this.search=y.substr(U),this.query=y.substr(U+1),e&&(this.query=v.parse(this.query)),y=y.slice(0,U)):e&&(this.search="",this.query={}),y&&(this.pathname=y),g[_]&&this.hostname&&!this.pathname&&(this.pathname="/"),this.pathname||this.search){I=this.pathname||"";var H=this.search||"";this.path=I+H}return this.href=this.format(),this},o.prototype.format=function(){var t=this.auth||"";t&&(t=(t=encodeURIComponent(t)).replace(/%3A/i,":"),t+="@");var e=this.protocol||"",n=this.pathname||"",r=this.hash||"",o=!1,i="";this.host?o=t+this.host:this.hostname&&(o=t+(-1===this.hostname.indexOf(":")?this.hostname:"["+this.hostname+"]"),this.port&&(o+=":"+this.port)),this.query&&"object"==typeof this.query&&Object.keys(this.query).length&&(i=v.stringify(this.query,{arrayFormat:"repeat",addQueryPrefix:!1}));var a=this.search||i&&"?"+i||"";return e&&":"!==e.substr(-1)&&(e+=":"),this.slashes||(!e||g[e])&&!1!==o?(o="//"+(o||""),n&&"/"!==n.charAt(0)&&(n="/"+n)):o||(o=""),r&&"#"!==r.charAt(0)&&(r="#"+r),a&&"?"!==a.charAt(0)&&(a="?"+a),e+o+(n=n.replace(/[?#]/g,(function(t){return encodeURIComponent(t)})))+(a=a.replace("#","%23"))+r},o.prototype.resolve=function(t){return this.resolveObject(y(t,!1,!0)).format()},o.prototype.resolveObject=function(t){if("string"==typeof t){var e=new o;e.parse(t,!1,!0),t=e}for(var n=new o,r=Object.keys(this),i=0;i<r.length;i++){var a=r[i];n[a]=this[a]}if(n.hash=t.hash,""===t.href)return n.href=n.format(),n;if(t.slashes&&!t.protocol){for(var s=Object.keys(t),l=0;l<s.length;l++){var u=s[l];"protocol"!==u&&(n[u]=t[u])}return g[n.protocol]&&n.hostname&&!n.pathname&&(n.pathname="/",n.path=n.pathname),n.href=n.format(),n}if(t.protocol&&t.protocol!==n.protocol){if(!g[t.protocol]){for(var c=Object.keys(t),h=0;h<c.length;h++){var f=c[h];n[f]=t[f]}return n.href=n.format(),n}if(n.protocol=t.protocol,t.host||m[t.protocol])n.pathname=t.pathname;else{for(var p=(t.pathname||"").split("/");p.length&&!(t.host=p.shift()););t.host||(t.host=""),t.hostname||(t.hostname=""),""!==p[0]&&p.unshift(""),p.length<2&&p.unshift(""),n.pathname=p.join("/")}if(n.search=t.search,n.query=t.query,n.host=t.host||"",n.auth=t.auth,n.hostname=t.hostname||t.host,n.port=t.port,n.pathname||n.search){var d=n.pathname||"",v=n.search||"";n.path=d+v}return n.slashes=n.slashes||t.slashes,n.href=n.format(),n}var y=n.pathname&&"/"===n.pathname.charAt(0),b=t.host||t.pathname&&"/"===t.pathname.charAt(0),w=b||y||n.host&&t.pathname,_=w,x=n.pathname&&n.pathname.split("/")||[],k=(p=t.pathname&&t.pathname.split("/")||[],n.protocol&&!g[n.protocol]);if(k&&(n.hostname="",n.port=null,n.host&&(""===x[0]?x[0]=n.host:x.unshift(n.host)),n.host="",t.protocol&&(t.hostname=null,t.port=null,t.host&&(""===p[0]?p[0]=t.host:p.unshift(t.host)),t.host=null),w=w&&(""===p[0]||""===x[0])),b)n.host=t.host||""===t.host?t.host:n.host,n.hostname=t.hostname||""===t.hostname?t.hostname:n.hostname,n.search=t.search,n.query=t.query,x=p;else if(p.length)x||(x=[]),x.pop(),x=x.concat(p),n.search=t.search,n.query=t.query;else if(null!=t.search){if(k)n.host=x.shift(),n.hostname=n.host,(S=!!(n.host&&n.host.indexOf("@")>0)&&n.host.split("@"))&&(n.auth=S.shift(),n.hostname=S.shift(),n.host=n.hostname);return n.search=t.search,n.query=t.query,null===n.pathname&&null===n.search||(n.path=(n.pathname?n.pathname:"")+(n.search?n.search:"")),n.href=n.format(),n}if(!x.length)return n.pathname=null,n.search?n.path="/"+n.search:n.path=null,n.href=n.format(),n;for(var A=x.slice(-1)[0],O=(n.host||t.host||x.length>1)&&("."===A||".."===A)||""===A,E=0,C=x.length;C>=0;C--)"."===(A=x[C])?x.splice(C,1):".."===A?(x.splice(C,1),E++):E&&(x.splice(C,1),E--);if(!w&&!_)for(;E--;E)x.unshift("..");!w||""===x[0]||x[0]&&"/"===x[0].charAt(0)||x.unshift(""),O&&"/"!==x.join("/").substr(-1)&&x.push("");var S,P=""===x[0]||x[0]&&"/"===x[0].charAt(0);k&&(n.hostname=P?"":x.length?x.shift():"",n.host=n.hostname,(S=!!(n.host&&n.host.indexOf("@")>0)&&n.host.split("@"))&&(n.auth=S.shift(),n.hostname=S.shift(),n.host=n.hostname));return(w=w||n.host&&x.length)&&!P&&x.unshift(""),x.length>0?n.pathname=x.join("/"):(n.pathname=null,n.path=null),null===n.pathname&&null===n.search||(n.path=(n.pathname?n.pathname:"")+(n.search?n.search:"")),n.auth=t.auth||n.auth,n.slashes=n.slashes||t.slashes,n.href=n.format(),n},o.prototype.parseHost=function(){var t=this.host,e=a.exec(t);e&&(":"!==(e=e[0])&&(this.port=e.substr(1)),t=t.substr(0,t.length-e.length)),t&&(this.hostname=t)},e.parse=y,e.resolve=function(t,e){return y(t,!1,!0).resolve(e)},e.resolveObject=function(t,e){return t?y(t,!1,!0).resolveObject(e):e},e.format=function(t){return"string"==typeof t&&(t=y(t)),t instanceof o?t.format():o.prototype.format.call(t)},e.Url=o},7951:function(t,e,n){var r={"./am":5074,"./am.json":5074,"./az":5679,"./az.json":5679,"./br":1480,"./br.json":1480,"./de":1279,"./de.json":1279,"./en":199,"./en.json":199,"./es":3488,"./es.json":3488,"./fr":8532,"./fr.json":8532,"./he":9571,"./he.json":9571,"./isv":9810,"./isv.json":9810,"./it":3229,"./it.json":3229,"./ja":6397,"./ja.json":6397,"./ka":5844,"./ka.json":5844,"./kr":7681,"./kr.json":7681,"./nl":6266,"./nl.json":6266,"./pl":8496,"./pl.json":8496,"./ru":1105,"./ru.json":1105,"./sv":5517,"./sv.json":5517,"./tr":3330,"./tr.json":3330,"./zh":650,"./zh.json":650};function o(t){var e=i(t);return n(e)}function i(t){if(!n.o(r,t)){var e=new Error("Cannot find module '"+t+"'");throw e.code="MODULE_NOT_FOUND",e}return r[t]}o.keys=function(){return Object.keys(r)},o.resolve=i,t.exports=o,o.id=7951},2634:function(){},4633:function(t,e,n){var r=n(3738).default;function o(){"use strict";t.exports=o=function(){return n},t.exports.__esModule=!0,t.exports.default=t.exports;var e,n={},i=Object.prototype,a=i.hasOwnProperty,s=Object.defineProperty||function(t,e,n){t[e]=n.value},l="function"==typeof Symbol?Symbol:{},u=l.iterator||"@@iterator",c=l.asyncIterator||"@@asyncIterator",h=l.toStringTag||"@@toStringTag";function f(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{f({},"")}catch(e){f=function(t,e,n){return t[e]=n}}function p(t,e,n,r){var o=e&&e.prototype instanceof w?e:w,i=Object.create(o.prototype),a=new M(r||[]);return s(i,"_invoke",{value:P(t,n,a)}),i}function d(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}n.wrap=p;var m="suspendedStart",g="suspendedYield",v="executing",y="completed",b={};function w(){}function _(){}function x(){}var k={};f(k,u,(function(){return this}));var A=Object.getPrototypeOf,O=A&&A(A(N([])));O&&O!==i&&a.call(O,u)&&(k=O);var E=x.prototype=w.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){f(t,e,(function(t){return this._invoke(e,t)}))}))}function S(t,e){function n(o,i,s,l){var u=d(t[o],t,i);if("throw"!==u.type){var c=u.arg,h=c.value;return h&&"object"==r(h)&&a.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,s,l)}),(function(t){n("throw",t,s,l)})):e.resolve(h).then((function(t){c.value=t,s(c)}),(function(t){return n("throw",t,s,l)}))}l(u.arg)}var o;s(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function P(t,n,r){var o=m;return function(i,a){if(o===v)throw Error("Generator is already running");if(o===y){if("throw"===i)throw a;return{value:e,done:!0}}for(r.method=i,r.arg=a;;){var s=r.delegate;if(s){var l=j(s,r);if(l){if(l===b)continue;return l}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===m)throw o=y,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=v;var u=d(t,n,r);if("normal"===u.type){if(o=r.done?y:g,u.arg===b)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(o=y,r.method="throw",r.arg=u.arg)}}}function j(t,n){var r=n.method,o=t.iterator[r];if(o===e)return n.delegate=null,"throw"===r&&t.iterator.return&&(n.method="return",n.arg=e,j(t,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),b;var i=d(o,t.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,b;var a=i.arg;return a?a.done?(n[t.resultName]=a.value,n.next=t.nextLoc,"return"!==n.method&&(n.method="next",n.arg=e),n.delegate=null,b):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,b)}function T(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function R(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function M(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(T,this),this.reset(!0)}function N(t){if(t||""===t){var n=t[u];if(n)return n.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var o=-1,i=function n(){for(;++o<t.length;)if(a.call(t,o))return n.value=t[o],n.done=!1,n;return n.value=e,n.done=!0,n};return i.next=i}}throw new TypeError(r(t)+" is not iterable")}return _.prototype=x,s(E,"constructor",{value:x,configurable:!0}),s(x,"constructor",{value:_,configurable:!0}),_.displayName=f(x,h,"GeneratorFunction"),n.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},n.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,x):(t.__proto__=x,f(t,h,"GeneratorFunction")),t.prototype=Object.create(E),t},n.awrap=function(t){return{__await:t}},C(S.prototype),f(S.prototype,c,(function(){return this})),n.AsyncIterator=S,n.async=function(t,e,r,o,i){void 0===i&&(i=Promise);var a=new S(p(t,e,r,o),i);return n.isGeneratorFunction(e)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),f(E,h,"Generator"),f(E,u,(function(){return this})),f(E,"toString",(function(){return"[object Generator]"})),n.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},n.values=N,M.prototype={constructor:M,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(R),!t)for(var n in this)"t"===n.charAt(0)&&a.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=e)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(t){if(this.done)throw t;var n=this;function r(r,o){return s.type="throw",s.arg=t,n.next=r,o&&(n.method="next",n.arg=e),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var i=this.tryEntries[o],s=i.completion;if("root"===i.tryLoc)return r("end");if(i.tryLoc<=this.prev){var l=a.call(i,"catchLoc"),u=a.call(i,"finallyLoc");if(l&&u){if(this.prev<i.catchLoc)return r(i.catchLoc,!0);if(this.prev<i.finallyLoc)return r(i.finallyLoc)}else if(l){if(this.prev<i.catchLoc)return r(i.catchLoc,!0)}else{if(!u)throw Error("try statement without catch or finally");if(this.prev<i.finallyLoc)return r(i.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&a.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var i=o?o.completion:{};return i.type=t,i.arg=e,o?(this.method="next",this.next=o.finallyLoc,b):this.complete(i)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),b},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),R(n),b}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;R(n)}return o}}throw Error("illegal catch attempt")},delegateYield:function(t,n,r){return this.delegate={iterator:N(t),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=e),b}},n}t.exports=o,t.exports.__esModule=!0,t.exports.default=t.exports},3738:function(t){function e(n){return t.exports=e="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},t.exports.__esModule=!0,t.exports.default=t.exports,e(n)}t.exports=e,t.exports.__esModule=!0,t.exports.default=t.exports},4756:function(t,e,n){var r=n(4633)();t.exports=r;try{regeneratorRuntime=r}catch(t){"object"==typeof globalThis?globalThis.regeneratorRuntime=r:Function("r","regeneratorRuntime = r")(r)}},793:function(t,e,n){"use strict";function r(t,e,n,r,o){var i={};return Object.keys(r).forEach((function(t){i[t]=r[t]})),i.enumerable=!!i.enumerable,i.configurable=!!i.configurable,("value"in i||i.initializer)&&(i.writable=!0),i=n.slice().reverse().reduce((function(n,r){return r(t,e,n)||n}),i),o&&void 0!==i.initializer&&(i.value=i.initializer?i.initializer.call(o):void 0,i.initializer=void 0),void 0===i.initializer&&(Object.defineProperty(t,e,i),i=null),i}n.d(e,{A:function(){return r}})},3029:function(t,e,n){"use strict";function r(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}n.d(e,{A:function(){return r}})},2901:function(t,e,n){"use strict";n.d(e,{A:function(){return i}});var r=n(816);function o(t,e){for(var n=0;n<e.length;n++){var o=e[n];o.enumerable=o.enumerable||!1,o.configurable=!0,"value"in o&&(o.writable=!0),Object.defineProperty(t,(0,r.A)(o.key),o)}}function i(t,e,n){return e&&o(t.prototype,e),n&&o(t,n),Object.defineProperty(t,"prototype",{writable:!1}),t}},4467:function(t,e,n){"use strict";n.d(e,{A:function(){return o}});var r=n(816);function o(t,e,n){return(e=(0,r.A)(e))in t?Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}):t[e]=n,t}},991:function(t,e,n){"use strict";n.d(e,{A:function(){return o}});var r=n(3954);function o(){return o="undefined"!=typeof Reflect&&Reflect.get?Reflect.get.bind():function(t,e,n){var o=function(t,e){for(;!Object.prototype.hasOwnProperty.call(t,e)&&null!==(t=(0,r.A)(t)););return t}(t,e);if(o){var i=Object.getOwnPropertyDescriptor(o,e);return i.get?i.get.call(arguments.length<3?t:n):i.value}},o.apply(this,arguments)}},3954:function(t,e,n){"use strict";function r(t){return r=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},r(t)}n.d(e,{A:function(){return r}})},5361:function(t,e,n){"use strict";function r(t,e){return r=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},r(t,e)}function o(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&r(t,e)}n.d(e,{A:function(){return o}})},388:function(t,e,n){"use strict";n.d(e,{A:function(){return o}});var r=n(2284);function o(t,e){if(e&&("object"===(0,r.A)(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}},816:function(t,e,n){"use strict";n.d(e,{A:function(){return o}});var r=n(2284);function o(t){var e=function(t,e){if("object"!=(0,r.A)(t)||!t)return t;var n=t[Symbol.toPrimitive];if(void 0!==n){var o=n.call(t,e||"default");if("object"!=(0,r.A)(o))return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===e?String:Number)(t)}(t,"string");return"symbol"==(0,r.A)(e)?e:e+""}},2284:function(t,e,n){"use strict";function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}n.d(e,{A:function(){return r}})},4523:function(t,e,n){"use strict";n.r(e),n.d(e,{VERSION:function(){return o},after:function(){return Ne},all:function(){return tn},allKeys:function(){return gt},any:function(){return en},assign:function(){return Nt},before:function(){return De},bind:function(){return xe},bindAll:function(){return Oe},chain:function(){return ye},chunk:function(){return In},clone:function(){return It},collect:function(){return Ke},compact:function(){return Cn},compose:function(){return Me},constant:function(){return Z},contains:function(){return nn},countBy:function(){return vn},create:function(){return Vt},debounce:function(){return je},default:function(){return Un},defaults:function(){return Dt},defer:function(){return Se},delay:function(){return Ce},detect:function(){return qe},difference:function(){return Pn},drop:function(){return On},each:function(){return Ge},escape:function(){return ae},every:function(){return tn},extend:function(){return Mt},extendOwn:function(){return Nt},filter:function(){return Ze},find:function(){return qe},findIndex:function(){return Le},findKey:function(){return Ve},findLastIndex:function(){return ze},findWhere:function(){return We},first:function(){return An},flatten:function(){return Sn},foldl:function(){return Ye},foldr:function(){return Je},forEach:function(){return Ge},functions:function(){return Tt},get:function(){return Ut},groupBy:function(){return mn},has:function(){return Ht},head:function(){return An},identity:function(){return qt},include:function(){return nn},includes:function(){return nn},indexBy:function(){return gn},indexOf:function(){return Ue},initial:function(){return kn},inject:function(){return Ye},intersection:function(){return Mn},invert:function(){return jt},invoke:function(){return rn},isArguments:function(){return X},isArray:function(){return W},isArrayBuffer:function(){return V},isBoolean:function(){return S},isDataView:function(){return q},isDate:function(){return M},isElement:function(){return P},isEmpty:function(){return lt},isEqual:function(){return mt},isError:function(){return D},isFinite:function(){return Y},isFunction:function(){return z},isMap:function(){return At},isMatch:function(){return ut},isNaN:function(){return J},isNull:function(){return E},isNumber:function(){return R},isObject:function(){return O},isRegExp:function(){return N},isSet:function(){return Et},isString:function(){return T},isSymbol:function(){return B},isTypedArray:function(){return ot},isUndefined:function(){return C},isWeakMap:function(){return Ot},isWeakSet:function(){return Ct},iteratee:function(){return Yt},keys:function(){return st},last:function(){return En},lastIndexOf:function(){return He},map:function(){return Ke},mapObject:function(){return Zt},matcher:function(){return Wt},matches:function(){return Wt},max:function(){return sn},memoize:function(){return Ee},methods:function(){return Tt},min:function(){return ln},mixin:function(){return zn},negate:function(){return Re},noop:function(){return Qt},now:function(){return re},object:function(){return Bn},omit:function(){return xn},once:function(){return Be},pairs:function(){return Pt},partial:function(){return _e},partition:function(){return yn},pick:function(){return _n},pluck:function(){return on},property:function(){return Gt},propertyOf:function(){return te},random:function(){return ne},range:function(){return Vn},reduce:function(){return Ye},reduceRight:function(){return Je},reject:function(){return Qe},rest:function(){return On},restArguments:function(){return A},result:function(){return me},sample:function(){return hn},select:function(){return Ze},shuffle:function(){return fn},size:function(){return bn},some:function(){return en},sortBy:function(){return pn},sortedIndex:function(){return $e},tail:function(){return On},take:function(){return An},tap:function(){return Lt},template:function(){return de},templateSettings:function(){return le},throttle:function(){return Pe},times:function(){return ee},toArray:function(){return cn},toPath:function(){return zt},transpose:function(){return Nn},unescape:function(){return se},union:function(){return Rn},uniq:function(){return Tn},unique:function(){return Tn},uniqueId:function(){return ve},unzip:function(){return Nn},values:function(){return St},where:function(){return an},without:function(){return jn},wrap:function(){return Te},zip:function(){return Dn}});var r={};n.r(r),n.d(r,{VERSION:function(){return o},after:function(){return Ne},all:function(){return tn},allKeys:function(){return gt},any:function(){return en},assign:function(){return Nt},before:function(){return De},bind:function(){return xe},bindAll:function(){return Oe},chain:function(){return ye},chunk:function(){return In},clone:function(){return It},collect:function(){return Ke},compact:function(){return Cn},compose:function(){return Me},constant:function(){return Z},contains:function(){return nn},countBy:function(){return vn},create:function(){return Vt},debounce:function(){return je},default:function(){return $n},defaults:function(){return Dt},defer:function(){return Se},delay:function(){return Ce},detect:function(){return qe},difference:function(){return Pn},drop:function(){return On},each:function(){return Ge},escape:function(){return ae},every:function(){return tn},extend:function(){return Mt},extendOwn:function(){return Nt},filter:function(){return Ze},find:function(){return qe},findIndex:function(){return Le},findKey:function(){return Ve},findLastIndex:function(){return ze},findWhere:function(){return We},first:function(){return An},flatten:function(){return Sn},foldl:function(){return Ye},foldr:function(){return Je},forEach:function(){return Ge},functions:function(){return Tt},get:function(){return Ut},groupBy:function(){return mn},has:function(){return Ht},head:function(){return An},identity:function(){return qt},include:function(){return nn},includes:function(){return nn},indexBy:function(){return gn},indexOf:function(){return Ue},initial:function(){return kn},inject:function(){return Ye},intersection:function(){return Mn},invert:function(){return jt},invoke:function(){return rn},isArguments:function(){return X},isArray:function(){return W},isArrayBuffer:function(){return V},isBoolean:function(){return S},isDataView:function(){return q},isDate:function(){return M},isElement:function(){return P},isEmpty:function(){return lt},isEqual:function(){return mt},isError:function(){return D},isFinite:function(){return Y},isFunction:function(){return z},isMap:function(){return At},isMatch:function(){return ut},isNaN:function(){return J},isNull:function(){return E},isNumber:function(){return R},isObject:function(){return O},isRegExp:function(){return N},isSet:function(){return Et},isString:function(){return T},isSymbol:function(){return B},isTypedArray:function(){return ot},isUndefined:function(){return C},isWeakMap:function(){return Ot},isWeakSet:function(){return Ct},iteratee:function(){return Yt},keys:function(){return st},last:function(){return En},lastIndexOf:function(){return He},map:function(){return Ke},mapObject:function(){return Zt},matcher:function(){return Wt},matches:function(){return Wt},max:function(){return sn},memoize:function(){return Ee},methods:function(){return Tt},min:function(){return ln},mixin:function(){return zn},negate:function(){return Re},noop:function(){return Qt},now:function(){return re},object:function(){return Bn},omit:function(){return xn},once:function(){return Be},pairs:function(){return Pt},partial:function(){return _e},partition:function(){return yn},pick:function(){return _n},pluck:function(){return on},property:function(){return Gt},propertyOf:function(){return te},random:function(){return ne},range:function(){return Vn},reduce:function(){return Ye},reduceRight:function(){return Je},reject:function(){return Qe},rest:function(){return On},restArguments:function(){return A},result:function(){return me},sample:function(){return hn},select:function(){return Ze},shuffle:function(){return fn},size:function(){return bn},some:function(){return en},sortBy:function(){return pn},sortedIndex:function(){return $e},tail:function(){return On},take:function(){return An},tap:function(){return Lt},template:function(){return de},templateSettings:function(){return le},throttle:function(){return Pe},times:function(){return ee},toArray:function(){return cn},toPath:function(){return zt},transpose:function(){return Nn},unescape:function(){return se},union:function(){return Rn},uniq:function(){return Tn},unique:function(){return Tn},uniqueId:function(){return ve},unzip:function(){return Nn},values:function(){return St},where:function(){return an},without:function(){return jn},wrap:function(){return Te},zip:function(){return Dn}});var o="1.13.6",i="object"==typeof self&&self.self===self&&self||"object"==typeof global&&global.global===global&&global||Function("return this")()||{},a=Array.prototype,s=Object.prototype,l="undefined"!=typeof Symbol?Symbol.prototype:null,u=a.push,c=a.slice,h=s.toString,f=s.hasOwnProperty,p="undefined"!=typeof ArrayBuffer,d="undefined"!=typeof DataView,m=Array.isArray,g=Object.keys,v=Object.create,y=p&&ArrayBuffer.isView,b=isNaN,w=isFinite,_=!{toString:null}.propertyIsEnumerable("toString"),x=["valueOf","isPrototypeOf","toString","propertyIsEnumerable","hasOwnProperty","toLocaleString"],k=Math.pow(2,53)-1;function A(t,e){return e=null==e?t.length-1:+e,function(){for(var n=Math.max(arguments.length-e,0),r=Array(n),o=0;o<n;o++)r[o]=arguments[o+e];switch(e){case 0:return t.call(this,r);case 1:return t.call(this,arguments[0],r);case 2:return t.call(this,arguments[0],arguments[1],r)}var i=Array(e+1);for(o=0;o<e;o++)i[o]=arguments[o];return i[e]=r,t.apply(this,i)}}function O(t){var e=typeof t;return"function"===e||"object"===e&&!!t}function E(t){return null===t}function C(t){return void 0===t}function S(t){return!0===t||!1===t||"[object Boolean]"===h.call(t)}function P(t){return!(!t||1!==t.nodeType)}function j(t){var e="[object "+t+"]";return function(t){return h.call(t)===e}}var T=j("String"),R=j("Number"),M=j("Date"),N=j("RegExp"),D=j("Error"),B=j("Symbol"),V=j("ArrayBuffer"),I=j("Function"),L=i.document&&i.document.childNodes;"object"!=typeof Int8Array&&"function"!=typeof L&&(I=function(t){return"function"==typeof t||!1});var z=I,$=j("Object"),F=d&&$(new DataView(new ArrayBuffer(8))),U="undefined"!=typeof Map&&$(new Map),H=j("DataView");var q=F?function(t){return null!=t&&z(t.getInt8)&&V(t.buffer)}:H,W=m||j("Array");function G(t,e){return null!=t&&f.call(t,e)}var K=j("Arguments");!function(){K(arguments)||(K=function(t){return G(t,"callee")})}();var X=K;function Y(t){return!B(t)&&w(t)&&!isNaN(parseFloat(t))}function J(t){return R(t)&&b(t)}function Z(t){return function(){return t}}function Q(t){return function(e){var n=t(e);return"number"==typeof n&&n>=0&&n<=k}}function tt(t){return function(e){return null==e?void 0:e[t]}}var et=tt("byteLength"),nt=Q(et),rt=/\[object ((I|Ui)nt(8|16|32)|Float(32|64)|Uint8Clamped|Big(I|Ui)nt64)Array\]/;var ot=p?function(t){return y?y(t)&&!q(t):nt(t)&&rt.test(h.call(t))}:Z(!1),it=tt("length");function at(t,e){e=function(t){for(var e={},n=t.length,r=0;r<n;++r)e[t[r]]=!0;return{contains:function(t){return!0===e[t]},push:function(n){return e[n]=!0,t.push(n)}}}(e);var n=x.length,r=t.constructor,o=z(r)&&r.prototype||s,i="constructor";for(G(t,i)&&!e.contains(i)&&e.push(i);n--;)(i=x[n])in t&&t[i]!==o[i]&&!e.contains(i)&&e.push(i)}function st(t){if(!O(t))return[];if(g)return g(t);var e=[];for(var n in t)G(t,n)&&e.push(n);return _&&at(t,e),e}function lt(t){if(null==t)return!0;var e=it(t);return"number"==typeof e&&(W(t)||T(t)||X(t))?0===e:0===it(st(t))}function ut(t,e){var n=st(e),r=n.length;if(null==t)return!r;for(var o=Object(t),i=0;i<r;i++){var a=n[i];if(e[a]!==o[a]||!(a in o))return!1}return!0}function ct(t){return t instanceof ct?t:this instanceof ct?void(this._wrapped=t):new ct(t)}function ht(t){return new Uint8Array(t.buffer||t,t.byteOffset||0,et(t))}ct.VERSION=o,ct.prototype.value=function(){return this._wrapped},ct.prototype.valueOf=ct.prototype.toJSON=ct.prototype.value,ct.prototype.toString=function(){return String(this._wrapped)};var ft="[object DataView]";function pt(t,e,n,r){if(t===e)return 0!==t||1/t==1/e;if(null==t||null==e)return!1;if(t!=t)return e!=e;var o=typeof t;return("function"===o||"object"===o||"object"==typeof e)&&dt(t,e,n,r)}function dt(t,e,n,r){t instanceof ct&&(t=t._wrapped),e instanceof ct&&(e=e._wrapped);var o=h.call(t);if(o!==h.call(e))return!1;if(F&&"[object Object]"==o&&q(t)){if(!q(e))return!1;o=ft}switch(o){case"[object RegExp]":case"[object String]":return""+t==""+e;case"[object Number]":return+t!=+t?+e!=+e:0==+t?1/+t==1/e:+t==+e;case"[object Date]":case"[object Boolean]":return+t==+e;case"[object Symbol]":return l.valueOf.call(t)===l.valueOf.call(e);case"[object ArrayBuffer]":case ft:return dt(ht(t),ht(e),n,r)}var i="[object Array]"===o;if(!i&&ot(t)){if(et(t)!==et(e))return!1;if(t.buffer===e.buffer&&t.byteOffset===e.byteOffset)return!0;i=!0}if(!i){if("object"!=typeof t||"object"!=typeof e)return!1;var a=t.constructor,s=e.constructor;if(a!==s&&!(z(a)&&a instanceof a&&z(s)&&s instanceof s)&&"constructor"in t&&"constructor"in e)return!1}r=r||[];for(var u=(n=n||[]).length;u--;)if(n[u]===t)return r[u]===e;if(n.push(t),r.push(e),i){if((u=t.length)!==e.length)return!1;for(;u--;)if(!pt(t[u],e[u],n,r))return!1}else{var c,f=st(t);if(u=f.length,st(e).length!==u)return!1;for(;u--;)if(!G(e,c=f[u])||!pt(t[c],e[c],n,r))return!1}return n.pop(),r.pop(),!0}function mt(t,e){return pt(t,e)}function gt(t){if(!O(t))return[];var e=[];for(var n in t)e.push(n);return _&&at(t,e),e}function vt(t){var e=it(t);return function(n){if(null==n)return!1;var r=gt(n);if(it(r))return!1;for(var o=0;o<e;o++)if(!z(n[t[o]]))return!1;return t!==xt||!z(n[yt])}}var yt="forEach",bt=["clear","delete"],wt=["get","has","set"],_t=bt.concat(yt,wt),xt=bt.concat(wt),kt=["add"].concat(bt,yt,"has"),At=U?vt(_t):j("Map"),Ot=U?vt(xt):j("WeakMap"),Et=U?vt(kt):j("Set"),Ct=j("WeakSet");function St(t){for(var e=st(t),n=e.length,r=Array(n),o=0;o<n;o++)r[o]=t[e[o]];return r}function Pt(t){for(var e=st(t),n=e.length,r=Array(n),o=0;o<n;o++)r[o]=[e[o],t[e[o]]];return r}function jt(t){for(var e={},n=st(t),r=0,o=n.length;r<o;r++)e[t[n[r]]]=n[r];return e}function Tt(t){var e=[];for(var n in t)z(t[n])&&e.push(n);return e.sort()}function Rt(t,e){return function(n){var r=arguments.length;if(e&&(n=Object(n)),r<2||null==n)return n;for(var o=1;o<r;o++)for(var i=arguments[o],a=t(i),s=a.length,l=0;l<s;l++){var u=a[l];e&&void 0!==n[u]||(n[u]=i[u])}return n}}var Mt=Rt(gt),Nt=Rt(st),Dt=Rt(gt,!0);function Bt(t){if(!O(t))return{};if(v)return v(t);var e=function(){};e.prototype=t;var n=new e;return e.prototype=null,n}function Vt(t,e){var n=Bt(t);return e&&Nt(n,e),n}function It(t){return O(t)?W(t)?t.slice():Mt({},t):t}function Lt(t,e){return e(t),t}function zt(t){return W(t)?t:[t]}function $t(t){return ct.toPath(t)}function Ft(t,e){for(var n=e.length,r=0;r<n;r++){if(null==t)return;t=t[e[r]]}return n?t:void 0}function Ut(t,e,n){var r=Ft(t,$t(e));return C(r)?n:r}function Ht(t,e){for(var n=(e=$t(e)).length,r=0;r<n;r++){var o=e[r];if(!G(t,o))return!1;t=t[o]}return!!n}function qt(t){return t}function Wt(t){return t=Nt({},t),function(e){return ut(e,t)}}function Gt(t){return t=$t(t),function(e){return Ft(e,t)}}function Kt(t,e,n){if(void 0===e)return t;switch(null==n?3:n){case 1:return function(n){return t.call(e,n)};case 3:return function(n,r,o){return t.call(e,n,r,o)};case 4:return function(n,r,o,i){return t.call(e,n,r,o,i)}}return function(){return t.apply(e,arguments)}}function Xt(t,e,n){return null==t?qt:z(t)?Kt(t,e,n):O(t)&&!W(t)?Wt(t):Gt(t)}function Yt(t,e){return Xt(t,e,1/0)}function Jt(t,e,n){return ct.iteratee!==Yt?ct.iteratee(t,e):Xt(t,e,n)}function Zt(t,e,n){e=Jt(e,n);for(var r=st(t),o=r.length,i={},a=0;a<o;a++){var s=r[a];i[s]=e(t[s],s,t)}return i}function Qt(){}function te(t){return null==t?Qt:function(e){return Ut(t,e)}}function ee(t,e,n){var r=Array(Math.max(0,t));e=Kt(e,n,1);for(var o=0;o<t;o++)r[o]=e(o);return r}function ne(t,e){return null==e&&(e=t,t=0),t+Math.floor(Math.random()*(e-t+1))}ct.toPath=zt,ct.iteratee=Yt;var re=Date.now||function(){return(new Date).getTime()};function oe(t){var e=function(e){return t[e]},n="(?:"+st(t).join("|")+")",r=RegExp(n),o=RegExp(n,"g");return function(t){return t=null==t?"":""+t,r.test(t)?t.replace(o,e):t}}var ie={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#x27;","`":"&#x60;"},ae=oe(ie),se=oe(jt(ie)),le=ct.templateSettings={evaluate:/<%([\s\S]+?)%>/g,interpolate:/<%=([\s\S]+?)%>/g,escape:/<%-([\s\S]+?)%>/g},ue=/(.)^/,ce={"'":"'","\\":"\\","\r":"r","\n":"n","\u2028":"u2028","\u2029":"u2029"},he=/\\|'|\r|\n|\u2028|\u2029/g;function fe(t){return"\\"+ce[t]}var pe=/^\s*(\w|\$)+\s*$/;function de(t,e,n){!e&&n&&(e=n),e=Dt({},e,ct.templateSettings);var r=RegExp([(e.escape||ue).source,(e.interpolate||ue).source,(e.evaluate||ue).source].join("|")+"|$","g"),o=0,i="__p+='";t.replace(r,(function(e,n,r,a,s){return i+=t.slice(o,s).replace(he,fe),o=s+e.length,n?i+="'+\n((__t=("+n+"))==null?'':_.escape(__t))+\n'":r?i+="'+\n((__t=("+r+"))==null?'':__t)+\n'":a&&(i+="';\n"+a+"\n__p+='"),e})),i+="';\n";var a,s=e.variable;if(s){if(!pe.test(s))throw new Error("variable is not a bare identifier: "+s)}else i="with(obj||{}){\n"+i+"}\n",s="obj";i="var __t,__p='',__j=Array.prototype.join,print=function(){__p+=__j.call(arguments,'');};\n"+i+"return __p;\n";try{a=new Function(s,"_",i)}catch(t){throw t.source=i,t}var l=function(t){return a.call(this,t,ct)};return l.source="function("+s+"){\n"+i+"}",l}function me(t,e,n){var r=(e=$t(e)).length;if(!r)return z(n)?n.call(t):n;for(var o=0;o<r;o++){var i=null==t?void 0:t[e[o]];void 0===i&&(i=n,o=r),t=z(i)?i.call(t):i}return t}var ge=0;function ve(t){var e=++ge+"";return t?t+e:e}function ye(t){var e=ct(t);return e._chain=!0,e}function be(t,e,n,r,o){if(!(r instanceof e))return t.apply(n,o);var i=Bt(t.prototype),a=t.apply(i,o);return O(a)?a:i}var we=A((function(t,e){var n=we.placeholder,r=function(){for(var o=0,i=e.length,a=Array(i),s=0;s<i;s++)a[s]=e[s]===n?arguments[o++]:e[s];for(;o<arguments.length;)a.push(arguments[o++]);return be(t,r,this,this,a)};return r}));we.placeholder=ct;var _e=we,xe=A((function(t,e,n){if(!z(t))throw new TypeError("Bind must be called on a function");var r=A((function(o){return be(t,r,e,this,n.concat(o))}));return r})),ke=Q(it);function Ae(t,e,n,r){if(r=r||[],e||0===e){if(e<=0)return r.concat(t)}else e=1/0;for(var o=r.length,i=0,a=it(t);i<a;i++){var s=t[i];if(ke(s)&&(W(s)||X(s)))if(e>1)Ae(s,e-1,n,r),o=r.length;else for(var l=0,u=s.length;l<u;)r[o++]=s[l++];else n||(r[o++]=s)}return r}var Oe=A((function(t,e){var n=(e=Ae(e,!1,!1)).length;if(n<1)throw new Error("bindAll must be passed function names");for(;n--;){var r=e[n];t[r]=xe(t[r],t)}return t}));function Ee(t,e){var n=function(r){var o=n.cache,i=""+(e?e.apply(this,arguments):r);return G(o,i)||(o[i]=t.apply(this,arguments)),o[i]};return n.cache={},n}var Ce=A((function(t,e,n){return setTimeout((function(){return t.apply(null,n)}),e)})),Se=_e(Ce,ct,1);function Pe(t,e,n){var r,o,i,a,s=0;n||(n={});var l=function(){s=!1===n.leading?0:re(),r=null,a=t.apply(o,i),r||(o=i=null)},u=function(){var u=re();s||!1!==n.leading||(s=u);var c=e-(u-s);return o=this,i=arguments,c<=0||c>e?(r&&(clearTimeout(r),r=null),s=u,a=t.apply(o,i),r||(o=i=null)):r||!1===n.trailing||(r=setTimeout(l,c)),a};return u.cancel=function(){clearTimeout(r),s=0,r=o=i=null},u}function je(t,e,n){var r,o,i,a,s,l=function(){var u=re()-o;e>u?r=setTimeout(l,e-u):(r=null,n||(a=t.apply(s,i)),r||(i=s=null))},u=A((function(u){return s=this,i=u,o=re(),r||(r=setTimeout(l,e),n&&(a=t.apply(s,i))),a}));return u.cancel=function(){clearTimeout(r),r=i=s=null},u}function Te(t,e){return _e(e,t)}function Re(t){return function(){return!t.apply(this,arguments)}}function Me(){var t=arguments,e=t.length-1;return function(){for(var n=e,r=t[e].apply(this,arguments);n--;)r=t[n].call(this,r);return r}}function Ne(t,e){return function(){if(--t<1)return e.apply(this,arguments)}}function De(t,e){var n;return function(){return--t>0&&(n=e.apply(this,arguments)),t<=1&&(e=null),n}}var Be=_e(De,2);function Ve(t,e,n){e=Jt(e,n);for(var r,o=st(t),i=0,a=o.length;i<a;i++)if(e(t[r=o[i]],r,t))return r}function Ie(t){return function(e,n,r){n=Jt(n,r);for(var o=it(e),i=t>0?0:o-1;i>=0&&i<o;i+=t)if(n(e[i],i,e))return i;return-1}}var Le=Ie(1),ze=Ie(-1);function $e(t,e,n,r){for(var o=(n=Jt(n,r,1))(e),i=0,a=it(t);i<a;){var s=Math.floor((i+a)/2);n(t[s])<o?i=s+1:a=s}return i}function Fe(t,e,n){return function(r,o,i){var a=0,s=it(r);if("number"==typeof i)t>0?a=i>=0?i:Math.max(i+s,a):s=i>=0?Math.min(i+1,s):i+s+1;else if(n&&i&&s)return r[i=n(r,o)]===o?i:-1;if(o!=o)return(i=e(c.call(r,a,s),J))>=0?i+a:-1;for(i=t>0?a:s-1;i>=0&&i<s;i+=t)if(r[i]===o)return i;return-1}}var Ue=Fe(1,Le,$e),He=Fe(-1,ze);function qe(t,e,n){var r=(ke(t)?Le:Ve)(t,e,n);if(void 0!==r&&-1!==r)return t[r]}function We(t,e){return qe(t,Wt(e))}function Ge(t,e,n){var r,o;if(e=Kt(e,n),ke(t))for(r=0,o=t.length;r<o;r++)e(t[r],r,t);else{var i=st(t);for(r=0,o=i.length;r<o;r++)e(t[i[r]],i[r],t)}return t}function Ke(t,e,n){e=Jt(e,n);for(var r=!ke(t)&&st(t),o=(r||t).length,i=Array(o),a=0;a<o;a++){var s=r?r[a]:a;i[a]=e(t[s],s,t)}return i}function Xe(t){return function(e,n,r,o){var i=arguments.length>=3;return function(e,n,r,o){var i=!ke(e)&&st(e),a=(i||e).length,s=t>0?0:a-1;for(o||(r=e[i?i[s]:s],s+=t);s>=0&&s<a;s+=t){var l=i?i[s]:s;r=n(r,e[l],l,e)}return r}(e,Kt(n,o,4),r,i)}}var Ye=Xe(1),Je=Xe(-1);function Ze(t,e,n){var r=[];return e=Jt(e,n),Ge(t,(function(t,n,o){e(t,n,o)&&r.push(t)})),r}function Qe(t,e,n){return Ze(t,Re(Jt(e)),n)}function tn(t,e,n){e=Jt(e,n);for(var r=!ke(t)&&st(t),o=(r||t).length,i=0;i<o;i++){var a=r?r[i]:i;if(!e(t[a],a,t))return!1}return!0}function en(t,e,n){e=Jt(e,n);for(var r=!ke(t)&&st(t),o=(r||t).length,i=0;i<o;i++){var a=r?r[i]:i;if(e(t[a],a,t))return!0}return!1}function nn(t,e,n,r){return ke(t)||(t=St(t)),("number"!=typeof n||r)&&(n=0),Ue(t,e,n)>=0}var rn=A((function(t,e,n){var r,o;return z(e)?o=e:(e=$t(e),r=e.slice(0,-1),e=e[e.length-1]),Ke(t,(function(t){var i=o;if(!i){if(r&&r.length&&(t=Ft(t,r)),null==t)return;i=t[e]}return null==i?i:i.apply(t,n)}))}));function on(t,e){return Ke(t,Gt(e))}function an(t,e){return Ze(t,Wt(e))}function sn(t,e,n){var r,o,i=-1/0,a=-1/0;if(null==e||"number"==typeof e&&"object"!=typeof t[0]&&null!=t)for(var s=0,l=(t=ke(t)?t:St(t)).length;s<l;s++)null!=(r=t[s])&&r>i&&(i=r);else e=Jt(e,n),Ge(t,(function(t,n,r){((o=e(t,n,r))>a||o===-1/0&&i===-1/0)&&(i=t,a=o)}));return i}function ln(t,e,n){var r,o,i=1/0,a=1/0;if(null==e||"number"==typeof e&&"object"!=typeof t[0]&&null!=t)for(var s=0,l=(t=ke(t)?t:St(t)).length;s<l;s++)null!=(r=t[s])&&r<i&&(i=r);else e=Jt(e,n),Ge(t,(function(t,n,r){((o=e(t,n,r))<a||o===1/0&&i===1/0)&&(i=t,a=o)}));return i}var un=/[^\ud800-\udfff]|[\ud800-\udbff][\udc00-\udfff]|[\ud800-\udfff]/g;function cn(t){return t?W(t)?c.call(t):T(t)?t.match(un):ke(t)?Ke(t,qt):St(t):[]}function hn(t,e,n){if(null==e||n)return ke(t)||(t=St(t)),t[ne(t.length-1)];var r=cn(t),o=it(r);e=Math.max(Math.min(e,o),0);for(var i=o-1,a=0;a<e;a++){var s=ne(a,i),l=r[a];r[a]=r[s],r[s]=l}return r.slice(0,e)}function fn(t){return hn(t,1/0)}function pn(t,e,n){var r=0;return e=Jt(e,n),on(Ke(t,(function(t,n,o){return{value:t,index:r++,criteria:e(t,n,o)}})).sort((function(t,e){var n=t.criteria,r=e.criteria;if(n!==r){if(n>r||void 0===n)return 1;if(n<r||void 0===r)return-1}return t.index-e.index})),"value")}function dn(t,e){return function(n,r,o){var i=e?[[],[]]:{};return r=Jt(r,o),Ge(n,(function(e,o){var a=r(e,o,n);t(i,e,a)})),i}}var mn=dn((function(t,e,n){G(t,n)?t[n].push(e):t[n]=[e]})),gn=dn((function(t,e,n){t[n]=e})),vn=dn((function(t,e,n){G(t,n)?t[n]++:t[n]=1})),yn=dn((function(t,e,n){t[n?0:1].push(e)}),!0);function bn(t){return null==t?0:ke(t)?t.length:st(t).length}function wn(t,e,n){return e in n}var _n=A((function(t,e){var n={},r=e[0];if(null==t)return n;z(r)?(e.length>1&&(r=Kt(r,e[1])),e=gt(t)):(r=wn,e=Ae(e,!1,!1),t=Object(t));for(var o=0,i=e.length;o<i;o++){var a=e[o],s=t[a];r(s,a,t)&&(n[a]=s)}return n})),xn=A((function(t,e){var n,r=e[0];return z(r)?(r=Re(r),e.length>1&&(n=e[1])):(e=Ke(Ae(e,!1,!1),String),r=function(t,n){return!nn(e,n)}),_n(t,r,n)}));function kn(t,e,n){return c.call(t,0,Math.max(0,t.length-(null==e||n?1:e)))}function An(t,e,n){return null==t||t.length<1?null==e||n?void 0:[]:null==e||n?t[0]:kn(t,t.length-e)}function On(t,e,n){return c.call(t,null==e||n?1:e)}function En(t,e,n){return null==t||t.length<1?null==e||n?void 0:[]:null==e||n?t[t.length-1]:On(t,Math.max(0,t.length-e))}function Cn(t){return Ze(t,Boolean)}function Sn(t,e){return Ae(t,e,!1)}var Pn=A((function(t,e){return e=Ae(e,!0,!0),Ze(t,(function(t){return!nn(e,t)}))})),jn=A((function(t,e){return Pn(t,e)}));function Tn(t,e,n,r){S(e)||(r=n,n=e,e=!1),null!=n&&(n=Jt(n,r));for(var o=[],i=[],a=0,s=it(t);a<s;a++){var l=t[a],u=n?n(l,a,t):l;e&&!n?(a&&i===u||o.push(l),i=u):n?nn(i,u)||(i.push(u),o.push(l)):nn(o,l)||o.push(l)}return o}var Rn=A((function(t){return Tn(Ae(t,!0,!0))}));function Mn(t){for(var e=[],n=arguments.length,r=0,o=it(t);r<o;r++){var i=t[r];if(!nn(e,i)){var a;for(a=1;a<n&&nn(arguments[a],i);a++);a===n&&e.push(i)}}return e}function Nn(t){for(var e=t&&sn(t,it).length||0,n=Array(e),r=0;r<e;r++)n[r]=on(t,r);return n}var Dn=A(Nn);function Bn(t,e){for(var n={},r=0,o=it(t);r<o;r++)e?n[t[r]]=e[r]:n[t[r][0]]=t[r][1];return n}function Vn(t,e,n){null==e&&(e=t||0,t=0),n||(n=e<t?-1:1);for(var r=Math.max(Math.ceil((e-t)/n),0),o=Array(r),i=0;i<r;i++,t+=n)o[i]=t;return o}function In(t,e){if(null==e||e<1)return[];for(var n=[],r=0,o=t.length;r<o;)n.push(c.call(t,r,r+=e));return n}function Ln(t,e){return t._chain?ct(e).chain():e}function zn(t){return Ge(Tt(t),(function(e){var n=ct[e]=t[e];ct.prototype[e]=function(){var t=[this._wrapped];return u.apply(t,arguments),Ln(this,n.apply(ct,t))}})),ct}Ge(["pop","push","reverse","shift","sort","splice","unshift"],(function(t){var e=a[t];ct.prototype[t]=function(){var n=this._wrapped;return null!=n&&(e.apply(n,arguments),"shift"!==t&&"splice"!==t||0!==n.length||delete n[0]),Ln(this,n)}})),Ge(["concat","join","slice"],(function(t){var e=a[t];ct.prototype[t]=function(){var t=this._wrapped;return null!=t&&(t=e.apply(t,arguments)),Ln(this,t)}}));var $n=ct,Fn=zn(r);Fn._=Fn;var Un=Fn},5074:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Տվյալներ չկան","name":"Ժամանակահատվածը"},"severity":{"name":"Կարևորությունը"},"status":{"name":"Կարգավիճակ"},"trend":{"empty":"Տվյալներ չկան"}},"component":{"markToggle":{"hideCases":"Թաքցնել {{mark}} թեստի արդյունքը","showCases":"Ցույց տալ {{mark}} թեստի արդյունքը"},"statusToggle":{"hideCases":"Թաքցնել {{status}} կարգավիճակով թեստի արյունքը","showCases":"Ցույց տալ {{status}} կարգավիճակով թեստի արյունքը"},"tree":{"download":"Բեռնել CSV","empty":"Տվյալներ չկան","filter":"Կարգիվիճակ","filter-marks":"Նշումներ","filtered":{"shown":"Ցուցադրվում է {{count}}","total":"{{count}} թեստի արդյունքը","total_plural":"{{count}} թեստերի արդյունքը"},"groups":"Տեղեկություն խմբերի մասին","time":{"max":{"name":"Մաքսիմում","tooltip":"Ամենաերկար թեստը"},"sum":{"name":"Գումարային","tooltip":"Բոլոր թեստերի գումարային տևողությունը"},"total":{"name":"Ընդամենը","tooltip":"Թեստի տևողությունը՝ առաջին թեստից մինչև վերջինը"}},"unknown":"<անհայտ>"},"widgetStatus":{"showAll":"Ցույց տալ բոլորը","total":"Ընդհանուր {{count}} էլեմենտ","total_plural":"Ընդհանուր {{count}} էլեմենտներ"}},"controls":{"backto":"Հետ գնալ","clipboard":"Պատճենել clipboard-ում","clipboardError":"Հնարավոր չէ պատճենել clipboard-ում: Հնարավոր է, որ այս գործառույթը չի ապահովվում դիտարկիչում","clipboardSuccess":"Պատճենումն հաջողվեց","collapse":"Ծալել","expand":"Մեծացնել","fullscreen":"Ամբողջ էկրան","language":"Փոխեք լեզուն"},"errors":{"missedAttachment":"Կցված ֆայլը չի գտնվել","notFound":"Չի գտնվել"},"marks":{"flaky":"Անկայուն","newBroken":"Նոր փչացած","newFailed":"Նոր ձախողված","newPassed":"Նոր հաջողված","retriesStatusChange":"Կարգավիճակը փոխվեց կրկնելուց հետո"},"sorter":{"duration":"տևողություն","name":"անուն","order":"հերթականություն","status":"կարգավիճակ"},"status":{"broken":"Փչացած","failed":"Ձախողված","passed":"Հաջողված","skipped":"Բաց թողնված","unknown":"Անհայտ"},"tab":{"categories":{"name":"Կատեգորիաներ"},"graph":{"name":"Գրաֆիկները"},"overview":{"name":"Ընդհանուր"},"suites":{"name":"Թեստի փաթեթներ"},"timeline":{"name":"Ժամանակային աղյուսակ","selected":"Ընտրվել է {{count}} թեստ ({{percent}}%) {{տեւողությամբ}}-ից բարձր տևողությամբ","selected_plural":"Ընտրվել են {{count}} թեստեր ({{percent}}%) {{տեւողությամբ}}-ից բարձր տևողությամբ"}},"testResult":{"categories":{"name":"Կատեգորիաներ"},"description":{"name":"Նկարագրություն"},"duration":{"name":"Տևողությունը"},"execution":{"body":"Հիմնական մասը","downloadAttachment":{"tooltip":"Բացել կցված ֆայլը նոր ներդիրում"},"name":"Կատարումը","setup":"Նախապատրաստում","teardown":"Ավարտը"},"history":{"empty":"Պատմությունը հասանելի չէ։","name":"Պատմություն","statistic":"{{passed}}-ը {{total}}-ից","successRate":"Հաջողության ցուցանիշը","time":"{{date}} {{time}}-ին"},"links":{"name":"Հղումներ"},"overview":{"name":"Ընդհանուր"},"owner":{"name":"Սեփականատեր"},"parameters":{"name":"Պարամետրեր"},"retries":{"empty":"Թեստերի կրկնության մասին տվյալները հասանելի չեն","name":"Կրկնությունների քանակ","time":"{{date}} {{time}}-ին"},"severity":{"name":"Կարևորությունը","blocker":"Բլոկավարող","critical":"Կրիտիկական","normal":"Նորմալ","minor":"Մինոր","trivial":"Տրիվիալ"},"stats":{"count":{"attachments":"{{count}} կցված ֆայլեր","attachments_plural":"{{count}} կցված ֆայլեր","parameters":"{{count}} պարամետրեր","parameters_plural":"{{count}} պարամետրեր","steps":"{{count}} ենթաքայլ","steps_plural":"{{count}} ենթաքայլեր"}},"status":{"empty":"Կարգավիճակի մանրամասները հասանելի չեն","trace":"Ցույց տալ trace-ը"},"tags":{"name":"Թեգեր"}},"widget":{"categories":{"name":"Կատեգորիաներ"},"categoriesTrend":{"name":"Կատեգորիաներ թրենդ"},"durationTrend":{"name":"Տևողության թրենդ"},"environment":{"empty":"Միջավայրի փոփոխականներ չկան","name":"Միջավայր","showAll":"Ցույց տալ բոլորը"},"executors":{"empty":"Թեստերը կատարողների հանձնողի մասին տեղեկություն չկա","name":"Թեստերը կատարողներ","unknown":"Անհայտ"},"launches":{"empty":"Գործարկիչների մասին տեղեկություններ չկան","name":"Գործարկիչներ"},"retryTrend":{"name":"Կրկնությունների թրենդ"},"suites":{"name":"Թեստի փաթեթներ"},"summary":{"aggregatedName":"Հաշվետվությունների համախումբ","launches":"գործարկիչ","launches_plural":"գործարկիչներ","testResults":"թեստ քեյս","testResults_plural":"թեստ քեյսեր"},"trend":{"name":"Թրենդ"}}}')},5679:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Göstəriləcək heç nə yoxdur","name":"Test müddəti"},"severity":{"name":"Testlərin əhəmiyyəti"},"status":{"name":"Testlərin statusu"},"trend":{"empty":"Göstəriləcək heç nə yoxdur"}},"component":{"markToggle":{"hideCases":"{{mark}} nəticəni gizlədin","showCases":"{{mark}} nəticəni göstərin"},"statusToggle":{"hideCases":"{{status}} statuslu test nəticələrini gizlədin","showCases":"{{status}} statuslu test nəticələrini gizlədin"},"tree":{"download":"CSV endirin","empty":"Məlumat yoxdur","filter":"Status","filter-marks":"Teqlər","filtered":{"shown":"{{count}} göstərilir","total":"{{count}} test nəticəsi","total_plural":"{{count}} test nəticəsi"},"groups":"Qruplar haqqında məlumatları göstərin","time":{"max":{"name":"Maks","tooltip":"Qrupdakı ən uzun testin müddəti"},"sum":{"name":"Cəm","tooltip":"Qrupdakı test müddətlərinin cəmi"},"total":{"name":"Toplam","tooltip":"İlk test başlayandan sonuncu bitənə qədər olan vaxt"}},"unknown":"<Boş>"},"widgetStatus":{"showAll":"Hamısını göstər","total":"Toplam {{count}} element","total_plural":"Toplam {{count}} element"}},"controls":{"backto":"Geri","clipboard":"Mübadilə buferinə kopyala","clipboardError":"Mübadilə buferinə kopyalamaq mümkün olmadı. Bu özəllik browseriniz tərəfindən dəstəklənmir","clipboardSuccess":"Uğurla kopyalandı","collapse":"Aç","expand":"Genişlət","fullscreen":"Tam ekran","language":"Dili dəyişin"},"errors":{"missedAttachment":"Qoşma tapılmadı","notFound":"Tapılmadı"},"marks":{"flaky":"Qeyri-sabit","newBroken":"Yeni qırılmış","newFailed":"Yeni uğursuz","newPassed":"Yeni keçmiş","retriesStatusChange":"Yenidən cəhd etdikdən sonra status dəyişib"},"sorter":{"duration":"müddət","name":"ad","order":"sıra","status":"status"},"status":{"broken":"Qırılmış","failed":"Uğursuz","passed":"Keçmiş","skipped":"Buraxılmış","unknown":"Qeyri müəyyən"},"tab":{"categories":{"name":"Kateqoriyalar"},"graph":{"name":"Qraflar"},"overview":{"name":"Ümumibaxış"},"suites":{"name":"Test dəsti"},"timeline":{"name":"Zaman şkalası","selected":"Müddəti {{duration}} çox olan {{count}} test ({{percent}}%) seçildi","selected_plural":"Müddəti {{duration}} çox olan {{count}} test ({{percent}}%) seçildi"}},"testResult":{"categories":{"name":"Kateqoriyalar"},"description":{"name":"Açıqlama"},"duration":{"name":"Müddət"},"execution":{"body":"Test gövdəsi","downloadAttachment":{"tooltip":"Qoşmanı yeni tabda açın"},"name":"İcra","setup":"Hazırlanma","teardown":"Sonlandırma"},"history":{"empty":"Tarix məlumatı tapılmadı.","name":"Tarix","statistic":"Toplam:{{total}}, Keçmiş:{{passed}} ","successRate":"Uğur faizi","time":"{{date}} at {{time}}"},"links":{"name":"Linklər"},"overview":{"name":"Ümumibaxış"},"owner":{"name":"Sahibi"},"parameters":{"name":"Parameterlər"},"retries":{"empty":"Testlərin yenidən çalışdırılması ilə bağlı məlumat yoxdur","name":"Yenidən Cəhdlər","time":"{{date}} at {{time}}"},"severity":{"name":"Əhəmiyyəti"},"stats":{"count":{"attachments":"{{count}} qoşma","attachments_plural":"{{count}} qoşma","parameters":"{{count}} parameter","parameters_plural":"{{count}} parameter","steps":"{{count}} alt addım","steps_plural":"{{count}} alt addım"}},"status":{"empty":"Boş status detalları","trace":"Trace-i göstər"},"tags":{"name":"Teqlər"}},"widget":{"categories":{"name":"Kateqoriyalar"},"categoriesTrend":{"name":"Kateqoriyalar trendi"},"durationTrend":{"name":"Müddət trendi"},"environment":{"empty":"Mühit dəyişənləri haqqında məlumat yoxdur","name":"Mühit","showAll":"Hamısını göstər"},"executors":{"empty":"Testin icrası sistemi haqqında məlumat yoxdur","name":"Test icraçıları","unknown":"Bilinməyən"},"launches":{"empty":"Başlamalar haqqında məlumat yoxdur","name":"Başlamalar"},"retryTrend":{"name":"Yenidən cəhdlər trendi"},"suites":{"name":"Dəstlər"},"summary":{"aggregatedName":"Ümumi hesabat","launches":"Başlama","launches_plural":"Başlamalar","testResults":"test nəticəsi","testResults_plural":"test nəticələri"},"trend":{"name":"Trend"}}}')},1480:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Não há nada para mostrar","name":"Duração"},"severity":{"name":"Severidade"},"status":{"name":"Situação"},"trend":{"empty":"Não há nada para mostrar"}},"component":{"statusToggle":{"hideCases":"Ocultar resultados dos testes com situação {{status}}","showCases":"Mostrar resultados dos testes com situação {{status}}"},"tree":{"download":"Download CSV","empty":"Não há itens","filter":"Filtrar por situação","filtered":{"shown":"mostrar {{count}}","total":"resultado do teste {{count}}","total_plural":"resultados dos testes {{count}}"},"groups":"Alternar informações do grupo","time":{"max":{"name":"Max","tooltip":"Teste mais demorado"},"sum":{"name":"Soma","tooltip":"Soma da duração de todos os testes"},"total":{"name":"Total","tooltip":"Duração de inicio do primeiro teste até o ultimo teste finalizar"}},"unknown":"Grupo vazio"},"widgetStatus":{"showAll":"Mostrar tudo","total":"total de item {{count}}","total_plural":"total de itens {{count}}"}},"controls":{"backto":"Voltar para","clipboard":"Copiar para área de transferência","clipboardError":"Não é possível copiar o valor para área de transferência. Parece que está funcionalidade não é suportada pelo seu browser","clipboardSuccess":"Copiado com sucesso","collapse":"Reduzir","expand":"Expandir","fullscreen":"Tela cheia","language":"Mudar a linguagem"},"errors":{"missedAttachment":"Anexo não encontrado","notFound":"Não encontrado"},"marks":{"flaky":"Inconsistente","newBroken":"Novo quebrado","newFailed":"Novo falhou","newPassed":"Novo passou","retriesStatusChange":"Status alterado após nova tentativa"},"sorter":{"duration":"duração","name":"nome","order":"ordem","status":"situação"},"status":{"broken":"Quebrado","failed":"Falhou","passed":"Passou","skipped":"Ignorado","unknown":"Desconhecido"},"tab":{"categories":{"name":"Categorias"},"graph":{"name":"Gráficos"},"overview":{"name":"Visão geral"},"suites":{"name":"Suítes"},"timeline":{"name":"Linha do tempo","selected":"Selecionado {{count}} teste ({{percent}}%) com duração acima de {{duration}}","selected_plural":"Selecionados {{count}} testes ({{percent}}%) com duração acima de {{duration}}"}},"testResult":{"categories":{"name":"Categorias"},"description":{"name":"Descrição"},"duration":{"name":"Duração"},"execution":{"body":"Corpo do teste","name":"Execução","setup":"Pré-execução","teardown":"Pós-execução"},"history":{"name":"Histórico","successRate":"Taxa de sucesso"},"links":{"name":"Links"},"overview":{"name":"Visão geral"},"owner":{"name":"Proprietário"},"parameters":{"name":"Parâmetros"},"retries":{"empty":"Não há informação disponível sobre as tentativas de testes.","name":"Tentativas"},"severity":{"name":"Severidade"},"stats":{"count":{"attachments":"{{count}} anexo","attachments_plural":"{{count}} anexos","parameters":"{{count}} parâmetro","parameters_plural":"{{count}} parâmetros","steps":"{{count}} sub-passo","steps_plural":"{{count}} sub-passos"}},"status":{"empty":"Detalhes da situação vazio.","trace":"Mostrar trace"},"tags":{"name":"Tags"}},"widget":{"categories":{"name":"Categorias"},"categoriesTrend":{"name":"Tendência das categorias"},"durationTrend":{"name":"Tendência das durações"},"environment":{"empty":"Não há variáveis de ambiente.","name":"Ambiente","showAll":"Mostrar tudo"},"executors":{"empty":"Não há informação sobre os executores dos testes.","name":"Executores","unknown":"Desconhecido"},"launches":{"empty":"Não há informações sobre execuções","name":"Execuções"},"retryTrend":{"name":"Tendência das tentativas"},"suites":{"name":"Suítes"},"summary":{"aggregatedName":"Relatório agregado","launches":"execução","launches_plural":"execuções","testResults":"caso de teste","testResults_plural":"casos de teste"},"trend":{"name":"Tendência"}}}')},1279:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Hier gibt es nichts zu zeigen","name":"Dauer"},"severity":{"name":"Ausmaß"},"status":{"name":"Status"},"trend":{"empty":"Hier gibt es nichts zu zeigen"}},"component":{"statusToggle":{"hideCases":"Verstecke Testergebnisse mit Status {{status}}","showCases":"Zeige Testergebnisse mit Status {{status}}"},"tree":{"download":"CSV herunterladen","empty":"Keine Einträge verfügbar","filter":"Filtere Testfälle nach Status","filtered":{"shown":"{{count}} angezeigt","total":"{{count}} Testergebnis","total_plural":"{{count}} Testergebnisse"},"groups":"Gruppeninformationen an- / ausschalten","time":{"max":{"name":"Max","tooltip":"Längste Testdauer"},"sum":{"name":"Summe","tooltip":"Summe aller Testdauern"},"total":{"name":"Gesamt","tooltip":"Dauer vom Start des ersten bis zum Ende des letzten Tests"}},"unknown":"<Leer>"},"widgetStatus":{"showAll":"Zeige alle","total":"{{count}} Eintrag insgesamt","total_plural":"{{count}} Einträge insgesamt"}},"controls":{"backto":"Zurück zu","clipboard":"In Zwischenablage kopieren","clipboardError":"Wert konnte nicht in Zwischenablage kopiert werden. Ihr Browser scheint dieses Feature nicht zu unterstützen","clipboardSuccess":"Erfolgreich in Zwischenablage kopiert","collapse":"Verkleinern","expand":"Vergrößern","fullscreen":"Vollbild","language":"Sprache ändern"},"errors":{"missedAttachment":"Anhang nicht gefunden","notFound":"Nicht gefunden"},"marks":{"flaky":"Instabil","newBroken":"Neu defekt","newFailed":"Neu fehlgeschlagen","newPassed":"Neu erfolgreich","retriesStatusChange":"Status nach erneutem Versuch geändert"},"sorter":{"duration":"Dauer","name":"Name","order":"Reihenfolge","status":"Status"},"status":{"broken":"Defekt","failed":"Fehlgeschlagen","passed":"Erfolgreich","skipped":"Übersprungen","unknown":"Unbekannt"},"tab":{"categories":{"name":"Kategorien"},"graph":{"name":"Grafiken"},"overview":{"name":"Übersicht"},"suites":{"name":"Suiten"},"timeline":{"name":"Zeitstrahl","selected":"{{count}} Test ausgewählt ({{percent}}%) mit einer Dauer von über {{duration}}","selected_plural":"{{count}} Tests ausgewählt ({{percent}}%) mit einer Dauer von über {{duration}}"}},"testResult":{"categories":{"name":"Kategorien"},"description":{"name":"Beschreibung"},"duration":{"name":"Dauer"},"execution":{"body":"Test","name":"Durchführung","setup":"Vorbereitung","teardown":"Aufräumung"},"history":{"name":"Historie","successRate":"Erfolgsrate"},"links":{"name":"Links"},"overview":{"name":"Übersicht"},"owner":{"name":"Besitzer"},"parameters":{"name":"Parameter"},"retries":{"empty":"Keine Informationen zu Wiederholungen verfügbar","name":"Wiederholungen"},"severity":{"name":"Ausmaß"},"stats":{"count":{"attachments":"{{count}} Anhang","attachments_plural":"{{count}} Anhänge","parameters":"{{count}} Parameter","parameters_plural":"{{count}} Parameter","steps":"{{count}} Unterschritt","steps_plural":"{{count}} Unterschritte"}},"status":{"empty":"Keine Status Details","trace":"Zeige Stracktrace"},"tags":{"name":"Tags"}},"widget":{"categories":{"name":"Kategorien"},"categoriesTrend":{"name":"Kategorien Trend"},"durationTrend":{"name":"Dauer Trend"},"environment":{"empty":"Keine Umgebungsvariablen verfügbar","name":"Umgebung","showAll":"Zeige alle"},"executors":{"empty":"Keine Informationen zu Testdurchführern verfügbar","name":"Durchführer","unknown":"Unbekannt"},"launches":{"empty":"Keine Informationen zu Durchläufen verfügbar","name":"Durchläufe"},"retryTrend":{"name":"Wiederholungen Trend"},"suites":{"name":"Suiten"},"summary":{"aggregatedName":"Aggregierter Report","launches":"Durchlauf","launches_plural":"Durchläufe","testResults":"Testfall","testResults_plural":"Testfälle"},"trend":{"name":"Trend"}}}')},199:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"There is nothing to show","name":"Duration"},"severity":{"name":"Severity"},"status":{"name":"Status"},"trend":{"empty":"There is nothing to show"}},"component":{"markToggle":{"hideCases":"Hide {{mark}} test results","showCases":"Show {{mark}} test results"},"statusToggle":{"hideCases":"Hide test results with {{status}} status","showCases":"Show test results with {{status}} status"},"tree":{"download":"Download CSV","empty":"There are no items","filter":"Status","filter-marks":"Marks","filtered":{"shown":"{{count}} shown","total":"{{count}} test result","total_plural":"{{count}} test results"},"groups":"Toggle groups info","time":{"max":{"name":"Max","tooltip":"Longest test duration"},"sum":{"name":"Sum","tooltip":"Sum of all tests durations"},"total":{"name":"Total","tooltip":"Duration from first test started to last test finished"}},"unknown":"<Empty>"},"widgetStatus":{"showAll":"Show all","total":"{{count}} item total","total_plural":"{{count}} items total"}},"controls":{"backto":"Back to","clipboard":"Copy to clipboard","clipboardError":"Can not copy value to clipboard. Seems like this feature is not supported for your browser","clipboardSuccess":"Successfully copied","collapse":"Collapse","expand":"Expand","fullscreen":"Full screen","language":"Change language"},"errors":{"missedAttachment":"Attachment not found","notFound":"Not found"},"marks":{"flaky":"Flaky","newBroken":"New broken","newFailed":"New failed","newPassed":"New passed","retriesStatusChange":"Status changed after retry"},"sorter":{"duration":"duration","name":"name","order":"order","status":"status"},"status":{"broken":"Broken","failed":"Failed","passed":"Passed","skipped":"Skipped","unknown":"Unknown"},"tab":{"categories":{"name":"Categories"},"graph":{"name":"Graphs"},"overview":{"name":"Overview"},"suites":{"name":"Suites"},"timeline":{"name":"Timeline","selected":"Selected {{count}} test ({{percent}}%) with duration above {{duration}}","selected_plural":"Selected {{count}} tests ({{percent}}%) with duration above {{duration}}"}},"testResult":{"categories":{"name":"Categories"},"description":{"name":"Description"},"duration":{"name":"Duration"},"execution":{"body":"Test body","downloadAttachment":{"tooltip":"Open attachment in new tab"},"name":"Execution","setup":"Set up","teardown":"Tear down"},"history":{"empty":"No history information available.","name":"History","statistic":"{{passed}} of {{total}}","successRate":"Success rate","time":"{{date}} at {{time}}"},"links":{"name":"Links"},"overview":{"name":"Overview"},"owner":{"name":"Owner"},"parameters":{"name":"Parameters"},"retries":{"empty":"There is no information available about test retries","name":"Retries","time":"{{date}} at {{time}}"},"severity":{"name":"Severity","blocker":"blocker","critical":"critical","normal":"normal","minor":"minor","trivial":"trivial"},"stats":{"count":{"attachments":"{{count}} attachment","attachments_plural":"{{count}} attachments","parameters":"{{count}} parameter","parameters_plural":"{{count}} parameters","steps":"{{count}} sub-step","steps_plural":"{{count}} sub-steps"}},"status":{"empty":"Empty status details","trace":"Show trace"},"tags":{"name":"Tags"}},"widget":{"categories":{"name":"Categories"},"categoriesTrend":{"name":"Categories trend"},"durationTrend":{"name":"Duration trend"},"environment":{"empty":"There are no environment variables","name":"Environment","showAll":"Show all"},"executors":{"empty":"There is no information about tests executors","name":"Executors","unknown":"Unknown"},"launches":{"empty":"There is no information about launches","name":"Launches"},"retryTrend":{"name":"Retries trend"},"suites":{"name":"Suites"},"summary":{"aggregatedName":"Aggregated report","launches":"launch","launches_plural":"launches","testResults":"test case","testResults_plural":"test cases"},"trend":{"name":"Trend"}}}')},3488:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"No hay nada para mostrar","name":"Duración"},"severity":{"name":"Severidad"},"status":{"name":"Estado"},"trend":{"empty":"No hay nada para mostrar"}},"component":{"markToggle":{"hideCases":"Ocultar {{mark}} resultados de prueba","showCases":"Mostrar {{mark}} resultados de prueba"},"statusToggle":{"hideCases":"Ocultar resultados de pruebas con estado {{status}}","showCases":"Mostrar resultados de pruebas con estado {{status}}"},"tree":{"download":"Descargar CSV","empty":"No hay ítems","filter":"Estado","unknown":"<Vacío>","filtered":{"shown":"{{count}} mostrados","total":"{{count}} resultado","total_plural":"{{count}} resultados"},"groups":"Alternar información del grupo","time":{"max":{"name":"Max","tooltip":"Prueba con mayor duración"},"sum":{"name":"Suma","tooltip":"Suma de todas las pruebas"},"total":{"name":"Total","tooltip":"Duración desde el primer test iniciado hasta el último finalizado"}}},"widgetStatus":{"showAll":"Mostrar todo","total":"total de ítems {{count}}","total_plural":"total de ítems {{count}}"}},"controls":{"backto":"Volver a","clipboard":"Copiar a portapapeles","clipboardError":"No es posible utilizar el portapapeles. Parece ser que esta funcionalidad no es soportada por tu navegador","clipboardSuccess":"Copiado exitosamente","collapse":"Colapsar","expand":"Expandir","fullscreen":"Pantalla completa","language":"Cambiar lenguaje"},"errors":{"missedAttachment":"Adjunto no encontrado","notFound":"No encontrado"},"marks":{"flaky":"Inestable","newBroken":"Nuevo roto","newFailed":"Nuevo fallido","newPassed":"Nuevo pasado","retriesStatusChange":"El estado cambió después de reintentar"},"sorter":{"duration":"duración","name":"nombre","order":"orden","status":"estado"},"status":{"broken":"Roto","failed":"Fallido","passed":"Exitoso","skipped":"Ignorado","unknown":"Desconocido"},"tab":{"categories":{"name":"Categorías"},"graph":{"name":"Gráficos"},"overview":{"name":"Visión General"},"suites":{"name":"Suites"},"timeline":{"name":"Línea de Tiempo","selected":"Selecionada {{count}} prueba ({{percent}}%) con duración arriba de {{duration}}","selected_plural":"Selecionadas {{count}} pruebas ({{percent}}%) con duración arriba de {{duration}}"}},"testResult":{"categories":{"name":"Categorías"},"description":{"name":"Descripción"},"duration":{"name":"Duración"},"execution":{"body":"Contenido de la prueba","name":"Ejecución","setup":"Pre-ejecución","teardown":"Post-ejecución"},"history":{"name":"Histórico","successRate":"Tasa de éxito"},"links":{"name":"Links"},"overview":{"name":"Visión general"},"owner":{"name":"Propietario"},"parameters":{"name":"Parámetros"},"retries":{"empty":"No hay información disponible sobre los reintentos de la prueba","name":"Reintentos"},"severity":{"name":"Severidad"},"stats":{"count":{"attachments":"{{count}} adjunto","attachments_plural":"{{count}} adjuntos","parameters":"{{count}} parámetro","parameters_plural":"{{count}} parámetros","steps":"{{count}} sub-paso","steps_plural":"{{count}} sub-pasos"}},"status":{"empty":"Detalles de estado no existente","trace":"Mostrar trace"},"tags":{"name":"Etiquetas"}},"widget":{"categories":{"name":"Categorías"},"categoriesTrend":{"name":"Tendencia de categorías"},"durationTrend":{"name":"Tendencia de duraciones"},"environment":{"empty":"No hay variables de ambiente definidas","name":"Ambiente","showAll":"Mostrar todo"},"executors":{"empty":"No hay información sobre los ejecutores de pruebas","name":"Ejecutores","unknown":"Desconocido"},"launches":{"empty":"No hay información sobre ejecutores","name":"Ejecutores"},"retryTrend":{"name":"Tendencia de reintentos"},"suites":{"name":"Suites"},"summary":{"aggregatedName":"Reporte agregado","launches":"ejecución","launches_plural":"ejecuciones","testResults":"caso de prueba","testResults_plural":"casos de prueba"},"trend":{"name":"Tendencia"}}}')},8532:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Il n\'y a rien à montrer","name":"Durée"},"severity":{"name":"Sévérité"},"status":{"name":"Statut"},"trend":{"empty":"Il n\'y a rien à montrer"}},"component":{"markToggle":{"hideCases":"Cacher les résultats de test marqués {{mark}}","showCases":"Montrer les résultats de test marqués {{mark}}"},"statusToggle":{"hideCases":"Cacher les résultats de test avec le statut {{status}}","showCases":"Montrer les résultats de test avec le statut {{status}}"},"tree":{"download":"Télécharger le fichier CSV","empty":"Il n\'y a aucun article","filter":"Statut","filter-marks":"Marques","filtered":{"shown":"{{count}} montré","total":"{{count}} résultat de test","total_plural":"{{count}} résultats de test"},"groups":"Basculer les informations des groupes","time":{"max":{"name":"Maximum","tooltip":"Durée la plus longue"},"sum":{"name":"Somme","tooltip":"Somme de toutes les durées"},"total":{"name":"Total","tooltip":"Durée depuis le premier test démarré jusqu\'au dernier test terminé"}},"unknown":"<Vide>"},"widgetStatus":{"showAll":"Montrer tout","total":"{{count}} article au total","total_plural":"{{count}} articles au total"}},"controls":{"backto":"Retour vers","clipboard":"Copier dans le presse-papier","clipboardError":"Impossible de copier vers le presse-papier. Cette fonction ne semble pas être supportée par votre navigateur","clipboardSuccess":"Copié avec succès","collapse":"Plier","expand":"Déplier","fullscreen":"Plein écran","language":"Changer de langue"},"errors":{"missedAttachment":"Pièce jointe non trouvée","notFound":"Non trouvé"},"marks":{"flaky":"Instable","newBroken":"Cassé (nouveau)","newFailed":"Échoué (nouveau)","newPassed":"Réussi (nouveau)","retriesStatusChange":"L\'état a changé après une nouvelle tentative"},"sorter":{"duration":"durée","name":"nom","order":"ordre","status":"statut"},"status":{"broken":"Cassé","failed":"Échoué","passed":"Passé","skipped":"Ignoré","unknown":"Inconnu"},"tab":{"categories":{"name":"Catégories"},"graph":{"name":"Graphiques"},"overview":{"name":"Aperçu"},"suites":{"name":"Suites"},"timeline":{"name":"Chronologie","selected":"{{count}} test sélectionné ({{percent}}%) avec une durée supérieure à {{duration}}","selected_plural":"{{count}} tests sélectionnés ({{percent}}%) avec une durée supérieure à {{duration}}"}},"testResult":{"categories":{"name":"Catégories"},"description":{"name":"Description"},"duration":{"name":"Durée"},"execution":{"body":"Contenu du test","downloadAttachment":{"tooltip":"Ouvrir la pièce jointe dans un nouvel onglet"},"name":"Exécution","setup":"Pré exécution","teardown":"Post exécution"},"history":{"empty":"Aucune information à propos de l\'historique.","name":"Historique","statistic":"{{passed}} sur {{total}}","successRate":"Taux de succès","time":"{{date}} à {{time}}"},"links":{"name":"Liens"},"overview":{"name":"Aperçu"},"owner":{"name":"Propriétaire"},"parameters":{"name":"Paramètres"},"retries":{"empty":"Aucune information à propos des tentatives","name":"Tentatives","time":"{{date}} à {{time}}"},"severity":{"name":"Sévérité"},"stats":{"count":{"attachments":"{{count}} pièce jointe","attachments_plural":"{{count}} pièces jointes","parameters":"{{count}} paramètre","parameters_plural":"{{count}} paramètres","steps":"{{count}} sous-étape","steps_plural":"{{count}} sous-étapes"}},"status":{"empty":"Détails du statut vide","trace":"Afficher la trace"},"tags":{"name":"Tags"}},"widget":{"categories":{"name":"Catégories"},"categoriesTrend":{"name":"Tendance des catégories"},"durationTrend":{"name":"Tendance de la durée"},"environment":{"empty":"Aucune variable d\'environnement","name":"Environnement","showAll":"Afficher tout"},"executors":{"empty":"Aucune information à propos des exécuteurs des tests","name":"Exécuteurs","unknown":"Inconnu"},"launches":{"empty":"Aucune information à propos des lancements","name":"Lancements"},"retryTrend":{"name":"Tendance des tentatives"},"suites":{"name":"Suites"},"summary":{"aggregatedName":"Rapport agrégé","launches":"lancement","launches_plural":"lancements","testResults":"cas de test","testResults_plural":"cas de test"},"trend":{"name":"Tendance"}}}')},9571:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"אין דבר להציג","name":"זמן ריצה"},"severity":{"name":"חומרה"},"status":{"name":"סטטוס"},"trend":{"empty":"אין דבר להציג"}},"component":{"statusToggle":{"hideCases":"הסתר תוצאות ריצה עם הסטטוס {{status}}","showCases":"הצג תוצאות ריצה עם הסטטוס {{status}}"},"tree":{"download":"הורד קובץ CSV","empty":"לא קיימים פריטים","filter":"מיין מקרי בדיקה על ידי סטטוס","filtered":{"shown":"מופיעים {{count}}","total":"תוצאת ריצה {{count}}","total_plural":"{{count}} תוצאות ריצה"},"groups":"הצג/הסתר את המידע על הקבוצות","time":{"max":{"name":"מקסימלי","tooltip":"זמן הריצה הכי ארוך"},"sum":{"name":"סכום","tooltip":"סכום כל זמני תוצאות הריצה"},"total":{"name":"סך הכול","tooltip":"משך זמן הריצה מתחילת ריצת מקרה הבדיקה הראשון עד סיום ריצת מקרה הבדיקה האחרון"}},"unknown":"רֵיק"},"widgetStatus":{"showAll":"הצג את כל הפריטים","total":"סך הכול פריט {{count}}","total_plural":"סך הכול {{count}} פריטים"}},"controls":{"backto":"חזור ל","clipboard":"העתק אל מגש המערכת","clipboardError":"לא ניתן להעתיק את הערך אל מגש המערכת. נראה שהתכונה הזאת לא נתמכת על ידי הדפדפן שלך","clipboardSuccess":"הועתק בהצלחה","collapse":"כווץ","expand":"הרחב","fullscreen":"מסך מלא","language":"שנה שפה"},"errors":{"missedAttachment":"התוכן המצורף לא נמצא","notFound":"לא נמצא"},"marks":{"flaky":"לא יציב","newBroken":"חדש שבור","newFailed":"חדש נכשל","newPassed":"חדש עבר","retriesStatusChange":"הסטטוס השתנה לאחר ניסיון חוזר"},"sorter":{"duration":"זמן ריצה","name":"שם מקרה הבדיקה","order":"סדר","status":"סטטוס"},"status":{"broken":"שבור","failed":"נכשל","passed":"עבר","skipped":"דולג","unknown":"לא ידוע"},"tab":{"categories":{"name":"קטגוריות"},"graph":{"name":"גרפים"},"overview":{"name":"סקירה כללית"},"suites":{"name":"קבוצות מקרי בדיקה"},"timeline":{"name":"ציר זמן","selected":"נבחר מקרה בדיקה {{count}} ({{percent}}%) עם זמן ריצה מעל {{duration}}","selected_plural":"נבחרו {{count}} מקרי בדיקה ({{percent}}%) עם זמן ריצה מעל {{duration}}"}},"testResult":{"categories":{"name":"קטגוריות"},"description":{"name":"תיאור"},"duration":{"name":"זמן ריצה"},"execution":{"body":"תוכן מקרה הבדיקה","name":"הרצה","setup":"הכנת הריצה","teardown":"סיום הריצה"},"history":{"name":"היסטוריה","successRate":"שיעור הצלחה"},"links":{"name":"קישורים"},"overview":{"name":"סקירה כללית"},"owner":{"name":"האחראי למקרה הבדיקה"},"parameters":{"name":"פרמטרים"},"retries":{"empty":"אין מידע זמין על ניסיונות ריצה חוזרים","name":"ניסיונות ריצה חוזרים"},"severity":{"name":"חומרה"},"stats":{"count":{"attachments":"תוכן מצורף {{count}}","attachments_plural":"{{count}} תכנים מצורפים","parameters":"פרמטר {{count}}","parameters_plural":"{{count}} פרמטרים","steps":"צעד משנה {{count}}","steps_plural":"{{count}} צעדי משנה"}},"status":{"empty":"לא קיימים פרטים על מצב מקרה הבדיקה","trace":"הצג מידע נוסף"},"tags":{"name":"תגים"}},"widget":{"categories":{"name":"קטגוריות"},"categoriesTrend":{"name":"מגמת ריצה על קטגוריות"},"durationTrend":{"name":"מגמת זמן ריצה"},"environment":{"empty":"לא קיימים משתני סביבה","name":"משתני סביבה","showAll":"הצג את כל משתני הסביבה"},"executors":{"empty":"לא קיים מידע על כלי הרצת מקרי הבדיקה","name":"כלי הרצה","unknown":"לא ידוע"},"launches":{"empty":"לא קיים מידע על חבילות הרצה","name":"חבילות הרצה"},"retryTrend":{"name":"מגמת חזרות על ריצה"},"suites":{"name":"קבוצות מקרי בדיקה"},"summary":{"aggregatedName":"דוח","launches":"חבילת הרצה","launches_plural":"חבילות הרצה","testResults":"תוצאת בדיקה","testResults_plural":"תוצאות בדיקה"},"trend":{"name":"מגמת ריצות"}}}')},9810:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Nema informacije","name":"Trvanje testov"},"severity":{"name":"Važnost testov"},"status":{"name":"Statusy testov"},"trend":{"empty":"Nema informacije"}},"component":{"markToggle":{"hideCases":"Skryj rezultaty označene kako \\"{{mark}}\\"","showCases":"Pokaži rezultaty označene kako \\"{{mark}}\\""},"statusToggle":{"hideCases":"Skryj rezultaty so statusom \\"{{status}}\\"","showCases":"Pokaži rezultaty so statusom \\"{{status}}\\""},"tree":{"download":"Daunloduj CSV","empty":"Nema informacije","filter":"Statusy","filter-marks":"Označenja","filtered":{"shown_0":"{{count}} pokazany","shown_1":"{{count}} pokazane","shown_2":"{{count}} pokazane","total_0":"{{count}} test vsego","total_1":"{{count}} testy vsego","total_2":"{{count}} testov vsego"},"groups":"Pokaži informaciju o grupah","time":{"max":{"name":"Najvyše dolgy","tooltip":"Koliko časa trval najvyše dolgy test v grupě"},"sum":{"name":"V sumě","tooltip":"Suma trvanij vsih testov v grupě"},"total":{"name":"Cělo","tooltip":"Čas od početka prvogo testa do konca poslědnogo"}},"unknown":"<Nema>"},"widgetStatus":{"showAll":"Pokaži vsečto","total_0":"{{count}} element vsego","total_1":"{{count}} elementa vsego","total_2":"{{count}} elementov vsego"}},"controls":{"backto":"Vzad do","clipboard":"Kopiruj do klipborda","clipboardError":"Pogrěška. Věrojetno, vaša prěgledka (brauzer) ne podpira kopirovanje do klipborda.","clipboardSuccess":"Tekst byl skopirovany","collapse":"Minimizuj","expand":"Razširi","fullscreen":"Na cěly ekran","language":"Izměni jezyk"},"errors":{"missedAttachment":"Priloga ne najdena","notFound":"Ne najdeno"},"marks":{"flaky":"Nestabilny","newBroken":"Iznova slomjeny","newFailed":"Iznova neuspěšny","newPassed":"Iznova uspěšny","retriesStatusChange":"Status měnjal se od proby do proby"},"sorter":{"duration":"trvanje","name":"nazva","order":"poredok","status":"status"},"status":{"broken":"Slomjeny","failed":"Neuspěšny","passed":"Uspěšny","skipped":"Propuščeny","unknown":"Neznany"},"tab":{"categories":{"name":"Kategorije"},"graph":{"name":"Diagramy"},"overview":{"name":"Prěgled"},"suites":{"name":"Komplety testov"},"timeline":{"name":"Hronologija","selected_0":"Izbrany {{count}} test ({{percent}}%) s trvanjem vyše od {{duration}}","selected_1":"Izbrane {{count}} testy ({{percent}}%) s trvanjem vyše od {{duration}}","selected_2":"Izbrane {{count}} testov ({{percent}}%) s trvanjem vyše od {{duration}}"}},"testResult":{"categories":{"name":"Kategorije"},"description":{"name":"Opis"},"duration":{"name":"Trvanje"},"execution":{"body":"Tělo testa","name":"Izpolnjenje","setup":"Prigotovjenje","teardown":"Zaključenje"},"history":{"name":"Historija","successRate":"Procent uspěha"},"links":{"name":"Linky"},"overview":{"name":"Prěgled"},"owner":{"name":"Vlastnik"},"parameters":{"name":"Parametry"},"retries":{"empty":"Nema informacije o minulyh probah testa","name":"Minule proby"},"severity":{"name":"Važnost","blocker":"bloker","critical":"kritična","normal":"obyčajna","minor":"mala","trivial":"kosmetična"},"stats":{"count":{"attachments_0":"{{count}} priloga","attachments_1":"{{count}} prilogy","attachments_2":"{{count}} prilog","parameters_0":"{{count}} parametr","parameters_1":"{{count}} parametry","parameters_2":"{{count}} parametrov","steps_0":"{{count}} vloženy krok","steps_1":"{{count}} vložene kroky","steps_2":"{{count}} vloženyh krokov"}},"status":{"empty":"Nema dodatnoj informacije o statusu","trace":"Pokaži dodatnu informaciju"},"tags":{"name":"Označenja"}},"widget":{"categories":{"name":"Kategorije"},"environment":{"empty":"Nema informacije o obsrědině","name":"Obsrědina","showAll":"Pokaži vsečto"},"executors":{"empty":"Nema informacije o izpolniteljah","name":"Sistemy izpolnjenja testov","unknown":"Neznano"},"launches":{"empty":"Nema informacije o puščenjah","name":"Puščenja testov"},"suites":{"name":"Komplety testov"},"summary":{"aggregatedName":"Agregovany raport","launches_0":"puščenje testov","launches_1":"puščenja testov","launches_2":"puščenij testov","testResults_0":"testovy scenarij","testResults_1":"testove scenarije","testResults_2":"testovyh scenarijev"},"trend":{"name":"Trend"}}}')},3229:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Non c\'è nulla da mostrare","name":"Durata"},"severity":{"name":"Gravità"},"status":{"name":"Stato"},"trend":{"empty":"Non c\'è nulla da mostrare"}},"component":{"markToggle":{"hideCases":"Nascondi i risultati dei test {{mark}}","showCases":"Mostra i risultati dei test {{mark}}"},"statusToggle":{"hideCases":"Nascondi i risultati dei test con stato {{status}}","showCases":"Mostra i risultati dei test con stato {{status}}"},"tree":{"download":"Scarica CSV","empty":"Non ci sono elementi","filter":"Stato","filter-marks":"Marcature","filtered":{"shown":"{{count}} mostrato","total":"{{count}} risultato del test","total_plural":"{{count}} risultati dei test"},"groups":"Mostra/nascondi info gruppi","time":{"max":{"name":"Max","tooltip":"Durata più lunga del test"},"sum":{"name":"Somma","tooltip":"Somma di tutte le durate dei test"},"total":{"name":"Totale","tooltip":"Durata dal primo test iniziato all\'ultimo test completato"}},"unknown":"<Vuoto>"},"widgetStatus":{"showAll":"Mostra tutto","total":"{{count}} elemento totale","total_plural":"{{count}} elementi totali"}},"controls":{"backto":"Torna a","clipboard":"Copia negli appunti","clipboardError":"Impossibile copiare il valore negli appunti. Sembra che questa funzione non sia supportata dal tuo browser","clipboardSuccess":"Copiato con successo","collapse":"Riduci","expand":"Espandi","fullscreen":"Schermo intero","language":"Cambia lingua"},"errors":{"missedAttachment":"Allegato non trovato","notFound":"Non trovato"},"marks":{"flaky":"Instabile","newBroken":"Nuovo rotto","newFailed":"Nuovo fallito","newPassed":"Nuovo passato","retriesStatusChange":"Stato cambiato dopo un tentativo"},"sorter":{"duration":"durata","name":"nome","order":"ordine","status":"stato"},"status":{"broken":"Rotto","failed":"Fallito","passed":"Passato","skipped":"Saltato","unknown":"Sconosciuto"},"tab":{"categories":{"name":"Categorie"},"graph":{"name":"Grafici"},"overview":{"name":"Panoramica"},"suites":{"name":"Suite"},"timeline":{"name":"Cronologia","selected":"{{count}} test selezionato ({{percent}}%) con durata superiore a {{duration}}","selected_plural":"{{count}} test selezionati ({{percent}}%) con durata superiore a {{duration}}"}},"testResult":{"categories":{"name":"Categorie"},"description":{"name":"Descrizione"},"duration":{"name":"Durata"},"execution":{"body":"Corpo del test","downloadAttachment":{"tooltip":"Apri l\'allegato in una nuova scheda"},"name":"Esecuzione","setup":"Preparazione","teardown":"Chiusura"},"history":{"empty":"Nessuna informazione storica disponibile.","name":"Cronologia","statistic":"{{passed}} di {{total}}","successRate":"Tasso di successo","time":"{{date}} alle {{time}}"},"links":{"name":"Collegamenti"},"overview":{"name":"Panoramica"},"owner":{"name":"Proprietario"},"parameters":{"name":"Parametri"},"retries":{"empty":"Non ci sono informazioni disponibili sui tentativi del test","name":"Tentativi","time":"{{date}} alle {{time}}"},"severity":{"name":"Gravità","blocker":"bloccante","critical":"critico","normal":"normale","minor":"minore","trivial":"banale"},"stats":{"count":{"attachments":"{{count}} allegato","attachments_plural":"{{count}} allegati","parameters":"{{count}} parametro","parameters_plural":"{{count}} parametri","steps":"{{count}} sottofase","steps_plural":"{{count}} sottofasi"}},"status":{"empty":"Dettagli dello stato vuoti","trace":"Mostra traccia"},"tags":{"name":"Tag"}},"widget":{"categories":{"name":"Categorie"},"categoriesTrend":{"name":"Tendenza delle categorie"},"durationTrend":{"name":"Tendenza delle durate"},"environment":{"empty":"Non ci sono variabili d\'ambiente","name":"Ambiente","showAll":"Mostra tutto"},"executors":{"empty":"Non ci sono informazioni sugli esecutori dei test","name":"Esecutori","unknown":"Sconosciuto"},"launches":{"empty":"Non ci sono informazioni sui lanci","name":"Lanci"},"retryTrend":{"name":"Tendenza dei tentativi"},"suites":{"name":"Suite"},"summary":{"aggregatedName":"Rapporto aggregato","launches":"lancio","launches_plural":"lanci","testResults":"caso di test","testResults_plural":"casi di test"},"trend":{"name":"Tendenza"}}}')},6397:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"何も表示するものがありません","name":"期間"},"severity":{"name":"重大度"},"status":{"name":"ステータス"},"trend":{"empty":"何も表示するものがありません"}},"component":{"markToggle":{"hideCases":"{{mark}} 件のテスト結果を隠す","showCases":"{{mark}} 件のテスト結果を表示"},"statusToggle":{"hideCases":"ステータスが {{status}} のテスト結果を隠す","showCases":"ステータスが {{status}} のテスト結果を表示"},"tree":{"download":"CSVをダウンロード","empty":"何もありません","filter":"ステータス","filter-marks":"マーク","filtered":{"shown":"{{count}} 件を表示","total":"{{count}} 件のテスト結果","total_plural":"{{count}} 件のテスト結果"},"groups":"グループ情報を表示・非表示","time":{"max":{"name":"最長","tooltip":"一番長い実行期間"},"sum":{"name":"合計","tooltip":"全てのテスト実行期間の合計"},"total":{"name":"全体","tooltip":"最初のテストが始まってから最後のテストが終わるまでの期間"}},"unknown":"空ける"},"widgetStatus":{"showAll":"全て表示","total":"計 {{count}} 件","total_plural":"計 {{count}} 件"}},"controls":{"backto":"戻る","clipboard":"クリップボードにコピー","clipboardError":"クリップボードにコピーできませんでした。ブラウザがサポートしていないようです。","clipboardSuccess":"コピーされました","collapse":"折り畳む","expand":"拡大","fullscreen":"フルスクリーン","language":"言語を変更"},"errors":{"missedAttachment":"添付ファイルは見つかりませんでした","notFound":"見つかりませんでした"},"marks":{"flaky":"不安定","newBroken":"新しく壊れた","newFailed":"新しい失敗","newPassed":"新しい成功","retriesStatusChange":"再試行後にステータスが変更されました"},"sorter":{"duration":"期間","name":"名前","order":"順序","status":"ステータス"},"status":{"broken":"故障","failed":"失敗","passed":"成功","skipped":"スキップ","unknown":"不明"},"tab":{"categories":{"name":"カテゴリー"},"graph":{"name":"グラフ"},"overview":{"name":"概要"},"suites":{"name":"スイート"},"timeline":{"name":"タイムライン","selected":"{{duration}} の期間で選択された {{count}} 件のテスト ({{percent}}%)","selected_plural":"{{duration}} の期間で選択された {{count}} 件のテスト ({{percent}}%)"}},"testResult":{"categories":{"name":"カテゴリー"},"description":{"name":"説明"},"duration":{"name":"期間"},"execution":{"body":"テスト本体","name":"実行","setup":"セットアップ作業","teardown":"仕上げ作業"},"history":{"name":"履歴","successRate":"成功率"},"links":{"name":"リンク"},"overview":{"name":"概要"},"owner":{"name":"オーナー"},"parameters":{"name":"パラメータ"},"retries":{"empty":"テストの再実行に関する情報がありません","name":"再実行"},"severity":{"name":"重大度"},"stats":{"count":{"attachments":"{{count}} 添付ファイル","attachments_plural":"{{count}} 添付ファイル","parameters":"{{count}} パラメータ","parameters_plural":"{{count}} パラメータ","steps":"{{count}} サブステップ","steps_plural":"{{count}} サブステップ"}},"status":{"empty":"ステータスに関する詳細はありません","trace":"トレースを表示"},"tags":{"name":"タグ"}},"widget":{"categories":{"name":"カテゴリー"},"categoriesTrend":{"name":"カテゴリーの傾向"},"durationTrend":{"name":"期間の傾向"},"environment":{"empty":"環境変数がありません","name":"環境","showAll":"全て表示する"},"executors":{"empty":"テスト実行者に関する情報はありません","name":"実行者","unknown":"不明"},"launches":{"empty":"開始に関する情報はありません","name":"開始"},"retryTrend":{"name":"再実行の傾向"},"suites":{"name":"スイート"},"summary":{"aggregatedName":"集計レポート","launches":"開始","launches_plural":"開始","testResults":"テストケース","testResults_plural":"テストケース"},"trend":{"name":"傾向"}}}')},5844:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"მონაცემები არაა ხელმისაწვდომი","name":"ხანგრძლივობა"},"severity":{"name":"სიმწვავე"},"status":{"name":"სტატუსი"},"trend":{"empty":"მონაცემები არაა ხელმისაწვდომი"}},"component":{"markToggle":{"hideCases":"დამალე {{mark}} ტესტის შედეგები","showCases":"გამოაჩინე {{mark}} ტესტის შედეგები"},"statusToggle":{"hideCases":"დამალე ტესტის შედეგები {{status}} სტატუსით","showCases":"გამოაჩინე ტესტის შედეგები {{status}} სტატუსით"},"tree":{"download":"ჩამოტვირთე CSV","empty":"მონაცემები არაა ხელმისაწვდომი","filter":"სტატუსი","filter-marks":"მონიშვნები","filtered":{"shown":"ნაჩვენებია {{count}}","total":"{{count}} ტესტის შედეგი","total_plural":"{{count}} ტესტის შედეგი"},"groups":"ჯგუფის ინფორმაციის გადართვა","time":{"max":{"name":"ყველაზე გრძელი","tooltip":"ყველაზე ხანგრძლივი ტესტი"},"sum":{"name":"ჯამი","tooltip":"ყველა ტესტის ხანგრძლივობის ჯამი"},"total":{"name":"სულ","tooltip":"ტესტის ხანგრძლივობა პირველი ტესტიდან ბოლოს ჩათვლით"}},"unknown":"<ცარიელი>"},"widgetStatus":{"showAll":"ყველას ჩვენება","total":"სულ {{count}} ელემენტი","total_plural":"სულ {{count}} ელემენტი"}},"controls":{"backto":"Back to","clipboard":"გაცვლის ბუფერში კოპირება","clipboardError":"გაცვლის ბიფერში კოპირება შეუძლებელია. როგორც ჩანს ეს ფუნქციონალი არაა მხარდაჭერილი ბრაუზერში","clipboardSuccess":"წარმატებით დაკოპირდა","collapse":"ჩაკეცვა","expand":"გაშლა","fullscreen":"სრულ ეკრანზე","language":"ენის შეცვლა"},"errors":{"missedAttachment":"მიმაგრებული ფაილი არ მოიძებნა","notFound":"არ მოიძებნა"},"marks":{"flaky":"არასტაბილური","newBroken":"ახალი დაზიანებული","newFailed":"ახალი წარუმატებელი","newPassed":"ახალი წარმატებული","retriesStatusChange":"სტატუსი შეიცვალა ხელახლა მცდელობისას"},"sorter":{"duration":"ხანგრძლივობა","name":"სათაური","order":"მიმდევრობა","status":"სტატუსი"},"status":{"broken":"დაზიანებული","failed":"წარუმატებელი","passed":"წარმატებული","skipped":"გამოტოვებული","unknown":"უცნობი"},"tab":{"categories":{"name":"კატეგორიები"},"graph":{"name":"გრაფიკები"},"overview":{"name":"მიმოხილვა"},"suites":{"name":"პაკეტები"},"timeline":{"name":"დროის დიაგრამა","selected":"მონიშნულია {{count}} ტესტი ({{percent}}%) {{duration}}-ზე მეტი ხანგრძლივობით","selected_plural":"მონიშნულია {{count}} ტესტი ({{percent}}%) {{duration}}-ზე მეტი ხანგრძლივობით"}},"testResult":{"categories":{"name":"კატეგორიები"},"description":{"name":"აღწერა"},"duration":{"name":"ხანგრძლივობა"},"execution":{"body":"ტესტის ძირითადი ნაწილი","downloadAttachment":{"tooltip":"გახსენი მიმაგრებული ფაილი ახალ ჩანართში"},"name":"შესრულება","setup":"მომზადება","teardown":"დასრულება"},"history":{"empty":"ისტორია არაა ხელმისაწვდომი","name":"ისტორია","statistic":"{{passed}} {{total}}-დან","successRate":"წარმატების მაჩვენებელი","time":"{{date}} {{time}}-ზე"},"links":{"name":"ბმულები"},"overview":{"name":"მიმოხილვა"},"owner":{"name":"მფლობელი"},"parameters":{"name":"პარამეტრები"},"retries":{"empty":"ინფრმაცია ხელახლა მცდელობაზე არაა ხელმისაწვდომი","name":"მცდელობები","time":"{{date}} {{time}}-ზე"},"severity":{"name":"სიმწვავე","blocker":"ბლოკერი","critical":"კრიტიკული","normal":"ჩვეულებრივი","minor":"მცირე","trivial":"უმნიშვნელო"},"stats":{"count":{"attachments":"{{count}} მიმაგრებული ფაილი","attachments_plural":"{{count}} მიმაგრებული ფაილი","parameters":"{{count}} პარამეტრი","parameters_plural":"{{count}} პარამეტრი","steps":"{{count}} ქვე-ნაბიჯი","steps_plural":"{{count}} ქვე-ნაბიჯი"}},"status":{"empty":"სტატუსის დეტალები ხელმიუწვდომელია","trace":"კვალის ჩვენება"},"tags":{"name":"ტეგები"}},"widget":{"categories":{"name":"კატეგორიები"},"categoriesTrend":{"name":"კატეგორიზებული ტენდენცია"},"durationTrend":{"name":"ხანგრძლივობის ტენდენცია"},"environment":{"empty":"გარემოს ცვლადები არაა ხელმისაწვდომი","name":"გარემო","showAll":"ყველას ჩვენება"},"executors":{"empty":"ინფორმაცია ტესტის შემსრულებელზე არაა ხელმისაწვდომი","name":"შემსრულებელი","unknown":"უცნობი"},"launches":{"empty":"გამშვებებზე ინფორმაცია არაა ხელმისაწვდომი","name":"გამშვებები"},"retryTrend":{"name":"მცდელობის ტენდენცია"},"suites":{"name":"პაკეტები"},"summary":{"aggregatedName":"საერთო ანგარიში","launches":"გაშვება","launches_plural":"გაშვება","testResults":"ტესტ ქეისი","testResults_plural":"ტესტ ქეისი"},"trend":{"name":"ტენდენცია"}}}')},7681:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"정보가 없습니다.","name":"시간"},"severity":{"name":"중요도"},"status":{"name":"상태"},"trend":{"empty":"정보가 없습니다."}},"component":{"markToggle":{"hideCases":"{{mark}} 감추기","showCases":"{{mark}} 보기"},"statusToggle":{"hideCases":"{{status}} 상태의 테스트 결과 감추기","showCases":"{{status}} 상태의 테스트 결과 보기"},"tree":{"download":"CSV 다운로드","empty":"내용이 없습니다.","filter":"상태","filter-marks":"마크","filtered":{"shown":"{{count}} 개 표시","total":"{{count}} 개의 테스트 결과","total_plural":"{{count}} 개의 테스트 결과"},"groups":"그룹 정보 표시","time":{"max":{"name":"최대","tooltip":"가장 긴 테스트 소요시간"},"sum":{"name":"합계","tooltip":"테스트 소요시간 총 합"},"total":{"name":"전체","tooltip":"첫번째 테스트부터 마지막 테스트까지의 소요시간"}},"unknown":"없는"},"widgetStatus":{"showAll":"전체보기","total":"총 {{count}} 개","total_plural":"총 {{count}} 개"}},"controls":{"backto":"돌아가기","clipboard":"클립보드에 복사","clipboardError":"클립보드에 복사가 되지 않습니다. 브러우저에 지원되지 않는 기능입니다.","clipboardSuccess":"성공적으로 복사되었습니다.","collapse":"접기","expand":"펼치기","fullscreen":"전체화면","language":"언어 변경"},"errors":{"missedAttachment":"첨부파일을 찾을 수 없습니다.","notFound":"찾을 수 없음"},"marks":{"flaky":"불안정함","newBroken":"새로운 깨진","newFailed":"새로 실패함","newPassed":"새로운 통과","retriesStatusChange":"새재시도 후 상태가 변경됨"},"sorter":{"duration":"소요시간","name":"이름","order":"순서","status":"상태"},"status":{"broken":"고장","failed":"실패","passed":"통과","skipped":"건너뜀","unknown":"알수없음"},"tab":{"categories":{"name":"카테고리"},"graph":{"name":"그래프"},"overview":{"name":"요약"},"suites":{"name":"스위트"},"timeline":{"name":"타임라인","selected":"{{duration}} 이상의 시간이 소요된 {{count}} 개 테스트 ({{percent}}%)","selected_plural":"{{duration}} 이상의 시간이 소요된 {{count}} 개 테스트 ({{percent}}%)"}},"testResult":{"categories":{"name":"카테고리"},"description":{"name":"설명"},"duration":{"name":"시간"},"execution":{"body":"테스트 내용","name":"실행","setup":"준비 작업","teardown":"종료 작업"},"history":{"name":"히스토리","successRate":"성공률"},"links":{"name":"링크"},"overview":{"name":"요약"},"owner":{"name":"소유자"},"parameters":{"name":"패러미터"},"retries":{"empty":"테스트 재시도에 대한 정보가 없습니다.","name":"재시도"},"severity":{"name":"중요도"},"stats":{"count":{"attachments":"첨부파일 {{count}} 개","attachments_plural":"첨부파일 {{count}} 개","parameters":"패러미터 {{count}} 개","parameters_plural":"패러미터 {{count}} 개","steps":"하위 스텝 {{count}} 개","steps_plural":"하위 스텝 {{count}} 개"}},"status":{"empty":"상태 정보가 없습니다.","trace":"추적 정보 보기"},"tags":{"name":"태그"}},"widget":{"categories":{"name":"카테고리"},"categoriesTrend":{"name":"카테고리 트렌드"},"durationTrend":{"name":"소요시간 트렌드"},"environment":{"empty":"환경변수가 없습니다.","name":"환경","showAll":"전체 보기"},"executors":{"empty":"실행 정보가 없습니다.","name":"실행 주체","unknown":"알 수 없음"},"launches":{"empty":"시작정보가 없습니다.","name":"시작"},"retryTrend":{"name":"재시도 트렌드"},"suites":{"name":"스위트"},"summary":{"aggregatedName":"전체 리포트","launches":"시작","launches_plural":"시작","testResults":"테스트 케이스","testResults_plural":"테스트 케이스"},"trend":{"name":"트렌드"}}}')},6266:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Er is niets te tonen","name":"Duur"},"severity":{"name":"Ernst"},"status":{"name":"Status"},"trend":{"empty":"Er is niets te tonen"}},"component":{"markToggle":{"hideCases":"Verberg testresultaten gemarkeerd als ‘{{mark}}’","showCases":"Toon testresultaten gemarkeerd als ‘{{mark}}’"},"statusToggle":{"hideCases":"Verberg testresultaten met status ‘{{status}}’","showCases":"Toon testresultaten met status ‘{{status}}’"},"tree":{"download":"Download CSV","empty":"Er zijn geen items","filter":"Status","filter-marks":"Markeringen","filtered":{"shown":"{{count}} getoond","total":"{{count}} testresultaat","total_plural":"{{count}} testresultaten"},"groups":"Groepsinformatie tonen/verbergen","time":{"max":{"name":"Langste","tooltip":"Duur van de langste test"},"sum":{"name":"Som","tooltip":"Opgetelde duur van alle tests"},"total":{"name":"Totaal","tooltip":"Doorloop van eerste test gestart tot laatste test beëindigd"}},"unknown":"<Leeg>"},"widgetStatus":{"showAll":"Toon alle","total":"{{count}} item in totaal","total_plural":"{{count}} items in totaal"}},"controls":{"backto":"Terug naar","clipboard":"Kopieer naar klembord","clipboardError":"Kan niet kopiëren naar klembord. De browser lijkt deze functionaliteit niet te ondersteunen.","clipboardSuccess":"Gekopieerd naar klembord","collapse":"Inklappen","expand":"Uitklappen","fullscreen":"Volledig scherm","language":"Taal wijzigen"},"errors":{"missedAttachment":"Bijlage niet gevonden","notFound":"Niet gevonden"},"marks":{"flaky":"Instabiel","newBroken":"Nieuw gebroken","newFailed":"Nieuw gefaald","newPassed":"Nieuw geslaagd","retriesStatusChange":"Status gewijzigd na opnieuw proberen"},"sorter":{"duration":"duur","name":"naam","order":"volgorde","status":"status"},"status":{"broken":"Defect","failed":"Gefaald","passed":"Succes","skipped":"Overgeslagen","unknown":"Onbekend"},"tab":{"categories":{"name":"Categorieën"},"graph":{"name":"Grafieken"},"overview":{"name":"Overzicht"},"suites":{"name":"Suites"},"timeline":{"name":"Tijdlijn","selected":"{{count}} test ({{percent}}%) geselecteerd met een duur van meer dan {{duration}}","selected_plural":"{{count}} tests ({{percent}}%) geselecteerd met een duur van meer dan {{duration}}"}},"testResult":{"categories":{"name":"Categorieën"},"description":{"name":"Omschrijving"},"duration":{"name":"Duur"},"execution":{"body":"Test body","downloadAttachment":{"tooltip":"Bijlage in een nieuw tabblad openen"},"name":"Uitvoering","setup":"Set up","teardown":"Tear down"},"history":{"empty":"Geen historische gegevens beschikbaar.","name":"Geschiedenis","statistic":"{{passed}} van {{total}}","successRate":"Slagingsratio","time":"{{date}} om {{time}}"},"links":{"name":"Links"},"overview":{"name":"Overzicht"},"owner":{"name":"Eigenaar"},"parameters":{"name":"Parameters"},"retries":{"empty":"Geen informatie beschikbaar.","name":"Pogingen","time":"{{date}} om {{time}}"},"severity":{"name":"Ernst"},"stats":{"count":{"attachments":"{{count}} bijlage","attachments_plural":"{{count}} bijlagen","parameters":"{{count}} parameter","parameters_plural":"{{count}} parameters","steps":"{{count}} substap","steps_plural":"{{count}} substappen"}},"status":{"empty":"Lege statusdetails","trace":"Toon trace"},"tags":{"name":"Tags"}},"widget":{"categories":{"name":"Categorieën"},"categoriesTrend":{"name":"Trend categorieën"},"durationTrend":{"name":"Trend duur"},"environment":{"empty":"Er zijn geen omgevingsvariabelen","name":"Omgeving","showAll":"Toon alles"},"executors":{"empty":"Er is geen informatie over testuitvoerders","name":"Uitvoerders","unknown":"Onbekend"},"launches":{"empty":"Er is geen informatie over starts","name":"Start"},"retryTrend":{"name":"Trend nieuwe pogingen"},"suites":{"name":"Suites"},"summary":{"aggregatedName":"Geaggregeerd rapport","launches":"start","launches_plural":"starts","testResults":"testgeval","testResults_plural":"testgevallen"},"trend":{"name":"Trend"}}}')},8496:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Brak czegokolwiek do pokazania","name":"Czas trwania"},"severity":{"name":"Ważność"},"status":{"name":"Status"},"trend":{"empty":"Brak czegokolwiek do pokazania"}},"component":{"statusToggle":{"hideCases":"Ukryj rezultaty testów ze statusem {{status}}","showCases":"Pokaż rezultaty testów ze statusem {{status}}"},"tree":{"download":"Pobierz CSV","empty":"Brak elementów","filter":"Filtrowanie według statusu","filter-marks":"Filtrowanie według oznaczenia","filtered":{"shown_0":"{{count}} pokazany","shown_1":"{{count}} pokazane","shown_2":"{{count}} pokazanych","total_0":"{{count}} rezultat testu","total_1":"{{count}} rezultaty testów","total_2":"{{count}} rezultatów testów"},"groups":"Przełącz informacje o grupach","time":{"max":{"name":"Najdłuższy","tooltip":"Najdłuższy czas trwania"},"sum":{"name":"Suma","tooltip":"Suma czasów trwania wszystkich testów"},"total":{"name":"Całkowity","tooltip":"Czas od uruchomienia pierwszego testu do zakończenia ostatniego testu"}},"unknown":"<Pusty>"},"widgetStatus":{"showAll":"Pokaż wszystko","total_0":"Razem {{count}} pozycja","total_1":"Razem {{count}} pozycje","total_2":"Razem {{count}} pozycji"}},"controls":{"backto":"Powrót do","clipboard":"Zapisz do schowka","clipboardError":"Nie można skopiować do schowka. Najprawdopodobniej twoja przeglądarka nie obsługuje tej funkcji","clipboardSuccess":"Skopiowano pomyślnie","collapse":"Zwiń","expand":"Rozwiń","fullscreen":"Pełny ekran","language":"Zmień język"},"errors":{"missedAttachment":"Nie znaleziono załącznika","notFound":"Nie znaleziono"},"marks":{"flaky":"Niestabilny","newBroken":"Nowy uszkodzony","newFailed":"Nowy nieudany","newPassed":"Nowy udany","retriesStatusChange":"Status zmieniony po ponownej próbie"},"sorter":{"duration":"czas trwania","name":"nazwa","order":"kolejność","status":"status"},"status":{"broken":"Uszkodzony","failed":"Nieudany","passed":"Pomyślny","skipped":"Pominięty","unknown":"Nieznany"},"tab":{"categories":{"name":"Kategorie"},"graph":{"name":"Wykresy"},"overview":{"name":"Podsumowanie"},"suites":{"name":"Zestawy"},"timeline":{"name":"Oś czasowa","selected_0":"{{count}} wybrany test ({{percent}}%) z czasem trwania powyżej {{duration}}","selected_1":"{{count}} wybrane testy ({{percent}}%) z czasem trwania powyżej {{duration}}","selected_2":"{{count}} wybranych testów ({{percent}}%) z czasem trwania powyżej {{duration}}"}},"testResult":{"categories":{"name":"Kategorie"},"description":{"name":"Opis"},"duration":{"name":"Czas trwania"},"execution":{"body":"Ciało testu","name":"Wykonanie","setup":"Przygotowanie","teardown":"Zakończenie"},"history":{"name":"Historia","successRate":"Współczynnik powodzenia"},"links":{"name":"Odnośniki"},"overview":{"name":"Podsumowanie"},"owner":{"name":"Właściciel"},"parameters":{"name":"Parametery"},"retries":{"empty":"Brak dostępnych informacji o powtórzeniach testów","name":"Powtórzenia"},"severity":{"name":"Ważność","blocker":"bloker","critical":"krytyczna","normal":"zwyczajna","minor":"niewielka","trivial":"minimalna"},"stats":{"count":{"attachments_0":"{{count}} załącznik","attachments_1":"{{count}} załączniki","attachments_2":"{{count}} załączników","parameters_0":"{{count}} parametr","parameters_1":"{{count}} parametry","parameters_2":"{{count}} parametrów","steps":"{{count}} podetap","steps_plural":"{{count}} podetapy"}},"status":{"empty":"Puste szczegóły statusu","trace":"Pokaż ślady"},"tags":{"name":"Tagi"}},"widget":{"categories":{"name":"Kategorie"},"categoriesTrend":{"name":"Trend kategorii"},"durationTrend":{"name":"Trend czasu trwania"},"environment":{"empty":"Brak zmiennych środowiskowych","name":"Środowisko","showAll":"Pokaż wszystkie"},"executors":{"empty":"Brak informacji o wykonawcach testów","name":"Wykonawcy","unknown":"Nieznany"},"launches":{"empty":"Brak informacji o uruchomieniach","name":"Uruchomienia"},"retryTrend":{"name":"Trend powtórzeń"},"suites":{"name":"Zestawy"},"summary":{"aggregatedName":"Raport zbiorczy","launches_0":"uruchomienie","launches_1":"uruchomienia","launches_3":"uruchomień","testResults_0":"przypadek testowy","testResults_1":"przypadki testowe","testResults_3":"przypadków testowych"},"trend":{"name":"Trend"}}}')},1105:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Нет данных","name":"Длительность тестов"},"severity":{"name":"Важность тестов"},"status":{"name":"Статусы тестов"},"trend":{"empty":"Нет данных"}},"component":{"markToggle":{"hideCases":"Скрыть {{mark}} результаты","showCases":"Показать {{mark}} результаты"},"statusToggle":{"hideCases":"Скрыть результаты со статусом \\"{{status}}\\"","showCases":"Показать результаты со статусом \\"{{status}}\\""},"tree":{"empty":"Нет данных","filter":"Статусы","filter-marks":"Метки","filtered":{"shown_0":"{{count}} показан","shown_1":"{{count}} показано","shown_2":"{{count}} показано","total_0":"всего {{count}} тест","total_1":"всего {{count}} теста","total_2":"всего {{count}} тестов"},"groups":"Показывать информацию о группах","time":{"max":{"name":"Самый долгий","tooltip":"Длительность самого долгого теста в группе"},"sum":{"name":"Суммарно","tooltip":"Сумма длительностей всех тестов в группе"},"total":{"name":"Итого","tooltip":"Время с начала первого теста до конца последнего"}},"unknown":"<Пусто>"},"widgetStatus":{"showAll":"Показать все","total_0":"Всего {{count}} элемент","total_1":"Всего {{count}} элемента","total_2":"Всего {{count}} элементов"}},"controls":{"backto":"Вернуться на","clipboard":"Скопировать в буфер обмена","clipboardError":"Ошибка. Скорее всего ваш браузер не поддерживает данную функциональность","clipboardSuccess":"Значение успешно скопировано","collapse":"Свернуть","expand":"Развернуть","fullscreen":"На весь экран","language":"Сменить язык"},"errors":{"missedAttachment":"Вложение не найдено","notFound":"Не найдено"},"marks":{"flaky":"Нестабильный","newBroken":"Новый сломанный","newFailed":"Новый упавший","newPassed":"Новый пройденный","retriesStatusChange":"Изменение статуса в перезапуске"},"sorter":{"duration":"длительность","name":"имя","order":"порядок","status":"статус"},"status":{"broken":"Сломалось","failed":"Не прошло","passed":"Прошло","skipped":"Пропущено","unknown":"Неизвестно"},"tab":{"categories":{"name":"Категории"},"graph":{"name":"Графики"},"overview":{"name":"Обзор"},"suites":{"name":"Тест сюиты"},"timeline":{"name":"Временная шкала","selected_0":"Выбран {{count}} тест ({{percent}}%) с длительностью выше {{duration}}","selected_1":"Выбрано {{count}} теста ({{percent}}%) с длительностью выше {{duration}}","selected_2":"Выбрано {{count}} тестов ({{percent}}%) с длительностью выше {{duration}}"}},"testResult":{"categories":{"name":"Категории"},"description":{"name":"Описание"},"duration":{"name":"Длительность"},"execution":{"body":"Тело теста","name":"Выполнение","setup":"Подготовка","teardown":"Завершение"},"history":{"name":"История","successRate":"Success rate"},"links":{"name":"Ссылки"},"overview":{"name":"Обзор"},"owner":{"name":"Ответственный"},"parameters":{"name":"Параметры"},"retries":{"empty":"Нет информации о перезапусках теста","name":"Перезапуски"},"severity":{"name":"Важность","blocker":"блокер","critical":"критическая","normal":"обычная","minor":"невысокая","trivial":"минимальная"},"stats":{"count":{"attachments_0":"{{count}} вложение","attachments_1":"{{count}} вложения","attachments_2":"{{count}} вложений","parameters_0":"{{count}} параметр","parameters_1":"{{count}} параметра","parameters_2":"{{count}} параметров","steps_0":"{{count}} вложенный шаг","steps_1":"{{count}} вложенных шага","steps_2":"{{count}} вложенных шагов"}},"status":{"empty":"Дополнительная информация о статусе отсутствует","trace":"Показать трейс"},"tags":{"name":"Теги"}},"widget":{"categories":{"name":"Категории"},"environment":{"empty":"Отсутствует информация про окружение","name":"Окружение","showAll":"Показать все"},"executors":{"empty":"Данные о системе выполнения тестов отсутствуют","name":"Система выполнения тестов","unknown":"Неизвестно"},"launches":{"empty":"Отсутствует информация про запуски","name":"Запуски тестов"},"suites":{"name":"Тест сюиты"},"summary":{"aggregatedName":"Агрегированый отчет","launches_0":"запуск тестов","launches_1":"запуска тестов","launches_2":"запусков тестов","testResults_0":"тестовый сценарий","testResults_1":"тестовых сценария","testResults_2":"тестовых сценариев"},"trend":{"name":"Тренд"}}}')},5517:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Det finns ingenting att visa här","name":"Varaktighet"},"severity":{"name":"Allvarlighetsgrad"},"status":{"name":"Status"},"trend":{"empty":"Det finns ingenting att visa här"}},"component":{"markToggle":{"hideCases":"Dölj testresultat med statusen {{mark}}","showCases":"Visa testresultat med statusen {{mark}}"},"statusToggle":{"hideCases":"Dölj testresultat med statusen {{status}}","showCases":"Visa testresultat med statusen {{status}}"},"tree":{"download":"Ladda ner CSV-fil","empty":"Det finns inga föremål","filter":"Status","filter-marks":"Märken","filtered":{"shown":"{{count}} visas","total":"{{count}} testresultat","total_plural":"{{count}} testresultat"},"groups":"Växla gruppinformation","time":{"max":{"name":"Max","tooltip":"Längsta testkörningstid"},"sum":{"name":"Summa","tooltip":"Summan av alla testkörningstider"},"total":{"name":"Total","tooltip":"Varaktighet från det första testet började till det sista testet avslutat"}},"unknown":"<Töm>"},"widgetStatus":{"showAll":"Visa allt","total":"{{count}} artikel totalt","total_plural":"{{count}} artiklar totalt"}},"controls":{"backto":"Tillbaka till","clipboard":"Kopiera till urklipp","clipboardError":"Kan inte kopiera värde till urklipp. Det verkar som urklippsfunktionen inte stöds för din webbläsare","clipboardSuccess":"Värdet har kopierats","collapse":"Komprimera","expand":"Utöka","fullscreen":"Helskärmsläge","language":"Ändra språk"},"errors":{"missedAttachment":"Det gick inte att hitta bilagan","notFound":"Hittades inte"},"marks":{"flaky":"Flagnande","newBroken":"Ny trasig","newFailed":"Ny misslyckades","newPassed":"Ny godkänd","retriesStatusChange":"Status ändrades efter ett nytt försök"},"sorter":{"duration":"varaktighet","name":"namn","order":"ordning","status":"status"},"status":{"broken":"Trasig","failed":"Misslyckades","passed":"Godkänt","skipped":"Skippad","unknown":"Okänd"},"tab":{"categories":{"name":"Kategorier"},"graph":{"name":"Grapher"},"overview":{"name":"Överblick"},"suites":{"name":"Testsviter"},"timeline":{"name":"Tidslinje","selected":"{{count}} test valt ({{percent}}%) med en varaktighet på över {{duration}}","selected_plural":"{{count}} tester valda ({{percent}}%) med en varaktighet på över {{duration}}"}},"testResult":{"categories":{"name":"Kategorier"},"description":{"name":"Beskrivning"},"duration":{"name":"Varaktighet"},"execution":{"body":"Teststeg","downloadAttachment":{"tooltip":"Öppna bilaga i ny flik"},"name":"Exekvering","setup":"Initiera","teardown":"Städa upp"},"history":{"empty":"Ingen händelseinformation tillgänglig.","name":"Händelser","statistic":"{{passed}} av {{total}}","successRate":"Framgångsfrekvens","time":"{{date}} kl {{time}}"},"links":{"name":"Länkar"},"overview":{"name":"Överblick"},"owner":{"name":"Ägare"},"parameters":{"name":"Parametrar"},"retries":{"empty":"Det finns ingen information tillgänglig om teståterförsök","name":"Återförsök","time":"{{date}} kl {{time}}"},"severity":{"name":"Allvarlighetsgrad","blocker":"blockare","critical":"kritisk","normal":"normal","minor":"mindre","trivial":"trivial"},"stats":{"count":{"attachments":"{{count}} bilaga","attachments_plural":"{{count}} bilagor","parameters":"{{count}} parameter","parameters_plural":"{{count}} parametrar","steps":"{{count}} delsteg","steps_plural":"{{count}} delsteg"}},"status":{"empty":"Tom statusinformation","trace":"Visa stackspår"},"tags":{"name":"Taggar"}},"widget":{"categories":{"name":"Kategorier"},"categoriesTrend":{"name":"Kategorier trend"},"durationTrend":{"name":"Varaktighet trend"},"environment":{"empty":"Det finns inga miljövariabler","name":"Miljö","showAll":"Visa allt"},"executors":{"empty":"Det finns ingen information om testagenter","name":"Testagenter","unknown":"Okänd"},"launches":{"empty":"Det finns ingen information om lanseringar","name":"Lanseringar"},"retryTrend":{"name":"Återförsöks trend"},"suites":{"name":"Testsviter"},"summary":{"aggregatedName":"Sammanlagd rapport","launches":"lansering","launches_plural":"lanseringar","testResults":"testfall","testResults_plural":"testfall"},"trend":{"name":"Trend"}}}')},3330:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"Gösterilecek bir şey yok","name":"Süre"},"severity":{"name":"Önem Derecesi"},"status":{"name":"Durum"},"trend":{"empty":"Gösterilecek bir şey yok"}},"component":{"markToggle":{"hideCases":"{{mark}} test sonuçlarını gizle","showCases":"{{mark}} test sonuçlarını göster"},"statusToggle":{"hideCases":"{{status}} durumlu test sonuçlarını gizle","showCases":"{{status}} durumlu test sonuçlarını göster"},"tree":{"download":"CSV indir","empty":"Öğe yok","filter":"Durum","filter-marks":"İşaretler","filtered":{"shown":"{{count}} gösteriliyor","total":"{{count}} test sonucu","total_plural":"{{count}} test sonucu"},"groups":"Grup bilgisini aç/kapat","time":{"max":{"name":"Maks.","tooltip":"En uzun test süresi"},"sum":{"name":"Toplam","tooltip":"Tüm test sürelerinin toplamı"},"total":{"name":"Toplam Süre","tooltip":"İlk testin başlangıcından son testin bitişine kadar geçen süre"}},"unknown":"<Boş>"},"widgetStatus":{"showAll":"Hepsini Göster","total":"{{count}} öğe toplam","total_plural":"{{count}} öğe toplam"}},"controls":{"backto":"Geri Dön","clipboard":"Panoya Kopyala","clipboardError":"Değer panoya kopyalanamadı. Tarayıcınız tarafından desteklenmediği görünüyor.","clipboardSuccess":"Başarıyla kopyalandı","collapse":"Daralt","expand":"Genişlet","fullscreen":"Tam Ekran","language":"Dili Değiştir"},"errors":{"missedAttachment":"Ek dosya bulunamadı","notFound":"Bulunamadı"},"marks":{"flaky":"Kararsız","newBroken":"Yeni Bozuk","newFailed":"Yeni Başarısız","newPassed":"Yeni Başarılı","retriesStatusChange":"Yeniden deneme sonrası durum değişikliği"},"sorter":{"duration":"süre","name":"ad","order":"sıralama","status":"durum"},"status":{"broken":"Kırık","failed":"Başarısız","passed":"Başarılı","skipped":"Atlandı","unknown":"Bilinmeyen"},"tab":{"categories":{"name":"Kategoriler"},"graph":{"name":"Grafikler"},"overview":{"name":"Genel Bakış"},"suites":{"name":"Test Suitleri"},"timeline":{"name":"Zaman Çizelgesi","selected":"{{duration}} süreden fazla süren {{count}} test (%{{percent}}) seçildi","selected_plural":"{{duration}} süreden fazla süren {{count}} test (%{{percent}}) seçildi"}},"testResult":{"categories":{"name":"Kategoriler"},"description":{"name":"Açıklama"},"duration":{"name":"Süre"},"execution":{"body":"Test gövdesi","downloadAttachment":{"tooltip":"Eki yeni bir sekmede aç"},"name":"Çalıştırma","setup":"Kurulum","teardown":"Kaldırma"},"history":{"empty":"Geçmiş bilgisi yok.","name":"Geçmiş","statistic":"{{total}}\'nin {{passed}} geçti","successRate":"Başarı oranı","time":"{{time}} tarihinde, {{date}}"},"links":{"name":"Bağlantılar"},"overview":{"name":"Genel Bakış"},"owner":{"name":"Sahip"},"parameters":{"name":"Parametreler"},"retries":{"empty":"Test yeniden deneme hakkında bilgi yok","name":"Yeniden Denemeler","time":"{{time}} tarihinde, {{date}}"},"severity":{"name":"Önem"},"stats":{"count":{"attachments":"{{count}} eklenti","attachments_plural":"{{count}} eklenti","parameters":"{{count}} parametre","parameters_plural":"{{count}} parametre","steps":"{{count}} alt adım","steps_plural":"{{count}} alt adım"}},"status":{"empty":"Boş durum ayrıntıları","trace":"İzlemeyi göster"},"tags":{"name":"Etiketler"}},"widget":{"categories":{"name":"Kategoriler"},"categoriesTrend":{"name":"Kategoriler trendi"},"durationTrend":{"name":"Süre trendi"},"environment":{"empty":"Herhangi bir çevresel değişken yok","name":"Çevre","showAll":"Hepsini göster"},"executors":{"empty":"Test yürütücüleri hakkında bilgi yok","name":"Yürütücüler","unknown":"Bilinmiyor"},"launches":{"empty":"Başlatma hakkında bilgi yok","name":"Başlatmalar"},"retryTrend":{"name":"Tekrar trendi"},"suites":{"name":"Suitler"},"summary":{"aggregatedName":"Toplu rapor","launches":"başlatma","launches_plural":"başlatmalar","testResults":"test durumu","testResults_plural":"test durumları"},"trend":{"name":"Trend"}}}')},650:function(t){"use strict";t.exports=JSON.parse('{"chart":{"duration":{"empty":"没有信息","name":"耗时"},"severity":{"name":"优先级"},"status":{"name":"状态"},"trend":{"empty":"没有信息"}},"component":{"statusToggle":{"hideCases":"隐藏{{status}}状态的用例","showCases":"显示{{status}}状态的用例"},"tree":{"empty":"没有记录","filter":"通过用例状态过滤","filtered":{"shown":"显示{{count}}个","total":"共{{count}}个用例","total_plural":"共{{count}}个用例"},"groups":"开关测试套信息","time":{"max":{"name":"最长","tooltip":"好使最长的用例"},"sum":{"name":"合并","tooltip":"所有用例耗时之和"},"total":{"name":"整体","tooltip":"从首个用例的开始时间到最后一个用例的结束时间"}},"unknown":"空小组"},"widgetStatus":{"showAll":"显示所有","total":"总共{{count}}项","total_plural":"总共{{count}}项"}},"controls":{"backto":"返回","clipboard":"复制到剪贴板","collapse":"折叠","expand":"展开","fullscreen":"全屏","language":"切换地区语言"},"errors":{"missedAttachment":"没有找到附件","notFound":"没有找到"},"marks":{"flaky":"不稳定","newBroken":"新的故障","newFailed":"新的失败","newPassed":"新的通过","retriesStatusChange":"重试后状态改变"},"sorter":{"duration":"用时","name":"名称","status":"状态"},"status":{"broken":"故障","failed":"失败","passed":"通过","skipped":"跳过","unknown":"未知"},"tab":{"categories":{"name":"类别"},"graph":{"name":"图表"},"overview":{"name":"总览"},"suites":{"name":"测试套"},"timeline":{"name":"时间刻度","selected":"{{count}}个测试用例({{percent}}%)执行时间超过{{duration}}","selected_plural":"{{count}}个测试用例({{percent}}%)执行时间超过{{duration}}"}},"testResult":{"categories":{"name":"类别"},"description":{"name":"描述"},"duration":{"name":"耗时"},"execution":{"body":"测试步骤","name":"执行","setup":"前置","teardown":"后置"},"history":{"name":"历史","successRate":"成功率"},"links":{"name":"链接"},"overview":{"name":"总览"},"owner":{"name":"作者"},"parameters":{"name":"参数"},"retries":{"name":"重试次数"},"severity":{"name":"优先级"},"stats":{"count":{"attachments":"{{count}}个附件","attachments_plural":"{{count}}个附件","parameters":"{{count}}个参数","parameters_plural":"{{count}}个参数","steps":"{{count}}个步骤","steps_plural":"{{count}}个步骤"}},"status":{"empty":"状态详情为空","trace":"展示堆栈"},"tags":{"name":"标签"}},"widget":{"categories":{"name":"类别"},"environment":{"empty":"没有环境变量","name":"环境","showAll":"显示所有"},"executors":{"empty":"没有运行器的信息","name":"运行器","unknown":"未知"},"launches":{"empty":"没有用例启动执行的信息","name":"启动"},"suites":{"name":"测试套"},"summary":{"aggregatedName":"汇总报告","launches":"启动","launches_plural":"启动","testResults":"测试用例","testResults_plural":"测试用例"},"trend":{"name":"趋势"}}}')}},e={};function n(r){var o=e[r];if(void 0!==o)return o.exports;var i=e[r]={id:r,loaded:!1,exports:{}};return t[r].call(i.exports,i,i.exports,n),i.loaded=!0,i.exports}n.n=function(t){var e=t&&t.__esModule?function(){return t.default}:function(){return t};return n.d(e,{a:e}),e},n.d=function(t,e){for(var r in e)n.o(e,r)&&!n.o(t,r)&&Object.defineProperty(t,r,{enumerable:!0,get:e[r]})},n.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(t){if("object"==typeof window)return window}}(),n.o=function(t,e){return Object.prototype.hasOwnProperty.call(t,e)},n.r=function(t){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},n.nmd=function(t){return t.paths=[],t.children||(t.children=[]),t},n.p="/",function(){"use strict";var t=n(4692),e=n.n(t),r=n(4755),o=(n.p,n(3029)),i=n(2901),a=n(388),s=n(991),l=n(3954),u=n(5361),c=n(4467);function h(t,e){let n;if(void 0===e)for(const e of t)null!=e&&(n<e||void 0===n&&e>=e)&&(n=e);else{let r=-1;for(let o of t)null!=(o=e(o,++r,t))&&(n<o||void 0===n&&o>=o)&&(n=o)}return n}function f(t,e){switch(arguments.length){case 0:break;case 1:this.range(t);break;default:this.range(e).domain(t)}return this}class p extends Map{constructor(t,e=v){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:e}}),null!=t)for(const[e,n]of t)this.set(e,n)}get(t){return super.get(d(this,t))}has(t){return super.has(d(this,t))}set(t,e){return super.set(m(this,t),e)}delete(t){return super.delete(g(this,t))}}Set;function d({_intern:t,_key:e},n){const r=e(n);return t.has(r)?t.get(r):n}function m({_intern:t,_key:e},n){const r=e(n);return t.has(r)?t.get(r):(t.set(r,n),n)}function g({_intern:t,_key:e},n){const r=e(n);return t.has(r)&&(n=t.get(r),t.delete(r)),n}function v(t){return null!==t&&"object"==typeof t?t.valueOf():t}const y=Symbol("implicit");function b(){var t=new p,e=[],n=[],r=y;function o(o){let i=t.get(o);if(void 0===i){if(r!==y)return r;t.set(o,i=e.push(o)-1)}return n[i%n.length]}return o.domain=function(n){if(!arguments.length)return e.slice();e=[],t=new p;for(const r of n)t.has(r)||t.set(r,e.push(r)-1);return o},o.range=function(t){return arguments.length?(n=Array.from(t),o):n.slice()},o.unknown=function(t){return arguments.length?(r=t,o):r},o.copy=function(){return b(e,n).unknown(r)},f.apply(o,arguments),o}function w(){var t,e,n=b().unknown(void 0),r=n.domain,o=n.range,i=0,a=1,s=!1,l=0,u=0,c=.5;function h(){var n=r().length,h=a<i,f=h?a:i,p=h?i:a;t=(p-f)/Math.max(1,n-l+2*u),s&&(t=Math.floor(t)),f+=(p-f-t*(n-l))*c,e=t*(1-l),s&&(f=Math.round(f),e=Math.round(e));var d=function(t,e,n){t=+t,e=+e,n=(o=arguments.length)<2?(e=t,t=0,1):o<3?1:+n;for(var r=-1,o=0|Math.max(0,Math.ceil((e-t)/n)),i=new Array(o);++r<o;)i[r]=t+r*n;return i}(n).map((function(e){return f+t*e}));return o(h?d.reverse():d)}return delete n.unknown,n.domain=function(t){return arguments.length?(r(t),h()):r()},n.range=function(t){return arguments.length?([i,a]=t,i=+i,a=+a,h()):[i,a]},n.rangeRound=function(t){return[i,a]=t,i=+i,a=+a,s=!0,h()},n.bandwidth=function(){return e},n.step=function(){return t},n.round=function(t){return arguments.length?(s=!!t,h()):s},n.padding=function(t){return arguments.length?(l=Math.min(1,u=+t),h()):l},n.paddingInner=function(t){return arguments.length?(l=Math.min(1,t),h()):l},n.paddingOuter=function(t){return arguments.length?(u=+t,h()):u},n.align=function(t){return arguments.length?(c=Math.max(0,Math.min(1,t)),h()):c},n.copy=function(){return w(r(),[i,a]).round(s).paddingInner(l).paddingOuter(u).align(c)},f.apply(h(),arguments)}function _(t){var e=t.copy;return t.padding=t.paddingOuter,delete t.paddingInner,delete t.paddingOuter,t.copy=function(){return _(e())},t}function x(){return _(w.apply(null,arguments).paddingInner(1))}const k=Math.sqrt(50),A=Math.sqrt(10),O=Math.sqrt(2);function E(t,e,n){const r=(e-t)/Math.max(0,n),o=Math.floor(Math.log10(r)),i=r/Math.pow(10,o),a=i>=k?10:i>=A?5:i>=O?2:1;let s,l,u;return o<0?(u=Math.pow(10,-o)/a,s=Math.round(t*u),l=Math.round(e*u),s/u<t&&++s,l/u>e&&--l,u=-u):(u=Math.pow(10,o)*a,s=Math.round(t/u),l=Math.round(e/u),s*u<t&&++s,l*u>e&&--l),l<s&&.5<=n&&n<2?E(t,e,2*n):[s,l,u]}function C(t,e,n){if(!((n=+n)>0))return[];if((t=+t)===(e=+e))return[t];const r=e<t,[o,i,a]=r?E(e,t,n):E(t,e,n);if(!(i>=o))return[];const s=i-o+1,l=new Array(s);if(r)if(a<0)for(let t=0;t<s;++t)l[t]=(i-t)/-a;else for(let t=0;t<s;++t)l[t]=(i-t)*a;else if(a<0)for(let t=0;t<s;++t)l[t]=(o+t)/-a;else for(let t=0;t<s;++t)l[t]=(o+t)*a;return l}function S(t,e,n){return E(t=+t,e=+e,n=+n)[2]}function P(t,e){return null==t||null==e?NaN:t<e?-1:t>e?1:t>=e?0:NaN}function j(t,e){return null==t||null==e?NaN:e<t?-1:e>t?1:e>=t?0:NaN}function T(t){let e,n,r;function o(t,r,o=0,i=t.length){if(o<i){if(0!==e(r,r))return i;do{const e=o+i>>>1;n(t[e],r)<0?o=e+1:i=e}while(o<i)}return o}return 2!==t.length?(e=P,n=(e,n)=>P(t(e),n),r=(e,n)=>t(e)-n):(e=t===P||t===j?t:R,n=t,r=t),{left:o,center:function(t,e,n=0,i=t.length){const a=o(t,e,n,i-1);return a>n&&r(t[a-1],e)>-r(t[a],e)?a-1:a},right:function(t,r,o=0,i=t.length){if(o<i){if(0!==e(r,r))return i;do{const e=o+i>>>1;n(t[e],r)<=0?o=e+1:i=e}while(o<i)}return o}}}function R(){return 0}const M=T(P),N=M.right;M.left,T((function(t){return null===t?NaN:+t})).center;var D=N;function B(t,e,n){t.prototype=e.prototype=n,n.constructor=t}function V(t,e){var n=Object.create(t.prototype);for(var r in e)n[r]=e[r];return n}function I(){}var L=.7,z=1/L,$="\\s*([+-]?\\d+)\\s*",F="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",U="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",H=/^#([0-9a-f]{3,8})$/,q=new RegExp(`^rgb\\(${$},${$},${$}\\)$`),W=new RegExp(`^rgb\\(${U},${U},${U}\\)$`),G=new RegExp(`^rgba\\(${$},${$},${$},${F}\\)$`),K=new RegExp(`^rgba\\(${U},${U},${U},${F}\\)$`),X=new RegExp(`^hsl\\(${F},${U},${U}\\)$`),Y=new RegExp(`^hsla\\(${F},${U},${U},${F}\\)$`),J={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function Z(){return this.rgb().formatHex()}function Q(){return this.rgb().formatRgb()}function tt(t){var e,n;return t=(t+"").trim().toLowerCase(),(e=H.exec(t))?(n=e[1].length,e=parseInt(e[1],16),6===n?et(e):3===n?new ot(e>>8&15|e>>4&240,e>>4&15|240&e,(15&e)<<4|15&e,1):8===n?nt(e>>24&255,e>>16&255,e>>8&255,(255&e)/255):4===n?nt(e>>12&15|e>>8&240,e>>8&15|e>>4&240,e>>4&15|240&e,((15&e)<<4|15&e)/255):null):(e=q.exec(t))?new ot(e[1],e[2],e[3],1):(e=W.exec(t))?new ot(255*e[1]/100,255*e[2]/100,255*e[3]/100,1):(e=G.exec(t))?nt(e[1],e[2],e[3],e[4]):(e=K.exec(t))?nt(255*e[1]/100,255*e[2]/100,255*e[3]/100,e[4]):(e=X.exec(t))?ct(e[1],e[2]/100,e[3]/100,1):(e=Y.exec(t))?ct(e[1],e[2]/100,e[3]/100,e[4]):J.hasOwnProperty(t)?et(J[t]):"transparent"===t?new ot(NaN,NaN,NaN,0):null}function et(t){return new ot(t>>16&255,t>>8&255,255&t,1)}function nt(t,e,n,r){return r<=0&&(t=e=n=NaN),new ot(t,e,n,r)}function rt(t,e,n,r){return 1===arguments.length?((o=t)instanceof I||(o=tt(o)),o?new ot((o=o.rgb()).r,o.g,o.b,o.opacity):new ot):new ot(t,e,n,null==r?1:r);var o}function ot(t,e,n,r){this.r=+t,this.g=+e,this.b=+n,this.opacity=+r}function it(){return`#${ut(this.r)}${ut(this.g)}${ut(this.b)}`}function at(){const t=st(this.opacity);return`${1===t?"rgb(":"rgba("}${lt(this.r)}, ${lt(this.g)}, ${lt(this.b)}${1===t?")":`, ${t})`}`}function st(t){return isNaN(t)?1:Math.max(0,Math.min(1,t))}function lt(t){return Math.max(0,Math.min(255,Math.round(t)||0))}function ut(t){return((t=lt(t))<16?"0":"")+t.toString(16)}function ct(t,e,n,r){return r<=0?t=e=n=NaN:n<=0||n>=1?t=e=NaN:e<=0&&(t=NaN),new ft(t,e,n,r)}function ht(t){if(t instanceof ft)return new ft(t.h,t.s,t.l,t.opacity);if(t instanceof I||(t=tt(t)),!t)return new ft;if(t instanceof ft)return t;var e=(t=t.rgb()).r/255,n=t.g/255,r=t.b/255,o=Math.min(e,n,r),i=Math.max(e,n,r),a=NaN,s=i-o,l=(i+o)/2;return s?(a=e===i?(n-r)/s+6*(n<r):n===i?(r-e)/s+2:(e-n)/s+4,s/=l<.5?i+o:2-i-o,a*=60):s=l>0&&l<1?0:a,new ft(a,s,l,t.opacity)}function ft(t,e,n,r){this.h=+t,this.s=+e,this.l=+n,this.opacity=+r}function pt(t){return(t=(t||0)%360)<0?t+360:t}function dt(t){return Math.max(0,Math.min(1,t||0))}function mt(t,e,n){return 255*(t<60?e+(n-e)*t/60:t<180?n:t<240?e+(n-e)*(240-t)/60:e)}function gt(t,e,n,r,o){var i=t*t,a=i*t;return((1-3*t+3*i-a)*e+(4-6*i+3*a)*n+(1+3*t+3*i-3*a)*r+a*o)/6}B(I,tt,{copy(t){return Object.assign(new this.constructor,this,t)},displayable(){return this.rgb().displayable()},hex:Z,formatHex:Z,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return ht(this).formatHsl()},formatRgb:Q,toString:Q}),B(ot,rt,V(I,{brighter(t){return t=null==t?z:Math.pow(z,t),new ot(this.r*t,this.g*t,this.b*t,this.opacity)},darker(t){return t=null==t?L:Math.pow(L,t),new ot(this.r*t,this.g*t,this.b*t,this.opacity)},rgb(){return this},clamp(){return new ot(lt(this.r),lt(this.g),lt(this.b),st(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:it,formatHex:it,formatHex8:function(){return`#${ut(this.r)}${ut(this.g)}${ut(this.b)}${ut(255*(isNaN(this.opacity)?1:this.opacity))}`},formatRgb:at,toString:at})),B(ft,(function(t,e,n,r){return 1===arguments.length?ht(t):new ft(t,e,n,null==r?1:r)}),V(I,{brighter(t){return t=null==t?z:Math.pow(z,t),new ft(this.h,this.s,this.l*t,this.opacity)},darker(t){return t=null==t?L:Math.pow(L,t),new ft(this.h,this.s,this.l*t,this.opacity)},rgb(){var t=this.h%360+360*(this.h<0),e=isNaN(t)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*e,o=2*n-r;return new ot(mt(t>=240?t-240:t+120,o,r),mt(t,o,r),mt(t<120?t+240:t-120,o,r),this.opacity)},clamp(){return new ft(pt(this.h),dt(this.s),dt(this.l),st(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const t=st(this.opacity);return`${1===t?"hsl(":"hsla("}${pt(this.h)}, ${100*dt(this.s)}%, ${100*dt(this.l)}%${1===t?")":`, ${t})`}`}}));var vt=t=>()=>t;function yt(t,e){return function(n){return t+n*e}}function bt(t){return 1==(t=+t)?wt:function(e,n){return n-e?function(t,e,n){return t=Math.pow(t,n),e=Math.pow(e,n)-t,n=1/n,function(r){return Math.pow(t+r*e,n)}}(e,n,t):vt(isNaN(e)?n:e)}}function wt(t,e){var n=e-t;return n?yt(t,n):vt(isNaN(t)?e:t)}var _t=function t(e){var n=bt(e);function r(t,e){var r=n((t=rt(t)).r,(e=rt(e)).r),o=n(t.g,e.g),i=n(t.b,e.b),a=wt(t.opacity,e.opacity);return function(e){return t.r=r(e),t.g=o(e),t.b=i(e),t.opacity=a(e),t+""}}return r.gamma=t,r}(1);function xt(t){return function(e){var n,r,o=e.length,i=new Array(o),a=new Array(o),s=new Array(o);for(n=0;n<o;++n)r=rt(e[n]),i[n]=r.r||0,a[n]=r.g||0,s[n]=r.b||0;return i=t(i),a=t(a),s=t(s),r.opacity=1,function(t){return r.r=i(t),r.g=a(t),r.b=s(t),r+""}}}var kt=xt((function(t){var e=t.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,e-1):Math.floor(n*e),o=t[r],i=t[r+1],a=r>0?t[r-1]:2*o-i,s=r<e-1?t[r+2]:2*i-o;return gt((n-r/e)*e,a,o,i,s)}}));xt((function(t){var e=t.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*e),o=t[(r+e-1)%e],i=t[r%e],a=t[(r+1)%e],s=t[(r+2)%e];return gt((n-r/e)*e,o,i,a,s)}}));function At(t,e){var n,r=e?e.length:0,o=t?Math.min(r,t.length):0,i=new Array(o),a=new Array(r);for(n=0;n<o;++n)i[n]=Rt(t[n],e[n]);for(;n<r;++n)a[n]=e[n];return function(t){for(n=0;n<o;++n)a[n]=i[n](t);return a}}function Ot(t,e){var n=new Date;return t=+t,e=+e,function(r){return n.setTime(t*(1-r)+e*r),n}}function Et(t,e){return t=+t,e=+e,function(n){return t*(1-n)+e*n}}function Ct(t,e){var n,r={},o={};for(n in null!==t&&"object"==typeof t||(t={}),null!==e&&"object"==typeof e||(e={}),e)n in t?r[n]=Rt(t[n],e[n]):o[n]=e[n];return function(t){for(n in r)o[n]=r[n](t);return o}}var St=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Pt=new RegExp(St.source,"g");function jt(t,e){var n,r,o,i=St.lastIndex=Pt.lastIndex=0,a=-1,s=[],l=[];for(t+="",e+="";(n=St.exec(t))&&(r=Pt.exec(e));)(o=r.index)>i&&(o=e.slice(i,o),s[a]?s[a]+=o:s[++a]=o),(n=n[0])===(r=r[0])?s[a]?s[a]+=r:s[++a]=r:(s[++a]=null,l.push({i:a,x:Et(n,r)})),i=Pt.lastIndex;return i<e.length&&(o=e.slice(i),s[a]?s[a]+=o:s[++a]=o),s.length<2?l[0]?function(t){return function(e){return t(e)+""}}(l[0].x):function(t){return function(){return t}}(e):(e=l.length,function(t){for(var n,r=0;r<e;++r)s[(n=l[r]).i]=n.x(t);return s.join("")})}function Tt(t,e){e||(e=[]);var n,r=t?Math.min(e.length,t.length):0,o=e.slice();return function(i){for(n=0;n<r;++n)o[n]=t[n]*(1-i)+e[n]*i;return o}}function Rt(t,e){var n,r,o=typeof e;return null==e||"boolean"===o?vt(e):("number"===o?Et:"string"===o?(n=tt(e))?(e=n,_t):jt:e instanceof tt?_t:e instanceof Date?Ot:(r=e,!ArrayBuffer.isView(r)||r instanceof DataView?Array.isArray(e)?At:"function"!=typeof e.valueOf&&"function"!=typeof e.toString||isNaN(e)?Ct:Et:Tt))(t,e)}function Mt(t,e){return t=+t,e=+e,function(n){return Math.round(t*(1-n)+e*n)}}function Nt(t){return+t}var Dt=[0,1];function Bt(t){return t}function Vt(t,e){return(e-=t=+t)?function(n){return(n-t)/e}:(n=isNaN(e)?NaN:.5,function(){return n});var n}function It(t,e,n){var r=t[0],o=t[1],i=e[0],a=e[1];return o<r?(r=Vt(o,r),i=n(a,i)):(r=Vt(r,o),i=n(i,a)),function(t){return i(r(t))}}function Lt(t,e,n){var r=Math.min(t.length,e.length)-1,o=new Array(r),i=new Array(r),a=-1;for(t[r]<t[0]&&(t=t.slice().reverse(),e=e.slice().reverse());++a<r;)o[a]=Vt(t[a],t[a+1]),i[a]=n(e[a],e[a+1]);return function(e){var n=D(t,e,1,r)-1;return i[n](o[n](e))}}function zt(t,e){return e.domain(t.domain()).range(t.range()).interpolate(t.interpolate()).clamp(t.clamp()).unknown(t.unknown())}function $t(){var t,e,n,r,o,i,a=Dt,s=Dt,l=Rt,u=Bt;function c(){var t=Math.min(a.length,s.length);return u!==Bt&&(u=function(t,e){var n;return t>e&&(n=t,t=e,e=n),function(n){return Math.max(t,Math.min(e,n))}}(a[0],a[t-1])),r=t>2?Lt:It,o=i=null,h}function h(e){return null==e||isNaN(e=+e)?n:(o||(o=r(a.map(t),s,l)))(t(u(e)))}return h.invert=function(n){return u(e((i||(i=r(s,a.map(t),Et)))(n)))},h.domain=function(t){return arguments.length?(a=Array.from(t,Nt),c()):a.slice()},h.range=function(t){return arguments.length?(s=Array.from(t),c()):s.slice()},h.rangeRound=function(t){return s=Array.from(t),l=Mt,c()},h.clamp=function(t){return arguments.length?(u=!!t||Bt,c()):u!==Bt},h.interpolate=function(t){return arguments.length?(l=t,c()):l},h.unknown=function(t){return arguments.length?(n=t,h):n},function(n,r){return t=n,e=r,c()}}var Ft,Ut=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function Ht(t){if(!(e=Ut.exec(t)))throw new Error("invalid format: "+t);var e;return new qt({fill:e[1],align:e[2],sign:e[3],symbol:e[4],zero:e[5],width:e[6],comma:e[7],precision:e[8]&&e[8].slice(1),trim:e[9],type:e[10]})}function qt(t){this.fill=void 0===t.fill?" ":t.fill+"",this.align=void 0===t.align?">":t.align+"",this.sign=void 0===t.sign?"-":t.sign+"",this.symbol=void 0===t.symbol?"":t.symbol+"",this.zero=!!t.zero,this.width=void 0===t.width?void 0:+t.width,this.comma=!!t.comma,this.precision=void 0===t.precision?void 0:+t.precision,this.trim=!!t.trim,this.type=void 0===t.type?"":t.type+""}function Wt(t,e){if((n=(t=e?t.toExponential(e-1):t.toExponential()).indexOf("e"))<0)return null;var n,r=t.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+t.slice(n+1)]}function Gt(t){return(t=Wt(Math.abs(t)))?t[1]:NaN}function Kt(t,e){var n=Wt(t,e);if(!n)return t+"";var r=n[0],o=n[1];return o<0?"0."+new Array(-o).join("0")+r:r.length>o+1?r.slice(0,o+1)+"."+r.slice(o+1):r+new Array(o-r.length+2).join("0")}Ht.prototype=qt.prototype,qt.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};var Xt={"%":(t,e)=>(100*t).toFixed(e),b:t=>Math.round(t).toString(2),c:t=>t+"",d:function(t){return Math.abs(t=Math.round(t))>=1e21?t.toLocaleString("en").replace(/,/g,""):t.toString(10)},e:(t,e)=>t.toExponential(e),f:(t,e)=>t.toFixed(e),g:(t,e)=>t.toPrecision(e),o:t=>Math.round(t).toString(8),p:(t,e)=>Kt(100*t,e),r:Kt,s:function(t,e){var n=Wt(t,e);if(!n)return t+"";var r=n[0],o=n[1],i=o-(Ft=3*Math.max(-8,Math.min(8,Math.floor(o/3))))+1,a=r.length;return i===a?r:i>a?r+new Array(i-a+1).join("0"):i>0?r.slice(0,i)+"."+r.slice(i):"0."+new Array(1-i).join("0")+Wt(t,Math.max(0,e+i-1))[0]},X:t=>Math.round(t).toString(16).toUpperCase(),x:t=>Math.round(t).toString(16)};function Yt(t){return t}var Jt,Zt,Qt,te=Array.prototype.map,ee=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"];function ne(t){var e,n,r=void 0===t.grouping||void 0===t.thousands?Yt:(e=te.call(t.grouping,Number),n=t.thousands+"",function(t,r){for(var o=t.length,i=[],a=0,s=e[0],l=0;o>0&&s>0&&(l+s+1>r&&(s=Math.max(1,r-l)),i.push(t.substring(o-=s,o+s)),!((l+=s+1)>r));)s=e[a=(a+1)%e.length];return i.reverse().join(n)}),o=void 0===t.currency?"":t.currency[0]+"",i=void 0===t.currency?"":t.currency[1]+"",a=void 0===t.decimal?".":t.decimal+"",s=void 0===t.numerals?Yt:function(t){return function(e){return e.replace(/[0-9]/g,(function(e){return t[+e]}))}}(te.call(t.numerals,String)),l=void 0===t.percent?"%":t.percent+"",u=void 0===t.minus?"−":t.minus+"",c=void 0===t.nan?"NaN":t.nan+"";function h(t){var e=(t=Ht(t)).fill,n=t.align,h=t.sign,f=t.symbol,p=t.zero,d=t.width,m=t.comma,g=t.precision,v=t.trim,y=t.type;"n"===y?(m=!0,y="g"):Xt[y]||(void 0===g&&(g=12),v=!0,y="g"),(p||"0"===e&&"="===n)&&(p=!0,e="0",n="=");var b="$"===f?o:"#"===f&&/[boxX]/.test(y)?"0"+y.toLowerCase():"",w="$"===f?i:/[%p]/.test(y)?l:"",_=Xt[y],x=/[defgprs%]/.test(y);function k(t){var o,i,l,f=b,k=w;if("c"===y)k=_(t)+k,t="";else{var A=(t=+t)<0||1/t<0;if(t=isNaN(t)?c:_(Math.abs(t),g),v&&(t=function(t){t:for(var e,n=t.length,r=1,o=-1;r<n;++r)switch(t[r]){case".":o=e=r;break;case"0":0===o&&(o=r),e=r;break;default:if(!+t[r])break t;o>0&&(o=0)}return o>0?t.slice(0,o)+t.slice(e+1):t}(t)),A&&0==+t&&"+"!==h&&(A=!1),f=(A?"("===h?h:u:"-"===h||"("===h?"":h)+f,k=("s"===y?ee[8+Ft/3]:"")+k+(A&&"("===h?")":""),x)for(o=-1,i=t.length;++o<i;)if(48>(l=t.charCodeAt(o))||l>57){k=(46===l?a+t.slice(o+1):t.slice(o))+k,t=t.slice(0,o);break}}m&&!p&&(t=r(t,1/0));var O=f.length+t.length+k.length,E=O<d?new Array(d-O+1).join(e):"";switch(m&&p&&(t=r(E+t,E.length?d-k.length:1/0),E=""),n){case"<":t=f+t+k+E;break;case"=":t=f+E+t+k;break;case"^":t=E.slice(0,O=E.length>>1)+f+t+k+E.slice(O);break;default:t=E+f+t+k}return s(t)}return g=void 0===g?6:/[gprs]/.test(y)?Math.max(1,Math.min(21,g)):Math.max(0,Math.min(20,g)),k.toString=function(){return t+""},k}return{format:h,formatPrefix:function(t,e){var n=h(((t=Ht(t)).type="f",t)),r=3*Math.max(-8,Math.min(8,Math.floor(Gt(e)/3))),o=Math.pow(10,-r),i=ee[8+r/3];return function(t){return n(o*t)+i}}}}function re(t,e,n,r){var o,i=function(t,e,n){n=+n;const r=(e=+e)<(t=+t),o=r?S(e,t,n):S(t,e,n);return(r?-1:1)*(o<0?1/-o:o)}(t,e,n);switch((r=Ht(null==r?",f":r)).type){case"s":var a=Math.max(Math.abs(t),Math.abs(e));return null!=r.precision||isNaN(o=function(t,e){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor(Gt(e)/3)))-Gt(Math.abs(t)))}(i,a))||(r.precision=o),Qt(r,a);case"":case"e":case"g":case"p":case"r":null!=r.precision||isNaN(o=function(t,e){return t=Math.abs(t),e=Math.abs(e)-t,Math.max(0,Gt(e)-Gt(t))+1}(i,Math.max(Math.abs(t),Math.abs(e))))||(r.precision=o-("e"===r.type));break;case"f":case"%":null!=r.precision||isNaN(o=function(t){return Math.max(0,-Gt(Math.abs(t)))}(i))||(r.precision=o-2*("%"===r.type))}return Zt(r)}function oe(t){var e=t.domain;return t.ticks=function(t){var n=e();return C(n[0],n[n.length-1],null==t?10:t)},t.tickFormat=function(t,n){var r=e();return re(r[0],r[r.length-1],null==t?10:t,n)},t.nice=function(n){null==n&&(n=10);var r,o,i=e(),a=0,s=i.length-1,l=i[a],u=i[s],c=10;for(u<l&&(o=l,l=u,u=o,o=a,a=s,s=o);c-- >0;){if((o=S(l,u,n))===r)return i[a]=l,i[s]=u,e(i);if(o>0)l=Math.floor(l/o)*o,u=Math.ceil(u/o)*o;else{if(!(o<0))break;l=Math.ceil(l*o)/o,u=Math.floor(u*o)/o}r=o}return t},t}function ie(){var t=$t()(Bt,Bt);return t.copy=function(){return zt(t,ie())},f.apply(t,arguments),oe(t)}function ae(t){for(var e=t.length/6|0,n=new Array(e),r=0;r<e;)n[r]="#"+t.slice(6*r,6*++r);return n}Jt=ne({thousands:",",grouping:[3],currency:["$",""]}),Zt=Jt.format,Qt=Jt.formatPrefix;var se=ae("1f77b4ff7f0e2ca02cd627289467bd8c564be377c27f7f7fbcbd2217becf");Array.prototype.slice;function le(t){return"object"==typeof t&&"length"in t?t:Array.from(t)}function ue(t){return function(){return t}}function ce(t,e){if((o=t.length)>1)for(var n,r,o,i=1,a=t[e[0]],s=a.length;i<o;++i)for(r=a,a=t[e[i]],n=0;n<s;++n)a[n][1]+=a[n][0]=isNaN(r[n][1])?r[n][0]:r[n][1]}function he(t){for(var e=t.length,n=new Array(e);--e>=0;)n[e]=e;return n}function fe(t,e){return t[e]}function pe(t){const e=[];return e.key=t,e}function de(t){this._context=t}function me(t){return new de(t)}de.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;default:this._context.lineTo(t,e)}}};const ge=Math.PI,ve=2*ge,ye=1e-6,be=ve-ye;function we(t){this._+=t[0];for(let e=1,n=t.length;e<n;++e)this._+=arguments[e]+t[e]}class _e{constructor(t){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=null==t?we:function(t){let e=Math.floor(t);if(!(e>=0))throw new Error(`invalid digits: ${t}`);if(e>15)return we;const n=10**e;return function(t){this._+=t[0];for(let e=1,r=t.length;e<r;++e)this._+=Math.round(arguments[e]*n)/n+t[e]}}(t)}moveTo(t,e){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+e}`}closePath(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(t,e){this._append`L${this._x1=+t},${this._y1=+e}`}quadraticCurveTo(t,e,n,r){this._append`Q${+t},${+e},${this._x1=+n},${this._y1=+r}`}bezierCurveTo(t,e,n,r,o,i){this._append`C${+t},${+e},${+n},${+r},${this._x1=+o},${this._y1=+i}`}arcTo(t,e,n,r,o){if(t=+t,e=+e,n=+n,r=+r,(o=+o)<0)throw new Error(`negative radius: ${o}`);let i=this._x1,a=this._y1,s=n-t,l=r-e,u=i-t,c=a-e,h=u*u+c*c;if(null===this._x1)this._append`M${this._x1=t},${this._y1=e}`;else if(h>ye)if(Math.abs(c*s-l*u)>ye&&o){let f=n-i,p=r-a,d=s*s+l*l,m=f*f+p*p,g=Math.sqrt(d),v=Math.sqrt(h),y=o*Math.tan((ge-Math.acos((d+h-m)/(2*g*v)))/2),b=y/v,w=y/g;Math.abs(b-1)>ye&&this._append`L${t+b*u},${e+b*c}`,this._append`A${o},${o},0,0,${+(c*f>u*p)},${this._x1=t+w*s},${this._y1=e+w*l}`}else this._append`L${this._x1=t},${this._y1=e}`;else;}arc(t,e,n,r,o,i){if(t=+t,e=+e,i=!!i,(n=+n)<0)throw new Error(`negative radius: ${n}`);let a=n*Math.cos(r),s=n*Math.sin(r),l=t+a,u=e+s,c=1^i,h=i?r-o:o-r;null===this._x1?this._append`M${l},${u}`:(Math.abs(this._x1-l)>ye||Math.abs(this._y1-u)>ye)&&this._append`L${l},${u}`,n&&(h<0&&(h=h%ve+ve),h>be?this._append`A${n},${n},0,1,${c},${t-a},${e-s}A${n},${n},0,1,${c},${this._x1=l},${this._y1=u}`:h>ye&&this._append`A${n},${n},0,${+(h>=ge)},${c},${this._x1=t+n*Math.cos(o)},${this._y1=e+n*Math.sin(o)}`)}rect(t,e,n,r){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+e}h${n=+n}v${+r}h${-n}Z`}toString(){return this._}}function xe(t){let e=3;return t.digits=function(n){if(!arguments.length)return e;if(null==n)e=null;else{const t=Math.floor(n);if(!(t>=0))throw new RangeError(`invalid digits: ${n}`);e=t}return t},()=>new _e(e)}function ke(t){return t[0]}function Ae(t){return t[1]}function Oe(t,e){var n=ue(!0),r=null,o=me,i=null,a=xe(s);function s(s){var l,u,c,h=(s=le(s)).length,f=!1;for(null==r&&(i=o(c=a())),l=0;l<=h;++l)!(l<h&&n(u=s[l],l,s))===f&&((f=!f)?i.lineStart():i.lineEnd()),f&&i.point(+t(u,l,s),+e(u,l,s));if(c)return i=null,c+""||null}return t="function"==typeof t?t:void 0===t?ke:ue(t),e="function"==typeof e?e:void 0===e?Ae:ue(e),s.x=function(e){return arguments.length?(t="function"==typeof e?e:ue(+e),s):t},s.y=function(t){return arguments.length?(e="function"==typeof t?t:ue(+t),s):e},s.defined=function(t){return arguments.length?(n="function"==typeof t?t:ue(!!t),s):n},s.curve=function(t){return arguments.length?(o=t,null!=r&&(i=o(r)),s):o},s.context=function(t){return arguments.length?(null==t?r=i=null:i=o(r=t),s):r},s}_e.prototype;var Ee=n(1391);function Ce(t){return t}var Se=1,Pe=2,je=3,Te=4,Re=1e-6;function Me(t){return"translate("+t+",0)"}function Ne(t){return"translate(0,"+t+")"}function De(t){return e=>+t(e)}function Be(t,e){return e=Math.max(0,t.bandwidth()-2*e)/2,t.round()&&(e=Math.round(e)),n=>+t(n)+e}function Ve(){return!this.__axis}function Ie(t,e){var n=[],r=null,o=null,i=6,a=6,s=3,l="undefined"!=typeof window&&window.devicePixelRatio>1?0:.5,u=t===Se||t===Te?-1:1,c=t===Te||t===Pe?"x":"y",h=t===Se||t===je?Me:Ne;function f(f){var p=null==r?e.ticks?e.ticks.apply(e,n):e.domain():r,d=null==o?e.tickFormat?e.tickFormat.apply(e,n):Ce:o,m=Math.max(i,0)+s,g=e.range(),v=+g[0]+l,y=+g[g.length-1]+l,b=(e.bandwidth?Be:De)(e.copy(),l),w=f.selection?f.selection():f,_=w.selectAll(".domain").data([null]),x=w.selectAll(".tick").data(p,e).order(),k=x.exit(),A=x.enter().append("g").attr("class","tick"),O=x.select("line"),E=x.select("text");_=_.merge(_.enter().insert("path",".tick").attr("class","domain").attr("stroke","currentColor")),x=x.merge(A),O=O.merge(A.append("line").attr("stroke","currentColor").attr(c+"2",u*i)),E=E.merge(A.append("text").attr("fill","currentColor").attr(c,u*m).attr("dy",t===Se?"0em":t===je?"0.71em":"0.32em")),f!==w&&(_=_.transition(f),x=x.transition(f),O=O.transition(f),E=E.transition(f),k=k.transition(f).attr("opacity",Re).attr("transform",(function(t){return isFinite(t=b(t))?h(t+l):this.getAttribute("transform")})),A.attr("opacity",Re).attr("transform",(function(t){var e=this.parentNode.__axis;return h((e&&isFinite(e=e(t))?e:b(t))+l)}))),k.remove(),_.attr("d",t===Te||t===Pe?a?"M"+u*a+","+v+"H"+l+"V"+y+"H"+u*a:"M"+l+","+v+"V"+y:a?"M"+v+","+u*a+"V"+l+"H"+y+"V"+u*a:"M"+v+","+l+"H"+y),x.attr("opacity",1).attr("transform",(function(t){return h(b(t)+l)})),O.attr(c+"2",u*i),E.attr(c,u*m).text(d),w.filter(Ve).attr("fill","none").attr("font-size",10).attr("font-family","sans-serif").attr("text-anchor",t===Pe?"start":t===Te?"end":"middle"),w.each((function(){this.__axis=b}))}return f.scale=function(t){return arguments.length?(e=t,f):e},f.ticks=function(){return n=Array.from(arguments),f},f.tickArguments=function(t){return arguments.length?(n=null==t?[]:Array.from(t),f):n.slice()},f.tickValues=function(t){return arguments.length?(r=null==t?null:Array.from(t),f):r&&r.slice()},f.tickFormat=function(t){return arguments.length?(o=t,f):o},f.tickSize=function(t){return arguments.length?(i=a=+t,f):i},f.tickSizeInner=function(t){return arguments.length?(i=+t,f):i},f.tickSizeOuter=function(t){return arguments.length?(a=+t,f):a},f.tickPadding=function(t){return arguments.length?(s=+t,f):s},f.offset=function(t){return arguments.length?(l=+t,f):l},f}function Le(t){return Ie(je,t)}function ze(t){return Ie(Te,t)}function $e(){}function Fe(t){return null==t?$e:function(){return this.querySelector(t)}}function Ue(){return[]}function He(t){return null==t?Ue:function(){return this.querySelectorAll(t)}}function qe(t){return function(){return null==(e=t.apply(this,arguments))?[]:Array.isArray(e)?e:Array.from(e);var e}}function We(t){return function(){return this.matches(t)}}function Ge(t){return function(e){return e.matches(t)}}var Ke=Array.prototype.find;function Xe(){return this.firstElementChild}var Ye=Array.prototype.filter;function Je(){return Array.from(this.children)}function Ze(t){return new Array(t.length)}function Qe(t,e){this.ownerDocument=t.ownerDocument,this.namespaceURI=t.namespaceURI,this._next=null,this._parent=t,this.__data__=e}function tn(t,e,n,r,o,i){for(var a,s=0,l=e.length,u=i.length;s<u;++s)(a=e[s])?(a.__data__=i[s],r[s]=a):n[s]=new Qe(t,i[s]);for(;s<l;++s)(a=e[s])&&(o[s]=a)}function en(t,e,n,r,o,i,a){var s,l,u,c=new Map,h=e.length,f=i.length,p=new Array(h);for(s=0;s<h;++s)(l=e[s])&&(p[s]=u=a.call(l,l.__data__,s,e)+"",c.has(u)?o[s]=l:c.set(u,l));for(s=0;s<f;++s)u=a.call(t,i[s],s,i)+"",(l=c.get(u))?(r[s]=l,l.__data__=i[s],c.delete(u)):n[s]=new Qe(t,i[s]);for(s=0;s<h;++s)(l=e[s])&&c.get(p[s])===l&&(o[s]=l)}function nn(t){return t.__data__}function rn(t){return"object"==typeof t&&"length"in t?t:Array.from(t)}function on(t,e){return t<e?-1:t>e?1:t>=e?0:NaN}Qe.prototype={constructor:Qe,appendChild:function(t){return this._parent.insertBefore(t,this._next)},insertBefore:function(t,e){return this._parent.insertBefore(t,e)},querySelector:function(t){return this._parent.querySelector(t)},querySelectorAll:function(t){return this._parent.querySelectorAll(t)}};var an="http://www.w3.org/1999/xhtml",sn={svg:"http://www.w3.org/2000/svg",xhtml:an,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function ln(t){var e=t+="",n=e.indexOf(":");return n>=0&&"xmlns"!==(e=t.slice(0,n))&&(t=t.slice(n+1)),sn.hasOwnProperty(e)?{space:sn[e],local:t}:t}function un(t){return function(){this.removeAttribute(t)}}function cn(t){return function(){this.removeAttributeNS(t.space,t.local)}}function hn(t,e){return function(){this.setAttribute(t,e)}}function fn(t,e){return function(){this.setAttributeNS(t.space,t.local,e)}}function pn(t,e){return function(){var n=e.apply(this,arguments);null==n?this.removeAttribute(t):this.setAttribute(t,n)}}function dn(t,e){return function(){var n=e.apply(this,arguments);null==n?this.removeAttributeNS(t.space,t.local):this.setAttributeNS(t.space,t.local,n)}}function mn(t){return t.ownerDocument&&t.ownerDocument.defaultView||t.document&&t||t.defaultView}function gn(t){return function(){this.style.removeProperty(t)}}function vn(t,e,n){return function(){this.style.setProperty(t,e,n)}}function yn(t,e,n){return function(){var r=e.apply(this,arguments);null==r?this.style.removeProperty(t):this.style.setProperty(t,r,n)}}function bn(t,e){return t.style.getPropertyValue(e)||mn(t).getComputedStyle(t,null).getPropertyValue(e)}function wn(t){return function(){delete this[t]}}function _n(t,e){return function(){this[t]=e}}function xn(t,e){return function(){var n=e.apply(this,arguments);null==n?delete this[t]:this[t]=n}}function kn(t){return t.trim().split(/^|\s+/)}function An(t){return t.classList||new On(t)}function On(t){this._node=t,this._names=kn(t.getAttribute("class")||"")}function En(t,e){for(var n=An(t),r=-1,o=e.length;++r<o;)n.add(e[r])}function Cn(t,e){for(var n=An(t),r=-1,o=e.length;++r<o;)n.remove(e[r])}function Sn(t){return function(){En(this,t)}}function Pn(t){return function(){Cn(this,t)}}function jn(t,e){return function(){(e.apply(this,arguments)?En:Cn)(this,t)}}function Tn(){this.textContent=""}function Rn(t){return function(){this.textContent=t}}function Mn(t){return function(){var e=t.apply(this,arguments);this.textContent=null==e?"":e}}function Nn(){this.innerHTML=""}function Dn(t){return function(){this.innerHTML=t}}function Bn(t){return function(){var e=t.apply(this,arguments);this.innerHTML=null==e?"":e}}function Vn(){this.nextSibling&&this.parentNode.appendChild(this)}function In(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function Ln(t){return function(){var e=this.ownerDocument,n=this.namespaceURI;return n===an&&e.documentElement.namespaceURI===an?e.createElement(t):e.createElementNS(n,t)}}function zn(t){return function(){return this.ownerDocument.createElementNS(t.space,t.local)}}function $n(t){var e=ln(t);return(e.local?zn:Ln)(e)}function Fn(){return null}function Un(){var t=this.parentNode;t&&t.removeChild(this)}function Hn(){var t=this.cloneNode(!1),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function qn(){var t=this.cloneNode(!0),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function Wn(t){return function(){var e=this.__on;if(e){for(var n,r=0,o=-1,i=e.length;r<i;++r)n=e[r],t.type&&n.type!==t.type||n.name!==t.name?e[++o]=n:this.removeEventListener(n.type,n.listener,n.options);++o?e.length=o:delete this.__on}}}function Gn(t,e,n){return function(){var r,o=this.__on,i=function(t){return function(e){t.call(this,e,this.__data__)}}(e);if(o)for(var a=0,s=o.length;a<s;++a)if((r=o[a]).type===t.type&&r.name===t.name)return this.removeEventListener(r.type,r.listener,r.options),this.addEventListener(r.type,r.listener=i,r.options=n),void(r.value=e);this.addEventListener(t.type,i,n),r={type:t.type,name:t.name,value:e,listener:i,options:n},o?o.push(r):this.__on=[r]}}function Kn(t,e,n){var r=mn(t),o=r.CustomEvent;"function"==typeof o?o=new o(e,n):(o=r.document.createEvent("Event"),n?(o.initEvent(e,n.bubbles,n.cancelable),o.detail=n.detail):o.initEvent(e,!1,!1)),t.dispatchEvent(o)}function Xn(t,e){return function(){return Kn(this,t,e)}}function Yn(t,e){return function(){return Kn(this,t,e.apply(this,arguments))}}On.prototype={add:function(t){this._names.indexOf(t)<0&&(this._names.push(t),this._node.setAttribute("class",this._names.join(" ")))},remove:function(t){var e=this._names.indexOf(t);e>=0&&(this._names.splice(e,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(t){return this._names.indexOf(t)>=0}};var Jn=[null];function Zn(t,e){this._groups=t,this._parents=e}function Qn(){return new Zn([[document.documentElement]],Jn)}Zn.prototype=Qn.prototype={constructor:Zn,select:function(t){"function"!=typeof t&&(t=Fe(t));for(var e=this._groups,n=e.length,r=new Array(n),o=0;o<n;++o)for(var i,a,s=e[o],l=s.length,u=r[o]=new Array(l),c=0;c<l;++c)(i=s[c])&&(a=t.call(i,i.__data__,c,s))&&("__data__"in i&&(a.__data__=i.__data__),u[c]=a);return new Zn(r,this._parents)},selectAll:function(t){t="function"==typeof t?qe(t):He(t);for(var e=this._groups,n=e.length,r=[],o=[],i=0;i<n;++i)for(var a,s=e[i],l=s.length,u=0;u<l;++u)(a=s[u])&&(r.push(t.call(a,a.__data__,u,s)),o.push(a));return new Zn(r,o)},selectChild:function(t){return this.select(null==t?Xe:function(t){return function(){return Ke.call(this.children,t)}}("function"==typeof t?t:Ge(t)))},selectChildren:function(t){return this.selectAll(null==t?Je:function(t){return function(){return Ye.call(this.children,t)}}("function"==typeof t?t:Ge(t)))},filter:function(t){"function"!=typeof t&&(t=We(t));for(var e=this._groups,n=e.length,r=new Array(n),o=0;o<n;++o)for(var i,a=e[o],s=a.length,l=r[o]=[],u=0;u<s;++u)(i=a[u])&&t.call(i,i.__data__,u,a)&&l.push(i);return new Zn(r,this._parents)},data:function(t,e){if(!arguments.length)return Array.from(this,nn);var n,r=e?en:tn,o=this._parents,i=this._groups;"function"!=typeof t&&(n=t,t=function(){return n});for(var a=i.length,s=new Array(a),l=new Array(a),u=new Array(a),c=0;c<a;++c){var h=o[c],f=i[c],p=f.length,d=rn(t.call(h,h&&h.__data__,c,o)),m=d.length,g=l[c]=new Array(m),v=s[c]=new Array(m);r(h,f,g,v,u[c]=new Array(p),d,e);for(var y,b,w=0,_=0;w<m;++w)if(y=g[w]){for(w>=_&&(_=w+1);!(b=v[_])&&++_<m;);y._next=b||null}}return(s=new Zn(s,o))._enter=l,s._exit=u,s},enter:function(){return new Zn(this._enter||this._groups.map(Ze),this._parents)},exit:function(){return new Zn(this._exit||this._groups.map(Ze),this._parents)},join:function(t,e,n){var r=this.enter(),o=this,i=this.exit();return"function"==typeof t?(r=t(r))&&(r=r.selection()):r=r.append(t+""),null!=e&&(o=e(o))&&(o=o.selection()),null==n?i.remove():n(i),r&&o?r.merge(o).order():o},merge:function(t){for(var e=t.selection?t.selection():t,n=this._groups,r=e._groups,o=n.length,i=r.length,a=Math.min(o,i),s=new Array(o),l=0;l<a;++l)for(var u,c=n[l],h=r[l],f=c.length,p=s[l]=new Array(f),d=0;d<f;++d)(u=c[d]||h[d])&&(p[d]=u);for(;l<o;++l)s[l]=n[l];return new Zn(s,this._parents)},selection:function(){return this},order:function(){for(var t=this._groups,e=-1,n=t.length;++e<n;)for(var r,o=t[e],i=o.length-1,a=o[i];--i>=0;)(r=o[i])&&(a&&4^r.compareDocumentPosition(a)&&a.parentNode.insertBefore(r,a),a=r);return this},sort:function(t){function e(e,n){return e&&n?t(e.__data__,n.__data__):!e-!n}t||(t=on);for(var n=this._groups,r=n.length,o=new Array(r),i=0;i<r;++i){for(var a,s=n[i],l=s.length,u=o[i]=new Array(l),c=0;c<l;++c)(a=s[c])&&(u[c]=a);u.sort(e)}return new Zn(o,this._parents).order()},call:function(){var t=arguments[0];return arguments[0]=this,t.apply(null,arguments),this},nodes:function(){return Array.from(this)},node:function(){for(var t=this._groups,e=0,n=t.length;e<n;++e)for(var r=t[e],o=0,i=r.length;o<i;++o){var a=r[o];if(a)return a}return null},size:function(){let t=0;for(const e of this)++t;return t},empty:function(){return!this.node()},each:function(t){for(var e=this._groups,n=0,r=e.length;n<r;++n)for(var o,i=e[n],a=0,s=i.length;a<s;++a)(o=i[a])&&t.call(o,o.__data__,a,i);return this},attr:function(t,e){var n=ln(t);if(arguments.length<2){var r=this.node();return n.local?r.getAttributeNS(n.space,n.local):r.getAttribute(n)}return this.each((null==e?n.local?cn:un:"function"==typeof e?n.local?dn:pn:n.local?fn:hn)(n,e))},style:function(t,e,n){return arguments.length>1?this.each((null==e?gn:"function"==typeof e?yn:vn)(t,e,null==n?"":n)):bn(this.node(),t)},property:function(t,e){return arguments.length>1?this.each((null==e?wn:"function"==typeof e?xn:_n)(t,e)):this.node()[t]},classed:function(t,e){var n=kn(t+"");if(arguments.length<2){for(var r=An(this.node()),o=-1,i=n.length;++o<i;)if(!r.contains(n[o]))return!1;return!0}return this.each(("function"==typeof e?jn:e?Sn:Pn)(n,e))},text:function(t){return arguments.length?this.each(null==t?Tn:("function"==typeof t?Mn:Rn)(t)):this.node().textContent},html:function(t){return arguments.length?this.each(null==t?Nn:("function"==typeof t?Bn:Dn)(t)):this.node().innerHTML},raise:function(){return this.each(Vn)},lower:function(){return this.each(In)},append:function(t){var e="function"==typeof t?t:$n(t);return this.select((function(){return this.appendChild(e.apply(this,arguments))}))},insert:function(t,e){var n="function"==typeof t?t:$n(t),r=null==e?Fn:"function"==typeof e?e:Fe(e);return this.select((function(){return this.insertBefore(n.apply(this,arguments),r.apply(this,arguments)||null)}))},remove:function(){return this.each(Un)},clone:function(t){return this.select(t?qn:Hn)},datum:function(t){return arguments.length?this.property("__data__",t):this.node().__data__},on:function(t,e,n){var r,o,i=function(t){return t.trim().split(/^|\s+/).map((function(t){var e="",n=t.indexOf(".");return n>=0&&(e=t.slice(n+1),t=t.slice(0,n)),{type:t,name:e}}))}(t+""),a=i.length;if(!(arguments.length<2)){for(s=e?Gn:Wn,r=0;r<a;++r)this.each(s(i[r],e,n));return this}var s=this.node().__on;if(s)for(var l,u=0,c=s.length;u<c;++u)for(r=0,l=s[u];r<a;++r)if((o=i[r]).type===l.type&&o.name===l.name)return l.value},dispatch:function(t,e){return this.each(("function"==typeof e?Yn:Xn)(t,e))},[Symbol.iterator]:function*(){for(var t=this._groups,e=0,n=t.length;e<n;++e)for(var r,o=t[e],i=0,a=o.length;i<a;++i)(r=o[i])&&(yield r)}};var tr=Qn;function er(t){return"string"==typeof t?new Zn([[document.querySelector(t)]],[document.documentElement]):new Zn([[t]],Jn)}var nr=n(2651),rr=n.n(nr);function or(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,ir()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function ir(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(ir=function(){return!!t})()}var ar=function(t){function e(t){var n;return(0,o.A)(this,e),n=or(this,e,[t]),(0,c.A)(n,"PAD_LEFT",50),(0,c.A)(n,"PAD_RIGHT",15),(0,c.A)(n,"PAD_TOP",10),(0,c.A)(n,"PAD_BOTTOM",30),n.options=t,n.firstRender=!0,n}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onRender",value:function(){er(window).on("resize.".concat(this.cid),this.onAttach.bind(this))}},{key:"onDestroy",value:function(){er(window).on("resize.".concat(this.cid),null)}},{key:"onAttach",value:function(){this.firstRender=!1}},{key:"setupViewport",value:function(){this.width=Math.floor(this.$el.outerWidth())-this.PAD_LEFT-this.PAD_RIGHT,this.height=Math.floor(this.$el.outerHeight())-this.PAD_BOTTOM-this.PAD_TOP,this.$el.html(rr()(this)),this.svg=er(this.$el[0]).select(".chart__svg"),this.plot=this.svg.select(".chart__plot")}},{key:"makeLeftAxis",value:function(t){var e=ze();return this.makeAxis(e,this.svg.select(".chart__axis_y"),t,{left:this.PAD_LEFT,top:this.PAD_TOP})}},{key:"makeBottomAxis",value:function(t){var e=Le();return this.makeAxis(e,this.svg.select(".chart__axis_x"),t,{left:this.PAD_LEFT,top:this.PAD_TOP+this.height})}},{key:"makeAxis",value:function(t,e,n){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},o=r.left,i=void 0===o?0:o,a=r.top,s=void 0===a?0:a;return Object.keys(n).forEach((function(e){return t[e](n[e])})),e.call(t).attr("transform","translate(".concat(i,",").concat(s,")")),t}},{key:"getTooltipContent",value:function(){}},{key:"onItemOver",value:function(t,e){this.showTooltip(e,t.target)}},{key:"showTooltip",value:function(t,e){this.tooltip.show(this.getTooltipContent(t),this.$(e))}},{key:"hideTooltip",value:function(){this.tooltip.hide()}},{key:"bindTooltip",value:function(t){t.on("mouseenter",this.onItemOver.bind(this)).on("mouseleave",this.hideTooltip.bind(this))}}])}(Ee.View),sr=n(3678),lr=n(9237),ur=n(2703),cr=n.n(ur);function hr(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function fr(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?hr(Object(n),!0).forEach((function(e){(0,c.A)(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):hr(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}function pr(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,dr()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function dr(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(dr=function(){return!!t})()}var mr=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=pr(this,e,[].concat(r)),(0,c.A)(t,"PAD_BOTTOM",50),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){this.x=x(),this.y=ie(),this.tooltip=new sr.A({position:"top"}),this.keys=t.keys||this.model.keys(),this.stack=function(){var t=ue([]),e=he,n=ce,r=fe;function o(o){var i,a,s=Array.from(t.apply(this,arguments),pe),l=s.length,u=-1;for(const t of o)for(i=0,++u;i<l;++i)(s[i][u]=[0,+r(t,s[i].key,u,o)]).data=t;for(i=0,a=le(e(s));i<l;++i)s[a[i]].index=i;return n(s,a),s}return o.keys=function(e){return arguments.length?(t="function"==typeof e?e:ue(Array.from(e)),o):t},o.value=function(t){return arguments.length?(r="function"==typeof t?t:ue(+t),o):r},o.order=function(t){return arguments.length?(e=null==t?he:"function"==typeof t?t:ue(Array.from(t)),o):e},o.offset=function(t){return arguments.length?(n=null==t?ce:t,o):n},o}().keys(this.keys).value((function(t,e){return t.data[e]||0})),this.color=t.colors||b(se),t.notStacked&&this.stack.offset((function(){})),this.yTickFormat=t.yTickFormat||function(t){return t}}},{key:"onAttach",value:function(){var t=this.model.toJSON();t&&t.length>1?this.doShow(t):this.$el.html('<div class="widget__noitems">'.concat((0,lr.default)("chart.trend.empty"),"</div>")),(0,s.A)((0,l.A)(e.prototype),"onAttach",this).call(this)}},{key:"doShow",value:function(t){this.setupViewport(),this.x.range([0,this.width]),this.y.range([this.height,0]),this.x.domain(t.map((function(t){return t.id}))),this.y.domain([0,h(t,(function(t){return t.total}))]).nice();var e=this.stack(t);this.makeBottomAxis({scale:this.x,tickFormat:function(e,n){return t[n].name}}),this.makeLeftAxis({scale:this.y,tickFormat:this.yTickFormat}),"rtl"===document.dir?this.svg.selectAll(".chart__axis_x").selectAll("text").style("text-anchor","start"):this.svg.selectAll(".chart__axis_x").selectAll("text").style("text-anchor","end"),this.svg.selectAll(".chart__axis_x").selectAll("text").attr("dx","-.8em").attr("dy","-.6em").attr("transform","rotate(-90)"),this.options.hideAreas||this.showAreas(e),this.options.hideLines||this.showLines(e),this.options.hidePoints||this.showPoints(e),this.showSlices(t)}},{key:"showAreas",value:function(t){var e=this,n=function(t,e,n){var r=null,o=ue(!0),i=null,a=me,s=null,l=xe(u);function u(u){var c,h,f,p,d,m=(u=le(u)).length,g=!1,v=new Array(m),y=new Array(m);for(null==i&&(s=a(d=l())),c=0;c<=m;++c){if(!(c<m&&o(p=u[c],c,u))===g)if(g=!g)h=c,s.areaStart(),s.lineStart();else{for(s.lineEnd(),s.lineStart(),f=c-1;f>=h;--f)s.point(v[f],y[f]);s.lineEnd(),s.areaEnd()}g&&(v[c]=+t(p,c,u),y[c]=+e(p,c,u),s.point(r?+r(p,c,u):v[c],n?+n(p,c,u):y[c]))}if(d)return s=null,d+""||null}function c(){return Oe().defined(o).curve(a).context(i)}return t="function"==typeof t?t:void 0===t?ke:ue(+t),e="function"==typeof e?e:ue(void 0===e?0:+e),n="function"==typeof n?n:void 0===n?Ae:ue(+n),u.x=function(e){return arguments.length?(t="function"==typeof e?e:ue(+e),r=null,u):t},u.x0=function(e){return arguments.length?(t="function"==typeof e?e:ue(+e),u):t},u.x1=function(t){return arguments.length?(r=null==t?null:"function"==typeof t?t:ue(+t),u):r},u.y=function(t){return arguments.length?(e="function"==typeof t?t:ue(+t),n=null,u):e},u.y0=function(t){return arguments.length?(e="function"==typeof t?t:ue(+t),u):e},u.y1=function(t){return arguments.length?(n=null==t?null:"function"==typeof t?t:ue(+t),u):n},u.lineX0=u.lineY0=function(){return c().x(t).y(e)},u.lineY1=function(){return c().x(t).y(n)},u.lineX1=function(){return c().x(r).y(e)},u.defined=function(t){return arguments.length?(o="function"==typeof t?t:ue(!!t),u):o},u.curve=function(t){return arguments.length?(a=t,null!=i&&(s=a(i)),u):a},u.context=function(t){return arguments.length?(null==t?i=s=null:s=a(i=t),u):i},u}().x((function(t){return e.x(t.data.id)})).y0((function(t){return e.y(t[0])})).y1((function(t){return e.y(t[1])}));this.plot.selectAll(".trend__area").data(t).enter().append("path").attr("class","trend__area").attr("d",n).style("fill",(function(t){return e.color(t.key)})).style("opacity",.85)}},{key:"showLines",value:function(t){var e=this,n=Oe().x((function(t){return e.x(t.data.id)})).y((function(t){return e.y(t[1])}));this.plot.selectAll(".trend__line").data(t).enter().append("path").attr("class",".trend__line").attr("d",n).style("stroke-width",2).style("stroke",(function(t){return e.color(t.key)}))}},{key:"showPoints",value:function(t){var e=this;this.plot.selectAll(".trend_points").data(t).enter().append("g").attr("class",".trend_point").style("fill",(function(t){return e.color(t.key)})).selectAll(".trend_point").data((function(t){return t})).enter().append("circle").attr("r",2).attr("cx",(function(t){return e.x(t.data.id)})).attr("cy",(function(t){return e.y(t[1])})).attr("class","trend_point")}},{key:"showSlices",value:function(t){var e=this;this.plot.selectAll(".slice").data(t).enter().append("g").attr("class","slice"),this.plot.selectAll(".slice").filter((function(t){return t.reportUrl})).append("a").attr("class","edge").filter((function(t){return t.reportUrl})).attr("xlink:href",(function(t){return t.reportUrl})),this.plot.selectAll(".slice").filter((function(t){return!t.reportUrl})).append("g").attr("class","edge"),this.plot.selectAll(".edge").append("line").attr("id",(function(t){return t.id})).attr("x1",(function(t){return e.x(t.id)})).attr("y1",(function(t){return e.y(t.total)})).attr("x2",(function(t){return e.x(t.id)})).attr("y2",this.y(0)).attr("stroke","white").attr("stroke-width",1).attr("class","report-line"),this.plot.selectAll(".edge").append("rect").style("opacity",0).attr("class","report-edge").attr("x",(function(t,n){return n>0?e.x(t.id)-e.x.step()/2:0})).attr("y",0).attr("height",this.height).attr("width",(function(t,n){return 0===n||e.x(t.id)===e.width?e.x.step()/2:e.x.step()})).on("mouseover",(function(t,n){var r=e.plot.append("circle").attr("class","anchor").attr("cx","".concat(e.x(n.id))).attr("cy","".concat(e.y(n.total/2)));e.showTooltip(n,r.node())})).on("mouseout",(function(){e.plot.selectAll(".anchor").remove(),e.hideTooltip()}))}},{key:"getTooltipContent",value:function(t){var e=this,n=fr(fr({},t),{},{data:this.keys.map((function(n){return{key:n,num:e.yTickFormat(t.data[n]),color:e.color(n)}})).filter((function(t){return!!t.num})).reverse()});return cr()(n)}}])}(ar),gr=mr,vr=n(8603),yr=n(5917),br=n.n(yr);function wr(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,_r()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function _r(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(_r=function(){return!!t})()}var xr=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=wr(this,e,[].concat(r)),(0,c.A)(t,"template",br()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){var t=void 0===this.showLinks||this.showLinks,n=void 0===this.showAll||this.showAll;return Object.assign((0,s.A)((0,l.A)(e.prototype),"serializeData",this).call(this),{rowTag:t?"a":"span",title:this.title,showAll:n,baseUrl:this.baseUrl})}}])}(vr.View),kr=n(4523),Ar=n(5193);function Or(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function Er(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?Or(Object(n),!0).forEach((function(e){(0,c.A)(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):Or(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}function Cr(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Sr()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Sr(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Sr=function(){return!!t})()}var Pr,jr=function(t){function e(){return(0,o.A)(this,e),Cr(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t,e){this.options=e,this.url="widgets/".concat(this.options.name,".json")}},{key:"fetch",value:function(t){var n=this;return(0,Ar._)(this.url,"application/json").then((function(r){return(0,s.A)((0,l.A)(e.prototype),"fetch",n).call(n,Er(Er({},t),{},{url:r}))}))}},{key:"parse",value:function(t){return t.reverse().map((function(t,e){return Er(Er({},t),{},{id:e,name:t.buildOrder?"#".concat(t.buildOrder):"",total:(0,kr.values)((0,kr.omit)(t.data,"total")).reduce((function(t,e){return t+e}),0),data:(0,kr.omit)(t.data,"total")})}))}},{key:"keys",value:function(){return(0,kr.uniq)((0,kr.flatten)(this.map((function(t){return(0,kr.keys)(t.get("data"))}))))}},{key:"sortedKeysByLastValue",value:function(){var t=this.keys(),e=this.last().get("data");return t.sort((function(t,n){return(e[n]||0)-(e[t]||0)}))}}])}(Ee.Collection),Tr=n(8563),Rr=n(8262),Mr=n(2854),Nr=n(5258),Dr=n.n(Nr);function Br(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Vr()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Vr(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Vr=function(){return!!t})()}var Ir,Lr=(0,Mr.s7)("empty-view")(Pr=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Br(this,e,[].concat(r)),(0,c.A)(t,"template",Dr()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){return{cls:this.className,message:this.options.message}}}])}(vr.View))||Pr,zr=Lr,$r=n(2319),Fr="undefined"!=typeof window?window:null,Ur=null===Fr,Hr=Ur?void 0:Fr.document,qr="addEventListener",Wr="removeEventListener",Gr="getBoundingClientRect",Kr="_a",Xr="_b",Yr="_c",Jr="horizontal",Zr=function(){return!1},Qr=Ur?"calc":["","-webkit-","-moz-","-o-"].filter((function(t){var e=Hr.createElement("div");return e.style.cssText="width:"+t+"calc(9px)",!!e.style.length})).shift()+"calc",to=function(t){return"string"==typeof t||t instanceof String},eo=function(t){if(to(t)){var e=Hr.querySelector(t);if(!e)throw new Error("Selector "+t+" did not match a DOM element");return e}return t},no=function(t,e,n){var r=t[e];return void 0!==r?r:n},ro=function(t,e,n,r){if(e){if("end"===r)return 0;if("center"===r)return t/2}else if(n){if("start"===r)return 0;if("center"===r)return t/2}return t},oo=function(t,e){var n=Hr.createElement("div");return n.className="gutter gutter-"+e,n},io=function(t,e,n){var r={};return to(e)?r[t]=e:r[t]=Qr+"("+e+"% - "+n+"px)",r},ao=function(t,e){var n;return(n={})[t]=e+"px",n},so=function(t,e){if(void 0===e&&(e={}),Ur)return{};var n,r,o,i,a,s,l=t;Array.from&&(l=Array.from(l));var u=eo(l[0]).parentNode,c=getComputedStyle?getComputedStyle(u):null,h=c?c.flexDirection:null,f=no(e,"sizes")||l.map((function(){return 100/l.length})),p=no(e,"minSize",100),d=Array.isArray(p)?p:l.map((function(){return p})),m=no(e,"maxSize",1/0),g=Array.isArray(m)?m:l.map((function(){return m})),v=no(e,"expandToMin",!1),y=no(e,"gutterSize",10),b=no(e,"gutterAlign","center"),w=no(e,"snapOffset",30),_=Array.isArray(w)?w:l.map((function(){return w})),x=no(e,"dragInterval",1),k=no(e,"direction",Jr),A=no(e,"cursor",k===Jr?"col-resize":"row-resize"),O=no(e,"gutter",oo),E=no(e,"elementStyle",io),C=no(e,"gutterStyle",ao);function S(t,e,r,o){var i=E(n,e,r,o);Object.keys(i).forEach((function(e){t.style[e]=i[e]}))}function P(){return s.map((function(t){return t.size}))}function j(t){return"touches"in t?t.touches[0][r]:t[r]}function T(t){var e=s[this.a],n=s[this.b],r=e.size+n.size;e.size=t/this.size*r,n.size=r-t/this.size*r,S(e.element,e.size,this[Xr],e.i),S(n.element,n.size,this[Yr],n.i)}function R(t){var n,r=s[this.a],o=s[this.b];this.dragging&&(n=j(t)-this.start+(this[Xr]-this.dragOffset),x>1&&(n=Math.round(n/x)*x),n<=r.minSize+r.snapOffset+this[Xr]?n=r.minSize+this[Xr]:n>=this.size-(o.minSize+o.snapOffset+this[Yr])&&(n=this.size-(o.minSize+this[Yr])),n>=r.maxSize-r.snapOffset+this[Xr]?n=r.maxSize+this[Xr]:n<=this.size-(o.maxSize-o.snapOffset+this[Yr])&&(n=this.size-(o.maxSize+this[Yr])),T.call(this,n),no(e,"onDrag",Zr)(P()))}function M(){var t=s[this.a].element,e=s[this.b].element,r=t[Gr](),a=e[Gr]();this.size=r[n]+a[n]+this[Xr]+this[Yr],this.start=r[o],this.end=r[i]}function N(t){var e=function(t){if(!getComputedStyle)return null;var e=getComputedStyle(t);if(!e)return null;var n=t[a];return 0===n?null:n-=k===Jr?parseFloat(e.paddingLeft)+parseFloat(e.paddingRight):parseFloat(e.paddingTop)+parseFloat(e.paddingBottom)}(u);if(null===e)return t;if(d.reduce((function(t,e){return t+e}),0)>e)return t;var n=0,r=[],o=t.map((function(o,i){var a=e*o/100,s=ro(y,0===i,i===t.length-1,b),l=d[i]+s;return a<l?(n+=l-a,r.push(0),l):(r.push(a-l),a)}));return 0===n?t:o.map((function(t,o){var i=t;if(n>0&&r[o]-n>0){var a=Math.min(n,r[o]-n);n-=a,i=t-a}return i/e*100}))}function D(){var t=this,n=s[t.a].element,r=s[t.b].element;t.dragging&&no(e,"onDragEnd",Zr)(P()),t.dragging=!1,Fr[Wr]("mouseup",t.stop),Fr[Wr]("touchend",t.stop),Fr[Wr]("touchcancel",t.stop),Fr[Wr]("mousemove",t.move),Fr[Wr]("touchmove",t.move),t.stop=null,t.move=null,n[Wr]("selectstart",Zr),n[Wr]("dragstart",Zr),r[Wr]("selectstart",Zr),r[Wr]("dragstart",Zr),n.style.userSelect="",n.style.webkitUserSelect="",n.style.MozUserSelect="",n.style.pointerEvents="",r.style.userSelect="",r.style.webkitUserSelect="",r.style.MozUserSelect="",r.style.pointerEvents="",t.gutter.style.cursor="",t.parent.style.cursor="",Hr.body.style.cursor=""}function B(t){if(!("button"in t)||0===t.button){var n=this,r=s[n.a].element,o=s[n.b].element;n.dragging||no(e,"onDragStart",Zr)(P()),t.preventDefault(),n.dragging=!0,n.move=R.bind(n),n.stop=D.bind(n),Fr[qr]("mouseup",n.stop),Fr[qr]("touchend",n.stop),Fr[qr]("touchcancel",n.stop),Fr[qr]("mousemove",n.move),Fr[qr]("touchmove",n.move),r[qr]("selectstart",Zr),r[qr]("dragstart",Zr),o[qr]("selectstart",Zr),o[qr]("dragstart",Zr),r.style.userSelect="none",r.style.webkitUserSelect="none",r.style.MozUserSelect="none",r.style.pointerEvents="none",o.style.userSelect="none",o.style.webkitUserSelect="none",o.style.MozUserSelect="none",o.style.pointerEvents="none",n.gutter.style.cursor=A,n.parent.style.cursor=A,Hr.body.style.cursor=A,M.call(n),n.dragOffset=j(t)-n.end}}k===Jr?(n="width",r="clientX",o="left",i="right",a="clientWidth"):"vertical"===k&&(n="height",r="clientY",o="top",i="bottom",a="clientHeight"),f=N(f);var V=[];function I(t){var e=t.i===V.length,n=e?V[t.i-1]:V[t.i];M.call(n);var r=e?n.size-t.minSize-n[Yr]:t.minSize+n[Xr];T.call(n,r)}return s=l.map((function(t,e){var r,o={element:eo(t),size:f[e],minSize:d[e],maxSize:g[e],snapOffset:_[e],i:e};if(e>0&&((r={a:e-1,b:e,dragging:!1,direction:k,parent:u})[Xr]=ro(y,e-1==0,!1,b),r[Yr]=ro(y,!1,e===l.length-1,b),"row-reverse"===h||"column-reverse"===h)){var i=r.a;r.a=r.b,r.b=i}if(e>0){var a=O(e,k,o.element);!function(t,e,r){var o=C(n,e,r);Object.keys(o).forEach((function(e){t.style[e]=o[e]}))}(a,y,e),r[Kr]=B.bind(r),a[qr]("mousedown",r[Kr]),a[qr]("touchstart",r[Kr]),u.insertBefore(a,o.element),r.gutter=a}return S(o.element,o.size,ro(y,0===e,e===l.length-1,b),e),e>0&&V.push(r),o})),s.forEach((function(t){var e=t.element[Gr]()[n];e<t.minSize&&(v?I(t):t.minSize=e)})),{setSizes:function(t){var e=N(t);e.forEach((function(t,n){if(n>0){var r=V[n-1],o=s[r.a],i=s[r.b];o.size=e[n-1],i.size=t,S(o.element,o.size,r[Xr],o.i),S(i.element,i.size,r[Yr],i.i)}}))},getSizes:P,collapse:function(t){I(s[t])},destroy:function(t,e){V.forEach((function(r){if(!0!==e?r.parent.removeChild(r.gutter):(r.gutter[Wr]("mousedown",r[Kr]),r.gutter[Wr]("touchstart",r[Kr])),!0!==t){var o=E(n,r.a.size,r[Xr]);Object.keys(o).forEach((function(t){s[r.a].element.style[t]="",s[r.b].element.style[t]=""}))}}))},parent:u,pairs:V}},lo=n(9922),uo=n(1248),co=n(4402),ho=n.n(co);function fo(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,po()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function po(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(po=function(){return!!t})()}var mo,go,vo,yo,bo=(0,Mr.s7)("side-by-side")(Ir=(0,Mr.Ei)({left:".side-by-side__left",right:".side-by-side__right"})(Ir=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=fo(this,e,[].concat(r)),(0,c.A)(t,"template",ho()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onAttach",value:function(){var t=so([".side-by-side__left",".side-by-side__right"],{gutterSize:7,sizes:uo.A.getSideBySidePosition(),onDragEnd:function(){var e=t.getSizes();uo.A.setSideBySidePosition(e),(0,lo.A)("side-by-side-resize",{sizes:e})}})}},{key:"onRender",value:function(){var t=this.options,e=t.left,n=t.right;this.showChildView("left",e),this.showChildView("right",n)}},{key:"templateContext",value:function(){return{cls:"side-by-side"}}}])}(vr.View))||Ir)||Ir,wo=bo,_o=n(1450),xo=n(793),ko=n(1109),Ao=["flaky","newFailed","newPassed","newBroken","retriesStatusChange"],Oo=n(245),Eo=n.n(Oo);function Co(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,So()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function So(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(So=function(){return!!t})()}var Po,jo,To,Ro,Mo=(mo=(0,Mr.s7)("marks-toggle"),go=(0,Mr.on)("click .y-label-mark, .n-label-mark"),mo((yo=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Co(this,e,[].concat(r)),(0,c.A)(t,"template",Eo()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){var e=t.settings;this.settings=e,this.listenTo(e,"change",this.render)}},{key:"serializeData",value:function(){var t=this,e=this.settings.getVisibleMarks();return{marks:Ao.map((function(n){return{mark:n,markName:(0,lr.default)("marks.".concat(n),{}),active:!!e[n],count:t.statistic?t.statistic[status.toLowerCase()]:0}}))}}},{key:"onToggleMark",value:function(t){var e=this.$(t.currentTarget),n=e.data("mark"),r=e.hasClass("n-label-mark"),o=this.settings.getVisibleMarks();this.settings.setVisibleMarks(Object.assign({},o,(0,c.A)({},n,r))),(0,lo.A)("marks_toggle_click",{status:n,checked:r})}}])}(vr.View),(0,xo.A)(yo.prototype,"onToggleMark",[go],Object.getOwnPropertyDescriptor(yo.prototype,"onToggleMark"),yo.prototype),vo=yo))||vo),No=Mo,Do=n(9393),Bo=n.n(Do);function Vo(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Io()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Io(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Io=function(){return!!t})()}var Lo,zo,$o,Fo,Uo="searchQuery",Ho=(Po=(0,Mr.s7)("search"),jo=(0,Mr.on)("input input"),Po((Ro=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Vo(this,e,[].concat(r)),(0,c.A)(t,"template",Bo()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){var e=t.state;this.state=e}},{key:"onRender",value:function(){this.$("input").val(this.state.get(Uo))}},{key:"onChangeSorting",value:function(t){this.state.set(Uo,t.target.value),(0,lo.A)("search")}},{key:"close",value:function(){this.state.set(Uo,"")}}])}(vr.View),(0,xo.A)(Ro.prototype,"onChangeSorting",[jo],Object.getOwnPropertyDescriptor(Ro.prototype,"onChangeSorting"),Ro.prototype),To=Ro))||To),qo=Ho,Wo=n(3143),Go=n.n(Wo);function Ko(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Xo()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Xo(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Xo=function(){return!!t})()}var Yo,Jo,Zo,Qo,ti=["sorter.order","sorter.name","sorter.duration","sorter.status"],ei=(Lo=(0,Mr.s7)("sorter"),zo=(0,Mr.on)("click .sorter__item"),Lo((Fo=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Ko(this,e,[].concat(r)),(0,c.A)(t,"template",Go()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){var e=t.settings;this.settings=e}},{key:"onChangeSorting",value:function(t){var e=this.$(t.currentTarget);this.settings.setTreeSorting({sorter:e.data("name"),ascending:!e.data("asc")});var n=e.data("asc");this.$(".sorter_enabled").toggleClass("sorter_enabled"),e.data("asc",!n),e.find(".sorter__name").toggleClass("sorter_enabled"),e.find(n?".fa-sort-asc":".fa-sort-desc").toggleClass("sorter_enabled")}},{key:"serializeData",value:function(){var t=this.settings.getTreeSorting();return{sorters:ti.map((function(e){return{name:e,asc:t.sorter===e&&t.ascending,desc:t.sorter===e&&!t.ascending}}))}}}])}(vr.View),(0,xo.A)(Fo.prototype,"onChangeSorting",[zo],Object.getOwnPropertyDescriptor(Fo.prototype,"onChangeSorting"),Fo.prototype),$o=Fo))||$o),ni=ei,ri=n(5731),oi=n(6065),ii=n.n(oi);function ai(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,si()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function si(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(si=function(){return!!t})()}var li=(Yo=(0,Mr.s7)("status-toggle"),Jo=(0,Mr.on)("click .y-label, .n-label"),Yo((Qo=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=ai(this,e,[].concat(r)),(0,c.A)(t,"template",ii()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){var e=t.settings,n=t.statistic;this.settings=e,this.statistic=n,this.listenTo(e,"change",this.render)}},{key:"serializeData",value:function(){var t=this,e=this.settings.getVisibleStatuses();return{statuses:ri.z.map((function(n){return{status:n,statusName:(0,lr.default)("status.".concat(n),{}),active:!!e[n],count:t.statistic?t.statistic[n.toLowerCase()]:0}}))}}},{key:"onToggleStatus",value:function(t){var e=this.$(t.currentTarget),n=e.data("status"),r=e.hasClass("n-label"),o=this.settings.getVisibleStatuses();this.settings.setVisibleStatuses(Object.assign({},o,(0,c.A)({},n,r))),(0,lo.A)("status_toggle_click",{status:n,checked:r})}}])}(vr.View),(0,xo.A)(Qo.prototype,"onToggleStatus",[Jo],Object.getOwnPropertyDescriptor(Qo.prototype,"onToggleStatus"),Qo.prototype),Zo=Qo))||Zo),ui=li;function ci(t,e){return t.order<e.order?-1:1}function hi(t,e){return String(t.name).toLowerCase()<String(e.name).toLowerCase()?-1:1}function fi(t,e){return t.time&&t.time.duration&&e.time&&e.time.duration&&t.time.duration<e.time.duration?-1:1}function pi(t,e){return t.time&&t.time.maxDuration&&e.time&&e.time.maxDuration&&t.time.maxDuration<e.time.maxDuration?-1:1}function di(t,e){return ri.z.indexOf(t.status)>ri.z.indexOf(e.status)?-1:1}function mi(t,e){return ri.z.reduce((function(n,r){return t.statistic[r]!==e.statistic[r]&&0===n?t.statistic[r]-e.statistic[r]:n}),0)}function gi(t,e,n,r,o){return t.children&&!e.children?-1:!t.children&&e.children?1:t.children&&e.children?o*r(t,e):t.children||e.children?0:o*n(t,e)}function vi(t){var e=t.sorter,n=t.ascending?1:-1;switch(e){case"sorter.order":return function(t,e){return gi(t,e,ci,hi,n)};case"sorter.name":return function(t,e){return gi(t,e,hi,hi,n)};case"sorter.duration":return function(t,e){return gi(t,e,fi,pi,n)};case"sorter.status":return function(t,e){return gi(t,e,di,mi,n)};default:return 0}}function yi(t){return t&&t.startsWith("tag:")?wi(t.substring(4)):bi(t)}function bi(t){return t=t&&t.toLowerCase()||"",function(e){return!t||e.name.toLowerCase().indexOf(t)>-1||e.children&&e.children.some(bi(t))}}function wi(t){var e=(t=t&&t.toLowerCase().trim()||"").split(/\s*,\s*/).filter((function(t){return t}));return function(n){var r=Array.isArray(n.tags)?n.tags.filter((function(t){return t})).map((function(t){return t.toLowerCase().trim()})):[];return!t||e.every((function(t){return r.indexOf(t)>-1}))||n.children&&n.children.some(wi(t))}}var _i=n(734);function xi(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,ki()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function ki(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(ki=function(){return!!t})()}var Ai,Oi,Ei,Ci,Si,Pi={27:"esc",37:"left",38:"up",39:"right",40:"down"},ji=function(t){function n(){return(0,o.A)(this,n),xi(this,n,arguments)}return(0,u.A)(n,t),(0,i.A)(n,[{key:"initialize",value:function(){e()(document).on("keydown",this.keyHandler.bind(this))}},{key:"keyHandler",value:function(t){var e=Pi[t.keyCode];e&&this.trigger("key:".concat(e),t)}}])}(vr.Object),Ti=new ji,Ri=n(7204),Mi=n.n(Ri);function Ni(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Di()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Di(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Di=function(){return!!t})()}var Bi,Vi,Ii,Li,zi,$i,Fi=(Ai=(0,Mr.s7)("tree"),Oi=(0,Mr.h1)("TooltipBehavior",{position:"bottom"}),Ei=(0,Mr.on)("click .node__title"),Ai(Ci=Oi((Si=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Ni(this,e,[].concat(r)),(0,c.A)(t,"template",Mi()),(0,c.A)(t,"cachedQuery",""),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){var e=t.routeState,n=t.state,r=t.tabName,o=t.baseUrl,i=t.settings;this.state=n,this.routeState=e,this.baseUrl=o,this.tabName=r,this.setState(),this.listenTo(this.routeState,"change:treeNode",this.selectNode),this.listenTo(this.routeState,"change:testResultTab",this.render),this.settings=i,this.listenTo(this.settings,"change",this.render),this.listenTo(this.state,"change",this.handleStateChange),this.listenTo(Ti,"key:up",this.onKeyUp,this),this.listenTo(Ti,"key:down",this.onKeyDown,this),this.listenTo(Ti,"key:esc",this.onKeyBack,this),this.listenTo(Ti,"key:left",this.onKeyBack,this)}},{key:"applyFilters",value:function(){var t,e,n=this.settings.getVisibleStatuses(),r=this.settings.getVisibleMarks(),o=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return function(t){var n=!0;return e.forEach((function(e){n=n&&e(t)})),n}}(yi(this.state.get(Uo)),(e=n,function(t){return t.children?t.children.length>0:e[t.status]}),(t=r,function(e){return e.children?e.children.length>0:Ao.map((function(n){return!t[n]||e[n]})).reduce((function(t,e){return t&&e}),!0)})),i=vi(this.settings.getTreeSorting());this.collection.applyFilterAndSorting(o,i)}},{key:"setState",value:function(){var t=this.routeState.get("treeNode");if(t&&t.testResult){var e=t.testResult;this.state.set(e,!0)}if(t&&t.testGroup){var n=t.testGroup;this.state.set(n,!0)}}},{key:"onBeforeRender",value:function(){this.applyFilters()}},{key:"handleStateChange",value:function(){var t=this.state.get(Uo);t!==this.cachedQuery&&(this.cachedQuery=t,this.render())}},{key:"onRender",value:function(){var t=this;this.selectNode(),this.state.get(Uo)?this.$(".node__title").each((function(e,n){t.$(n).parent().addClass("node__expanded")})):this.restoreState()}},{key:"selectNode",value:function(){var t=this.routeState.previous("treeNode");this.toggleNode(t,!1);var e=this.routeState.get("treeNode");this.toggleNode(e,!0),this.restoreState()}},{key:"toggleNode",value:function(t){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];t&&(this.findElement(t).toggleClass("node__title_active",e),this.changeState(t.testResult),this.changeState(t.testGroup))}},{key:"changeState",value:function(t){!(arguments.length>1&&void 0!==arguments[1])||arguments[1]?this.state.set(t,!0):this.state.unset(t)}},{key:"restoreState",value:function(){var t=this;this.$("[data-uid]").each((function(e,n){var r=t.$(n),o=r.data("uid");r.toggleClass("node__expanded",t.state.has(o))})),this.$(".node__title_active").parents(".node").toggleClass("node__expanded",!0),this.$(".node").parents(".node__expanded").length>0?this.$(".node__expanded").parents("div.node.node__expanded").toggleClass("node__expanded",!0):this.$(".node__expanded").parents(".node").toggleClass("node__expanded",!0)}},{key:"findElement",value:function(t){return t.testResult?this.$("[data-uid='".concat(t.testResult,"'][data-parentUid='").concat(t.testGroup,"']")):this.$("[data-uid='".concat(t.testGroup,"']"))}},{key:"onNodeClick",value:function(t){var e=this.$(t.currentTarget),n=e.data("uid");this.changeState(n,!this.state.has(n)),e.parent().toggleClass("node__expanded")}},{key:"onKeyUp",value:function(t){t.preventDefault();var e=this.routeState.get("treeNode");e&&e.testResult?this.selectTestResult(this.collection.getPreviousTestResult(e.testResult)):this.selectTestResult(this.collection.getLastTestResult())}},{key:"onKeyDown",value:function(t){t.preventDefault();var e=this.routeState.get("treeNode");e&&e.testResult?this.selectTestResult(this.collection.getNextTestResult(e.testResult)):this.selectTestResult(this.collection.getFirstTestResult())}},{key:"onKeyBack",value:function(t){t.preventDefault();var e=this.routeState.get("treeNode");e&&(e.testGroup&&e.testResult?this.routeState.get("attachment")?_i.A.setSearch({attachment:null}):_i.A.toUrl("".concat(this.baseUrl,"/").concat(e.testGroup)):e.testGroup&&_i.A.toUrl("".concat(this.baseUrl)))}},{key:"selectTestResult",value:function(t){if(t){var e=this.routeState.get("testResultTab")||"";_i.A.toUrl("".concat(this.baseUrl,"/").concat(t.parentUid,"/").concat(t.uid,"/").concat(e),{replace:!0})}}},{key:"templateContext",value:function(){return{cls:this.className,baseUrl:this.baseUrl,showGroupInfo:this.settings.isShowGroupInfo(),time:this.collection.time,statistic:this.collection.statistic,uid:this.collection.uid,tabName:this.tabName,items:this.collection.toJSON(),testResultTab:this.routeState.get("testResultTab")||""}}}])}(vr.View),(0,xo.A)(Si.prototype,"onNodeClick",[Ei],Object.getOwnPropertyDescriptor(Si.prototype,"onNodeClick"),Si.prototype),Ci=Si))||Ci)||Ci),Ui=Fi,Hi=n(5501),qi=n.n(Hi);function Wi(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Gi()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Gi(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Gi=function(){return!!t})()}var Ki,Xi=(Bi=(0,Mr.s7)("tree"),Vi=(0,Mr.h1)("TooltipBehavior",{position:"bottom"}),Ii=(0,Mr.Ei)({search:".pane__search",sorter:".tree__sorter",filter:".tree__filter",filterMarks:".tree__filter-marks",content:".tree__content"}),Li=(0,Mr.on)("click .tree__info"),Bi(zi=Vi(zi=Ii(($i=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Wi(this,e,[].concat(r)),(0,c.A)(t,"template",qi()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){var e=t.routeState,n=t.state,r=void 0===n?new Ee.Model:n,o=t.tabName,i=t.baseUrl,a=t.csvUrl,s=void 0===a?null:a,l=t.settings,u=void 0===l?(0,ko.O$)(i):l;this.state=r,this.routeState=e,this.baseUrl=i,this.csvUrl=s,this.tabName=o,this.listenTo(this.routeState,"change:testResultTab",this.render),this.settings=u}},{key:"onInfoClick",value:function(){var t=this.settings.isShowGroupInfo();this.settings.setShowGroupInfo(!t),(0,lo.A)("tree_info_click",{enable:!t})}},{key:"onRender",value:function(){this.showChildView("content",new Ui({state:this.state,routeState:this.routeState,tabName:this.tabName,baseUrl:this.baseUrl,settings:this.settings,collection:this.collection})),this.showChildView("search",new qo({state:this.state})),this.showChildView("sorter",new ni({settings:this.settings})),this.showChildView("filter",new ui({settings:this.settings,statistic:this.collection.statistic})),this.showChildView("filterMarks",new No({settings:this.settings}))}},{key:"templateContext",value:function(){return{cls:this.className,showGroupInfo:this.settings.isShowGroupInfo(),tabName:this.tabName,shownCases:0,totalCases:0,filtered:!1,csvUrl:this.csvUrl}}}])}(vr.View),(0,xo.A)($i.prototype,"onInfoClick",[Li],Object.getOwnPropertyDescriptor($i.prototype,"onInfoClick"),$i.prototype),zi=$i))||zi)||zi)||zi),Yi=Xi;function Ji(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Zi()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Zi(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Zi=function(){return!!t})()}var Qi=(0,Mr.s7)("side-by-side")(Ki=function(t){function e(){return(0,o.A)(this,e),Ji(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){var n=this,r=t.tree,o=t.routeState,i=t.csvUrl;(0,s.A)((0,l.A)(e.prototype),"initialize",this).call(this),this.csvUrl=i,this.tree=r,this.routeState=o,this.listenTo(this.routeState,"change:treeNode",(function(t,e){return n.showLeaf(e)}))}},{key:"showLeaf",value:function(t){var e=this;if(t&&t.testResult){var n="#".concat(this.options.baseUrl,"/").concat(t.testGroup,"/").concat(t.testResult),r=new Rr.A({uid:t.testResult});r.fetch({url:r.url(),success:function(){return e.showChildView("right",new _o.A({baseUrl:n,model:r,routeState:e.routeState}))},error:function(){return e.showChildView("right",new $r.A({code:404,message:'Test result with uid "'.concat(t.testResult,'" not found')}))}})}else this.showChildView("right",new zr({message:"No item selected"}))}},{key:"onRender",value:function(){var t=this.options,e=t.tabName,n=t.baseUrl,r=new Yi({collection:this.tree,routeState:this.routeState,treeSorters:[],tabName:e,baseUrl:n,csvUrl:this.csvUrl});this.showChildView("left",r)}},{key:"templateContext",value:function(){return{cls:"testresult-tree"}}}])}(wo))||Ki,ta=Qi;function ea(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function na(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?ea(Object(n),!0).forEach((function(e){(0,c.A)(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):ea(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}function ra(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,oa()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function oa(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(oa=function(){return!!t})()}function ia(t,e,n,r){e&&e[n]&&(t[n]=r(t[n],e[n]))}var aa=function(t){function e(){return(0,o.A)(this,e),ra(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t,e){var n=e.url;this.url=n}},{key:"fetch",value:function(t){var n=this;return(0,Ar._)(this.url,"application/json").then((function(r){return(0,s.A)((0,l.A)(e.prototype),"fetch",n).call(n,na(na({},t),{},{url:r}))}))}},{key:"findLeaf",value:function(t,e){return(0,kr.findWhere)(this.allResults,{parentUid:t,uid:e})}},{key:"getFlattenTestResults",value:function(t){var e=this;return(0,kr.flatten)(t.map((function(t){return t.children?e.getFlattenTestResults(t.children):t})))}},{key:"parse",value:function(t){var e=t.uid,n=t.children||[];return this.uid=e,this.allResults=this.getFlattenTestResults(n),this.allNodes=n,this.time=this.calculateTime(this.allResults),this.statistic=this.calculateStatistic(this.allResults),n}},{key:"applyFilterAndSorting",value:function(t,e){var n=this.getFilteredAndSortedChildren(this.allNodes,t,e);this.reset(n),this.testResults=this.getFlattenTestResults(n)}},{key:"getFilteredAndSortedChildren",value:function(t,e,n){var r=this;return this.calculateOrder(t).map((function(t){if(t.children){var o=r.getFilteredAndSortedChildren(t.children,e,n);return na(na({},t),{},{children:o,statistic:r.calculateStatistic(o),time:r.calculateTime(o)})}return t})).filter(e).sort(n)}},{key:"getFirstTestResult",value:function(){if(this.testResults.length>0)return this.testResults[0]}},{key:"getLastTestResult",value:function(){if(this.testResults.length>0)return this.testResults[this.testResults.length-1]}},{key:"getNextTestResult",value:function(t){var e=this.testResults.findIndex((function(e){return e.uid===t}));if(e<this.testResults.length-1)return this.testResults[e+1]}},{key:"getPreviousTestResult",value:function(t){var e=this.testResults.findIndex((function(e){return e.uid===t}));if(e>0)return this.testResults[e-1]}},{key:"calculateOrder",value:function(t){var e=this;if(t){var n=0;return t.forEach((function(t){t.children?e.calculateOrder(t.children):t.order=++n})),t}return[]}},{key:"calculateStatistic",value:function(t){var e={};return ri.z.forEach((function(t){e[t]=0})),t.forEach((function(t){t.children?ri.z.forEach((function(n){e[n]+=t.statistic?t.statistic[n]:0})):e[t.status]++})),e}},{key:"calculateTime",value:function(t){var e={maxDuration:Number.MIN_VALUE,minDuration:Number.MAX_VALUE,sumDuration:0,duration:0,start:Number.MAX_VALUE,stop:Number.MIN_VALUE};return t.forEach((function(t){t.children?(ia(e,t.time,"maxDuration",Math.max),ia(e,t.time,"minDuration",Math.min),ia(e,t.time,"sumDuration",(function(t,e){return t+e}))):t.time&&isFinite(t.time.duration)&&(e.maxDuration=Math.max(e.maxDuration,t.time.duration),e.minDuration=Math.min(e.minDuration,t.time.duration),e.sumDuration=e.sumDuration+t.time.duration),ia(e,t.time,"start",Math.min),ia(e,t.time,"stop",Math.max),e.duration=e.stop-e.start})),e}}])}(Ee.Collection);function sa(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,la()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function la(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(la=function(){return!!t})()}var ua=function(t){function e(){return(0,o.A)(this,e),sa(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){var n=t.url;(0,s.A)((0,l.A)(e.prototype),"initialize",this).call(this),this.tree=new aa([],{url:n}),this.routeState=new Ee.Model}},{key:"loadData",value:function(){return this.tree.fetch()}},{key:"getContentView",value:function(){var t=this.options,e=t.baseUrl,n=t.tabName,r=t.csvUrl;return new ta({tree:this.tree,routeState:this.routeState,tabName:n,baseUrl:e,csvUrl:r})}},{key:"onViewReady",value:function(){var t=this.options,e=t.testGroup,n=t.testResult,r=t.testResultTab;this.onRouteUpdate(e,n,r)}},{key:"onRouteUpdate",value:function(t,e,n){this.routeState.set("treeNode",{testGroup:t,testResult:e}),this.routeState.set("testResultTab",n);var r=_i.A.getUrlParams().attachment;r?this.routeState.set("attachment",r):this.routeState.unset("attachment")}}])}(Tr.A),ca=n(8681);function ha(t,e){(null==e||e>t.length)&&(e=t.length);for(var n=0,r=new Array(e);n<e;n++)r[n]=t[n];return r}function fa(t,e){if(t){if("string"==typeof t)return ha(t,e);var n=Object.prototype.toString.call(t).slice(8,-1);return"Object"===n&&t.constructor&&(n=t.constructor.name),"Map"===n||"Set"===n?Array.from(t):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?ha(t,e):void 0}}function pa(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var n=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=n){var r,o,i,a,s=[],l=!0,u=!1;try{if(i=(n=n.call(t)).next,0===e){if(Object(n)!==n)return;l=!1}else for(;!(l=(r=i.call(n)).done)&&(s.push(r.value),s.length!==e);l=!0);}catch(t){u=!0,o=t}finally{try{if(!l&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return s}}(t,e)||fa(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function da(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function ma(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?da(Object(n),!0).forEach((function(e){va(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):da(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}function ga(t){return ga="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ga(t)}function va(t,e,n){return e in t?Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}):t[e]=n,t}function ya(){return ya=Object.assign||function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(t[r]=n[r])}return t},ya.apply(this,arguments)}function ba(t,e){if(null==t)return{};var n,r,o=function(t,e){if(null==t)return{};var n,r,o={},i=Object.keys(t);for(r=0;r<i.length;r++)n=i[r],e.indexOf(n)>=0||(o[n]=t[n]);return o}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(r=0;r<i.length;r++)n=i[r],e.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(t,n)&&(o[n]=t[n])}return o}window.allure={api:ca.A,getPluginSettings:function(t,e){return(0,ko.gU)(t,e)},settings:uo.A,components:{AppLayout:Tr.A,TreeLayout:ua,WidgetStatusView:xr,TrendChartView:gr},collections:{TrendCollection:jr}};function wa(t){if("undefined"!=typeof window&&window.navigator)return!!navigator.userAgent.match(t)}var _a=wa(/(?:Trident.*rv[ :]?11\.|msie|iemobile|Windows Phone)/i),xa=wa(/Edge/i),ka=wa(/firefox/i),Aa=wa(/safari/i)&&!wa(/chrome/i)&&!wa(/android/i),Oa=wa(/iP(ad|od|hone)/i),Ea=wa(/chrome/i)&&wa(/android/i),Ca={capture:!1,passive:!1};function Sa(t,e,n){t.addEventListener(e,n,!_a&&Ca)}function Pa(t,e,n){t.removeEventListener(e,n,!_a&&Ca)}function ja(t,e){if(e){if(">"===e[0]&&(e=e.substring(1)),t)try{if(t.matches)return t.matches(e);if(t.msMatchesSelector)return t.msMatchesSelector(e);if(t.webkitMatchesSelector)return t.webkitMatchesSelector(e)}catch(t){return!1}return!1}}function Ta(t){return t.host&&t!==document&&t.host.nodeType?t.host:t.parentNode}function Ra(t,e,n,r){if(t){n=n||document;do{if(null!=e&&(">"===e[0]?t.parentNode===n&&ja(t,e):ja(t,e))||r&&t===n)return t;if(t===n)break}while(t=Ta(t))}return null}var Ma,Na=/\s+/g;function Da(t,e,n){if(t&&e)if(t.classList)t.classList[n?"add":"remove"](e);else{var r=(" "+t.className+" ").replace(Na," ").replace(" "+e+" "," ");t.className=(r+(n?" "+e:"")).replace(Na," ")}}function Ba(t,e,n){var r=t&&t.style;if(r){if(void 0===n)return document.defaultView&&document.defaultView.getComputedStyle?n=document.defaultView.getComputedStyle(t,""):t.currentStyle&&(n=t.currentStyle),void 0===e?n:n[e];e in r||-1!==e.indexOf("webkit")||(e="-webkit-"+e),r[e]=n+("string"==typeof n?"":"px")}}function Va(t,e){var n="";if("string"==typeof t)n=t;else do{var r=Ba(t,"transform");r&&"none"!==r&&(n=r+" "+n)}while(!e&&(t=t.parentNode));var o=window.DOMMatrix||window.WebKitCSSMatrix||window.CSSMatrix||window.MSCSSMatrix;return o&&new o(n)}function Ia(t,e,n){if(t){var r=t.getElementsByTagName(e),o=0,i=r.length;if(n)for(;o<i;o++)n(r[o],o);return r}return[]}function La(){var t=document.scrollingElement;return t||document.documentElement}function za(t,e,n,r,o){if(t.getBoundingClientRect||t===window){var i,a,s,l,u,c,h;if(t!==window&&t.parentNode&&t!==La()?(a=(i=t.getBoundingClientRect()).top,s=i.left,l=i.bottom,u=i.right,c=i.height,h=i.width):(a=0,s=0,l=window.innerHeight,u=window.innerWidth,c=window.innerHeight,h=window.innerWidth),(e||n)&&t!==window&&(o=o||t.parentNode,!_a))do{if(o&&o.getBoundingClientRect&&("none"!==Ba(o,"transform")||n&&"static"!==Ba(o,"position"))){var f=o.getBoundingClientRect();a-=f.top+parseInt(Ba(o,"border-top-width")),s-=f.left+parseInt(Ba(o,"border-left-width")),l=a+i.height,u=s+i.width;break}}while(o=o.parentNode);if(r&&t!==window){var p=Va(o||t),d=p&&p.a,m=p&&p.d;p&&(l=(a/=m)+(c/=m),u=(s/=d)+(h/=d))}return{top:a,left:s,bottom:l,right:u,width:h,height:c}}}function $a(t,e,n){for(var r=Wa(t,!0),o=za(t)[e];r;){var i=za(r)[n];if(!("top"===n||"left"===n?o>=i:o<=i))return r;if(r===La())break;r=Wa(r,!1)}return!1}function Fa(t,e,n,r){for(var o=0,i=0,a=t.children;i<a.length;){if("none"!==a[i].style.display&&a[i]!==Js.ghost&&(r||a[i]!==Js.dragged)&&Ra(a[i],n.draggable,t,!1)){if(o===e)return a[i];o++}i++}return null}function Ua(t,e){for(var n=t.lastElementChild;n&&(n===Js.ghost||"none"===Ba(n,"display")||e&&!ja(n,e));)n=n.previousElementSibling;return n||null}function Ha(t,e){var n=0;if(!t||!t.parentNode)return-1;for(;t=t.previousElementSibling;)"TEMPLATE"===t.nodeName.toUpperCase()||t===Js.clone||e&&!ja(t,e)||n++;return n}function qa(t){var e=0,n=0,r=La();if(t)do{var o=Va(t),i=o.a,a=o.d;e+=t.scrollLeft*i,n+=t.scrollTop*a}while(t!==r&&(t=t.parentNode));return[e,n]}function Wa(t,e){if(!t||!t.getBoundingClientRect)return La();var n=t,r=!1;do{if(n.clientWidth<n.scrollWidth||n.clientHeight<n.scrollHeight){var o=Ba(n);if(n.clientWidth<n.scrollWidth&&("auto"==o.overflowX||"scroll"==o.overflowX)||n.clientHeight<n.scrollHeight&&("auto"==o.overflowY||"scroll"==o.overflowY)){if(!n.getBoundingClientRect||n===document.body)return La();if(r||e)return n;r=!0}}}while(n=n.parentNode);return La()}function Ga(t,e){return Math.round(t.top)===Math.round(e.top)&&Math.round(t.left)===Math.round(e.left)&&Math.round(t.height)===Math.round(e.height)&&Math.round(t.width)===Math.round(e.width)}function Ka(t,e){return function(){if(!Ma){var n=arguments;1===n.length?t.call(this,n[0]):t.apply(this,n),Ma=setTimeout((function(){Ma=void 0}),e)}}}function Xa(t,e,n){t.scrollLeft+=e,t.scrollTop+=n}function Ya(t){var e=window.Polymer,n=window.jQuery||window.Zepto;return e&&e.dom?e.dom(t).cloneNode(!0):n?n(t).clone(!0)[0]:t.cloneNode(!0)}function Ja(t,e,n){var r={};return Array.from(t.children).forEach((function(o){var i,a,s,l;if(Ra(o,e.draggable,t,!1)&&!o.animated&&o!==n){var u=za(o);r.left=Math.min(null!==(i=r.left)&&void 0!==i?i:1/0,u.left),r.top=Math.min(null!==(a=r.top)&&void 0!==a?a:1/0,u.top),r.right=Math.max(null!==(s=r.right)&&void 0!==s?s:-1/0,u.right),r.bottom=Math.max(null!==(l=r.bottom)&&void 0!==l?l:-1/0,u.bottom)}})),r.width=r.right-r.left,r.height=r.bottom-r.top,r.x=r.left,r.y=r.top,r}var Za="Sortable"+(new Date).getTime();function Qa(){var t,e=[];return{captureAnimationState:function(){(e=[],this.options.animation)&&[].slice.call(this.el.children).forEach((function(t){if("none"!==Ba(t,"display")&&t!==Js.ghost){e.push({target:t,rect:za(t)});var n=ma({},e[e.length-1].rect);if(t.thisAnimationDuration){var r=Va(t,!0);r&&(n.top-=r.f,n.left-=r.e)}t.fromRect=n}}))},addAnimationState:function(t){e.push(t)},removeAnimationState:function(t){e.splice(function(t,e){for(var n in t)if(t.hasOwnProperty(n))for(var r in e)if(e.hasOwnProperty(r)&&e[r]===t[n][r])return Number(n);return-1}(e,{target:t}),1)},animateAll:function(n){var r=this;if(!this.options.animation)return clearTimeout(t),void("function"==typeof n&&n());var o=!1,i=0;e.forEach((function(t){var e=0,n=t.target,a=n.fromRect,s=za(n),l=n.prevFromRect,u=n.prevToRect,c=t.rect,h=Va(n,!0);h&&(s.top-=h.f,s.left-=h.e),n.toRect=s,n.thisAnimationDuration&&Ga(l,s)&&!Ga(a,s)&&(c.top-s.top)/(c.left-s.left)==(a.top-s.top)/(a.left-s.left)&&(e=function(t,e,n,r){return Math.sqrt(Math.pow(e.top-t.top,2)+Math.pow(e.left-t.left,2))/Math.sqrt(Math.pow(e.top-n.top,2)+Math.pow(e.left-n.left,2))*r.animation}(c,l,u,r.options)),Ga(s,a)||(n.prevFromRect=a,n.prevToRect=s,e||(e=r.options.animation),r.animate(n,c,s,e)),e&&(o=!0,i=Math.max(i,e),clearTimeout(n.animationResetTimer),n.animationResetTimer=setTimeout((function(){n.animationTime=0,n.prevFromRect=null,n.fromRect=null,n.prevToRect=null,n.thisAnimationDuration=null}),e),n.thisAnimationDuration=e)})),clearTimeout(t),o?t=setTimeout((function(){"function"==typeof n&&n()}),i):"function"==typeof n&&n(),e=[]},animate:function(t,e,n,r){if(r){Ba(t,"transition",""),Ba(t,"transform","");var o=Va(this.el),i=o&&o.a,a=o&&o.d,s=(e.left-n.left)/(i||1),l=(e.top-n.top)/(a||1);t.animatingX=!!s,t.animatingY=!!l,Ba(t,"transform","translate3d("+s+"px,"+l+"px,0)"),this.forRepaintDummy=function(t){return t.offsetWidth}(t),Ba(t,"transition","transform "+r+"ms"+(this.options.easing?" "+this.options.easing:"")),Ba(t,"transform","translate3d(0,0,0)"),"number"==typeof t.animated&&clearTimeout(t.animated),t.animated=setTimeout((function(){Ba(t,"transition",""),Ba(t,"transform",""),t.animated=!1,t.animatingX=!1,t.animatingY=!1}),r)}}}}var ts=[],es={initializeByDefault:!0},ns={mount:function(t){for(var e in es)es.hasOwnProperty(e)&&!(e in t)&&(t[e]=es[e]);ts.forEach((function(e){if(e.pluginName===t.pluginName)throw"Sortable: Cannot mount plugin ".concat(t.pluginName," more than once")})),ts.push(t)},pluginEvent:function(t,e,n){var r=this;this.eventCanceled=!1,n.cancel=function(){r.eventCanceled=!0};var o=t+"Global";ts.forEach((function(r){e[r.pluginName]&&(e[r.pluginName][o]&&e[r.pluginName][o](ma({sortable:e},n)),e.options[r.pluginName]&&e[r.pluginName][t]&&e[r.pluginName][t](ma({sortable:e},n)))}))},initializePlugins:function(t,e,n,r){for(var o in ts.forEach((function(r){var o=r.pluginName;if(t.options[o]||r.initializeByDefault){var i=new r(t,e,t.options);i.sortable=t,i.options=t.options,t[o]=i,ya(n,i.defaults)}})),t.options)if(t.options.hasOwnProperty(o)){var i=this.modifyOption(t,o,t.options[o]);void 0!==i&&(t.options[o]=i)}},getEventProperties:function(t,e){var n={};return ts.forEach((function(r){"function"==typeof r.eventProperties&&ya(n,r.eventProperties.call(e[r.pluginName],t))})),n},modifyOption:function(t,e,n){var r;return ts.forEach((function(o){t[o.pluginName]&&o.optionListeners&&"function"==typeof o.optionListeners[e]&&(r=o.optionListeners[e].call(t[o.pluginName],n))})),r}};function rs(t){var e=t.sortable,n=t.rootEl,r=t.name,o=t.targetEl,i=t.cloneEl,a=t.toEl,s=t.fromEl,l=t.oldIndex,u=t.newIndex,c=t.oldDraggableIndex,h=t.newDraggableIndex,f=t.originalEvent,p=t.putSortable,d=t.extraEventProperties;if(e=e||n&&n[Za]){var m,g=e.options,v="on"+r.charAt(0).toUpperCase()+r.substr(1);!window.CustomEvent||_a||xa?(m=document.createEvent("Event")).initEvent(r,!0,!0):m=new CustomEvent(r,{bubbles:!0,cancelable:!0}),m.to=a||n,m.from=s||n,m.item=o||n,m.clone=i,m.oldIndex=l,m.newIndex=u,m.oldDraggableIndex=c,m.newDraggableIndex=h,m.originalEvent=f,m.pullMode=p?p.lastPutMode:void 0;var y=ma(ma({},d),ns.getEventProperties(r,e));for(var b in y)m[b]=y[b];n&&n.dispatchEvent(m),g[v]&&g[v].call(e,m)}}var os=["evt"],is=function(t,e){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},r=n.evt,o=ba(n,os);ns.pluginEvent.bind(Js)(t,e,ma({dragEl:ss,parentEl:ls,ghostEl:us,rootEl:cs,nextEl:hs,lastDownEl:fs,cloneEl:ps,cloneHidden:ds,dragStarted:Cs,putSortable:ws,activeSortable:Js.active,originalEvent:r,oldIndex:ms,oldDraggableIndex:vs,newIndex:gs,newDraggableIndex:ys,hideGhostForTarget:Gs,unhideGhostForTarget:Ks,cloneNowHidden:function(){ds=!0},cloneNowShown:function(){ds=!1},dispatchSortableEvent:function(t){as({sortable:e,name:t,originalEvent:r})}},o))};function as(t){rs(ma({putSortable:ws,cloneEl:ps,targetEl:ss,rootEl:cs,oldIndex:ms,oldDraggableIndex:vs,newIndex:gs,newDraggableIndex:ys},t))}var ss,ls,us,cs,hs,fs,ps,ds,ms,gs,vs,ys,bs,ws,_s,xs,ks,As,Os,Es,Cs,Ss,Ps,js,Ts,Rs=!1,Ms=!1,Ns=[],Ds=!1,Bs=!1,Vs=[],Is=!1,Ls=[],zs="undefined"!=typeof document,$s=Oa,Fs=xa||_a?"cssFloat":"float",Us=zs&&!Ea&&!Oa&&"draggable"in document.createElement("div"),Hs=function(){if(zs){if(_a)return!1;var t=document.createElement("x");return t.style.cssText="pointer-events:auto","auto"===t.style.pointerEvents}}(),qs=function(t,e){var n=Ba(t),r=parseInt(n.width)-parseInt(n.paddingLeft)-parseInt(n.paddingRight)-parseInt(n.borderLeftWidth)-parseInt(n.borderRightWidth),o=Fa(t,0,e),i=Fa(t,1,e),a=o&&Ba(o),s=i&&Ba(i),l=a&&parseInt(a.marginLeft)+parseInt(a.marginRight)+za(o).width,u=s&&parseInt(s.marginLeft)+parseInt(s.marginRight)+za(i).width;if("flex"===n.display)return"column"===n.flexDirection||"column-reverse"===n.flexDirection?"vertical":"horizontal";if("grid"===n.display)return n.gridTemplateColumns.split(" ").length<=1?"vertical":"horizontal";if(o&&a.float&&"none"!==a.float){var c="left"===a.float?"left":"right";return!i||"both"!==s.clear&&s.clear!==c?"horizontal":"vertical"}return o&&("block"===a.display||"flex"===a.display||"table"===a.display||"grid"===a.display||l>=r&&"none"===n[Fs]||i&&"none"===n[Fs]&&l+u>r)?"vertical":"horizontal"},Ws=function(t){function e(t,n){return function(r,o,i,a){var s=r.options.group.name&&o.options.group.name&&r.options.group.name===o.options.group.name;if(null==t&&(n||s))return!0;if(null==t||!1===t)return!1;if(n&&"clone"===t)return t;if("function"==typeof t)return e(t(r,o,i,a),n)(r,o,i,a);var l=(n?r:o).options.group.name;return!0===t||"string"==typeof t&&t===l||t.join&&t.indexOf(l)>-1}}var n={},r=t.group;r&&"object"==ga(r)||(r={name:r}),n.name=r.name,n.checkPull=e(r.pull,!0),n.checkPut=e(r.put),n.revertClone=r.revertClone,t.group=n},Gs=function(){!Hs&&us&&Ba(us,"display","none")},Ks=function(){!Hs&&us&&Ba(us,"display","")};zs&&!Ea&&document.addEventListener("click",(function(t){if(Ms)return t.preventDefault(),t.stopPropagation&&t.stopPropagation(),t.stopImmediatePropagation&&t.stopImmediatePropagation(),Ms=!1,!1}),!0);var Xs=function(t){if(ss){t=t.touches?t.touches[0]:t;var e=(o=t.clientX,i=t.clientY,Ns.some((function(t){var e=t[Za].options.emptyInsertThreshold;if(e&&!Ua(t)){var n=za(t),r=o>=n.left-e&&o<=n.right+e,s=i>=n.top-e&&i<=n.bottom+e;return r&&s?a=t:void 0}})),a);if(e){var n={};for(var r in t)t.hasOwnProperty(r)&&(n[r]=t[r]);n.target=n.rootEl=e,n.preventDefault=void 0,n.stopPropagation=void 0,e[Za]._onDragOver(n)}}var o,i,a},Ys=function(t){ss&&ss.parentNode[Za]._isOutsideThisEl(t.target)};function Js(t,e){if(!t||!t.nodeType||1!==t.nodeType)throw"Sortable: `el` must be an HTMLElement, not ".concat({}.toString.call(t));this.el=t,this.options=e=ya({},e),t[Za]=this;var n={group:null,sort:!0,disabled:!1,store:null,handle:null,draggable:/^[uo]l$/i.test(t.nodeName)?">li":">*",swapThreshold:1,invertSwap:!1,invertedSwapThreshold:null,removeCloneOnHide:!0,direction:function(){return qs(t,this.options)},ghostClass:"sortable-ghost",chosenClass:"sortable-chosen",dragClass:"sortable-drag",ignore:"a, img",filter:null,preventOnFilter:!0,animation:0,easing:null,setData:function(t,e){t.setData("Text",e.textContent)},dropBubble:!1,dragoverBubble:!1,dataIdAttr:"data-id",delay:0,delayOnTouchOnly:!1,touchStartThreshold:(Number.parseInt?Number:window).parseInt(window.devicePixelRatio,10)||1,forceFallback:!1,fallbackClass:"sortable-fallback",fallbackOnBody:!1,fallbackTolerance:0,fallbackOffset:{x:0,y:0},supportPointer:!1!==Js.supportPointer&&"PointerEvent"in window&&!Aa,emptyInsertThreshold:5};for(var r in ns.initializePlugins(this,t,n),n)!(r in e)&&(e[r]=n[r]);for(var o in Ws(e),this)"_"===o.charAt(0)&&"function"==typeof this[o]&&(this[o]=this[o].bind(this));this.nativeDraggable=!e.forceFallback&&Us,this.nativeDraggable&&(this.options.touchStartThreshold=1),e.supportPointer?Sa(t,"pointerdown",this._onTapStart):(Sa(t,"mousedown",this._onTapStart),Sa(t,"touchstart",this._onTapStart)),this.nativeDraggable&&(Sa(t,"dragover",this),Sa(t,"dragenter",this)),Ns.push(this.el),e.store&&e.store.get&&this.sort(e.store.get(this)||[]),ya(this,Qa())}function Zs(t,e,n,r,o,i,a,s){var l,u,c=t[Za],h=c.options.onMove;return!window.CustomEvent||_a||xa?(l=document.createEvent("Event")).initEvent("move",!0,!0):l=new CustomEvent("move",{bubbles:!0,cancelable:!0}),l.to=e,l.from=t,l.dragged=n,l.draggedRect=r,l.related=o||e,l.relatedRect=i||za(e),l.willInsertAfter=s,l.originalEvent=a,t.dispatchEvent(l),h&&(u=h.call(c,l,a)),u}function Qs(t){t.draggable=!1}function tl(){Is=!1}function el(t){for(var e=t.tagName+t.className+t.src+t.href+t.textContent,n=e.length,r=0;n--;)r+=e.charCodeAt(n);return r.toString(36)}function nl(t){return setTimeout(t,0)}function rl(t){return clearTimeout(t)}Js.prototype={constructor:Js,_isOutsideThisEl:function(t){this.el.contains(t)||t===this.el||(Ss=null)},_getDirection:function(t,e){return"function"==typeof this.options.direction?this.options.direction.call(this,t,e,ss):this.options.direction},_onTapStart:function(t){if(t.cancelable){var e=this,n=this.el,r=this.options,o=r.preventOnFilter,i=t.type,a=t.touches&&t.touches[0]||t.pointerType&&"touch"===t.pointerType&&t,s=(a||t).target,l=t.target.shadowRoot&&(t.path&&t.path[0]||t.composedPath&&t.composedPath()[0])||s,u=r.filter;if(function(t){Ls.length=0;var e=t.getElementsByTagName("input"),n=e.length;for(;n--;){var r=e[n];r.checked&&Ls.push(r)}}(n),!ss&&!(/mousedown|pointerdown/.test(i)&&0!==t.button||r.disabled)&&!l.isContentEditable&&(this.nativeDraggable||!Aa||!s||"SELECT"!==s.tagName.toUpperCase())&&!((s=Ra(s,r.draggable,n,!1))&&s.animated||fs===s)){if(ms=Ha(s),vs=Ha(s,r.draggable),"function"==typeof u){if(u.call(this,t,s,this))return as({sortable:e,rootEl:l,name:"filter",targetEl:s,toEl:n,fromEl:n}),is("filter",e,{evt:t}),void(o&&t.cancelable&&t.preventDefault())}else if(u&&(u=u.split(",").some((function(r){if(r=Ra(l,r.trim(),n,!1))return as({sortable:e,rootEl:r,name:"filter",targetEl:s,fromEl:n,toEl:n}),is("filter",e,{evt:t}),!0}))))return void(o&&t.cancelable&&t.preventDefault());r.handle&&!Ra(l,r.handle,n,!1)||this._prepareDragStart(t,a,s)}}},_prepareDragStart:function(t,e,n){var r,o=this,i=o.el,a=o.options,s=i.ownerDocument;if(n&&!ss&&n.parentNode===i){var l=za(n);if(cs=i,ls=(ss=n).parentNode,hs=ss.nextSibling,fs=n,bs=a.group,Js.dragged=ss,_s={target:ss,clientX:(e||t).clientX,clientY:(e||t).clientY},Os=_s.clientX-l.left,Es=_s.clientY-l.top,this._lastX=(e||t).clientX,this._lastY=(e||t).clientY,ss.style["will-change"]="all",r=function(){is("delayEnded",o,{evt:t}),Js.eventCanceled?o._onDrop():(o._disableDelayedDragEvents(),!ka&&o.nativeDraggable&&(ss.draggable=!0),o._triggerDragStart(t,e),as({sortable:o,name:"choose",originalEvent:t}),Da(ss,a.chosenClass,!0))},a.ignore.split(",").forEach((function(t){Ia(ss,t.trim(),Qs)})),Sa(s,"dragover",Xs),Sa(s,"mousemove",Xs),Sa(s,"touchmove",Xs),Sa(s,"mouseup",o._onDrop),Sa(s,"touchend",o._onDrop),Sa(s,"touchcancel",o._onDrop),ka&&this.nativeDraggable&&(this.options.touchStartThreshold=4,ss.draggable=!0),is("delayStart",this,{evt:t}),!a.delay||a.delayOnTouchOnly&&!e||this.nativeDraggable&&(xa||_a))r();else{if(Js.eventCanceled)return void this._onDrop();Sa(s,"mouseup",o._disableDelayedDrag),Sa(s,"touchend",o._disableDelayedDrag),Sa(s,"touchcancel",o._disableDelayedDrag),Sa(s,"mousemove",o._delayedDragTouchMoveHandler),Sa(s,"touchmove",o._delayedDragTouchMoveHandler),a.supportPointer&&Sa(s,"pointermove",o._delayedDragTouchMoveHandler),o._dragStartTimer=setTimeout(r,a.delay)}}},_delayedDragTouchMoveHandler:function(t){var e=t.touches?t.touches[0]:t;Math.max(Math.abs(e.clientX-this._lastX),Math.abs(e.clientY-this._lastY))>=Math.floor(this.options.touchStartThreshold/(this.nativeDraggable&&window.devicePixelRatio||1))&&this._disableDelayedDrag()},_disableDelayedDrag:function(){ss&&Qs(ss),clearTimeout(this._dragStartTimer),this._disableDelayedDragEvents()},_disableDelayedDragEvents:function(){var t=this.el.ownerDocument;Pa(t,"mouseup",this._disableDelayedDrag),Pa(t,"touchend",this._disableDelayedDrag),Pa(t,"touchcancel",this._disableDelayedDrag),Pa(t,"mousemove",this._delayedDragTouchMoveHandler),Pa(t,"touchmove",this._delayedDragTouchMoveHandler),Pa(t,"pointermove",this._delayedDragTouchMoveHandler)},_triggerDragStart:function(t,e){e=e||"touch"==t.pointerType&&t,!this.nativeDraggable||e?this.options.supportPointer?Sa(document,"pointermove",this._onTouchMove):Sa(document,e?"touchmove":"mousemove",this._onTouchMove):(Sa(ss,"dragend",this),Sa(cs,"dragstart",this._onDragStart));try{document.selection?nl((function(){document.selection.empty()})):window.getSelection().removeAllRanges()}catch(t){}},_dragStarted:function(t,e){if(Rs=!1,cs&&ss){is("dragStarted",this,{evt:e}),this.nativeDraggable&&Sa(document,"dragover",Ys);var n=this.options;!t&&Da(ss,n.dragClass,!1),Da(ss,n.ghostClass,!0),Js.active=this,t&&this._appendGhost(),as({sortable:this,name:"start",originalEvent:e})}else this._nulling()},_emulateDragOver:function(){if(xs){this._lastX=xs.clientX,this._lastY=xs.clientY,Gs();for(var t=document.elementFromPoint(xs.clientX,xs.clientY),e=t;t&&t.shadowRoot&&(t=t.shadowRoot.elementFromPoint(xs.clientX,xs.clientY))!==e;)e=t;if(ss.parentNode[Za]._isOutsideThisEl(t),e)do{if(e[Za]){if(e[Za]._onDragOver({clientX:xs.clientX,clientY:xs.clientY,target:t,rootEl:e})&&!this.options.dragoverBubble)break}t=e}while(e=e.parentNode);Ks()}},_onTouchMove:function(t){if(_s){var e=this.options,n=e.fallbackTolerance,r=e.fallbackOffset,o=t.touches?t.touches[0]:t,i=us&&Va(us,!0),a=us&&i&&i.a,s=us&&i&&i.d,l=$s&&Ts&&qa(Ts),u=(o.clientX-_s.clientX+r.x)/(a||1)+(l?l[0]-Vs[0]:0)/(a||1),c=(o.clientY-_s.clientY+r.y)/(s||1)+(l?l[1]-Vs[1]:0)/(s||1);if(!Js.active&&!Rs){if(n&&Math.max(Math.abs(o.clientX-this._lastX),Math.abs(o.clientY-this._lastY))<n)return;this._onDragStart(t,!0)}if(us){i?(i.e+=u-(ks||0),i.f+=c-(As||0)):i={a:1,b:0,c:0,d:1,e:u,f:c};var h="matrix(".concat(i.a,",").concat(i.b,",").concat(i.c,",").concat(i.d,",").concat(i.e,",").concat(i.f,")");Ba(us,"webkitTransform",h),Ba(us,"mozTransform",h),Ba(us,"msTransform",h),Ba(us,"transform",h),ks=u,As=c,xs=o}t.cancelable&&t.preventDefault()}},_appendGhost:function(){if(!us){var t=this.options.fallbackOnBody?document.body:cs,e=za(ss,!0,$s,!0,t),n=this.options;if($s){for(Ts=t;"static"===Ba(Ts,"position")&&"none"===Ba(Ts,"transform")&&Ts!==document;)Ts=Ts.parentNode;Ts!==document.body&&Ts!==document.documentElement?(Ts===document&&(Ts=La()),e.top+=Ts.scrollTop,e.left+=Ts.scrollLeft):Ts=La(),Vs=qa(Ts)}Da(us=ss.cloneNode(!0),n.ghostClass,!1),Da(us,n.fallbackClass,!0),Da(us,n.dragClass,!0),Ba(us,"transition",""),Ba(us,"transform",""),Ba(us,"box-sizing","border-box"),Ba(us,"margin",0),Ba(us,"top",e.top),Ba(us,"left",e.left),Ba(us,"width",e.width),Ba(us,"height",e.height),Ba(us,"opacity","0.8"),Ba(us,"position",$s?"absolute":"fixed"),Ba(us,"zIndex","100000"),Ba(us,"pointerEvents","none"),Js.ghost=us,t.appendChild(us),Ba(us,"transform-origin",Os/parseInt(us.style.width)*100+"% "+Es/parseInt(us.style.height)*100+"%")}},_onDragStart:function(t,e){var n=this,r=t.dataTransfer,o=n.options;is("dragStart",this,{evt:t}),Js.eventCanceled?this._onDrop():(is("setupClone",this),Js.eventCanceled||((ps=Ya(ss)).removeAttribute("id"),ps.draggable=!1,ps.style["will-change"]="",this._hideClone(),Da(ps,this.options.chosenClass,!1),Js.clone=ps),n.cloneId=nl((function(){is("clone",n),Js.eventCanceled||(n.options.removeCloneOnHide||cs.insertBefore(ps,ss),n._hideClone(),as({sortable:n,name:"clone"}))})),!e&&Da(ss,o.dragClass,!0),e?(Ms=!0,n._loopId=setInterval(n._emulateDragOver,50)):(Pa(document,"mouseup",n._onDrop),Pa(document,"touchend",n._onDrop),Pa(document,"touchcancel",n._onDrop),r&&(r.effectAllowed="move",o.setData&&o.setData.call(n,r,ss)),Sa(document,"drop",n),Ba(ss,"transform","translateZ(0)")),Rs=!0,n._dragStartId=nl(n._dragStarted.bind(n,e,t)),Sa(document,"selectstart",n),Cs=!0,Aa&&Ba(document.body,"user-select","none"))},_onDragOver:function(t){var e,n,r,o,i=this.el,a=t.target,s=this.options,l=s.group,u=Js.active,c=bs===l,h=s.sort,f=ws||u,p=this,d=!1;if(!Is){if(void 0!==t.preventDefault&&t.cancelable&&t.preventDefault(),a=Ra(a,s.draggable,i,!0),P("dragOver"),Js.eventCanceled)return d;if(ss.contains(t.target)||a.animated&&a.animatingX&&a.animatingY||p._ignoreWhileAnimating===a)return T(!1);if(Ms=!1,u&&!s.disabled&&(c?h||(r=ls!==cs):ws===this||(this.lastPutMode=bs.checkPull(this,u,ss,t))&&l.checkPut(this,u,ss,t))){if(o="vertical"===this._getDirection(t,a),e=za(ss),P("dragOverValid"),Js.eventCanceled)return d;if(r)return ls=cs,j(),this._hideClone(),P("revert"),Js.eventCanceled||(hs?cs.insertBefore(ss,hs):cs.appendChild(ss)),T(!0);var m=Ua(i,s.draggable);if(!m||function(t,e,n){var r=za(Ua(n.el,n.options.draggable)),o=Ja(n.el,n.options,us),i=10;return e?t.clientX>o.right+i||t.clientY>r.bottom&&t.clientX>r.left:t.clientY>o.bottom+i||t.clientX>r.right&&t.clientY>r.top}(t,o,this)&&!m.animated){if(m===ss)return T(!1);if(m&&i===t.target&&(a=m),a&&(n=za(a)),!1!==Zs(cs,i,ss,e,a,n,t,!!a))return j(),m&&m.nextSibling?i.insertBefore(ss,m.nextSibling):i.appendChild(ss),ls=i,R(),T(!0)}else if(m&&function(t,e,n){var r=za(Fa(n.el,0,n.options,!0)),o=Ja(n.el,n.options,us),i=10;return e?t.clientX<o.left-i||t.clientY<r.top&&t.clientX<r.right:t.clientY<o.top-i||t.clientY<r.bottom&&t.clientX<r.left}(t,o,this)){var g=Fa(i,0,s,!0);if(g===ss)return T(!1);if(n=za(a=g),!1!==Zs(cs,i,ss,e,a,n,t,!1))return j(),i.insertBefore(ss,g),ls=i,R(),T(!0)}else if(a.parentNode===i){n=za(a);var v,y,b,w=ss.parentNode!==i,_=!function(t,e,n){var r=n?t.left:t.top,o=n?t.right:t.bottom,i=n?t.width:t.height,a=n?e.left:e.top,s=n?e.right:e.bottom,l=n?e.width:e.height;return r===a||o===s||r+i/2===a+l/2}(ss.animated&&ss.toRect||e,a.animated&&a.toRect||n,o),x=o?"top":"left",k=$a(a,"top","top")||$a(ss,"top","top"),A=k?k.scrollTop:void 0;if(Ss!==a&&(y=n[x],Ds=!1,Bs=!_&&s.invertSwap||w),v=function(t,e,n,r,o,i,a,s){var l=r?t.clientY:t.clientX,u=r?n.height:n.width,c=r?n.top:n.left,h=r?n.bottom:n.right,f=!1;if(!a)if(s&&js<u*o){if(!Ds&&(1===Ps?l>c+u*i/2:l<h-u*i/2)&&(Ds=!0),Ds)f=!0;else if(1===Ps?l<c+js:l>h-js)return-Ps}else if(l>c+u*(1-o)/2&&l<h-u*(1-o)/2)return function(t){return Ha(ss)<Ha(t)?1:-1}(e);if((f=f||a)&&(l<c+u*i/2||l>h-u*i/2))return l>c+u/2?1:-1;return 0}(t,a,n,o,_?1:s.swapThreshold,null==s.invertedSwapThreshold?s.swapThreshold:s.invertedSwapThreshold,Bs,Ss===a),0!==v){var O=Ha(ss);do{O-=v,b=ls.children[O]}while(b&&("none"===Ba(b,"display")||b===us))}if(0===v||b===a)return T(!1);Ss=a,Ps=v;var E=a.nextElementSibling,C=!1,S=Zs(cs,i,ss,e,a,n,t,C=1===v);if(!1!==S)return 1!==S&&-1!==S||(C=1===S),Is=!0,setTimeout(tl,30),j(),C&&!E?i.appendChild(ss):a.parentNode.insertBefore(ss,C?E:a),k&&Xa(k,0,A-k.scrollTop),ls=ss.parentNode,void 0===y||Bs||(js=Math.abs(y-za(a)[x])),R(),T(!0)}if(i.contains(ss))return T(!1)}return!1}function P(s,l){is(s,p,ma({evt:t,isOwner:c,axis:o?"vertical":"horizontal",revert:r,dragRect:e,targetRect:n,canSort:h,fromSortable:f,target:a,completed:T,onMove:function(n,r){return Zs(cs,i,ss,e,n,za(n),t,r)},changed:R},l))}function j(){P("dragOverAnimationCapture"),p.captureAnimationState(),p!==f&&f.captureAnimationState()}function T(e){return P("dragOverCompleted",{insertion:e}),e&&(c?u._hideClone():u._showClone(p),p!==f&&(Da(ss,ws?ws.options.ghostClass:u.options.ghostClass,!1),Da(ss,s.ghostClass,!0)),ws!==p&&p!==Js.active?ws=p:p===Js.active&&ws&&(ws=null),f===p&&(p._ignoreWhileAnimating=a),p.animateAll((function(){P("dragOverAnimationComplete"),p._ignoreWhileAnimating=null})),p!==f&&(f.animateAll(),f._ignoreWhileAnimating=null)),(a===ss&&!ss.animated||a===i&&!a.animated)&&(Ss=null),s.dragoverBubble||t.rootEl||a===document||(ss.parentNode[Za]._isOutsideThisEl(t.target),!e&&Xs(t)),!s.dragoverBubble&&t.stopPropagation&&t.stopPropagation(),d=!0}function R(){gs=Ha(ss),ys=Ha(ss,s.draggable),as({sortable:p,name:"change",toEl:i,newIndex:gs,newDraggableIndex:ys,originalEvent:t})}},_ignoreWhileAnimating:null,_offMoveEvents:function(){Pa(document,"mousemove",this._onTouchMove),Pa(document,"touchmove",this._onTouchMove),Pa(document,"pointermove",this._onTouchMove),Pa(document,"dragover",Xs),Pa(document,"mousemove",Xs),Pa(document,"touchmove",Xs)},_offUpEvents:function(){var t=this.el.ownerDocument;Pa(t,"mouseup",this._onDrop),Pa(t,"touchend",this._onDrop),Pa(t,"pointerup",this._onDrop),Pa(t,"touchcancel",this._onDrop),Pa(document,"selectstart",this)},_onDrop:function(t){var e=this.el,n=this.options;gs=Ha(ss),ys=Ha(ss,n.draggable),is("drop",this,{evt:t}),ls=ss&&ss.parentNode,gs=Ha(ss),ys=Ha(ss,n.draggable),Js.eventCanceled||(Rs=!1,Bs=!1,Ds=!1,clearInterval(this._loopId),clearTimeout(this._dragStartTimer),rl(this.cloneId),rl(this._dragStartId),this.nativeDraggable&&(Pa(document,"drop",this),Pa(e,"dragstart",this._onDragStart)),this._offMoveEvents(),this._offUpEvents(),Aa&&Ba(document.body,"user-select",""),Ba(ss,"transform",""),t&&(Cs&&(t.cancelable&&t.preventDefault(),!n.dropBubble&&t.stopPropagation()),us&&us.parentNode&&us.parentNode.removeChild(us),(cs===ls||ws&&"clone"!==ws.lastPutMode)&&ps&&ps.parentNode&&ps.parentNode.removeChild(ps),ss&&(this.nativeDraggable&&Pa(ss,"dragend",this),Qs(ss),ss.style["will-change"]="",Cs&&!Rs&&Da(ss,ws?ws.options.ghostClass:this.options.ghostClass,!1),Da(ss,this.options.chosenClass,!1),as({sortable:this,name:"unchoose",toEl:ls,newIndex:null,newDraggableIndex:null,originalEvent:t}),cs!==ls?(gs>=0&&(as({rootEl:ls,name:"add",toEl:ls,fromEl:cs,originalEvent:t}),as({sortable:this,name:"remove",toEl:ls,originalEvent:t}),as({rootEl:ls,name:"sort",toEl:ls,fromEl:cs,originalEvent:t}),as({sortable:this,name:"sort",toEl:ls,originalEvent:t})),ws&&ws.save()):gs!==ms&&gs>=0&&(as({sortable:this,name:"update",toEl:ls,originalEvent:t}),as({sortable:this,name:"sort",toEl:ls,originalEvent:t})),Js.active&&(null!=gs&&-1!==gs||(gs=ms,ys=vs),as({sortable:this,name:"end",toEl:ls,originalEvent:t}),this.save())))),this._nulling()},_nulling:function(){is("nulling",this),cs=ss=ls=us=hs=ps=fs=ds=_s=xs=Cs=gs=ys=ms=vs=Ss=Ps=ws=bs=Js.dragged=Js.ghost=Js.clone=Js.active=null,Ls.forEach((function(t){t.checked=!0})),Ls.length=ks=As=0},handleEvent:function(t){switch(t.type){case"drop":case"dragend":this._onDrop(t);break;case"dragenter":case"dragover":ss&&(this._onDragOver(t),function(t){t.dataTransfer&&(t.dataTransfer.dropEffect="move");t.cancelable&&t.preventDefault()}(t));break;case"selectstart":t.preventDefault()}},toArray:function(){for(var t,e=[],n=this.el.children,r=0,o=n.length,i=this.options;r<o;r++)Ra(t=n[r],i.draggable,this.el,!1)&&e.push(t.getAttribute(i.dataIdAttr)||el(t));return e},sort:function(t,e){var n={},r=this.el;this.toArray().forEach((function(t,e){var o=r.children[e];Ra(o,this.options.draggable,r,!1)&&(n[t]=o)}),this),e&&this.captureAnimationState(),t.forEach((function(t){n[t]&&(r.removeChild(n[t]),r.appendChild(n[t]))})),e&&this.animateAll()},save:function(){var t=this.options.store;t&&t.set&&t.set(this)},closest:function(t,e){return Ra(t,e||this.options.draggable,this.el,!1)},option:function(t,e){var n=this.options;if(void 0===e)return n[t];var r=ns.modifyOption(this,t,e);n[t]=void 0!==r?r:e,"group"===t&&Ws(n)},destroy:function(){is("destroy",this);var t=this.el;t[Za]=null,Pa(t,"mousedown",this._onTapStart),Pa(t,"touchstart",this._onTapStart),Pa(t,"pointerdown",this._onTapStart),this.nativeDraggable&&(Pa(t,"dragover",this),Pa(t,"dragenter",this)),Array.prototype.forEach.call(t.querySelectorAll("[draggable]"),(function(t){t.removeAttribute("draggable")})),this._onDrop(),this._disableDelayedDragEvents(),Ns.splice(Ns.indexOf(this.el),1),this.el=t=null},_hideClone:function(){if(!ds){if(is("hideClone",this),Js.eventCanceled)return;Ba(ps,"display","none"),this.options.removeCloneOnHide&&ps.parentNode&&ps.parentNode.removeChild(ps),ds=!0}},_showClone:function(t){if("clone"===t.lastPutMode){if(ds){if(is("showClone",this),Js.eventCanceled)return;ss.parentNode!=cs||this.options.group.revertClone?hs?cs.insertBefore(ps,hs):cs.appendChild(ps):cs.insertBefore(ps,ss),this.options.group.revertClone&&this.animate(ss,ps),Ba(ps,"display",""),ds=!1}}else this._hideClone()}},zs&&Sa(document,"touchmove",(function(t){(Js.active||Rs)&&t.cancelable&&t.preventDefault()})),Js.utils={on:Sa,off:Pa,css:Ba,find:Ia,is:function(t,e){return!!Ra(t,e,t,!1)},extend:function(t,e){if(t&&e)for(var n in e)e.hasOwnProperty(n)&&(t[n]=e[n]);return t},throttle:Ka,closest:Ra,toggleClass:Da,clone:Ya,index:Ha,nextTick:nl,cancelNextTick:rl,detectDirection:qs,getChild:Fa},Js.get=function(t){return t[Za]},Js.mount=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];e[0].constructor===Array&&(e=e[0]),e.forEach((function(t){if(!t.prototype||!t.prototype.constructor)throw"Sortable: Mounted plugin must be a constructor function, not ".concat({}.toString.call(t));t.utils&&(Js.utils=ma(ma({},Js.utils),t.utils)),ns.mount(t)}))},Js.create=function(t,e){return new Js(t,e)},Js.version="1.15.2";var ol,il,al,sl,ll,ul,cl=[],hl=!1;function fl(){cl.forEach((function(t){clearInterval(t.pid)})),cl=[]}function pl(){clearInterval(ul)}var dl=Ka((function(t,e,n,r){if(e.scroll){var o,i=(t.touches?t.touches[0]:t).clientX,a=(t.touches?t.touches[0]:t).clientY,s=e.scrollSensitivity,l=e.scrollSpeed,u=La(),c=!1;il!==n&&(il=n,fl(),ol=e.scroll,o=e.scrollFn,!0===ol&&(ol=Wa(n,!0)));var h=0,f=ol;do{var p=f,d=za(p),m=d.top,g=d.bottom,v=d.left,y=d.right,b=d.width,w=d.height,_=void 0,x=void 0,k=p.scrollWidth,A=p.scrollHeight,O=Ba(p),E=p.scrollLeft,C=p.scrollTop;p===u?(_=b<k&&("auto"===O.overflowX||"scroll"===O.overflowX||"visible"===O.overflowX),x=w<A&&("auto"===O.overflowY||"scroll"===O.overflowY||"visible"===O.overflowY)):(_=b<k&&("auto"===O.overflowX||"scroll"===O.overflowX),x=w<A&&("auto"===O.overflowY||"scroll"===O.overflowY));var S=_&&(Math.abs(y-i)<=s&&E+b<k)-(Math.abs(v-i)<=s&&!!E),P=x&&(Math.abs(g-a)<=s&&C+w<A)-(Math.abs(m-a)<=s&&!!C);if(!cl[h])for(var j=0;j<=h;j++)cl[j]||(cl[j]={});cl[h].vx==S&&cl[h].vy==P&&cl[h].el===p||(cl[h].el=p,cl[h].vx=S,cl[h].vy=P,clearInterval(cl[h].pid),0==S&&0==P||(c=!0,cl[h].pid=setInterval(function(){r&&0===this.layer&&Js.active._onTouchMove(ll);var e=cl[this.layer].vy?cl[this.layer].vy*l:0,n=cl[this.layer].vx?cl[this.layer].vx*l:0;"function"==typeof o&&"continue"!==o.call(Js.dragged.parentNode[Za],n,e,t,ll,cl[this.layer].el)||Xa(cl[this.layer].el,n,e)}.bind({layer:h}),24))),h++}while(e.bubbleScroll&&f!==u&&(f=Wa(f,!1)));hl=c}}),30),ml=function(t){var e=t.originalEvent,n=t.putSortable,r=t.dragEl,o=t.activeSortable,i=t.dispatchSortableEvent,a=t.hideGhostForTarget,s=t.unhideGhostForTarget;if(e){var l=n||o;a();var u=e.changedTouches&&e.changedTouches.length?e.changedTouches[0]:e,c=document.elementFromPoint(u.clientX,u.clientY);s(),l&&!l.el.contains(c)&&(i("spill"),this.onSpill({dragEl:r,putSortable:n}))}};function gl(){}function vl(){}gl.prototype={startIndex:null,dragStart:function(t){var e=t.oldDraggableIndex;this.startIndex=e},onSpill:function(t){var e=t.dragEl,n=t.putSortable;this.sortable.captureAnimationState(),n&&n.captureAnimationState();var r=Fa(this.sortable.el,this.startIndex,this.options);r?this.sortable.el.insertBefore(e,r):this.sortable.el.appendChild(e),this.sortable.animateAll(),n&&n.animateAll()},drop:ml},ya(gl,{pluginName:"revertOnSpill"}),vl.prototype={onSpill:function(t){var e=t.dragEl,n=t.putSortable||this.sortable;n.captureAnimationState(),e.parentNode&&e.parentNode.removeChild(e),n.animateAll()},drop:ml},ya(vl,{pluginName:"removeOnSpill"});Js.mount(new function(){function t(){for(var t in this.defaults={scroll:!0,forceAutoScrollFallback:!1,scrollSensitivity:30,scrollSpeed:10,bubbleScroll:!0},this)"_"===t.charAt(0)&&"function"==typeof this[t]&&(this[t]=this[t].bind(this))}return t.prototype={dragStarted:function(t){var e=t.originalEvent;this.sortable.nativeDraggable?Sa(document,"dragover",this._handleAutoScroll):this.options.supportPointer?Sa(document,"pointermove",this._handleFallbackAutoScroll):e.touches?Sa(document,"touchmove",this._handleFallbackAutoScroll):Sa(document,"mousemove",this._handleFallbackAutoScroll)},dragOverCompleted:function(t){var e=t.originalEvent;this.options.dragOverBubble||e.rootEl||this._handleAutoScroll(e)},drop:function(){this.sortable.nativeDraggable?Pa(document,"dragover",this._handleAutoScroll):(Pa(document,"pointermove",this._handleFallbackAutoScroll),Pa(document,"touchmove",this._handleFallbackAutoScroll),Pa(document,"mousemove",this._handleFallbackAutoScroll)),pl(),fl(),clearTimeout(Ma),Ma=void 0},nulling:function(){ll=il=ol=hl=ul=al=sl=null,cl.length=0},_handleFallbackAutoScroll:function(t){this._handleAutoScroll(t,!0)},_handleAutoScroll:function(t,e){var n=this,r=(t.touches?t.touches[0]:t).clientX,o=(t.touches?t.touches[0]:t).clientY,i=document.elementFromPoint(r,o);if(ll=t,e||this.options.forceAutoScrollFallback||xa||_a||Aa){dl(t,this.options,i,e);var a=Wa(i,!0);!hl||ul&&r===al&&o===sl||(ul&&pl(),ul=setInterval((function(){var i=Wa(document.elementFromPoint(r,o),!0);i!==a&&(a=i,fl()),dl(t,n.options,i,e)}),10),al=r,sl=o)}else{if(!this.options.bubbleScroll||Wa(i,!0)===La())return void fl();dl(t,this.options,Wa(i,!1),!1)}}},ya(t,{pluginName:"scroll",initializeByDefault:!0})}),Js.mount(vl,gl);var yl,bl=Js,wl=n(8966),_l=n.n(wl);function xl(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,kl()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function kl(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(kl=function(){return!!t})()}var Al,Ol=(0,Mr.fF)({text:"Loading..."})(yl=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=xl(this,e,[].concat(r)),(0,c.A)(t,"template",_l()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){this.options=t}},{key:"serializeData",value:function(){return this.options}}])}(vr.View))||yl,El=Ol;function Cl(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Sl()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Sl(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Sl=function(){return!!t})()}var Pl=(0,Mr.s7)("widgets-grid")(Al=function(t){function n(){var t;(0,o.A)(this,n);for(var e=arguments.length,r=new Array(e),i=0;i<e;i++)r[i]=arguments[i];return t=Cl(this,n,[].concat(r)),(0,c.A)(t,"template",(function(){return""})),t}return(0,u.A)(n,t),(0,i.A)(n,[{key:"initialize",value:function(){this.widgets=ca.A.widgets[this.options.tabName],this.settings=this.options.settings||(0,ko.gW)(this.options.tabName)}},{key:"onRender",value:function(){var t=this;this.getWidgetsArrangement().map((function(e){return e.map((function(e){return[e,t.widgets[e].widget,t.widgets[e].model]}))})).forEach((function(n){var r=e()('<div class="widgets-grid__col"></div>');t.$el.append(r),n.forEach((function(e){var n=pa(e,3),o=n[0],i=n[1],a=n[2];t.addWidget(r,o,i,a)}))})),this.$(".widgets-grid__col").each((function(e,n){return new bl(n,{group:"widgets",ghostClass:"widget_ghost",handle:".widget__handle",onEnd:t.saveWidgetsArrangement.bind(t)})}))}},{key:"getWidgetsArrangement",value:function(){var t=this,e=this.settings.getWidgetsArrangement().map((function(e){return e.filter((function(e){return t.widgets[e]}))}));return Object.keys(this.widgets).forEach((function(t){e.every((function(e){return-1===e.indexOf(t)}))&&e.reduce((function(t,e){return e.length<t.length?e:t})).push(t)})),e}},{key:"saveWidgetsArrangement",value:function(){this.settings.setWidgetsArrangement(this.$(".widgets-grid__col").toArray().map((function(t){return e()(t).find(".widget").toArray().map((function(t){return e()(t).data("id")}))})))}},{key:"addWidget",value:function(t,n,r,o){var i=e()(function(t){return'<div class="widget island" data-id="'.concat(t,'">\n    <div class="widget__handle">\n        <span class="draggable-icon"></span>\n    </div>\n    <div class="widget__body"></div>\n</div>')}(n));t.append(i),this.addRegion(n,{el:i.find(".widget__body")});var a=new o({},{name:n});!function(t,e,n,r){var o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:function(){};t.showChildView(e,new El),n.fetch().then((function(){t.showChildView(e,r),o()}))}(this,n,a,new r({model:a}))}}])}(vr.View))||Al,jl=Pl;function Tl(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Rl()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Rl(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Rl=function(){return!!t})()}var Ml=function(t){function e(){return(0,o.A)(this,e),Tl(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"getContentView",value:function(){return new jl({tabName:"widgets"})}}])}(Tr.A);allure.api.addTab("",{title:"tab.overview.name",icon:"fa fa-home",route:"",onEnter:function(){return new Ml({tabName:"tab.overview.name"})}});n(427),n(1334);function Nl(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function Dl(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?Nl(Object(n),!0).forEach((function(e){(0,c.A)(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):Nl(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}function Bl(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Vl()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Vl(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Vl=function(){return!!t})()}var Il=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Bl(this,e,[].concat(r)),(0,c.A)(t,"url",(function(){return"widgets/status-chart.json"})),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"fetch",value:function(t){var n=this;return(0,Ar._)(this.url(),"application/json").then((function(r){return(0,s.A)((0,l.A)(e.prototype),"fetch",n).call(n,Dl(Dl({},t),{},{url:r}))}))}}])}(Ee.Collection);function Ll(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,zl()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function zl(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(zl=function(){return!!t})()}var $l=function(t){function e(){return(0,o.A)(this,e),Ll(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(){this.collection=new Il}},{key:"loadData",value:function(){return this.collection.fetch()}},{key:"getContentView",value:function(){return new jl({model:this.collection,tabName:"graph"})}}])}(Tr.A);function Fl(t,e){return e||(e=t.slice(0)),Object.freeze(Object.defineProperties(t,{raw:{value:Object.freeze(e)}}))}allure.api.addTab("graph",{title:"tab.graph.name",icon:"fa fa-bar-chart",route:"graph",onEnter:function(){return new $l}});var Ul={value:()=>{}};function Hl(){for(var t,e=0,n=arguments.length,r={};e<n;++e){if(!(t=arguments[e]+"")||t in r||/[\s.]/.test(t))throw new Error("illegal type: "+t);r[t]=[]}return new ql(r)}function ql(t){this._=t}function Wl(t,e){for(var n,r=0,o=t.length;r<o;++r)if((n=t[r]).name===e)return n.value}function Gl(t,e,n){for(var r=0,o=t.length;r<o;++r)if(t[r].name===e){t[r]=Ul,t=t.slice(0,r).concat(t.slice(r+1));break}return null!=n&&t.push({name:e,value:n}),t}ql.prototype=Hl.prototype={constructor:ql,on:function(t,e){var n,r,o=this._,i=(r=o,(t+"").trim().split(/^|\s+/).map((function(t){var e="",n=t.indexOf(".");if(n>=0&&(e=t.slice(n+1),t=t.slice(0,n)),t&&!r.hasOwnProperty(t))throw new Error("unknown type: "+t);return{type:t,name:e}}))),a=-1,s=i.length;if(!(arguments.length<2)){if(null!=e&&"function"!=typeof e)throw new Error("invalid callback: "+e);for(;++a<s;)if(n=(t=i[a]).type)o[n]=Gl(o[n],t.name,e);else if(null==e)for(n in o)o[n]=Gl(o[n],t.name,null);return this}for(;++a<s;)if((n=(t=i[a]).type)&&(n=Wl(o[n],t.name)))return n},copy:function(){var t={},e=this._;for(var n in e)t[n]=e[n].slice();return new ql(t)},call:function(t,e){if((n=arguments.length-2)>0)for(var n,r,o=new Array(n),i=0;i<n;++i)o[i]=arguments[i+2];if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(i=0,n=(r=this._[t]).length;i<n;++i)r[i].value.apply(e,o)},apply:function(t,e,n){if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(var r=this._[t],o=0,i=r.length;o<i;++o)r[o].value.apply(e,n)}};var Kl=Hl;const Xl={passive:!1},Yl={capture:!0,passive:!1};function Jl(t){t.stopImmediatePropagation()}function Zl(t){t.preventDefault(),t.stopImmediatePropagation()}function Ql(t){var e=t.document.documentElement,n=er(t).on("dragstart.drag",Zl,Yl);"onselectstart"in e?n.on("selectstart.drag",Zl,Yl):(e.__noselect=e.style.MozUserSelect,e.style.MozUserSelect="none")}function tu(t,e){var n=t.document.documentElement,r=er(t).on("dragstart.drag",null);e&&(r.on("click.drag",Zl,Yl),setTimeout((function(){r.on("click.drag",null)}),0)),"onselectstart"in n?r.on("selectstart.drag",null):(n.style.MozUserSelect=n.__noselect,delete n.__noselect)}function eu(t,e){if(t=function(t){let e;for(;e=t.sourceEvent;)t=e;return t}(t),void 0===e&&(e=t.currentTarget),e){var n=e.ownerSVGElement||e;if(n.createSVGPoint){var r=n.createSVGPoint();return r.x=t.clientX,r.y=t.clientY,[(r=r.matrixTransform(e.getScreenCTM().inverse())).x,r.y]}if(e.getBoundingClientRect){var o=e.getBoundingClientRect();return[t.clientX-o.left-e.clientLeft,t.clientY-o.top-e.clientTop]}}return[t.pageX,t.pageY]}var nu,ru,ou=0,iu=0,au=0,su=1e3,lu=0,uu=0,cu=0,hu="object"==typeof performance&&performance.now?performance:Date,fu="object"==typeof window&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(t){setTimeout(t,17)};function pu(){return uu||(fu(du),uu=hu.now()+cu)}function du(){uu=0}function mu(){this._call=this._time=this._next=null}function gu(t,e,n){var r=new mu;return r.restart(t,e,n),r}function vu(){uu=(lu=hu.now())+cu,ou=iu=0;try{!function(){pu(),++ou;for(var t,e=nu;e;)(t=uu-e._time)>=0&&e._call.call(void 0,t),e=e._next;--ou}()}finally{ou=0,function(){var t,e,n=nu,r=1/0;for(;n;)n._call?(r>n._time&&(r=n._time),t=n,n=n._next):(e=n._next,n._next=null,n=t?t._next=e:nu=e);ru=t,bu(r)}(),uu=0}}function yu(){var t=hu.now(),e=t-lu;e>su&&(cu-=e,lu=t)}function bu(t){ou||(iu&&(iu=clearTimeout(iu)),t-uu>24?(t<1/0&&(iu=setTimeout(vu,t-hu.now()-cu)),au&&(au=clearInterval(au))):(au||(lu=hu.now(),au=setInterval(yu,su)),ou=1,fu(vu)))}function wu(t,e,n){var r=new mu;return e=null==e?0:+e,r.restart((n=>{r.stop(),t(n+e)}),e,n),r}mu.prototype=gu.prototype={constructor:mu,restart:function(t,e,n){if("function"!=typeof t)throw new TypeError("callback is not a function");n=(null==n?pu():+n)+(null==e?0:+e),this._next||ru===this||(ru?ru._next=this:nu=this,ru=this),this._call=t,this._time=n,bu()},stop:function(){this._call&&(this._call=null,this._time=1/0,bu())}};var _u=Kl("start","end","cancel","interrupt"),xu=[],ku=0,Au=1,Ou=2,Eu=3,Cu=4,Su=5,Pu=6;function ju(t,e,n,r,o,i){var a=t.__transition;if(a){if(n in a)return}else t.__transition={};!function(t,e,n){var r,o=t.__transition;function i(t){n.state=Au,n.timer.restart(a,n.delay,n.time),n.delay<=t&&a(t-n.delay)}function a(i){var u,c,h,f;if(n.state!==Au)return l();for(u in o)if((f=o[u]).name===n.name){if(f.state===Eu)return wu(a);f.state===Cu?(f.state=Pu,f.timer.stop(),f.on.call("interrupt",t,t.__data__,f.index,f.group),delete o[u]):+u<e&&(f.state=Pu,f.timer.stop(),f.on.call("cancel",t,t.__data__,f.index,f.group),delete o[u])}if(wu((function(){n.state===Eu&&(n.state=Cu,n.timer.restart(s,n.delay,n.time),s(i))})),n.state=Ou,n.on.call("start",t,t.__data__,n.index,n.group),n.state===Ou){for(n.state=Eu,r=new Array(h=n.tween.length),u=0,c=-1;u<h;++u)(f=n.tween[u].value.call(t,t.__data__,n.index,n.group))&&(r[++c]=f);r.length=c+1}}function s(e){for(var o=e<n.duration?n.ease.call(null,e/n.duration):(n.timer.restart(l),n.state=Su,1),i=-1,a=r.length;++i<a;)r[i].call(t,o);n.state===Su&&(n.on.call("end",t,t.__data__,n.index,n.group),l())}function l(){for(var r in n.state=Pu,n.timer.stop(),delete o[e],o)return;delete t.__transition}o[e]=n,n.timer=gu(i,0,n.time)}(t,n,{name:e,index:r,group:o,on:_u,tween:xu,time:i.time,delay:i.delay,duration:i.duration,ease:i.ease,timer:null,state:ku})}function Tu(t,e){var n=Mu(t,e);if(n.state>ku)throw new Error("too late; already scheduled");return n}function Ru(t,e){var n=Mu(t,e);if(n.state>Eu)throw new Error("too late; already running");return n}function Mu(t,e){var n=t.__transition;if(!n||!(n=n[e]))throw new Error("transition not found");return n}function Nu(t,e){var n,r,o,i=t.__transition,a=!0;if(i){for(o in e=null==e?null:e+"",i)(n=i[o]).name===e?(r=n.state>Ou&&n.state<Su,n.state=Pu,n.timer.stop(),n.on.call(r?"interrupt":"cancel",t,t.__data__,n.index,n.group),delete i[o]):a=!1;a&&delete t.__transition}}var Du,Bu=180/Math.PI,Vu={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function Iu(t,e,n,r,o,i){var a,s,l;return(a=Math.sqrt(t*t+e*e))&&(t/=a,e/=a),(l=t*n+e*r)&&(n-=t*l,r-=e*l),(s=Math.sqrt(n*n+r*r))&&(n/=s,r/=s,l/=s),t*r<e*n&&(t=-t,e=-e,l=-l,a=-a),{translateX:o,translateY:i,rotate:Math.atan2(e,t)*Bu,skewX:Math.atan(l)*Bu,scaleX:a,scaleY:s}}function Lu(t,e,n,r){function o(t){return t.length?t.pop()+" ":""}return function(i,a){var s=[],l=[];return i=t(i),a=t(a),function(t,r,o,i,a,s){if(t!==o||r!==i){var l=a.push("translate(",null,e,null,n);s.push({i:l-4,x:Et(t,o)},{i:l-2,x:Et(r,i)})}else(o||i)&&a.push("translate("+o+e+i+n)}(i.translateX,i.translateY,a.translateX,a.translateY,s,l),function(t,e,n,i){t!==e?(t-e>180?e+=360:e-t>180&&(t+=360),i.push({i:n.push(o(n)+"rotate(",null,r)-2,x:Et(t,e)})):e&&n.push(o(n)+"rotate("+e+r)}(i.rotate,a.rotate,s,l),function(t,e,n,i){t!==e?i.push({i:n.push(o(n)+"skewX(",null,r)-2,x:Et(t,e)}):e&&n.push(o(n)+"skewX("+e+r)}(i.skewX,a.skewX,s,l),function(t,e,n,r,i,a){if(t!==n||e!==r){var s=i.push(o(i)+"scale(",null,",",null,")");a.push({i:s-4,x:Et(t,n)},{i:s-2,x:Et(e,r)})}else 1===n&&1===r||i.push(o(i)+"scale("+n+","+r+")")}(i.scaleX,i.scaleY,a.scaleX,a.scaleY,s,l),i=a=null,function(t){for(var e,n=-1,r=l.length;++n<r;)s[(e=l[n]).i]=e.x(t);return s.join("")}}}var zu=Lu((function(t){const e=new("function"==typeof DOMMatrix?DOMMatrix:WebKitCSSMatrix)(t+"");return e.isIdentity?Vu:Iu(e.a,e.b,e.c,e.d,e.e,e.f)}),"px, ","px)","deg)"),$u=Lu((function(t){return null==t?Vu:(Du||(Du=document.createElementNS("http://www.w3.org/2000/svg","g")),Du.setAttribute("transform",t),(t=Du.transform.baseVal.consolidate())?Iu((t=t.matrix).a,t.b,t.c,t.d,t.e,t.f):Vu)}),", ",")",")");function Fu(t,e){var n,r;return function(){var o=Ru(this,t),i=o.tween;if(i!==n)for(var a=0,s=(r=n=i).length;a<s;++a)if(r[a].name===e){(r=r.slice()).splice(a,1);break}o.tween=r}}function Uu(t,e,n){var r,o;if("function"!=typeof n)throw new Error;return function(){var i=Ru(this,t),a=i.tween;if(a!==r){o=(r=a).slice();for(var s={name:e,value:n},l=0,u=o.length;l<u;++l)if(o[l].name===e){o[l]=s;break}l===u&&o.push(s)}i.tween=o}}function Hu(t,e,n){var r=t._id;return t.each((function(){var t=Ru(this,r);(t.value||(t.value={}))[e]=n.apply(this,arguments)})),function(t){return Mu(t,r).value[e]}}function qu(t,e){var n;return("number"==typeof e?Et:e instanceof tt?_t:(n=tt(e))?(e=n,_t):jt)(t,e)}function Wu(t){return function(){this.removeAttribute(t)}}function Gu(t){return function(){this.removeAttributeNS(t.space,t.local)}}function Ku(t,e,n){var r,o,i=n+"";return function(){var a=this.getAttribute(t);return a===i?null:a===r?o:o=e(r=a,n)}}function Xu(t,e,n){var r,o,i=n+"";return function(){var a=this.getAttributeNS(t.space,t.local);return a===i?null:a===r?o:o=e(r=a,n)}}function Yu(t,e,n){var r,o,i;return function(){var a,s,l=n(this);if(null!=l)return(a=this.getAttribute(t))===(s=l+"")?null:a===r&&s===o?i:(o=s,i=e(r=a,l));this.removeAttribute(t)}}function Ju(t,e,n){var r,o,i;return function(){var a,s,l=n(this);if(null!=l)return(a=this.getAttributeNS(t.space,t.local))===(s=l+"")?null:a===r&&s===o?i:(o=s,i=e(r=a,l));this.removeAttributeNS(t.space,t.local)}}function Zu(t,e){var n,r;function o(){var o=e.apply(this,arguments);return o!==r&&(n=(r=o)&&function(t,e){return function(n){this.setAttributeNS(t.space,t.local,e.call(this,n))}}(t,o)),n}return o._value=e,o}function Qu(t,e){var n,r;function o(){var o=e.apply(this,arguments);return o!==r&&(n=(r=o)&&function(t,e){return function(n){this.setAttribute(t,e.call(this,n))}}(t,o)),n}return o._value=e,o}function tc(t,e){return function(){Tu(this,t).delay=+e.apply(this,arguments)}}function ec(t,e){return e=+e,function(){Tu(this,t).delay=e}}function nc(t,e){return function(){Ru(this,t).duration=+e.apply(this,arguments)}}function rc(t,e){return e=+e,function(){Ru(this,t).duration=e}}var oc=tr.prototype.constructor;function ic(t){return function(){this.style.removeProperty(t)}}var ac=0;function sc(t,e,n,r){this._groups=t,this._parents=e,this._name=n,this._id=r}function lc(){return++ac}var uc=tr.prototype;sc.prototype=function(t){return tr().transition(t)}.prototype={constructor:sc,select:function(t){var e=this._name,n=this._id;"function"!=typeof t&&(t=Fe(t));for(var r=this._groups,o=r.length,i=new Array(o),a=0;a<o;++a)for(var s,l,u=r[a],c=u.length,h=i[a]=new Array(c),f=0;f<c;++f)(s=u[f])&&(l=t.call(s,s.__data__,f,u))&&("__data__"in s&&(l.__data__=s.__data__),h[f]=l,ju(h[f],e,n,f,h,Mu(s,n)));return new sc(i,this._parents,e,n)},selectAll:function(t){var e=this._name,n=this._id;"function"!=typeof t&&(t=He(t));for(var r=this._groups,o=r.length,i=[],a=[],s=0;s<o;++s)for(var l,u=r[s],c=u.length,h=0;h<c;++h)if(l=u[h]){for(var f,p=t.call(l,l.__data__,h,u),d=Mu(l,n),m=0,g=p.length;m<g;++m)(f=p[m])&&ju(f,e,n,m,p,d);i.push(p),a.push(l)}return new sc(i,a,e,n)},selectChild:uc.selectChild,selectChildren:uc.selectChildren,filter:function(t){"function"!=typeof t&&(t=We(t));for(var e=this._groups,n=e.length,r=new Array(n),o=0;o<n;++o)for(var i,a=e[o],s=a.length,l=r[o]=[],u=0;u<s;++u)(i=a[u])&&t.call(i,i.__data__,u,a)&&l.push(i);return new sc(r,this._parents,this._name,this._id)},merge:function(t){if(t._id!==this._id)throw new Error;for(var e=this._groups,n=t._groups,r=e.length,o=n.length,i=Math.min(r,o),a=new Array(r),s=0;s<i;++s)for(var l,u=e[s],c=n[s],h=u.length,f=a[s]=new Array(h),p=0;p<h;++p)(l=u[p]||c[p])&&(f[p]=l);for(;s<r;++s)a[s]=e[s];return new sc(a,this._parents,this._name,this._id)},selection:function(){return new oc(this._groups,this._parents)},transition:function(){for(var t=this._name,e=this._id,n=lc(),r=this._groups,o=r.length,i=0;i<o;++i)for(var a,s=r[i],l=s.length,u=0;u<l;++u)if(a=s[u]){var c=Mu(a,e);ju(a,t,n,u,s,{time:c.time+c.delay+c.duration,delay:0,duration:c.duration,ease:c.ease})}return new sc(r,this._parents,t,n)},call:uc.call,nodes:uc.nodes,node:uc.node,size:uc.size,empty:uc.empty,each:uc.each,on:function(t,e){var n=this._id;return arguments.length<2?Mu(this.node(),n).on.on(t):this.each(function(t,e,n){var r,o,i=function(t){return(t+"").trim().split(/^|\s+/).every((function(t){var e=t.indexOf(".");return e>=0&&(t=t.slice(0,e)),!t||"start"===t}))}(e)?Tu:Ru;return function(){var a=i(this,t),s=a.on;s!==r&&(o=(r=s).copy()).on(e,n),a.on=o}}(n,t,e))},attr:function(t,e){var n=ln(t),r="transform"===n?$u:qu;return this.attrTween(t,"function"==typeof e?(n.local?Ju:Yu)(n,r,Hu(this,"attr."+t,e)):null==e?(n.local?Gu:Wu)(n):(n.local?Xu:Ku)(n,r,e))},attrTween:function(t,e){var n="attr."+t;if(arguments.length<2)return(n=this.tween(n))&&n._value;if(null==e)return this.tween(n,null);if("function"!=typeof e)throw new Error;var r=ln(t);return this.tween(n,(r.local?Zu:Qu)(r,e))},style:function(t,e,n){var r="transform"==(t+="")?zu:qu;return null==e?this.styleTween(t,function(t,e){var n,r,o;return function(){var i=bn(this,t),a=(this.style.removeProperty(t),bn(this,t));return i===a?null:i===n&&a===r?o:o=e(n=i,r=a)}}(t,r)).on("end.style."+t,ic(t)):"function"==typeof e?this.styleTween(t,function(t,e,n){var r,o,i;return function(){var a=bn(this,t),s=n(this),l=s+"";return null==s&&(this.style.removeProperty(t),l=s=bn(this,t)),a===l?null:a===r&&l===o?i:(o=l,i=e(r=a,s))}}(t,r,Hu(this,"style."+t,e))).each(function(t,e){var n,r,o,i,a="style."+e,s="end."+a;return function(){var l=Ru(this,t),u=l.on,c=null==l.value[a]?i||(i=ic(e)):void 0;u===n&&o===c||(r=(n=u).copy()).on(s,o=c),l.on=r}}(this._id,t)):this.styleTween(t,function(t,e,n){var r,o,i=n+"";return function(){var a=bn(this,t);return a===i?null:a===r?o:o=e(r=a,n)}}(t,r,e),n).on("end.style."+t,null)},styleTween:function(t,e,n){var r="style."+(t+="");if(arguments.length<2)return(r=this.tween(r))&&r._value;if(null==e)return this.tween(r,null);if("function"!=typeof e)throw new Error;return this.tween(r,function(t,e,n){var r,o;function i(){var i=e.apply(this,arguments);return i!==o&&(r=(o=i)&&function(t,e,n){return function(r){this.style.setProperty(t,e.call(this,r),n)}}(t,i,n)),r}return i._value=e,i}(t,e,null==n?"":n))},text:function(t){return this.tween("text","function"==typeof t?function(t){return function(){var e=t(this);this.textContent=null==e?"":e}}(Hu(this,"text",t)):function(t){return function(){this.textContent=t}}(null==t?"":t+""))},textTween:function(t){var e="text";if(arguments.length<1)return(e=this.tween(e))&&e._value;if(null==t)return this.tween(e,null);if("function"!=typeof t)throw new Error;return this.tween(e,function(t){var e,n;function r(){var r=t.apply(this,arguments);return r!==n&&(e=(n=r)&&function(t){return function(e){this.textContent=t.call(this,e)}}(r)),e}return r._value=t,r}(t))},remove:function(){return this.on("end.remove",function(t){return function(){var e=this.parentNode;for(var n in this.__transition)if(+n!==t)return;e&&e.removeChild(this)}}(this._id))},tween:function(t,e){var n=this._id;if(t+="",arguments.length<2){for(var r,o=Mu(this.node(),n).tween,i=0,a=o.length;i<a;++i)if((r=o[i]).name===t)return r.value;return null}return this.each((null==e?Fu:Uu)(n,t,e))},delay:function(t){var e=this._id;return arguments.length?this.each(("function"==typeof t?tc:ec)(e,t)):Mu(this.node(),e).delay},duration:function(t){var e=this._id;return arguments.length?this.each(("function"==typeof t?nc:rc)(e,t)):Mu(this.node(),e).duration},ease:function(t){var e=this._id;return arguments.length?this.each(function(t,e){if("function"!=typeof e)throw new Error;return function(){Ru(this,t).ease=e}}(e,t)):Mu(this.node(),e).ease},easeVarying:function(t){if("function"!=typeof t)throw new Error;return this.each(function(t,e){return function(){var n=e.apply(this,arguments);if("function"!=typeof n)throw new Error;Ru(this,t).ease=n}}(this._id,t))},end:function(){var t,e,n=this,r=n._id,o=n.size();return new Promise((function(i,a){var s={value:a},l={value:function(){0==--o&&i()}};n.each((function(){var n=Ru(this,r),o=n.on;o!==t&&((e=(t=o).copy())._.cancel.push(s),e._.interrupt.push(s),e._.end.push(l)),n.on=e})),0===o&&i()}))},[Symbol.iterator]:uc[Symbol.iterator]};var cc={time:null,delay:0,duration:250,ease:function(t){return((t*=2)<=1?t*t*t:(t-=2)*t*t+2)/2}};function hc(t,e){for(var n;!(n=t.__transition)||!(n=n[e]);)if(!(t=t.parentNode))throw new Error(`transition ${e} not found`);return n}tr.prototype.interrupt=function(t){return this.each((function(){Nu(this,t)}))},tr.prototype.transition=function(t){var e,n;t instanceof sc?(e=t._id,t=t._name):(e=lc(),(n=cc).time=pu(),t=null==t?null:t+"");for(var r=this._groups,o=r.length,i=0;i<o;++i)for(var a,s=r[i],l=s.length,u=0;u<l;++u)(a=s[u])&&ju(a,t,e,u,s,n||hc(a,e));return new sc(r,this._parents,t,e)};var fc=t=>()=>t;function pc(t,{sourceEvent:e,target:n,selection:r,mode:o,dispatch:i}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},target:{value:n,enumerable:!0,configurable:!0},selection:{value:r,enumerable:!0,configurable:!0},mode:{value:o,enumerable:!0,configurable:!0},_:{value:i}})}function dc(t){t.preventDefault(),t.stopImmediatePropagation()}var mc={name:"drag"},gc={name:"space"},vc={name:"handle"},yc={name:"center"};const{abs:bc,max:wc,min:_c}=Math;function xc(t){return[+t[0],+t[1]]}function kc(t){return[xc(t[0]),xc(t[1])]}var Ac={name:"x",handles:["w","e"].map(Tc),input:function(t,e){return null==t?null:[[+t[0],e[0][1]],[+t[1],e[1][1]]]},output:function(t){return t&&[t[0][0],t[1][0]]}},Oc={name:"y",handles:["n","s"].map(Tc),input:function(t,e){return null==t?null:[[e[0][0],+t[0]],[e[1][0],+t[1]]]},output:function(t){return t&&[t[0][1],t[1][1]]}},Ec=(["n","w","e","s","nw","ne","sw","se"].map(Tc),{overlay:"crosshair",selection:"move",n:"ns-resize",e:"ew-resize",s:"ns-resize",w:"ew-resize",nw:"nwse-resize",ne:"nesw-resize",se:"nwse-resize",sw:"nesw-resize"}),Cc={e:"w",w:"e",nw:"ne",ne:"nw",se:"sw",sw:"se"},Sc={n:"s",s:"n",nw:"sw",ne:"se",se:"ne",sw:"nw"},Pc={overlay:1,selection:1,n:null,e:1,s:null,w:-1,nw:-1,ne:1,se:1,sw:-1},jc={overlay:1,selection:1,n:-1,e:null,s:1,w:null,nw:-1,ne:-1,se:1,sw:1};function Tc(t){return{type:t}}function Rc(t){return!t.ctrlKey&&!t.button}function Mc(){var t=this.ownerSVGElement||this;return t.hasAttribute("viewBox")?[[(t=t.viewBox.baseVal).x,t.y],[t.x+t.width,t.y+t.height]]:[[0,0],[t.width.baseVal.value,t.height.baseVal.value]]}function Nc(){return navigator.maxTouchPoints||"ontouchstart"in this}function Dc(t){for(;!t.__brush;)if(!(t=t.parentNode))return;return t.__brush}function Bc(t){var e,n=Mc,r=Rc,o=Nc,i=!0,a=Kl("start","brush","end"),s=6;function l(e){var n=e.property("__brush",m).selectAll(".overlay").data([Tc("overlay")]);n.enter().append("rect").attr("class","overlay").attr("pointer-events","all").attr("cursor",Ec.overlay).merge(n).each((function(){var t=Dc(this).extent;er(this).attr("x",t[0][0]).attr("y",t[0][1]).attr("width",t[1][0]-t[0][0]).attr("height",t[1][1]-t[0][1])})),e.selectAll(".selection").data([Tc("selection")]).enter().append("rect").attr("class","selection").attr("cursor",Ec.selection).attr("fill","#777").attr("fill-opacity",.3).attr("stroke","#fff").attr("shape-rendering","crispEdges");var r=e.selectAll(".handle").data(t.handles,(function(t){return t.type}));r.exit().remove(),r.enter().append("rect").attr("class",(function(t){return"handle handle--"+t.type})).attr("cursor",(function(t){return Ec[t.type]})),e.each(u).attr("fill","none").attr("pointer-events","all").on("mousedown.brush",f).filter(o).on("touchstart.brush",f).on("touchmove.brush",p).on("touchend.brush touchcancel.brush",d).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function u(){var t=er(this),e=Dc(this).selection;e?(t.selectAll(".selection").style("display",null).attr("x",e[0][0]).attr("y",e[0][1]).attr("width",e[1][0]-e[0][0]).attr("height",e[1][1]-e[0][1]),t.selectAll(".handle").style("display",null).attr("x",(function(t){return"e"===t.type[t.type.length-1]?e[1][0]-s/2:e[0][0]-s/2})).attr("y",(function(t){return"s"===t.type[0]?e[1][1]-s/2:e[0][1]-s/2})).attr("width",(function(t){return"n"===t.type||"s"===t.type?e[1][0]-e[0][0]+s:s})).attr("height",(function(t){return"e"===t.type||"w"===t.type?e[1][1]-e[0][1]+s:s}))):t.selectAll(".selection,.handle").style("display","none").attr("x",null).attr("y",null).attr("width",null).attr("height",null)}function c(t,e,n){var r=t.__brush.emitter;return!r||n&&r.clean?new h(t,e,n):r}function h(t,e,n){this.that=t,this.args=e,this.state=t.__brush,this.active=0,this.clean=n}function f(n){if((!e||n.touches)&&r.apply(this,arguments)){var o,a,s,l,h,f,p,d,m,g,v,y=this,b=n.target.__data__.type,w="selection"===(i&&n.metaKey?b="overlay":b)?mc:i&&n.altKey?yc:vc,_=t===Oc?null:Pc[b],x=t===Ac?null:jc[b],k=Dc(y),A=k.extent,O=k.selection,E=A[0][0],C=A[0][1],S=A[1][0],P=A[1][1],j=0,T=0,R=_&&x&&i&&n.shiftKey,M=Array.from(n.touches||[n],(t=>{const e=t.identifier;return(t=eu(t,y)).point0=t.slice(),t.identifier=e,t}));Nu(y);var N=c(y,arguments,!0).beforestart();if("overlay"===b){O&&(m=!0);const e=[M[0],M[1]||M[0]];k.selection=O=[[o=t===Oc?E:_c(e[0][0],e[1][0]),s=t===Ac?C:_c(e[0][1],e[1][1])],[h=t===Oc?S:wc(e[0][0],e[1][0]),p=t===Ac?P:wc(e[0][1],e[1][1])]],M.length>1&&L(n)}else o=O[0][0],s=O[0][1],h=O[1][0],p=O[1][1];a=o,l=s,f=h,d=p;var D=er(y).attr("pointer-events","none"),B=D.selectAll(".overlay").attr("cursor",Ec[b]);if(n.touches)N.moved=I,N.ended=z;else{var V=er(n.view).on("mousemove.brush",I,!0).on("mouseup.brush",z,!0);i&&V.on("keydown.brush",(function(t){switch(t.keyCode){case 16:R=_&&x;break;case 18:w===vc&&(_&&(h=f-j*_,o=a+j*_),x&&(p=d-T*x,s=l+T*x),w=yc,L(t));break;case 32:w!==vc&&w!==yc||(_<0?h=f-j:_>0&&(o=a-j),x<0?p=d-T:x>0&&(s=l-T),w=gc,B.attr("cursor",Ec.selection),L(t));break;default:return}dc(t)}),!0).on("keyup.brush",(function(t){switch(t.keyCode){case 16:R&&(g=v=R=!1,L(t));break;case 18:w===yc&&(_<0?h=f:_>0&&(o=a),x<0?p=d:x>0&&(s=l),w=vc,L(t));break;case 32:w===gc&&(t.altKey?(_&&(h=f-j*_,o=a+j*_),x&&(p=d-T*x,s=l+T*x),w=yc):(_<0?h=f:_>0&&(o=a),x<0?p=d:x>0&&(s=l),w=vc),B.attr("cursor",Ec[b]),L(t));break;default:return}dc(t)}),!0),Ql(n.view)}u.call(y),N.start(n,w.name)}function I(t){for(const e of t.changedTouches||[t])for(const t of M)t.identifier===e.identifier&&(t.cur=eu(e,y));if(R&&!g&&!v&&1===M.length){const t=M[0];bc(t.cur[0]-t[0])>bc(t.cur[1]-t[1])?v=!0:g=!0}for(const t of M)t.cur&&(t[0]=t.cur[0],t[1]=t.cur[1]);m=!0,dc(t),L(t)}function L(t){const e=M[0],n=e.point0;var r;switch(j=e[0]-n[0],T=e[1]-n[1],w){case gc:case mc:_&&(j=wc(E-o,_c(S-h,j)),a=o+j,f=h+j),x&&(T=wc(C-s,_c(P-p,T)),l=s+T,d=p+T);break;case vc:M[1]?(_&&(a=wc(E,_c(S,M[0][0])),f=wc(E,_c(S,M[1][0])),_=1),x&&(l=wc(C,_c(P,M[0][1])),d=wc(C,_c(P,M[1][1])),x=1)):(_<0?(j=wc(E-o,_c(S-o,j)),a=o+j,f=h):_>0&&(j=wc(E-h,_c(S-h,j)),a=o,f=h+j),x<0?(T=wc(C-s,_c(P-s,T)),l=s+T,d=p):x>0&&(T=wc(C-p,_c(P-p,T)),l=s,d=p+T));break;case yc:_&&(a=wc(E,_c(S,o-j*_)),f=wc(E,_c(S,h+j*_))),x&&(l=wc(C,_c(P,s-T*x)),d=wc(C,_c(P,p+T*x)))}f<a&&(_*=-1,r=o,o=h,h=r,r=a,a=f,f=r,b in Cc&&B.attr("cursor",Ec[b=Cc[b]])),d<l&&(x*=-1,r=s,s=p,p=r,r=l,l=d,d=r,b in Sc&&B.attr("cursor",Ec[b=Sc[b]])),k.selection&&(O=k.selection),g&&(a=O[0][0],f=O[1][0]),v&&(l=O[0][1],d=O[1][1]),O[0][0]===a&&O[0][1]===l&&O[1][0]===f&&O[1][1]===d||(k.selection=[[a,l],[f,d]],u.call(y),N.brush(t,w.name))}function z(t){if(function(t){t.stopImmediatePropagation()}(t),t.touches){if(t.touches.length)return;e&&clearTimeout(e),e=setTimeout((function(){e=null}),500)}else tu(t.view,m),V.on("keydown.brush keyup.brush mousemove.brush mouseup.brush",null);D.attr("pointer-events","all"),B.attr("cursor",Ec.overlay),k.selection&&(O=k.selection),function(t){return t[0][0]===t[1][0]||t[0][1]===t[1][1]}(O)&&(k.selection=null,u.call(y)),N.end(t,w.name)}}function p(t){c(this,arguments).moved(t)}function d(t){c(this,arguments).ended(t)}function m(){var e=this.__brush||{selection:null};return e.extent=kc(n.apply(this,arguments)),e.dim=t,e}return l.move=function(e,n,r){e.tween?e.on("start.brush",(function(t){c(this,arguments).beforestart().start(t)})).on("interrupt.brush end.brush",(function(t){c(this,arguments).end(t)})).tween("brush",(function(){var e=this,r=e.__brush,o=c(e,arguments),i=r.selection,a=t.input("function"==typeof n?n.apply(this,arguments):n,r.extent),s=Rt(i,a);function l(t){r.selection=1===t&&null===a?null:s(t),u.call(e),o.brush()}return null!==i&&null!==a?l:l(1)})):e.each((function(){var e=this,o=arguments,i=e.__brush,a=t.input("function"==typeof n?n.apply(e,o):n,i.extent),s=c(e,o).beforestart();Nu(e),i.selection=null===a?null:a,u.call(e),s.start(r).brush(r).end(r)}))},l.clear=function(t,e){l.move(t,null,e)},h.prototype={beforestart:function(){return 1==++this.active&&(this.state.emitter=this,this.starting=!0),this},start:function(t,e){return this.starting?(this.starting=!1,this.emit("start",t,e)):this.emit("brush",t),this},brush:function(t,e){return this.emit("brush",t,e),this},end:function(t,e){return 0==--this.active&&(delete this.state.emitter,this.emit("end",t,e)),this},emit:function(e,n,r){var o=er(this.that).datum();a.call(e,this.that,new pc(e,{sourceEvent:n,target:l,selection:t.output(this.state.selection),mode:r,dispatch:a}),o)}},l.extent=function(t){return arguments.length?(n="function"==typeof t?t:fc(kc(t)),l):n},l.filter=function(t){return arguments.length?(r="function"==typeof t?t:fc(!!t),l):r},l.touchable=function(t){return arguments.length?(o="function"==typeof t?t:fc(!!t),l):o},l.handleSize=function(t){return arguments.length?(s=+t,l):s},l.keyModifiers=function(t){return arguments.length?(i=!!t,l):i},l.on=function(){var t=a.on.apply(a,arguments);return t===a?l:t},l}var Vc=t=>()=>t;function Ic(t,{sourceEvent:e,subject:n,target:r,identifier:o,active:i,x:a,y:s,dx:l,dy:u,dispatch:c}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},subject:{value:n,enumerable:!0,configurable:!0},target:{value:r,enumerable:!0,configurable:!0},identifier:{value:o,enumerable:!0,configurable:!0},active:{value:i,enumerable:!0,configurable:!0},x:{value:a,enumerable:!0,configurable:!0},y:{value:s,enumerable:!0,configurable:!0},dx:{value:l,enumerable:!0,configurable:!0},dy:{value:u,enumerable:!0,configurable:!0},_:{value:c}})}function Lc(t){return!t.ctrlKey&&!t.button}function zc(){return this.parentNode}function $c(t,e){return null==e?{x:t.x,y:t.y}:e}function Fc(){return navigator.maxTouchPoints||"ontouchstart"in this}Ic.prototype.on=function(){var t=this._.on.apply(this._,arguments);return t===this._?this:t};var Uc=n(5969),Hc=n(3633);function qc(t){for(var e=arguments.length,n=new Array(e>1?e-1:0),r=1;r<e;r++)n[r-1]=arguments[r];return t.reduce((function(t,e,r){return t+(0,Hc.escapeExpression)(n[r-1])+e}))}var Wc,Gc,Kc=n(424),Xc=n.n(Kc);function Yc(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Jc()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Jc(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Jc=function(){return!!t})()}var Zc=30,Qc=(0,Mr.s7)("timeline")(Wc=function(t){function e(){return(0,o.A)(this,e),Yc(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(){var t=this;this.chartX=ie(),this.brushX=ie(),this.sorter=vi({sorter:"sorter.name",ascending:!0}),this.brush=Bc(Ac).on("start brush end",this.onBrushChange.bind(this)),this.tooltip=new sr.A({position:"bottom"}),this.collection.applyFilterAndSorting((function(){return 1}),this.sorter),this.minDuration=this.collection.time.minDuration,this.maxDuration=this.collection.time.maxDuration,this.selectedDuration=this.minDuration,this.data=this.collection.toJSON(),this.total=this.collection.allResults.length,this.timeOffset=function(e){return e-t.collection.time.start}}},{key:"onAttach",value:function(){this.doShow()}},{key:"setupViewport",value:function(){this.$el.html(Xc()({PADDING:Zc})),this.svgChart=er(this.$el[0]).select(".timeline__chart_svg"),this.svgBrush=er(this.$el[0]).select(".timeline__brush_svg"),this.slider=this.svgChart.select(".timeline__slider")}},{key:"setupSlider",value:function(){var t=this,e=ie().range([0,this.width]).domain([this.minDuration,this.maxDuration]).clamp(!0);this.slider.append("line").attr("class","timeline__slider_track").attr("x1",e.range()[0]).attr("x2",e.range()[1]),this.handle=this.slider.insert("circle").attr("class","timeline__slider_handle").attr("cx",e(this.selectedDuration)).attr("r",8).call(function(){var t,e,n,r,o=Lc,i=zc,a=$c,s=Fc,l={},u=Kl("start","drag","end"),c=0,h=0;function f(t){t.on("mousedown.drag",p).filter(s).on("touchstart.drag",g).on("touchmove.drag",v,Xl).on("touchend.drag touchcancel.drag",y).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function p(a,s){if(!r&&o.call(this,a,s)){var l=b(this,i.call(this,a,s),a,s,"mouse");l&&(er(a.view).on("mousemove.drag",d,Yl).on("mouseup.drag",m,Yl),Ql(a.view),Jl(a),n=!1,t=a.clientX,e=a.clientY,l("start",a))}}function d(r){if(Zl(r),!n){var o=r.clientX-t,i=r.clientY-e;n=o*o+i*i>h}l.mouse("drag",r)}function m(t){er(t.view).on("mousemove.drag mouseup.drag",null),tu(t.view,n),Zl(t),l.mouse("end",t)}function g(t,e){if(o.call(this,t,e)){var n,r,a=t.changedTouches,s=i.call(this,t,e),l=a.length;for(n=0;n<l;++n)(r=b(this,s,t,e,a[n].identifier,a[n]))&&(Jl(t),r("start",t,a[n]))}}function v(t){var e,n,r=t.changedTouches,o=r.length;for(e=0;e<o;++e)(n=l[r[e].identifier])&&(Zl(t),n("drag",t,r[e]))}function y(t){var e,n,o=t.changedTouches,i=o.length;for(r&&clearTimeout(r),r=setTimeout((function(){r=null}),500),e=0;e<i;++e)(n=l[o[e].identifier])&&(Jl(t),n("end",t,o[e]))}function b(t,e,n,r,o,i){var s,h,p,d=u.copy(),m=eu(i||n,e);if(null!=(p=a.call(t,new Ic("beforestart",{sourceEvent:n,target:f,identifier:o,active:c,x:m[0],y:m[1],dx:0,dy:0,dispatch:d}),r)))return s=p.x-m[0]||0,h=p.y-m[1]||0,function n(i,a,u){var g,v=m;switch(i){case"start":l[o]=n,g=c++;break;case"end":delete l[o],--c;case"drag":m=eu(u||a,e),g=c}d.call(i,t,new Ic(i,{sourceEvent:a,subject:p,target:f,identifier:o,active:g,x:m[0]+s,y:m[1]+h,dx:m[0]-v[0],dy:m[1]-v[1],dispatch:d}),r)}}return f.filter=function(t){return arguments.length?(o="function"==typeof t?t:Vc(!!t),f):o},f.container=function(t){return arguments.length?(i="function"==typeof t?t:Vc(t),f):i},f.subject=function(t){return arguments.length?(a="function"==typeof t?t:Vc(t),f):a},f.touchable=function(t){return arguments.length?(s="function"==typeof t?t:Vc(!!t),f):s},f.on=function(){var t=u.on.apply(u,arguments);return t===u?f:t},f.clickDistance=function(t){return arguments.length?(h=(t=+t)*t,f):Math.sqrt(h)},f}().on("drag",(function(n){t.selectedDuration=e.invert(n.x),t.handle.attr("cx",e(t.selectedDuration))})).on("end",(function(){var n=function(t,e){return function(n){return n.children?n.children.length>0:t<=n.time.duration&&n.time.duration<=e}}(t.selectedDuration,t.maxDuration);t.collection.applyFilterAndSorting(n,t.sorter),t.data=t.collection.toJSON(),t.doShow(),t.handle.attr("cx",e(t.selectedDuration))})));var n=this.collection.testResults.length,r={count:n,percent:(100*n/this.total).toFixed(2),duration:(0,Uc.default)(this.selectedDuration)};this.slider.insert("g").append("text").attr("transform","translate(".concat(this.width/2,", 20)")).attr("class","timeline__slider_text").text((0,lr.default)("tab.timeline.selected",{hash:r})),this.slider.insert("g").attr("class","timeline__slider_text").attr("transform","translate(0, ".concat(20,")")).selectAll("text").data(e.domain()).enter().append("text").attr("x",e).text((function(t){return(0,Uc.default)(t,1)}))}},{key:"doShow",value:function(){var t=this;this.width=this.$el.width()>60?this.$el.width()-60:this.$el.width();var n=[this.collection.time.start,this.collection.time.stop];this.chartX.domain(n).range([0,this.width]),this.brushX.domain(n).range([0,this.width]),this.setupViewport(),this.setupSlider();var r=10,o=this.svgChart.select(".timeline__plot");r+=this.drawTestGroups(this.data,r,o,!0),er(this.$el[0]).select(".timeline__brush").style("top",(function(){return"".concat(Math.min(t.$el.height()-20,r+Zc),"px")})),this.xChartAxis=this.makeAxis(Le(),this.svgChart.select(".timeline__chart__axis_x"),{scale:this.chartX,tickFormat:function(){return""},tickSizeOuter:0,tickSizeInner:r}),this.xBrushAxis=this.makeAxis(Le(),this.svgBrush.select(".timeline__brush__axis_x"),{scale:this.chartX,tickFormat:function(e){return(0,Uc.default)(e-t.collection.time.start,2)},tickSizeOuter:0},{top:24,left:Zc}),this.brush.extent([[0,0],[this.width,20]]),this.svgBrush.append("g").attr("transform","translate(".concat(Zc,", ").concat(2,")")).attr("class","brush").call(this.brush).call(this.brush.move,this.chartX.range()),this.firstRender&&this.svgBrush.select(".brush").transition().duration(300).call(this.brush.move,[1/16*this.width,15/16*this.width]).transition().duration(500).call(this.brush.move,this.chartX.range()),this.svgChart.attr("height",(function(){return Zc+r+20})),(0,s.A)((0,l.A)(e.prototype),"onRender",this).call(this)}},{key:"drawTestGroups",value:function(t,e,n,r){var o=this;return t.filter((function(t){return t.children})).forEach((function(t){var i=0,a=n.append("g").attr("class","timeline__group").attr("transform","translate(0, ".concat(e,")"));if(r){var s=a.append("text").datum(t).text((function(t){return t.name})).attr("class","timeline__group_title");o.bindTooltip(s),e+=i=22}e+=o.drawTestGroups(t.children,i,a,!1)})),e+=this.drawTestResults(t.filter((function(t){return!t.children})),n,e)}},{key:"drawTestResults",value:function(t,e){var n=this;if(t.length){var r=e.selectAll(".timeline__item").data(t).enter().append("a").attr("xlink:href",(function(t){return"#testresult/".concat(t.uid)})).append("rect").attr("class",(function(t){return"timeline__item chart__fill_status_".concat(t.status)})).attr("x",(function(t){return n.chartX(t.time.start)})).attr("width",(function(t){return n.chartX(t.time.start+t.time.duration)})).attr("rx",2).attr("ry",2).attr("height",20);return this.bindTooltip(r),r.on("click",this.hideTooltip.bind(this)),22}return 0}},{key:"onBrushChange",value:function(t){var e=this,n=t.selection,r=function(t){return Math.max(0,Math.min(e.chartX(t.time.start),e.width))};n&&(this.chartX.domain(n.map(this.brushX.invert,this.brushX)),this.svgChart.selectAll(".timeline__item").attr("x",(function(t){return r(t)})).attr("width",(function(t){return function(t){return Math.max(0,Math.min(e.chartX(t.time.stop),e.width))}(t)-r(t)})),this.svgBrush.select(".timeline__brush__axis_x").call(this.xBrushAxis),this.svgChart.select(".timeline__chart__axis_x").call(this.xChartAxis)),this.svgBrush.selectAll(".handle").attr("y",0).attr("height",20)}},{key:"getTooltipContent",value:function(t){return qc(Gc||(Gc=Fl(["","<br>\n            "," — ",""])),t.name,(0,Uc.default)(this.timeOffset(t.time.start)),(0,Uc.default)(this.timeOffset(t.time.stop)))}}])}(ar))||Wc,th=Qc;function eh(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,nh()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function nh(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(nh=function(){return!!t})()}var rh=function(t){function e(){return(0,o.A)(this,e),eh(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){var n=t.url;(0,s.A)((0,l.A)(e.prototype),"initialize",this).call(this),this.items=new aa([],{url:n,parse:!0})}},{key:"loadData",value:function(){return this.items.fetch()}},{key:"getContentView",value:function(){return new th({collection:this.items})}}])}(Tr.A);function oh(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);e&&(r=r.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,r)}return n}function ih(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?oh(Object(n),!0).forEach((function(e){(0,c.A)(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):oh(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}allure.api.addTab("timeline",{title:"tab.timeline.name",icon:"fa fa-clock-o",route:"timeline",onEnter:function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];return new rh(ih(ih({},e),{},{url:"data/timeline.json"}))}});const ah=Math.abs,sh=Math.atan2,lh=Math.cos,uh=Math.max,ch=Math.min,hh=Math.sin,fh=Math.sqrt,ph=1e-12,dh=Math.PI,mh=dh/2,gh=2*dh;function vh(t){return t>=1?mh:t<=-1?-mh:Math.asin(t)}function yh(t){return t.innerRadius}function bh(t){return t.outerRadius}function wh(t){return t.startAngle}function _h(t){return t.endAngle}function xh(t){return t&&t.padAngle}function kh(t,e,n,r,o,i,a){var s=t-n,l=e-r,u=(a?i:-i)/fh(s*s+l*l),c=u*l,h=-u*s,f=t+c,p=e+h,d=n+c,m=r+h,g=(f+d)/2,v=(p+m)/2,y=d-f,b=m-p,w=y*y+b*b,_=o-i,x=f*m-d*p,k=(b<0?-1:1)*fh(uh(0,_*_*w-x*x)),A=(x*b-y*k)/w,O=(-x*y-b*k)/w,E=(x*b+y*k)/w,C=(-x*y+b*k)/w,S=A-g,P=O-v,j=E-g,T=C-v;return S*S+P*P>j*j+T*T&&(A=E,O=C),{cx:A,cy:O,x01:-c,y01:-h,x11:A*(o/_-1),y11:O*(o/_-1)}}function Ah(){var t=yh,e=bh,n=ue(0),r=null,o=wh,i=_h,a=xh,s=null,l=xe(u);function u(){var u,c,h,f=+t.apply(this,arguments),p=+e.apply(this,arguments),d=o.apply(this,arguments)-mh,m=i.apply(this,arguments)-mh,g=ah(m-d),v=m>d;if(s||(s=u=l()),p<f&&(c=p,p=f,f=c),p>ph)if(g>gh-ph)s.moveTo(p*lh(d),p*hh(d)),s.arc(0,0,p,d,m,!v),f>ph&&(s.moveTo(f*lh(m),f*hh(m)),s.arc(0,0,f,m,d,v));else{var y,b,w=d,_=m,x=d,k=m,A=g,O=g,E=a.apply(this,arguments)/2,C=E>ph&&(r?+r.apply(this,arguments):fh(f*f+p*p)),S=ch(ah(p-f)/2,+n.apply(this,arguments)),P=S,j=S;if(C>ph){var T=vh(C/f*hh(E)),R=vh(C/p*hh(E));(A-=2*T)>ph?(x+=T*=v?1:-1,k-=T):(A=0,x=k=(d+m)/2),(O-=2*R)>ph?(w+=R*=v?1:-1,_-=R):(O=0,w=_=(d+m)/2)}var M=p*lh(w),N=p*hh(w),D=f*lh(k),B=f*hh(k);if(S>ph){var V,I=p*lh(_),L=p*hh(_),z=f*lh(x),$=f*hh(x);if(g<dh)if(V=function(t,e,n,r,o,i,a,s){var l=n-t,u=r-e,c=a-o,h=s-i,f=h*l-c*u;if(!(f*f<ph))return[t+(f=(c*(e-i)-h*(t-o))/f)*l,e+f*u]}(M,N,z,$,I,L,D,B)){var F=M-V[0],U=N-V[1],H=I-V[0],q=L-V[1],W=1/hh(((h=(F*H+U*q)/(fh(F*F+U*U)*fh(H*H+q*q)))>1?0:h<-1?dh:Math.acos(h))/2),G=fh(V[0]*V[0]+V[1]*V[1]);P=ch(S,(f-G)/(W-1)),j=ch(S,(p-G)/(W+1))}else P=j=0}O>ph?j>ph?(y=kh(z,$,M,N,p,j,v),b=kh(I,L,D,B,p,j,v),s.moveTo(y.cx+y.x01,y.cy+y.y01),j<S?s.arc(y.cx,y.cy,j,sh(y.y01,y.x01),sh(b.y01,b.x01),!v):(s.arc(y.cx,y.cy,j,sh(y.y01,y.x01),sh(y.y11,y.x11),!v),s.arc(0,0,p,sh(y.cy+y.y11,y.cx+y.x11),sh(b.cy+b.y11,b.cx+b.x11),!v),s.arc(b.cx,b.cy,j,sh(b.y11,b.x11),sh(b.y01,b.x01),!v))):(s.moveTo(M,N),s.arc(0,0,p,w,_,!v)):s.moveTo(M,N),f>ph&&A>ph?P>ph?(y=kh(D,B,I,L,f,-P,v),b=kh(M,N,z,$,f,-P,v),s.lineTo(y.cx+y.x01,y.cy+y.y01),P<S?s.arc(y.cx,y.cy,P,sh(y.y01,y.x01),sh(b.y01,b.x01),!v):(s.arc(y.cx,y.cy,P,sh(y.y01,y.x01),sh(y.y11,y.x11),!v),s.arc(0,0,f,sh(y.cy+y.y11,y.cx+y.x11),sh(b.cy+b.y11,b.cx+b.x11),v),s.arc(b.cx,b.cy,P,sh(b.y11,b.x11),sh(b.y01,b.x01),!v))):s.arc(0,0,f,k,x,v):s.lineTo(D,B)}else s.moveTo(0,0);if(s.closePath(),u)return s=null,u+""||null}return u.centroid=function(){var n=(+t.apply(this,arguments)+ +e.apply(this,arguments))/2,r=(+o.apply(this,arguments)+ +i.apply(this,arguments))/2-dh/2;return[lh(r)*n,hh(r)*n]},u.innerRadius=function(e){return arguments.length?(t="function"==typeof e?e:ue(+e),u):t},u.outerRadius=function(t){return arguments.length?(e="function"==typeof t?t:ue(+t),u):e},u.cornerRadius=function(t){return arguments.length?(n="function"==typeof t?t:ue(+t),u):n},u.padRadius=function(t){return arguments.length?(r=null==t?null:"function"==typeof t?t:ue(+t),u):r},u.startAngle=function(t){return arguments.length?(o="function"==typeof t?t:ue(+t),u):o},u.endAngle=function(t){return arguments.length?(i="function"==typeof t?t:ue(+t),u):i},u.padAngle=function(t){return arguments.length?(a="function"==typeof t?t:ue(+t),u):a},u.context=function(t){return arguments.length?(s=null==t?null:t,u):s},u}function Oh(t,e){return e<t?-1:e>t?1:e>=t?0:NaN}function Eh(t){return t}var Ch,Sh,Ph,jh;function Th(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Rh()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Rh(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Rh=function(){return!!t})()}var Mh,Nh=(Ch=(0,Mr.on)("mouseleave .chart__legend-row"),Sh=(0,Mr.on)("mouseenter .chart__legend-row"),Ph=function(t){function e(){return(0,o.A)(this,e),Th(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(t){this.options=t,this.model=this.options.model,this.showLegend=this.options&&this.options.showLegend||!1,this.arc=Ah(),this.pie=function(){var t=Eh,e=Oh,n=null,r=ue(0),o=ue(gh),i=ue(0);function a(a){var s,l,u,c,h,f=(a=le(a)).length,p=0,d=new Array(f),m=new Array(f),g=+r.apply(this,arguments),v=Math.min(gh,Math.max(-gh,o.apply(this,arguments)-g)),y=Math.min(Math.abs(v)/f,i.apply(this,arguments)),b=y*(v<0?-1:1);for(s=0;s<f;++s)(h=m[d[s]=s]=+t(a[s],s,a))>0&&(p+=h);for(null!=e?d.sort((function(t,n){return e(m[t],m[n])})):null!=n&&d.sort((function(t,e){return n(a[t],a[e])})),s=0,u=p?(v-f*b)/p:0;s<f;++s,g=c)l=d[s],c=g+((h=m[l])>0?h*u:0)+b,m[l]={data:a[l],index:s,value:h,startAngle:g,endAngle:c,padAngle:y};return m}return a.value=function(e){return arguments.length?(t="function"==typeof e?e:ue(+e),a):t},a.sortValues=function(t){return arguments.length?(e=t,n=null,a):e},a.sort=function(t){return arguments.length?(n=t,e=null,a):n},a.startAngle=function(t){return arguments.length?(r="function"==typeof t?t:ue(+t),a):r},a.endAngle=function(t){return arguments.length?(o="function"==typeof t?t:ue(+t),a):o},a.padAngle=function(t){return arguments.length?(i="function"==typeof t?t:ue(+t),a):i},a}().sort(null).value((function(t){return t.value})),this.tooltip=new sr.A({position:"center"}),this.getChartData()}},{key:"getChartData",value:function(){this.statistic=this.model.get("statistic");var t=this.statistic.total,e=(0,kr.omit)(this.statistic,"total");this.data=Object.keys(e).map((function(n){return{name:n.toUpperCase(),value:e[n],part:e[n]/t}})).filter((function(t){return t.value}))}},{key:"setupViewport",value:function(){return(0,s.A)((0,l.A)(e.prototype),"setupViewport",this).call(this),this.showLegend&&this.$el.append(this.getLegendTpl()),this.svg}},{key:"onAttach",value:function(){var t=this,n=this.data,r=this.$el.outerWidth(),o=this.$el.outerHeight(),i=Math.min(r,o)/2-10,a=o/2,u=r/2;this.showLegend&&(u-=70),this.arc.innerRadius(.8*i).outerRadius(i),this.svg=this.setupViewport();var c=this.svg.select(".chart__plot").attr("transform","translate(".concat(u,",").concat(a,")")).selectAll(".chart__arc").data(this.pie(n)).enter().append("path").attr("class",(function(t){return"chart__arc chart__fill_status_".concat(t.data.name.toLowerCase())}));this.bindTooltip(c),this.svg.select(".chart__plot").append("text").classed("chart__caption",!0).attr("dy","0.4em").style("font-size","".concat(i/3,"px")).text(this.getChartTitle()),this.firstRender?c.transition().duration(750).attrTween("d",(function(e){var n=Rt(0,e.startAngle),r=Rt(0,e.endAngle);return function(e){return t.arc({startAngle:n(e),endAngle:r(e)})}})):c.attr("d",(function(e){return t.arc(e)})),(0,s.A)((0,l.A)(e.prototype),"onAttach",this).call(this)}},{key:"formatNumber",value:function(t){return(Math.floor(100*t)/100).toString()}},{key:"getChartTitle",value:function(){var t=this.statistic,e=t.passed,n=void 0===e?0:e,r=t.failed,o=void 0===r?0:r,i=t.broken,a=void 0===i?0:i,s=t.total;return(void 0===s?0:s)?n?"".concat(this.formatNumber(n/(n+o+a)*100),"%"):"0%":"???"}},{key:"getTooltipContent",value:function(t){var e=t.data,n=e.value||0,r=e.part||0,o=e.name.toLowerCase(),i=(0,lr.default)("status.".concat(o),{});return qc(jh||(jh=Fl(["\n            "," tests (","%)<br>\n            ","\n        "])),n,this.formatNumber(100*r),i)}},{key:"getLegendTpl",value:function(){return'<div class="chart__legend">\n    '.concat(ri.z.map((function(t){return'<div class="chart__legend-row" data-status="'.concat(t,'">\n<span class="chart__legend-icon chart__legend-icon_status_').concat(t,'"></span> ').concat((0,lr.default)("status.".concat(t)),"</div>")})).join(""),"\n</div>")}},{key:"onLegendOut",value:function(){this.hideTooltip()}},{key:"onLegendHover",value:function(t){var e=this.$(t.currentTarget).data("status"),n=this.$el.find(".chart__fill_status_".concat(e))[0];if(n){var r=er(n).datum();this.showTooltip(r,n)}}}])}(ar),(0,xo.A)(Ph.prototype,"onLegendOut",[Ch],Object.getOwnPropertyDescriptor(Ph.prototype,"onLegendOut"),Ph.prototype),(0,xo.A)(Ph.prototype,"onLegendHover",[Sh],Object.getOwnPropertyDescriptor(Ph.prototype,"onLegendHover"),Ph.prototype),Ph),Dh=Nh,Bh=n(1585),Vh=n.n(Bh);function Ih(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Lh()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Lh(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Lh=function(){return!!t})()}var zh=(0,Mr.s7)("status-widget")(Mh=(0,Mr.Ei)({chart:".status-widget__content"})(Mh=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Ih(this,e,[].concat(r)),(0,c.A)(t,"template",Vh()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onRender",value:function(){this.showChildView("chart",new Dh({model:this.getStatusChartData(),showLegend:!0}))}},{key:"getStatusChartData",value:function(){this.items=this.model.get("items");var t=this.items.reduce((function(t,e){return t[e.status.toLowerCase()]++,t}),{total:this.items.length,failed:0,broken:0,skipped:0,passed:0,unknown:0});return new Ee.Model({statistic:t})}}])}(vr.View))||Mh)||Mh,$h=zh;function Fh(t){return function(e){return e<0?-Math.pow(-e,t):Math.pow(e,t)}}function Uh(t){return t<0?-Math.sqrt(-t):Math.sqrt(t)}function Hh(t){return t<0?-t*t:t*t}function qh(t){var e=t(Bt,Bt),n=1;return e.exponent=function(e){return arguments.length?1===(n=+e)?t(Bt,Bt):.5===n?t(Uh,Hh):t(Fh(n),Fh(1/n)):n},oe(e)}function Wh(){var t=qh($t());return t.copy=function(){return zt(t,Wh()).exponent(t.exponent())},f.apply(t,arguments),t}function Gh(){return Wh.apply(null,arguments).exponent(.5)}allure.api.addWidget("graph","status-chart",$h);var Kh,Xh=n(4838);function Yh(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Jh()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Jh(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Jh=function(){return!!t})()}var Zh,Qh=["blocker","critical","normal","minor","trivial"],tf=function(t){function e(){return(0,o.A)(this,e),Yh(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(){this.x=w().domain(Qh),this.y=Gh(),this.status=w().domain(ri.z),this.tooltip=new Xh.A({position:"right"}),this.collection=this.model,this.getChartData()}},{key:"getChartData",value:function(){var t=this;this.data=Qh.map((function(e){return ri.z.map((function(n){var r=t.collection.filter((function(t){return t.status===n&&t.severity===e}));return{value:r.length,testResults:r,severity:e,status:n}}))}))}},{key:"onAttach",value:function(){var t=this,n=this.data;this.setupViewport(),this.x.range([0,this.width]),this.y.range([this.height,0],1),this.y.domain([0,h(n,(function(t){return h(t,(function(t){return t.value}))}))]).nice(),this.status.rangeRound([0,this.x.step()]),this.makeBottomAxis({tickFormat:function(t){return t.toLowerCase()},scale:this.x}),this.svg.selectAll(".tick").select("line").attr("transform","translate(".concat(this.x.step()/2," , 0)")),this.makeLeftAxis({scale:this.y,ticks:Math.min(10,this.y.domain()[1])});var r=this.svg.select(".chart__plot").selectAll(".chart__group").data(n).enter().append("g").attr("transform",(function(e){return"translate(".concat(t.x(e[0].severity),",0)")})).selectAll(".bar").data((function(t){return t})).enter().append("rect");r.attr("x",(function(e){return t.status(e.status)})).attr("y",this.height).attr("height",0).attr("width",this.status.step()).attr("class",(function(t){return"chart__bar chart__fill_status_".concat(t.status)})),this.bindTooltip(r),this.firstRender&&(r=r.transition().duration(500)),r.attr("y",(function(e){return t.y(e.value)})).attr("height",(function(e){return t.height-t.y(e.value)})),(0,s.A)((0,l.A)(e.prototype),"onAttach",this).call(this)}},{key:"getTooltipContent",value:function(t){var e=t.value,n=t.severity,r=t.status,o=t.testResults,i=o.slice(0,10),a=o.length-i.length;return"<b>".concat(e," ").concat(n.toLowerCase()," test cases ").concat(r.toLowerCase(),'</b><br>\n            <ul class="popover__list">\n                ').concat(i.map((function(t){return qc(Kh||(Kh=Fl(["<li>","</li>"])),t.name)})).join(""),"\n            </ul>\n            ").concat(a?"...and ".concat(a," more"):"","\n        ")}}])}(ar),ef=n(1463),nf=n.n(ef);function rf(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,of()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function of(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(of=function(){return!!t})()}var af=(0,Mr.s7)("severity-widget")(Zh=(0,Mr.Ei)({chart:".severity-widget__content"})(Zh=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=rf(this,e,[].concat(r)),(0,c.A)(t,"template",nf()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onRender",value:function(){this.showChildView("chart",new tf({model:this.model.get("items")}))}}])}(vr.View))||Zh)||Zh,sf=af;allure.api.addWidget("graph","severity",sf);var lf,uf=Array.prototype,cf=uf.slice;uf.map;function hf(t){return()=>t}function ff(t,e){let n,r;if(void 0===e)for(const e of t)null!=e&&(void 0===n?e>=e&&(n=r=e):(n>e&&(n=e),r<e&&(r=e)));else{let o=-1;for(let i of t)null!=(i=e(i,++o,t))&&(void 0===n?i>=i&&(n=r=i):(n>i&&(n=i),r<i&&(r=i)))}return[n,r]}function pf(t){return t}function df(t){return Math.max(1,Math.ceil(Math.log(function(t,e){let n=0;if(void 0===e)for(let e of t)null!=e&&(e=+e)>=e&&++n;else{let r=-1;for(let o of t)null!=(o=e(o,++r,t))&&(o=+o)>=o&&++n}return n}(t))/Math.LN2)+1)}function mf(){var t=pf,e=ff,n=df;function r(r){Array.isArray(r)||(r=Array.from(r));var o,i,a,s=r.length,l=new Array(s);for(o=0;o<s;++o)l[o]=t(r[o],o,r);var u=e(l),c=u[0],h=u[1],f=n(l,c,h);if(!Array.isArray(f)){const t=h,n=+f;if(e===ff&&([c,h]=function(t,e,n){let r;for(;;){const o=S(t,e,n);if(o===r||0===o||!isFinite(o))return[t,e];o>0?(t=Math.floor(t/o)*o,e=Math.ceil(e/o)*o):o<0&&(t=Math.ceil(t*o)/o,e=Math.floor(e*o)/o),r=o}}(c,h,n)),(f=C(c,h,n))[0]<=c&&(a=S(c,h,n)),f[f.length-1]>=h)if(t>=h&&e===ff){const t=S(c,h,n);isFinite(t)&&(t>0?h=(Math.floor(h/t)+1)*t:t<0&&(h=(Math.ceil(h*-t)+1)/-t))}else f.pop()}for(var p=f.length,d=0,m=p;f[d]<=c;)++d;for(;f[m-1]>h;)--m;(d||m<p)&&(f=f.slice(d,m),p=m-d);var g,v=new Array(p+1);for(o=0;o<=p;++o)(g=v[o]=[]).x0=o>0?f[o-1]:c,g.x1=o<p?f[o]:h;if(isFinite(a)){if(a>0)for(o=0;o<s;++o)null!=(i=l[o])&&c<=i&&i<=h&&v[Math.min(p,Math.floor((i-c)/a))].push(r[o]);else if(a<0)for(o=0;o<s;++o)if(null!=(i=l[o])&&c<=i&&i<=h){const t=Math.floor((c-i)*a);v[Math.min(p,t+(f[t]<=i))].push(r[o])}}else for(o=0;o<s;++o)null!=(i=l[o])&&c<=i&&i<=h&&v[D(f,i,0,p)].push(r[o]);return v}return r.value=function(e){return arguments.length?(t="function"==typeof e?e:hf(e),r):t},r.domain=function(t){return arguments.length?(e="function"==typeof t?t:hf([t[0],t[1]]),r):e},r.thresholds=function(t){return arguments.length?(n="function"==typeof t?t:hf(Array.isArray(t)?cf.call(t):t),r):n},r}function gf(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,vf()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function vf(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(vf=function(){return!!t})()}var yf,bf=function(t){function e(){return(0,o.A)(this,e),gf(this,e,arguments)}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(){this.collection=this.model,this.getChartData()}},{key:"getChartData",value:function(){this.data=this.collection.map((function(t){return{value:t.time.duration,name:t.name}})).filter((function(t){return null!==t.value}))}},{key:"onAttach",value:function(){this.data&&this.data.length?this.doShow():this.$el.html('<div class="widget__noitems">'.concat((0,lr.default)("chart.duration.empty"),"</div>")),(0,s.A)((0,l.A)(e.prototype),"onAttach",this).call(this)}},{key:"doShow",value:function(){var t=this;this.x=ie(),this.y=Gh(),this.tooltip=new Xh.A({position:"right"}),this.setupViewport(),this.x.range([0,this.width]),this.y.range([this.height,0],1);var e=h(this.data,(function(t){return t.value}));this.x.domain([0,Math.max(e,10)]).nice();var n=mf().value((function(t){return t.value})).domain(this.x.domain()).thresholds(this.x.ticks())(this.data).map((function(t){return{x0:t.x0,x1:t.x1,y:t.length,testResults:t}})),r=h(n,(function(t){return t.y}));this.y.domain([0,r]).nice(),this.makeBottomAxis({scale:this.x,tickFormat:function(t){return(0,Uc.default)(t,1)}}),this.makeLeftAxis({scale:this.y,ticks:Math.min(10,r)});var o=this.plot.selectAll(".chart__bar").data(n).enter().append("rect").classed("chart__bar",!0);this.bindTooltip(o),o.attr("x",(function(e){return t.x(e.x0)+2})).attr("y",this.height).attr("width",(function(e){return Math.max(t.x(e.x1)-t.x(e.x0)-2,0)})).attr("height",0),this.firstRender&&(o=o.transition().duration(500)),o.attr("y",(function(e){return t.y(e.y)})).attr("height",(function(e){return t.height-t.y(e.y)}))}},{key:"getTooltipContent",value:function(t){var e=t.testResults,n=e.slice(0,10),r=e.length-n.length;return"<b>".concat(e.length,' test cases</b><br>\n            <ul class="popover__list">\n                ').concat(n.map((function(t){return qc(lf||(lf=Fl(["<li>","</li>"])),t.name)})).join(""),"\n            </ul>\n            ").concat(r?"...and ".concat(r," more"):"","\n        ")}}])}(ar),wf=n(5549),_f=n.n(wf);function xf(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,kf()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function kf(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(kf=function(){return!!t})()}var Af=(0,Mr.s7)("duration-widget")(yf=(0,Mr.Ei)({chart:".duration-widget__content"})(yf=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=xf(this,e,[].concat(r)),(0,c.A)(t,"template",_f()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onRender",value:function(){this.showChildView("chart",new bf({model:this.model.get("items")}))}}])}(vr.View))||yf)||yf,Of=Af;function Ef(t){return function(t){if(Array.isArray(t))return ha(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||fa(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}allure.api.addWidget("graph","duration",Of);var Cf,Sf=n(1360),Pf=n.n(Sf);function jf(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Tf()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Tf(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Tf=function(){return!!t})()}var Rf=(0,Mr.Ei)({chart:".duration-trend__chart"})(Cf=(0,Mr.s7)("duration-trend")(Cf=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=jf(this,e,[].concat(r)),(0,c.A)(t,"template",Pf()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onRender",value:function(){var t="duration",e=this.model.map((function(e){return e.get("data")[t]})),n=Math.min.apply(Math,Ef([function(t){return t>=0},function(t){return t<=0}].map((function(t){return e.reduce((function(n,r,o){return t(r-e[o-1])?o:n}),(0,kr.last)(e))})))),r=Math.max.apply(Math,Ef(e))-Math.min.apply(Math,Ef(e)),o=e[n]-(0,kr.last)(e),i=ie().domain([0,Math.max(r,.25*Math.max.apply(Math,Ef(e)))]);i.range(o>0?["#c4cac6","#31a354"]:["#cdc5c4","#e34a33"]).interpolate(_t);var a=b().range([i(Math.abs(o))]);this.showChildView("chart",new gr({model:this.model,hidePoints:!0,hideLines:!0,colors:a,keys:[t],yTickFormat:function(t){return(0,Uc.default)(t,2)}}))}}])}(vr.View))||Cf)||Cf,Mf=Rf;allure.api.addWidget("graph","duration-trend",Mf,jr);var Nf,Df=(t=>kt(t[t.length-1]))(new Array(3).concat("ffeda0feb24cf03b20","ffffb2fecc5cfd8d3ce31a1c","ffffb2fecc5cfd8d3cf03b20bd0026","ffffb2fed976feb24cfd8d3cf03b20bd0026","ffffb2fed976feb24cfd8d3cfc4e2ae31a1cb10026","ffffccffeda0fed976feb24cfd8d3cfc4e2ae31a1cb10026","ffffccffeda0fed976feb24cfd8d3cfc4e2ae31a1cbd0026800026").map(ae)),Bf=n(4990),Vf=n.n(Bf);function If(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Lf()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Lf(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Lf=function(){return!!t})()}var zf=(0,Mr.Ei)({chart:".retry-trend__chart"})(Nf=(0,Mr.s7)("retry-trend")(Nf=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=If(this,e,[].concat(r)),(0,c.A)(t,"template",Vf()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onRender",value:function(){var t=this.model.last().get("data"),e=t.retry,n=t.run,r=Math.min(.3+Math.min(e,n)/n,1),o=b(["#4682b4",Df(r)]);this.showChildView("chart",new gr({model:this.model,keys:["run","retry"],colors:o,hideLines:!0,hidePoints:!0}))}}])}(vr.View))||Nf)||Nf,$f=zf;allure.api.addWidget("graph","retry-trend",$f,jr);var Ff,Uf=n(3972),Hf=n.n(Uf);function qf(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Wf()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Wf(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Wf=function(){return!!t})()}var Gf=(0,Mr.Ei)({chart:".categories-trend__chart"})(Ff=(0,Mr.s7)("categories-trend")(Ff=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=qf(this,e,[].concat(r)),(0,c.A)(t,"template",Hf()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onRender",value:function(){var t=this.model.sortedKeysByLastValue(),e=b((0,kr.range)(0,1,1/t.length).map((function(t){return Df(1-t)})));this.showChildView("chart",new gr({model:this.model,keys:t,colors:e,hideLines:!0,hidePoints:!0}))}}])}(vr.View))||Ff)||Ff,Kf=Gf;allure.api.addWidget("graph","categories-trend",Kf,jr);var Xf,Yf=n(5459),Jf=n.n(Yf);function Zf(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Qf()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Qf(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Qf=function(){return!!t})()}var tp=(0,Mr.Ei)({chart:".summary-widget__chart"})(Xf=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Zf(this,e,[].concat(r)),(0,c.A)(t,"template",Jf()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onRender",value:function(){this.showChildView("chart",new Dh({model:this.model,showLegend:!1}))}},{key:"serializeData",value:function(){var t=this.model.get("testRuns"),n=t&&t.length;return Object.assign((0,s.A)((0,l.A)(e.prototype),"serializeData",this).call(this),{isAggregated:n>1,launchesCount:n})}}])}(vr.View))||Xf,ep=tp;allure.api.addWidget("widgets","summary",ep);var np,rp=n(1650),op=n.n(rp);function ip(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,ap()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function ap(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(ap=function(){return!!t})()}var sp=(0,Mr.Ei)({chart:".history-trend__chart"})(np=(0,Mr.s7)("history-trend")(np=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=ip(this,e,[].concat(r)),(0,c.A)(t,"template",op()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"onRender",value:function(){this.showChildView("chart",new gr({model:this.model,hideLines:!0,hidePoints:!0,colors:b(["#fd5a3e","#ffd050","#97cc64","#aaa","#d35ebe"]).domain(ri.z),keys:ri.z}))}}])}(vr.View))||np)||np,lp=sp;allure.api.addWidget("widgets","history-trend",lp,jr),allure.api.addWidget("graph","history-trend",lp,jr),allure.api.addWidget("widgets","suites",xr.extend({rowTag:"a",title:"widget.suites.name",baseUrl:"suites",showLinks:!0})),allure.api.addWidget("widgets","categories",xr.extend({rowTag:"a",title:"widget.categories.name",baseUrl:"categories",showLinks:!0}));var up,cp,hp=n(4e3),fp=n.n(hp);function pp(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,dp()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function dp(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(dp=function(){return!!t})()}var mp=(up=(0,Mr.on)("click .environment-widget__expand"),cp=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=pp(this,e,[].concat(r)),(0,c.A)(t,"template",fp()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"initialize",value:function(){this.listLimit=5}},{key:"onExpandClick",value:function(){this.listLimit=this.model.get("items").length,this.render()}},{key:"serializeData",value:function(){var t=this.model.get("items");return{items:t.slice(0,this.listLimit),overLimit:t.length>this.listLimit}}}])}(vr.View),(0,xo.A)(cp.prototype,"onExpandClick",[up],Object.getOwnPropertyDescriptor(cp.prototype,"onExpandClick"),cp.prototype),cp);allure.api.addWidget("widgets","environment",mp);var gp=n(4538),vp=n.n(gp);function yp(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,bp()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function bp(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(bp=function(){return!!t})()}var wp=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=yp(this,e,[].concat(r)),(0,c.A)(t,"template",vp()),t}return(0,u.A)(e,t),(0,i.A)(e)}(vr.View),_p=wp;allure.api.addWidget("widgets","executors",_p);var xp,kp=n(9592),Ap=n.n(kp);function Op(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Ep()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Ep(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Ep=function(){return!!t})()}var Cp=(0,Mr.s7)("pane__section")(xp=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Op(this,e,[].concat(r)),(0,c.A)(t,"template",Ap()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){return{descriptionHtml:this.model.get("descriptionHtml")}}}])}(vr.View))||xp,Sp=Cp;allure.api.addTestResultBlock(Sp,{position:"before"});var Pp,jp=n(628),Tp=n.n(jp);function Rp(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Mp()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Mp(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Mp=function(){return!!t})()}var Np=(0,Mr.s7)("pane__section")(Pp=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Rp(this,e,[].concat(r)),(0,c.A)(t,"template",Tp()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){var t=this.model.get("extra");return{tags:t?t.tags:null}}}])}(vr.View))||Pp,Dp=Np;allure.api.addTestResultBlock(Dp,{position:"tag"});var Bp,Vp=n(1166),Ip=n.n(Vp);function Lp(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,zp()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function zp(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(zp=function(){return!!t})()}var $p=(0,Mr.s7)("pane__section")(Bp=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Lp(this,e,[].concat(r)),(0,c.A)(t,"template",Ip()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){var t=this.model.get("extra");return{categories:t?t.categories:null}}}])}(vr.View))||Bp,Fp=$p;allure.api.addTestResultBlock(Fp,{position:"tag"});var Up,Hp=n(9140),qp=n.n(Hp);function Wp(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Gp()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Gp(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Gp=function(){return!!t})()}function Kp(t){if(!t||!t.statistic||!t.statistic.total)return"unknown";var e,n=t.statistic,r=n.passed,o=n.total;return"".concat((e=(r||0)/o*100,(Math.floor(100*e)/100).toString()),"%")}var Xp=(0,Mr.s7)("test-result-history")(Up=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Wp(this,e,[].concat(r)),(0,c.A)(t,"template",qp()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){var t=this.model.get("extra"),e=t?t.history:null;return{cls:this.className,history:e,successRate:Kp(e)}}}])}(vr.View))||Up,Yp=Xp;allure.api.addTestResultTab("history","testResult.history.name",Yp);var Jp,Zp,Qp,td,ed=n(9500),nd=n.n(ed);function rd(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,od()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function od(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(od=function(){return!!t})()}var id=(Jp=(0,Mr.s7)("test-result-retries"),Zp=(0,Mr.on)("click .retry-row"),Jp((td=function(t){function n(){var t;(0,o.A)(this,n);for(var e=arguments.length,r=new Array(e),i=0;i<e;i++)r[i]=arguments[i];return t=rd(this,n,[].concat(r)),(0,c.A)(t,"template",nd()),t}return(0,u.A)(n,t),(0,i.A)(n,[{key:"serializeData",value:function(){var t=this.model.get("extra"),e=t?t.retries:null;return{cls:this.className,retries:e}}},{key:"onRetryClick",value:function(t){var n=e()(t.currentTarget).data("uid");_i.A.toUrl("#testresult/".concat(n))}}])}(vr.View),(0,xo.A)(td.prototype,"onRetryClick",[Zp],Object.getOwnPropertyDescriptor(td.prototype,"onRetryClick"),td.prototype),Qp=td))||Qp),ad=id;allure.api.addTestResultTab("retries","testResult.retries.name",ad);var sd,ld=n(6452),ud=n.n(ld);function cd(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,hd()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function hd(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(hd=function(){return!!t})()}var fd=(0,Mr.s7)("pane__section")(sd=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=cd(this,e,[].concat(r)),(0,c.A)(t,"template",ud()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){var t=this.model.get("extra");return{owner:t?t.owner:null}}}])}(vr.View))||sd,pd=fd;allure.api.addTestResultBlock(pd,{position:"before"});var dd,md=n(1428),gd=n.n(md);function vd(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,yd()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function yd(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(yd=function(){return!!t})()}var bd=(0,Mr.s7)("pane__section")(dd=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=vd(this,e,[].concat(r)),(0,c.A)(t,"template",gd()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){var t=this.model.get("extra");return{severity:t?t.severity:null}}}])}(vr.View))||dd,wd=bd;allure.api.addTestResultBlock(wd,{position:"tag"});var _d,xd=n(2694),kd=n.n(xd);function Ad(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Od()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Od(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Od=function(){return!!t})()}var Ed=(0,Mr.s7)("pane__section")(_d=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Ad(this,e,[].concat(r)),(0,c.A)(t,"template",kd()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){return{time:this.model.get("time")}}}])}(vr.View))||_d,Cd=Ed;allure.api.addTestResultBlock(Cd,{position:"tag"});var Sd,Pd,jd,Td,Rd=n(5774),Md=n.n(Rd);function Nd(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Dd()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Dd(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Dd=function(){return!!t})()}var Bd=(Sd=(0,Mr.s7)("pane__section"),Pd=(0,Mr.on)("click .environment"),Sd((Td=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=Nd(this,e,[].concat(r)),(0,c.A)(t,"template",Md()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){return{parameters:this.model.get("parameters")}}},{key:"onParameterClick",value:function(){this.$(".environment").toggleClass("line-ellipsis",!1)}}])}(vr.View),(0,xo.A)(Td.prototype,"onParameterClick",[Pd],Object.getOwnPropertyDescriptor(Td.prototype,"onParameterClick"),Td.prototype),jd=Td))||jd),Vd=Bd;allure.api.addTestResultBlock(Vd,{position:"before"});var Id,Ld=n(7552),zd=n.n(Ld);function $d(t,e,n){return e=(0,l.A)(e),(0,a.A)(t,Fd()?Reflect.construct(e,n||[],(0,l.A)(t).constructor):e.apply(t,n))}function Fd(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Fd=function(){return!!t})()}var Ud=(0,Mr.s7)("pane__section")(Id=function(t){function e(){var t;(0,o.A)(this,e);for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t=$d(this,e,[].concat(r)),(0,c.A)(t,"template",zd()),t}return(0,u.A)(e,t),(0,i.A)(e,[{key:"serializeData",value:function(){return{links:this.model.get("links")}}}])}(vr.View))||Id,Hd=Ud;allure.api.addTestResultBlock(Hd,{position:"before"}),window.jQuery=e(),e()(document).ready((function(){return r.qw.start()}))}()}();
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Micro-benchmarks for page-object operations and helper loops
+
+Each case runs against the fake Appium server (utils/fake_appium.py) and
+records WebDriver commands per operation, latency percentiles and the time the
+operation spent in time.sleep(). Results are compared with
+benchmarks/baselines.json; added round trips or sleeps fail the run.
+
+    python -m benchmarks.run                   # compare with the baselines
+    python -m benchmarks.run --update-baseline # accept the current numbers
+    pytest benchmarks --fake-appium            # same cases as pytest tests
+"""
@@ -0,0 +1,252 @@
+"""
+Time-to-reflect benchmark for arm/disarm transitions on the Areas tab
+
+The arm tests check end states after a fixed sleep, which says nothing about
+how quickly the app shows a panel change. Here every step taps the button for
+the next state, timestamps the tap and reads the area status as often as the
+source allows until the label shows the new state. Over N cycles of SEQUENCE
+each transition (e.g. "Disarmed -> Stay Armed") gets p50/p95/p99, and the run
+is appended to a trend file so changes show up across builds.
+
+    python -m benchmarks.arm_latency --cycles 50                 # simulated panel, offline
+    python -m benchmarks.arm_latency --appium http://127.0.0.1:4723 --area "Area 1"
+    pytest "tests/MGSP/SP6000+/SP6000+_arm_tests.py" -k latency --arm-latency 20
+
+The simulated panel flips its status after a seeded log-normal delay per
+target state and runs on the harness's virtual clock, so 50 cycles take
+milliseconds and the same seed gives the same numbers.
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+
+from benchmarks.harness import VirtualClock, percentile
+from utils.page_snapshot import PageSnapshot
+from utils.panel_state import parse_areas
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TREND_FILE = os.path.join(PROJECT_ROOT, "reports", "arm_latency_trend.jsonl")
+
+# One cycle; consecutive states differ, and it ends where it starts
+SEQUENCE = ("Stay Armed", "Sleep Armed", "Disarmed", "Armed", "Stay Armed", "Disarmed")
+
+# Median seconds the simulated panel takes to show each state
+SIMULATED_LATENCY = {"Armed": 1.4, "Stay Armed": 1.1, "Sleep Armed": 1.2, "Disarmed": 0.8}
+
+
+class AppStatusSource:
+    """Taps the AreasPage buttons and reads one area's status from page_source"""
+
+    name = "app"
+
+    def __init__(self, driver, area="Area 1"):
+        from pages.areas_page import AreasPage
+
+        self.driver = driver
+        self.area = area
+        self.buttons = {
+            "Armed": AreasPage.arm_button,
+            "Stay Armed": AreasPage.stay_btn,
+            "Sleep Armed": AreasPage.sleep_arm_btn,
+            "Disarmed": AreasPage.disarm_button,
+        }
+
+    def tap(self, target):
+        """Tap the button for a state; returns the monotonic time of the tap"""
+        # Located before the clock starts, so only the tap itself is timed
+        element = self.driver.find_element(*self.buttons[target])
+        started = time.monotonic()
+        element.click()
+        return started
+
+    def status(self):
+        for area in parse_areas(PageSnapshot.capture(self.driver)):
+            if area.label == self.area:
+                return area.status
+        return None
+
+
+class SimulatedStatusSource:
+    """A panel that shows a tapped state after a random, seeded delay"""
+
+    name = "simulated"
+
+    def __init__(self, latency=None, jitter=0.35, read_cost=0.12, seed=0, initial="Disarmed"):
+        """
+        Args:
+            latency (dict): Median seconds per target state (SIMULATED_LATENCY by default)
+            jitter (float): Sigma of the log-normal spread around the median
+            read_cost (float): Seconds one status read takes, like a page_source round trip
+            seed (int): Random seed; the same seed gives the same run
+            initial (str): State the panel starts in
+        """
+        self.latency = latency or SIMULATED_LATENCY
+        self.jitter = jitter
+        self.read_cost = read_cost
+        self.random = random.Random(seed)
+        self.current = initial
+        self.pending = None
+
+    def tap(self, target):
+        started = time.monotonic()
+        delay = self.random.lognormvariate(math.log(self.latency[target]), self.jitter)
+        self.pending = (target, started + delay)
+        return started
+
+    def status(self):
+        time.sleep(self.read_cost)
+        if self.pending and time.monotonic() >= self.pending[1]:
+            self.current, self.pending = self.pending[0], None
+        return self.current
+
+
+def time_to_reflect(source, target, poll_interval=0.0, timeout=30):
+    """
+    Tap towards a state and poll until the status shows it
+
+    Returns:
+        tuple: (seconds from tap to the first read showing the state, or None on
+            timeout; number of status reads)
+    """
+    started = source.tap(target)
+    reads = 0
+    while True:
+        status = source.status()
+        reads += 1
+        elapsed = time.monotonic() - started
+        if status == target:
+            return elapsed, reads
+        if elapsed >= timeout:
+            return None, reads
+        if poll_interval:
+            time.sleep(poll_interval)
+
+
+def run(source, cycles=10, sequence=SEQUENCE, poll_interval=0.0, timeout=30):
+    """
+    Run `cycles` passes over `sequence` and summarise each transition
+
+    Returns:
+        dict: {"transitions": {"A -> B": {"n", "timeouts", "reads", "p50_ms", "p95_ms",
+            "p99_ms", "max_ms"}}, "cycles": ..., "sequence": [...]}
+    """
+    samples = defaultdict(list)
+    timeouts = Counter()
+    reads = Counter()
+    current = source.status()
+    for cycle in range(cycles):
+        for target in sequence:
+            if target == current:
+                continue
+            transition = f"{current} -> {target}"
+            elapsed, count = time_to_reflect(source, target, poll_interval, timeout)
+            reads[transition] += count
+            if elapsed is None:
+                timeouts[transition] += 1
+                print(f"❌ {transition}: not shown within {timeout}s (cycle {cycle + 1})")
+                current = source.status()
+                continue
+            samples[transition].append(elapsed * 1000)
+            current = target
+        print(f"⏱️ Cycle {cycle + 1}/{cycles} done")
+
+    transitions = {}
+    for transition in sorted(set(samples) | set(timeouts)):
+        values = samples[transition]
+        attempts = len(values) + timeouts[transition]
+        transitions[transition] = {
+            "n": len(values),
+            "timeouts": timeouts[transition],
+            "reads": round(reads[transition] / attempts, 1),
+            "p50_ms": round(percentile(values, 50), 1),
+            "p95_ms": round(percentile(values, 95), 1),
+            "p99_ms": round(percentile(values, 99), 1),
+            "max_ms": round(max(values), 1) if values else None,
+        }
+    return {"cycles": cycles, "sequence": list(sequence), "transitions": transitions}
+
+
+def load_trend(path=TREND_FILE):
+    """Earlier runs from the trend file, oldest first"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def append_trend(report, path=TREND_FILE, **labels):
+    """Add a run to the trend file (one JSON line per run), with labels such as source or device"""
+    entry = {"time": datetime.datetime.now().isoformat(timespec="seconds"), **labels, **report}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def format_report(report, previous=None):
+    """Table of the transitions, with the p95 change since `previous` (an earlier trend entry)"""
+    lines = [f"{'transition':<30}{'n':>5}{'t/o':>5}{'reads':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'Δp95':>9}"]
+    before = (previous or {}).get("transitions", {})
+    for name, stats in report["transitions"].items():
+        delta = ""
+        if name in before and stats["n"] and before[name]["n"]:
+            delta = f"{stats['p95_ms'] - before[name]['p95_ms']:+.0f}"
+        lines.append(f"{name:<30}{stats['n']:>5}{stats['timeouts']:>5}{stats['reads']:>7}"
+                     f"{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}{delta:>9}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Arm/disarm time-to-reflect benchmark")
+    parser.add_argument("--cycles", type=int, default=10, help="Passes over the state sequence")
+    parser.add_argument("--appium", default=None, metavar="URL",
+                        help="Measure the app through this Appium server (default: simulated panel)")
+    parser.add_argument("--area", default="Area 1", help="Area whose status is read")
+    parser.add_argument("--poll-interval", type=float, default=0.0,
+                        help="Pause between status reads in seconds (default: read back to back)")
+    parser.add_argument("--timeout", type=float, default=30, help="Seconds before a transition counts as missed")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the simulated panel")
+    parser.add_argument("--trend", default=TREND_FILE, help="Trend file the run is appended to")
+    args = parser.parse_args(argv)
+
+    previous_runs = load_trend(args.trend)
+    driver = None
+    if args.appium:
+        from drivers.driver_factory import init_driver
+        from helpers.navigator import go_to
+
+        driver = init_driver(server_url=args.appium)
+        go_to(driver, "areas")
+        source = AppStatusSource(driver, args.area)
+        clock = contextlib.nullcontext()
+    else:
+        source = SimulatedStatusSource(seed=args.seed)
+        clock = VirtualClock()
+
+    try:
+        with clock:
+            report = run(source, args.cycles, poll_interval=args.poll_interval, timeout=args.timeout)
+    finally:
+        if driver is not None:
+            driver.quit()
+
+    previous = next((entry for entry in reversed(previous_runs)
+                     if entry.get("source") == source.name and entry.get("area") == args.area), None)
+    print(format_report(report, previous))
+    append_trend(report, args.trend, source=source.name, area=args.area)
+    print(f"📈 Appended to {args.trend}")
+    missed = sum(stats["timeouts"] for stats in report["transitions"].values())
+    return 1 if missed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
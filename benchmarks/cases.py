@@ -0,0 +1,77 @@
+"""
+Benchmark cases: the page-object operations and helper loops we track
+
+Every setup puts the fake session on a fresh copy of the screen the operation
+expects, so each round measures the same work.
+"""
+
+import os
+import tempfile
+from unittest import mock
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+from benchmarks.harness import BenchmarkCase
+from helpers import common_tests
+from helpers.upgrade_helpers import UpgradeHelpers
+from pages.areas_page import AreasPage
+from pages.base_page import BasePage
+from pages.landing_page import LandingPage
+from pages.zones_page import ZonesPage
+from utils.locator_resolver import LocatorResolver
+
+# Rankings learnt while benchmarking must not leak into .locator_rankings.json
+_RANKINGS_FILE = os.path.join(tempfile.gettempdir(), f"benchmark_locator_rankings_{os.getpid()}.json")
+_resolver = LocatorResolver(_RANKINGS_FILE)
+
+
+def show(screen, over=None):
+    """Setup that resets the session onto a screen (optionally with a dialog on top)"""
+    def setup(server, driver):
+        server.show(screen, driver.session_id, reset=True)
+        if over:
+            server.show(over, driver.session_id)
+    return setup
+
+
+def click_login(server, driver):
+    BasePage(driver).click(LandingPage.login_btn)
+
+
+def scroll_to_add_device(server, driver):
+    BasePage(driver).scroll_to_description("Add Olarm Device")
+
+
+def scroll_to_end_of_list(server, driver):
+    # Not on the screen: measures how quickly the search gives up at the end of the list
+    UpgradeHelpers(driver).scroll_to_element((AppiumBy.ACCESSIBILITY_ID, "Zone 99"), max_scrolls=10)
+
+
+def read_area_state(server, driver):
+    AreasPage(driver).get_area_state("Area 1")
+
+
+def first_login_btn(server, driver):
+    with mock.patch.object(common_tests, "locator_resolver", _resolver):
+        common_tests.first_login_btn(driver)
+
+
+def auto_grant_all_permissions(server, driver):
+    UpgradeHelpers(driver).auto_grant_all_permissions(wait=True)
+
+
+def bypass_zones(server, driver):
+    ZonesPage(driver).bypass_zones()
+
+
+CASES = [
+    BenchmarkCase("base_page.click", click_login, show("landing")),
+    BenchmarkCase("base_page.scroll_to_description", scroll_to_add_device, show("my_devices")),
+    BenchmarkCase("upgrade_helpers.scroll_to_element", scroll_to_end_of_list, show("zones")),
+    BenchmarkCase("common_tests.first_login_btn", first_login_btn, show("landing")),
+    # The dialog watcher polls in real time on its own thread until 2s pass without a dialog
+    BenchmarkCase("upgrade_helpers.auto_grant_all_permissions", auto_grant_all_permissions,
+                  show("my_devices", over="notification_permission"), rounds=3, command_tolerance=2),
+    BenchmarkCase("areas_page.get_area_state", read_area_state, show("areas")),
+    BenchmarkCase("zones_page.bypass_zones", bypass_zones, show("zones")),
+]
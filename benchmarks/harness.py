@@ -0,0 +1,180 @@
+"""
+Measurement, baselines and regression checks for the benchmark cases
+
+Sleeps are not actually slept: VirtualClock records the requested seconds and
+moves time.time()/time.monotonic() forward instead, so a 5 second polling loop
+costs the same number of commands as on a device but finishes in milliseconds.
+Only the benchmarking thread sees the virtual clock; the fake server and
+background watchers keep real time.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+# Extra commands per operation tolerated before a case counts as a regression
+COMMAND_TOLERANCE = 0
+# Extra sleep per operation (seconds) tolerated before a case counts as a regression
+SLEEP_TOLERANCE = 0.05
+# Latency only warns: wall time depends on the machine running the benchmarks
+LATENCY_WARN_FACTOR = 1.5
+
+
+class VirtualClock:
+    """Patch time.sleep/time.time/time.monotonic for the current thread"""
+
+    def __init__(self):
+        self.slept = 0.0
+        self.sleeps = 0
+        self._offset = 0.0
+        self._thread = None
+        self._originals = None
+
+    def __enter__(self):
+        self._thread = threading.get_ident()
+        self._originals = (time.sleep, time.time, time.monotonic)
+        real_sleep, real_time, real_monotonic = self._originals
+
+        def sleep(seconds):
+            if threading.get_ident() != self._thread:
+                return real_sleep(seconds)
+            self.slept += seconds
+            self.sleeps += 1
+            self._offset += seconds
+
+        def virtual(real):
+            def now():
+                if threading.get_ident() != self._thread:
+                    return real()
+                return real() + self._offset
+            return now
+
+        time.sleep, time.time, time.monotonic = sleep, virtual(real_time), virtual(real_monotonic)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        time.sleep, time.time, time.monotonic = self._originals
+        return False
+
+
+class BenchmarkCase:
+    """One operation to measure, with the setup that puts the app in front of it"""
+
+    def __init__(self, name, operation, setup=None, rounds=10, command_tolerance=COMMAND_TOLERANCE):
+        """
+        Args:
+            name (str): Key in baselines.json, e.g. "base_page.click"
+            operation (callable): operation(server, driver), the code being measured
+            setup (callable): setup(server, driver), run before every round, not measured
+            rounds (int): Measured rounds (one extra warm-up round runs first)
+            command_tolerance (int): Extra commands tolerated, for cases with a
+                background thread whose poll count depends on timing
+        """
+        self.name = name
+        self.operation = operation
+        self.setup = setup
+        self.rounds = rounds
+        self.command_tolerance = command_tolerance
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def run_case(server, driver, case, rounds=None):
+    """
+    Measure a case
+
+    Returns:
+        dict: commands/sleep per operation (medians), latency percentiles in ms
+            and the command breakdown of the last round
+    """
+    rounds = rounds or case.rounds
+    latencies, commands, sleeps = [], [], []
+    breakdown = Counter()
+    for index in range(rounds + 1):
+        if case.setup:
+            case.setup(server, driver)
+        before = Counter(server.commands)
+        with VirtualClock() as clock:
+            start = time.perf_counter()
+            case.operation(server, driver)
+            elapsed = time.perf_counter() - start
+        if index == 0:
+            continue  # warm-up: connection, locator rankings, imports
+        breakdown = server.commands - before
+        latencies.append(elapsed * 1000)
+        commands.append(sum(breakdown.values()))
+        sleeps.append(clock.slept)
+
+    return {
+        "rounds": rounds,
+        "commands": percentile(commands, 50),
+        "sleep_s": round(percentile(sleeps, 50), 3),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+        },
+        "breakdown": dict(sorted(breakdown.items())),
+    }
+
+
+def load_baselines(path=BASELINE_FILE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baselines(results, path=BASELINE_FILE):
+    baselines = {name: {key: result[key] for key in ("commands", "sleep_s", "latency_ms")}
+                 for name, result in sorted(results.items())}
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(baselines, f, indent=2)
+        f.write("\n")
+    os.replace(temp_path, path)
+
+
+def compare(name, result, baseline, command_tolerance=COMMAND_TOLERANCE):
+    """
+    Check a result against its baseline
+
+    Returns:
+        tuple: (regressions, warnings) as lists of messages
+    """
+    regressions, warnings = [], []
+    if not baseline:
+        warnings.append(f"{name}: no baseline (run with --update-baseline)")
+        return regressions, warnings
+
+    if result["commands"] > baseline["commands"] + command_tolerance:
+        regressions.append(f"{name}: {result['commands']:g} commands per op (baseline {baseline['commands']:g})")
+    if result["sleep_s"] > baseline["sleep_s"] + SLEEP_TOLERANCE:
+        regressions.append(f"{name}: {result['sleep_s']:g}s sleep per op (baseline {baseline['sleep_s']:g}s)")
+    base_p50 = baseline["latency_ms"]["p50"]
+    if base_p50 and result["latency_ms"]["p50"] > base_p50 * LATENCY_WARN_FACTOR:
+        warnings.append(f"{name}: p50 {result['latency_ms']['p50']}ms (baseline {base_p50}ms)")
+    return regressions, warnings
+
+
+def format_table(results):
+    lines = [f"{'case':<44}{'cmds':>7}{'sleep s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+    for name, result in results.items():
+        latency = result["latency_ms"]
+        lines.append(f"{name:<44}{result['commands']:>7g}{result['sleep_s']:>9g}"
+                     f"{latency['p50']:>9}{latency['p95']:>9}{latency['p99']:>9}")
+    return "\n".join(lines)
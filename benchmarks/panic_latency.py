@@ -0,0 +1,236 @@
+"""
+Panic flow timing on the Send Panic screen
+
+The panic tests tap Fire, Panic or Medical and check for "... Panic Activated"
+after fixed waits, so how long the confirmation takes to appear is never
+measured. This harness drives PanicPage and times, per emergency type:
+
+    <type>.activated   tap on the emergency button -> "... Panic Activated" banner shown
+    <type>.dismissed   tap on Okay -> banner gone
+    contacts.render    tap on "Show all emergency contacts" -> title and every contact shown
+
+Each timer starts right after the tap (the element is located first) and stops
+at the first page_source read that shows the change; reads run back to back.
+After N rounds the p95 of every metric is checked against THRESHOLDS_MS and the
+run fails when one is over its threshold or a change never showed up.
+
+    python -m benchmarks.panic_latency --rounds 20                 # recorded screens, offline
+    python -m benchmarks.panic_latency --latency 0.15              # ... with a device's round-trip time
+    python -m benchmarks.panic_latency --appium http://127.0.0.1:4723 --threshold fire.activated=2000
+    pytest "tests/MGSP/SP6000+/SP6000+_panics.py" -k latency --panic-latency 20
+
+Only use --appium against a panel where sending panics is expected: every
+round really sends one of each type.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+
+from benchmarks.harness import percentile
+from drivers.driver_factory import init_driver
+from helpers.navigator import go_to
+from pages.panic import PanicPage
+from utils.fake_appium import FakeAppiumServer, ScreenGraph
+from utils.page_snapshot import PageSnapshot
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_FILE = os.path.join(PROJECT_ROOT, "reports", "panic_latency.json")
+
+# Emergency type -> (button, banner)
+EMERGENCIES = {
+    "fire": (PanicPage.fire_button, PanicPage.fire_panic_acivated),
+    "panic": (PanicPage.panic_button, PanicPage.panic_acivated),
+    "medical": (PanicPage.medical_button, PanicPage.medical_panic_acivated),
+}
+
+# Everything that has to be on screen before the contacts list counts as rendered
+CONTACTS = (
+    PanicPage.emergency_contacts_title,
+    PanicPage.national_emergency,
+    PanicPage.er24_ambulance,
+    PanicPage.national_crimestop,
+)
+
+# p95 limits in ms, by metric kind ("activated") or full name ("fire.activated"); the full name wins
+THRESHOLDS_MS = {"activated": 3000, "dismissed": 1500, "render": 2500}
+
+
+def _shown(snapshot, locator):
+    node = snapshot.find(*locator)
+    return node is not None and node.displayed
+
+
+class PanicLatency:
+    """Times the panic flow for one driver that is on the Send Panic screen"""
+
+    def __init__(self, driver, timeout=15):
+        """
+        Args:
+            driver: Appium WebDriver instance
+            timeout (float): Seconds to wait for a change before counting it as missed
+        """
+        self.driver = driver
+        self.page = PanicPage(driver)
+        self.timeout = timeout
+        self.samples = defaultdict(list)
+        self.timeouts = Counter()
+
+    def time_tap(self, locator, done):
+        """
+        Tap an element and read the page source until done(snapshot) is true
+
+        Returns:
+            float: Seconds from the tap to the first read where done() holds, or None on timeout
+        """
+        element = self.driver.find_element(*locator)
+        started = time.monotonic()
+        element.click()
+        while True:
+            snapshot = PageSnapshot.capture(self.driver)
+            elapsed = time.monotonic() - started
+            if done(snapshot):
+                return elapsed
+            if elapsed >= self.timeout:
+                return None
+
+    def _record(self, metric, elapsed):
+        if elapsed is None:
+            self.timeouts[metric] += 1
+            print(f"❌ {metric}: no change within {self.timeout}s")
+            return False
+        self.samples[metric].append(elapsed * 1000)
+        return True
+
+    def measure_emergency(self, kind):
+        """Send one panic of a type and dismiss its banner"""
+        button, banner = EMERGENCIES[kind]
+        shown = self.time_tap(button, lambda snapshot: _shown(snapshot, banner))
+        if not self._record(f"{kind}.activated", shown):
+            return
+        dismissed = self.time_tap(self.page.okay_btn_panic_activated,
+                                  lambda snapshot: not _shown(snapshot, banner))
+        self._record(f"{kind}.dismissed", dismissed)
+
+    def measure_contacts(self):
+        """Open the emergency contacts list and go back"""
+        rendered = self.time_tap(self.page.emergency_contacts_btn,
+                                 lambda snapshot: all(_shown(snapshot, locator) for locator in CONTACTS))
+        if self._record("contacts.render", rendered):
+            self.page.click_emergency_contacts_back_btn()
+
+    def run(self, rounds=10, emergencies=tuple(EMERGENCIES), contacts=True):
+        """
+        Measure `rounds` rounds and summarise every metric
+
+        Returns:
+            dict: {metric: {"n", "timeouts", "p50_ms", "p95_ms", "p99_ms", "max_ms"}}
+        """
+        for index in range(rounds):
+            for kind in emergencies:
+                self.measure_emergency(kind)
+            if contacts:
+                self.measure_contacts()
+            print(f"⏱️ Round {index + 1}/{rounds} done")
+        return self.summary()
+
+    def summary(self):
+        results = {}
+        for metric in sorted(set(self.samples) | set(self.timeouts)):
+            values = self.samples[metric]
+            results[metric] = {
+                "n": len(values),
+                "timeouts": self.timeouts[metric],
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+                "max_ms": round(max(values), 1) if values else None,
+            }
+        return results
+
+
+def threshold_for(metric, thresholds=THRESHOLDS_MS):
+    return thresholds.get(metric, thresholds.get(metric.rsplit(".", 1)[-1]))
+
+
+def check_thresholds(results, thresholds=THRESHOLDS_MS):
+    """
+    Metrics whose p95 is over their threshold, or that timed out
+
+    Returns:
+        list: Failure messages, empty when the run passes
+    """
+    failures = []
+    for metric, stats in results.items():
+        if stats["timeouts"]:
+            failures.append(f"{metric}: {stats['timeouts']} of {stats['n'] + stats['timeouts']} never showed")
+        limit = threshold_for(metric, thresholds)
+        if limit is not None and stats["n"] and stats["p95_ms"] > limit:
+            failures.append(f"{metric}: p95 {stats['p95_ms']}ms over the {limit}ms threshold")
+    return failures
+
+
+def format_table(results, thresholds=THRESHOLDS_MS):
+    lines = [f"{'metric':<22}{'n':>5}{'t/o':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'limit':>8}"]
+    for metric, stats in results.items():
+        limit = threshold_for(metric, thresholds)
+        lines.append(f"{metric:<22}{stats['n']:>5}{stats['timeouts']:>5}{stats['p50_ms']:>9}"
+                     f"{stats['p95_ms']:>9}{stats['p99_ms']:>9}{'' if limit is None else f'{limit:g}':>8}")
+    return "\n".join(lines)
+
+
+def parse_threshold(value):
+    """'fire.activated=2000' -> ('fire.activated', 2000.0), for --threshold"""
+    name, _, limit = value.partition("=")
+    try:
+        return name.strip(), float(limit)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected METRIC=MS, got '{value}'")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Panic flow latency with p95 thresholds")
+    parser.add_argument("--rounds", type=int, default=10, help="Rounds of every emergency type plus the contacts list")
+    parser.add_argument("--appium", default=None, metavar="URL",
+                        help="Measure the app through this Appium server (default: recorded screens)")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Seconds the recorded-screen server adds to every command")
+    parser.add_argument("--only", choices=sorted(EMERGENCIES), action="append",
+                        help="Only this emergency type (repeatable)")
+    parser.add_argument("--threshold", type=parse_threshold, action="append", default=[], metavar="METRIC=MS",
+                        help="Override a p95 threshold, e.g. activated=2500 or fire.activated=2000")
+    parser.add_argument("--timeout", type=float, default=15, help="Seconds before a change counts as missed")
+    args = parser.parse_args(argv)
+
+    thresholds = {**THRESHOLDS_MS, **dict(args.threshold)}
+    server = None
+    if not args.appium:
+        # Recorded screens settle immediately; don't spend the first settle poll waiting
+        os.environ.setdefault("UI_SETTLE_INITIAL_INTERVAL", "0.005")
+        server = FakeAppiumServer(ScreenGraph.load(), latency=args.latency)
+    with server or contextlib.nullcontext():
+        driver = init_driver(server_url=args.appium or server.url)
+        try:
+            go_to(driver, "panic")
+            results = PanicLatency(driver, args.timeout).run(args.rounds, args.only or tuple(EMERGENCIES))
+        finally:
+            driver.quit()
+
+    print(format_table(results, thresholds))
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, "w") as f:
+        json.dump({"thresholds_ms": thresholds, "results": results}, f, indent=2)
+
+    failures = check_thresholds(results, thresholds)
+    for message in failures:
+        print(f"❌ {message}")
+    print("❌ Panic latency over threshold" if failures else "✅ Panic latency within thresholds")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Standalone benchmark runner
+
+    python -m benchmarks.run [--latency 0.05] [--only zones_page] [--update-baseline]
+
+Exits with status 1 when a case needs more commands or sleeps longer than its
+baseline. Results are also written to reports/benchmarks.json.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+
+from benchmarks.cases import CASES
+from benchmarks.harness import compare, format_table, load_baselines, run_case, save_baselines
+from drivers.driver_factory import init_driver
+from utils.fake_appium import DEFAULT_GRAPH, FakeAppiumServer, ScreenGraph
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_FILE = os.path.join(PROJECT_ROOT, "reports", "benchmarks.json")
+
+
+def run_cases(server, driver, cases, rounds=None, verbose=False):
+    results = {}
+    for case in cases:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(sys.stdout if verbose else output):
+            results[case.name] = run_case(server, driver, case, rounds)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Page-object micro-benchmarks against recorded screens")
+    parser.add_argument("--graph", default=DEFAULT_GRAPH, help="Screen graph JSON")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the fake server adds to every command")
+    parser.add_argument("--rounds", type=int, default=None, help="Override the measured rounds of every case")
+    parser.add_argument("--only", default=None, help="Only run cases whose name contains this text")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baselines")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show the page objects' output")
+    args = parser.parse_args(argv)
+
+    # Recorded screens settle immediately; don't spend the first settle poll waiting
+    os.environ.setdefault("UI_SETTLE_INITIAL_INTERVAL", "0.005")
+    cases = [case for case in CASES if not args.only or args.only in case.name]
+
+    with FakeAppiumServer(ScreenGraph.load(args.graph), latency=args.latency) as server:
+        driver = init_driver(server_url=server.url)
+        try:
+            results = run_cases(server, driver, cases, args.rounds, args.verbose)
+        finally:
+            driver.quit()
+
+    print(format_table(results))
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, "w") as f:
+        json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        if args.latency or args.only:
+            parser.error("baselines are recorded with every case and no added latency")
+        save_baselines(results)
+        print("📏 Baselines updated")
+        return 0
+
+    baselines = load_baselines()
+    failed = False
+    for case in cases:
+        regressions, warnings = compare(case.name, results[case.name], baselines.get(case.name),
+                                        case.command_tolerance)
+        for message in warnings:
+            print(f"⚠️ {message}")
+        for message in regressions:
+            print(f"❌ {message}")
+        failed = failed or bool(regressions)
+    print("❌ Benchmark regressions found" if failed else "✅ No benchmark regressions")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+The benchmark cases as pytest tests (not collected by a plain `pytest` run)
+
+    pytest benchmarks --fake-appium
+
+With pytest-benchmark installed, its `benchmark` fixture times the operation as
+well and the command counts are stored in the benchmark's extra_info.
+"""
+
+import pytest
+
+from benchmarks.cases import CASES
+from benchmarks.harness import VirtualClock, compare, load_baselines, run_case
+
+
+# Skipped before any fixture runs, so a plain `pytest benchmarks` never starts a real Appium server
+pytestmark = pytest.mark.skipif('not config.getoption("--fake-appium")',
+                                reason="benchmarks run against recorded screens: pass --fake-appium")
+
+
+@pytest.fixture(scope="module")
+def baselines():
+    return load_baselines()
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_benchmark(case, request, fake_appium, baselines):
+    driver = request.getfixturevalue("driver")
+    result = run_case(fake_appium, driver, case)
+    print(f"{case.name}: {result}")
+
+    if request.config.pluginmanager.hasplugin("benchmark"):
+        benchmark = request.getfixturevalue("benchmark")
+        benchmark.extra_info.update(commands=result["commands"], sleep_s=result["sleep_s"])
+        with VirtualClock():
+            benchmark.pedantic(case.operation, args=(fake_appium, driver),
+                               setup=lambda: case.setup(fake_appium, driver), rounds=case.rounds)
+
+    regressions, warnings = compare(case.name, result, baselines.get(case.name), case.command_tolerance)
+    for message in warnings:
+        print(f"⚠️ {message}")
+    assert not regressions, "; ".join(regressions)
@@ -1,4 +1,5 @@
 import os
+import re
 
 # Base directory for app files
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -14,7 +15,8 @@ APP_VERSIONS = {
         "version_name": "1.6.6",
         "min_sdk": "21",
         "target_sdk": "33",
-        "description": "Version 1.6.6 - Classic tokens version (upgrades to app-release.apk)"
+        "description": "Version 1.6.6 - Classic tokens version (upgrades to app-release.apk)",
+        "login_flow": "classic"
     },
     "1.6.6-oauth": {
         "apk_path": os.path.join(ANDROID_APPS_DIR, "app-release-166-oauth.apk"),
@@ -24,7 +26,8 @@ APP_VERSIONS = {
         "version_name": "1.6.6",
         "min_sdk": "21",
         "target_sdk": "33",
-        "description": "Version 1.6.6 - OAuth version (upgrades to app-release.apk)"
+        "description": "Version 1.6.6 - OAuth version (upgrades to app-release.apk)",
+        "login_flow": "classic"
     },
     "2.0.5": {
         "apk_path": os.path.join(ANDROID_APPS_DIR, "app-v2.0.5.apk"),
@@ -89,6 +92,49 @@ APP_VERSIONS = {
 
 }
 
+# Version every upgrade scenario targets (app-release.apk)
+LATEST_VERSION = "2.0.10"
+
+# Versioned builds dropped into android/app are picked up automatically
+VERSIONED_APK_PATTERN = re.compile(r"^app-v(\d+)\.(\d+)\.(\d+)\.apk$")
+
+
+def discover_versioned_apks():
+    """
+    Register app-vX.Y.Z.apk files in android/app that are not in APP_VERSIONS yet
+
+    Returns:
+        list: Version strings that were added
+    """
+    added = []
+    try:
+        filenames = sorted(os.listdir(ANDROID_APPS_DIR))
+    except OSError:
+        return added
+
+    for filename in filenames:
+        match = VERSIONED_APK_PATTERN.match(filename)
+        if not match:
+            continue
+        version = ".".join(match.groups())
+        if version in APP_VERSIONS:
+            continue
+        APP_VERSIONS[version] = {
+            "apk_path": os.path.join(ANDROID_APPS_DIR, filename),
+            "package_name": "com.olarm.olarm1",
+            "activity_name": "com.olarm.olarm1.MainActivity",
+            "version_code": "".join(match.groups()),
+            "version_name": version,
+            "min_sdk": "21",
+            "target_sdk": "33",
+            "description": f"Version {version} - discovered in android/app (upgrades to app-release.apk)"
+        }
+        added.append(version)
+    return added
+
+
+discover_versioned_apks()
+
 # Upgrade test scenarios
 UPGRADE_SCENARIOS = [
     {
@@ -125,14 +171,18 @@ UPGRADE_SCENARIOS = [
         "from_version": "1.6.6",
         "to_version": "2.0.10",
         "description": "Upgrade from version 1.6.6 to 2.0.10 (app-release.apk)",
-        "expected_behavior": "User should remain logged in and see My Devices screen"
+        "expected_behavior": "User should remain logged in and see My Devices screen",
+        # Different login flow; timed but never held to the performance thresholds
+        "thresholds": None
     },
     {
         "name": "upgrade_166_oauth_to_app_release",
         "from_version": "1.6.6-oauth",
         "to_version": "2.0.10",
         "description": "Upgrade from version 1.6.6-oauth to 2.0.10 (app-release.apk)",
-        "expected_behavior": "User should remain logged in and see My Devices screen"
+        "expected_behavior": "User should remain logged in and see My Devices screen",
+        # Different login flow; timed but never held to the performance thresholds
+        "thresholds": None
     },
     {
         "name": "upgrade_209_to_app_release",
@@ -215,7 +265,7 @@ def get_latest_version():
     Returns:
         dict: Latest version configuration
     """
-    return APP_VERSIONS["2.0.10"]
+    return APP_VERSIONS[LATEST_VERSION]
 
 def get_upgrade_scenarios():
     """
@@ -235,6 +285,64 @@ def get_clean_install_scenarios():
     """
     return CLEAN_INSTALL_SCENARIOS
 
+def get_login_flow(version):
+    """
+    Get the login flow a version uses ("classic" for the 1.6.6 builds, otherwise "standard")
+    
+    Args:
+        version (str): Version string
+        
+    Returns:
+        str: Login flow name
+    """
+    return APP_VERSIONS[version].get("login_flow", "standard")
+
+def _scenario_slug(version):
+    return version.replace(".", "").replace("-", "_")
+
+def get_upgrade_matrix(kind="upgrade"):
+    """
+    Build the upgrade matrix: every declared scenario plus one generated
+    scenario for each version in APP_VERSIONS that has none yet
+    
+    Args:
+        kind (str): "upgrade" (in-place, logged in) or "clean_install"
+        
+    Returns:
+        list: Scenario dicts (name, from_version, to_version, description,
+            expected_behavior, login_flow and, when declared, thresholds), in
+            APP_VERSIONS order
+    """
+    if kind == "upgrade":
+        declared = UPGRADE_SCENARIOS
+        name_format = "upgrade_{slug}_to_app_release"
+        description_format = "Upgrade from version {version} to {latest} (app-release.apk)"
+        expected_behavior = "User should remain logged in and see My Devices screen"
+    elif kind == "clean_install":
+        declared = CLEAN_INSTALL_SCENARIOS
+        name_format = "clean_install_{slug}_to_app_release"
+        description_format = "Clean installation from version {version} to {latest} (app-release.apk)"
+        expected_behavior = "App should show landing screen (not logged in)"
+    else:
+        raise ValueError(f"Unknown upgrade matrix kind: {kind}")
+    
+    by_from_version = {scenario["from_version"]: scenario for scenario in declared}
+    matrix = []
+    for version in APP_VERSIONS:
+        if version == LATEST_VERSION:
+            continue
+        scenario = dict(by_from_version.get(version) or {
+            "name": name_format.format(slug=_scenario_slug(version)),
+            "from_version": version,
+            "to_version": LATEST_VERSION,
+            "description": description_format.format(version=version, latest=LATEST_VERSION),
+            "expected_behavior": expected_behavior
+        })
+        scenario["login_flow"] = get_login_flow(version)
+        scenario["slug"] = _scenario_slug(version)
+        matrix.append(scenario)
+    return matrix
+
 def verify_apk_exists(version):
     """
     Verify that APK file exists for a given version
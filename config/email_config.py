@@ -13,7 +13,7 @@ EMAIL_CONFIG = {
     'sender_email': 'ndumiso@olarm.com',
     'sender_password': 'Thi$P@$$wordI$100%superunique3',
     
-    # Recipient Configuration
+    # Recipient Configuration (several addresses separated by commas)
     'recipient_email': 'ndumiso@olarm.com',
     
     # Email Settings
@@ -21,6 +21,7 @@ EMAIL_CONFIG = {
     'send_on_success': True,
     'send_on_failure': True,
     'send_on_completion': True,
+    'max_attachment_mb': 18,  # Larger reports are sent as a summary
 }
 
 # Alternative SMTP configurations
@@ -93,7 +94,8 @@ def validate_email_config(config):
     if not re.match(email_pattern, config['sender_email']):
         return False, f"Invalid sender email format: {config['sender_email']}"
     
-    if not re.match(email_pattern, config['recipient_email']):
-        return False, f"Invalid recipient email format: {config['recipient_email']}"
+    for recipient in config['recipient_email'].split(','):
+        if not re.match(email_pattern, recipient.strip()):
+            return False, f"Invalid recipient email format: {recipient.strip()}"
     
     return True, "Configuration is valid"
@@ -1,9 +1,31 @@
+import allure
 import pytest
 from drivers.driver_factory import init_driver
 from appium.webdriver.appium_service import AppiumService
 import requests
 import time
-from config.capabilities import device_farm_config
+from config.capabilities import device_farm_config, local_config
+from helpers.dialog_watcher import DialogWatcher
+from helpers.upgrade_matrix import clear_matrix_results, merge_matrix_results
+from utils import adb_client
+from utils.command_trace import command_tracer
+from utils.data_reader import test_data
+from utils.fake_appium import DEFAULT_GRAPH, FakeAppiumServer, ScreenGraph
+from utils.device_pool import (
+    DurationRecorder,
+    DurationStore,
+    get_device_pool,
+    get_slot_capabilities,
+    get_worker_count,
+    get_worker_slot,
+    make_device_scheduler,
+)
+from utils.apk_registry import remove_app
+from utils.locator_resolver import locator_resolver
+from utils.result_stream import ResultStreamReporter
+from utils.screenshots import screenshots
+from utils.session_pool import DEFAULT_ISOLATION, DEVICE_FARM_ISOLATION, SessionPool
+from utils.ui_settle import settle_stats
 from dotenv import load_dotenv
 import os
 import urllib.parse
@@ -20,12 +42,63 @@ def pytest_addoption(parser):
                     help="Platform to run tests on (android or ios)")
     parser.addoption("--device-id", action="store", default=None,
                     help="Device farm device ID or name")
+    parser.addoption("--devices", action="store", default=None,
+                    help="Comma separated device serials for parallel runs (-n); "
+                         "defaults to $DEVICE_POOL or every device attached to adb")
+    parser.addoption("--fake-appium", action="store", nargs="?", const=DEFAULT_GRAPH, default=None,
+                     metavar="GRAPH",
+                     help="Run against the local fake Appium server replaying recorded screens "
+                          "(optionally from a screen graph JSON file)")
+    parser.addoption("--profile-commands", action="store_true", default=False,
+                     help="Trace every WebDriver command and attach a per-test flame summary "
+                          "and Chrome trace JSON to Allure")
+    parser.addoption("--fuzz-login", action="store", type=int, default=0, metavar="N",
+                     help="Run the login fuzzing test with N generated SQLi/XSS/unicode payloads")
+    parser.addoption("--arm-latency", action="store", type=int, default=0, metavar="N",
+                     help="Run the arm/disarm latency benchmark for N cycles (trend in reports/arm_latency_trend.jsonl)")
+    parser.addoption("--panic-latency", action="store", type=int, default=0, metavar="N",
+                     help="Run the panic latency harness for N rounds (sends real panics) and fail on p95 thresholds")
+    parser.addoption("--result-stream", action="store", default=None, metavar="HOST:PORT",
+                     help="Stream per-test results as JSON lines to a ResultCollector (used by the upgrade runner)")
 
-def wait_for_appium(timeout=10):
+def pytest_configure(config):
+    config.duration_store = DurationStore()
+    if config.getoption("--profile-commands"):
+        command_tracer.install()
+    # Only the controller (or a serial run) records durations; xdist workers forward their reports to it
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(config.duration_store), "duration-recorder")
+        if config.getoption("--result-stream"):
+            config.pluginmanager.register(ResultStreamReporter(config.getoption("--result-stream")), "result-stream")
+        clear_matrix_results()
+
+def pytest_sessionfinish(session):
+    # Persist which fallback locators won so the next run resolves them in one find
+    locator_resolver.save()
+    adb_client.close_all()
+    screenshots.shutdown()
+    # Workers each wrote their upgrade scenarios; the controller merges them into one report
+    if not hasattr(session.config, "workerinput"):
+        merge_matrix_results()
+
+def pytest_collection_modifyitems(config, items):
+    # xdist workers each collect the same ordered list, so sorting here makes
+    # the controller hand out the slowest modules first
+    if hasattr(config, "workerinput"):
+        config.duration_store.sort_items(items)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Keep MGSP modules on one device; spread independent upgrade scenarios across the pool"""
+    if config.getoption("dist") != "load":
+        return None
+    return make_device_scheduler(config, log)
+
+def wait_for_appium(port=4725, timeout=10):
     start_time = time.time()
     while time.time() - start_time < timeout:
         try:
-            res = requests.get("http://localhost:4725/wd/hub/status")
+            res = requests.get(f"http://localhost:{port}/wd/hub/status")
             if res.status_code == 200:
                 print("✅ Appium server is live")
                 return
@@ -73,9 +146,46 @@ def platform(request):
 def device_id(request):
     return request.config.getoption("--device-id")
 
+@pytest.fixture(scope="session")
+def fake_appium(request):
+    """Fake Appium server for --fake-appium runs (one per worker), else None"""
+    graph_path = request.config.getoption("--fake-appium")
+    if not graph_path:
+        yield None
+        return
+    # Recorded screens settle immediately; don't spend the first settle poll waiting
+    os.environ.setdefault("UI_SETTLE_INITIAL_INTERVAL", "0.005")
+    with FakeAppiumServer(ScreenGraph.load(graph_path)) as server:
+        print(f"🤖 Fake Appium server on {server.url}")
+        yield server
+
+@pytest.fixture(scope="session")
+def device_slot(request, use_device_farm, device_id, fake_appium):
+    """Device udid and Appium/systemPort/chromedriver ports owned by this worker"""
+    if use_device_farm or fake_appium:
+        return None
+    devices = []
+    if request.config.getoption("--devices") or get_worker_count(request.config) > 1:
+        devices = get_device_pool(request.config.getoption("--devices"))
+    slot = get_worker_slot(request.config, devices, device_id)
+    if slot["udid"]:
+        test_data.device = slot["udid"]  # testdata/devices/<udid>.json applies to this worker
+    print(f"📱 Worker {slot['worker']} -> device {slot['udid'] or 'default'} on Appium port {slot['appium_port']}")
+    return slot
+
+def get_driver_kwargs(use_device_farm, platform, device_id, device_slot):
+    kwargs = {"use_device_farm": use_device_farm, "platform": platform, "device_id": device_id}
+    if device_slot:
+        kwargs["server_url"] = device_slot["server_url"]
+        kwargs["capability_overrides"] = get_slot_capabilities(device_slot)
+    return kwargs
+
 @pytest.fixture(scope="session", autouse=True)
-def start_appium(use_device_farm):
-    if not use_device_farm:
+def start_appium(use_device_farm, device_slot, fake_appium):
+    if not use_device_farm and not fake_appium:
+        port = str(device_slot["appium_port"])
+        log_file = "appium.log" if device_slot["worker"] == "gw0" else f"appium-{device_slot['worker']}.log"
+
         # Only start local Appium server for local testing
         # Force stop any existing Appium service
         try:
@@ -83,98 +193,124 @@ def start_appium(use_device_farm):
         except:
             pass
         
-        # Kill any existing processes on port 4725
+        # Kill any existing processes on this worker's port
         import subprocess
         try:
-            subprocess.run(['pkill', '-f', 'appium.*4725'], capture_output=True)
+            subprocess.run(['pkill', '-f', f'appium.*{port}'], capture_output=True)
             import time
             time.sleep(2)
         except:
             pass
 
         # Configure Appium service with custom port and base path
-        appium_service.start(args=['--port', '4725', '--base-path', '/wd/hub', '--log', 'appium.log'])
+        appium_service.start(args=['--port', port, '--base-path', '/wd/hub', '--log', log_file])
         
         # Wait for Appium server to be ready
-        wait_for_appium()
+        wait_for_appium(device_slot["appium_port"])
 
     yield
 
-    if not use_device_farm and appium_service.is_running:
+    if not use_device_farm and not fake_appium and appium_service.is_running:
         appium_service.stop()
         print("🧹 Appium service stopped")
 
+@pytest.fixture(autouse=True)
+def ui_settle_report():
+    """Attach the adaptive settle waits of each test (and the time they saved) to Allure"""
+    settle_stats.reset()
+    yield
+    if settle_stats.records:
+        allure.attach(settle_stats.to_json(), name="UI settle waits",
+                      attachment_type=allure.attachment_type.JSON)
+
+@pytest.fixture(autouse=True)
+def command_profile():
+    """With --profile-commands, attach the WebDriver commands each test sent to Allure"""
+    if not command_tracer.enabled:
+        yield
+        return
+    command_tracer.reset()
+    yield
+    if command_tracer.records:
+        allure.attach(command_tracer.flame_summary(), name="WebDriver commands",
+                      attachment_type=allure.attachment_type.TEXT)
+        allure.attach(command_tracer.chrome_trace(), name="WebDriver command trace (chrome://tracing)",
+                      attachment_type=allure.attachment_type.JSON)
+
+@pytest.fixture(autouse=True)
+def screenshot_artifacts(request):
+    """Wait for the test's background screenshots and attach them to Allure"""
+    yield
+    for path in screenshots.flush():
+        allure.attach.file(path, name=os.path.basename(path), attachment_type=allure.attachment_type.PNG)
+        # Streamed to the upgrade runner with the test's result (see utils/result_stream.py)
+        request.node.user_properties.append(("artifact", os.path.relpath(path)))
+
+@pytest.fixture(scope="session")
+def session_pool(start_appium, use_device_farm, platform, device_id, device_slot, fake_appium):
+    """One warm Appium session per worker, reused by every test on that device"""
+    kwargs = get_driver_kwargs(use_device_farm, platform, device_id, device_slot)
+    app_path = None if use_device_farm else local_config[platform].get("app")
+    if fake_appium:
+        kwargs["server_url"] = fake_appium.url
+        app_path = None
+    # Farm capabilities use fullReset, so unmarked tests there keep getting a clean install
+    default_isolation = DEVICE_FARM_ISOLATION if use_device_farm else DEFAULT_ISOLATION
+    pool = SessionPool(lambda: init_driver(**kwargs), device_farm_config["app_package"], app_path,
+                       default_isolation)
+    print(f"{'Device Farm' if use_device_farm else 'Local'} {platform} session pool ready")
+    yield pool
+    pool.close_all()
+
+def get_isolation(request):
+    marker = request.node.get_closest_marker("isolation")
+    return marker.args[0] if marker else None  # None: the pool's default level
+
 @pytest.fixture(scope="function")
-def driver(start_appium, use_device_farm, platform, device_id):
-    driver = None
+def driver(session_pool, request):
     try:
-        # Initialize driver with device farm configuration if specified
-        driver = init_driver(
-            use_device_farm=use_device_farm,
-            platform=platform,
-            device_id=device_id
-        )
-        print(f"{'Device Farm' if use_device_farm else 'Local'} {platform} driver initialized successfully")
-        
-        yield driver
+        driver = session_pool.acquire(get_isolation(request))
     except Exception as e:
         print(f"❌ Failed to initialize driver: {str(e)}")
         raise
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                print("🧹 Driver cleaned up successfully")
-            except Exception as e:
-                print(f"[WARNING] Error during driver cleanup: {e}")
+    yield driver
+    session_pool.release(driver)
+
+@pytest.fixture
+def dialog_watcher(driver):
+    """Grant permissions / dismiss ANRs in the background for the whole test; fail it on a crash dialog"""
+    watcher = DialogWatcher(driver, quiet_period=None, timeout=None, interval=1.0).start()
+    yield watcher
+    watcher.stop()
+    watcher.raise_for_failures()
 
 @pytest.fixture(scope="session")
-def session_driver(start_appium, use_device_farm, platform, device_id):
+def session_driver(session_pool):
     """Session-scoped driver that persists across multiple tests"""
-    driver = None
+    # Without a build on hand the pool replaces the shared session to reinstall the app,
+    # so this one gets a slot of its own (it was a separate session before pooling)
+    key = "default" if session_pool.app_path else "session"
     try:
-        # Initialize driver with device farm configuration if specified
-        driver = init_driver(
-            use_device_farm=use_device_farm,
-            platform=platform,
-            device_id=device_id
-        )
-        print(f"{'Device Farm' if use_device_farm else 'Local'} {platform} session driver initialized successfully")
-        
-        yield driver
+        driver = session_pool.acquire("none", key=key)
     except Exception as e:
         print(f"❌ Failed to initialize session driver: {str(e)}")
         raise
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                print("🧹 Session driver cleaned up successfully")
-            except Exception as e:
-                print(f"[WARNING] Error during session driver cleanup: {e}")
+    yield driver
 
 @pytest.fixture
-def driver_with_uninstall(start_appium, use_device_farm, platform, device_id):
-    driver = None
+def driver_with_uninstall(session_pool, request):
     try:
-        driver = init_driver(
-            use_device_farm=use_device_farm,
-            platform=platform,
-            device_id=device_id
-        )
-        print(f"{'Device Farm' if use_device_farm else 'Local'} {platform} driver initialized successfully")
-        
-        yield driver
+        driver = session_pool.acquire(get_isolation(request))
     except Exception as e:
         print(f"❌ Failed to initialize driver: {str(e)}")
         raise
-    finally:
-        if driver:
-            try:
-                app_package = device_farm_config["app_package"]
-                driver.terminate_app(app_package)
-                driver.remove_app(app_package)
-                driver.quit()
-                print("🧹 Driver and app cleaned up successfully")
-            except Exception as e:
-                print(f"[WARNING] Error during driver cleanup: {e}")
\ No newline at end of file
+    yield driver
+    try:
+        app_package = device_farm_config["app_package"]
+        driver.terminate_app(app_package)
+        remove_app(driver, app_package)
+        print("🧹 App uninstalled")
+    except Exception as e:
+        print(f"[WARNING] Error during driver cleanup: {e}")
+    # The next checkout reinstalls the build, as a fresh session with the "app" capability did
+    session_pool.release(driver, app_removed=True)
@@ -26,13 +26,17 @@ def wait_for_server(url, timeout=60, interval=5):
         time.sleep(interval)
     return False
 
-def init_driver(use_device_farm=False, platform="android", device_id=None):
+def init_driver(use_device_farm=False, platform="android", device_id=None,
+                server_url=None, capability_overrides=None):
     """Initialize WebDriver with appropriate capabilities
     
     Args:
         use_device_farm (bool): Whether to use device farm
         platform (str): Either 'android' or 'ios'
         device_id (str): Device ID or name from device farm
+        server_url (str): Appium server URL (defaults to device_farm_config["server_url"])
+        capability_overrides (dict): Extra capabilities applied last, e.g. the
+            udid/systemPort of a parallel worker's device slot
     """
     max_retries = device_farm_config.get("max_retry", 3)
     retry_delay = device_farm_config.get("retry_delay", 5000) / 1000  # Convert to seconds
@@ -45,13 +49,14 @@ def init_driver(use_device_farm=False, platform="android", device_id=None):
                 
                 # Get capabilities for the specified platform and device
                 caps = get_device_farm_caps(platform, device_id)
+                caps.update(capability_overrides or {})
                 
                 # Create Appium options
                 options = AppiumOptions()
                 for cap_name, cap_value in caps.items():
                     options.set_capability(cap_name, cap_value)
                 
-                server_url = device_farm_config["server_url"]
+                server_url = server_url or device_farm_config["server_url"]
                 
                 # If using local network, try to ensure we're using the correct interface
                 if device_farm_config.get("network_config", {}).get("use_local_network"):
@@ -76,10 +81,10 @@ def init_driver(use_device_farm=False, platform="android", device_id=None):
                 # Use local configuration
                 options = AppiumOptions()
                 local_caps = local_config[platform]
-                for cap_name, cap_value in local_caps.items():
+                for cap_name, cap_value in {**local_caps, **(capability_overrides or {})}.items():
                     options.set_capability(cap_name, cap_value)
                 
-                server_url = device_farm_config["server_url"]  # Use the configured server URL
+                server_url = server_url or device_farm_config["server_url"]  # Use the configured server URL
                 driver = webdriver.Remote(
                     command_executor=server_url,
                     options=options
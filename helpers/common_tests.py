@@ -1,7 +1,7 @@
-import time
-
 from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException
 
+from helpers.dialog_watcher import PERMISSION_HANDLER
 from pages.add_device_page import AddDevicePage
 from pages.devices_page import DevicesPage
 from pages.landing_page import LandingPage
@@ -9,123 +9,91 @@ from pages.login_page import LoginPage
 from pages.areas_page import AreasPage
 from pages.logout_page import LogOutPage
 from utils.data_reader import read_test_data, read_device_details
+from utils.locator_resolver import locator_resolver
+from utils.page_snapshot import PageSnapshot
+from utils.panel_state import parse_areas
+from utils.screenshots import capture_screenshot
+from utils.ui_settle import wait_for_ui_settle
+
+
+NOTIFICATION_PERMISSION_LOCATORS = [
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Allow Olarm to send you notifications?")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Allow").textContains("to send you notifications")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("notifications")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("com.android.permissioncontroller:id/permission_message")')
+]
+
+PERMISSION_ALLOW_LOCATORS = [
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Allow")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("com.android.permissioncontroller:id/permission_allow_button")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("android:id/button1")')
+]
 
+# The dialog can appear a moment after launch, so give it this long to show up
+NOTIFICATION_POPUP_TIMEOUT = 2.5
 
-def handle_notification_permission_popup(driver, timeout=5):
+
+def handle_notification_permission_popup(driver):
     """
-    Handle notification permission popup by allowing notifications
-    
+    Allow the notification permission popup if it shows up
+
+    Page-source reads tell whether the dialog is there, whichever variant it
+    is. They stop as soon as it appears, or after NOTIFICATION_POPUP_TIMEOUT.
+
     Args:
         driver: Appium WebDriver instance
-        timeout (int): Timeout in seconds to wait for permission popup
-        
+
     Returns:
         bool: True if handled or no popup found, False if error
     """
-    import time
     try:
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            try:
-                # Look for notification permission dialog
-                permission_selectors = [
-                    'new UiSelector().text("Allow Olarm to send you notifications?")',
-                    'new UiSelector().textContains("Allow").textContains("to send you notifications")',
-                    'new UiSelector().textContains("notifications")',
-                    'new UiSelector().resourceId("com.android.permissioncontroller:id/permission_message")'
-                ]
-                
-                for selector in permission_selectors:
-                    try:
-                        permission_dialog = driver.find_element(
-                            AppiumBy.ANDROID_UIAUTOMATOR, 
-                            selector
-                        )
-                        if permission_dialog.is_displayed():
-                            print("✅ Found notification permission dialog")
-                            
-                            # Look for "Allow" button and click it
-                            allow_selectors = [
-                                'new UiSelector().text("Allow")',
-                                'new UiSelector().resourceId("com.android.permissioncontroller:id/permission_allow_button")',
-                                'new UiSelector().resourceId("android:id/button1")'
-                            ]
-                            
-                            for allow_selector in allow_selectors:
-                                try:
-                                    allow_button = driver.find_element(
-                                        AppiumBy.ANDROID_UIAUTOMATOR, 
-                                        allow_selector
-                                    )
-                                    if allow_button.is_displayed():
-                                        allow_button.click()
-                                        print("✅ Clicked 'Allow' for notifications")
-                                        time.sleep(1)
-                                        return True
-                                except Exception:
-                                    continue
-                            
-                            print("⚠️ Found permission dialog but couldn't find Allow button")
-                            return False
-                            
-                    except Exception:
-                        continue
-                
-                # No permission dialog found, that's okay
-                time.sleep(0.5)
-                
-            except Exception:
-                pass
-        
-        print("ℹ️ No notification permission dialog found within timeout")
+        snapshot = wait_for_ui_settle(driver, 0, label="notification popup", condition=PERMISSION_HANDLER.detect,
+                                      timeout=NOTIFICATION_POPUP_TIMEOUT) or PageSnapshot.capture(driver)
+        if not PERMISSION_HANDLER.detect(snapshot):
+            return True
+        print("✅ Found notification permission dialog")
+
+        allow_button = PERMISSION_HANDLER.button_node(snapshot)
+        if allow_button is None:
+            print("⚠️ Found permission dialog but couldn't find Allow button")
+            return False
+        driver.tap([allow_button.center])
+        print("✅ Clicked 'Allow' for notifications")
         return True
-        
+
     except Exception as e:
         print(f"❌ Error handling notification permission: {e}")
         return True  # Don't fail the test for permission handling issues
 
 
-def first_login_btn(driver):
+# Login button locators across app versions, most likely first
+LOGIN_BUTTON_LOCATORS = [
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("Login")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Login")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("login-button")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("btn-login")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Login")'),
+    (AppiumBy.ACCESSIBILITY_ID, 'Login'),
+    (AppiumBy.XPATH, '//android.widget.Button[@content-desc="Login"]'),
+    (AppiumBy.XPATH, '//android.widget.Button[@text="Login"]'),
+    (AppiumBy.XPATH, '//*[@text="Login"]'),
+    (AppiumBy.XPATH, '//*[@content-desc="Login"]')
+]
+
+
+def first_login_btn(driver, app_version=None, handle_permissions=True):
     # Handle notification permission popup if it appears
-    handle_notification_permission_popup(driver)
+    if handle_permissions:
+        handle_notification_permission_popup(driver)
     
-    # Try multiple locators for the login button to handle different app versions
-    login_button_locators = [
-        (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("Login")'),
-        (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Login")'),
-        (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("login-button")'),
-        (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("btn-login")'),
-        (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Login")'),
-        (AppiumBy.ACCESSIBILITY_ID, 'Login'),
-        (AppiumBy.XPATH, '//android.widget.Button[@content-desc="Login"]'),
-        (AppiumBy.XPATH, '//android.widget.Button[@text="Login"]'),
-        (AppiumBy.XPATH, '//*[@text="Login"]'),
-        (AppiumBy.XPATH, '//*[@content-desc="Login"]')
-    ]
-    
-    login_button_found = False
-    for i, locator in enumerate(login_button_locators):
-        try:
-            print(f"🔍 Trying login button locator {i+1}: {locator}")
-            element = driver.find_element(*locator)
-            if element.is_displayed():
-                print(f"✅ Found login button with locator {i+1}: {locator}")
-                element.click()
-                login_button_found = True
-                break
-        except Exception as e:
-            print(f"❌ Locator {i+1} failed: {e}")
-            continue
-    
-    if not login_button_found:
+    # The resolver tries the locator that worked last time for this app version first
+    try:
+        element = locator_resolver.find(driver, "landing", "login_button", LOGIN_BUTTON_LOCATORS, app_version)
+        element.click()
+    except NoSuchElementException:
         print("❌ Could not find login button with any locator")
         # Take a screenshot for debugging
-        try:
-            driver.save_screenshot("login_button_not_found.png")
-            print("📸 Screenshot saved: login_button_not_found.png")
-        except Exception as e:
-            print(f"⚠️ Could not take screenshot: {e}")
+        capture_screenshot(driver, "login_button_not_found")
         raise Exception("Login button not found with any locator")
     
     print("✅ Login button clicked successfully")
@@ -204,7 +172,12 @@ def do_disarm(driver):
     #select_device(driver)
     areas_page = AreasPage(driver)
     areas_page.disarm_panel()
-    time.sleep(5)  # Allow time for UI to reflect state change
+    # The panel reports each area separately; wait until none of them shows armed
+    def all_disarmed(snapshot):
+        areas = parse_areas(snapshot)
+        return bool(areas) and not any(area.armed for area in areas)
+
+    areas_page.wait_for_settle(5, label="disarm state change", condition=all_disarmed)
 
 def do_login_with_classic_tokens(driver):
     credentials = read_test_data("valid_user")
@@ -0,0 +1,222 @@
+"""
+Background watcher for system dialogs (runtime permissions, ANR, crashes)
+
+Instead of probing a dozen selectors one find at a time, the watcher reads the
+page source once per tick and lets every registered handler inspect that one
+snapshot. It runs in its own thread next to the test step and stops on its own
+once the screen has been quiet (no dialog) for a while.
+
+    watcher = DialogWatcher(driver).start()
+    ...  # test step runs while permissions are granted in the background
+    watcher.stop()
+    watcher.raise_for_failures()
+"""
+
+import re
+import threading
+import time
+
+from utils.page_snapshot import PageSnapshot
+
+
+class AppCrashedError(AssertionError):
+    """Raised when the watcher saw a crash dialog such as "App has stopped" """
+
+
+class DialogHandler:
+    """
+    Reacts to one kind of dialog
+
+    Args:
+        name (str): Name used in logs and the handled list
+        detect (callable): Takes a PageSnapshot, returns True when the dialog is on screen
+        buttons (list): Callables taking the snapshot and returning the node to tap, tried in order
+        fail (bool): Record the dialog as a test failure (e.g. a crash)
+    """
+
+    def __init__(self, name, detect, buttons=(), fail=False):
+        self.name = name
+        self.detect = detect
+        self.buttons = list(buttons)
+        self.fail = fail
+
+    def button_node(self, snapshot):
+        for find_button in self.buttons:
+            node = find_button(snapshot)
+            if node is not None and node.center:
+                return node
+        return None
+
+
+def node_with_resource_id(*resource_ids):
+    def find(snapshot):
+        for resource_id in resource_ids:
+            for node in snapshot.by_resource_id.get(resource_id, []):
+                if node.displayed:
+                    return node
+        return None
+    return find
+
+
+def node_with_text(*texts):
+    def find(snapshot):
+        for text in texts:
+            for node in snapshot.by_text.get(text, []):
+                if node.displayed:
+                    return node
+        return None
+    return find
+
+
+def text_matching(pattern):
+    regex = re.compile(pattern)
+
+    def detect(snapshot):
+        return any(regex.search(text) for text in snapshot.by_text if text)
+    return detect
+
+
+def any_of(*detectors):
+    def detect(snapshot):
+        return any(detector(snapshot) for detector in detectors)
+    return detect
+
+
+PERMISSION_HANDLER = DialogHandler(
+    "allow permission",
+    detect=any_of(
+        node_with_resource_id("com.android.permissioncontroller:id/permission_message",
+                              "com.android.packageinstaller:id/permission_message"),
+        text_matching(r"^Allow .+ to "),
+    ),
+    buttons=[
+        node_with_resource_id("com.android.permissioncontroller:id/permission_allow_button",
+                              "com.android.permissioncontroller:id/permission_allow_foreground_only_button",
+                              "com.android.packageinstaller:id/permission_allow_button"),
+        node_with_text("Allow", "ALLOW", "allow", "While using the app"),
+    ],
+)
+
+ANR_HANDLER = DialogHandler(
+    "dismiss ANR",
+    detect=text_matching(r"isn't responding|Not Responding|\bANR\b"),
+    buttons=[
+        node_with_resource_id("android:id/aerr_wait"),
+        node_with_text("Wait", "WAIT"),
+    ],
+)
+
+APP_STOPPED_HANDLER = DialogHandler(
+    "app has stopped",
+    detect=text_matching(r"App has stopped|has stopped|keeps stopping|^Unfortunately|Force Close"),
+    buttons=[
+        node_with_resource_id("android:id/aerr_close"),
+        node_with_text("Close app", "OK"),
+    ],
+    fail=True,
+)
+
+DEFAULT_HANDLERS = (APP_STOPPED_HANDLER, ANR_HANDLER, PERMISSION_HANDLER)
+
+
+class DialogWatcher:
+    """Polls one page-source snapshot per tick and dispatches dialog handlers"""
+
+    def __init__(self, driver, handlers=DEFAULT_HANDLERS, interval=0.5, quiet_period=2.0, timeout=10):
+        """
+        Args:
+            driver: Appium WebDriver instance
+            handlers (iterable): DialogHandler objects, checked in order on every tick
+            interval (float): Delay between ticks in seconds
+            quiet_period (float): Stop after this long without any dialog (None = run until stopped)
+            timeout (float): Hard limit on the watcher's lifetime (None = run until stopped)
+        """
+        self.driver = driver
+        self.handlers = list(handlers)
+        self.interval = interval
+        self.quiet_period = quiet_period
+        self.timeout = timeout
+        self.handled = []
+        self.failures = []
+        self.ticks = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def register(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="dialog-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def raise_for_failures(self):
+        if self.failures:
+            raise AppCrashedError(f"Crash dialog(s) seen during the test: {self.failures}")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        if exc_type is None:
+            self.raise_for_failures()
+        return False
+
+    def tick(self):
+        """
+        Check the current screen once
+
+        Returns:
+            bool: True if a dialog was found
+        """
+        self.ticks += 1
+        try:
+            snapshot = PageSnapshot.capture(self.driver)
+        except Exception:
+            return False
+
+        for handler in self.handlers:
+            if not handler.detect(snapshot):
+                continue
+            print(f"🛎️ Dialog watcher: {handler.name}")
+            self.handled.append(handler.name)
+            if handler.fail:
+                self.failures.append(handler.name)
+            node = handler.button_node(snapshot)
+            if node is not None:
+                try:
+                    self.driver.tap([node.center])
+                except Exception as e:
+                    print(f"⚠️ Dialog watcher could not tap '{node.text or node.content_desc}': {e}")
+            return True
+        return False
+
+    def _run(self):
+        start_time = time.time()
+        last_dialog = start_time
+        while not self._stop_event.is_set():
+            if self.tick():
+                last_dialog = time.time()
+                if self.failures:
+                    break
+
+            now = time.time()
+            if self.timeout is not None and now - start_time >= self.timeout:
+                break
+            if self.quiet_period is not None and now - last_dialog >= self.quiet_period:
+                break
+            self._stop_event.wait(self.interval)
@@ -0,0 +1,294 @@
+"""
+Security fuzzing of the login form (SQL injection, XSS, unicode)
+
+Payloads are generated lazily, so a corpus of thousands costs no memory up
+front, and are all tried in one session on one login screen: LoginPage only
+replaces the two input values and taps Login between attempts. Each tap counts
+only once the app has visibly handled it: the rejection message appears after
+being hidden, the Login button comes back enabled after going busy, or the form
+is gone. Attempts run in batches; after each batch one settled page-source read
+checks that the app is still on the login screen showing the rejection message.
+A batch that fails that check, and any tap that was not acknowledged, is
+replayed one payload at a time (app reset in between).
+
+    fuzzer = LoginFuzzer(driver, recover=reset_to_login)
+    report = fuzzer.run(iter_payloads(), limit=2000)
+    assert not report.breaches, report.summary()
+"""
+
+import itertools
+import time
+import urllib.parse
+from collections import Counter
+
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from pages.login_page import LoginPage
+from utils.data_reader import test_data
+from utils.page_snapshot import PageSnapshot
+
+EXPECTED_ERROR = "Please check your credentials and try again!"
+LOGGED_IN_TEXT = "My Devices"
+BENIGN_USERNAME = "fuzz@olarm.local"
+BENIGN_PASSWORD = "Fuzz@1234"
+
+SQLI_SEEDS = [
+    "' OR '1'='1", "' OR 1=1 --", "\" OR \"\"=\"", "admin'--", "admin' #", "') OR ('1'='1",
+    "'; DROP TABLE users; --", "' UNION SELECT NULL, NULL --", "1' AND SLEEP(5) --",
+    "' OR EXISTS(SELECT * FROM users) --", "'||(SELECT password FROM users LIMIT 1)||'",
+    "%' AND 1=0 UNION SELECT username, password FROM users --",
+]
+XSS_SEEDS = [
+    "<script>alert(1)</script>", "\"><img src=x onerror=alert(1)>", "javascript:alert(1)",
+    "<svg/onload=alert(1)>", "'\"><iframe src=javascript:alert(1)>", "<body onload=alert(1)>",
+    "{{7*7}}", "${7*7}", "<a href=\"javas&#99;ript:alert(1)\">x</a>", "</textarea><script>alert(1)</script>",
+]
+UNICODE_SEEDS = [
+    "ｐｒｉｍａｒｙ@ｏｌａｒｍ.ｌｏｃａｌ", "primary​@olarm.local", "prіmary@olarm.local",
+    "‮resu‬@olarm.local", "😀🔥💥@olarm.local", "用户@例子.广告", "á́́",
+    "﻿primary@olarm.local", "ﬁ@olarm.local", "\u00a0\u2028\u2029",
+]
+CATEGORIES = {"sqli": SQLI_SEEDS, "xss": XSS_SEEDS, "unicode": UNICODE_SEEDS}
+
+# Each seed is tried in every variant, in each field, at every length
+MUTATIONS = [
+    ("plain", lambda value: value),
+    ("upper", str.upper),
+    ("url-encoded", urllib.parse.quote),
+    ("comment-spaces", lambda value: value.replace(" ", "/**/")),
+    ("padded", lambda value: f"  {value}\t"),
+    ("as-email", lambda value: f"{value}@olarm.local"),
+    ("doubled", lambda value: value * 2),
+    ("quoted", lambda value: f"\"{value}\""),
+]
+REPEATS = (1, 8)
+FIELDS = ("username", "password", "both")
+
+
+def iter_payloads(categories=tuple(CATEGORIES), include_dataset=True):
+    """
+    Yield payload cases as {"category", "variant", "username", "password"}
+
+    The cases from testdata sql_injection_data come first, then every seed x
+    mutation x length x field combination of the selected categories.
+    """
+    if include_dataset:
+        for case in test_data.iter_cases("sql_injection_data", "SQL_injection_tests"):
+            yield {"category": "sqli", "variant": "dataset", **case}
+
+    for (name, mutate), repeat, field in itertools.product(MUTATIONS, REPEATS, FIELDS):
+        for category in categories:
+            for seed in CATEGORIES[category]:
+                value = mutate(seed) * repeat
+                yield {
+                    "category": category,
+                    "variant": f"{name}/x{repeat}/{field}",
+                    "username": value if field != "password" else BENIGN_USERNAME,
+                    "password": value if field != "username" else BENIGN_PASSWORD,
+                }
+
+
+class FuzzReport:
+    """Outcome of a fuzzing run"""
+
+    def __init__(self):
+        self.attempts = 0
+        self.batches = 0
+        self.replayed = 0
+        self.breaches = []
+        self.anomalies = []
+        self.unacknowledged = []
+        self.messages = Counter()
+        self.by_category = Counter()
+        self.elapsed = 0.0
+
+    @property
+    def rate(self):
+        return self.attempts / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        lines = [
+            f"{self.attempts} payloads in {self.elapsed:.1f}s ({self.rate:.1f}/s), "
+            f"{self.batches} batches, {self.replayed} replayed one by one, "
+            f"{len(self.unacknowledged)} never acknowledged",
+            "By category: " + ", ".join(f"{name} {count}" for name, count in sorted(self.by_category.items())),
+            "Login screen messages: " + (", ".join(f"{message!r} x{count}" for message, count in
+                                                 self.messages.most_common()) or "none"),
+        ]
+        for payload in self.breaches:
+            lines.append(f"❌ Logged in with {payload['variant']} {payload['username']!r} / {payload['password']!r}")
+        for payload, reason in self.anomalies:
+            lines.append(f"⚠️ {payload['variant']} {payload['username']!r}: {reason}")
+        for payload in self.unacknowledged:
+            lines.append(f"⚠️ {payload['variant']} {payload['username']!r}: Login tap never acknowledged")
+        return "\n".join(lines)
+
+
+class LoginFuzzer:
+    """Drives payloads through the login form of one session"""
+
+    # Page-source polling while waiting for the app to handle one Login tap
+    ack_poll_interval = 0.05
+
+    def __init__(self, driver, recover, batch_size=25, expected_error=EXPECTED_ERROR, ack_timeout=3):
+        """
+        Args:
+            driver: Appium WebDriver instance, already on the login screen
+            recover (callable): recover(driver) brings the app back to the login
+                screen after a payload left it (e.g. reset the app, then first_login_btn)
+            batch_size (int): Attempts between two screen checks
+            expected_error (str): Message the app shows for rejected credentials
+            ack_timeout (float): Seconds to wait for the app to handle each Login tap
+        """
+        self.driver = driver
+        self.recover = recover
+        self.batch_size = batch_size
+        self.expected_error = expected_error
+        self.ack_timeout = ack_timeout
+        self.page = LoginPage(driver)
+
+    def run(self, payloads, limit=None):
+        """
+        Try payloads until the iterator (or limit) runs out
+
+        Returns:
+            FuzzReport
+        """
+        report = FuzzReport()
+        start = time.perf_counter()
+        payloads = iter(payloads) if limit is None else itertools.islice(payloads, limit)
+        while True:
+            batch = list(itertools.islice(payloads, self.batch_size))
+            if not batch:
+                break
+            self._run_batch(batch, report)
+            report.batches += 1
+            print(f"🧪 Fuzzed {report.attempts} payloads ({report.attempts / (time.perf_counter() - start):.1f}/s)")
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _run_batch(self, batch, report):
+        submitted = []
+        acknowledged = []
+        unacknowledged = []
+        remaining = []
+        for index, payload in enumerate(batch):
+            try:
+                handled = self._submit(payload)
+            except NoSuchElementException:
+                if submitted:
+                    remaining = batch[index:]  # The previous attempt navigated away
+                    break
+                # Nothing in this batch ran, so the form was gone already: skip the payload, not the loop
+                report.anomalies.append((payload, "login form not on screen"))
+                self._recover()
+                continue
+            except WebDriverException as e:
+                report.anomalies.append((payload, f"could not be typed: {e.msg}"))
+                continue
+            submitted.append(payload)
+            (acknowledged if handled else unacknowledged).append(payload)
+
+        state, message = self._screen_state()
+        if not remaining and state == "rejected":
+            self._count(acknowledged, report, message)
+            replay = unacknowledged
+            if replay:
+                print(f"🔎 {len(replay)} Login taps were not acknowledged, replaying them individually")
+        else:
+            # Something in this batch left the login screen: replay it one payload at a time
+            print(f"🔎 Batch ended on '{state}' ({message!r}), replaying {len(submitted)} payloads individually")
+            replay = submitted
+        if replay:
+            self._replay(replay, report)
+        if remaining:
+            self._run_batch(remaining, report)
+
+    def _replay(self, payloads, report):
+        self._recover()
+        for payload in payloads:
+            report.replayed += 1
+            try:
+                handled = self._submit(payload)
+                if not handled:
+                    self._recover()  # Retry from a fresh screen, where the rejection message is hidden
+                    handled = self._submit(payload)
+            except NoSuchElementException:
+                report.anomalies.append((payload, "login form not on screen after recovering"))
+                self._recover()
+                continue
+            except WebDriverException as e:
+                report.anomalies.append((payload, f"could not be typed: {e.msg}"))
+                continue
+            state, message = self._screen_state()
+            if state == "logged_in":
+                report.breaches.append(payload)
+            elif not handled:
+                report.unacknowledged.append(payload)
+            elif state != "rejected":
+                report.anomalies.append((payload, f"left the login screen ({message or 'no message'})"))
+            if handled or state == "logged_in":
+                self._count([payload], report, message)
+            if state != "rejected":
+                self._recover()
+
+    def _submit(self, payload):
+        """
+        Fill in one payload, tap Login and wait for the app to handle the tap
+
+        The tap counts as handled once the rejection message shows after being
+        hidden when Login was tapped, the Login button comes back enabled after
+        going busy, or the login form is gone.
+
+        Returns:
+            bool: False if none of that happened within ack_timeout
+
+        Raises:
+            NoSuchElementException: If the login form was already gone
+        """
+        self.page.submit_credentials(payload["username"], payload["password"], submit=False)
+        error_shown = self._error_node(PageSnapshot.capture(self.driver)) is not None
+        self.page.submit()
+        busy = False
+        end_time = time.monotonic() + self.ack_timeout
+        while True:
+            snapshot = PageSnapshot.capture(self.driver)
+            button = snapshot.find(*LoginPage.login_button)
+            if button is None or len(snapshot.find_all(*LoginPage.credential_inputs)) < 2:
+                return True
+            if not button.enabled:
+                busy = True
+            elif busy or (not error_shown and self._error_node(snapshot) is not None):
+                return True
+            if time.monotonic() >= end_time:
+                return False
+            time.sleep(self.ack_poll_interval)
+
+    def _error_node(self, snapshot):
+        return snapshot.find(AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().text("{self.expected_error}")')
+
+    def _count(self, payloads, report, message):
+        report.attempts += len(payloads)
+        report.messages[message] += len(payloads)
+        report.by_category.update(payload["category"] for payload in payloads)
+
+    def _screen_state(self):
+        """
+        Classify the settled screen from its page source
+
+        Returns:
+            tuple: ("rejected" | "logged_in" | "other", message shown or None)
+        """
+        snapshot = self.page.wait_for_settle(0.5, label="login fuzz")
+        error = self._error_node(snapshot)
+        message = error.text if error is not None else None
+        if snapshot.find(AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().text("{LOGGED_IN_TEXT}")') is not None:
+            return "logged_in", message
+        if error is not None and len(snapshot.find_all(*LoginPage.credential_inputs)) >= 2:
+            return "rejected", message
+        return "other", message
+
+    def _recover(self):
+        self.recover(self.driver)
+        self.page = LoginPage(self.driver)
@@ -0,0 +1,261 @@
+"""
+Screen-graph navigation between app screens
+
+Tests used to reach their screen by replaying the whole flow (first_login_btn,
+do_login, select_device, drawer menu) inside try/except "Already logged in".
+The navigator instead reads the page source once, works out which screen the
+app is on and runs the cheapest sequence of page-object actions to the target:
+
+    navigator = Navigator(driver)
+    navigator.go_to("zones")   # from landing: login, select device, Zones tab
+    navigator.go_to("panic")   # from zones: one tap
+
+After every step the screen is detected again. If the app ended up somewhere
+else (a system dialog, a slow transition, a back arrow that closed more than
+expected) the route is planned again from there.
+"""
+
+import heapq
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+from config.capabilities import device_farm_config
+from helpers.common_tests import do_login, first_login_btn, select_device
+from pages.base_page import BasePage
+from pages.burger_menu_page import BurgerMenuPage
+from pages.logout_page import LogOutPage
+from pages.panic import PanicPage
+from pages.zones_page import ZonesPage
+from utils.page_snapshot import PageSnapshot
+
+APP_RUNNING_IN_FOREGROUND = 4
+
+
+def _ui(selector):
+    return (AppiumBy.ANDROID_UIAUTOMATOR, f"new UiSelector().{selector}")
+
+
+class Screen:
+    """A screen recognised by the locators present (and absent) in one page source"""
+
+    def __init__(self, name, present, absent=()):
+        self.name = name
+        self.present = list(present)
+        self.absent = list(absent)
+
+    def matches(self, snapshot):
+        return (all(snapshot.find(*locator) is not None for locator in self.present)
+                and not any(snapshot.find(*locator) is not None for locator in self.absent))
+
+
+class Edge:
+    """An action that moves the app from one screen to another"""
+
+    def __init__(self, source, target, action, cost=1):
+        """
+        Args:
+            source (str): Screen the action starts from
+            target (str): Screen it is expected to end on
+            action (callable): action(driver), usually a page-object method
+            cost (float): Rough seconds the step takes; routes minimise the total
+        """
+        self.source = source
+        self.target = target
+        self.action = action
+        self.cost = cost
+
+    def __repr__(self):
+        return f"{self.source} -> {self.target}"
+
+
+class NavigationError(AssertionError):
+    """Raised when the target screen cannot be reached"""
+
+
+def _tap(locator):
+    return lambda driver: BasePage(driver).click(locator)
+
+
+def _back(driver):
+    driver.back()
+    BasePage(driver).wait_for_settle(1, label="back")
+
+
+# Most specific first: the first screen whose signature matches is the current one
+SCREENS = [
+    Screen("emergency_contacts", [_ui('text("Emergency contacts")')]),
+    Screen("panic_activated", [_ui('textMatches(".*Panic Activated")')]),
+    Screen("panic", [_ui('text("Emergency type")')]),
+    Screen("device_status", [_ui('text("Panel AC Power")')]),
+    Screen("device_notifications", [_ui('text("Reminders & Alerts")')]),
+    Screen("profile", [_ui('text("Account setup")')]),
+    Screen("terms_of_service", [_ui('text("Terms & conditions")')]),
+    Screen("drawer", [_ui('description("View Profile")'), _ui('description("Logout")')]),
+    Screen("zones", [_ui('description("Bypassed")'), _ui('description("All")')]),
+    Screen("areas", [_ui('description("Zones")'), _ui('description("Panic")')]),
+    Screen("my_devices", [_ui('text("My Devices")')]),
+    Screen("login", [_ui('resourceId("text-input-outlined")'), (AppiumBy.ACCESSIBILITY_ID, "Login")]),
+    Screen("landing", [_ui('description("Login")'), _ui('description("Sign Up")')]),
+]
+
+# System dialogs that can cover any screen; dismissed wherever they show up
+DIALOGS = {
+    "notification_permission": (
+        Screen("notification_permission", [_ui('text("Allow Olarm to send you notifications?")')]),
+        _tap((AppiumBy.ID, "com.android.permissioncontroller:id/permission_allow_button")),
+    ),
+}
+
+EDGES = [
+    # The navigator dismisses the permission dialog itself, so don't wait for one here
+    Edge("landing", "login", lambda driver: first_login_btn(driver, handle_permissions=False)),
+    Edge("login", "landing", _back),
+    Edge("login", "my_devices", do_login, cost=3),
+    Edge("my_devices", "areas", select_device, cost=2),
+    Edge("my_devices", "landing", lambda driver: LogOutPage(driver).logout_my_devices(), cost=3),
+    Edge("areas", "zones", lambda driver: ZonesPage(driver).click_zones()),
+    Edge("areas", "panic", lambda driver: PanicPage(driver).click_panic_button_bottom_nav()),
+    Edge("areas", "drawer", lambda driver: BurgerMenuPage(driver).click_drawer_menu()),
+    Edge("areas", "my_devices", _back, cost=2),
+    Edge("zones", "areas", _tap(_ui('description("Areas")'))),
+    Edge("zones", "panic", lambda driver: PanicPage(driver).click_panic_button_bottom_nav()),
+    Edge("panic", "areas", _tap(_ui('description("Areas")'))),
+    Edge("panic", "zones", lambda driver: ZonesPage(driver).click_zones()),
+    Edge("panic", "emergency_contacts", lambda driver: PanicPage(driver).click_show_all_emergency_contacts()),
+    Edge("panic_activated", "panic", lambda driver: PanicPage(driver).click_okay_btn_panic_activated()),
+    Edge("emergency_contacts", "panic", lambda driver: PanicPage(driver).click_emergency_contacts_back_btn()),
+    Edge("drawer", "device_status", lambda driver: BurgerMenuPage(driver).click_device_status()),
+    Edge("drawer", "device_notifications", lambda driver: BurgerMenuPage(driver).click_device_notifications()),
+    Edge("drawer", "profile", lambda driver: BurgerMenuPage(driver).click_view_profile()),
+    Edge("drawer", "terms_of_service", lambda driver: BurgerMenuPage(driver).click_terms_of_service()),
+    Edge("drawer", "landing", _tap(LogOutPage.logout_btn), cost=2),
+    Edge("drawer", "areas", _back),
+    Edge("device_status", "areas", lambda driver: BurgerMenuPage(driver).click_back_status_page()),
+    Edge("device_notifications", "areas",
+         lambda driver: BurgerMenuPage(driver).dismiss_device_notifications_modal()),
+    Edge("profile", "areas", lambda driver: BurgerMenuPage(driver).click_account_setup_back_btn()),
+    Edge("terms_of_service", "areas",
+         lambda driver: BurgerMenuPage(driver).navigate_back_from_terms_of_service(), cost=2),
+]
+
+
+class Navigator:
+    """Shortest-path routing over SCREENS/EDGES for one driver"""
+
+    def __init__(self, driver, screens=SCREENS, edges=EDGES, dialogs=DIALOGS,
+                 app_package=device_farm_config["app_package"]):
+        self.driver = driver
+        self.screens = list(screens)
+        self.dialogs = dict(dialogs)
+        self.app_package = app_package
+        self.edges = {}
+        for edge in edges:
+            self.edges.setdefault(edge.source, []).append(edge)
+        self.names = {screen.name for screen in self.screens}
+
+    def detect(self, snapshot=None):
+        """
+        Name of the screen shown, from one page-source read
+
+        Returns:
+            str: A SCREENS or DIALOGS name, or None if nothing matches
+        """
+        snapshot = snapshot or PageSnapshot.capture(self.driver)
+        for name, (screen, _) in self.dialogs.items():
+            if screen.matches(snapshot):
+                return name
+        for screen in self.screens:
+            if screen.matches(snapshot):
+                return screen.name
+        return None
+
+    def route(self, source, target, blocked=()):
+        """
+        Cheapest list of edges from one screen to another (Dijkstra over the edge costs)
+
+        Args:
+            blocked: Edges to leave out, e.g. ones that just failed to move the app
+
+        Returns:
+            list: Edges to run in order, [] if already there, None if unreachable
+        """
+        queue = [(0, 0, source, [])]
+        settled = set()
+        tie = 0
+        while queue:
+            cost, _, screen, path = heapq.heappop(queue)
+            if screen == target:
+                return path
+            if screen in settled:
+                continue
+            settled.add(screen)
+            for edge in self.edges.get(screen, []):
+                if edge.target not in settled and edge not in blocked:
+                    tie += 1
+                    heapq.heappush(queue, (cost + edge.cost, tie, edge.target, path + [edge]))
+        return None
+
+    def go_to(self, target, max_steps=12):
+        """
+        Bring the app to a screen from wherever it is now
+
+        Args:
+            target (str): A SCREENS name, e.g. "areas", "zones", "panic", "drawer"
+            max_steps (int): Actions allowed before giving up (re-planning included)
+
+        Returns:
+            list: Names of the screens passed through, starting with the current one
+
+        Raises:
+            NavigationError: If the screen is unknown or the target cannot be reached
+        """
+        if target not in self.names:
+            raise ValueError(f"Unknown screen '{target}', expected one of {sorted(self.names)}")
+
+        visited = []
+        blocked = set()
+        last_edge = None
+        relaunched = False
+        for _ in range(max_steps + 1):
+            current = self.detect()
+            visited.append(current)
+            if last_edge is not None and current not in self.dialogs:
+                if current != last_edge.target:
+                    print(f"⚠️ {last_edge} ended on '{current}', routing around it")
+                    blocked.add(last_edge)
+                last_edge = None
+            if current == target:
+                print(f"🧭 On '{target}' ({' -> '.join(str(name) for name in visited)})")
+                return visited
+
+            if current in self.dialogs:
+                print(f"🧭 Dismissing '{current}'")
+                self.dialogs[current][1](self.driver)
+                continue
+
+            if current is None:
+                if relaunched:
+                    raise NavigationError(f"Cannot tell which screen the app is on (after {visited})")
+                # Not one of our screens: the app may be in the background or behind another app
+                print("🧭 Unknown screen, bringing the app to the foreground")
+                if self.driver.query_app_state(self.app_package) != APP_RUNNING_IN_FOREGROUND:
+                    self.driver.activate_app(self.app_package)
+                else:
+                    self.driver.back()
+                BasePage(self.driver).wait_for_settle(2, label="navigator relaunch")
+                relaunched = True
+                continue
+
+            path = self.route(current, target, blocked)
+            if not path:
+                raise NavigationError(f"No route from '{current}' to '{target}' (passed {visited})")
+            last_edge = path[0]
+            print(f"🧭 {last_edge} (route: {' -> '.join([current] + [step.target for step in path])})")
+            last_edge.action(self.driver)
+
+        raise NavigationError(f"Did not reach '{target}' within {max_steps} steps (passed {visited})")
+
+
+def go_to(driver, target):
+    """Shortcut for Navigator(driver).go_to(target)"""
+    return Navigator(driver).go_to(target)
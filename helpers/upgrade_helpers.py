@@ -1,15 +1,36 @@
 import os
 import time
-import subprocess
 from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException
+
+from helpers.common_tests import NOTIFICATION_PERMISSION_LOCATORS, PERMISSION_ALLOW_LOCATORS
+from helpers.dialog_watcher import DialogWatcher
+from utils.adb_client import AdbError, adb_device, device_serial
+from utils.apk_registry import apk_registry, query_installed_package, remove_app
+from utils.locator_resolver import locator_resolver
+from utils.page_snapshot import PageSnapshot
+from utils.screenshots import capture_screenshot
+from utils.scroll_search import ScrollSearch
+from utils.ui_settle import wait_for_ui_settle
+
 # TouchAction is deprecated in newer Appium versions, using W3C Actions instead
 
+# The drawer's version line has read "Version ...", "App Version ...", "v2.0..." and "Build ..."
+VERSION_TEXT_LOCATOR = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textMatches("(?s).*(Version|2[.]0|Build).*")')
+
 
 class UpgradeHelpers:
     """Helper class for app upgrade automation"""
     
     def __init__(self, driver):
         self.driver = driver
+        self.dialog_watcher = None
+    
+    def _device_id(self):
+        try:
+            return device_serial(self.driver)
+        except AdbError:
+            return None
     
     def install_app_version(self, apk_path, package_name):
         """
@@ -30,6 +51,7 @@ class UpgradeHelpers:
             
             # Install new version (will overwrite existing app)
             self.driver.install_app(apk_path)
+            apk_registry.record_install(self._device_id(), package_name, apk_path)
             print(f"✅ Installed app from: {apk_path}")
             return True
             
@@ -54,9 +76,16 @@ class UpgradeHelpers:
                 print(f"❌ APK file not found: {apk_path}")
                 return False
             
+            # Same build already on the device: wiping its data gives the same clean state
+            if apk_registry.is_installed(self._device_id(), package_name, apk_path):
+                self.driver.terminate_app(package_name)
+                self.driver.execute_script("mobile: clearApp", {"appId": package_name})
+                print(f"✅ {os.path.basename(apk_path)} already installed, cleared app data instead of reinstalling")
+                return True
+            
             # Uninstall existing app if present
             try:
-                self.driver.remove_app(package_name)
+                remove_app(self.driver, package_name)
                 print(f"✅ Uninstalled existing app: {package_name}")
                 time.sleep(2)  # Wait for uninstall to complete
             except Exception as e:
@@ -64,6 +93,7 @@ class UpgradeHelpers:
             
             # Install new version
             self.driver.install_app(apk_path)
+            apk_registry.record_install(self._device_id(), package_name, apk_path)
             print(f"✅ Installed app from: {apk_path}")
             return True
             
@@ -88,8 +118,13 @@ class UpgradeHelpers:
                 print(f"❌ APK file not found: {apk_path}")
                 return False
             
+            if apk_registry.is_installed(self._device_id(), package_name, apk_path):
+                print(f"✅ {os.path.basename(apk_path)} already installed, skipping reinstall")
+                return True
+            
             # Install new version directly (will overwrite if exists)
             self.driver.install_app(apk_path)
+            apk_registry.record_install(self._device_id(), package_name, apk_path)
             print(f"✅ Installed app from: {apk_path}")
             return True
             
@@ -136,7 +171,7 @@ class UpgradeHelpers:
                 self.driver.activate_app(package_name)
             
             print(f"✅ Launched app: {package_name}")
-            time.sleep(3)  # Wait for app to load
+            wait_for_ui_settle(self.driver, 3, label=f"launch {package_name}")  # Wait for app to load
             
             return True
             
@@ -160,48 +195,24 @@ class UpgradeHelpers:
             while time.time() - start_time < timeout:
                 try:
                     # Look for notification permission dialog
-                    permission_selectors = [
-                        'new UiSelector().text("Allow Olarm to send you notifications?")',
-                        'new UiSelector().textContains("Allow").textContains("to send you notifications")',
-                        'new UiSelector().textContains("notifications")',
-                        'new UiSelector().resourceId("com.android.permissioncontroller:id/permission_message")'
-                    ]
-                    
-                    for selector in permission_selectors:
-                        try:
-                            permission_dialog = self.driver.find_element(
-                                AppiumBy.ANDROID_UIAUTOMATOR, 
-                                selector
-                            )
-                            if permission_dialog.is_displayed():
-                                print("✅ Found notification permission dialog")
-                                
-                                # Look for "Allow" button and click it
-                                allow_selectors = [
-                                    'new UiSelector().text("Allow")',
-                                    'new UiSelector().resourceId("com.android.permissioncontroller:id/permission_allow_button")',
-                                    'new UiSelector().resourceId("android:id/button1")'
-                                ]
-                                
-                                for allow_selector in allow_selectors:
-                                    try:
-                                        allow_button = self.driver.find_element(
-                                            AppiumBy.ANDROID_UIAUTOMATOR, 
-                                            allow_selector
-                                        )
-                                        if allow_button.is_displayed():
-                                            allow_button.click()
-                                            print("✅ Clicked 'Allow' for notifications")
-                                            time.sleep(1)
-                                            return True
-                                    except Exception:
-                                        continue
-                                
-                                print("⚠️ Found permission dialog but couldn't find Allow button")
-                                return False
-                                
-                        except Exception:
-                            continue
+                    permission_dialog = locator_resolver.find_optional(
+                        self.driver, "system", "notification_permission_dialog", NOTIFICATION_PERMISSION_LOCATORS
+                    )
+                    if permission_dialog is not None:
+                        print("✅ Found notification permission dialog")
+                        
+                        # Look for "Allow" button and click it
+                        allow_button = locator_resolver.find_optional(
+                            self.driver, "system", "notification_permission_allow", PERMISSION_ALLOW_LOCATORS
+                        )
+                        if allow_button is not None:
+                            allow_button.click()
+                            print("✅ Clicked 'Allow' for notifications")
+                            time.sleep(1)
+                            return True
+                        
+                        print("⚠️ Found permission dialog but couldn't find Allow button")
+                        return False
                     
                     # No permission dialog found, that's okay
                     time.sleep(0.5)
@@ -216,91 +227,30 @@ class UpgradeHelpers:
             print(f"❌ Error handling notification permission: {e}")
             return True  # Don't fail the test for permission handling issues
 
-    def auto_grant_all_permissions(self, timeout=10):
+    def auto_grant_all_permissions(self, timeout=10, wait=False):
         """
         Automatically grant all permissions that might appear after login
         This simulates the autoGrantPermissions behavior for runtime permissions
         
+        A background DialogWatcher grants permissions (and dismisses ANR / records
+        crash dialogs) while the next test step runs; it stops once no dialog has
+        been seen for 2 seconds.
+        
         Args:
-            timeout (int): Timeout in seconds to wait for permission dialogs
+            timeout (int): Upper bound in seconds for the watcher
+            wait (bool): Block until the watcher has finished
             
         Returns:
             bool: True if all permissions handled successfully
         """
         try:
             print("🔧 Auto-granting all permissions after login...")
-            start_time = time.time()
-            
-            while time.time() - start_time < timeout:
-                try:
-                    # Look for various permission dialogs
-                    permission_patterns = [
-                        # Notification permissions
-                        ('new UiSelector().textContains("notifications")', 'Allow'),
-                        ('new UiSelector().textContains("notification")', 'Allow'),
-                        # Location permissions
-                        ('new UiSelector().textContains("location")', 'Allow'),
-                        ('new UiSelector().textContains("Location")', 'Allow'),
-                        # Camera permissions
-                        ('new UiSelector().textContains("camera")', 'Allow'),
-                        ('new UiSelector().textContains("Camera")', 'Allow'),
-                        # Storage permissions
-                        ('new UiSelector().textContains("storage")', 'Allow'),
-                        ('new UiSelector().textContains("Storage")', 'Allow'),
-                        # Microphone permissions
-                        ('new UiSelector().textContains("microphone")', 'Allow'),
-                        ('new UiSelector().textContains("Microphone")', 'Allow'),
-                        # Generic permission dialogs
-                        ('new UiSelector().resourceId("com.android.permissioncontroller:id/permission_message")', 'Allow'),
-                        ('new UiSelector().resourceId("android:id/alertTitle")', 'Allow'),
-                        # App-specific permission dialogs
-                        ('new UiSelector().textContains("Olarm")', 'Allow'),
-                        ('new UiSelector().textContains("olarm")', 'Allow')
-                    ]
-                    
-                    for pattern, action in permission_patterns:
-                        try:
-                            dialog = self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, pattern)
-                            if dialog.is_displayed():
-                                print(f"✅ Found permission dialog: {pattern}")
-                                
-                                # Look for action buttons (Allow, OK, Yes, etc.)
-                                action_selectors = [
-                                    f'new UiSelector().text("{action}")',
-                                    f'new UiSelector().text("{action.lower()}")',
-                                    f'new UiSelector().text("{action.upper()}")',
-                                    'new UiSelector().resourceId("com.android.permissioncontroller:id/permission_allow_button")',
-                                    'new UiSelector().resourceId("android:id/button1")',
-                                    'new UiSelector().resourceId("android:id/positive")',
-                                    'new UiSelector().text("OK")',
-                                    'new UiSelector().text("Yes")',
-                                    'new UiSelector().text("Accept")'
-                                ]
-                                
-                                for action_selector in action_selectors:
-                                    try:
-                                        button = self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, action_selector)
-                                        if button.is_displayed():
-                                            button.click()
-                                            print(f"✅ Clicked '{action}' for permission")
-                                            time.sleep(1)
-                                            break
-                                    except Exception:
-                                        continue
-                                
-                                # Continue looking for more dialogs
-                                break
-                                
-                        except Exception:
-                            continue
-                    
-                    # Check if we're done (no more dialogs)
-                    time.sleep(0.5)
-                    
-                except Exception:
-                    pass
-            
-            print("✅ Auto-grant permissions completed")
+            if self.dialog_watcher is not None and self.dialog_watcher.running:
+                self.dialog_watcher.stop()
+            self.dialog_watcher = DialogWatcher(self.driver, timeout=timeout).start()
+            if wait:
+                self.dialog_watcher.join()
+                print(f"✅ Auto-grant permissions completed (handled: {self.dialog_watcher.handled or 'none'})")
             return True
             
         except Exception as e:
@@ -339,11 +289,7 @@ class UpgradeHelpers:
         
         print("❌ User is not logged in - 'My Devices' screen not visible")
         # Take a screenshot for debugging when login fails
-        try:
-            self.take_screenshot("login_failure_debug.png")
-            print("📸 Debug screenshot saved: upgrade_screenshots/login_failure_debug.png")
-        except Exception as e:
-            print(f"⚠️ Could not take debug screenshot: {e}")
+        self.take_screenshot("login_failure_debug.png")
         return False
 
     def verify_my_devices_screen_content(self, timeout=10):
@@ -394,11 +340,7 @@ class UpgradeHelpers:
                     print(f"❌ My Devices screen contains problematic content: {', '.join(found_unwanted_content)}")
                     
                     # Take a screenshot for debugging
-                    try:
-                        self.take_screenshot("my_devices_error_content.png")
-                        print("📸 Error screenshot saved: upgrade_screenshots/my_devices_error_content.png")
-                    except Exception as e:
-                        print(f"⚠️ Could not take error screenshot: {e}")
+                    self.take_screenshot("my_devices_error_content.png")
                     
                     return False
                 
@@ -442,11 +384,7 @@ class UpgradeHelpers:
         print("Expected to find one of: Devices Online, Devices Offline, Add Olarm Device, Add Device, No devices found, Add your first device")
         
         # Take a screenshot for debugging
-        try:
-            self.take_screenshot("my_devices_content_failure.png")
-            print("📸 Debug screenshot saved: upgrade_screenshots/my_devices_content_failure.png")
-        except Exception as e:
-            print(f"⚠️ Could not take debug screenshot: {e}")
+        self.take_screenshot("my_devices_content_failure.png")
         
         return False
     
@@ -491,28 +429,32 @@ class UpgradeHelpers:
             list: List of error messages found
         """
         error_messages = []
-        error_selectors = [
-            ('new UiSelector().text("Error")', "Error dialog"),
-            ('new UiSelector().text("Crash")', "Crash dialog"),
-            ('new UiSelector().text("App has stopped")', "App stopped dialog"),
-            ('new UiSelector().text("Unfortunately")', "Unfortunately dialog"),
-            ('new UiSelector().text("Force Close")', "Force close dialog"),
-            ('new UiSelector().text("ANR")', "ANR dialog"),
-            ('new UiSelector().text("Not Responding")', "Not responding dialog")
+        error_texts = [
+            ("Error", "Error dialog"),
+            ("Crash", "Crash dialog"),
+            ("App has stopped", "App stopped dialog"),
+            ("Unfortunately", "Unfortunately dialog"),
+            ("Force Close", "Force close dialog"),
+            ("ANR", "ANR dialog"),
+            ("Not Responding", "Not responding dialog")
         ]
         
-        for selector, description in error_selectors:
-            try:
-                error_element = self.driver.find_element(
-                    AppiumBy.ANDROID_UIAUTOMATOR, 
-                    selector
-                )
-                if error_element.is_displayed():
-                    error_messages.append(description)
-                    print(f"❌ Found error dialog: {description}")
-            except Exception:
-                # Element not found, which is good
-                pass
+        # Crash dialogs the background watcher saw (and closed) count too
+        if self.dialog_watcher is not None:
+            for failure in self.dialog_watcher.failures:
+                error_messages.append(f"{failure} (seen by dialog watcher)")
+                print(f"❌ Dialog watcher saw: {failure}")
+        
+        try:
+            snapshot = PageSnapshot.capture(self.driver)
+        except Exception as e:
+            print(f"⚠️ Could not read page source for error dialogs: {e}")
+            return error_messages
+        
+        for text, description in error_texts:
+            if any(node.displayed for node in snapshot.by_text.get(text, [])):
+                error_messages.append(description)
+                print(f"❌ Found error dialog: {description}")
         
         if not error_messages:
             print("✅ No error dialogs detected")
@@ -533,30 +475,26 @@ class UpgradeHelpers:
         
         while time.time() - start_time < timeout:
             try:
+                # One page source read per tick covers both the error and the ready checks
+                snapshot = PageSnapshot.capture(self.driver)
+                
                 # First, check for error dialogs or crash states
-                error_selectors = [
-                    'new UiSelector().text("App has stopped")',
-                    'new UiSelector().text("Unfortunately")',
-                    'new UiSelector().text("Force Close")',
-                    'new UiSelector().text("ANR")',
-                    'new UiSelector().text("Not Responding")',
-                    'new UiSelector().text("It appears that you do not have devices, but none of them are online")',
-                    'new UiSelector().text("There was a problem with your request. Please try again.")'
+                error_texts = [
+                    "App has stopped",
+                    "Unfortunately",
+                    "Force Close",
+                    "ANR",
+                    "Not Responding",
+                    "It appears that you do not have devices, but none of them are online",
+                    "There was a problem with your request. Please try again."
                 ]
                 
-                for error_selector in error_selectors:
-                    try:
-                        error_element = self.driver.find_element(
-                            AppiumBy.ANDROID_UIAUTOMATOR, 
-                            error_selector
-                        )
-                        if error_element.is_displayed():
-                            print(f"❌ App is showing error state: {error_selector}")
-                            # Take a screenshot for debugging
-                            self.take_screenshot("app_error_state.png")
-                            return False
-                    except Exception:
-                        continue
+                for error_text in error_texts:
+                    if any(node.displayed for node in snapshot.by_text.get(error_text, [])):
+                        print(f"❌ App is showing error state: {error_text}")
+                        # Take a screenshot for debugging
+                        self.take_screenshot("app_error_state.png")
+                        return False
                 
                 # Check if app is responsive by looking for common elements
                 elements_to_check = [
@@ -569,16 +507,9 @@ class UpgradeHelpers:
                 ]
                 
                 for selector in elements_to_check:
-                    try:
-                        element = self.driver.find_element(
-                            AppiumBy.ANDROID_UIAUTOMATOR, 
-                            selector
-                        )
-                        if element.is_displayed():
-                            print(f"✅ App loaded successfully - Found: {selector}")
-                            return True
-                    except Exception:
-                        continue
+                    if snapshot.is_visible((AppiumBy.ANDROID_UIAUTOMATOR, selector)):
+                        print(f"✅ App loaded successfully - Found: {selector}")
+                        return True
                 
             except Exception as e:
                 print(f"⚠️ Error during app load check: {e}")
@@ -602,17 +533,11 @@ class UpgradeHelpers:
             bool: True if data cleared successfully, False otherwise
         """
         try:
-            # Clear app data using ADB
-            device_id = self.driver.desired_capabilities.get('udid', 'emulator-5554')
-            cmd = f"adb -s {device_id} shell pm clear {package_name}"
-            
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if result.returncode == 0:
+            if adb_device(self._device_id()).pm_clear(package_name):
                 print(f"✅ Cleared app data for: {package_name}")
                 return True
             else:
-                print(f"❌ Failed to clear app data: {result.stderr}")
+                print(f"❌ Failed to clear app data for: {package_name}")
                 return False
                 
         except Exception as e:
@@ -623,6 +548,9 @@ class UpgradeHelpers:
         """
         Get the installed version of the app
         
+        Builds installed through these helpers are looked up in the APK index;
+        only unknown installs fall back to dumpsys on the device.
+        
         Args:
             package_name (str): Package name of the app
             
@@ -630,19 +558,15 @@ class UpgradeHelpers:
             str: Version string or None if not found
         """
         try:
-            device_id = self.driver.desired_capabilities.get('udid', 'emulator-5554')
-            cmd = f"adb -s {device_id} shell dumpsys package {package_name} | grep versionName"
+            installed = apk_registry.installed_metadata(self._device_id(), package_name)
+            if installed is not None:
+                print(f"✅ App version: {installed['version_name']}")
+                return installed['version_name']
             
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                # Parse version from output
-                output_lines = result.stdout.strip().split('\n')
-                for line in output_lines:
-                    if 'versionName=' in line:
-                        version = line.split('versionName=')[1].strip()
-                        print(f"✅ App version: {version}")
-                        return version
+            device_state = query_installed_package(self._device_id(), package_name)
+            if device_state is not None and device_state['version_name']:
+                print(f"✅ App version: {device_state['version_name']}")
+                return device_state['version_name']
             
             print("❌ Could not determine app version")
             return None
@@ -655,26 +579,16 @@ class UpgradeHelpers:
         """
         Take a screenshot for debugging purposes
         
+        The frame is written in the background under reports/screenshots/<test id>/
+        and attached to the Allure result when the test finishes.
+        
         Args:
-            filename (str): Name of the screenshot file
+            filename (str): Step name for the screenshot, e.g. "version_after_upgrade.png"
             
         Returns:
-            bool: True if screenshot taken successfully, False otherwise
+            bool: True if the screenshot was captured, False otherwise
         """
-        try:
-            # Create upgrade_screenshots directory if it doesn't exist
-            screenshot_dir = "upgrade_screenshots"
-            os.makedirs(screenshot_dir, exist_ok=True)
-            
-            screenshot_path = os.path.join(screenshot_dir, filename)
-            
-            self.driver.save_screenshot(screenshot_path)
-            print(f"✅ Screenshot saved: {screenshot_path}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Failed to take screenshot: {e}")
-            return False
+        return capture_screenshot(self.driver, filename) is not None
     
     def wait_for_element(self, locator, timeout=10):
         """
@@ -703,7 +617,7 @@ class UpgradeHelpers:
     
     def scroll_to_element(self, locator, max_scrolls=5):
         """
-        Scroll to find an element using W3C Actions
+        Scroll to find an element (UiScrollable on the device, flings as a fallback)
         
         Args:
             locator (tuple): Element locator (strategy, value)
@@ -712,31 +626,10 @@ class UpgradeHelpers:
         Returns:
             bool: True if element found, False otherwise
         """
-        for i in range(max_scrolls):
-            try:
-                element = self.driver.find_element(*locator)
-                if element.is_displayed():
-                    return True
-            except Exception:
-                pass
-            
-            # Scroll down using W3C Actions
-            screen_size = self.driver.get_window_size()
-            start_x = screen_size['width'] * 0.5
-            start_y = screen_size['height'] * 0.8
-            end_y = screen_size['height'] * 0.2
-            
-            from selenium.webdriver.common.action_chains import ActionChains
-            actions = ActionChains(self.driver)
-            actions.w3c_actions.pointer_action.move_to_location(start_x, start_y)
-            actions.w3c_actions.pointer_action.pointer_down()
-            actions.w3c_actions.pointer_action.move_to_location(start_x, end_y)
-            actions.w3c_actions.pointer_action.pointer_up()
-            actions.perform()
-            
-            time.sleep(1)
-        
-        return False
+        try:
+            return ScrollSearch(self.driver, max_flings=max_scrolls).find(locator).is_displayed()
+        except NoSuchElementException:
+            return False
 
     def open_drawer_menu_and_verify_version(self, expected_version, screenshot_name):
         """
@@ -773,75 +666,32 @@ class UpgradeHelpers:
             # Scroll to bottom of the drawer menu to find version info
             print("📜 Scrolling to bottom of drawer menu to find version info...")
             
-            # Try to find version text at the bottom
-            version_found = False
-            max_scrolls = 3
-            
-            for scroll_attempt in range(max_scrolls):
-                try:
-                    # Look for version text patterns
-                    version_selectors = [
-                        'new UiSelector().textContains("Version")',
-                        'new UiSelector().textContains("v2.0")',
-                        'new UiSelector().textContains("2.0")',
-                        'new UiSelector().textContains("App Version")',
-                        'new UiSelector().textContains("Build")'
-                    ]
-                    
-                    for selector in version_selectors:
-                        try:
-                            version_element = self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, selector)
-                            if version_element.is_displayed():
-                                version_text = version_element.text
-                                print(f"✅ Found version info: {version_text}")
-                                
-                                # Verify the version matches expected
-                                if expected_version in version_text:
-                                    print(f"✅ Version verification successful: {expected_version}")
-                                    version_found = True
-                                    break
-                                else:
-                                    print(f"⚠️ Version mismatch. Expected: {expected_version}, Found: {version_text}")
-                        except Exception:
-                            continue
-                    
-                    if version_found:
-                        break
-                    
-                    # Scroll down in drawer menu
-                    screen_size = self.driver.get_window_size()
-                    start_x = screen_size['width'] * 0.5
-                    start_y = screen_size['height'] * 0.8
-                    end_y = screen_size['height'] * 0.2
-                    
-                    from selenium.webdriver.common.action_chains import ActionChains
-                    actions = ActionChains(self.driver)
-                    actions.w3c_actions.pointer_action.move_to_location(start_x, start_y)
-                    actions.w3c_actions.pointer_action.pointer_down()
-                    actions.w3c_actions.pointer_action.move_to_location(start_x, end_y)
-                    actions.w3c_actions.pointer_action.pointer_up()
-                    actions.perform()
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"⚠️ Scroll attempt {scroll_attempt + 1} failed: {e}")
-                    continue
+            # One scroll search for any of the texts the version line has used
+            try:
+                version_element = ScrollSearch(self.driver, max_flings=3).find(VERSION_TEXT_LOCATOR)
+                version_text = version_element.text
+                print(f"✅ Found version info: {version_text}")
+                if expected_version in version_text:
+                    print(f"✅ Version verification successful: {expected_version}")
+                else:
+                    print(f"⚠️ Version mismatch. Expected: {expected_version}, Found: {version_text}")
+            except NoSuchElementException as e:
+                print(f"⚠️ Version info not found in the drawer menu: {e.msg}")
             
             # Take screenshot regardless of version verification
             print(f"📸 Taking screenshot: {screenshot_name}")
             self.take_screenshot(screenshot_name)
             
-            # Also get app version via ADB for additional verification
+            # Cross-check against the installed build (APK index, dumpsys for unknown installs)
             package_name = "com.olarm.olarm1"
-            adb_version = self.get_app_version(package_name)
+            installed_version = self.get_app_version(package_name)
             
-            if adb_version:
-                print(f"📱 ADB reported version: {adb_version}")
-                if expected_version in adb_version:
-                    print(f"✅ ADB version verification successful: {expected_version}")
+            if installed_version:
+                print(f"📱 Installed build version: {installed_version}")
+                if expected_version in installed_version:
+                    print(f"✅ Installed version verification successful: {expected_version}")
                 else:
-                    print(f"⚠️ ADB version mismatch. Expected: {expected_version}, Found: {adb_version}")
+                    print(f"⚠️ Installed version mismatch. Expected: {expected_version}, Found: {installed_version}")
             
             return True
             
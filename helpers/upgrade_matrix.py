@@ -0,0 +1,251 @@
+"""
+Data-driven upgrade matrix
+
+Every from -> to pair in config.app_versions.get_upgrade_matrix() runs through
+the same scenario steps below. Each scenario is an independent test, so under
+pytest-xdist the pairs are handed out one by one to whichever device in the
+pool is free (see utils.device_pool.PER_TEST_SCOPE_MODULES). Every worker writes
+one JSON result per scenario and the controller merges them into a single
+matrix report at the end of the run.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+
+from config.app_versions import get_version_config, verify_apk_exists
+from helpers.common_tests import do_login, do_login_with_classic_tokens, first_login_btn
+from utils.apk_registry import remove_app
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The upgrade runner points each concurrently running suite at its own directory
+MATRIX_RESULTS_DIR = os.getenv("UPGRADE_MATRIX_DIR") or os.path.join(PROJECT_ROOT, "reports", "upgrade-matrix")
+MATRIX_REPORT_FILE = (os.getenv("UPGRADE_MATRIX_REPORT")
+                      or os.path.join(PROJECT_ROOT, "reports", "upgrade_matrix_report.json"))
+
+# Upper bounds per phase, in seconds. A scenario can override them with its own
+# "thresholds" entry; None records the timings without asserting them.
+PERFORMANCE_THRESHOLDS = {
+    "install_time": 60,
+    "launch_time": 30,
+    "login_time": 30,
+    "upgrade_time": 120,
+    "total_time": 300
+}
+
+
+def clear_matrix_results(results_dir=MATRIX_RESULTS_DIR):
+    """Remove scenario results left over from a previous run"""
+    if not os.path.isdir(results_dir):
+        return
+    for filename in os.listdir(results_dir):
+        if filename.endswith(".json"):
+            os.remove(os.path.join(results_dir, filename))
+
+
+def record_scenario_result(scenario, status, metrics, error=None, results_dir=MATRIX_RESULTS_DIR):
+    """Write one scenario's outcome; safe to call from any xdist worker"""
+    os.makedirs(results_dir, exist_ok=True)
+    result = {
+        "name": scenario["name"],
+        "from_version": scenario["from_version"],
+        "to_version": scenario["to_version"],
+        "status": status,
+        "metrics": {key: round(value, 2) for key, value in metrics.items()},
+        "worker": os.getenv("PYTEST_XDIST_WORKER", "gw0"),
+        "error": error,
+        "finished_at": time.time()
+    }
+    with open(os.path.join(results_dir, f"{scenario['name']}.json"), "w") as f:
+        json.dump(result, f, indent=2)
+    return result
+
+
+def merge_matrix_results(results_dir=MATRIX_RESULTS_DIR, report_path=MATRIX_REPORT_FILE):
+    """
+    Merge the per-scenario results of all workers into one report
+
+    Returns:
+        dict: The merged report, or None if no scenario ran
+    """
+    if not os.path.isdir(results_dir):
+        return None
+    results = []
+    for filename in sorted(os.listdir(results_dir)):
+        if filename.endswith(".json"):
+            with open(os.path.join(results_dir, filename)) as f:
+                results.append(json.load(f))
+    if not results:
+        return None
+
+    summary = {status: sum(1 for result in results if result["status"] == status)
+               for status in ("passed", "failed", "skipped")}
+    summary["total"] = len(results)
+    summary["scenario_time"] = round(sum(result["metrics"].get("total_time", 0) for result in results), 2)
+    summary["workers"] = sorted({result["worker"] for result in results})
+    report = {"summary": summary, "scenarios": results}
+
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print("\n📊 Upgrade matrix:")
+    for result in results:
+        icon = {"passed": "✅", "failed": "❌"}.get(result["status"], "⏭️")
+        total = result["metrics"].get("total_time")
+        timing = f"{total:.1f}s" if total is not None else "-"
+        print(f"  {icon} {result['from_version']:>12} → {result['to_version']:<8} {timing:>8}  [{result['worker']}]")
+    print(f"  {summary['passed']} passed, {summary['failed']} failed, {summary['skipped']} skipped "
+          f"on {len(summary['workers'])} device(s) - report: {report_path}")
+    return report
+
+
+@contextmanager
+def matrix_result(scenario):
+    """Record the scenario as passed/failed/skipped with the metrics collected inside the block"""
+    metrics = {}
+    try:
+        yield metrics
+    except pytest.skip.Exception as e:
+        record_scenario_result(scenario, "skipped", metrics, str(e))
+        raise
+    except BaseException as e:
+        record_scenario_result(scenario, "failed", metrics, f"{type(e).__name__}: {e}")
+        raise
+    else:
+        record_scenario_result(scenario, "passed", metrics)
+
+
+def _verify_classic_login(driver, upgrade_helper, scenario, timeout=10):
+    # 1.6.6 builds show a "Devices" title instead of "My Devices". The permission
+    # watcher may still be tapping dialogs, so poll like verify_user_logged_in does.
+    start_time = time.time()
+    error = None
+    while time.time() - start_time < timeout:
+        try:
+            devices_element = driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Devices")')
+            if devices_element.is_displayed():
+                print("✅ Found 'Devices' screen title")
+                return
+        except Exception as e:
+            error = e
+        time.sleep(1)
+
+    print(f"❌ Login verification failed for version {scenario['from_version']}: "
+          f"{error or 'Devices screen not visible'}")
+    upgrade_helper.take_screenshot(f"{scenario['slug']}_login_failure_debug.png")
+    raise AssertionError(f"Failed to login to version {scenario['from_version']} - classic tokens verification failed")
+
+
+def run_upgrade_scenario(driver, upgrade_helper, scenario, metrics):
+    """
+    Install the old build, log in, upgrade in place and verify the user stays logged in
+
+    Args:
+        driver: Appium WebDriver instance
+        upgrade_helper (UpgradeHelpers): Helper bound to the driver
+        scenario (dict): Entry from get_upgrade_matrix("upgrade")
+        metrics (dict): Filled with the time spent in each phase. Each phase covers
+            the same steps the old performance test timed; permission grants,
+            screen-content checks and drawer version checks are not counted.
+    """
+    from_version = scenario["from_version"]
+    to_version = scenario["to_version"]
+    slug = scenario["slug"]
+    print(f"\n🔄 Testing in-place upgrade scenario: {from_version} → {to_version}")
+
+    if not verify_apk_exists(from_version):
+        pytest.skip(f"APK file for version {from_version} not found")
+    if not verify_apk_exists(to_version):
+        pytest.skip(f"APK file for version {to_version} not found")
+
+    old_config = get_version_config(from_version)
+    new_config = get_version_config(to_version)
+
+    print(f"Step 1: Installing version {from_version}...")
+    phase_start = time.time()
+    assert upgrade_helper.install_app_version_clean(
+        old_config["apk_path"],
+        old_config["package_name"]
+    ), f"Failed to install version {from_version}"
+    metrics["install_time"] = time.time() - phase_start
+
+    print("Step 2: Launching app and logging in...")
+    phase_start = time.time()
+    assert upgrade_helper.launch_app(old_config["package_name"]), "Failed to launch old version"
+    metrics["launch_time"] = time.time() - phase_start
+
+    phase_start = time.time()
+    if scenario["login_flow"] == "classic":
+        do_login_with_classic_tokens(driver)
+    else:
+        first_login_btn(driver, app_version=old_config["version_name"])
+        do_login(driver)
+    metrics["login_time"] = time.time() - phase_start
+
+    # Handle notification permission dialog that appears after login (before checking login status)
+    upgrade_helper.auto_grant_all_permissions()
+
+    phase_start = time.time()
+    if scenario["login_flow"] == "classic":
+        _verify_classic_login(driver, upgrade_helper, scenario)
+        metrics["login_time"] += time.time() - phase_start
+    else:
+        assert upgrade_helper.verify_user_logged_in(), f"Failed to login to version {from_version}"
+        metrics["login_time"] += time.time() - phase_start
+        assert upgrade_helper.verify_my_devices_screen_content(), \
+            f"My Devices screen does not contain expected functional content in version {from_version}"
+    print(f"✅ Successfully logged into version {from_version}")
+
+    upgrade_helper.open_drawer_menu_and_verify_version(old_config["version_name"], f"{slug}_version_before_upgrade.png")
+
+    # In-place upgrade (NO uninstall) preserves user login state and app data
+    print(f"Step 3: Performing in-place upgrade to {to_version} (app-release.apk)...")
+    phase_start = time.time()
+    assert upgrade_helper.install_app_version_direct(
+        new_config["apk_path"],
+        new_config["package_name"]
+    ), f"Failed to install version {to_version}"
+    assert upgrade_helper.launch_app(new_config["package_name"]), "Failed to launch upgraded app"
+    metrics["upgrade_time"] = time.time() - phase_start
+
+    # Auto-grant all permissions after upgrade (drawer menu becomes visible after this)
+    upgrade_helper.auto_grant_all_permissions()
+
+    print("Step 4: Verifying upgrade results...")
+    phase_start = time.time()
+    assert upgrade_helper.wait_for_app_load(), "App did not load after upgrade"
+    assert upgrade_helper.verify_user_logged_in(), "User not logged in after upgrade"
+    metrics["verify_time"] = time.time() - phase_start
+
+    my_devices_element = driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("My Devices")')
+    assert my_devices_element.is_displayed(), "'My Devices' screen not visible after upgrade"
+
+    # CRITICAL: Verify My Devices screen contains expected functional content and NO error messages
+    assert upgrade_helper.verify_my_devices_screen_content(), \
+        "My Devices screen does not contain expected functional content after upgrade"
+
+    error_messages = upgrade_helper.check_for_error_dialogs()
+    assert len(error_messages) == 0, f"Error dialogs found during upgrade: {error_messages}"
+
+    upgrade_helper.open_drawer_menu_and_verify_version(new_config["version_name"], f"{slug}_version_after_upgrade.png")
+    upgrade_helper.take_screenshot(f"{slug}_my_devices_after_upgrade.png")
+    metrics["total_time"] = sum(metrics[phase] for phase in
+                                ("install_time", "launch_time", "login_time", "upgrade_time", "verify_time"))
+
+    print(f"✅ In-place upgrade from {from_version} to {to_version} completed successfully")
+
+    print("Step 5: Uninstalling the app...")
+    remove_app(driver, new_config["package_name"])
+    print("✅ App uninstalled successfully")
+
+    thresholds = scenario.get("thresholds", PERFORMANCE_THRESHOLDS)
+    if thresholds is None:
+        print(f"ℹ️ Timings recorded but not checked for {from_version} (no thresholds for this scenario)")
+        return
+    for phase, threshold in thresholds.items():
+        assert metrics[phase] < threshold, \
+            f"{phase.replace('_', ' ').capitalize()} too slow for {from_version}→{to_version}: {metrics[phase]:.2f}s"
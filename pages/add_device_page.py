@@ -1,4 +1,3 @@
-import os
 import time
 from socket import send_fds
 
@@ -8,6 +7,7 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from pages.base_page import BasePage
 from appium.webdriver.common.appiumby import AppiumBy
+from utils.screenshots import capture_screenshot
 
 class AddDevicePage(BasePage):
     def __init__(self, driver):
@@ -91,7 +91,7 @@ class AddDevicePage(BasePage):
                 EC.presence_of_element_located((AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("This device is only compatible with 2.4GHz Wi-Fi networks.")'))
             )
         except TimeoutException:
-            self.driver.save_screenshot("next_screen_not_found.png")
+            capture_screenshot(self.driver, "next_screen_not_found")
             return False
 
     #skip steps
@@ -145,7 +145,7 @@ class AddDevicePage(BasePage):
             )
             return True
         except TimeoutException:
-            self.driver.save_screenshot("wifi_not_connected.png")
+            capture_screenshot(self.driver, "wifi_not_connected")
             return False
 
     def get_error_message_existing_device(self):
@@ -168,9 +168,8 @@ class AddDevicePage(BasePage):
             )
             return element.text
         except Exception as e:
-            screenshot_path = os.path.join(os.getcwd(), "device_added_fail.png")
-            self.driver.save_screenshot(screenshot_path)
-            print(f"[❌] 'Device Added Successfully.' not found. Screenshot saved at: {screenshot_path}")
+            capture_screenshot(self.driver, "device_added_fail")
+            print("[❌] 'Device Added Successfully.' not found.")
             print(f"[⚠️] Exception: {e}")
             print(f"[📄] Page source:\n{self.driver.page_source}")
             return ""
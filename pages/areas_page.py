@@ -1,4 +1,3 @@
-import time
 from socket import send_fds
 
 from selenium.common import TimeoutException
@@ -6,6 +5,8 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from pages.base_page import BasePage
+from utils.panel_state import parse_areas
+from utils.ui_settle import locator_visible
 from appium.webdriver.common.appiumby import AppiumBy
 
 class AreasPage(BasePage):
@@ -15,54 +16,43 @@ class AreasPage(BasePage):
     area1_label = (AppiumBy.ANDROID_UIAUTOMATOR,'new UiSelector().text("Area 1")')
     status = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Armed")')
     status_disarmed = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Disarmed")')
+    status_stay_armed = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Stay Armed")')
+    status_sleep_armed = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Sleep Armed")')
     timestamp = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text(" • Now")')
     stay_btn = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("icon-button").instance(5)')
     sleep_arm_btn = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("icon-button").instance(6)')
 
 
-    def get_area_info_by_label(self, label_text, timeout=5):
-        # Locate the parent container for the area
-        area_container = self.driver.find_element(
-            AppiumBy.XPATH,
-            f'//android.widget.TextView[@text="{label_text}"]/parent::android.view.ViewGroup'
-        )
-
-        # Collect all text elements in the container
-        text_elements = area_container.find_elements(
-            AppiumBy.XPATH,
-            './/android.widget.TextView'
-        )
+    def read_areas(self, snapshot=None):
+        """
+        State of every area card from one page_source read
+
+        Returns:
+            dict: {area label: AreaState}
+        """
+        snapshot = snapshot or self.current_snapshot(refresh=True)
+        return {area.label: area for area in parse_areas(snapshot)}
+
+    def get_area_state(self, label_text, timeout=5):
+        """
+        The AreaState of one area, waiting up to `timeout` seconds for its card to show a status
+
+        Raises:
+            Exception: If no card with this label and a status appears
+        """
+        areas = self.read_areas()
+        if label_text not in areas:
+            snapshot = self.wait_for_settle(0, label=f"area {label_text}", timeout=timeout,
+                                            condition=lambda snapshot: any(
+                                                area.label == label_text for area in parse_areas(snapshot)))
+            areas = self.read_areas(snapshot)
+        if label_text not in areas:
+            raise Exception(f"Status not found for label '{label_text}'. Areas found: {list(areas.values())}")
+        return areas[label_text]
 
-        # Initialize fallback values
-        status = None
-        timestamp = None
-        all_texts = []
-
-        # Check each text element for matching content
-        for element in text_elements:
-            text = element.text.strip()
-            all_texts.append(text)  # For debugging
-            
-            if text.lower() in ["armed","stay armed","sleep armed", "disarmed"]:
-                status = text
-            elif "now" in text.lower() or "•" in text or ":" in text:
-                timestamp = text
-
-        print(f"DEBUG: All texts found for {label_text}: {all_texts}")
-        print(f"DEBUG: Status found: {status}, Timestamp found: {timestamp}")
-
-        if not status:
-            raise Exception(f"Status not found for label '{label_text}'. Found texts: {all_texts}")
-        if not timestamp:
-            # If no timestamp found, use a default
-            print(f"WARNING: No timestamp found for {label_text}, using 'Now' as default")
-            timestamp = "Now"
-
-        return {
-            "label": label_text,
-            "status": status,
-            "time": timestamp
-        }
+    def get_area_info_by_label(self, label_text, timeout=5):
+        """get_area_state() as the {"label", "status", "time"} dict older tests use"""
+        return self.get_area_state(label_text, timeout).as_dict()
 
     arm_button = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("icon-button").instance(4)')
 
@@ -76,47 +66,36 @@ class AreasPage(BasePage):
 
     def arm_panel(self):
         self.click(self.arm_button)
-        time.sleep(3)
+        self.wait_for_settle(3, label="arm panel", condition=locator_visible(self.status))
+
+    def _area_status(self, matches):
+        """Status text of the first area whose status passes `matches`, or "" if none does"""
+        return next((area.status for area in self.read_areas().values() if matches(area.status)), "")
 
     def is_panel_armed(self):
-        try:
-            return self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR,
-                                            (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Armed")')
-).text
-        except:
-            return ""
+        return self._area_status(lambda status: "Armed" in status)
 
     disarm_button = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("icon-button").instance(3)')
     def disarm_panel(self):
         self.click(self.disarm_button)
-        time.sleep(3)
+        self.wait_for_settle(3, label="disarm panel", condition=locator_visible(self.status_disarmed))
 
     def is_panel_disarmed(self):
-        try:
-            return self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR,
-                                            (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Disarmed")')
-).text
-        except:
-            return ""
+        return self._area_status(lambda status: "Disarmed" in status)
 
 
     #------------------
 
     def stay_arm(self):
         self.click(self.stay_btn)
-        time.sleep(3)
+        self.wait_for_settle(3, label="stay arm", condition=locator_visible(self.status_stay_armed))
 
     def is_panel_stay_armed(self):
-        try:
-            return self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR,
-                                            (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Stay Armed")')
-                                            ).text
-        except:
-            return ""
+        return self._area_status(lambda status: status == "Stay Armed")
 
     def sleep_arm(self):
         self.click(self.sleep_arm_btn)
-        time.sleep(3)
+        self.wait_for_settle(3, label="sleep arm", condition=locator_visible(self.status_sleep_armed))
 
     def is_panel_sleep_armed(self):
         try:
@@ -1,6 +1,6 @@
-import os
 import time
 import traceback
+from contextlib import contextmanager
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 from selenium.webdriver.common.actions.pointer_input import PointerInput
@@ -14,10 +14,86 @@ from selenium.webdriver.common.actions.interaction import Interaction
 from selenium.common.exceptions import NoSuchElementException
 import time
 
+from utils.page_snapshot import PageSnapshot, UnsupportedLocator
+from utils.screenshots import capture_screenshot
+from utils.scroll_search import ScrollSearch
+from utils.ui_settle import wait_for_ui_settle
+
 
 class BasePage:
+    # Poll interval used while waiting on a snapshot for an element to appear
+    snapshot_poll_interval = 0.5
+
     def __init__(self, driver):
         self.driver = driver
+        self._snapshot = None
+        self._snapshot_mode = False
+
+    @contextmanager
+    def snapshot(self):
+        """
+        Answer is_element_visible/get_text lookups from one page_source read.
+
+        The snapshot is fetched lazily on the first lookup and reused until an
+        action (click, type, scroll) invalidates it, so a block of visibility
+        checks costs one HTTP round trip instead of a find per element.
+
+        Usage:
+            with page.snapshot():
+                assert page.is_element_visible(page.panel_ac_power)
+                assert page.is_element_visible(page.panel_ac_power_value)
+        """
+        previous_mode = self._snapshot_mode
+        self._snapshot_mode = True
+        try:
+            yield self
+        finally:
+            self._snapshot_mode = previous_mode
+            if not previous_mode:
+                self._snapshot = None
+
+    def invalidate_snapshot(self):
+        """Drop the cached page source so the next lookup re-reads the screen"""
+        self._snapshot = None
+
+    def current_snapshot(self, refresh=False):
+        """Return the cached snapshot, capturing a new one if needed"""
+        if refresh or self._snapshot is None:
+            self._snapshot = PageSnapshot.capture(self.driver)
+        return self._snapshot
+
+    def wait_for_settle(self, baseline=1, label="settle", condition=None, timeout=None):
+        """
+        Wait for the screen to stop changing instead of sleeping a fixed time.
+
+        Args:
+            baseline (float): The fixed sleep this replaces (recorded for the stats)
+            label (str): Name recorded in the settle stats
+            condition (callable): Optional PageSnapshot predicate to wait for instead
+            timeout (float): Upper bound on the wait
+        """
+        snapshot = wait_for_ui_settle(self.driver, baseline, label=label, condition=condition, timeout=timeout)
+        # The settled read is the current screen, so reuse it for snapshot lookups
+        self._snapshot = snapshot if self._snapshot_mode else None
+        return snapshot
+
+    def _snapshot_find(self, locator, timeout, predicate):
+        """
+        Wait for a node matching the locator and predicate in the snapshot.
+
+        Returns the node, None if it did not appear within the timeout, or
+        raises UnsupportedLocator if the snapshot cannot evaluate the locator.
+        """
+        end_time = time.time() + timeout
+        while True:
+            snapshot = self.current_snapshot()
+            node = snapshot.find(*locator)
+            if node is not None and predicate(node):
+                return node
+            if time.time() >= end_time:
+                return None
+            time.sleep(self.snapshot_poll_interval)
+            self.invalidate_snapshot()
 
     def wait_and_click(self, locator, timeout=5):
         """Wait for an element to be clickable and then click it."""
@@ -31,13 +107,14 @@ class BasePage:
 
     def click(self, locator, timeout=5):
         """Wait and click using normal click, fallback to W3C tap if click fails."""
+        self.invalidate_snapshot()
         try:
             print(f"[Clicking] Trying to click: {locator}")
             element = self.wait_until_clickable(locator, timeout)
 
             if element.is_displayed() and element.is_enabled():
                 element.click()
-                time.sleep(1)  # Let the app respond
+                self.wait_for_settle(1, label=f"click {locator[1]}")  # Let the app respond
             else:
                 raise Exception("Element is not interactable")
 
@@ -55,20 +132,21 @@ class BasePage:
                 action.pointer_action.pointer_down()
                 action.pointer_action.pointer_up()
                 action.perform()
-                time.sleep(1)
+                self.wait_for_settle(1, label=f"tap {locator[1]}")
             except Exception as tap_error:
                 self._log_error(locator, "click", tap_error)
                 raise
 
     def type(self, locator, text, timeout=10):
         """Type text into an input field identified by the locator."""
+        self.invalidate_snapshot()
         try:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             element.clear()  # Clear existing text
             element.send_keys(text)
-            time.sleep(0.5)  # Small wait after typing
+            self.wait_for_settle(0.5, label=f"type {locator[1]}")
         except Exception as e:
             self._log_error(locator, "type", e)
             raise
@@ -85,6 +163,11 @@ class BasePage:
             raise
 
     def is_element_visible(self, locator, timeout=5):
+        if self._snapshot_mode:
+            try:
+                return self._snapshot_find(locator, timeout, lambda node: node.displayed) is not None
+            except UnsupportedLocator:
+                pass
         try:
             WebDriverWait(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
@@ -105,6 +188,15 @@ class BasePage:
 
     def get_text(self, locator, timeout=5):
         """Wait for visibility and get text from the element."""
+        if self._snapshot_mode:
+            try:
+                node = self._snapshot_find(locator, timeout, lambda node: node.displayed)
+                if node is None:
+                    print(f"❌ Failed to get_text on {locator}: not found in page snapshot")
+                    return ""
+                return node.text
+            except UnsupportedLocator:
+                pass
         try:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
@@ -115,39 +207,20 @@ class BasePage:
             return ""
 
     def scroll_to_description(self, description, max_swipes=10):
-        screen_size = self.driver.get_window_size()
-        start_x = screen_size['width'] / 2
-        start_y = screen_size['height'] * 0.8
-        end_y = screen_size['height'] * 0.2
-
-        for attempt in range(max_swipes):
-            try:
-                el = self.driver.find_element(
-                    AppiumBy.ANDROID_UIAUTOMATOR,
-                    f'new UiSelector().text("{description}")'
-                )
-                print(f"✅ Found element with text '{description}' on attempt {attempt + 1}")
-                return el
-            except NoSuchElementException:
-                print(f"🔄 Scrolling attempt {attempt + 1} to find '{description}'")
-
-                finger = PointerInput("touch", "finger")
-                actions = ActionBuilder(self.driver)
-                actions.pointer_action.move_to_location(int(start_x), int(start_y))
-                actions.pointer_action.pointer_down()
-                actions.pointer_action.pause(0.2)
-                actions.pointer_action.move_to_location(int(start_x), int(end_y))
-                actions.pointer_action.release()
-                actions.perform()
-                time.sleep(1)
-
-        raise AssertionError(f"❌ Could not find element with text '{description}' after {max_swipes} scrolls")
+        """Scroll the list until the element with this text is on screen and return it."""
+        self.invalidate_snapshot()
+        try:
+            element = ScrollSearch(self.driver, max_flings=max_swipes).find(
+                (AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().text("{description}")'))
+        except NoSuchElementException:
+            raise AssertionError(f"❌ Could not find element with text '{description}' after {max_swipes} scrolls")
+        print(f"✅ Found element with text '{description}'")
+        return element
 
     def _log_error(self, locator, action, error):
         """Helper to log and screenshot on errors."""
-        screenshot_path = os.path.join(os.getcwd(), f"{action}_error.png")
-        self.driver.save_screenshot(screenshot_path)
-        print(f"❌ Failed to {action} on {locator}. Screenshot saved to {screenshot_path}. Error: {str(error)}")
+        capture_screenshot(self.driver, f"{action}_error")
+        print(f"❌ Failed to {action} on {locator}. Error: {str(error)}")
         traceback.print_exc()
 
 #Reset device
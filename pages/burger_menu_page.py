@@ -1,5 +1,3 @@
-import time
-
 from selenium.common import TimeoutException
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -69,32 +67,26 @@ class BurgerMenuPage(BasePage):
     def click_drawer_menu(self):
         """Click the Drawer Menu button"""
         self.click(self.drawer_menu)
-        time.sleep(1)
 
     def click_view_profile(self):
         """Click the View Profile button"""
         self.click(self.view_profile)
-        time.sleep(1)
 
     def click_account_setup_back_btn(self):
         """Click the Account setup back button"""
         self.click(self.account_setup_back_btn)
-        time.sleep(1)
 
     def click_back_status_page(self):
         """Click the Back arrow button"""
         self.click(self.back_arrow_device_status)
-        time.sleep(1)
 
     def click_device_status(self):
         """Click the Device status button"""
         self.click(self.device_status)
-        time.sleep(1)
 
     def click_device_notifications(self):   
         """Click the Device notifications button"""
         self.click(self.device_notifications_menu_item)
-        time.sleep(1)
     
     def dismiss_device_notifications_modal(self):
         """Dismiss the Device Notifications bottom sheet modal using multiple methods"""
@@ -105,7 +97,6 @@ class BurgerMenuPage(BasePage):
             try:
                 self.click(self.device_notifications_back_arrow)
                 print("✅ Dismissed modal using back arrow")
-                time.sleep(1)
                 return
             except Exception as e1:
                 print(f"❌ Back arrow failed: {e1}")
@@ -114,7 +105,7 @@ class BurgerMenuPage(BasePage):
             try:
                 self.driver.back()
                 print("✅ Dismissed modal using Android back button")
-                time.sleep(1)
+                self.wait_for_settle(1, label="dismiss notifications modal")
                 return
             except Exception as e2:
                 print(f"❌ Android back button failed: {e2}")
@@ -132,7 +123,7 @@ class BurgerMenuPage(BasePage):
                 
                 self.driver.swipe(start_x, start_y, end_x, end_y, 500)
                 print("✅ Dismissed modal using swipe down gesture")
-                time.sleep(1)
+                self.wait_for_settle(1, label="dismiss notifications modal")
                 return
             except Exception as e3:
                 print(f"❌ Swipe down failed: {e3}")
@@ -144,7 +135,7 @@ class BurgerMenuPage(BasePage):
                 y = 100  # Upper area above the modal
                 self.driver.tap([(x, y)])
                 print("✅ Dismissed modal by tapping outside")
-                time.sleep(1)
+                self.wait_for_settle(1, label="dismiss notifications modal")
                 return
             except Exception as e4:
                 print(f"❌ Tap outside failed: {e4}")
@@ -158,37 +149,30 @@ class BurgerMenuPage(BasePage):
     def click_close_modal(self):
         """Click the outside modal"""
         self.click(self.click_outside_modal)
-        time.sleep(1)
 
     def click_cant_get_notifications_link(self):
         """Click the Cant get notifications link"""
         self.click(self.cant_get_notifications)
-        time.sleep(1)
 
     def click_notification_and_alerts_close_btn(self):
         """Click the Notification and alerts close button"""
         self.click(self.notification_and_alerts_close_btn)
-        time.sleep(1)
 
     def click_toggle_to_disable_arm_partial_arm_disarm_notifications(self): 
         """Click the toggle to disable arm, partial arm and disarm notifications"""
         self.click(self.switch_arm_partial_arm_disarm_notifications)
-        time.sleep(1)
 
     def click_toggle_to_enable_arm_partial_arm_disarm_notifications(self):
         """Click the toggle to enable arm, partial arm and disarm notifications"""
         self.click(self.switch_arm_partial_arm_disarm_notifications)
-        time.sleep(1)
 
     def click_turn_off_notifications_confirm_btn(self):
         """Click the Turn off notifications confirm button"""
         self.click(self.turn_off_notifications_confirm_btn)
-        time.sleep(1)
 
     def click_turn_off_notifications_cancel_btn(self):
         """Click the Turn off notifications cancel button"""
         self.click(self.turn_off_notifications_cancel_btn)
-        time.sleep(1)
 
     def tap_outside_modal(self):
         # Get screen size
@@ -202,7 +186,6 @@ class BurgerMenuPage(BasePage):
     def click_terms_of_service(self):
         """Click the Terms of service button"""
         self.click(self.terms_of_service)
-        time.sleep(1)
     
     def navigate_back_from_terms_of_service(self):
         """Navigate back from Terms of Service webview to app"""
@@ -210,14 +193,14 @@ class BurgerMenuPage(BasePage):
             print("🔙 Attempting to navigate back from Terms of Service...")
             # Method 1: Use Android back button
             self.driver.back()
-            time.sleep(2)
+            self.wait_for_settle(2, label="back from terms of service")
             print("✅ Successfully navigated back using driver.back()")
         except Exception as e1:
             print(f"❌ driver.back() failed: {e1}")
             try:
                 # Method 2: Use back keycode
                 self.driver.press_keycode(4)  # KEYCODE_BACK
-                time.sleep(2)
+                self.wait_for_settle(2, label="back from terms of service")
                 print("✅ Successfully navigated back using keycode")
             except Exception as e2:
                 print(f"❌ keycode back failed: {e2}")
@@ -236,7 +219,7 @@ class BurgerMenuPage(BasePage):
                         width = screen_size['width']
                         height = screen_size['height']
                         self.driver.swipe(0, height // 2, width // 4, height // 2, 300)
-                        time.sleep(2)
+                        self.wait_for_settle(2, label="back from terms of service")
                         print("✅ Successfully navigated back using swipe gesture")
                     except Exception as e4:
                         print(f"❌ All navigation methods failed: {e4}")
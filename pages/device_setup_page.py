@@ -7,6 +7,7 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from pages.base_page import BasePage
 from appium.webdriver.common.appiumby import AppiumBy
+from utils.screenshots import capture_screenshot
 
 class DeviceSetupPage(BasePage):
     def __init__(self, driver):
@@ -32,7 +33,7 @@ class DeviceSetupPage(BasePage):
             )
         except Exception:
             print("❌ Page source dump:\n", self.driver.page_source)
-            self.driver.save_screenshot("agree_button_error.png")
+            capture_screenshot(self.driver, "agree_button_error")
             raise AssertionError("❌ 'Agree' button not visible after clicking 'Factory Reset'")
 
         assert self.driver.find_element(*self.agree_btn).is_displayed(), "❌ 'Agree' button not displayed"
@@ -1,10 +1,13 @@
 from pages.base_page import BasePage
 from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 
 class LoginPage(BasePage):
     def __init__(self, driver):
         super().__init__(driver)
+        self._form = None
 #Locate elements
+    credential_inputs = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("text-input-outlined")')
     username_input = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("text-input-outlined").instance(0)')
     password_input = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("text-input-outlined").instance(1)')
     login_button = (AppiumBy.ACCESSIBILITY_ID, "Login")
@@ -28,6 +31,49 @@ class LoginPage(BasePage):
         self.type(self.password_input, password)
         self.click(self.login_button)
 
+    # Repeated attempts on one screen (fuzzing) skip the per-step waits of login()
+    def _login_form(self, refresh=False):
+        """(username, password, login button) elements, found once and reused until they go stale"""
+        if refresh or self._form is None:
+            inputs = self.driver.find_elements(*self.credential_inputs)
+            if len(inputs) < 2:
+                raise NoSuchElementException("Login inputs are not on screen")
+            self._form = (inputs[0], inputs[1], self.driver.find_element(*self.login_button))
+        return self._form
+
+    def _replace_value(self, element, text):
+        # One command instead of clear() + send_keys()
+        self.driver.execute_script("mobile: replaceElementValue", {"elementId": element.id, "text": text})
+
+    def _with_form(self, action):
+        """Run action(username, password, login button), finding the form again once if it went stale"""
+        self.invalidate_snapshot()
+        for refresh in (False, True):
+            try:
+                return action(*self._login_form(refresh))
+            except StaleElementReferenceException:
+                if refresh:
+                    raise NoSuchElementException("Login form went stale twice in a row")
+
+    def submit_credentials(self, username, password, submit=True):
+        """
+        Replace both inputs and tap Login, without waiting for the app to settle
+
+        Raises:
+            NoSuchElementException: If the login form is gone (the screen changed)
+        """
+        def fill(username_field, password_field, login):
+            self._replace_value(username_field, username)
+            self._replace_value(password_field, password)
+            if submit:
+                login.click()
+
+        self._with_form(fill)
+
+    def submit(self):
+        """Tap Login on the form as it is, without waiting for the app to settle"""
+        self._with_form(lambda username_field, password_field, login: login.click())
+
     def is_username_visible(self):
         return self.is_visible(self.username_input)
 
@@ -1,5 +1,3 @@
-import time
-
 from selenium.common import TimeoutException
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -54,37 +52,30 @@ class PanicPage(BasePage):
     def click_okay_btn_panic_activated(self):
         """Click the Okay button"""
         self.click(self.okay_btn_panic_activated)
-        time.sleep(1)
 
     def click_emergency_contacts_back_btn(self):
         """Click the Back button"""
         self.click(self.emergency_contacts_back_btn)
-        time.sleep(1)
     
     def click_panic_button_bottom_nav(self):
         """Click the main panic button to access Send Panic screen"""
         self.click(self.panic_btn)
-        time.sleep(1)
     
     def click_fire_emergency(self):
         """Click the Fire emergency button"""
         self.click(self.fire_button)
-        time.sleep(0.5)
     
     def click_panic_emergency(self):
         """Click the Panic emergency button"""
         self.click(self.panic_button)
-        time.sleep(0.5)
     
     def click_medical_emergency(self):
         """Click the Medical emergency button"""
         self.click(self.medical_button)
-        time.sleep(0.5)
     
     def click_show_all_emergency_contacts(self):
         """Click the Show all emergency contacts button"""
         self.click(self.emergency_contacts_btn)
-        time.sleep(1)
     
     def is_send_panic_screen_visible(self):
         """Check if the Send Panic screen is visible"""
@@ -1,10 +1,13 @@
-import time
-
 from selenium.common import TimeoutException
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.actions import interaction
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.pointer_input import PointerInput
 
 from pages.base_page import BasePage
+from utils.panel_state import parse_zones
+from utils.ui_settle import locator_visible
 from appium.webdriver.common.appiumby import AppiumBy
 
 class ZonesPage(BasePage):
@@ -27,12 +30,28 @@ class ZonesPage(BasePage):
     zone_5_button = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("button").instance(4)')
     zone_6_button = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("button").instance(5)')
 
+    # Bypassed zones show a "Reset" button in place of "Bypass"
+    zone_1_reset_btn = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("Reset").instance(0)')
+    zone_2_reset_btn = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("Reset").instance(1)')
+    zone_3_reset_btn = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("Reset").instance(2)')
+    zone_4_reset_btn = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("Reset").instance(3)')
+    zone_5_reset_btn = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("Reset").instance(4)')
+    zone_6_reset_btn = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("Reset").instance(5)')
+
     # Zone names
     zone_10_name = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Zone 10")')
     zone_06_name = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Zone 06")')
     zone_07_name = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Zone 07")')
     zone_08_name = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Zone 08")')
     zone_09_name = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Zone 09")')
+
+    # The scrolling zone list (rows are parsed by utils.panel_state.parse_zones)
+    zone_list = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().scrollable(true)')
+
+    # Pause between the taps of one batch so the app registers each press
+    tap_interval = 0.1
+    # Upper bound on waiting for the panel to confirm a batch of zone taps
+    toggle_timeout = 10
    
 
 
@@ -43,7 +62,7 @@ class ZonesPage(BasePage):
         try:
             print("=== Clicking Zones Button ===")
             self.click(self.zones_button)
-            time.sleep(3)  # Increased wait time for stability
+            self.wait_for_settle(3, label="open zones", condition=locator_visible(self.all_zones_button))
             print("✅ Zones button clicked successfully")
         except Exception as e:
             print(f"❌ Error clicking zones button: {e}")
@@ -54,7 +73,7 @@ class ZonesPage(BasePage):
         try:
             print("=== Clicking Bypassed Zones Button ===")
             self.click(self.bypassed_zones_button)
-            time.sleep(2)  # Increased wait time for stability
+            self.wait_for_settle(2, label="bypassed zones tab")
             print("✅ Bypassed zones button clicked successfully")
         except Exception as e:
             print(f"❌ Error clicking bypassed zones button: {e}")
@@ -65,7 +84,7 @@ class ZonesPage(BasePage):
         try:
             print("=== Clicking All Zones Button ===")
             self.click(self.all_zones_button)
-            time.sleep(3)  # Increased wait time for stability
+            self.wait_for_settle(3, label="all zones tab")
             print("✅ All zones button clicked successfully")
         except Exception as e:
             print(f"❌ Error clicking all zones button: {e}")
@@ -75,167 +94,219 @@ class ZonesPage(BasePage):
         """Verify that zones page elements are visible"""
         try:
             print("=== Verifying Zones Page Elements ===")
+
+            # All checks below are answered from a single page_source read
+            with self.snapshot():
+                # Check if active zones button is visible
+                active_visible = self.is_element_visible(self.active_zones_button, timeout=5)
+                print(f"Active zones button visible: {active_visible}")
             
-            # Check if active zones button is visible
-            active_visible = self.is_element_visible(self.active_zones_button, timeout=5)
-            print(f"Active zones button visible: {active_visible}")
-            
-            # Check if bypassed zones button is visible  
-            bypassed_visible = self.is_element_visible(self.bypassed_zones_button, timeout=5)
-            print(f"Bypassed zones button visible: {bypassed_visible}")
+                # Check if bypassed zones button is visible  
+                bypassed_visible = self.is_element_visible(self.bypassed_zones_button, timeout=5)
+                print(f"Bypassed zones button visible: {bypassed_visible}")
 
-            #check if zone 1 is bypassed (changed to "reset")
-            is_zone_1_bypassed = self.is_element_visible(self.zone_1_reset_btn, timeout=5)
-            print(f"Zone 1 bypassed: {is_zone_1_bypassed}")
+                #check if zone 1 is bypassed (changed to "reset")
+                is_zone_1_bypassed = self.is_element_visible(self.zone_1_reset_btn, timeout=5)
+                print(f"Zone 1 bypassed: {is_zone_1_bypassed}")
 
-            is_zone_2_bypassed = self.is_element_visible(self.zone_2_reset_btn, timeout=5)
-            print(f"Zone 2 bypassed: {is_zone_2_bypassed}")
+                is_zone_2_bypassed = self.is_element_visible(self.zone_2_reset_btn, timeout=5)
+                print(f"Zone 2 bypassed: {is_zone_2_bypassed}")
 
-            is_zone_3_bypassed = self.is_element_visible(self.zone_3_reset_btn, timeout=5)
-            print(f"Zone 3 bypassed: {is_zone_3_bypassed}")
+                is_zone_3_bypassed = self.is_element_visible(self.zone_3_reset_btn, timeout=5)
+                print(f"Zone 3 bypassed: {is_zone_3_bypassed}")
 
-            is_zone_4_bypassed = self.is_element_visible(self.zone_4_reset_btn, timeout=5)
-            print(f"Zone 4 bypassed: {is_zone_4_bypassed}") 
+                is_zone_4_bypassed = self.is_element_visible(self.zone_4_reset_btn, timeout=5)
+                print(f"Zone 4 bypassed: {is_zone_4_bypassed}") 
 
-            is_zone_5_bypassed = self.is_element_visible(self.zone_5_reset_btn, timeout=5)
-            print(f"Zone 5 bypassed: {is_zone_5_bypassed}")
+                is_zone_5_bypassed = self.is_element_visible(self.zone_5_reset_btn, timeout=5)
+                print(f"Zone 5 bypassed: {is_zone_5_bypassed}")
 
-            is_zone_6_bypassed = self.is_element_visible(self.zone_6_reset_btn, timeout=5)
-            print(f"Zone 6 bypassed: {is_zone_6_bypassed}")
+                is_zone_6_bypassed = self.is_element_visible(self.zone_6_reset_btn, timeout=5)
+                print(f"Zone 6 bypassed: {is_zone_6_bypassed}")
             
-            return active_visible and bypassed_visible and is_zone_1_bypassed and is_zone_2_bypassed and is_zone_3_bypassed and is_zone_4_bypassed and is_zone_5_bypassed and is_zone_6_bypassed
-        
-
-            #check if zones are bypassed
-            is_zone_1_bypassed = self.is_element_visible(self.zone_1_reset_btn, timeout=5)
-            print(f"Zone 1 bypassed: {is_zone_1_bypassed}")
+                return active_visible and bypassed_visible and is_zone_1_bypassed and is_zone_2_bypassed and is_zone_3_bypassed and is_zone_4_bypassed and is_zone_5_bypassed and is_zone_6_bypassed
 
-            is_zone_2_bypassed = self.is_element_visible(self.zone_2_reset_btn, timeout=5)
-            
         except Exception as e:
             print(f"❌ Error verifying zones page elements: {e}")
             return False
         
-    def bypass_zones(self):
-        """Bypass exactly 6 zones using a more reliable approach"""
-        print("=== Bypassing exactly 6 zones ===")
-        
-        try:
-            # Find all bypass buttons on the page
-            bypass_buttons = self.driver.find_elements(AppiumBy.XPATH, '//android.widget.Button[@content-desc="Bypass"]')
-            print(f"Found {len(bypass_buttons)} bypass buttons total")
-            
-            # Limit to exactly 6 zones
-            zones_to_bypass = min(len(bypass_buttons), 6)
-            print(f"Processing exactly {zones_to_bypass} zones (limited to 6)")
-            
-            # Click each bypass button in order, limited to 6
-            for i in range(zones_to_bypass):
-                try:
-                    print(f"Clicking zone {i+1}...")
-                    bypass_buttons[i].click()
-                    time.sleep(2)
-                    print(f"✅ Zone {i+1} bypassed successfully")
-                except Exception as e:
-                    print(f"❌ Error clicking zone {i+1}: {e}")
-                    continue
-            
-            print(f"✅ Successfully processed exactly {zones_to_bypass} zones")
-            
-        except Exception as e:
-            print(f"❌ Error in bypass_zones: {e}")
-            raise
-           
+    def bypass_zones(self, limit=None):
+        """
+        Bypass every zone in the list (or the first `limit` zones still active)
 
-    def verify_bypassed_zones_in_bypassed_tab(self):
-        """Verify if exactly 6 zones are bypassed in bypassed tab using a more reliable approach"""
-        print("=== Verifying exactly 6 bypassed zones in bypassed tab ===")
-        
-        # Debug: Find all elements with "Bypassed" content-desc
-        try:
-            all_bypassed_elements = self.driver.find_elements(AppiumBy.XPATH, '//*[@content-desc="Bypassed"]')
-            print(f"Found {len(all_bypassed_elements)} elements with 'Bypassed' content-desc")
-            for i, elem in enumerate(all_bypassed_elements):
-                try:
-                    bounds = elem.get_attribute('bounds')
-                    clickable = elem.get_attribute('clickable')
-                    print(f"  Element {i+1}: bounds={bounds}, clickable={clickable}")
-                except Exception as e:
-                    print(f"  Element {i+1}: Error getting attributes: {e}")
-        except Exception as e:
-            print(f"Error finding bypassed elements: {e}")
-        
-        # Click the bypassed tab
-        print("Clicking bypassed tab...")
+        Returns:
+            dict: {zone name: True if it now shows "Reset"} for each zone tapped
+        """
+        print("=== Bypassing zones ===")
+        results = self._toggle_zones("Bypass", "Reset", limit)
+        failed = [name for name, bypassed in results.items() if not bypassed]
+        print(f"✅ Bypassed {len(results) - len(failed)} of {len(results)} zones")
+        if failed:
+            print(f"❌ Still not bypassed: {', '.join(failed)}")
+        return results
+
+    def verify_bypassed_zones_in_bypassed_tab(self, limit=None):
+        """Verify that the bypassed tab lists zones and every one of them shows "Reset" """
+        print("=== Verifying bypassed zones in bypassed tab ===")
         self.click(self.bypassed_zones_button)
-        #time.sleep(2)
-        
-        try:
-            # Find all reset buttons on the page
-            reset_buttons = self.driver.find_elements(AppiumBy.XPATH, '//android.widget.Button[@content-desc="Reset"]')
-            print(f"Found {len(reset_buttons)} reset buttons in bypassed tab")
-            
-            # Limit to exactly 6 zones
-            zones_to_check = min(len(reset_buttons), 6)
-            print(f"Checking exactly {zones_to_check} zones (limited to 6)")
-            
-            # Check each reset button, limited to 6
-            zones_status = []
-            for i in range(zones_to_check):
-                try:
-                    is_visible = reset_buttons[i].is_displayed()
-                    print(f"Zone {i+1} shows in bypassed zones tab: {is_visible}")
-                    zones_status.append(is_visible)
-                except Exception as e:
-                    print(f"❌ Error checking zone {i+1}: {e}")
-                    zones_status.append(False)
-            
-            all_bypassed = all(zones_status) if zones_status else False
-            print(f"✅ All {zones_to_check} zones bypassed: {all_bypassed}")
-            return all_bypassed
-            
-        except Exception as e:
-            print(f"❌ Error in verify_bypassed_zones_in_bypassed_tab: {e}")
-            raise
-           
 
-    def reset_zones(self):
-        """Reset exactly 6 zones using a more reliable approach"""
-        print("=== Resetting exactly 6 zones ===")
-        
-        try:
-            # Keep resetting zones until no more reset buttons are found
-            zones_reset = 0
-            max_attempts = 6  # Limit to 6 zones maximum
-            
-            while zones_reset < max_attempts:
-                try:
-                    # Find all reset buttons on the page
-                    reset_buttons = self.driver.find_elements(AppiumBy.XPATH, '//android.widget.Button[@content-desc="Reset"]')
-                    print(f"Found {len(reset_buttons)} reset buttons available")
-                    
-                    if len(reset_buttons) == 0:
-                        print("No more reset buttons found - all zones have been reset")
-                        break
-                    
-                    # Click the first available reset button
-                    print(f"Resetting zone {zones_reset + 1}...")
-                    reset_buttons[0].click()
-                    time.sleep(2)
-                    print(f"✅ Zone {zones_reset + 1} reset successfully")
-                    zones_reset += 1
-                    
-                except Exception as e:
-                    print(f"❌ Error resetting zone {zones_reset + 1}: {e}")
-                    # If we get an error, try to refresh and continue
-                    time.sleep(1)
-                    continue
-            
-            print(f"✅ Successfully reset {zones_reset} zones")
-            
-        except Exception as e:
-            print(f"❌ Error in reset_zones: {e}")
-            raise
+        zones = self.read_zones(limit)
+        print(f"Found {len(zones)} zones in bypassed tab")
+        not_bypassed = [name for name, zone in zones.items() if not zone.bypassed]
+        for name in not_bypassed:
+            print(f"❌ {name} shows '{zones[name].action}' instead of 'Reset'")
+        all_bypassed = bool(zones) and not not_bypassed
+        print(f"✅ All {len(zones)} zones bypassed: {all_bypassed}")
+        return all_bypassed
+
+    def reset_zones(self, limit=None):
+        """
+        Reset every bypassed zone in the list (or the first `limit` of them)
+
+        Returns:
+            dict: {zone name: True if it now shows "Bypass"} for each zone tapped
+        """
+        print("=== Resetting zones ===")
+        results = self._toggle_zones("Reset", "Bypass", limit)
+        failed = [name for name, reset in results.items() if not reset]
+        print(f"✅ Reset {len(results) - len(failed)} of {len(results)} zones")
+        if failed:
+            print(f"❌ Still bypassed: {', '.join(failed)}")
+        return results
+
+    def visible_zones(self, snapshot):
+        """
+        Zone rows shown in one page source read
+
+        Returns:
+            dict: {zone name: ZoneState} in list order, for rows whose button is
+                inside the visible part of the list (not under the tab bar)
+        """
+        container = snapshot.find(*self.zone_list)
+        if container is None or not container.bounds:
+            return {zone.label: zone for zone in parse_zones(snapshot)}
+        return {zone.label: zone for zone in parse_zones(snapshot, container.bounds[1], container.bounds[3])}
+
+    def read_zones(self, limit=None):
+        """
+        Every zone in the list, scrolling once per screenful
+
+        Returns:
+            dict: {zone name: ZoneState}
+        """
+        zones = {}
+
+        def collect(snapshot, page):
+            zones.update(page)
+            return limit is not None and len(zones) >= limit
+
+        self._walk_zone_list(collect)
+        return dict(list(zones.items())[:limit]) if limit is not None else zones
+
+    def _walk_zone_list(self, visit):
+        """
+        Call visit(snapshot, zones) once per screenful of the list, top to bottom
+
+        zones holds only the rows not seen on an earlier screenful. The walk ends
+        when visit returns True or a scroll brings no new zone into view.
+        """
+        seen = set()
+        snapshot = self.current_snapshot(refresh=True)
+        while True:
+            page = {name: zone for name, zone in self.visible_zones(snapshot).items() if name not in seen}
+            if not page:
+                return
+            seen.update(page)
+            if visit(snapshot, page) or not self._scroll_zone_list(snapshot):
+                return
+            snapshot = self._settled_snapshot(1, "scroll zones")
+
+    def _scroll_zone_list(self, snapshot):
+        """Drag the list up by one screenful, slowly enough that it does not fling past rows"""
+        container = snapshot.find(*self.zone_list)
+        if container is None or not container.bounds:
+            return False
+        left, top, right, bottom = container.bounds
+        x = (left + right) // 2
+        finger = PointerInput(interaction.POINTER_TOUCH, "finger")
+        actions = ActionBuilder(self.driver, mouse=finger, duration=400)
+        actions.pointer_action.move_to_location(x, bottom - 20)
+        actions.pointer_action.pointer_down()
+        actions.pointer_action.move_to_location(x, top + 20)
+        actions.pointer_action.pause(0.2)  # Hold before lifting so the list stops where the finger did
+        actions.pointer_action.release()
+        actions.perform()
+        self.invalidate_snapshot()
+        return True
+
+    def _tap_all(self, zones):
+        """Tap the buttons of several zones in a single W3C action sequence (one HTTP round trip)"""
+        finger = PointerInput(interaction.POINTER_TOUCH, "finger")
+        actions = ActionBuilder(self.driver, mouse=finger, duration=0)
+        for zone in zones:
+            x, y = zone.center
+            actions.pointer_action.move_to_location(x, y)
+            actions.pointer_action.pointer_down()
+            actions.pointer_action.pause(0.05)
+            actions.pointer_action.pointer_up()
+            actions.pointer_action.pause(self.tap_interval)
+        actions.perform()
+        self.invalidate_snapshot()
+
+    def _settled_snapshot(self, baseline, label):
+        # Fixed settle mode sleeps without reading the screen
+        return self.wait_for_settle(baseline, label=label) or self.current_snapshot(refresh=True)
+
+    def _wait_for_zones(self, names, target, baseline, label):
+        """Read the screen until every zone in names offers `target`, or toggle_timeout runs out"""
+        def all_changed(snapshot):
+            zones = self.visible_zones(snapshot)
+            return all(name in zones and zones[name].action == target for name in names)
+
+        snapshot = self.wait_for_settle(baseline, label=label, condition=all_changed, timeout=self.toggle_timeout)
+        return snapshot or self.current_snapshot(refresh=True)
+
+    def _toggle_zones(self, current, target, limit=None, retries=1):
+        """
+        Tap every zone button offering `current` until it offers `target`
+
+        Per screenful of the list: one page source read, the taps as one batched
+        action, then reads until the panel has confirmed them all (at most
+        toggle_timeout). Only zones still offering `current` after that wait are
+        tapped again (up to `retries` times), so a slow answer is not undone by
+        a second tap.
+
+        Args:
+            current (str): Button label to act on, "Bypass" or "Reset"
+            target (str): Label the button shows once the zone changed
+            limit (int): Stop after this many zones (all zones when None)
+            retries (int): Extra batches for zones that did not change
+
+        Returns:
+            dict: {zone name: True if the zone now offers `target`} for each zone tapped
+        """
+        results = {}
+
+        def toggle(snapshot, page):
+            pending = [name for name, zone in page.items() if zone.action == current]
+            if limit is not None:
+                pending = pending[:limit - len(results)]
+            for attempt in range(retries + 1):
+                if not pending:
+                    break
+                if attempt:
+                    print(f"🔁 Tapping {len(pending)} zone(s) again: {', '.join(pending)}")
+                self._tap_all([page[name] for name in pending])
+                page = self.visible_zones(self._wait_for_zones(pending, target, 2 * len(pending),
+                                                               f"{current.lower()} zones"))
+                for name in pending:
+                    results[name] = name in page and page[name].action == target
+                pending = [name for name in pending
+                           if not results[name] and name in page and page[name].action == current]
+            return limit is not None and len(results) >= limit
+
+        self._walk_zone_list(toggle)
+        return results
 
     def search_zones(self, zone_name):
         """Search for a zone by name"""
@@ -243,7 +314,7 @@ class ZonesPage(BasePage):
         print(f"=== Searching for zone: {zone_name} ===")
         self.click(self.search_zones_field)
         self.type(self.search_zones_field, zone_name)
-        time.sleep(2)
+        self.wait_for_settle(2, label="search zones")
         print(f"✅ Successfully searched for zone: {zone_name}")
         
         
@@ -3,11 +3,17 @@
 Test runner script for Olarm mobile app upgrade tests with email reporting
 """
 
+import argparse
 import os
+import queue
+import re
+import shutil
 import sys
 import time
 import subprocess
 import logging
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -17,6 +23,10 @@ sys.path.insert(0, str(project_root))
 
 from utils.email_sender import EmailSender
 from config.email_config import get_email_config, validate_email_config
+from helpers.upgrade_matrix import MATRIX_RESULTS_DIR, clear_matrix_results, merge_matrix_results
+from utils.device_pool import get_device_pool
+from utils.allure_report import build_report
+from utils.result_stream import ResultCollector
 
 # Configure logging
 logging.basicConfig(
@@ -30,10 +40,27 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Suites of a nightly upgrade run; they run side by side, each on its own devices
+TEST_SUITES = [
+    ("in-place upgrade", "tests/test_upgrade_automation.py"),
+    ("clean installation", "tests/test_app_upgrade.py::TestAppUpgrade::test_upgrade_clean_installation"),
+]
+
+# Per-suite allure-results, upgrade matrix results and pytest log
+RUNS_DIR = project_root / "reports" / "runs"
+ALLURE_RESULTS_DIR = project_root / "reports" / "allure-results"
+REPORT_DIR = project_root / "reports" / "allure-report"
+
 class UpgradeTestRunner:
     """Test runner for upgrade tests with email reporting"""
     
-    def __init__(self):
+    def __init__(self, max_parallel=None):
+        """
+        Args:
+            max_parallel (int): Most suites running at once (default: one per suite,
+                limited by the attached devices)
+        """
+        self.max_parallel = max_parallel
         self.start_time = None
         self.end_time = None
         self.test_results = {
@@ -77,16 +104,12 @@ class UpgradeTestRunner:
         # Clean previous results
         self.clean_previous_results()
         
-        # Run in-place upgrade tests
-        logger.info("📋 Running in-place upgrade tests...")
-        inplace_results = self.run_test_suite("tests/test_upgrade_automation.py")
-        
-        # Run clean installation tests
-        logger.info("📋 Running clean installation tests...")
-        clean_results = self.run_test_suite("tests/test_app_upgrade.py::TestAppUpgrade::test_upgrade_clean_installation")
+        # Run the in-place upgrade and clean installation suites side by side
+        suite_results = self.run_suites(TEST_SUITES)
         
         # Combine results
-        self.test_results = self.combine_results(inplace_results, clean_results)
+        self.test_results = self.combine_results(*suite_results)
+        self.merge_suite_results()
         
         self.end_time = time.time()
         duration = self.end_time - self.start_time
@@ -104,95 +127,189 @@ class UpgradeTestRunner:
     
     def clean_previous_results(self):
         """Clean previous test results"""
-        allure_results_dir = "reports/allure-results"
-        if os.path.exists(allure_results_dir):
-            import shutil
-            shutil.rmtree(allure_results_dir)
-            logger.info("🧹 Cleaned previous allure-results")
+        for directory in (ALLURE_RESULTS_DIR, RUNS_DIR):
+            if directory.exists():
+                shutil.rmtree(directory)
+                logger.info(f"🧹 Cleaned previous {directory.name}")
+        
+        ALLURE_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    
+    def run_suites(self, suites):
+        """
+        Run suites concurrently, each in its own pytest process on its own devices
+        
+        The device pool is split into lanes (at most max_parallel, one per device
+        when there are fewer devices than suites). A suite takes a free lane, runs
+        on that lane's devices and Appium/systemPort range, and hands the lane to
+        the next suite when it finishes.
+        
+        Returns:
+            list: Result counts per suite, in the order given
+        """
+        devices = get_device_pool()
+        parallel = min(self.max_parallel or len(suites), len(suites))
+        # Without a known pool every suite would share the default device
+        parallel = max(1, min(parallel, len(devices))) if devices else 1
+        
+        share = len(devices) // parallel
+        lanes = queue.Queue()
+        for lane in range(parallel):
+            end = (lane + 1) * share if lane < parallel - 1 else len(devices)
+            lanes.put((lane, devices[lane * share:end]))
+        logger.info(f"📋 Running {len(suites)} suites, {parallel} at a time on {len(devices) or 'the default'} device(s)")
         
-        os.makedirs(allure_results_dir, exist_ok=True)
+        def run(suite):
+            name, test_path = suite
+            lane, lane_devices = lanes.get()
+            try:
+                return self.run_test_suite(test_path, name, lane_devices, slot_offset=lane * share)
+            finally:
+                lanes.put((lane, lane_devices))
+        
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="suite") as pool:
+            return list(pool.map(run, suites))
     
-    def run_test_suite(self, test_path):
-        """Run a specific test suite"""
+    def run_test_suite(self, test_path, name=None, devices=None, slot_offset=0):
+        """
+        Run a specific test suite, following its results as they stream in
+        
+        Args:
+            test_path (str): pytest node id or path
+            name (str): Suite name used in the log and its reports/runs/ directory
+            devices (list): Device serials the suite may use (xdist across them when more than one)
+            slot_offset (int): Port index offset so concurrent suites get their own Appium ports
+        """
+        name = name or test_path
+        run_dir = RUNS_DIR / re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_')
+        run_dir.mkdir(parents=True, exist_ok=True)
+        collector = ResultCollector(on_event=lambda event, collector: self.log_progress(event, collector, name))
         cmd = [
             sys.executable, "-m", "pytest",
             test_path,
             "-v",
-            "--alluredir=./reports/allure-results",
-            "--tb=short"
+            f"--alluredir={run_dir / 'allure-results'}",
+            "--tb=short",
+            "--result-stream", collector.address
         ]
         
-        logger.info(f"Running: {' '.join(cmd)}")
+        if devices:
+            cmd += ["--devices", ",".join(devices)]
+            if len(devices) > 1:
+                cmd += ["-n", str(len(devices))]
+        env = {
+            **os.environ,
+            "DEVICE_SLOT_OFFSET": str(slot_offset),
+            "UPGRADE_MATRIX_DIR": str(run_dir / "upgrade-matrix"),
+            "UPGRADE_MATRIX_REPORT": str(run_dir / "upgrade_matrix_report.json"),
+        }
+        
+        # pytest's console output goes straight to a log file; results come over the stream
+        log_path = run_dir / "pytest.log"
+        logger.info(f"[{name}] Running: {' '.join(cmd)}")
+        logger.info(f"[{name}] pytest output: {log_path.relative_to(project_root)}")
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=project_root
-            )
+            with open(log_path, "w") as log_file:
+                returncode = subprocess.run(cmd, stdout=log_file, stderr=subprocess.STDOUT,
+                                            cwd=project_root, env=env).returncode
+            collector.close()
             
-            # Parse results from output
-            results = self.parse_pytest_output(result.stdout)
+            if not collector.connected:
+                logger.error(f"[{name}] ❌ {test_path} exited ({returncode}) before reporting any results, see {log_path}")
+                return {'passed': 0, 'failed': 1, 'skipped': 0, 'total': 1}
             
-            if result.returncode == 0:
-                logger.info(f"✅ {test_path} completed successfully")
+            if returncode == 0:
+                logger.info(f"[{name}] ✅ {test_path} completed successfully")
             else:
-                logger.warning(f"⚠️ {test_path} had some failures")
+                logger.warning(f"[{name}] ⚠️ {test_path} had some failures")
             
-            return results
+            return collector.summary()
             
         except Exception as e:
-            logger.error(f"Failed to run {test_path}: {e}")
+            collector.close()
+            logger.error(f"Failed to run [{name}] {test_path}: {e}")
             return {'passed': 0, 'failed': 1, 'skipped': 0, 'total': 1}
     
-    def parse_pytest_output(self, output):
-        """Parse pytest output to extract test results"""
-        results = {'passed': 0, 'failed': 0, 'skipped': 0, 'total': 0}
-        
-        # Look for summary line like: "6 passed, 2 skipped, 1 warning in 269.05s"
-        import re
-        summary_pattern = r'(\d+) passed.*?(\d+) failed.*?(\d+) skipped'
-        match = re.search(summary_pattern, output)
-        
-        if match:
-            results['passed'] = int(match.group(1))
-            results['failed'] = int(match.group(2)) if match.group(2) else 0
-            results['skipped'] = int(match.group(3)) if match.group(3) else 0
-            results['total'] = results['passed'] + results['failed'] + results['skipped']
-        
-        return results
+    def log_progress(self, event, collector, name):
+        """Log each test as its result arrives"""
+        if event["event"] == "collected":
+            logger.info(f"[{name}] 🧪 {event['count']} tests collected")
+        elif event["event"] == "test_result":
+            icon = {'passed': '✅', 'skipped': '⏭️'}.get(event['outcome'], '❌')
+            done = collector.results['total']
+            total = collector.collected or '?'
+            worker = f" [{event['worker']}]" if event.get('worker') else ""
+            line = f"[{name}] {icon} [{done}/{total}] {event['outcome']} {event['nodeid']} ({event['duration']:.1f}s){worker}"
+            if event.get('message') and event['outcome'] != 'passed':
+                line += f" - {event['message']}"
+            logger.info(line)
     
-    def combine_results(self, results1, results2):
+    def combine_results(self, *suite_results):
         """Combine results from multiple test suites"""
         combined = {
-            'passed': results1.get('passed', 0) + results2.get('passed', 0),
-            'failed': results1.get('failed', 0) + results2.get('failed', 0),
-            'skipped': results1.get('skipped', 0) + results2.get('skipped', 0),
+            'passed': sum(results.get('passed', 0) for results in suite_results),
+            'failed': sum(results.get('failed', 0) for results in suite_results),
+            'skipped': sum(results.get('skipped', 0) for results in suite_results),
             'total': 0
         }
         combined['total'] = combined['passed'] + combined['failed'] + combined['skipped']
         return combined
     
+    def merge_suite_results(self):
+        """
+        Merge every suite's allure-results and upgrade matrix results into reports/
+        
+        The merged allure-results directory is built next to the live one and
+        swapped in with renames, so a reader (report generation, email) never
+        sees a half-merged directory.
+        """
+        if not RUNS_DIR.exists():
+            return
+        run_dirs = sorted(path for path in RUNS_DIR.iterdir() if path.is_dir())
+        
+        staging = ALLURE_RESULTS_DIR.with_name(f"{ALLURE_RESULTS_DIR.name}.{os.getpid()}.tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        merged = 0
+        for run_dir in run_dirs:
+            source = run_dir / "allure-results"
+            if not source.is_dir():
+                continue
+            for path in source.iterdir():
+                if not path.is_file():
+                    continue
+                # Allure names results by uuid; only shared files (e.g. environment.properties) can clash
+                target = staging / path.name
+                if target.exists():
+                    target = staging / f"{run_dir.name}-{path.name}"
+                shutil.copy2(path, target)
+                merged += 1
+        
+        previous = ALLURE_RESULTS_DIR.with_name(f"{ALLURE_RESULTS_DIR.name}.old")
+        shutil.rmtree(previous, ignore_errors=True)
+        if ALLURE_RESULTS_DIR.exists():
+            os.replace(ALLURE_RESULTS_DIR, previous)
+        os.replace(staging, ALLURE_RESULTS_DIR)
+        shutil.rmtree(previous, ignore_errors=True)
+        logger.info(f"📦 Merged {merged} allure result files from {len(run_dirs)} suites")
+        
+        clear_matrix_results()
+        for run_dir in run_dirs:
+            source = run_dir / "upgrade-matrix"
+            if source.is_dir():
+                os.makedirs(MATRIX_RESULTS_DIR, exist_ok=True)
+                for path in source.glob("*.json"):
+                    shutil.copy2(path, os.path.join(MATRIX_RESULTS_DIR, path.name))
+        merge_matrix_results()
+    
     def generate_allure_report(self):
-        """Generate Allure report"""
+        """Build the HTML report in-process; only results new since the last build are rendered"""
         logger.info("📊 Generating Allure report...")
         
-        cmd = [
-            "allure", "generate",
-            "./reports/allure-results",
-            "--clean",
-            "-o", "./reports/allure-report"
-        ]
-        
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
-            
-            if result.returncode == 0:
-                logger.info("✅ Allure report generated successfully")
-            else:
-                logger.error(f"Failed to generate Allure report: {result.stderr}")
-                
+            stats = build_report(str(ALLURE_RESULTS_DIR), str(REPORT_DIR))
+            logger.info(f"✅ Allure report generated successfully ({stats['rendered']} tests rendered, "
+                        f"{stats['reused']} reused in {stats['build_time']}s)")
         except Exception as e:
             logger.error(f"Failed to generate Allure report: {e}")
     
@@ -212,16 +329,15 @@ class UpgradeTestRunner:
             'duration': f"{duration:.2f} seconds"
         }
         
-        allure_results_dir = "reports/allure-results"
-        allure_report_dir = "reports/allure-report"
-        
-        if os.path.exists(allure_report_dir):
+        if REPORT_DIR.exists():
             success = self.email_sender.send_allure_report(
-                allure_results_dir,
-                allure_report_dir,
+                str(ALLURE_RESULTS_DIR),
+                str(REPORT_DIR),
                 test_summary
             )
             
+            self.email_sender.close()
+            
             if success:
                 logger.info("✅ Email report sent successfully")
             else:
@@ -231,13 +347,13 @@ class UpgradeTestRunner:
     
     def open_report(self):
         """Open Allure report in browser"""
-        report_dir = "reports/allure-report"
+        index = REPORT_DIR / "index.html"
         
-        if os.path.exists(report_dir):
+        if index.exists():
             logger.info("🌐 Opening Allure report in browser...")
             
             try:
-                subprocess.run(["allure", "open", report_dir], cwd=project_root)
+                webbrowser.open(index.as_uri())
             except Exception as e:
                 logger.error(f"Failed to open report: {e}")
         else:
@@ -249,7 +365,12 @@ def main():
     print("🚀 Olarm Mobile App Upgrade Test Runner")
     print("=" * 60)
     
-    runner = UpgradeTestRunner()
+    parser = argparse.ArgumentParser(description="Run the upgrade test suites and email the report")
+    parser.add_argument("--max-parallel", type=int, default=None,
+                        help="Most suites running at once (default: all, limited by the attached devices)")
+    args = parser.parse_args()
+    
+    runner = UpgradeTestRunner(max_parallel=args.max_parallel)
     
     try:
         # Run tests
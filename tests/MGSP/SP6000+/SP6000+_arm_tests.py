@@ -1,9 +1,14 @@
 import time
 
-from helpers.common_tests import select_device, first_login_btn, do_login, do_disarm
+import pytest
+
+from benchmarks import arm_latency
+from helpers.common_tests import do_disarm
+from helpers.navigator import go_to
 from pages.areas_page import AreasPage
 from pages.zones_page import ZonesPage
 from appium.webdriver.common.appiumby import AppiumBy
+from utils.screenshots import capture_screenshot
 
 
 def launch_olarm_app(driver):
@@ -66,86 +71,56 @@ def test_debug_app_launch(session_driver):
         print("❌ App may not be running properly")
     
     # Take a screenshot
-    try:
-        session_driver.save_screenshot("debug_app_launch.png")
-        print("📸 Screenshot saved: debug_app_launch.png")
-    except Exception as e:
-        print(f"⚠️ Could not take screenshot: {e}")
+    capture_screenshot(session_driver, "debug_app_launch")
 
 
 def test_stay_arm_disarm(session_driver):
     """First test: login -> stay arm -> disarm"""
-   # Launch the app first
-    launch_olarm_app(session_driver)
-    
-    # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except:
-        print("Already logged in, continuing...")
+    go_to(session_driver, "areas")
     
     page = AreasPage(session_driver)
     
     # Test Stay Arm cycle
     print("=== Testing Stay Arm Cycle ===")
     page.stay_arm()
-    info = page.get_area_info_by_label("Area 1")
-    assert info["status"] == "Stay Armed"  # Let's try the correct expectation
-    assert "•" in info["time"]  # More flexible - accepts "Now" or "X secs ago"
+    area = page.get_area_state("Area 1")
+    assert area.status == "Stay Armed"  # Let's try the correct expectation
+    assert "•" in area.timestamp  # More flexible - accepts "Now" or "X secs ago"
     time.sleep(2)
     
     # Disarm after stay arm
     do_disarm(session_driver)
     page = AreasPage(session_driver)
-    info = page.get_area_info_by_label("Area 1")
-    assert info["status"] == "Disarmed"
-    assert "•" in info["time"]  # More flexible - accepts "Now" or "X secs ago"
+    area = page.get_area_state("Area 1")
+    assert area.status == "Disarmed"
+    assert "•" in area.timestamp  # More flexible - accepts "Now" or "X secs ago"
     time.sleep(2)
 
 def test_sleep_arm_disarm(session_driver):
     """Second test: sleep arm -> disarm (continues same session)"""
-    # Launch the app first
-    launch_olarm_app(session_driver)
-       # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except:
-        print("Already logged in, continuing...")
+    go_to(session_driver, "areas")
     
     page = AreasPage(session_driver)
     
     # Test Sleep Arm cycle (same session)
     print("=== Testing Sleep Arm Cycle ===")
     page.sleep_arm()
-    info = page.get_area_info_by_label("Area 1")
-    assert info["status"] == "Sleep Armed"
-    assert "•" in info["time"]  # More flexible - accepts "Now" or "X secs ago"
+    area = page.get_area_state("Area 1")
+    assert area.status == "Sleep Armed"
+    assert "•" in area.timestamp  # More flexible - accepts "Now" or "X secs ago"
     #time.sleep(2)
     
     # Disarm after sleep arm
     do_disarm(session_driver)
     page = AreasPage(session_driver)
-    info = page.get_area_info_by_label("Area 1")
-    assert info["status"] == "Disarmed"
-    assert "•" in info["time"]  # More flexible - accepts "Now" or "X secs ago"
+    area = page.get_area_state("Area 1")
+    assert area.status == "Disarmed"
+    assert "•" in area.timestamp  # More flexible - accepts "Now" or "X secs ago"
    # time.sleep(2)
 
 def test_arm_disarm(session_driver):
     """Test: Arm -> Disarm"""
-    # Launch the app first
-    launch_olarm_app(session_driver)
-    
-    # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except:
-        print("Already logged in, continuing...")
+    go_to(session_driver, "areas")
     
     page = AreasPage(session_driver)
     
@@ -153,70 +128,52 @@ def test_arm_disarm(session_driver):
     print("=== Step 1: Clicking Arm Button ===")
     page.click(page.arm_button)
     time.sleep(3)
-    info = page.get_area_info_by_label("Area 1")
-    print(f"Status after Arm: {info['status']}")
-    assert "Armed" in info["status"]  # Should be "Armed""
-    assert "•" in info["time"]
+    area = page.get_area_state("Area 1")
+    print(f"Status after Arm: {area.status}")
+    assert "Armed" in area.status  # Should be "Armed""
+    assert "•" in area.timestamp
     
     # Step 2: Disarm
     do_disarm(session_driver)
     page = AreasPage(session_driver)
-    info = page.get_area_info_by_label("Area 1")
-    assert info["status"] == "Disarmed"
-    assert "•" in info["time"]  # More flexible - accepts "Now" or "X secs ago"
+    area = page.get_area_state("Area 1")
+    assert area.status == "Disarmed"
+    assert "•" in area.timestamp  # More flexible - accepts "Now" or "X secs ago"
    # time.sleep(2)
 
 def test_sleep_arm_to_stay_arm_to_arm(session_driver):
     """Test: Sleep Arm -> Stay Arm -> Arm"""
-    # Launch the app first
-    launch_olarm_app(session_driver)
-    
-    # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except:
-        print("Already logged in, continuing...")
+    go_to(session_driver, "areas")
     
     page = AreasPage(session_driver)
 
     # Step 1: Click "sleep arm" button 
     print("=== Sleep Arming ===")
     page.sleep_arm()
-    info = page.get_area_info_by_label("Area 1")
-    assert info["status"] == "Sleep Armed"
-    assert "•" in info["time"]  # More flexible - accepts "Now" or "X secs ago"
+    area = page.get_area_state("Area 1")
+    assert area.status == "Sleep Armed"
+    assert "•" in area.timestamp  # More flexible - accepts "Now" or "X secs ago"
     time.sleep(2)
 
     # Step 2: Click "stay arm" button 
     print("=== Stay Arming..")
     page.stay_arm()
-    info = page.get_area_info_by_label("Area 1")
-    assert info["status"] == "Stay Armed"
-    assert "•" in info["time"]  # More flexible - accepts "Now" or "X secs ago"
+    area = page.get_area_state("Area 1")
+    assert area.status == "Stay Armed"
+    assert "•" in area.timestamp  # More flexible - accepts "Now" or "X secs ago"
     
     # Step 3: Click "Arm" button 
     print("=== Step 1: Clicking Arm Button ===")
     page.click(page.arm_button)
     time.sleep(3)
-    info = page.get_area_info_by_label("Area 1")
-    print(f"Status after Arm: {info['status']}")
-    assert "Armed" in info["status"]  # Should be "Armed""
-    assert "•" in info["time"]
+    area = page.get_area_state("Area 1")
+    print(f"Status after Arm: {area.status}")
+    assert "Armed" in area.status  # Should be "Armed""
+    assert "•" in area.timestamp
 
 def test_arm_to_sleep_arm_without_disarm(session_driver):
     """Test: Arm -> Sleep Arm (no disarm between)"""
-    # Launch the app first
-    launch_olarm_app(session_driver)
-    
-    # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except:
-        print("Already logged in, continuing...")
+    go_to(session_driver, "areas")
     
     page = AreasPage(session_driver)
     
@@ -224,32 +181,23 @@ def test_arm_to_sleep_arm_without_disarm(session_driver):
     print("=== Step 1: Clicking Arm Button ===")
     page.click(page.arm_button)
     time.sleep(3)
-    info = page.get_area_info_by_label("Area 1")
-    print(f"Status after Arm: {info['status']}")
-    assert "Armed" in info["status"]  # Should be "Armed""
-    assert "•" in info["time"]
+    area = page.get_area_state("Area 1")
+    print(f"Status after Arm: {area.status}")
+    assert "Armed" in area.status  # Should be "Armed""
+    assert "•" in area.timestamp
     
     # Step 2: Click "Sleep Arm" button
     print("=== Step 2: Clicking Sleep Arm Button ===")
     page.sleep_arm()
     time.sleep(3)
-    info = page.get_area_info_by_label("Area 1")
-    print(f"Status after Sleep Arm: {info['status']}")
-    assert info["status"] == "Sleep Armed"
-    assert "•" in info["time"]
+    area = page.get_area_state("Area 1")
+    print(f"Status after Sleep Arm: {area.status}")
+    assert area.status == "Sleep Armed"
+    assert "•" in area.timestamp
 
 def test_arm_to_stay_arm_to_sleep_arm_without_disarm(session_driver):
     """Test: Arm -> Stay Arm -> Full Arm -> Sleep Arm (no disarm between)"""
-    # Launch the app first
-    launch_olarm_app(session_driver)
-    
-    # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except:
-        print("Already logged in, continuing...")
+    go_to(session_driver, "areas")
     
     page = AreasPage(session_driver)
     
@@ -257,38 +205,57 @@ def test_arm_to_stay_arm_to_sleep_arm_without_disarm(session_driver):
     print("=== Step 1: Clicking Arm Button ===")
     page.click(page.arm_button)
     time.sleep(3)
-    info = page.get_area_info_by_label("Area 1")
-    print(f"Status after Arm: {info['status']}")
-    assert "Armed" in info["status"]  # Should be "Armed""
-    assert "•" in info["time"]
+    area = page.get_area_state("Area 1")
+    print(f"Status after Arm: {area.status}")
+    assert "Armed" in area.status  # Should be "Armed""
+    assert "•" in area.timestamp
     
     # Step 2: Click "Stay Arm" button
     print("=== Step 2: Clicking Stay Arm Button ===")
     page.stay_arm()
     time.sleep(3)
-    info = page.get_area_info_by_label("Area 1")
-    print(f"Status after Stay Arm: {info['status']}")
-    assert info["status"] == "Stay Armed"
-    assert "•" in info["time"]
+    area = page.get_area_state("Area 1")
+    print(f"Status after Stay Arm: {area.status}")
+    assert area.status == "Stay Armed"
+    assert "•" in area.timestamp
     
     # Step 4: Click "Sleep Arm" button
     print("=== Step 4: Clicking Sleep Arm Button ===")
     page.sleep_arm()
     time.sleep(3)
-    info = page.get_area_info_by_label("Area 1")
-    print(f"Status after Sleep Arm: {info['status']}")
-    assert info["status"] == "Sleep Armed"
-    assert "•" in info["time"]
+    area = page.get_area_state("Area 1")
+    print(f"Status after Sleep Arm: {area.status}")
+    assert area.status == "Sleep Armed"
+    assert "•" in area.timestamp
 
     # lastly disarm
     do_disarm(session_driver)
     page = AreasPage(session_driver)
-    info = page.get_area_info_by_label("Area 1")
-    assert info["status"] == "Disarmed"
-    assert "•" in info["time"]
+    area = page.get_area_state("Area 1")
+    assert area.status == "Disarmed"
+    assert "•" in area.timestamp
     
     print("=== All arm cycles completed successfully! ===")
 
+
+def test_arm_state_latency(session_driver, request):
+    """Benchmark: time from each arm/disarm tap until Area 1 shows the new state"""
+    cycles = request.config.getoption("--arm-latency")
+    if not cycles:
+        pytest.skip("pass --arm-latency N to time N arm/disarm cycles")
+
+    go_to(session_driver, "areas")
+    source = arm_latency.AppStatusSource(session_driver, "Area 1")
+    report = arm_latency.run(source, cycles)
+    print(arm_latency.format_report(report))
+    arm_latency.append_trend(report, source=source.name, area=source.area)
+
+    # Leave the panel as the other tests expect it
+    if source.status() != "Disarmed":
+        do_disarm(session_driver)
+    missed = {name: stats["timeouts"] for name, stats in report["transitions"].items() if stats["timeouts"]}
+    assert not missed, f"❌ State not shown within the timeout: {missed}"
+
 def test_reset_app(driver_with_uninstall):
     # This test will uninstall the app after it runs
     pass
@@ -1,55 +1,12 @@
 import time
 
-from helpers.common_tests import select_device, first_login_btn, do_login, do_disarm
+from helpers.common_tests import do_disarm
+from helpers.navigator import go_to
 from pages.areas_page import AreasPage
 from pages.zones_page import ZonesPage
 from appium.webdriver.common.appiumby import AppiumBy
 
 
-def launch_olarm_app(driver):
-    """Launch the Olarm app from the home screen"""
-    try:
-        # First, try to launch the app directly using the app package
-        print("🚀 Attempting to launch Olarm app directly...")
-        driver.activate_app("com.olarm.olarm1")
-        time.sleep(5)  # Wait for app to launch
-        print("✅ Olarm app launched successfully using app package")
-        return True
-    except Exception as e:
-        print(f"❌ Failed to launch app directly: {e}")
-        
-        # Fallback: try to find and click the Olarm app icon
-        try:
-            print("🔍 Looking for Olarm app icon on home screen...")
-            
-            # Try different ways to find the Olarm app
-            olarm_selectors = [
-                (AppiumBy.XPATH, "//android.widget.TextView[@text='Olarm']"),
-                (AppiumBy.XPATH, "//*[@content-desc='Olarm']"),
-                (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Olarm")'),
-                (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("Olarm")'),
-            ]
-            
-            for selector_type, selector_value in olarm_selectors:
-                try:
-                    olarm_icon = driver.find_element(selector_type, selector_value)
-                    if olarm_icon.is_displayed():
-                        print(f"✅ Found Olarm app icon with selector: {selector_type}, {selector_value}")
-                        olarm_icon.click()
-                        time.sleep(5)  # Wait for app to launch
-                        print("✅ Olarm app launched successfully")
-                        return True
-                except Exception:
-                    continue
-            
-            print("❌ Could not find Olarm app icon on home screen")
-            return False
-            
-        except Exception as e2:
-            print(f"❌ Error looking for Olarm app icon: {e2}")
-            return False
-
-
 # def test_verify_if_zones_page_is_displayed(session_driver):
 #     """Test: Verify if zones page is displayed"""
 #     # Launch the app first
@@ -69,21 +26,13 @@ def launch_olarm_app(driver):
 #     assert page.is_element_visible(page.bypassed_zones_button)
 
 def test_bypass_zones(session_driver):
-    """Test: Bypass all 6 zones"""
-    # Launch the app first
-    launch_olarm_app(session_driver)
-    # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except:
-        print("Already logged in, continuing...")
+    """Test: Bypass all zones"""
+    go_to(session_driver, "zones")
     page = ZonesPage(session_driver)
-    page.click_zones()
     
     # Bypass all zones using the reliable approach
-    page.bypass_zones()
+    results = page.bypass_zones()
+    assert all(results.values()), f"Zones not bypassed: {[name for name, ok in results.items() if not ok]}"
     
     # Verify that zones are bypassed by checking for reset buttons
     try:
@@ -100,15 +49,7 @@ def test_bypass_zones(session_driver):
 
 def test_verify_bypassed_zones_in_bypassed_tab(session_driver):
     """Test: Verify if bypassed zones appear in bypassed tab"""
-    # Launch the app first
-    launch_olarm_app(session_driver)
-    # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except:
-        print("Already logged in, continuing...")
+    go_to(session_driver, "zones")
     page = ZonesPage(session_driver)
     page.click_bypassed_zones()
     
@@ -121,26 +62,18 @@ def test_verify_bypassed_zones_in_bypassed_tab(session_driver):
     result = page.verify_bypassed_zones_in_bypassed_tab()
     
     # Assert that all zones are bypassed
-    assert result, "All 6 zones should be bypassed and visible in the bypassed tab"
+    assert result, "All zones should be bypassed and visible in the bypassed tab"
 
 
 def test_reset_zones(session_driver):
-    """Test: Reset all 6 zones"""
-    # Launch the app first
-    launch_olarm_app(session_driver)
-    # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except: 
-        print("Already logged in, continuing...")
+    """Test: Reset all zones"""
+    go_to(session_driver, "zones")
     page = ZonesPage(session_driver)
-    page.click_zones()  # First navigate to zones page
     
     # Step 1: Bypass all zones
     print("=== Step 1: Bypassing all zones ===")
-    page.bypass_zones()
+    results = page.bypass_zones()
+    assert all(results.values()), f"Zones not bypassed: {[name for name, ok in results.items() if not ok]}"
     
     # Step 2: Go to "Bypassed" tab to verify zones are displayed there
     print("=== Step 2: Checking bypassed zones in Bypassed tab ===")
@@ -152,7 +85,8 @@ def test_reset_zones(session_driver):
     
     # Step 4: Reset all zones
     print("=== Step 4: Resetting all zones ===")
-    page.reset_zones()
+    results = page.reset_zones()
+    assert all(results.values()), f"Zones not reset: {[name for name, ok in results.items() if not ok]}"
     
     # Wait a moment for UI to update
     time.sleep(3)
@@ -210,17 +144,8 @@ def test_reset_zones(session_driver):
 
 def test_search_zones(session_driver):
     """Test: Search for a zone by name"""
-    # Launch the app first
-    launch_olarm_app(session_driver)
-    # Login and setup (if not already logged in)
-    try:
-        first_login_btn(session_driver)
-        do_login(session_driver)
-        select_device(session_driver)
-    except: 
-        print("Already logged in, continuing...")
+    go_to(session_driver, "zones")
     page = ZonesPage(session_driver)
-    page.click_zones()  # First navigate to zones page
 
     page = ZonesPage(session_driver)
     page.search_zones("Zone 06")
@@ -8,59 +8,32 @@ from pages.landing_page import LandingPage
 from helpers.common_tests import do_login, first_login_btn
 from utils.data_reader import read_test_data
 from config.capabilities import device_farm_config
+from config.app_versions import get_latest_version, get_upgrade_matrix, get_version_config
+from helpers.upgrade_matrix import matrix_result
+from utils.apk_registry import remove_app
+
+
+CLEAN_INSTALL_MATRIX = get_upgrade_matrix("clean_install")
 
 
 class TestAppUpgrade:
     """Test suite for app version upgrade scenarios"""
     
-    # Test data for different app versions
-    APP_VERSIONS = {
-        "1.6.6": {
-            "apk_path": "android/app/app-release-166-classic-tokens.apk",
-            "package_name": "com.olarm.olarm1"
-        },
-        "1.6.6-oauth": {
-            "apk_path": "android/app/app-release-166-oauth.apk",
-            "package_name": "com.olarm.olarm1"
-        },
-        "2.0.5": {
-            "apk_path": "android/app/app-v2.0.5.apk",
-            "package_name": "com.olarm.olarm1"
-        },
-        "2.0.6": {
-            "apk_path": "android/app/app-v2.0.6.apk", 
-            "package_name": "com.olarm.olarm1"
-        },
-        "2.0.7": {
-            "apk_path": "android/app/app-v2.0.7.apk",
-            "package_name": "com.olarm.olarm1"
-        },
-        "2.0.8": {
-            "apk_path": "android/app/app-v2.0.8.apk",
-            "package_name": "com.olarm.olarm1"
-        },
-        "2.0.9": {
-            "apk_path": "android/app/app-release.apk",  # Latest version
-            "package_name": "com.olarm.olarm1"
-        },
-
-    }
-    
     @pytest.fixture(scope="function")
     def setup_old_version(self, driver, request):
         """Setup fixture to install old version of the app"""
         old_version = request.param
-        app_config = self.APP_VERSIONS[old_version]
+        app_config = get_version_config(old_version)
         
         # Uninstall existing app if present
         try:
-            driver.remove_app(app_config["package_name"])
+            remove_app(driver, app_config["package_name"])
             print(f"✅ Uninstalled existing app version")
         except Exception as e:
             print(f"ℹ️ No existing app to uninstall: {e}")
         
         # Install old version
-        apk_path = os.path.join(os.getcwd(), app_config["apk_path"])
+        apk_path = app_config["apk_path"]
         if os.path.exists(apk_path):
             driver.install_app(apk_path)
             print(f"✅ Installed app version {old_version}")
@@ -71,7 +44,7 @@ class TestAppUpgrade:
         
         # Cleanup: uninstall app after test
         try:
-            driver.remove_app(app_config["package_name"])
+            remove_app(driver, app_config["package_name"])
             print(f"✅ Cleaned up app version {old_version}")
         except Exception as e:
             print(f"⚠️ Error during cleanup: {e}")
@@ -79,13 +52,13 @@ class TestAppUpgrade:
     @pytest.fixture(scope="function") 
     def setup_latest_version(self, driver):
         """Setup fixture to install latest version of the app"""
-        latest_config = self.APP_VERSIONS["2.0.9"]
+        latest_config = get_latest_version()
         
         # Install latest version
-        apk_path = os.path.join(os.getcwd(), latest_config["apk_path"])
+        apk_path = latest_config["apk_path"]
         if os.path.exists(apk_path):
             driver.install_app(apk_path)
-            print(f"✅ Installed latest app version (2.0.9 - app-release.apk)")
+            print(f"✅ Installed latest app version ({latest_config['version_name']} - app-release.apk)")
         else:
             pytest.skip(f"Latest APK file not found: {apk_path}")
         
@@ -93,7 +66,7 @@ class TestAppUpgrade:
         
         # Cleanup
         try:
-            driver.remove_app(latest_config["package_name"])
+            remove_app(driver, latest_config["package_name"])
             print(f"✅ Cleaned up latest app version")
         except Exception as e:
             print(f"⚠️ Error during cleanup: {e}")
@@ -181,37 +154,45 @@ class TestAppUpgrade:
         # For now, we'll create a placeholder test
         pytest.skip("Network interruption upgrade test requires additional setup")
     
-    @pytest.mark.parametrize("setup_old_version", ["1.6.6", "1.6.6-oauth", "2.0.5", "2.0.6", "2.0.7", "2.0.8"], indirect=True)
+    @pytest.mark.parametrize(
+        "setup_old_version",
+        [scenario["from_version"] for scenario in CLEAN_INSTALL_MATRIX],
+        ids=[scenario["name"] for scenario in CLEAN_INSTALL_MATRIX],
+        indirect=True
+    )
     def test_upgrade_clean_installation(self, setup_old_version, setup_latest_version):
         """
         Test clean installation (no previous login) upgrade scenarios
         """
         driver, old_version = setup_old_version
+        scenario = next(scenario for scenario in CLEAN_INSTALL_MATRIX if scenario["from_version"] == old_version)
         
-        print(f"\n🔄 Testing clean installation upgrade from {old_version} to 2.0.9 (app-release.apk)")
+        with matrix_result(scenario) as metrics:
+            start_time = time.time()
+            latest_config = get_latest_version()
+            print(f"\n🔄 Testing clean installation upgrade from {old_version} to {latest_config['version_name']} (app-release.apk)")
         
-        # Install latest version without logging in first
-        try:
-            driver.remove_app(self.APP_VERSIONS[old_version]["package_name"])
-            print(f"✅ Uninstalled version {old_version}")
+            # Install latest version without logging in first
+            try:
+                remove_app(driver, get_version_config(old_version)["package_name"])
+                print(f"✅ Uninstalled version {old_version}")
             
-            latest_config = self.APP_VERSIONS["2.0.9"]
-            apk_path = os.path.join(os.getcwd(), latest_config["apk_path"])
-            driver.install_app(apk_path)
-            print("✅ Installed latest version (2.0.9 - app-release.apk)")
+                driver.install_app(latest_config["apk_path"])
+                print(f"✅ Installed latest version ({latest_config['version_name']} - app-release.apk)")
             
-            driver.activate_app(latest_config["package_name"])
-            print("✅ Launched upgraded app")
+                driver.activate_app(latest_config["package_name"])
+                print("✅ Launched upgraded app")
             
-            # Verify app launches to landing screen (not logged in)
-            time.sleep(1.5)
-            from helpers.upgrade_helpers import UpgradeHelpers
-            upgrade_helper = UpgradeHelpers(driver)
-            assert upgrade_helper.verify_landing_screen(), "❌ App should show landing screen for clean install"
-            print("✅ Clean installation shows landing screen correctly")
+                # Verify app launches to landing screen (not logged in)
+                time.sleep(1.5)
+                from helpers.upgrade_helpers import UpgradeHelpers
+                upgrade_helper = UpgradeHelpers(driver)
+                assert upgrade_helper.verify_landing_screen(), "❌ App should show landing screen for clean install"
+                print("✅ Clean installation shows landing screen correctly")
             
-        except Exception as e:
-            pytest.fail(f"❌ Failed clean installation upgrade: {e}")
+            except Exception as e:
+                pytest.fail(f"❌ Failed clean installation upgrade: {e}")
+            metrics["total_time"] = time.time() - start_time
     
     def test_upgrade_performance(self, driver):
         """
@@ -25,9 +25,9 @@ def test_arming(driver):
     areas_page = AreasPage(driver)
     areas_page.arm_panel()
     time.sleep(1)
-    info = areas_page.get_area_info_by_label("Front Door")
-    assert info["status"] == "Armed"
-    assert "Now" in info["time"]
+    area = areas_page.get_area_state("Front Door")
+    assert area.status == "Armed"
+    assert "Now" in area.timestamp
 
 
 def test_disarming(driver):
@@ -37,9 +37,9 @@ def test_disarming(driver):
     areas_page.disarm_panel()
     time.sleep(15)  # Allow time for UI to reflect state change
 
-    info = areas_page.get_area_info_by_label("Front Door")
-    assert info["status"] == "Disarmed"
-    assert "Now" in info["time"]
+    area = areas_page.get_area_state("Front Door")
+    assert area.status == "Disarmed"
+    assert "Now" in area.timestamp
     time.sleep(3)
 
 # def test_logout(driver):
@@ -9,6 +9,7 @@ from pages.login_page import LoginPage
 from pages.landing_page import LandingPage
 from utils.data_reader import read_sql_injection_data
 from helpers.common_tests import first_login_btn
+from helpers.login_fuzz import LoginFuzzer, iter_payloads
 from appium.webdriver.common.appiumby import AppiumBy
 from appium.webdriver.appium_service import AppiumService
 
@@ -26,6 +27,24 @@ def test_sql_injection_login(driver, credentials):
     assert login_page.get_error_message() == "Please check your credentials and try again!"
 
 
+@pytest.mark.isolation("clear-data")
+def test_login_fuzzing(driver, session_pool, request):
+    count = request.config.getoption("--fuzz-login")
+    if not count:
+        pytest.skip("pass --fuzz-login N to fuzz the login form with N payloads")
+
+    def back_to_login(driver):
+        session_pool.reset_app(driver, "clear-data")
+        first_login_btn(driver)
+
+    first_login_btn(driver)
+    report = LoginFuzzer(driver, recover=back_to_login).run(iter_payloads(), limit=count)
+    print(report.summary())
+    assert not report.breaches, f"❌ Injection worked:\n{report.summary()}"
+    assert not report.anomalies and not report.unacknowledged, \
+        f"❌ Payloads left the login screen, failed or went unanswered:\n{report.summary()}"
+
+
 def test_reset_app(driver_with_uninstall):
     # This test will uninstall the app after it runs
     ...
@@ -10,9 +10,9 @@ def test_stay_arm(driver):
     select_device(driver)
     page = AreasPage(driver)
     page.stay_arm()
-    info = page.get_area_info_by_label("Front Door")
-    assert info["status"] == "Stay Armed"
-    assert "Now" in info["time"]
+    area = page.get_area_state("Front Door")
+    assert area.status == "Stay Armed"
+    assert "Now" in area.timestamp
     time.sleep(3)
 
 def test_sleep_arm(driver):
@@ -21,16 +21,16 @@ def test_sleep_arm(driver):
     #select_device(driver)
     page = AreasPage(driver)
     page.sleep_arm()
-    info = page.get_area_info_by_label("Front Door")
-    assert info["status"] == "Sleep Armed"
-    assert "Now" in info["time"]
+    area = page.get_area_state("Front Door")
+    assert area.status == "Sleep Armed"
+    assert "Now" in area.timestamp
 
 def test_disarm(driver):
     do_disarm(driver)
     page = AreasPage(driver)
-    info = page.get_area_info_by_label("Front Door")
-    assert info["status"] == "Disarmed"
-    assert "Now" in info["time"]
+    area = page.get_area_state("Front Door")
+    assert area.status == "Disarmed"
+    assert "Now" in area.timestamp
     time.sleep(30)
 
 def test_reset_app(driver_with_uninstall):
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def start_appium():
+    """Unit tests talk to no device, so they need no Appium server"""
+    yield
@@ -0,0 +1,160 @@
+import struct
+
+import pytest
+
+from utils.adb_client import AdbClient, AdbError, PersistentShell
+
+STDIN, STDOUT, STDERR, EXIT = 0, 1, 2, 3
+
+
+def packet(packet_id, payload):
+    return struct.pack("<BI", packet_id, len(payload)) + payload
+
+
+class FakeSocket:
+    """Socket that plays back scripted bytes in small reads and records what was sent"""
+
+    def __init__(self, incoming=b"", read_size=7):
+        self.incoming = bytearray(incoming)
+        self.read_size = read_size
+        self.sent = b""
+        self.closed = False
+
+    def sendall(self, data):
+        if self.closed:
+            raise OSError("socket is closed")
+        self.sent += data
+
+    def recv(self, size):
+        chunk = bytes(self.incoming[:min(size, self.read_size)])
+        del self.incoming[:len(chunk)]
+        return chunk
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    """open_service() hands out the queued sockets in order"""
+
+    def __init__(self, *sockets):
+        self.sockets = list(sockets)
+        self.services = []
+
+    def open_service(self, serial, service):
+        self.services.append((serial, service))
+        return self.sockets.pop(0)
+
+
+def done(shell, exit_code):
+    return f"\n{shell._marker} {exit_code}\n".encode()
+
+
+def stdin_packets(data):
+    packets = []
+    while data:
+        packet_id, length = struct.unpack("<BI", data[:5])
+        packets.append((packet_id, data[5:5 + length]))
+        data = data[5 + length:]
+    return packets
+
+
+def test_commands_are_sent_as_one_stdin_packet():
+    shell = PersistentShell(None, "emulator-5554")
+    sock = FakeSocket(packet(STDOUT, b"Success\n" + done(shell, 0) + done(shell, 0)))
+    shell.client = FakeClient(sock)
+
+    shell.run(["pm clear com.olarm.olarm1", "input keyevent 3"])
+
+    assert shell.client.services == [("emulator-5554", "shell,v2,raw:sh")]
+    (packet_id, script), = stdin_packets(sock.sent)
+    assert packet_id == STDIN
+    lines = script.decode().splitlines()
+    assert lines[0] == "{ pm clear com.olarm.olarm1"
+    assert lines[2] == "{ input keyevent 3"
+    assert script.decode().count(shell._marker) == 2
+
+
+def test_output_is_split_at_markers_across_packets():
+    shell = PersistentShell(None, "emulator-5554")
+    stream = b"Success\n" + done(shell, 0) + b"Error: unknown package\n" + done(shell, 1)
+    # Cut the stream so that both markers straddle packet boundaries
+    cut = [0, 11, 20, 38, 60, len(stream)]
+    packets = b"".join(packet(STDOUT, stream[start:end]) for start, end in zip(cut, cut[1:]))
+    shell.client = FakeClient(FakeSocket(packets))
+
+    cleared, missing = shell.run(["pm clear com.olarm.olarm1", "pm clear com.missing"])
+
+    assert (cleared.output, cleared.exit_code, cleared.ok) == ("Success\n", 0, True)
+    assert (missing.output, missing.exit_code, missing.ok) == ("Error: unknown package\n", 1, False)
+
+
+def test_stderr_packets_and_empty_output():
+    shell = PersistentShell(None, "emulator-5554")
+    packets = (packet(STDERR, b"sh: nope: not found\n") + packet(STDOUT, done(shell, 127))
+               + packet(STDOUT, done(shell, 0)))
+    shell.client = FakeClient(FakeSocket(packets))
+
+    missing, quiet = shell.run(["nope", "true"])
+
+    assert (missing.output, missing.exit_code) == ("sh: nope: not found\n", 127)
+    assert (quiet.output, quiet.exit_code) == ("", 0)
+
+
+def test_marker_text_inside_output_is_not_an_end_marker():
+    shell = PersistentShell(None, "emulator-5554")
+    echoed = f"prefix {shell._marker} 0\n".encode()
+    shell.client = FakeClient(FakeSocket(packet(STDOUT, echoed + done(shell, 0))))
+
+    result, = shell.run(["echo"])
+
+    assert result.output == echoed.decode()
+
+
+def test_output_after_a_marker_is_kept_for_the_next_run():
+    shell = PersistentShell(None, "emulator-5554")
+    shell.client = FakeClient(FakeSocket(packet(STDOUT, b"a\n" + done(shell, 0) + b"b\n" + done(shell, 0))))
+
+    first, = shell.run(["echo a"])
+    second, = shell.run(["echo b"])
+
+    assert (first.output, second.output) == ("a\n", "b\n")
+    assert len(shell.client.services) == 1
+
+
+def test_exited_shell_is_reopened_once():
+    shell = PersistentShell(None, "emulator-5554")
+    dropped = FakeSocket(packet(EXIT, b"\x00"))
+    fresh = FakeSocket(packet(STDOUT, b"Success\n" + done(shell, 0)))
+    shell.client = FakeClient(dropped, fresh)
+
+    result, = shell.run(["pm clear com.olarm.olarm1"])
+
+    assert dropped.closed
+    assert result.output == "Success\n"
+    assert len(shell.client.services) == 2
+
+
+def test_shell_that_keeps_exiting_raises():
+    shell = PersistentShell(FakeClient(FakeSocket(packet(EXIT, b"\x00")), FakeSocket(packet(EXIT, b"\x00"))),
+                            "emulator-5554")
+
+    with pytest.raises(AdbError, match="exited unexpectedly"):
+        shell.run(["pm clear com.olarm.olarm1"])
+    assert shell._sock is None
+
+
+def test_request_is_length_prefixed_and_accepts_okay():
+    sock = FakeSocket(b"OKAY")
+
+    AdbClient._request(sock, "host:transport:emulator-5554")
+
+    assert sock.sent == b"001chost:transport:emulator-5554"
+
+
+def test_request_failure_carries_the_server_message():
+    message = b"device 'emulator-5556' not found"
+    sock = FakeSocket(b"FAIL" + f"{len(message):04x}".encode() + message)
+
+    with pytest.raises(AdbError, match="host:transport:emulator-5556: device 'emulator-5556' not found"):
+        AdbClient._request(sock, "host:transport:emulator-5556")
@@ -0,0 +1,109 @@
+import email
+import io
+import socket
+import zipfile
+
+import pytest
+
+from utils.email_sender import EmailSender
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+
+
+class Inbox:
+    """aiosmtpd handler that keeps every message it receives"""
+
+    def __init__(self):
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append((envelope.rcpt_tos, email.message_from_bytes(envelope.content)))
+        return "250 Message accepted for delivery"
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    inbox = Inbox()
+    controller = aiosmtpd_controller.Controller(inbox, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    yield controller, inbox
+    controller.stop()
+
+
+@pytest.fixture
+def report(tmp_path):
+    report_dir = tmp_path / "allure-report"
+    (report_dir / "data").mkdir(parents=True)
+    (report_dir / "index.html").write_text("<html>report</html>")
+    (report_dir / "app.js").write_text("console.log('allure');" * 2000)
+    (report_dir / "styles.css").write_text("body {}")
+    (report_dir / "data" / "suites.json").write_text('{"children": []}')
+    return report_dir
+
+
+def make_sender(controller, **overrides):
+    config = {
+        "smtp_server": controller.hostname,
+        "smtp_port": controller.port,
+        "use_tls": False,
+        "sender_email": "runner@olarm.local",
+        "sender_password": "unused",
+        "recipient_email": "qa@olarm.local, dev@olarm.local",
+    }
+    config.update(overrides)
+    return EmailSender(config)
+
+
+def attachment(message):
+    for part in message.walk():
+        if part.get_filename():
+            return part.get_filename(), part.get_payload(decode=True)
+    return None
+
+
+def test_report_is_sent_whole_to_every_recipient(smtp_server, report, tmp_path):
+    controller, inbox = smtp_server
+    sender = make_sender(controller)
+    try:
+        assert sender.send_allure_report(str(tmp_path / "allure-results"), str(report),
+                                         {"passed": 3, "failed": 1, "skipped": 0})
+        # A second report goes over the same pooled connection and still carries every file
+        assert sender.send_allure_report(str(tmp_path / "allure-results"), str(report))
+    finally:
+        sender.close()
+
+    assert [recipients for recipients, _ in inbox.messages] == [["qa@olarm.local"], ["dev@olarm.local"]] * 2
+    for _, message in inbox.messages:
+        filename, payload = attachment(message)
+        assert filename == "allure-report.zip"
+        with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+            assert sorted(archive.namelist()) == ["app.js", "data/suites.json", "index.html", "styles.css"]
+            assert archive.read("app.js") == (report / "app.js").read_bytes()
+    assert "3 passed, 1 failed" in str(email.header.make_header(email.header.decode_header(
+        inbox.messages[0][1]["Subject"])))
+
+
+def test_oversized_report_sends_a_summary(smtp_server, report, tmp_path):
+    controller, inbox = smtp_server
+    results = tmp_path / "allure-results"
+    results.mkdir()
+    (results / "1-result.json").write_text(
+        '{"name": "test_upgrade", "status": "failed", "statusDetails": {"message": "Version mismatch"}}')
+    sender = make_sender(controller, recipient_email="qa@olarm.local", max_attachment_mb=0.0001)
+    try:
+        assert sender.send_allure_report(str(results), str(report))
+    finally:
+        sender.close()
+
+    (_, message), = inbox.messages
+    filename, payload = attachment(message)
+    assert filename == "report-summary.html"
+    assert payload == b"<html>report</html>"
+    body = next(part for part in message.walk() if part.get_content_type() == "text/plain")
+    assert "test_upgrade: Version mismatch" in body.get_payload(decode=True).decode()
@@ -0,0 +1,336 @@
+"""
+ADB client speaking the adb server protocol over sockets
+
+Running "adb -s <serial> shell ..." starts a new adb process per call. Over an
+upgrade run that adds up to hundreds of process spawns. This client talks
+straight to the local adb server (tcp:5037) and keeps one persistent shell per
+device. Commands go down that shell's stdin and their output is split back out
+with per-command end markers, so several commands can share one round trip:
+
+    device = adb_device("emulator-5554")
+    device.pm_clear("com.olarm.olarm1")
+    device.dumpsys_package("com.olarm.olarm1").version_name
+"""
+
+import os
+import re
+import shlex
+import socket
+import struct
+import subprocess
+import threading
+import uuid
+
+ADB_HOST = os.getenv("ADB_SERVER_HOST", "127.0.0.1")
+ADB_PORT = int(os.getenv("ANDROID_ADB_SERVER_PORT", "5037"))
+
+# Shell protocol v2 packet ids
+_SHELL_STDIN = 0
+_SHELL_STDOUT = 1
+_SHELL_STDERR = 2
+_SHELL_EXIT = 3
+_SHELL_CLOSE_STDIN = 4
+
+
+class AdbError(Exception):
+    """Raised when the adb server or the device refuses a request"""
+
+
+class ShellResult:
+    """Output and exit code of one shell command"""
+
+    __slots__ = ("command", "output", "exit_code")
+
+    def __init__(self, command, output, exit_code):
+        self.command = command
+        self.output = output
+        self.exit_code = exit_code
+
+    @property
+    def ok(self):
+        return self.exit_code == 0
+
+    def __repr__(self):
+        return f"ShellResult({self.command!r}, exit_code={self.exit_code})"
+
+
+class PackageInfo:
+    """Installed package state from "dumpsys package" """
+
+    __slots__ = ("package", "version_code", "version_name", "first_install_time", "last_update_time")
+
+    def __init__(self, package, version_code, version_name, first_install_time, last_update_time):
+        self.package = package
+        self.version_code = version_code
+        self.version_name = version_name
+        self.first_install_time = first_install_time
+        self.last_update_time = last_update_time
+
+    @classmethod
+    def parse(cls, package, output):
+        """Build from dumpsys output, or return None if the package is not installed"""
+        version_code = re.search(r"versionCode=(\d+)", output)
+        if not version_code:
+            return None
+
+        def field(name):
+            match = re.search(rf"{name}=(.+)", output)
+            return match.group(1).strip() if match else None
+
+        version_name = re.search(r"versionName=(\S+)", output)
+        return cls(
+            package,
+            int(version_code.group(1)),
+            version_name.group(1) if version_name else None,
+            field("firstInstallTime"),
+            field("lastUpdateTime"),
+        )
+
+
+def _recv_exactly(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise AdbError("adb connection closed unexpectedly")
+        data += chunk
+    return bytes(data)
+
+
+def _recv_all(sock):
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+class AdbClient:
+    """Connection factory for the local adb server"""
+
+    def __init__(self, host=ADB_HOST, port=ADB_PORT, timeout=60):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._server_started = False
+
+    def _connect(self):
+        try:
+            return socket.create_connection((self.host, self.port), timeout=self.timeout)
+        except ConnectionRefusedError:
+            if self._server_started:
+                raise AdbError(f"adb server is not listening on {self.host}:{self.port}")
+            # The only process spawn left: bring the server up once, as the adb CLI would
+            subprocess.run(["adb", "start-server"], capture_output=True, timeout=30)
+            self._server_started = True
+            return self._connect()
+
+    @staticmethod
+    def _request(sock, payload):
+        data = payload.encode()
+        sock.sendall(f"{len(data):04x}".encode() + data)
+        status = _recv_exactly(sock, 4)
+        if status == b"OKAY":
+            return
+        if status == b"FAIL":
+            length = int(_recv_exactly(sock, 4), 16)
+            raise AdbError(f"{payload}: {_recv_exactly(sock, length).decode(errors='replace')}")
+        raise AdbError(f"{payload}: unexpected adb response {status!r}")
+
+    def devices(self):
+        """
+        Serials of devices in the "device" state (unauthorized/offline are skipped)
+
+        Returns:
+            list: Device serials
+        """
+        with self._connect() as sock:
+            self._request(sock, "host:devices")
+            length = int(_recv_exactly(sock, 4), 16)
+            listing = _recv_exactly(sock, length).decode()
+
+        devices = []
+        for line in listing.splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[1] == "device":
+                devices.append(parts[0])
+        return devices
+
+    def open_service(self, serial, service):
+        """
+        Open a socket to a device service, e.g. "shell,v2,raw:sh"
+
+        Args:
+            serial (str): Device serial (None = the only attached device)
+            service (str): adb device service request
+
+        Returns:
+            socket.socket: Connected socket; the caller owns and closes it
+        """
+        sock = self._connect()
+        try:
+            self._request(sock, f"host:transport:{serial}" if serial else "host:transport-any")
+            self._request(sock, service)
+        except Exception:
+            sock.close()
+            raise
+        return sock
+
+
+class PersistentShell:
+    """One long-lived "sh" on the device; commands are written to its stdin"""
+
+    def __init__(self, client, serial):
+        self.client = client
+        self.serial = serial
+        self._marker = f"__adb_done_{uuid.uuid4().hex}__"
+        self._lock = threading.Lock()
+        self._sock = None
+        self._buffer = b""
+
+    def _open(self):
+        self._sock = self.client.open_service(self.serial, "shell,v2,raw:sh")
+        self._buffer = b""
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._sock.sendall(struct.pack("<BI", _SHELL_CLOSE_STDIN, 0))
+            except OSError:
+                pass
+            self._sock.close()
+            self._sock = None
+
+    def _read_packet(self):
+        packet_id, length = struct.unpack("<BI", _recv_exactly(self._sock, 5))
+        return packet_id, _recv_exactly(self._sock, length)
+
+    def _read_until_marker(self):
+        pattern = re.compile(rb"(?:^|\n)" + re.escape(self._marker.encode()) + rb" (\d+)\n")
+        while True:
+            match = pattern.search(self._buffer)
+            if match:
+                output = self._buffer[:match.start()]
+                self._buffer = self._buffer[match.end():]
+                return output.decode(errors="replace"), int(match.group(1))
+
+            packet_id, payload = self._read_packet()
+            if packet_id == _SHELL_EXIT:
+                raise AdbError(f"Shell on {self.serial} exited unexpectedly")
+            if packet_id in (_SHELL_STDOUT, _SHELL_STDERR):
+                self._buffer += payload
+
+    def run(self, commands):
+        """
+        Run commands in one round trip
+
+        Args:
+            commands (list): Shell command strings
+
+        Returns:
+            list: ShellResult per command, in order
+        """
+        script = "".join(f"{{ {command}\n}} 2>&1; printf '\\n%s %s\\n' {self._marker} $?\n" for command in commands)
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._sock is None:
+                        self._open()
+                    payload = script.encode()
+                    self._sock.sendall(struct.pack("<BI", _SHELL_STDIN, len(payload)) + payload)
+                    results = []
+                    for command in commands:
+                        output, exit_code = self._read_until_marker()
+                        results.append(ShellResult(command, output, exit_code))
+                    return results
+                except (OSError, AdbError):
+                    # A dropped shell (device reboot, adb restart) is reopened once
+                    self.close()
+                    if attempt:
+                        raise
+
+
+class AdbDevice:
+    """Typed adb operations for one device"""
+
+    def __init__(self, serial, client=None):
+        self.serial = serial
+        self.client = client or default_client
+        self._shell = PersistentShell(self.client, serial)
+        self._legacy_shell = False
+
+    def close(self):
+        self._shell.close()
+
+    def _legacy_run(self, command):
+        with self.client.open_service(self.serial, f"shell:{command} 2>&1; echo $?") as sock:
+            output = _recv_all(sock).decode(errors="replace").replace("\r\n", "\n").rstrip("\n")
+        output, _, exit_code = output.rpartition("\n")
+        return ShellResult(command, output, int(exit_code) if exit_code.isdigit() else -1)
+
+    def shell(self, command):
+        """Run one shell command and return its ShellResult"""
+        if not self._legacy_shell:
+            try:
+                return self._shell.run([command])[0]
+            except AdbError as e:
+                if not str(e).startswith("shell,v2"):
+                    raise
+                # Devices older than Android 7 have no shell protocol v2
+                self._legacy_shell = True
+        return self._legacy_run(command)
+
+    def pm_clear(self, package_name):
+        """Wipe an app's data; returns True on "Success" """
+        result = self.shell(f"pm clear {shlex.quote(package_name)}")
+        return result.ok and "Success" in result.output
+
+    def dumpsys_package(self, package_name):
+        """
+        Installed state of a package
+
+        Returns:
+            PackageInfo: Or None if the package is not installed
+        """
+        result = self.shell(f"dumpsys package {shlex.quote(package_name)}")
+        return PackageInfo.parse(package_name, result.output)
+
+
+default_client = AdbClient()
+_devices = {}
+_devices_lock = threading.Lock()
+
+
+def adb_device(serial):
+    """Shared AdbDevice for a serial; its persistent shell is reused by every caller"""
+    with _devices_lock:
+        device = _devices.get(serial)
+        if device is None:
+            device = _devices[serial] = AdbDevice(serial)
+        return device
+
+
+def device_serial(driver):
+    """
+    Serial of the device an Appium session runs on
+
+    Uses the udid the session resolved, then the requested udid, then the only
+    device attached to adb.
+    """
+    for capabilities in (getattr(driver, "capabilities", None), getattr(driver, "desired_capabilities", None)):
+        if capabilities:
+            serial = capabilities.get("deviceUDID") or capabilities.get("udid") or capabilities.get("appium:udid")
+            if serial:
+                return serial
+    devices = default_client.devices()
+    if len(devices) == 1:
+        return devices[0]
+    raise AdbError(f"Cannot tell which device the session runs on (attached: {devices})")
+
+
+def close_all():
+    with _devices_lock:
+        for device in _devices.values():
+            device.close()
+        _devices.clear()
@@ -0,0 +1,382 @@
+"""
+Static HTML report built in-process from allure-results (no Allure CLI / JVM)
+
+    python -m utils.allure_report [results_dir] [report_dir]
+
+The builder keeps a cache in <report>/data/cache.json keyed by each result
+file's size and mtime. On the next build, only new or changed results are
+parsed, their attachments copied and their test pages rendered. Pages and
+attachments of results that have gone away are removed. The index (summary, trend, tests by
+suite) is small and is always rewritten.
+
+History survives between builds in <report>/history/:
+  * history-trend.json: status counts per run (the last HISTORY_LIMIT runs), in
+    the same shape the Allure CLI uses;
+  * history.json: recent statuses per test historyId, for the "last runs" column.
+"""
+
+import html
+import json
+import os
+import shutil
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "reports", "allure-results")
+REPORT_DIR = os.path.join(PROJECT_ROOT, "reports", "allure-report")
+
+HISTORY_LIMIT = 20
+STATUSES = ("passed", "failed", "broken", "skipped", "unknown")
+_COLORS = {"passed": "#97cc64", "failed": "#fd5a3e", "broken": "#ffd050", "skipped": "#aaaaaa", "unknown": "#d35ebe"}
+
+_STYLE = """
+body{font:14px/1.4 -apple-system,Segoe UI,Roboto,sans-serif;margin:24px;color:#222}
+h1{font-size:22px}h2{font-size:17px;margin-top:28px}
+table{border-collapse:collapse;width:100%}td,th{padding:4px 8px;border-bottom:1px solid #eee;text-align:left;vertical-align:top}
+.badge{display:inline-block;min-width:56px;padding:1px 6px;border-radius:3px;color:#fff;font-size:12px;text-align:center}
+.passed{background:#97cc64}.failed{background:#fd5a3e}.broken{background:#ffd050;color:#222}
+.skipped{background:#aaa}.unknown{background:#d35ebe}
+.dot{display:inline-block;width:9px;height:9px;border-radius:50%;margin-right:2px}
+pre{background:#f6f6f6;padding:8px;overflow:auto;font-size:12px}
+.muted{color:#888}a{color:#2a62bc;text-decoration:none}
+"""
+
+
+def _escape(value):
+    return html.escape(str(value if value is not None else ""))
+
+
+def _duration(ms):
+    if ms is None:
+        return "-"
+    seconds = ms / 1000
+    return f"{seconds:.1f}s" if seconds < 60 else f"{int(seconds // 60)}m {seconds % 60:.0f}s"
+
+
+def _page(title, body):
+    return (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{_escape(title)}</title>"
+            f"<style>{_STYLE}</style></head><body>{body}</body></html>")
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def _read_json(path, default):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _flatten_steps(steps, depth=0):
+    rows = []
+    for step in steps or []:
+        start, stop = step.get("start"), step.get("stop")
+        rows.append({
+            "name": step.get("name", ""),
+            "status": step.get("status", "unknown"),
+            "duration": stop - start if start is not None and stop is not None else None,
+            "depth": depth,
+            "attachments": step.get("attachments", []),
+        })
+        rows += _flatten_steps(step.get("steps"), depth + 1)
+    return rows
+
+
+def parse_result(path):
+    """
+    Read one <uuid>-result.json into the record the report renders
+
+    Returns:
+        dict: name, status, suite, duration, message, steps, attachments, ...
+    """
+    with open(path, encoding="utf-8") as f:
+        result = json.load(f)
+    labels = {}
+    for label in result.get("labels", []):
+        labels.setdefault(label.get("name"), label.get("value"))
+    start, stop = result.get("start"), result.get("stop")
+    steps = _flatten_steps(result.get("steps"))
+    attachments = list(result.get("attachments", []))
+    for step in steps:
+        attachments += step["attachments"]
+    details = result.get("statusDetails") or {}
+    uuid = result.get("uuid") or os.path.basename(path).split("-result")[0]
+    return {
+        "uuid": uuid,
+        "history_id": result.get("historyId") or result.get("fullName") or uuid,
+        "name": result.get("name", uuid),
+        "full_name": result.get("fullName", ""),
+        "status": result.get("status", "unknown") if result.get("status") in STATUSES else "unknown",
+        "message": details.get("message"),
+        "trace": details.get("trace"),
+        "start": start,
+        "stop": stop,
+        "duration": stop - start if start is not None and stop is not None else None,
+        "suite": labels.get("suite") or labels.get("parentSuite") or labels.get("package") or "Tests",
+        "labels": labels,
+        "parameters": result.get("parameters", []),
+        "steps": steps,
+        "attachments": attachments,
+        "page": f"tests/{uuid}.html",
+    }
+
+
+def _attachment_names(record):
+    """File names under data/attachments/ that a record's page links to"""
+    return {os.path.basename(attachment["source"]) for attachment in record["attachments"]
+            if attachment.get("source")}
+
+
+class AllureReportBuilder:
+    """Incremental allure-results -> static HTML report"""
+
+    def __init__(self, results_dir=RESULTS_DIR, report_dir=REPORT_DIR, history_limit=HISTORY_LIMIT):
+        self.results_dir = results_dir
+        self.report_dir = report_dir
+        self.history_limit = history_limit
+        self.cache_path = os.path.join(report_dir, "data", "cache.json")
+
+    def build(self):
+        """
+        Bring the report up to date with the results directory
+
+        Returns:
+            dict: summary counts plus how many test pages were rendered/reused/removed
+        """
+        started = time.time()
+        cache = _read_json(self.cache_path, {})
+        records, new_cache = [], {}
+        rendered = reused = 0
+
+        names = sorted(name for name in os.listdir(self.results_dir)
+                       if name.endswith("-result.json")) if os.path.isdir(self.results_dir) else []
+        for name in names:
+            path = os.path.join(self.results_dir, name)
+            stat = os.stat(path)
+            signature = [stat.st_size, stat.st_mtime_ns]
+            entry = cache.get(name)
+            if entry and entry["signature"] == signature and os.path.exists(
+                    os.path.join(self.report_dir, entry["record"]["page"])):
+                record = entry["record"]
+                reused += 1
+            else:
+                try:
+                    record = parse_result(path)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Skipping unreadable result {name}: {e}")
+                    continue
+                self._copy_attachments(record)
+                _write(os.path.join(self.report_dir, record["page"]), self._render_test(record))
+                rendered += 1
+            new_cache[name] = {"signature": signature, "record": record}
+            records.append(record)
+
+        removed = 0
+        kept_pages = {entry["record"]["page"] for entry in new_cache.values()}
+        kept_attachments = {name for entry in new_cache.values() for name in _attachment_names(entry["record"])}
+        attachments_dir = os.path.join(self.report_dir, "data", "attachments")
+        for name, entry in cache.items():
+            page = entry["record"]["page"]
+            if name not in new_cache and page not in kept_pages:
+                try:
+                    os.remove(os.path.join(self.report_dir, page))
+                    removed += 1
+                except OSError:
+                    pass
+            # Also covers a result rewritten with different attachments
+            for attachment in _attachment_names(entry["record"]) - kept_attachments:
+                try:
+                    os.remove(os.path.join(attachments_dir, attachment))
+                except OSError:
+                    pass
+
+        trend, history = self._update_history(records)
+        summary = self._summary(records)
+        _write(os.path.join(self.report_dir, "index.html"), self._render_index(records, summary, trend, history))
+        _write(os.path.join(self.report_dir, "widgets", "summary.json"), json.dumps(summary, indent=2))
+        _write(self.cache_path, json.dumps(new_cache))
+
+        stats = {**summary, "rendered": rendered, "reused": reused, "removed": removed,
+                 "build_time": round(time.time() - started, 3)}
+        print(f"📊 Report: {summary['total']} tests, {rendered} pages rendered, {reused} reused, "
+              f"{removed} removed in {stats['build_time']}s -> {os.path.join(self.report_dir, 'index.html')}")
+        return stats
+
+    def _copy_attachments(self, record):
+        target_dir = os.path.join(self.report_dir, "data", "attachments")
+        os.makedirs(target_dir, exist_ok=True)
+        for attachment in record["attachments"]:
+            source = os.path.join(self.results_dir, attachment.get("source", ""))
+            target = os.path.join(target_dir, os.path.basename(attachment.get("source", "")))
+            if not os.path.isfile(source):
+                continue
+            if os.path.exists(target) and os.path.getsize(target) == os.path.getsize(source):
+                continue  # attachment names are uuids, so same name + size is the same file
+            shutil.copy2(source, target)
+
+    # -- history ------------------------------------------------------------
+
+    def _update_history(self, records):
+        history_dir = os.path.join(self.report_dir, "history")
+        trend_path = os.path.join(history_dir, "history-trend.json")
+        history_path = os.path.join(history_dir, "history.json")
+        trend = _read_json(trend_path, [])
+        history = _read_json(history_path, {})
+        if not records:
+            return trend, history
+
+        # A run is identified by when it started; rebuilding while results of the
+        # same run keep arriving updates its entries instead of adding new ones
+        run_id = min(record["start"] or 0 for record in records)
+        counts = {status: 0 for status in STATUSES}
+        for record in records:
+            counts[record["status"]] += 1
+        counts["total"] = len(records)
+        entry = {"buildOrder": run_id, "reportName": time.strftime("%Y-%m-%d %H:%M"), "data": counts}
+        if trend and trend[0].get("buildOrder") == run_id:
+            trend[0] = entry
+        else:
+            trend.insert(0, entry)
+        for record in records:
+            items = history.setdefault(record["history_id"], {"items": []})["items"]
+            item = {"uid": record["uuid"], "run": run_id, "status": record["status"],
+                    "time": {"start": record["start"], "stop": record["stop"], "duration": record["duration"]}}
+            if items and items[0].get("run") == run_id:
+                items[0] = item
+            else:
+                items.insert(0, item)
+            del items[self.history_limit:]
+        del trend[self.history_limit:]
+
+        _write(trend_path, json.dumps(trend))
+        _write(history_path, json.dumps(history))
+        return trend, history
+
+    # -- rendering ----------------------------------------------------------
+
+    @staticmethod
+    def _summary(records):
+        counts = {status: sum(1 for record in records if record["status"] == status) for status in STATUSES}
+        starts = [record["start"] for record in records if record["start"]]
+        stops = [record["stop"] for record in records if record["stop"]]
+        return {
+            "total": len(records),
+            "statistic": counts,
+            "time": {"start": min(starts) if starts else None, "stop": max(stops) if stops else None,
+                     "duration": max(stops) - min(starts) if starts and stops else None},
+        }
+
+    @staticmethod
+    def _trend_svg(trend):
+        runs = list(reversed(trend))
+        if not runs:
+            return ""
+        width, height, bar = 24 * len(runs), 90, 18
+        peak = max(run["data"].get("total", 0) for run in runs) or 1
+        shapes = []
+        for index, run in enumerate(runs):
+            y = height
+            for status in STATUSES:
+                count = run["data"].get(status, 0)
+                if not count:
+                    continue
+                size = count / peak * (height - 10)
+                y -= size
+                shapes.append(f"<rect x='{index * 24 + 3}' y='{y:.1f}' width='{bar}' height='{size:.1f}' "
+                              f"fill='{_COLORS[status]}'><title>{_escape(run.get('reportName'))}: "
+                              f"{count} {status}</title></rect>")
+        return f"<svg width='{width}' height='{height}'>{''.join(shapes)}</svg>"
+
+    def _render_index(self, records, summary, trend, history):
+        counts = summary["statistic"]
+        parts = [f"<h1>Test report</h1><p class='muted'>Built {time.strftime('%Y-%m-%d %H:%M:%S')} - "
+                 f"{summary['total']} tests in {_duration(summary['time']['duration'])}</p><p>"]
+        parts += [f"<span class='badge {status}'>{counts[status]} {status}</span> "
+                  for status in STATUSES if counts[status]]
+        parts.append("</p>")
+        if len(trend) > 1:
+            parts.append(f"<h2>Trend (last {len(trend)} runs)</h2>{self._trend_svg(trend)}")
+
+        environment = self._environment()
+        if environment:
+            rows = "".join(f"<tr><td>{_escape(key)}</td><td>{_escape(value)}</td></tr>"
+                           for key, value in environment)
+            parts.append(f"<h2>Environment</h2><table>{rows}</table>")
+
+        suites = {}
+        for record in records:
+            suites.setdefault(record["suite"], []).append(record)
+        for suite, suite_records in sorted(suites.items()):
+            failed = sum(1 for record in suite_records if record["status"] in ("failed", "broken"))
+            parts.append(f"<h2>{_escape(suite)} <span class='muted'>({len(suite_records)} tests"
+                         f"{f', {failed} failing' if failed else ''})</span></h2><table>"
+                         "<tr><th>Status</th><th>Test</th><th>Duration</th><th>Last runs</th></tr>")
+            order = {"failed": 0, "broken": 1, "unknown": 2, "skipped": 3, "passed": 4}
+            for record in sorted(suite_records, key=lambda record: (order[record["status"]], record["name"])):
+                items = history.get(record["history_id"], {}).get("items", [])
+                dots = "".join(f"<span class='dot {item['status']}' title='{item['status']}'></span>"
+                               for item in reversed(items[:10]))
+                message = (f"<div class='muted'>{_escape(record['message'].splitlines()[0][:200])}</div>"
+                           if record["message"] and record["status"] != "passed" else "")
+                parts.append(f"<tr><td><span class='badge {record['status']}'>{record['status']}</span></td>"
+                             f"<td><a href='{record['page']}'>{_escape(record['name'])}</a>{message}</td>"
+                             f"<td>{_duration(record['duration'])}</td><td>{dots}</td></tr>")
+            parts.append("</table>")
+        return _page("Test report", "".join(parts))
+
+    def _environment(self):
+        path = os.path.join(self.results_dir, "environment.properties")
+        if not os.path.exists(path):
+            return []
+        pairs = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if "=" in line and not line.lstrip().startswith("#"):
+                    key, value = line.split("=", 1)
+                    pairs.append((key.strip(), value.strip()))
+        return pairs
+
+    def _render_test(self, record):
+        parts = ["<p><a href='../index.html'>&larr; Report</a></p>",
+                 f"<h1><span class='badge {record['status']}'>{record['status']}</span> {_escape(record['name'])}</h1>",
+                 f"<p class='muted'>{_escape(record['full_name'])} - {_duration(record['duration'])}</p>"]
+        if record["parameters"]:
+            rows = "".join(f"<tr><td>{_escape(p.get('name'))}</td><td>{_escape(p.get('value'))}</td></tr>"
+                           for p in record["parameters"])
+            parts.append(f"<h2>Parameters</h2><table>{rows}</table>")
+        if record["message"] or record["trace"]:
+            parts.append(f"<h2>Details</h2><pre>{_escape(record['message'])}\n\n{_escape(record['trace'])}</pre>")
+        if record["steps"]:
+            rows = "".join(f"<tr><td><span class='badge {step['status']}'>{step['status']}</span></td>"
+                           f"<td style='padding-left:{8 + step['depth'] * 18}px'>{_escape(step['name'])}</td>"
+                           f"<td>{_duration(step['duration'])}</td></tr>" for step in record["steps"])
+            parts.append(f"<h2>Steps</h2><table>{rows}</table>")
+        if record["attachments"]:
+            items = []
+            for attachment in record["attachments"]:
+                href = f"../data/attachments/{_escape(os.path.basename(attachment.get('source', '')))}"
+                if attachment.get("type", "").startswith("image/"):
+                    items.append(f"<p>{_escape(attachment.get('name'))}<br><a href='{href}'>"
+                                 f"<img src='{href}' style='max-width:320px;border:1px solid #ddd'></a></p>")
+                else:
+                    items.append(f"<p><a href='{href}'>{_escape(attachment.get('name'))}</a> "
+                                 f"<span class='muted'>{_escape(attachment.get('type'))}</span></p>")
+            parts.append(f"<h2>Attachments</h2>{''.join(items)}")
+        return _page(record["name"], "".join(parts))
+
+
+def build_report(results_dir=RESULTS_DIR, report_dir=REPORT_DIR):
+    """Build (or update) the static report; see AllureReportBuilder.build"""
+    return AllureReportBuilder(results_dir, report_dir).build()
+
+
+if __name__ == "__main__":
+    build_report(*sys.argv[1:3])
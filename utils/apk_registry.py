@@ -0,0 +1,425 @@
+"""
+APK metadata registry with content hashing and an install-skip cache
+
+Each APK referenced from APP_VERSIONS is parsed once - binary AndroidManifest.xml
+(package, versionCode, versionName), signing certificate digest, size - and
+stored with its SHA-256 in .apk_index.json. Entries are only re-read when the
+file's size or mtime changes.
+
+The index also remembers which build was installed on which device. Installers
+use it to skip reinstalling an identical build, and the installed version can be
+looked up locally instead of running "adb shell dumpsys package" every time.
+Uninstall through remove_app() so the index forgets the build as well.
+"""
+
+import hashlib
+import json
+import os
+import re
+import struct
+import threading
+import zipfile
+
+from utils.adb_client import AdbError, adb_device, device_serial
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INDEX_FILE = os.path.join(PROJECT_ROOT, ".apk_index.json")
+
+# Binary XML chunk types
+_RES_STRING_POOL_TYPE = 0x0001
+_RES_XML_TYPE = 0x0003
+_RES_XML_START_ELEMENT_TYPE = 0x0102
+_RES_XML_RESOURCE_MAP_TYPE = 0x0180
+_UTF8_FLAG = 1 << 8
+
+# android:versionCode / android:versionName attribute resource ids
+_ATTR_VERSION_CODE = 0x0101021B
+_ATTR_VERSION_NAME = 0x0101021C
+
+# Res_value data types
+_TYPE_STRING = 0x03
+_TYPE_INT_DEC = 0x10
+_TYPE_INT_HEX = 0x11
+
+_APK_SIG_BLOCK_MAGIC = b"APK Sig Block 42"
+_APK_SIGNATURE_SCHEME_IDS = (0x7109871A, 0xF05368C0)  # v2, v3
+_V1_SIGNATURE_BLOCK = re.compile(r"^META-INF/[^/]+\.(RSA|DSA|EC)$", re.IGNORECASE)
+
+
+class ApkParseError(Exception):
+    """Raised when an APK's manifest or signature cannot be read"""
+
+
+def _read_string_pool(data, offset):
+    _, header_size, _ = struct.unpack_from("<HHI", data, offset)
+    string_count, _, flags, strings_start, _ = struct.unpack_from("<IIIII", data, offset + 8)
+    offsets = struct.unpack_from(f"<{string_count}I", data, offset + header_size)
+    is_utf8 = bool(flags & _UTF8_FLAG)
+    strings = []
+
+    for string_offset in offsets:
+        position = offset + strings_start + string_offset
+        if is_utf8:
+            # UTF-16 length then UTF-8 byte length, each 1 or 2 bytes
+            for _ in range(2):
+                length = data[position]
+                position += 1
+                if length & 0x80:
+                    length = ((length & 0x7F) << 8) | data[position]
+                    position += 1
+            strings.append(data[position:position + length].decode("utf-8", errors="replace"))
+        else:
+            length = struct.unpack_from("<H", data, position)[0]
+            position += 2
+            if length & 0x8000:
+                length = ((length & 0x7FFF) << 16) | struct.unpack_from("<H", data, position)[0]
+                position += 2
+            strings.append(data[position:position + length * 2].decode("utf-16-le", errors="replace"))
+    return strings
+
+
+def parse_binary_manifest(data):
+    """
+    Read package, versionCode and versionName from a binary AndroidManifest.xml
+
+    Args:
+        data (bytes): Raw AndroidManifest.xml from the APK
+
+    Returns:
+        dict: package, version_code (int or None), version_name (str or None)
+    """
+    chunk_type, header_size, _ = struct.unpack_from("<HHI", data, 0)
+    if chunk_type != _RES_XML_TYPE:
+        raise ApkParseError("AndroidManifest.xml is not a binary XML document")
+
+    strings = []
+    resource_ids = []
+    offset = header_size
+    while offset < len(data):
+        chunk_type, chunk_header_size, chunk_size = struct.unpack_from("<HHI", data, offset)
+        if chunk_size == 0:
+            break
+
+        if chunk_type == _RES_STRING_POOL_TYPE:
+            strings = _read_string_pool(data, offset)
+        elif chunk_type == _RES_XML_RESOURCE_MAP_TYPE:
+            count = (chunk_size - chunk_header_size) // 4
+            resource_ids = list(struct.unpack_from(f"<{count}I", data, offset + chunk_header_size))
+        elif chunk_type == _RES_XML_START_ELEMENT_TYPE:
+            ext = offset + chunk_header_size
+            _, name_index, attribute_start, attribute_size, attribute_count = struct.unpack_from("<IIHHH", data, ext)
+            if strings[name_index] != "manifest":
+                raise ApkParseError("First element of AndroidManifest.xml is not <manifest>")
+
+            manifest = {"package": None, "version_code": None, "version_name": None}
+            for index in range(attribute_count):
+                attribute = ext + attribute_start + index * attribute_size
+                _, name, raw_value, _, _, data_type, value = struct.unpack_from("<IIIHBBI", data, attribute)
+                resource_id = resource_ids[name] if name < len(resource_ids) else None
+                attribute_name = strings[name] if name < len(strings) else ""
+
+                if data_type == _TYPE_STRING:
+                    parsed = strings[value]
+                elif raw_value != 0xFFFFFFFF:
+                    parsed = strings[raw_value]
+                elif data_type in (_TYPE_INT_DEC, _TYPE_INT_HEX):
+                    parsed = value
+                else:
+                    parsed = None
+
+                if attribute_name == "package":
+                    manifest["package"] = parsed
+                elif resource_id == _ATTR_VERSION_CODE or attribute_name == "versionCode":
+                    manifest["version_code"] = int(parsed) if parsed is not None else None
+                elif resource_id == _ATTR_VERSION_NAME or attribute_name == "versionName":
+                    manifest["version_name"] = str(parsed) if parsed is not None else None
+            return manifest
+
+        offset += chunk_size
+
+    raise ApkParseError("No <manifest> element in AndroidManifest.xml")
+
+
+def _der_element(data, offset):
+    """Return (tag, content_start, end) of the DER element at offset"""
+    tag = data[offset]
+    length = data[offset + 1]
+    position = offset + 2
+    if length & 0x80:
+        byte_count = length & 0x7F
+        length = int.from_bytes(data[position:position + byte_count], "big")
+        position += byte_count
+    return tag, position, position + length
+
+
+def _der_children(data, start, end):
+    children = []
+    offset = start
+    while offset < end:
+        element = _der_element(data, offset)
+        children.append((offset,) + element)
+        offset = element[2]
+    return children
+
+
+def _certificate_from_pkcs7(data):
+    # ContentInfo -> [0] SignedData -> [0] IMPLICIT certificates -> first Certificate
+    _, start, end = _der_element(data, 0)
+    content_info = _der_children(data, start, end)
+    _, _, signed_start, signed_end = content_info[1]
+    _, sequence_start, sequence_end = _der_element(data, signed_start)
+    for offset, tag, content_start, content_end in _der_children(data, sequence_start, sequence_end):
+        if tag == 0xA0:
+            certificate_offset, _, _, certificate_end = _der_children(data, content_start, content_end)[0]
+            return data[certificate_offset:certificate_end]
+    raise ApkParseError("PKCS#7 signature block has no certificate")
+
+
+def _length_prefixed(data, offset):
+    length = struct.unpack_from("<I", data, offset)[0]
+    return data[offset + 4:offset + 4 + length], offset + 4 + length
+
+
+def _certificate_from_signing_block(path):
+    # APK Signature Scheme v2/v3 block sits right before the central directory
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        file_size = f.tell()
+        tail_size = min(file_size, 65536 + 22)
+        f.seek(file_size - tail_size)
+        tail = f.read()
+        eocd = tail.rfind(b"PK\x05\x06")
+        if eocd < 0:
+            raise ApkParseError("Not a zip file")
+        central_directory = struct.unpack_from("<I", tail, eocd + 16)[0]
+
+        f.seek(central_directory - 24)
+        block_size, magic = struct.unpack("<Q16s", f.read(24))
+        if magic != _APK_SIG_BLOCK_MAGIC:
+            raise ApkParseError("APK has no v1 certificate and no APK signing block")
+        f.seek(central_directory - block_size - 8)
+        block = f.read(block_size + 8)
+
+    offset = 8
+    while offset < len(block) - 24:
+        pair_length, pair_id = struct.unpack_from("<QI", block, offset)
+        if pair_id in _APK_SIGNATURE_SCHEME_IDS:
+            value = block[offset + 12:offset + 8 + pair_length]
+            signers, _ = _length_prefixed(value, 0)
+            signer, _ = _length_prefixed(signers, 0)
+            signed_data, _ = _length_prefixed(signer, 0)
+            _, position = _length_prefixed(signed_data, 0)  # digests
+            certificates, _ = _length_prefixed(signed_data, position)
+            certificate, _ = _length_prefixed(certificates, 0)
+            return certificate
+        offset += 8 + pair_length
+    raise ApkParseError("APK signing block has no v2/v3 signer")
+
+
+def read_apk_metadata(path):
+    """
+    Parse an APK once: manifest versions, signing certificate digest, size and SHA-256
+
+    Args:
+        path (str): Path to the APK
+
+    Returns:
+        dict: package, version_code, version_name, cert_sha256, size, mtime, sha256
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(block)
+
+    with zipfile.ZipFile(path) as apk:
+        manifest = parse_binary_manifest(apk.read("AndroidManifest.xml"))
+        certificate = None
+        for name in apk.namelist():
+            if _V1_SIGNATURE_BLOCK.match(name):
+                certificate = _certificate_from_pkcs7(apk.read(name))
+                break
+
+    if certificate is None:
+        certificate = _certificate_from_signing_block(path)
+
+    stat = os.stat(path)
+    return {
+        **manifest,
+        "cert_sha256": hashlib.sha256(certificate).hexdigest(),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "sha256": sha256.hexdigest(),
+    }
+
+
+def query_installed_package(device_id, package_name):
+    """
+    Read an installed package's versionCode, versionName and lastUpdateTime from the device
+
+    Returns:
+        dict: version_code, version_name, last_update_time; or None if not installed
+    """
+    try:
+        info = adb_device(device_id).dumpsys_package(package_name)
+    except (AdbError, OSError) as e:
+        print(f"⚠️ Could not query {package_name} on {device_id}: {e}")
+        return None
+    if info is None:
+        return None
+    return {
+        "version_code": info.version_code,
+        "version_name": info.version_name,
+        "last_update_time": info.last_update_time,
+    }
+
+
+class ApkRegistry:
+    """On-disk index of APK metadata plus what was installed on each device"""
+
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        index = self._load()
+        self.apks = index.get("apks", {})
+        self.installed = index.get("installed", {})
+        # Entries changed by this process since the last save, merged into the file by save()
+        self._dirty_apks = set()
+        self._dirty_installs = set()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """Merge the entries changed by this process into the file (safe across xdist workers)"""
+        with self._lock:
+            if not self._dirty_apks and not self._dirty_installs:
+                return
+            # Re-read first: workers on other devices may have recorded installs since we loaded
+            merged = self._load()
+            apks = merged.setdefault("apks", {})
+            installed = merged.setdefault("installed", {})
+            for apk_path in self._dirty_apks:
+                apks[apk_path] = self.apks[apk_path]
+            for device_id, package_name in self._dirty_installs:
+                entry = self.installed.get(device_id, {}).get(package_name)
+                if entry is not None:
+                    installed.setdefault(device_id, {})[package_name] = entry
+                else:
+                    installed.get(device_id, {}).pop(package_name, None)
+            self._dirty_apks.clear()
+            self._dirty_installs.clear()
+            self.apks = apks
+            self.installed = installed
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(temp_path, "w") as f:
+                    json.dump(merged, f, indent=2, sort_keys=True)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"⚠️ Could not save APK index: {e}")
+
+    def get(self, apk_path):
+        """
+        Metadata for an APK, parsed only if the file is new or changed
+
+        Returns:
+            dict: See read_apk_metadata(), or None if the file is missing or unreadable
+        """
+        apk_path = os.path.abspath(apk_path)
+        try:
+            stat = os.stat(apk_path)
+        except OSError:
+            return None
+
+        cached = self.apks.get(apk_path)
+        if cached and cached["size"] == stat.st_size and cached["mtime"] == stat.st_mtime:
+            return cached
+
+        try:
+            metadata = read_apk_metadata(apk_path)
+        except (ApkParseError, zipfile.BadZipFile, KeyError, IndexError, struct.error) as e:
+            print(f"⚠️ Could not parse {os.path.basename(apk_path)}: {e}")
+            return None
+        with self._lock:
+            self.apks[apk_path] = metadata
+            self._dirty_apks.add(apk_path)
+        self.save()
+        return metadata
+
+    def for_version(self, version):
+        """Metadata for an APP_VERSIONS entry"""
+        from config.app_versions import get_version_config
+        config = get_version_config(version)
+        return self.get(config["apk_path"]) if config else None
+
+    def find_by_sha256(self, sha256):
+        for metadata in self.apks.values():
+            if metadata["sha256"] == sha256:
+                return metadata
+        return None
+
+    def record_install(self, device_id, package_name, apk_path):
+        """Remember which build is on the device (call after a successful install)"""
+        metadata = self.get(apk_path)
+        if metadata is None:
+            return
+        device_state = query_installed_package(device_id, package_name) or {}
+        with self._lock:
+            self.installed.setdefault(device_id or "default", {})[package_name] = {
+                "sha256": metadata["sha256"],
+                "last_update_time": device_state.get("last_update_time"),
+            }
+            self._dirty_installs.add((device_id or "default", package_name))
+        self.save()
+
+    def forget_install(self, device_id, package_name):
+        with self._lock:
+            self.installed.get(device_id or "default", {}).pop(package_name, None)
+            self._dirty_installs.add((device_id or "default", package_name))
+        self.save()
+
+    def installed_metadata(self, device_id, package_name):
+        """Metadata of the build this registry last installed on the device, without touching adb"""
+        entry = self.installed.get(device_id or "default", {}).get(package_name)
+        return self.find_by_sha256(entry["sha256"]) if entry else None
+
+    def is_installed(self, device_id, package_name, apk_path):
+        """
+        True if exactly this build is what the device currently has installed
+
+        One dumpsys call confirms the device still has the versionCode/versionName we
+        installed and that nothing reinstalled the package since (lastUpdateTime).
+        """
+        metadata = self.get(apk_path)
+        entry = self.installed.get(device_id or "default", {}).get(package_name)
+        if metadata is None or entry is None or entry["sha256"] != metadata["sha256"]:
+            return False
+
+        device_state = query_installed_package(device_id, package_name)
+        if device_state is None:
+            self.forget_install(device_id, package_name)
+            return False
+        return (device_state["version_code"] == metadata["version_code"]
+                and device_state["version_name"] == metadata["version_name"]
+                and device_state["last_update_time"] == entry["last_update_time"])
+
+
+apk_registry = ApkRegistry()
+
+
+def remove_app(driver, package_name):
+    """
+    driver.remove_app() that also drops the package from the install index
+
+    Otherwise installed_metadata() keeps reporting a build that is no longer on the device.
+    """
+    driver.remove_app(package_name)
+    try:
+        device_id = device_serial(driver)
+    except (AdbError, OSError):
+        device_id = None
+    apk_registry.forget_install(device_id, package_name)
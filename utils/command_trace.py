@@ -0,0 +1,214 @@
+"""
+WebDriver command tracing (pytest --profile-commands)
+
+install() wraps RemoteConnection.execute, the single path every Selenium/Appium
+command takes to the server. While tracing is enabled each command is recorded
+with its locator, duration, request/response size, outcome and the project
+call stack that issued it (test -> page object -> helper), so a slow step can
+be broken down into the finds that made it slow.
+
+Per test, the records are turned into:
+  * a flame-style text summary: time and command count per call-stack frame,
+    heaviest first, with the slowest locators;
+  * Chrome trace-event JSON (open in chrome://tracing or https://ui.perfetto.dev)
+    with one span per command and per page-object method around them.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_IGNORED_PATHS = (os.path.join(PROJECT_ROOT, "venv") + os.sep, os.path.abspath(__file__))
+
+
+def _project_stack(frame):
+    """Outermost-first "Class.method" names of the project frames on a stack"""
+    names = []
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        name = frame.f_code.co_name
+        # <lambda>/<genexpr> frames add depth without telling you where the time went
+        if filename.startswith(PROJECT_ROOT) and not filename.startswith(_IGNORED_PATHS) and name[0] != "<":
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                name = f"{type(owner).__name__}.{name}"
+            elif "cls" in frame.f_locals and isinstance(frame.f_locals["cls"], type):
+                name = f"{frame.f_locals['cls'].__name__}.{name}"
+            names.append(name)
+        frame = frame.f_back
+    names.reverse()
+    return tuple(names)
+
+
+def _outcome(response):
+    value = response.get("value") if isinstance(response, dict) else None
+    if isinstance(value, dict) and value.get("error"):
+        return value["error"]
+    return "ok"
+
+
+class CommandTracer:
+    """Per-test record of the WebDriver commands sent, fed by the execute() wrapper"""
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self._installed = False
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def install(self):
+        """Wrap RemoteConnection.execute (once per process) and start tracing"""
+        if not self._installed:
+            from selenium.webdriver.remote import remote_connection
+
+            original = remote_connection.RemoteConnection.execute
+            tracer = self
+
+            def execute(connection, command, params):
+                if not tracer.enabled:
+                    return original(connection, command, params)
+                element_id = params.get("id") if isinstance(params, dict) else None
+                stack = _project_stack(sys._getframe(1))
+                start = time.perf_counter()
+                try:
+                    response = original(connection, command, params)
+                except Exception as e:
+                    tracer.record(command, params, element_id, start, stack, type(e).__name__, 0)
+                    raise
+                size = len(json.dumps(response.get("value"))) if isinstance(response, dict) else 0
+                tracer.record(command, params, element_id, start, stack, _outcome(response), size)
+                return response
+
+            remote_connection.RemoteConnection.execute = execute
+            self._installed = True
+        self.enabled = True
+
+    def reset(self):
+        with self._lock:
+            self.records = []
+
+    def record(self, command, params, element_id, start, stack, outcome, response_bytes):
+        end = time.perf_counter()
+        # execute() has removed the URL parameters, so params is now the request body
+        body = params if isinstance(params, dict) else {}
+        locator = f"{body['using']}={body['value']}" if "using" in body and "value" in body else None
+        if locator is None and body.get("script"):
+            locator = body["script"]
+        with self._lock:
+            self.records.append({
+                "command": command,
+                "locator": locator,
+                "element": element_id,
+                "start": start - self._origin,
+                "duration": end - start,
+                "request_bytes": len(json.dumps(body)) if body else 0,
+                "response_bytes": response_bytes,
+                "outcome": outcome,
+                "caller": stack[-1] if stack else None,
+                "stack": stack,
+                "thread": threading.current_thread().name,
+            })
+
+    # -- reports ------------------------------------------------------------
+
+    def flame_summary(self, top_locators=10):
+        """Indented tree of call-stack frames with total time and commands, heaviest first"""
+        records = list(self.records)
+        if not records:
+            return "No WebDriver commands recorded"
+
+        def tree():
+            return {"time": 0.0, "count": 0, "children": defaultdict(tree)}
+
+        root = tree()
+        for record in records:
+            node = root
+            node["time"] += record["duration"]
+            node["count"] += 1
+            path = record["stack"] + (f"[{record['command']}]",)
+            if record["thread"] != "MainThread":
+                path = (f"<{record['thread']}>",) + path
+            for name in path:
+                node = node["children"][name]
+                node["time"] += record["duration"]
+                node["count"] += 1
+
+        lines = [f"{root['time'] * 1000:9.1f} ms {root['count']:5d} cmds  total"]
+
+        def walk(node, depth):
+            for name, child in sorted(node["children"].items(), key=lambda item: -item[1]["time"]):
+                lines.append(f"{child['time'] * 1000:9.1f} ms {child['count']:5d} cmds  {'  ' * depth}{name}")
+                walk(child, depth + 1)
+
+        walk(root, 1)
+
+        by_locator = defaultdict(lambda: [0.0, 0, Counter()])
+        for record in records:
+            if record["locator"]:
+                entry = by_locator[(record["command"], record["locator"])]
+                entry[0] += record["duration"]
+                entry[1] += 1
+                entry[2][record["outcome"]] += 1
+        if by_locator:
+            lines += ["", f"Slowest locators (top {top_locators}):"]
+            ranked = sorted(by_locator.items(), key=lambda item: -item[1][0])[:top_locators]
+            for (command, locator), (total, count, outcomes) in ranked:
+                outcome = ", ".join(f"{name} x{n}" for name, n in outcomes.items())
+                lines.append(f"{total * 1000:9.1f} ms {count:5d}x  {command} {locator}  ({outcome})")
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """Chrome trace-event JSON: a span per command plus spans for the frames that issued them"""
+        pid = os.getpid()
+        events = []
+        threads = {}
+        records = sorted(self.records, key=lambda record: (record["thread"], record["start"]))
+        for record in records:
+            tid = threads.setdefault(record["thread"], len(threads) + 1)
+            events.append({
+                "name": f"{record['command']} {record['locator'] or ''}".strip(),
+                "cat": "webdriver",
+                "ph": "X",
+                "ts": round(record["start"] * 1e6, 1),
+                "dur": round(record["duration"] * 1e6, 1),
+                "pid": pid,
+                "tid": tid,
+                "args": {key: record[key] for key in
+                         ("command", "locator", "element", "request_bytes", "response_bytes", "outcome", "caller")},
+            })
+
+        # Consecutive commands sharing a stack prefix become one span per frame
+        for thread, tid in threads.items():
+            thread_records = [record for record in records if record["thread"] == thread]
+            depth = max((len(record["stack"]) for record in thread_records), default=0)
+            for level in range(depth):
+                run = []
+                for record in thread_records + [None]:
+                    prefix = record["stack"][:level + 1] if record and len(record["stack"]) > level else None
+                    if run and prefix != run[0]["stack"][:level + 1]:
+                        first, last = run[0], run[-1]
+                        events.append({
+                            "name": first["stack"][level],
+                            "cat": "page-object",
+                            "ph": "X",
+                            "ts": round(first["start"] * 1e6, 1),
+                            "dur": round((last["start"] + last["duration"] - first["start"]) * 1e6, 1),
+                            "pid": pid,
+                            "tid": tid,
+                            "args": {"commands": len(run)},
+                        })
+                        run = []
+                    if prefix is not None:
+                        run.append(record)
+
+        for thread, tid in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread}})
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+command_tracer = CommandTracer()
@@ -1,37 +1,289 @@
+"""
+Test data registry for the files in testdata/
+
+Each testdata/<dataset>.json file is parsed once and validated against its
+schema in SCHEMAS; later reads are served from memory until the file's mtime
+changes. Values are layered, last one wins:
+
+  1. testdata/<dataset>.json
+  2. testdata/devices/<udid>.json, per-device data keyed by dataset, e.g.
+     {"olarm_device_data": {"valid_device": {"serial": "..."}}}
+  3. .env and the process environment: TESTDATA__<dataset>__<key>[__<field>]=value
+     (values that parse as JSON are used as such, anything else as a string;
+     the environment is read once, clear() picks up later changes)
+
+Large corpora can live in testdata/<dataset>/<key>.jsonl, one case per line;
+iter_cases() streams them without loading the whole file.
+"""
+
+import copy
 import json
 import os
+import threading
+
+import pytest
+from dotenv import dotenv_values
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TESTDATA_DIR = os.path.join(PROJECT_ROOT, "testdata")
+ENV_FILE = os.path.join(PROJECT_ROOT, ".env")
+ENV_PREFIX = "TESTDATA__"
+
+CREDENTIALS = {"username": str, "password": str}
+
+# dataset -> {key: schema}; a schema is a type, a list holding the item schema,
+# or a dict of required fields (undeclared keys are allowed)
+SCHEMAS = {
+    "login_data": {
+        "valid_user": CREDENTIALS,
+        "invalid_user": CREDENTIALS,
+    },
+    "olarm_device_data": {
+        "valid_device": {"serial": str, "verification_code": str},
+        "invalid_device": {"serial": str, "verification_code": str},
+        "name_device": {"name_of_device": str},
+        "UDL_master_data": {"input_1": int, "input_2": int, "input_3": int, "input_4": int},
+        "Wifi_creds": {"Wifi": str, "PWD": str},
+    },
+    "sql_injection_data": {
+        "SQL_injection_tests": [CREDENTIALS],
+    },
+    "phone_no_data": {
+        "phone_no_val": [{"phone": str}],
+    },
+}
+
+
+class DataSchemaError(ValueError):
+    """Test data that does not match its declared schema"""
+
+
+def validate(value, schema, path):
+    """
+    Check a value against a schema
+
+    Raises:
+        DataSchemaError: Naming the first path that does not match, e.g. login_data.valid_user.password
+    """
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            raise DataSchemaError(f"{path}: expected an object, got {type(value).__name__}")
+        for field, field_schema in schema.items():
+            if field not in value:
+                raise DataSchemaError(f"{path}: missing required field '{field}'")
+            validate(value[field], field_schema, f"{path}.{field}")
+    elif isinstance(schema, list):
+        if not isinstance(value, list):
+            raise DataSchemaError(f"{path}: expected a list, got {type(value).__name__}")
+        for index, item in enumerate(value):
+            validate(item, schema[0], f"{path}[{index}]")
+    elif not isinstance(value, schema) or (schema is int and isinstance(value, bool)):
+        raise DataSchemaError(f"{path}: expected {schema.__name__}, got {type(value).__name__}")
+
+
+def _stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse_env_value(value):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _merge(base, override):
+    if isinstance(base, dict) and isinstance(override, dict):
+        merged = dict(base)
+        for key, value in override.items():
+            merged[key] = _merge(base.get(key), value)
+        return merged
+    return override
+
+
+class DataRegistry:
+    """Memoized, validated and layered view of testdata/"""
+
+    def __init__(self, data_dir=TESTDATA_DIR, env_file=ENV_FILE, schemas=SCHEMAS):
+        """
+        Args:
+            data_dir (str): Directory holding <dataset>.json and devices/<udid>.json
+            env_file (str): .env file read for TESTDATA__ overrides
+            schemas (dict): Schema per dataset; datasets without one are not validated
+        """
+        self.data_dir = data_dir
+        self.env_file = env_file
+        self.schemas = schemas
+        # Set by the device_slot fixture so per-device data applies to this worker
+        self.device = os.getenv("TESTDATA_DEVICE")
+        self._files = {}
+        self._merged = {}
+        self._env = {}
+        self._environ = None
+        self._lock = threading.Lock()
+
+    def _read(self, path):
+        """Parsed JSON (or .env values) for a file, re-read only when its mtime or size changes"""
+        stamp = _stamp(path)
+        cached = self._files.get(path)
+        if cached and cached[0] == stamp:
+            return stamp, cached[1]
+        if stamp is None:
+            data = None
+        elif path.endswith(".json"):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            data = dotenv_values(path)
+        self._files[path] = (stamp, data)
+        return stamp, data
+
+    def _env_overrides(self, dataset):
+        """{key: value} from .env and the environment (environment wins) for one dataset"""
+        stamp, values = self._read(self.env_file)
+        cached = self._env.get(dataset)
+        if cached and cached[0] == stamp:
+            return cached
+        if self._environ is None:
+            # The environment is scanned once; call clear() after changing TESTDATA__ variables
+            self._environ = {name: value for name, value in os.environ.items() if name.startswith(ENV_PREFIX)}
+        values = {**(values or {}), **self._environ}
+
+        overrides = {}
+        prefix = f"{ENV_PREFIX}{dataset}__"
+        for name, value in sorted(values.items()):
+            if not name.startswith(prefix) or value is None:
+                continue
+            *parents, leaf = name[len(prefix):].split("__")
+            target = overrides
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[leaf] = _parse_env_value(value)
+        self._env[dataset] = (stamp, overrides)
+        return stamp, overrides
+
+    def load(self, dataset):
+        """
+        The merged, validated contents of a dataset
+
+        Returns:
+            dict: A copy callers may modify
+
+        Raises:
+            FileNotFoundError: If testdata/<dataset>.json does not exist
+            DataSchemaError: If the merged data does not match SCHEMAS[dataset]
+        """
+        return copy.deepcopy(self._load(dataset))
+
+    def _load(self, dataset):
+        base_path = os.path.join(self.data_dir, f"{dataset}.json")
+        device_path = os.path.join(self.data_dir, "devices", f"{self.device}.json") if self.device else None
+        with self._lock:
+            base_stamp, base = self._read(base_path)
+            if base_stamp is None:
+                raise FileNotFoundError(f"No test data file for dataset '{dataset}': {base_path}")
+            device_stamp, device_data = self._read(device_path) if device_path else (None, None)
+            env_stamp, env = self._env_overrides(dataset)
+
+            key = (base_stamp, device_path, device_stamp, env_stamp)
+            cached = self._merged.get(dataset)
+            if cached is None or cached[0] != key:
+                data = base
+                if device_data and dataset in device_data:
+                    data = _merge(data, device_data[dataset])
+                if env:
+                    data = _merge(data, env)
+                if dataset in self.schemas:
+                    for name, schema in self.schemas[dataset].items():
+                        if name in data:
+                            validate(data[name], schema, f"{dataset}.{name}")
+                cached = (key, data)
+                self._merged[dataset] = cached
+        return cached[1]
+
+    def get(self, dataset, key, default=None):
+        """One top-level entry of a dataset (a copy), e.g. get("login_data", "valid_user")"""
+        return copy.deepcopy(self._load(dataset).get(key, default))
+
+    def iter_cases(self, dataset, key, limit=None):
+        """
+        Cases of a list entry, one at a time
+
+        Streams testdata/<dataset>/<key>.jsonl line by line when that file exists,
+        otherwise walks the list in testdata/<dataset>.json. Each case is validated
+        against the list's item schema as it is produced.
+
+        Args:
+            dataset (str): Dataset name, e.g. "sql_injection_data"
+            key (str): List entry, e.g. "SQL_injection_tests"
+            limit (int): Stop after this many cases
+
+        Raises:
+            ValueError: If the dataset has no such entry
+            TypeError: If the entry is not a list
+        """
+        schema = self.schemas.get(dataset, {}).get(key)
+        item_schema = schema[0] if isinstance(schema, list) else None
+        corpus = os.path.join(self.data_dir, dataset, f"{key}.jsonl")
+        if os.path.exists(corpus):
+            cases = self._stream(corpus)
+        else:
+            cases = self._load(dataset).get(key)
+            if cases is None:
+                raise ValueError(f"No data found for key: {key}")
+            if not isinstance(cases, list):
+                raise TypeError(f"Expected list for key '{key}', but got {type(cases).__name__}")
+
+        for index, case in enumerate(cases):
+            if limit is not None and index >= limit:
+                return
+            if item_schema is not None:
+                validate(case, item_schema, f"{dataset}.{key}[{index}]")
+            yield copy.deepcopy(case)
+
+    @staticmethod
+    def _stream(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def param_cases(self, dataset, key, id_field=None, limit=None, marks=()):
+        """
+        iter_cases() as a list of pytest.param objects, for @pytest.mark.parametrize
+
+        Args:
+            id_field (str): Case field used as the test id (defaults to pytest's own ids)
+            marks: Marks applied to every case
+        """
+        return [pytest.param(case, id=str(case[id_field]) if id_field else None, marks=marks)
+                for case in self.iter_cases(dataset, key, limit)]
+
+    def clear(self):
+        """Forget everything read so far, including the environment scan"""
+        with self._lock:
+            self._files.clear()
+            self._merged.clear()
+            self._env.clear()
+            self._environ = None
+
+
+test_data = DataRegistry()
+
 
 def read_test_data(key):
-    file_path = os.path.join(os.path.dirname(__file__), '../testdata/login_data.json')
-    with open(file_path) as f:
-        data = json.load(f)
-    return data.get(key)
+    return test_data.get("login_data", key)
 
 def read_device_details(key):
-    file_path = os.path.join(os.path.dirname(__file__), '../testdata/olarm_device_data.json')
-    with open(file_path) as f:
-        data = json.load(f)
-    return data.get(key)
+    return test_data.get("olarm_device_data", key)
 
 
 def read_sql_injection_data(key):
-    file_path = os.path.join(os.path.dirname(__file__), '../testdata/sql_injection_data.json')
-    with open(file_path) as f:
-        data = json.load(f)
-    result = data.get(key)
-    if result is None:
-        raise ValueError(f"No data found for key: {key}")
-    if not isinstance(result, list):
-        raise TypeError(f"Expected list for key '{key}', but got {type(result).__name__}")
-    return result
+    return list(test_data.iter_cases("sql_injection_data", key))
 
 def read_cell_no_data(key):
-    file_path = os.path.join(os.path.dirname(__file__), '../testdata/phone_no_data.json')
-    with open(file_path) as f:
-        data = json.load(f)
-    result = data.get(key)
-    if result is None:
-        raise ValueError(f"No data found for key: {key}")
-    if not isinstance(result, list):
-        raise TypeError(f"Expected list for key '{key}', but got {type(result).__name__}")
-    return result
\ No newline at end of file
+    return list(test_data.iter_cases("phone_no_data", key))
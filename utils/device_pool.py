@@ -0,0 +1,229 @@
+"""
+Device pool and per-worker port allocation for parallel (pytest-xdist) runs
+
+Every xdist worker gets its own Appium server port, UiAutomator2 systemPort,
+chromedriver port and device udid, so N attached emulators can run N test
+modules at the same time. Test modules are sharded longest-first using the
+durations recorded by previous runs.
+"""
+
+import json
+import os
+
+from utils.adb_client import default_client
+
+# Base ports; worker N uses base + N
+APPIUM_BASE_PORT = 4725
+SYSTEM_BASE_PORT = 8201
+CHROMEDRIVER_BASE_PORT = 9515
+MJPEG_BASE_PORT = 7810
+# Added to every worker's port index so separate pytest processes running side by
+# side (the upgrade runner's concurrent suites) don't claim the same ports
+SLOT_OFFSET = int(os.getenv("DEVICE_SLOT_OFFSET", "0"))
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DURATIONS_FILE = os.path.join(PROJECT_ROOT, ".test_durations.json")
+
+# Modules whose tests are independent (each installs its own builds), so every
+# test - e.g. each upgrade matrix pair - can go to whichever device is free
+PER_TEST_SCOPE_MODULES = (
+    "tests/test_upgrade_automation.py",
+    "tests/test_app_upgrade.py",
+)
+
+
+def discover_devices():
+    """
+    List the serials of devices attached to the local adb server
+
+    Returns:
+        list: Device serials in the "device" state (unauthorized/offline are skipped)
+    """
+    try:
+        return default_client.devices()
+    except Exception as e:
+        print(f"⚠️ Could not list adb devices: {e}")
+        return []
+
+
+def get_device_pool(option_value=None):
+    """
+    Resolve the device pool for this run
+
+    Order of precedence: --devices option, DEVICE_POOL environment variable,
+    devices attached to adb.
+
+    Args:
+        option_value (str): Comma separated serials from the --devices option
+
+    Returns:
+        list: Device serials
+    """
+    raw = option_value or os.getenv("DEVICE_POOL", "")
+    devices = [serial.strip() for serial in raw.split(",") if serial.strip()]
+    if devices:
+        return devices
+    return discover_devices()
+
+
+def get_worker_index(config):
+    """Return the xdist worker number (gw3 -> 3), or 0 when not running under xdist"""
+    workerinput = getattr(config, "workerinput", None)
+    if not workerinput:
+        return 0
+    return int(workerinput["workerid"].lstrip("gw"))
+
+
+def get_worker_count(config):
+    workerinput = getattr(config, "workerinput", None)
+    if not workerinput:
+        return 1
+    return int(workerinput.get("workercount", 1))
+
+
+def get_worker_slot(config, devices, device_id=None):
+    """
+    Build the device and port assignment for the current worker
+
+    Args:
+        config: pytest config
+        devices (list): Device pool
+        device_id (str): Explicit --device-id; only honoured outside xdist
+
+    Returns:
+        dict: udid, appium_port, server_url, system_port, chromedriver_port, mjpeg_port
+
+    Raises:
+        RuntimeError: If there are more workers than devices
+    """
+    index = get_worker_index(config)
+    worker_count = get_worker_count(config)
+
+    if device_id and worker_count == 1:
+        udid = device_id
+    elif index < len(devices):
+        udid = devices[index]
+    elif not devices and worker_count == 1:
+        udid = None  # Single device run: let the capabilities pick the default
+    else:
+        raise RuntimeError(
+            f"Worker gw{index} has no device: {worker_count} workers but only "
+            f"{len(devices)} device(s) in the pool {devices}"
+        )
+
+    port_index = index + SLOT_OFFSET
+    appium_port = APPIUM_BASE_PORT + port_index
+    return {
+        "worker": f"gw{index}",
+        "udid": udid,
+        "appium_port": appium_port,
+        "server_url": f"http://localhost:{appium_port}/wd/hub",
+        "system_port": SYSTEM_BASE_PORT + port_index,
+        "chromedriver_port": CHROMEDRIVER_BASE_PORT + port_index,
+        "mjpeg_port": MJPEG_BASE_PORT + port_index,
+    }
+
+
+def get_slot_capabilities(slot):
+    """Capabilities that bind a session to the worker's device and ports"""
+    caps = {
+        "systemPort": slot["system_port"],
+        "chromedriverPort": slot["chromedriver_port"],
+        "mjpegServerPort": slot["mjpeg_port"],
+    }
+    if slot["udid"]:
+        caps["udid"] = slot["udid"]
+        caps["deviceName"] = slot["udid"]
+    return caps
+
+
+def make_device_scheduler(config, log):
+    """
+    xdist scheduler that keeps a module on one worker (MGSP suites share app
+    state between tests) except for PER_TEST_SCOPE_MODULES, whose tests are
+    scheduled one by one across the device pool
+    """
+    from xdist.scheduler import LoadScopeScheduling
+
+    class DeviceScopeScheduling(LoadScopeScheduling):
+        def _split_scope(self, nodeid):
+            module_path = nodeid.split("::", 1)[0]
+            if module_path in PER_TEST_SCOPE_MODULES:
+                return nodeid
+            return module_path
+
+    return DeviceScopeScheduling(config, log)
+
+
+class DurationStore:
+    """Historical per-test durations used to shard modules longest-first"""
+
+    def __init__(self, path=DURATIONS_FILE):
+        self.path = path
+        self.durations = self._load()
+        self.current_run = {}
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def record(self, nodeid, duration):
+        """Accumulate setup + call + teardown time for a test"""
+        self.current_run[nodeid] = self.current_run.get(nodeid, 0.0) + duration
+
+    def module_durations(self):
+        """Total recorded duration per test module path"""
+        totals = {}
+        for nodeid, duration in self.durations.items():
+            module_path = nodeid.split("::")[0]
+            totals[module_path] = totals.get(module_path, 0.0) + duration
+        return totals
+
+    def sort_items(self, items):
+        """
+        Reorder collected items so the slowest modules are scheduled first
+
+        Tests inside a module keep their order because MGSP suites rely on
+        state left behind by the previous test in the same file.
+        """
+        if not self.durations:
+            return
+
+        totals = self.module_durations()
+        module_order = {}
+        for position, item in enumerate(items):
+            module_order.setdefault(item.nodeid.split("::")[0], position)
+
+        def sort_key(item):
+            module_path = item.nodeid.split("::")[0]
+            return -totals.get(module_path, 0.0), module_order[module_path]
+
+        items.sort(key=sort_key)
+
+    def save(self):
+        if not self.current_run:
+            return
+        # Re-read first: another pytest process running alongside may have saved since we loaded
+        merged = dict(self.durations)
+        merged.update(self._load())
+        merged.update({nodeid: round(duration, 3) for nodeid, duration in self.current_run.items()})
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+class DurationRecorder:
+    """pytest plugin that feeds test phase durations into a DurationStore"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def pytest_runtest_logreport(self, report):
+        self.store.record(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session):
+        self.store.save()
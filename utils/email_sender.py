@@ -1,13 +1,120 @@
+import base64
+import io
 import smtplib
 import os
+import tempfile
+import threading
+import uuid
 import zipfile
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from email.header import Header
+from email.utils import formatdate, make_msgid
 from datetime import datetime
 import logging
 
+# Reports bigger than this (zipped, before base64) are sent as a summary only
+DEFAULT_MAX_ATTACHMENT_MB = 18
+
+CHUNK_SIZE = 57 * 1024  # a multiple of 57 bytes, so every base64 chunk ends on a whole 76-char line
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable file object that hands zipfile's output back in chunks"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._offset = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def drain(self):
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+
+def iter_zip(files):
+    """
+    Zip files into a stream of byte chunks without holding the archive anywhere
+
+    Args:
+        files (list): (path, arcname) pairs
+
+    Yields:
+        bytes: The archive, chunk by chunk
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path, arcname in files:
+            large = os.path.getsize(path) > 2 ** 31
+            with open(path, "rb") as source, archive.open(arcname, "w", force_zip64=large) as target:
+                for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                    target.write(chunk)
+                    yield from sink.drain()
+            yield from sink.drain()
+    yield from sink.drain()
+
+
+class SmtpPool:
+    """One authenticated SMTP connection kept open and reused across sends"""
+
+    def __init__(self, config, timeout=30):
+        self.config = config
+        self.timeout = timeout
+        self._server = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        server = smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port'], timeout=self.timeout)
+        server.ehlo()
+        if self.config.get('use_tls', True):
+            server.starttls()
+            server.ehlo()
+        # Local stand-ins (aiosmtpd, MailHog) don't offer AUTH
+        if server.has_extn('auth'):
+            server.login(self.config['sender_email'], self.config['sender_password'])
+        return server
+
+    def acquire(self):
+        """Return the open connection after a NOOP check, reconnecting if it has dropped"""
+        with self._lock:
+            if self._server is not None:
+                try:
+                    if self._server.noop()[0] == 250:
+                        return self._server
+                except smtplib.SMTPException:
+                    pass
+                except OSError:
+                    pass
+                self._discard()
+            self._server = self._connect()
+            return self._server
+
+    def _discard(self):
+        try:
+            self._server.close()
+        except Exception:
+            pass
+        self._server = None
+
+    def close(self):
+        with self._lock:
+            if self._server is not None:
+                try:
+                    self._server.quit()
+                except Exception:
+                    pass
+                self._discard()
+
+
 class EmailSender:
     """Email utility for sending Allure test reports"""
     
@@ -16,10 +123,13 @@ class EmailSender:
         Initialize email sender with configuration
         
         Args:
-            config (dict): Email configuration dictionary
+            config (dict): Email configuration dictionary. recipient_email may list
+                several addresses separated by commas; max_attachment_mb sets the
+                size budget
         """
         self.config = config or self._get_default_config()
         self.logger = logging.getLogger(__name__)
+        self.pool = SmtpPool(self.config)
     
     def _get_default_config(self):
         """Get default email configuration"""
@@ -32,10 +142,23 @@ class EmailSender:
             'use_tls': True
         }
     
+    @property
+    def recipients(self):
+        return [address.strip() for address in self.config['recipient_email'].split(',') if address.strip()]
+    
+    @property
+    def max_attachment_bytes(self):
+        return int(float(self.config.get('max_attachment_mb', DEFAULT_MAX_ATTACHMENT_MB)) * 1024 * 1024)
+    
     def send_allure_report(self, allure_results_dir, allure_report_dir, test_summary=None):
         """
         Send Allure report via email
         
+        The report is zipped as a stream into a temporary file and base64-encoded
+        from there onto the SMTP connection, so memory use does not grow with the
+        report. A report over the size budget is replaced by a summary (failing
+        tests in the body, the report's index.html attached).
+        
         Args:
             allure_results_dir (str): Path to allure-results directory
             allure_report_dir (str): Path to allure-report directory
@@ -45,39 +168,97 @@ class EmailSender:
             bool: True if email sent successfully, False otherwise
         """
         try:
-            # Create ZIP file of the report
-            zip_path = self._create_report_zip(allure_report_dir)
-            
-            # Prepare email content
+            files = self._collect_report_files(allure_report_dir)
             subject = self._generate_subject(test_summary)
             body = self._generate_email_body(test_summary)
             
-            # Send email
-            success = self._send_email(subject, body, zip_path)
-            
-            # Clean up ZIP file
-            if os.path.exists(zip_path):
-                os.remove(zip_path)
-            
-            return success
+            with tempfile.TemporaryFile() as archive:
+                if self._spool_archive(files, archive):
+                    archive.seek(0)
+                    attachment = (f"{os.path.basename(os.path.normpath(allure_report_dir))}.zip",
+                                  "application/zip", iter(lambda: archive.read(CHUNK_SIZE), b""))
+                else:
+                    self.logger.warning(f"Report exceeds {self.max_attachment_bytes // (1024 * 1024)} MB, "
+                                        "sending a summary instead")
+                    body += self._failure_summary(allure_results_dir)
+                    attachment = self._summary_attachment(allure_report_dir)
+                return self._send_email(subject, body, attachment)
             
         except Exception as e:
             self.logger.error(f"Failed to send Allure report: {e}")
             return False
     
-    def _create_report_zip(self, report_dir):
-        """Create ZIP file of the Allure report"""
-        zip_path = f"{report_dir}.zip"
+    # -- report payload ---------------------------------------------------------
+    
+    @staticmethod
+    def _collect_report_files(report_dir):
+        """
+        List every file of the report, so the attached ZIP opens on its own
+        
+        Returns:
+            list: (path, arcname) pairs
+        """
+        files = []
+        for root, dirs, filenames in os.walk(report_dir):
+            dirs.sort()
+            for filename in sorted(filenames):
+                path = os.path.join(root, filename)
+                files.append((path, os.path.relpath(path, report_dir)))
+        return files
+    
+    def _spool_archive(self, files, target):
+        """
+        Stream the zip into target, stopping as soon as it passes the size budget
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(report_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, report_dir)
-                    zipf.write(file_path, arcname)
+        Returns:
+            bool: True if the whole archive fits the budget
+        """
+        size = 0
+        stream = iter_zip(files)
+        try:
+            for chunk in stream:
+                size += len(chunk)
+                if size > self.max_attachment_bytes:
+                    return False
+                target.write(chunk)
+        finally:
+            stream.close()
+        self.logger.info(f"Report archive: {size / 1024:.0f} KB")
+        return True
+    
+    def _failure_summary(self, results_dir, limit=50):
+        from utils.allure_report import parse_result
         
-        self.logger.info(f"Created ZIP file: {zip_path}")
-        return zip_path
+        failures = []
+        if os.path.isdir(results_dir):
+            for name in sorted(os.listdir(results_dir)):
+                if not name.endswith("-result.json"):
+                    continue
+                try:
+                    record = parse_result(os.path.join(results_dir, name))
+                except (OSError, ValueError):
+                    continue
+                if record["status"] in ("failed", "broken"):
+                    message = (record["message"] or "").strip().splitlines()
+                    failures.append(f"• {record['name']}: {message[0][:200] if message else record['status']}")
+        text = "\n⚠️ The full report was too large to attach; its index page is attached instead.\n"
+        if failures:
+            text += f"\n❌ Failing tests ({len(failures)}):\n" + "\n".join(failures[:limit]) + "\n"
+            if len(failures) > limit:
+                text += f"... and {len(failures) - limit} more\n"
+        return text
+    
+    def _summary_attachment(self, report_dir):
+        index = os.path.join(report_dir, "index.html")
+        if not os.path.isfile(index) or os.path.getsize(index) > self.max_attachment_bytes:
+            return None
+        f = open(index, "rb")
+        
+        def chunks():
+            with f:
+                yield from iter(lambda: f.read(CHUNK_SIZE), b"")
+        
+        return "report-summary.html", "text/html", chunks()
     
     def _generate_subject(self, test_summary):
         """Generate email subject"""
@@ -139,69 +320,99 @@ Olarm Mobile Automation Team
         
         return body
     
-    def _send_email(self, subject, body, attachment_path):
-        """Send email with attachment"""
+    # -- delivery ---------------------------------------------------------------
+    
+    def _send_email(self, subject, body, attachment=None):
+        """
+        Send one message per recipient over the pooled connection
+        
+        The MIME body is written once to a temporary file with the attachment
+        base64-encoded chunk by chunk, then streamed to each recipient.
+        
+        Args:
+            attachment (tuple): (filename, content type, iterator of byte chunks) or None
+        """
+        boundary = f"==============={uuid.uuid4().hex}=="
         try:
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = self.config['sender_email']
-            msg['To'] = self.config['recipient_email']
-            msg['Subject'] = subject
-            
-            # Add body
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Add attachment
-            if os.path.exists(attachment_path):
-                with open(attachment_path, "rb") as attachment:
-                    part = MIMEBase('application', 'zip')
-                    part.set_payload(attachment.read())
-                
-                encoders.encode_base64(part)
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename= {os.path.basename(attachment_path)}'
-                )
-                msg.attach(part)
-            
-            # Send email
-            server = smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port'])
-            
-            if self.config.get('use_tls', True):
-                server.starttls()
-            
-            server.login(self.config['sender_email'], self.config['sender_password'])
-            text = msg.as_string()
-            server.sendmail(self.config['sender_email'], self.config['recipient_email'], text)
-            server.quit()
-            
-            self.logger.info(f"Email sent successfully to {self.config['recipient_email']}")
+            with tempfile.TemporaryFile() as message:
+                self._write_mime_parts(message, boundary, body, attachment)
+                for recipient in self.recipients:
+                    message.seek(0)
+                    self._deliver(recipient, subject, boundary, message)
+                    self.logger.info(f"Email sent successfully to {recipient}")
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to send email: {e}")
+            self.pool.close()  # a failure mid-DATA leaves the connection unusable
             return False
     
+    def _write_mime_parts(self, target, boundary, body, attachment):
+        target.write(f"--{boundary}\r\nContent-Type: text/plain; charset=\"utf-8\"\r\n"
+                     "Content-Transfer-Encoding: base64\r\n\r\n".encode())
+        target.write(base64.encodebytes(body.encode("utf-8")).replace(b"\n", b"\r\n"))
+        if attachment is not None:
+            filename, content_type, chunks = attachment
+            target.write(f"--{boundary}\r\nContent-Type: {content_type}; name=\"{filename}\"\r\n"
+                         "Content-Transfer-Encoding: base64\r\n"
+                         f"Content-Disposition: attachment; filename=\"{filename}\"\r\n\r\n".encode())
+            pending = b""
+            for chunk in chunks:
+                pending += chunk
+                whole = len(pending) - len(pending) % 57
+                if whole >= CHUNK_SIZE:
+                    target.write(base64.encodebytes(pending[:whole]).replace(b"\n", b"\r\n"))
+                    pending = pending[whole:]
+            if pending:
+                target.write(base64.encodebytes(pending).replace(b"\n", b"\r\n"))
+        target.write(f"--{boundary}--\r\n".encode())
+    
+    def _deliver(self, recipient, subject, boundary, message):
+        sender = self.config['sender_email']
+        headers = (f"From: {sender}\r\nTo: {recipient}\r\n"
+                   f"Subject: {Header(subject, 'utf-8').encode()}\r\n"
+                   f"Date: {formatdate(localtime=True)}\r\nMessage-ID: {make_msgid()}\r\n"
+                   f"MIME-Version: 1.0\r\nContent-Type: multipart/mixed; boundary=\"{boundary}\"\r\n\r\n")
+        
+        server = self.pool.acquire()
+        code, response = server.mail(sender)
+        if code != 250:
+            raise smtplib.SMTPSenderRefused(code, response, sender)
+        code, response = server.rcpt(recipient)
+        if code not in (250, 251):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused({recipient: (code, response)})
+        # smtplib.data() needs the whole message in memory; stream it instead.
+        # Every line is a header, a boundary or base64, so none needs dot-stuffing.
+        server.putcmd("data")
+        code, response = server.getreply()
+        if code != 354:
+            raise smtplib.SMTPDataError(code, response)
+        server.send(headers.encode())
+        for chunk in iter(lambda: message.read(CHUNK_SIZE), b""):
+            server.send(chunk)
+        server.send(b".\r\n")
+        code, response = server.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, response)
+    
     def update_config(self, **kwargs):
         """Update email configuration"""
         self.config.update(kwargs)
+        self.close()
+        self.pool = SmtpPool(self.config)
     
     def test_connection(self):
-        """Test email connection"""
+        """Test email connection (the connection stays open for the next send)"""
         try:
-            server = smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port'])
-            
-            if self.config.get('use_tls', True):
-                server.starttls()
-            
-            server.login(self.config['sender_email'], self.config['sender_password'])
-            server.quit()
-            
+            self.pool.acquire()
             self.logger.info("Email connection test successful")
             return True
             
         except Exception as e:
             self.logger.error(f"Email connection test failed: {e}")
             return False
-
-
+    
+    def close(self):
+        """Close the pooled SMTP connection"""
+        self.pool.close()
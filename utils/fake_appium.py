@@ -0,0 +1,654 @@
+"""
+Local stand-in for an Appium (W3C WebDriver) server
+
+Serves recorded UiAutomator2 page sources from a declarative screen graph so the
+page objects and helpers can run without a device:
+
+    {
+      "start": "landing",
+      "screens": {
+        "landing": {
+          "source": "landing.xml",
+          "transitions": [
+            {"on": ["-android uiautomator", "new UiSelector().description(\\"Login\\")"], "to": "login"}
+          ]
+        },
+        "login": {
+          "source": "login.xml",
+          "transitions": [
+            {"on": ["accessibility id", "Login"], "to": "my_devices",
+             "when": [{"locator": ["xpath", "//android.widget.EditText[2]"], "text_matches": ".+"}]},
+            {"on": ["accessibility id", "Login"], "to": "login_error"}
+          ]
+        }
+      }
+    }
+
+Finds (UiSelector, XPath, accessibility id, id, class name) are answered from the
+current screen's XML with the same engine as PageSnapshot; a UiScrollable
+scrollIntoView query finds its target anywhere inside the scrollable container,
+since a recorded source already holds the whole list. A click or W3C tap on
+a node that matches a transition's "on" locator (or a tap inside it) moves to the
+next screen; "to": "back" returns to the previous one. A "set" transition edits
+the matched node's attributes in place instead (e.g. a zone's "Bypass" button
+turning into "Reset"), or the nodes matching its "target" locator on the screen
+it ends on. Typed text is written into the live XML too, so "when" guards and
+get_attribute("text") see it; edits last until clearApp. An "edit" transition
+fires when text is typed into a node matching its locator (e.g. the login error
+hiding once an input changes).
+
+    with FakeAppiumServer(ScreenGraph.load("testdata/screens/graph.json")) as server:
+        driver = init_driver(server_url=server.url)
+
+or from the command line: python -m utils.fake_appium testdata/screens/graph.json --port 4723
+"""
+
+import argparse
+import base64
+import itertools
+import json
+import os
+import re
+import socket
+import threading
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+from utils.page_snapshot import PageSnapshot, UnsupportedLocator
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_GRAPH = os.path.join(PROJECT_ROOT, "testdata", "screens", "graph.json")
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+KEYCODE_BACK = 4
+
+_UISCROLLABLE = "new UiScrollable("
+_SCROLL_INTO_VIEW = ".scrollIntoView("
+
+# 1x1 transparent PNG returned for screenshots
+_BLANK_PNG = base64.b64encode(bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c63000100000500010d0a2db40000000049454e44ae426082"
+)).decode()
+
+# get_attribute() names -> page source attributes
+_ATTRIBUTE_ALIASES = {
+    "contentDescription": "content-desc",
+    "content-desc": "content-desc",
+    "resourceId": "resource-id",
+    "resource-id": "resource-id",
+    "className": "class",
+    "class": "class",
+    "longClickable": "long-clickable",
+}
+
+
+class WebDriverError(Exception):
+    """A W3C error response"""
+
+    def __init__(self, status, error, message):
+        super().__init__(message)
+        self.status = status
+        self.error = error
+
+
+def no_such_element(message):
+    return WebDriverError(404, "no such element", message)
+
+
+class ScreenGraph:
+    """Screens (recorded page sources) and the clicks that move between them"""
+
+    def __init__(self, screens, start):
+        """
+        Args:
+            screens (dict): name -> {"source": xml string, "transitions": [...]}
+            start (str): Screen shown after launch / clearApp
+        """
+        if start not in screens:
+            raise ValueError(f"Start screen '{start}' is not defined")
+        for name, screen in screens.items():
+            for transition in screen.get("transitions", []):
+                target = transition.get("to", "back")
+                if target != "back" and target not in screens:
+                    raise ValueError(f"Screen '{name}' has a transition to unknown screen '{target}'")
+        self.screens = screens
+        self.start = start
+
+    @classmethod
+    def load(cls, path=DEFAULT_GRAPH):
+        """Load a graph file; "source" entries are XML file names relative to it"""
+        with open(path) as f:
+            data = json.load(f)
+        base_dir = os.path.dirname(os.path.abspath(path))
+        screens = {}
+        for name, screen in data["screens"].items():
+            source = screen["source"]
+            if not source.lstrip().startswith("<"):
+                with open(os.path.join(base_dir, source), encoding="utf-8") as f:
+                    source = f.read()
+            screens[name] = {**screen, "source": source}
+        return cls(screens, data["start"])
+
+    def source(self, screen):
+        return self.screens[screen]["source"]
+
+    def transitions(self, screen):
+        return self.screens[screen].get("transitions", [])
+
+
+def _split_xpath_union(xpath):
+    # Split on top-level '|' (not inside predicates or quotes)
+    parts = []
+    depth = 0
+    quote = None
+    current = []
+    for char in xpath:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return [part for part in parts if part]
+
+
+def _split_uiscrollable(expression):
+    """(container, target) UiSelectors of 'new UiScrollable(<container>)...scrollIntoView(<target>)', else None"""
+    expression = expression.strip()
+    if not expression.startswith(_UISCROLLABLE) or not expression.endswith(")"):
+        return None
+    depth = 0
+    for position in range(len(_UISCROLLABLE) - 1, len(expression)):
+        depth += {"(": 1, ")": -1}.get(expression[position], 0)
+        if depth == 0:
+            break
+    container = expression[len(_UISCROLLABLE):position]
+    start = expression.find(_SCROLL_INTO_VIEW, position)
+    if start < 0:
+        return None
+    return container, expression[start + len(_SCROLL_INTO_VIEW):-1]
+
+
+class FakeSession:
+    """One driver session walking the screen graph"""
+
+    def __init__(self, graph, capabilities):
+        self.id = uuid.uuid4().hex
+        self.graph = graph
+        self.capabilities = capabilities
+        self.app_running = True
+        self.history = []
+        self.live_sources = {}
+        self._visits = itertools.count(1)
+        self.lock = threading.Lock()
+        self.goto(graph.start, remember=False)
+
+    # -- screen state -------------------------------------------------------
+
+    def goto(self, screen, remember=True):
+        if remember:
+            self.history.append(self.screen)
+        self.screen = screen
+        self.visit = next(self._visits)
+        self.snapshot = PageSnapshot(self.live_sources.get(screen) or self.graph.source(screen))
+
+    def back(self):
+        if self.history:
+            self.goto(self.history.pop(), remember=False)
+
+    def reset(self):
+        self.history = []
+        self.live_sources = {}
+        self.app_running = True
+        self.goto(self.graph.start, remember=False)
+
+    @property
+    def source(self):
+        return self.snapshot.source if self.app_running else "<hierarchy/>"
+
+    def _set_attributes(self, node, attributes):
+        # Structure is unchanged, so node orders (and element ids) stay valid.
+        # The edited screen is kept until clearApp, like app state would be.
+        for name, value in attributes.items():
+            node.element.set(name, value)
+        source = ET.tostring(self.snapshot.root, encoding="unicode")
+        self.live_sources[self.screen] = source
+        self.snapshot = PageSnapshot(source)
+
+    # -- elements -----------------------------------------------------------
+
+    def element_id(self, node):
+        return f"{self.visit}-{node.order}"
+
+    def node(self, element_id):
+        visit, _, order = element_id.partition("-")
+        if int(visit) != self.visit:
+            raise WebDriverError(404, "stale element reference", f"Element {element_id} is no longer on screen")
+        return self.snapshot.nodes[int(order)]
+
+    def find(self, by, value, within=None):
+        if not self.app_running:
+            return []
+        try:
+            scroll = _split_uiscrollable(value) if by == AppiumBy.ANDROID_UIAUTOMATOR else None
+            if scroll is not None:
+                nodes = self._find_scrollable(*scroll)
+            elif by == AppiumBy.XPATH:
+                nodes = self._find_xpath(value, within)
+            else:
+                nodes = self.snapshot.find_all(by, value)
+                if within is not None:
+                    inside = {node.order for node in within.descendants()}
+                    nodes = [node for node in nodes if node.order in inside]
+        except UnsupportedLocator as e:
+            raise WebDriverError(400, "invalid selector", str(e))
+        return nodes
+
+    def _find_scrollable(self, container, target):
+        # Recorded sources hold the whole list, so "scrolling" is a search inside the container
+        for scrollable in self.snapshot.find_all(AppiumBy.ANDROID_UIAUTOMATOR, container):
+            inside = {node.order for node in scrollable.descendants()}
+            nodes = [node for node in self.snapshot.find_all(AppiumBy.ANDROID_UIAUTOMATOR, target)
+                     if node.order in inside]
+            if nodes:
+                return nodes[:1]
+        return []
+
+    def _find_xpath(self, xpath, within):
+        found = {}
+        for part in _split_xpath_union(xpath):
+            if within is not None and part.startswith("."):
+                elements = within.element.findall(part)
+                index = {node.element: node for node in within.descendants()}
+                nodes = [index[element] for element in elements if element in index]
+            else:
+                nodes = self.snapshot.find_all(AppiumBy.XPATH, part)
+            for node in nodes:
+                found[node.order] = node
+        return [found[order] for order in sorted(found)]
+
+    # -- interaction --------------------------------------------------------
+
+    def click(self, node):
+        chain = []
+        current = node
+        while current is not None and current.parent is not None:
+            chain.append(current.order)
+            current = current.parent
+
+        for transition in self.graph.transitions(self.screen):
+            if "on" not in transition:
+                continue
+            targets = {match.order for match in self.snapshot.find_all(*transition["on"])}
+            if not targets.intersection(chain) or not self._guards_pass(transition.get("when", [])):
+                continue
+            self._follow(transition, next(order for order in chain if order in targets))
+            return True
+        return False
+
+    def _edited(self, node):
+        for transition in self.graph.transitions(self.screen):
+            if "edit" not in transition:
+                continue
+            targets = {match.order for match in self.snapshot.find_all(*transition["edit"])}
+            if node.order in targets and self._guards_pass(transition.get("when", [])):
+                self._follow(transition, node.order)
+                return
+
+    def _follow(self, transition, matched):
+        if "set" in transition and "target" not in transition:
+            self._set_attributes(self.snapshot.nodes[matched], transition["set"])
+        if transition.get("to") == "back":
+            self.back()
+        elif "to" in transition:
+            self.goto(transition["to"])
+        if "target" in transition:
+            # Each edit re-parses the screen, so look the nodes up by order again
+            for order in [node.order for node in self.snapshot.find_all(*transition["target"])]:
+                self._set_attributes(self.snapshot.nodes[order], transition["set"])
+
+    def _guards_pass(self, guards):
+        for guard in guards:
+            match = self.snapshot.find(*guard["locator"])
+            text = match.text if match is not None else None
+            if "text_matches" in guard and (text is None or not re.fullmatch(guard["text_matches"], text)):
+                return False
+            if "present" in guard and (match is not None) != guard["present"]:
+                return False
+        return True
+
+    def tap(self, x, y):
+        hit = None
+        for node in self.snapshot.nodes:
+            bounds = node.bounds
+            if bounds and bounds[0] <= x < bounds[2] and bounds[1] <= y < bounds[3] and node.displayed:
+                hit = node  # later in document order = deeper / on top
+        if hit is not None:
+            self.click(hit)
+
+    def type(self, node, text):
+        self._set_attributes(node, {"text": node.text + text})
+        self._edited(node)
+
+    def clear(self, node):
+        self._set_attributes(node, {"text": ""})
+        self._edited(node)
+
+    def replace(self, node, text):
+        self._set_attributes(node, {"text": text})
+        self._edited(node)
+
+    def perform_actions(self, actions):
+        for source in actions:
+            if source.get("type") != "pointer":
+                continue
+            x = y = 0
+            start = None
+            for action in source.get("actions", []):
+                kind = action.get("type")
+                if kind == "pointerMove":
+                    origin = action.get("origin", "viewport")
+                    if isinstance(origin, dict):
+                        center = self.node(origin[ELEMENT_KEY]).center or (0, 0)
+                        x, y = center[0] + action.get("x", 0), center[1] + action.get("y", 0)
+                    elif origin == "pointer":
+                        x, y = x + action.get("x", 0), y + action.get("y", 0)
+                    else:
+                        x, y = action.get("x", 0), action.get("y", 0)
+                elif kind == "pointerDown":
+                    start = (x, y)
+                elif kind == "pointerUp" and start is not None:
+                    # Swipes have no recorded effect; a press that stays put is a tap
+                    if abs(x - start[0]) <= 10 and abs(y - start[1]) <= 10:
+                        self.tap(x, y)
+                    start = None
+
+
+class FakeAppiumServer:
+    """Threaded HTTP server implementing the W3C/Appium commands the page objects use"""
+
+    def __init__(self, graph=None, host="127.0.0.1", port=0, latency=0.0):
+        """
+        Args:
+            graph (ScreenGraph): Screens to serve (defaults to testdata/screens/graph.json)
+            host (str): Interface to bind
+            port (int): Port to bind (0 = any free port)
+            latency (float): Seconds added to every command, to mimic a real device
+        """
+        self.graph = graph or ScreenGraph.load()
+        self.latency = latency
+        self.sessions = {}
+        self.commands = Counter()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/wd/hub"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-appium", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def show(self, screen, session_id=None, reset=False):
+        """
+        Put a session (default: every session) on a screen, e.g. a system dialog
+        that no click in the graph leads to; "back" returns to the previous screen.
+        reset=True first drops the edits earlier commands made to the screens.
+        """
+        for session in list(self.sessions.values()):
+            if session_id in (None, session.id):
+                with session.lock:
+                    if reset:
+                        session.reset()
+                    session.goto(screen)
+
+    # -- command dispatch ---------------------------------------------------
+
+    def handle(self, method, path, body):
+        """
+        Run one command
+
+        Returns:
+            tuple: (HTTP status, response value)
+        """
+        path = path.split("?", 1)[0].rstrip("/")
+        match = re.search(r"/(status|session)(/.*)?$", path)
+        if not match:
+            raise WebDriverError(404, "unknown command", f"Unknown path {path}")
+        if match.group(1) == "status":
+            return {"ready": True, "message": "fake appium ready", "build": {"version": "fake"}}
+
+        rest = (match.group(2) or "").strip("/").split("/") if match.group(2) else []
+        if not rest:
+            if method != "POST":
+                raise WebDriverError(404, "unknown command", f"{method} /session")
+            self.commands["newSession"] += 1
+            return self._new_session(body)
+
+        session = self.sessions.get(rest[0])
+        if session is None:
+            raise WebDriverError(404, "invalid session id", f"No session {rest[0]}")
+        command = rest[1:]
+        if not command and method == "DELETE":
+            self.commands["deleteSession"] += 1
+            del self.sessions[session.id]
+            return None
+
+        if self.latency:
+            time.sleep(self.latency)
+        with session.lock:
+            return self._session_command(session, method, command, body)
+
+    def _new_session(self, body):
+        capabilities = body.get("capabilities", {}).get("alwaysMatch", {}) or body.get("desiredCapabilities", {})
+        capabilities = {**capabilities, "platformName": "Android", "automationName": "UiAutomator2",
+                        "deviceName": "fake", "udid": capabilities.get("appium:udid") or "fake-device"}
+        session = FakeSession(self.graph, capabilities)
+        self.sessions[session.id] = session
+        return {"sessionId": session.id, "capabilities": capabilities}
+
+    def _session_command(self, session, method, command, body):
+        name = "/".join(part if not re.fullmatch(r"\d+-\d+", part) else ":id" for part in command)
+        self.commands[f"{method} {name}"] += 1
+
+        if command in (["element"], ["elements"]) and method == "POST":
+            return self._find(session, body, command[0] == "elements")
+        if command[:1] == ["element"] and len(command) >= 3:
+            return self._element_command(session, method, command[1], command[2:], body)
+        if command == ["source"]:
+            return session.source
+        if command == ["screenshot"]:
+            return _BLANK_PNG
+        if command == ["timeouts"]:
+            return None
+        if command[:1] == ["window"] and method == "GET":
+            width = int(session.snapshot.root.get("width", 1080))
+            height = int(session.snapshot.root.get("height", 2400))
+            return {"x": 0, "y": 0, "width": width, "height": height}
+        if command == ["actions"]:
+            if method == "POST":
+                session.perform_actions(body.get("actions", []))
+            return None
+        if command == ["back"]:
+            session.back()
+            return None
+        if command[:1] == ["execute"]:
+            return self._execute(session, body.get("script", ""), (body.get("args") or [{}])[0])
+        if command[:1] == ["appium"]:
+            return self._appium_command(session, command[-1], body)
+        raise WebDriverError(404, "unknown command", f"{method} /{name} is not implemented by the fake server")
+
+    def _find(self, session, body, multiple, within=None):
+        nodes = session.find(body["using"], body["value"], within)
+        if multiple:
+            return [{ELEMENT_KEY: session.element_id(node)} for node in nodes]
+        if not nodes:
+            raise no_such_element(f"No element matches {body['using']}={body['value']!r} on '{session.screen}'")
+        return {ELEMENT_KEY: session.element_id(nodes[0])}
+
+    def _element_command(self, session, method, element_id, command, body):
+        node = session.node(element_id)
+        action = command[0]
+        if action in ("element", "elements") and method == "POST":
+            return self._find(session, body, action == "elements", within=node)
+        if action == "click":
+            session.click(node)
+            return None
+        if action == "value":
+            session.type(node, body.get("text") or "".join(body.get("value", [])))
+            return None
+        if action == "clear":
+            session.clear(node)
+            return None
+        if action == "text":
+            return node.text
+        if action == "name":
+            return node.class_name
+        if action == "displayed":
+            return node.displayed
+        if action == "enabled":
+            return node.enabled
+        if action == "selected":
+            return node.flag("selected")
+        if action in ("rect", "location", "size"):
+            rect = node.rect or {"x": 0, "y": 0, "width": 0, "height": 0}
+            return rect
+        if action == "attribute":
+            attribute = _ATTRIBUTE_ALIASES.get(command[1], command[1])
+            if attribute == "class":
+                return node.class_name
+            return node.get(attribute)
+        if action == "screenshot":
+            return _BLANK_PNG
+        raise WebDriverError(404, "unknown command", f"Element command '{action}' is not implemented")
+
+    def _execute(self, session, script, args):
+        if script in ("mobile: clearApp",):
+            session.reset()
+        elif script == "mobile: terminateApp":
+            session.app_running = False
+        elif script == "mobile: activateApp":
+            if not session.app_running:
+                session.reset()
+        elif script == "mobile: pressKey" and args.get("keycode") == KEYCODE_BACK:
+            session.back()
+        elif script == "mobile: clickGesture":
+            if args.get("elementId"):
+                session.click(session.node(args["elementId"]))
+            else:
+                session.tap(args.get("x", 0), args.get("y", 0))
+        elif script == "mobile: replaceElementValue":
+            session.replace(session.node(args["elementId"]), args.get("text", ""))
+        elif script in ("mobile: scrollGesture", "mobile: flingGesture"):
+            return False  # Recorded screens have nothing more to scroll to
+        elif script == "mobile: shell":
+            return ""
+        return None
+
+    def _appium_command(self, session, command, body):
+        if command in ("app_installed", "is_keyboard_shown"):
+            return command == "app_installed"
+        if command == "terminate_app":
+            session.app_running = False
+            return True
+        if command == "activate_app":
+            if not session.app_running:
+                session.reset()
+            return None
+        if command == "app_state":
+            return 4 if session.app_running else 1
+        if command == "remove_app":
+            session.app_running = False
+            return True
+        if command == "install_app":
+            return None
+        if command == "press_keycode" and body.get("keycode") == KEYCODE_BACK:
+            session.back()
+        return None
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            # Headers and body go out in separate writes; don't let Nagle hold the body back
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def _respond(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw) if raw else {}
+                status, value = 200, server.handle(self.command, self.path, body)
+            except WebDriverError as e:
+                status, value = e.status, {"error": e.error, "message": str(e), "stacktrace": ""}
+            except Exception as e:
+                status, value = 500, {"error": "unknown error", "message": f"{type(e).__name__}: {e}", "stacktrace": ""}
+
+            payload = json.dumps({"value": value}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_DELETE = _respond
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded screens as a fake Appium server")
+    parser.add_argument("graph", nargs="?", default=DEFAULT_GRAPH, help="Screen graph JSON file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4723)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every command")
+    args = parser.parse_args()
+
+    server = FakeAppiumServer(ScreenGraph.load(args.graph), args.host, args.port, args.latency)
+    print(f"🤖 Fake Appium server on {server.url} (start screen: {server.graph.start})")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Self-learning resolver for multi-locator fallback chains
+
+Elements that moved between app versions are looked up with a list of candidate
+locators. Trying them one by one pays a failed find (plus implicit timeouts) for
+every miss, so the resolver:
+
+  * remembers which locator matched for (screen, element, app version) and tries
+    that one first - a known version resolves in a single find;
+  * on a miss, merges the whole chain into one combined UiAutomator query
+    (selectors joined with ';') and one XPath union ('|') instead of N finds;
+  * persists the ranking to .locator_rankings.json so the next run starts warm.
+"""
+
+import json
+import os
+import threading
+
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException
+
+from config.app_versions import get_latest_version
+from utils.page_snapshot import PageSnapshot, UnsupportedLocator
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RANKINGS_FILE = os.path.join(PROJECT_ROOT, ".locator_rankings.json")
+
+
+def default_app_version():
+    """App version under test: $APP_VERSION (an APP_VERSIONS key) or the latest build"""
+    return os.getenv("APP_VERSION") or get_latest_version()["version_name"]
+
+
+def locator_key(locator):
+    by, value = locator
+    return f"{by}::{value}"
+
+
+def _quote(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def combine_locators(locators):
+    """
+    Merge a fallback chain into as few queries as possible
+
+    UiAutomator selectors, accessibility ids and ids become one ';' separated
+    UiSelector query; XPaths become one '|' union. Other strategies are kept as is.
+
+    Args:
+        locators (list): (by, value) tuples
+
+    Returns:
+        list: Combined (by, value) locators, UiAutomator query first
+    """
+    selectors = []
+    xpaths = []
+    others = []
+    for by, value in locators:
+        if by == AppiumBy.ANDROID_UIAUTOMATOR:
+            selectors.append(value)
+        elif by == AppiumBy.ACCESSIBILITY_ID:
+            selectors.append(f"new UiSelector().description({_quote(value)})")
+        elif by == AppiumBy.ID:
+            selectors.append(f"new UiSelector().resourceId({_quote(value)})")
+        elif by == AppiumBy.XPATH:
+            xpaths.append(value)
+        else:
+            others.append((by, value))
+
+    combined = []
+    if selectors:
+        combined.append((AppiumBy.ANDROID_UIAUTOMATOR, ";".join(dict.fromkeys(selectors))))
+    if xpaths:
+        combined.append((AppiumBy.XPATH, " | ".join(dict.fromkeys(xpaths))))
+    return combined + others
+
+
+class LocatorResolver:
+    """Ranks fallback locators per (screen, element, app version) and remembers the winner"""
+
+    def __init__(self, path=RANKINGS_FILE):
+        self.path = path
+        self.rankings = self._load()
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def ranking_key(screen, element, app_version):
+        return f"{screen}/{element}@{app_version}"
+
+    def ranked(self, key, locators):
+        """Return the locators ordered by past hits (ties keep the declared order)"""
+        hits = self.rankings.get(key, {})
+        return sorted(locators, key=lambda locator: -hits.get(locator_key(locator), 0))
+
+    def record_hit(self, key, locator):
+        with self._lock:
+            hits = self.rankings.setdefault(key, {})
+            name = locator_key(locator)
+            hits[name] = hits.get(name, 0) + 1
+            self._dirty.add(key)
+
+    def record_miss(self, key, locator):
+        """Forget a cached winner that no longer matches (e.g. after an app update)"""
+        with self._lock:
+            self.rankings.get(key, {}).pop(locator_key(locator), None)
+            self._dirty.add(key)
+
+    def find(self, driver, screen, element, locators, app_version=None):
+        """
+        Resolve a logical element to a displayed WebElement
+
+        Args:
+            driver: Appium WebDriver instance
+            screen (str): Screen the element lives on, e.g. "landing"
+            element (str): Logical element name, e.g. "login_button"
+            locators (list): Fallback chain of (by, value) tuples, most likely first
+            app_version (str): Version under test (defaults to default_app_version())
+
+        Returns:
+            WebElement: The matching element
+
+        Raises:
+            NoSuchElementException: If no locator in the chain matches a displayed element
+        """
+        key = self.ranking_key(screen, element, app_version or default_app_version())
+
+        cached = None
+        if self.rankings.get(key):
+            cached = self.ranked(key, locators)[0]
+            try:
+                found = driver.find_element(*cached)
+                if found.is_displayed():
+                    self.record_hit(key, cached)
+                    return found
+            except Exception:
+                pass
+
+        for query in combine_locators(locators):
+            try:
+                matches = driver.find_elements(*query)
+            except Exception:
+                continue
+            if not any(match.is_displayed() for match in matches):
+                continue
+
+            # Learn which individual locator won so the next lookup is a single find
+            winner = self._identify_winner(driver, locators)
+            if winner is None:
+                return next(match for match in matches if match.is_displayed())
+            if cached is not None and cached != winner:
+                # The element is on screen but the cached locator no longer finds it
+                self.record_miss(key, cached)
+            self.record_hit(key, winner)
+            self.save()
+            return driver.find_element(*winner)
+
+        raise NoSuchElementException(f"No locator matched {screen}/{element}: {locators}")
+
+    def find_optional(self, driver, screen, element, locators, app_version=None):
+        """Like find() but returns None instead of raising"""
+        try:
+            return self.find(driver, screen, element, locators, app_version)
+        except NoSuchElementException:
+            return None
+
+    @staticmethod
+    def _identify_winner(driver, locators):
+        # First locator in declared order that matches a displayed node, as the old loop did
+        try:
+            snapshot = PageSnapshot.capture(driver)
+        except Exception:
+            return None
+        for locator in locators:
+            try:
+                if snapshot.is_visible(locator):
+                    return locator
+            except UnsupportedLocator:
+                continue
+        return None
+
+    def save(self):
+        """Merge the rankings touched by this process into the file (safe across xdist workers)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            merged = self._load()
+            for key in self._dirty:
+                if self.rankings.get(key):
+                    merged[key] = self.rankings[key]
+                else:
+                    merged.pop(key, None)
+            self._dirty.clear()
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(temp_path, "w") as f:
+                    json.dump(merged, f, indent=2, sort_keys=True)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"⚠️ Could not save locator rankings: {e}")
+
+
+locator_resolver = LocatorResolver()
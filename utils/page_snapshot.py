@@ -0,0 +1,397 @@
+import hashlib
+import re
+import time
+import xml.etree.ElementTree as ET
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+
+class UnsupportedLocator(Exception):
+    """Raised when a locator cannot be evaluated against a page-source snapshot"""
+
+
+class SnapshotNode:
+    """A single element of a parsed page source"""
+
+    __slots__ = ("element", "parent", "children", "order")
+
+    def __init__(self, element, parent, order):
+        self.element = element
+        self.parent = parent
+        self.children = []
+        self.order = order
+
+    def get(self, name, default=None):
+        return self.element.attrib.get(name, default)
+
+    @property
+    def tag(self):
+        return self.element.tag
+
+    @property
+    def text(self):
+        return self.get("text", "")
+
+    @property
+    def content_desc(self):
+        return self.get("content-desc", "")
+
+    @property
+    def resource_id(self):
+        return self.get("resource-id", "")
+
+    @property
+    def class_name(self):
+        return self.get("class", self.element.tag)
+
+    def flag(self, name, default=False):
+        value = self.get(name)
+        if value is None:
+            return default
+        return value == "true"
+
+    @property
+    def displayed(self):
+        # Older UiAutomator2 servers omit "displayed"; anything in the dump is on screen
+        return self.flag("displayed", default=True)
+
+    @property
+    def enabled(self):
+        return self.flag("enabled", default=True)
+
+    @property
+    def clickable(self):
+        return self.flag("clickable")
+
+    @property
+    def bounds(self):
+        """Return (left, top, right, bottom) or None if the node has no bounds"""
+        match = _BOUNDS_PATTERN.match(self.get("bounds", ""))
+        if not match:
+            return None
+        return tuple(int(value) for value in match.groups())
+
+    @property
+    def rect(self):
+        bounds = self.bounds
+        if not bounds:
+            return None
+        left, top, right, bottom = bounds
+        return {"x": left, "y": top, "width": right - left, "height": bottom - top}
+
+    @property
+    def center(self):
+        bounds = self.bounds
+        if not bounds:
+            return None
+        left, top, right, bottom = bounds
+        return (left + right) // 2, (top + bottom) // 2
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+    def __repr__(self):
+        return (f"SnapshotNode({self.tag}, text={self.text!r}, "
+                f"content-desc={self.content_desc!r}, resource-id={self.resource_id!r})")
+
+
+_BOUNDS_PATTERN = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+_DIGITS = re.compile(r"\d+")
+
+# UiSelector method -> (page source attribute, comparison)
+_UISELECTOR_ATTRIBUTES = {
+    "text": ("text", "equals"),
+    "textContains": ("text", "contains"),
+    "textStartsWith": ("text", "startswith"),
+    "textMatches": ("text", "matches"),
+    "description": ("content-desc", "equals"),
+    "descriptionContains": ("content-desc", "contains"),
+    "descriptionStartsWith": ("content-desc", "startswith"),
+    "descriptionMatches": ("content-desc", "matches"),
+    "resourceId": ("resource-id", "equals"),
+    "resourceIdMatches": ("resource-id", "matches"),
+    "className": ("class", "equals"),
+    "classNameMatches": ("class", "matches"),
+    "packageName": ("package", "equals"),
+    "packageNameMatches": ("package", "matches"),
+}
+
+_UISELECTOR_FLAGS = {
+    "clickable": "clickable",
+    "enabled": "enabled",
+    "checked": "checked",
+    "checkable": "checkable",
+    "focusable": "focusable",
+    "focused": "focused",
+    "scrollable": "scrollable",
+    "selected": "selected",
+    "longClickable": "long-clickable",
+}
+
+# XPath features ElementTree cannot evaluate
+_UNSUPPORTED_XPATH = re.compile(r"contains\(|starts-with\(|text\(\)|::|\bor\b|\band\b|^\(|\|")
+
+_NEW_SELECTOR = re.compile(r"\s*new\s+UiSelector\(\)")
+_SELECTOR_CALL = re.compile(r"\s*\.\s*(\w+)\s*\(\s*")
+_BARE_ARGUMENT = re.compile(r"[\w.\-]*")
+_CLOSE_CALL = re.compile(r"\s*\)")
+_SELECTOR_SEPARATOR = re.compile(r"\s*;?\s*")
+
+
+def parse_uiselector(expression):
+    """
+    Parse a UiSelector expression into a list of (method, argument) tuples
+
+    Args:
+        expression (str): e.g. 'new UiSelector().resourceId("button").instance(2)'
+
+    Returns:
+        list: One list of (method, argument) tuples per ';' separated selector
+
+    Raises:
+        UnsupportedLocator: If the expression uses anything other than plain UiSelector calls
+    """
+    selectors = []
+    position = 0
+    length = len(expression)
+
+    while position < length:
+        match = _NEW_SELECTOR.match(expression, position)
+        if not match:
+            raise UnsupportedLocator(f"Not a plain UiSelector expression: {expression}")
+        position = match.end()
+        calls = []
+
+        while True:
+            match = _SELECTOR_CALL.match(expression, position)
+            if not match:
+                break
+            method = match.group(1)
+            position = match.end()
+
+            if position < length and expression[position] == '"':
+                # Quoted string argument with backslash escapes
+                position += 1
+                chars = []
+                while position < length and expression[position] != '"':
+                    if expression[position] == "\\" and position + 1 < length:
+                        position += 1
+                    chars.append(expression[position])
+                    position += 1
+                argument = "".join(chars)
+                position += 1
+            else:
+                match = _BARE_ARGUMENT.match(expression, position)
+                token = match.group(0)
+                position = match.end()
+                if token in ("true", "false"):
+                    argument = token == "true"
+                elif re.fullmatch(r"-?\d+", token):
+                    argument = int(token)
+                else:
+                    raise UnsupportedLocator(f"Unsupported UiSelector argument '{token}' in {expression}")
+
+            match = _CLOSE_CALL.match(expression, position)
+            if not match:
+                raise UnsupportedLocator(f"Malformed UiSelector expression: {expression}")
+            position = match.end()
+
+            if (method not in _UISELECTOR_ATTRIBUTES and method not in _UISELECTOR_FLAGS
+                    and method not in ("instance", "index")):
+                raise UnsupportedLocator(f"Unsupported UiSelector method '{method}'")
+            calls.append((method, argument))
+
+        selectors.append(calls)
+        match = _SELECTOR_SEPARATOR.match(expression, position)
+        position = match.end()
+
+    if not selectors:
+        raise UnsupportedLocator(f"Empty UiSelector expression: {expression!r}")
+    return selectors
+
+
+class PageSnapshot:
+    """
+    Parsed, indexed copy of driver.page_source
+
+    One snapshot answers any number of UiSelector, XPath, accessibility-id, id and
+    class-name lookups locally, so multi-element verifications cost a single
+    HTTP round trip instead of one find (plus is_displayed) per element.
+    """
+
+    def __init__(self, source, taken_at=None):
+        """
+        Args:
+            source (str): Page source XML as returned by driver.page_source
+            taken_at (float): time.time() the source was captured (defaults to now)
+        """
+        self.source = source
+        self.taken_at = taken_at if taken_at is not None else time.time()
+        self.digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        self.root = ET.fromstring(source)
+        self.nodes = []
+        self._node_by_element = {}
+        self.by_resource_id = {}
+        self.by_content_desc = {}
+        self.by_text = {}
+        self.by_class = {}
+        self._layout_digest = None
+        self._index(self.root, None)
+
+    @classmethod
+    def capture(cls, driver):
+        """Fetch the page source once and build a snapshot from it"""
+        return cls(driver.page_source)
+
+    def _index(self, element, parent):
+        node = SnapshotNode(element, parent, len(self.nodes))
+        self._node_by_element[element] = node
+        if parent is not None:
+            parent.children.append(node)
+            self.nodes.append(node)
+            self.by_resource_id.setdefault(node.resource_id, []).append(node)
+            self.by_content_desc.setdefault(node.content_desc, []).append(node)
+            self.by_text.setdefault(node.text, []).append(node)
+            self.by_class.setdefault(node.class_name, []).append(node)
+        for child in element:
+            self._index(child, node)
+
+    @property
+    def age(self):
+        return time.time() - self.taken_at
+
+    @property
+    def layout_digest(self):
+        """
+        Hash of the visible structure with digits masked out
+
+        Ticking text such as " • 5 secs ago" does not change this digest, so it
+        can be compared between reads to decide whether the UI has settled.
+        """
+        if self._layout_digest is None:
+            digest = hashlib.sha1()
+            for node in self.nodes:
+                digest.update("|".join((
+                    node.tag,
+                    node.resource_id,
+                    _DIGITS.sub("#", node.content_desc),
+                    _DIGITS.sub("#", node.text),
+                    node.get("bounds", ""),
+                    node.get("checked", ""),
+                    node.get("selected", ""),
+                )).encode("utf-8"))
+            self._layout_digest = digest.hexdigest()
+        return self._layout_digest
+
+    def find_all(self, by, value):
+        """
+        Return every node matching a locator, in document order
+
+        Args:
+            by (str): AppiumBy strategy
+            value (str): Locator value
+
+        Returns:
+            list: Matching SnapshotNode objects
+
+        Raises:
+            UnsupportedLocator: If the locator cannot be answered from the snapshot
+        """
+        if by == AppiumBy.ANDROID_UIAUTOMATOR:
+            return self._find_uiselector(value)
+        if by == AppiumBy.XPATH:
+            return self._find_xpath(value)
+        if by == AppiumBy.ACCESSIBILITY_ID:
+            return list(self.by_content_desc.get(value, []))
+        if by == AppiumBy.ID:
+            return [node for node in self.nodes
+                    if node.resource_id == value or node.resource_id.endswith(f":id/{value}")]
+        if by == AppiumBy.CLASS_NAME:
+            return list(self.by_class.get(value, []))
+        raise UnsupportedLocator(f"Unsupported locator strategy: {by}")
+
+    def find(self, by, value):
+        """Return the first node matching a locator, or None"""
+        matches = self.find_all(by, value)
+        return matches[0] if matches else None
+
+    def is_visible(self, locator):
+        node = self.find(*locator)
+        return node is not None and node.displayed
+
+    def _candidates(self, calls):
+        # Narrow the search with an exact-match index when the selector has one
+        for method, argument in calls:
+            if method == "resourceId":
+                return self.by_resource_id.get(argument, [])
+            if method == "description":
+                return self.by_content_desc.get(argument, [])
+            if method == "text":
+                return self.by_text.get(argument, [])
+            if method == "className":
+                return self.by_class.get(argument, [])
+        return self.nodes
+
+    def _find_uiselector(self, expression):
+        results = []
+        seen = set()
+        for calls in parse_uiselector(expression):
+            instance = None
+            filters = []
+            for method, argument in calls:
+                if method == "instance":
+                    instance = argument
+                else:
+                    filters.append((method, argument))
+
+            matches = [node for node in self._candidates(calls)
+                       if all(_matches_uiselector_call(node, method, argument) for method, argument in filters)]
+            if instance is not None:
+                matches = matches[instance:instance + 1]
+
+            for node in matches:
+                if node.order not in seen:
+                    seen.add(node.order)
+                    results.append(node)
+        return sorted(results, key=lambda node: node.order)
+
+    def _find_xpath(self, xpath):
+        if _UNSUPPORTED_XPATH.search(xpath):
+            raise UnsupportedLocator(f"XPath not supported by snapshot engine: {xpath}")
+        path = xpath
+        if path.startswith("//"):
+            path = "." + path
+        elif path.startswith("/"):
+            # An absolute path's first step is the <hierarchy> root itself
+            first, slash, rest = path[1:].partition("/")
+            if first not in (self.root.tag, "*"):
+                raise UnsupportedLocator(f"XPath not supported by snapshot engine: {xpath}")
+            path = f"./{rest}" if slash else "."
+        try:
+            elements = self.root.findall(path)
+        except (SyntaxError, KeyError) as e:
+            raise UnsupportedLocator(f"XPath not supported by snapshot engine: {xpath} ({e})")
+        nodes = [self._node_by_element[element] for element in elements if element is not self.root]
+        return sorted(nodes, key=lambda node: node.order)
+
+
+def _matches_uiselector_call(node, method, argument):
+    if method == "index":
+        return node.get("index") == str(argument)
+    if method in _UISELECTOR_FLAGS:
+        return node.flag(_UISELECTOR_FLAGS[method]) == argument
+
+    attribute, comparison = _UISELECTOR_ATTRIBUTES[method]
+    if attribute == "class":
+        actual = node.class_name
+    else:
+        actual = node.get(attribute, "")
+    if comparison == "equals":
+        return actual == argument
+    if comparison == "contains":
+        return argument in actual
+    if comparison == "startswith":
+        return actual.startswith(argument)
+    return re.fullmatch(argument, actual) is not None
@@ -0,0 +1,163 @@
+"""
+Area and zone state parsed from one page_source dump
+
+Reading an area's status element by element costs a find for the card, a find
+for its texts and one .text call per text. parse_areas() and parse_zones()
+read the same information out of a single PageSnapshot instead:
+
+    snapshot = PageSnapshot.capture(driver)
+    areas = parse_areas(snapshot)        # [AreaState(label='Area 1', status='Disarmed', ...)]
+    zones = parse_zones(snapshot)        # [ZoneState(label='Zone 01', action='Bypass', ...)]
+"""
+
+AREA_STATUSES = ("armed", "stay armed", "sleep armed", "disarmed")
+# Zone rows end with one button whose label says what tapping it does
+ZONE_ACTIONS = ("Bypass", "Reset")
+
+
+def _center(bounds):
+    if not bounds:
+        return None
+    left, top, right, bottom = bounds
+    return (left + right) // 2, (top + bottom) // 2
+
+
+def _is_timestamp(text):
+    # " • Now", " • 5 secs ago", "12:04"
+    return "•" in text or "now" in text.lower() or ":" in text
+
+
+def _texts(node):
+    return [child.text.strip() for child in node.descendants() if child.text.strip()]
+
+
+class AreaState:
+    """One area card on the Areas tab"""
+
+    __slots__ = ("label", "status", "timestamp", "bounds")
+
+    def __init__(self, label, status, timestamp="", bounds=None):
+        """
+        Args:
+            label (str): Area name, e.g. "Area 1"
+            status (str): "Armed", "Stay Armed", "Sleep Armed" or "Disarmed", as shown
+            timestamp (str): Time of the last change as shown, e.g. " • Now" ("" if none)
+            bounds (tuple): (left, top, right, bottom) of the card
+        """
+        self.label = label
+        self.status = status
+        self.timestamp = timestamp
+        self.bounds = bounds
+
+    @property
+    def armed(self):
+        return self.status.lower() != "disarmed"
+
+    @property
+    def center(self):
+        return _center(self.bounds)
+
+    def as_dict(self):
+        """The {"label", "status", "time"} dict get_area_info_by_label has always returned"""
+        return {"label": self.label, "status": self.status, "time": self.timestamp}
+
+    def __eq__(self, other):
+        return isinstance(other, AreaState) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"AreaState(label={self.label!r}, status={self.status!r}, timestamp={self.timestamp!r})"
+
+
+class ZoneState:
+    """One row of the Zones tab"""
+
+    __slots__ = ("label", "action", "status", "timestamp", "bounds")
+
+    def __init__(self, label, action, status="", timestamp="", bounds=None):
+        """
+        Args:
+            label (str): Zone name, e.g. "Zone 01"
+            action (str): What the row's button offers: "Bypass" (active) or "Reset" (bypassed)
+            status (str): Any other status text on the row, e.g. "Open" ("" if none)
+            timestamp (str): Time of the last change as shown ("" if none)
+            bounds (tuple): (left, top, right, bottom) of the Bypass/Reset button
+        """
+        self.label = label
+        self.action = action
+        self.status = status
+        self.timestamp = timestamp
+        self.bounds = bounds
+
+    @property
+    def bypassed(self):
+        return self.action == "Reset"
+
+    @property
+    def center(self):
+        """Where to tap the Bypass/Reset button"""
+        return _center(self.bounds)
+
+    def __eq__(self, other):
+        return isinstance(other, ZoneState) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"ZoneState(label={self.label!r}, action={self.action!r}, status={self.status!r})"
+
+
+def parse_areas(snapshot):
+    """
+    Every area card in a snapshot of the Areas tab, in screen order
+
+    A card is the parent of a text reading one of AREA_STATUSES; its first other
+    text is the label and a text with "•", "now" or ":" is the timestamp.
+
+    Returns:
+        list: AreaState records
+    """
+    areas = []
+    seen = set()
+    for node in snapshot.nodes:
+        card = node.parent
+        if node.text.strip().lower() not in AREA_STATUSES or card is None or card.order in seen:
+            continue
+        seen.add(card.order)
+        label = status = None
+        timestamp = ""
+        for text in _texts(card):
+            if status is None and text.lower() in AREA_STATUSES:
+                status = text
+            elif not timestamp and _is_timestamp(text):
+                timestamp = text
+            elif label is None:
+                label = text
+        areas.append(AreaState(label or "", status, timestamp, card.bounds))
+    return areas
+
+
+def parse_zones(snapshot, top=0, bottom=float("inf")):
+    """
+    Every zone row in a snapshot of the Zones tab, in list order
+
+    Args:
+        top, bottom (int): Only rows whose button centre lies between these y
+            coordinates, e.g. the visible part of the list above the tab bar
+
+    Returns:
+        list: ZoneState records
+    """
+    zones = []
+    for button in snapshot.nodes:
+        if button.content_desc not in ZONE_ACTIONS or button.parent is None or not button.displayed:
+            continue
+        center = button.center
+        if center is None or not top <= center[1] < bottom:
+            continue
+        texts = _texts(button.parent)
+        if not texts:
+            continue
+        timestamp = next((text for text in texts[1:] if _is_timestamp(text)), "")
+        status = next((text for text in texts[1:] if text != timestamp), "")
+        zones.append(ZoneState(texts[0], button.content_desc, status, timestamp, button.bounds))
+    return zones
@@ -0,0 +1,202 @@
+"""
+Structured test results streamed from a pytest run to the process that started it
+
+The runner opens a ResultCollector (a localhost socket) and starts pytest with
+--result-stream <host:port>. ResultStreamReporter, registered by conftest.py
+on the controller (xdist workers forward their reports to it), sends one JSON
+line per event as it happens:
+
+    {"event": "session_start", "pid": ...}
+    {"event": "collected", "count": 12}
+    {"event": "test_start", "nodeid": ...}
+    {"event": "test_result", "nodeid": ..., "outcome": "passed", "duration": 41.2,
+     "worker": "gw1", "message": null, "artifacts": ["reports/screenshots/..."]}
+    {"event": "session_finish", "exitstatus": 0}
+
+The collector keeps running totals, so the runner can report progress live and
+never has to buffer or parse pytest's console output.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+
+class ResultStreamReporter:
+    """pytest plugin that streams collection and per-test events to a ResultCollector"""
+
+    def __init__(self, address):
+        host, port = address.rsplit(":", 1)
+        self._socket = socket.create_connection((host, int(port)))
+        self._file = self._socket.makefile("w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._phases = {}
+        self._collected = False
+
+    def send(self, event, **fields):
+        line = json.dumps({"event": event, "time": time.time(), **fields}, default=str)
+        with self._lock:
+            try:
+                self._file.write(line + "\n")
+                self._file.flush()
+            except OSError:
+                pass  # The runner went away; the run itself carries on
+
+    def pytest_sessionstart(self, session):
+        self.send("session_start", pid=os.getpid())
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.send("test_result", nodeid=report.nodeid, outcome="error", duration=0.0, worker=None,
+                      message=_short_message(report), artifacts=[])
+
+    def pytest_collection_finish(self, session):
+        self._collected = True
+        self.send("collected", count=len(session.items))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids):
+        # The xdist controller collects nothing itself; every worker collects the same ids
+        if not self._collected:
+            self._collected = True
+            self.send("collected", count=len(ids))
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self.send("test_start", nodeid=nodeid)
+
+    def pytest_runtest_logreport(self, report):
+        self._phases.setdefault(report.nodeid, []).append(report)
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        reports = self._phases.pop(nodeid, [])
+        if not reports:
+            return
+        outcome, message = "passed", None
+        for report in reports:
+            if report.failed:
+                outcome = "failed" if report.when == "call" else "error"
+                message = _short_message(report)
+                break
+            if report.skipped:
+                outcome = "skipped"
+                message = _short_message(report)
+        artifacts = []
+        for report in reports:
+            artifacts += [value for name, value in report.user_properties if name == "artifact"]
+        self.send("test_result", nodeid=nodeid, outcome=outcome,
+                  duration=round(sum(report.duration for report in reports), 3),
+                  worker=_worker_id(reports[0]),
+                  message=message, artifacts=sorted(set(artifacts)))
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.send("session_finish", exitstatus=int(exitstatus))
+        try:
+            self._file.close()
+            self._socket.close()
+        except OSError:
+            pass
+
+
+def _worker_id(report):
+    # xdist sets report.node to the WorkerController the report came from
+    node = getattr(report, "node", None)
+    return node.gateway.id if node is not None else None
+
+
+def _short_message(report):
+    if hasattr(report, "wasxfail"):
+        return f"xfail: {report.wasxfail}"
+    if isinstance(report.longrepr, tuple):  # skip: (path, line, reason)
+        return report.longrepr[2]
+    text = getattr(report, "longreprtext", "") or str(report.longrepr or "")
+    errors = [line[1:].strip() for line in text.splitlines() if line.startswith("E ")]
+    if errors:
+        return errors[0]
+    lines = text.strip().splitlines()
+    return lines[-1] if lines else None
+
+
+class ResultCollector:
+    """Runner-side end of the result stream: totals built event by event"""
+
+    def __init__(self, on_event=None, host="127.0.0.1"):
+        """
+        Args:
+            on_event (callable): Called with each event dict (and the collector) as it arrives
+            host (str): Interface to listen on
+        """
+        self.on_event = on_event
+        self.results = {"passed": 0, "failed": 0, "skipped": 0, "error": 0, "total": 0}
+        self.tests = []
+        self.collected = None
+        self.exitstatus = None
+        self.running = set()
+        self._server = socket.create_server((host, 0))
+        self._threads = []
+        self._accept_thread = threading.Thread(target=self._accept, name="result-stream", daemon=True)
+        self._accept_thread.start()
+
+    @property
+    def address(self):
+        host, port = self._server.getsockname()[:2]
+        return f"{host}:{port}"
+
+    @property
+    def connected(self):
+        return bool(self._threads)
+
+    def _accept(self):
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return  # closed
+            thread = threading.Thread(target=self._read, args=(connection,), name="result-stream-reader",
+                                      daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _read(self, connection):
+        with connection, connection.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                self.handle(event)
+
+    def handle(self, event):
+        kind = event.get("event")
+        if kind == "collected":
+            self.collected = event["count"]
+        elif kind == "test_start":
+            self.running.add(event["nodeid"])
+        elif kind == "test_result":
+            self.running.discard(event["nodeid"])
+            outcome = event["outcome"]
+            self.results[outcome] = self.results.get(outcome, 0) + 1
+            self.results["total"] += 1
+            self.tests.append(event)
+        elif kind == "session_finish":
+            self.exitstatus = event["exitstatus"]
+        if self.on_event:
+            self.on_event(event, self)
+
+    def summary(self):
+        """Counts in the runner's {'passed', 'failed', 'skipped', 'total'} shape (errors count as failed)"""
+        return {
+            "passed": self.results["passed"],
+            "failed": self.results["failed"] + self.results["error"],
+            "skipped": self.results["skipped"],
+            "total": self.results["total"],
+        }
+
+    def close(self, timeout=10):
+        """Stop accepting and wait for the streams already open to drain"""
+        self._server.close()
+        for thread in self._threads:
+            thread.join(timeout)
@@ -0,0 +1,173 @@
+"""
+Asynchronous screenshot pipeline
+
+capture() grabs the frame as base64 (the one WebDriver round trip that has to
+happen on the test thread) and returns right away. A small thread pool decodes
+and hashes the frame and writes it to reports/screenshots/<test id>/NN_<step>.png.
+
+  * a frame byte-identical to one the test already saved is not written a
+    second time (frames that differ only in a version string or an error
+    banner are kept);
+  * the finished frames of a test are attached to Allure at teardown;
+  * the oldest files are pruned so the directory stays within MAX_FILES and
+    MAX_BYTES.
+"""
+
+import base64
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCREENSHOT_DIR = os.path.join(PROJECT_ROOT, "reports", "screenshots")
+
+MAX_FILES = int(os.getenv("SCREENSHOT_MAX_FILES", "300"))
+MAX_BYTES = int(os.getenv("SCREENSHOT_MAX_MB", "200")) * 1024 * 1024
+
+
+def current_test_id():
+    """Sanitized id of the running test from PYTEST_CURRENT_TEST, or "session" outside tests"""
+    current = os.getenv("PYTEST_CURRENT_TEST", "")
+    test_id = current.rsplit(" ", 1)[0] if current else "session"
+    test_id = test_id.split("/")[-1].replace(".py::", "__").replace("::", "__")
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", test_id).strip("_")[:120] or "session"
+
+
+def frame_hash(png_bytes):
+    """SHA-256 hex digest of a PNG; only byte-identical frames count as duplicates"""
+    return hashlib.sha256(png_bytes).hexdigest()
+
+
+class ScreenshotPipeline:
+    """Background writer with per-test naming, dedupe and a retention budget"""
+
+    def __init__(self, root=SCREENSHOT_DIR, max_files=MAX_FILES, max_bytes=MAX_BYTES, workers=2):
+        self.root = root
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.stats = {"captured": 0, "written": 0, "deduplicated": 0, "pruned": 0}
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._frames = {}
+        self._steps = {}
+        self._hashes = {}
+        self._files = None
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="screenshots")
+        return self._executor
+
+    def capture(self, driver, step, test_id=None):
+        """
+        Queue a screenshot of the current screen
+
+        Args:
+            driver: Appium WebDriver instance
+            step (str): Step name used in the file name, e.g. "click_error"
+            test_id (str): Defaults to the running pytest test
+
+        Returns:
+            Future: Resolves to the written path (or the earlier identical frame), None on failure
+        """
+        test_id = test_id or current_test_id()
+        step = re.sub(r"[^A-Za-z0-9_.-]+", "_", os.path.splitext(step)[0]).strip("_") or "step"
+        try:
+            encoded = driver.get_screenshot_as_base64()
+        except Exception as e:
+            print(f"⚠️ Could not capture screenshot '{step}': {e}")
+            return None
+
+        with self._lock:
+            self.stats["captured"] += 1
+            index = self._steps[test_id] = self._steps.get(test_id, 0) + 1
+            future = self._pool().submit(self._write, test_id, f"{index:02d}_{step}.png", encoded)
+            self._pending.setdefault(test_id, []).append(future)
+        return future
+
+    def _write(self, test_id, filename, encoded):
+        try:
+            png = base64.b64decode(encoded)
+            digest = frame_hash(png)
+            with self._lock:
+                seen_path = self._hashes.get(test_id, {}).get(digest)
+                if seen_path is not None:
+                    self.stats["deduplicated"] += 1
+                    return seen_path
+
+            directory = os.path.join(self.root, test_id)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, filename)
+            with open(path, "wb") as f:
+                f.write(png)
+
+            with self._lock:
+                self._hashes.setdefault(test_id, {}).setdefault(digest, path)
+                self._frames.setdefault(test_id, []).append(path)
+                self.stats["written"] += 1
+                self._track(path, len(png))
+            print(f"📸 Screenshot saved: {os.path.relpath(path, PROJECT_ROOT)}")
+            return path
+        except Exception as e:
+            print(f"⚠️ Could not save screenshot {filename}: {e}")
+            return None
+
+    def _track(self, path, size):
+        # Caller holds the lock; the existing files are scanned once per process
+        if self._files is None:
+            self._files = []
+            for directory, _, filenames in os.walk(self.root):
+                for name in filenames:
+                    if name.endswith(".png"):
+                        existing = os.path.join(directory, name)
+                        if existing != path:
+                            stat = os.stat(existing)
+                            self._files.append((stat.st_mtime, existing, stat.st_size))
+            self._files.sort()
+        self._files.append((float("inf"), path, size))
+
+        total = sum(entry[2] for entry in self._files)
+        while self._files and (len(self._files) > self.max_files or total > self.max_bytes):
+            _, oldest, oldest_size = self._files.pop(0)
+            try:
+                os.remove(oldest)
+                self.stats["pruned"] += 1
+            except OSError:
+                pass
+            total -= oldest_size
+
+    def flush(self, test_id=None):
+        """
+        Wait for a test's queued screenshots
+
+        Returns:
+            list: Paths written for the test, in capture order
+        """
+        test_id = test_id or current_test_id()
+        with self._lock:
+            pending = self._pending.pop(test_id, [])
+        wait(pending)
+        with self._lock:
+            self._steps.pop(test_id, None)
+            self._hashes.pop(test_id, None)
+            return sorted(path for path in self._frames.pop(test_id, []) if os.path.exists(path))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.stats["captured"]:
+            print(f"📸 Screenshots: {self.stats['captured']} captured, {self.stats['written']} written, "
+                  f"{self.stats['deduplicated']} duplicates skipped, {self.stats['pruned']} pruned")
+
+
+screenshots = ScreenshotPipeline()
+
+
+def capture_screenshot(driver, step, test_id=None):
+    """Queue a screenshot on the shared pipeline (see ScreenshotPipeline.capture)"""
+    return screenshots.capture(driver, step, test_id)
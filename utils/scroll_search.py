@@ -0,0 +1,144 @@
+"""
+Finding an element that may be further down a scrollable list
+
+ScrollSearch.find() looks for the element on screen, then hands the whole
+search to the device: one UiScrollable.scrollIntoView query, during which
+UiAutomator2 scrolls the list itself and returns the element. That is two HTTP
+round trips however far down the list the element is.
+
+When that is not possible (a locator UiSelector cannot express, a driver
+without UiAutomator2, no scrollable container) it falls back to fling-sized
+swipes. After each fling it reads the settled page source once; the element is
+looked up in that read, and when the source hash is the same as before the
+fling, the list has reached its end and the search stops instead of swiping on.
+
+    element = ScrollSearch(driver).find((AppiumBy.ACCESSIBILITY_ID, "Zone 12"))
+"""
+
+import hashlib
+
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.actions import interaction
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.pointer_input import PointerInput
+
+from utils.page_snapshot import PageSnapshot, UnsupportedLocator
+from utils.ui_settle import wait_for_ui_settle
+
+SCROLLABLE_CONTAINER = "new UiSelector().scrollable(true)"
+
+
+def uiselector_for(locator):
+    """
+    The UiSelector expression equivalent to a locator, for use inside UiScrollable
+
+    Returns:
+        str: e.g. 'new UiSelector().description("Zones")', or None if there is none
+    """
+    by, value = locator
+    if by == AppiumBy.ANDROID_UIAUTOMATOR:
+        value = value.strip()
+        # A ';' list of selectors or a UiScrollable expression cannot be nested
+        if value.startswith("new UiSelector()") and ";" not in value:
+            return value
+        return None
+    quoted = value.replace("\\", "\\\\").replace('"', '\\"')
+    if by == AppiumBy.ACCESSIBILITY_ID:
+        return f'new UiSelector().description("{quoted}")'
+    if by == AppiumBy.ID and ":id/" in value:
+        return f'new UiSelector().resourceId("{quoted}")'
+    return None
+
+
+class ScrollSearch:
+    """Scroll-and-find for one driver"""
+
+    def __init__(self, driver, max_flings=10, fling_ms=80, container=SCROLLABLE_CONTAINER):
+        """
+        Args:
+            driver: Appium WebDriver instance
+            max_flings (int): Upper bound on swipes, for the device search and the fallback
+            fling_ms (int): Duration of one fallback swipe; short enough to fling the list
+            container (str): UiSelector of the list to scroll (the first scrollable one by default)
+        """
+        self.driver = driver
+        self.max_flings = max_flings
+        self.fling_ms = fling_ms
+        self.container = container
+
+    def find(self, locator):
+        """
+        Scroll until an element is on screen and return it
+
+        Args:
+            locator (tuple): (strategy, value) of the element
+
+        Returns:
+            WebElement: The element, scrolled into view
+
+        Raises:
+            NoSuchElementException: If it is not found before the list stops moving
+        """
+        elements = self.driver.find_elements(*locator)
+        if elements:
+            return elements[0]
+        selector = uiselector_for(locator)
+        if selector is not None:
+            try:
+                return self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, self.scroll_into_view(selector))
+            except NoSuchElementException:
+                print(f"🔄 scrollIntoView did not find {locator[1]}, flinging through the screen instead")
+            except WebDriverException as e:
+                print(f"🔄 scrollIntoView not available ({e.msg}), flinging through the screen instead")
+        return self._fling_until_found(locator)
+
+    def scroll_into_view(self, selector):
+        """The UiScrollable expression that makes the device scroll to a UiSelector itself"""
+        return (f"new UiScrollable({self.container}).setMaxSearchSwipes({self.max_flings})"
+                f".scrollIntoView({selector})")
+
+    def _fling_until_found(self, locator):
+        snapshot = PageSnapshot.capture(self.driver)
+        previous = None
+        for fling in range(self.max_flings + 1):
+            element = self._find_on_screen(snapshot, locator)
+            if element is not None:
+                print(f"✅ Found {locator[1]} after {fling} fling(s)")
+                return element
+            digest = hashlib.sha1(snapshot.source.encode("utf-8")).hexdigest()
+            if digest == previous:
+                print(f"🛑 Screen stopped changing after {fling} fling(s); end of the list")
+                break
+            previous = digest
+            if fling == self.max_flings:
+                break
+            self.fling()
+            # One read per fling: the settled screen is both the hash and the search
+            snapshot = wait_for_ui_settle(self.driver, 1, label="fling") or PageSnapshot.capture(self.driver)
+        raise NoSuchElementException(f"{locator[1]} not found after scrolling to the end of the list")
+
+    def _find_on_screen(self, snapshot, locator):
+        try:
+            node = snapshot.find(*locator)
+            if node is None or not node.displayed:
+                return None
+        except UnsupportedLocator:
+            pass  # Let the driver evaluate it
+        elements = self.driver.find_elements(*locator)
+        return elements[0] if elements else None
+
+    def fling(self, direction="up"):
+        """One fast swipe in the middle of the screen; 'up' moves the list towards its end"""
+        size = self.driver.get_window_size()
+        x = int(size["width"] / 2)
+        top, bottom = int(size["height"] * 0.25), int(size["height"] * 0.75)
+        start, end = (bottom, top) if direction == "up" else (top, bottom)
+
+        finger = PointerInput(interaction.POINTER_TOUCH, "finger")
+        actions = ActionBuilder(self.driver, mouse=finger, duration=self.fling_ms)
+        actions.pointer_action.move_to_location(x, start)
+        actions.pointer_action.pointer_down()
+        actions.pointer_action.move_to_location(x, end)
+        actions.pointer_action.release()
+        actions.perform()
@@ -0,0 +1,191 @@
+"""
+Persistent Appium session pool
+
+Creating a UiAutomator2 session costs 10-30s (server install/launch, capability
+negotiation), so instead of init_driver()/quit() per test every worker keeps one
+warm session for its device and resets the app between tests according to the
+test's isolation level:
+
+    none        leave the app exactly as the previous test left it
+    restart     terminate and relaunch the app (in-memory state is lost)
+    clear-data  terminate, wipe the app data (pm clear) and relaunch
+    reinstall   remove the app, install the build again and launch it
+
+Tests declare their level with @pytest.mark.isolation("clear-data"); unmarked
+tests get the pool's default level (DEFAULT_ISOLATION unless configured).
+Sessions are health-checked on every checkout and transparently replaced when
+the Appium server or the device dropped them.
+
+Without a local build (device farms install from the "app" capability), the
+pool cannot reinstall the app itself. There, "reinstall" and checkouts after a
+test removed the app get a new session, whose fullReset capability reinstalls it.
+"""
+
+import os
+import time
+
+from utils.apk_registry import remove_app
+
+ISOLATION_LEVELS = ("none", "restart", "clear-data", "reinstall")
+
+# Existing suites chain app state (e.g. arm in one test, disarm in the next),
+# which is what a fresh noReset session per test used to give them
+DEFAULT_ISOLATION = "none"
+# Device farm sessions used fullReset, a clean install per test
+DEVICE_FARM_ISOLATION = "reinstall"
+
+
+class PooledSession:
+    """A live driver plus the bookkeeping the pool needs to reuse it"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.time()
+        self.checkouts = 0
+        self.app_removed = False
+
+
+class SessionPool:
+    """One reusable Appium session per key (normally one per worker/device)"""
+
+    def __init__(self, factory, app_package, app_path=None, default_isolation=DEFAULT_ISOLATION):
+        """
+        Args:
+            factory (callable): Creates a new driver, e.g. a partial of init_driver
+            app_package (str): Package/bundle id that isolation levels reset
+            app_path (str): Build to install for the "reinstall" level and after a
+                test uninstalled the app (None on device farms: a new session
+                reinstalls from the "app" capability instead)
+            default_isolation (str): Level for checkouts that don't ask for one
+        """
+        self.factory = factory
+        self.app_package = app_package
+        self.app_path = app_path
+        self.default_isolation = default_isolation
+        self.sessions = {}
+        self.stats = {"created": 0, "reused": 0, "replaced": 0}
+
+    def acquire(self, isolation=None, key="default"):
+        """
+        Check out the warm session, creating or replacing it if needed
+
+        Args:
+            isolation (str): One of ISOLATION_LEVELS (the pool's default level if None)
+            key (str): Pool slot; tests on the same key share a session
+
+        Returns:
+            WebDriver: A healthy driver with the app reset to the requested level
+        """
+        isolation = isolation or self.default_isolation
+        if isolation not in ISOLATION_LEVELS:
+            raise ValueError(f"Unknown isolation level '{isolation}', expected one of {ISOLATION_LEVELS}")
+
+        # Without a build to install, only a new session (fullReset) reinstalls the app
+        new_install = isolation == "reinstall" and not self.app_path
+        session = self.sessions.get(key)
+        if session is not None and new_install:
+            print("🔄 No build to reinstall from, starting a new session for a clean install")
+            self.discard(key)
+            session = None
+        elif session is not None and not self.is_healthy(session.driver):
+            print("⚠️ Pooled Appium session is no longer responding, replacing it")
+            self.discard(key)
+            self.stats["replaced"] += 1
+            session = None
+
+        if session is None:
+            session = PooledSession(self.factory())
+            self.sessions[key] = session
+            self.stats["created"] += 1
+        else:
+            self.stats["reused"] += 1
+
+        session.checkouts += 1
+        if session.app_removed:
+            self._install(session.driver)
+            session.app_removed = False
+        if not new_install:
+            self.reset_app(session.driver, isolation)
+        return session.driver
+
+    def release(self, driver, app_removed=False, key="default"):
+        """
+        Return a session to the pool after a test
+
+        Args:
+            driver: The driver handed out by acquire()
+            app_removed (bool): The test uninstalled the app; it is reinstalled on next checkout
+            key (str): Pool slot the driver was acquired from
+        """
+        session = self.sessions.get(key)
+        if session is None or session.driver is not driver or not app_removed:
+            return
+        if self.app_path:
+            session.app_removed = True
+        else:
+            # Nothing to reinstall from; the next checkout's new session installs the app
+            print("🔄 App was removed and there is no build to reinstall, dropping the session")
+            self.discard(key)
+
+    def discard(self, key="default"):
+        """Quit and forget a session (used when it is unhealthy)"""
+        session = self.sessions.pop(key, None)
+        if session is None:
+            return
+        try:
+            session.driver.quit()
+        except Exception:
+            pass
+
+    def close_all(self):
+        for key in list(self.sessions):
+            self.discard(key)
+        print(f"🧹 Session pool closed (created: {self.stats['created']}, "
+              f"reused: {self.stats['reused']}, replaced: {self.stats['replaced']})")
+
+    @staticmethod
+    def is_healthy(driver):
+        """Cheap round trip that fails once the session has been dropped"""
+        try:
+            driver.get_window_size()
+            return True
+        except Exception:
+            return False
+
+    def reset_app(self, driver, isolation):
+        """
+        Bring the app under test into the state required by an isolation level
+
+        Args:
+            driver: Appium WebDriver instance
+            isolation (str): One of ISOLATION_LEVELS
+        """
+        if isolation == "none":
+            return
+
+        print(f"🔄 Resetting app for isolation level '{isolation}'")
+        try:
+            driver.terminate_app(self.app_package)
+        except Exception as e:
+            print(f"⚠️ Could not terminate app: {e}")
+
+        if isolation == "clear-data":
+            # UiAutomator2 runs "pm clear" for this; it keeps the install and permissions grants
+            driver.execute_script("mobile: clearApp", {"appId": self.app_package})
+        elif isolation == "reinstall":
+            try:
+                remove_app(driver, self.app_package)
+            except Exception as e:
+                print(f"⚠️ Could not remove app: {e}")
+            self._install(driver)
+
+        driver.activate_app(self.app_package)
+
+    def _install(self, driver):
+        if not self.app_path or not os.path.exists(self.app_path):
+            print(f"⚠️ No build to install for {self.app_package} (app path: {self.app_path})")
+            return
+        if driver.is_app_installed(self.app_package):
+            return
+        print(f"📦 Installing {os.path.basename(self.app_path)}")
+        driver.install_app(self.app_path)
@@ -0,0 +1,148 @@
+"""
+Event-driven replacement for fixed time.sleep() calls after taps and transitions
+
+wait_for_ui_settle() polls a cheap signal (the layout digest of page_source, or a
+caller supplied condition on the snapshot) with exponential backoff and returns
+as soon as the UI is stable. Every call is recorded against the fixed sleep it
+replaced so the per-test saving can be attached to the Allure results.
+
+Set UI_SETTLE_MODE=fixed to fall back to the old fixed sleeps. UI_SETTLE_INITIAL_INTERVAL
+sets the first poll delay (the fake Appium server, which settles instantly,
+uses a few milliseconds).
+"""
+
+import json
+import os
+import time
+
+from utils.page_snapshot import PageSnapshot
+
+
+class SettleStats:
+    """Per-test record of how long settle waits took versus the fixed sleep they replaced"""
+
+    def __init__(self):
+        self.records = []
+
+    def reset(self):
+        self.records = []
+
+    def record(self, label, waited, baseline, polls, settled):
+        self.records.append({
+            "label": label,
+            "waited": round(waited, 3),
+            "baseline": baseline,
+            "polls": polls,
+            "settled": settled,
+        })
+
+    def summary(self):
+        total_waited = sum(record["waited"] for record in self.records)
+        total_baseline = sum(record["baseline"] for record in self.records)
+        return {
+            "calls": len(self.records),
+            "total_waited": round(total_waited, 3),
+            "total_fixed_sleep": round(total_baseline, 3),
+            "saved": round(total_baseline - total_waited, 3),
+            "unsettled_calls": sum(1 for record in self.records if not record["settled"]),
+            "waits": self.records,
+        }
+
+    def to_json(self):
+        return json.dumps(self.summary(), indent=2)
+
+
+settle_stats = SettleStats()
+
+
+def settle_mode():
+    return os.getenv("UI_SETTLE_MODE", "adaptive").lower()
+
+
+def initial_poll_interval():
+    return float(os.getenv("UI_SETTLE_INITIAL_INTERVAL", "0.1"))
+
+
+def wait_for_ui_settle(driver, baseline, label="settle", condition=None, timeout=None,
+                       initial_interval=None, max_interval=0.8, backoff=2.0):
+    """
+    Wait until the UI stops changing (or a condition holds) instead of sleeping a fixed time
+
+    Args:
+        driver: Appium WebDriver instance
+        baseline (float): The fixed sleep this call replaces, in seconds
+        label (str): Name recorded in the settle stats
+        condition (callable): Optional predicate taking a PageSnapshot; when given the
+            wait ends as soon as it returns True instead of waiting for stability
+        timeout (float): Upper bound on the wait (defaults to twice the baseline, min 1s)
+        initial_interval (float): First poll delay in seconds (defaults to initial_poll_interval())
+        max_interval (float): Cap for the exponential backoff
+        backoff (float): Multiplier applied to the poll delay after each read
+
+    Returns:
+        PageSnapshot: The last snapshot read, or None in fixed mode / if no read succeeded
+    """
+    if settle_mode() == "fixed":
+        time.sleep(baseline)
+        settle_stats.record(label, baseline, baseline, polls=0, settled=True)
+        return None
+
+    if timeout is None:
+        timeout = max(baseline * 2, 1.0)
+
+    start_time = time.time()
+    interval = initial_interval if initial_interval is not None else initial_poll_interval()
+    previous_digest = None
+    snapshot = None
+    polls = 0
+    settled = False
+
+    while True:
+        time.sleep(interval)
+        try:
+            current = PageSnapshot.capture(driver)
+        except Exception:
+            # page_source can fail mid activity transition; treat as "still changing"
+            current = None
+        polls += 1
+
+        if current is not None:
+            snapshot = current
+            if condition is not None:
+                if condition(current):
+                    settled = True
+                    break
+            elif current.layout_digest == previous_digest:
+                settled = True
+                break
+            previous_digest = current.layout_digest
+
+        if time.time() - start_time >= timeout:
+            break
+        interval = min(interval * backoff, max_interval)
+
+    waited = time.time() - start_time
+    settle_stats.record(label, waited, baseline, polls, settled)
+    if not settled:
+        print(f"⚠️ UI did not settle for '{label}' within {timeout:.1f}s")
+    return snapshot
+
+
+def text_visible(text):
+    """Condition for wait_for_ui_settle: a node with exactly this text is on screen"""
+    def condition(snapshot):
+        return any(node.displayed for node in snapshot.by_text.get(text, []))
+    return condition
+
+
+def locator_visible(locator):
+    """
+    Condition for wait_for_ui_settle: the locator matches a displayed node
+
+    Raises:
+        UnsupportedLocator: If the snapshot cannot evaluate the locator, rather
+            than waiting out the whole timeout on a condition that can never hold
+    """
+    def condition(snapshot):
+        return snapshot.is_visible(locator)
+    return condition